@@ -1 +1,12 @@
 __version__ = "0.1.0"
+
+__all__ = ["Lexicon", "transcribe", "transcribe_candidates"]
+
+
+def __getattr__(name):
+    # Only import the library (and whatever it needs) on first use.
+    if name in __all__:
+        from .python import lexicon
+
+        return getattr(lexicon, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,7 @@
+"""`python -m loanwords_gairaigo`, the `gairaigo` command (see python/cli.py)."""
+
+import sys
+
+from .python import cli
+
+sys.exit(cli.main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Find the sources that disagree with the others about a word's katakana.
+
+The merge keeps the highest-priority source and drops the rest, so a bad
+Wikipedia title or a noisy Wiktionary transcription goes through unnoticed
+whenever no better source has the word. This stage reads the same normalized
+pairs as `merge_engine.py` and, for every English word found in two or more
+sources, computes the edit distance between each pair of candidates,
+normalized by the longer of the two (0 for identical, 1 for nothing in
+common). All the pairs are scored in batches with `edit_distance.distances`.
+
+A candidate's score is its mean normalized distance to the other sources'
+candidates. The one with the lowest score (the highest-priority source on a
+tie) is the consensus; every other candidate scoring at least `--threshold`
+is written to the `anomalies` table, with `chosen` set when it is the one
+`merged` will keep.
+
+With `--fail-above N` the stage exits with status 1 if more than N chosen
+candidates are anomalies, so that it can gate a release.
+"""
+
+import sys
+import logging
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+from merge_engine import SOURCES, readSource
+from merge_clean_db import HERE, MERGED_DB
+from edit_distance import distances
+from profiling import phase, profiled, stage_parser
+
+THRESHOLD = 0.5
+WRITE_BATCH = 10_000
+
+
+def readCandidates(sources, db_dir):
+    """The best katakana of every word in every source.
+
+    Returns parallel lists of words and katakana and an array of source
+    indices, in source priority order.
+    """
+    words, kanas, owners = [], [], []
+    for priority, source in enumerate(sources):
+        best = {}
+        for word, jap, tie_break, _ in readSource(source, db_dir):
+            if word not in best or tie_break < best[word][0]:
+                best[word] = (tie_break, jap)
+        words.extend(best)
+        kanas.extend(jap for _, jap in best.values())
+        owners.extend([priority] * len(best))
+        logging.info(f"{source.name}: {len(best)} words.")
+    return words, kanas, np.asarray(owners, dtype=np.int64)
+
+
+def groupCandidates(words, owners):
+    """The candidates of every word found in two or more sources.
+
+    Returns their indices, grouped by word and in priority order within a
+    word, and the size of each group.
+    """
+    ids = {}
+    word_ids = np.fromiter(
+        (ids.setdefault(w, len(ids)) for w in words), dtype=np.int64, count=len(words)
+    )
+    order = np.lexsort((owners, word_ids))
+    sorted_ids = word_ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+    shared = np.repeat(sizes > 1, sizes)
+    return order[shared], sizes[sizes > 1]
+
+
+def candidatePairs(starts, sizes):
+    """Every pair (i, j), i < j, of positions within the same group."""
+    first, second = [], []
+    for k in np.unique(sizes):
+        i, j = np.triu_indices(k, 1)
+        group_starts = starts[sizes == k][:, None]
+        first.append((group_starts + i).ravel())
+        second.append((group_starts + j).ravel())
+    return np.concatenate(first), np.concatenate(second)
+
+
+def scoreCandidates(kanas, sizes):
+    """Mean normalized distance of each candidate to the rest of its group.
+
+    `kanas` are in group order, as given by `groupCandidates`. Returns the
+    scores and, for every group, the position of its consensus.
+    """
+    starts = np.cumsum(sizes) - sizes
+    group_of = np.repeat(np.arange(len(sizes)), sizes)
+    first, second = candidatePairs(starts, sizes)
+    lengths = np.fromiter(map(len, kanas), dtype=np.int64, count=len(kanas))
+
+    # Most sources agree; only the pairs that differ need the DP.
+    differ = np.fromiter(
+        (kanas[i] != kanas[j] for i, j in zip(first.tolist(), second.tolist())),
+        dtype=bool,
+        count=len(first),
+    )
+    a, b = first[differ], second[differ]
+    with phase("distances"):
+        d = distances([kanas[i] for i in a], [kanas[j] for j in b])
+    normalized = np.zeros(len(first))
+    normalized[differ] = d / np.maximum(lengths[a], lengths[b])
+
+    n = len(kanas)
+    totals = np.bincount(first, normalized, n) + np.bincount(second, normalized, n)
+    score = totals / (sizes - 1)[group_of]
+
+    # The lowest score wins, the first (highest-priority) candidate on a tie.
+    lowest = np.minimum.reduceat(score, starts)
+    positions = np.where(score <= lowest[group_of] + 1e-9, np.arange(n), n)
+    consensus = np.minimum.reduceat(positions, starts)
+    return score, consensus
+
+
+def writeAnomalies(rows, path=MERGED_DB):
+    """Replace the `anomalies` table with `rows`."""
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        conn.execute("DROP TABLE IF EXISTS anomalies;")
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS
+                    anomalies (
+                        english TEXT,
+                        source TEXT,
+                        japanese TEXT,
+                        consensus TEXT,
+                        score REAL,
+                        sources INTEGER,
+                        chosen INTEGER
+                    )
+                ;
+            """
+        )
+        for start in range(0, len(rows), WRITE_BATCH):
+            conn.executemany(
+                "INSERT INTO anomalies VALUES ( ?, ?, ?, ?, ?, ?, ? );",
+                rows[start : start + WRITE_BATCH],
+            )
+    conn.close()
+
+
+def findAnomalies(sources, db_dir, threshold=THRESHOLD):
+    """Rows for the `anomalies` table, worst first."""
+    with phase("read"):
+        words, kanas, owners = readCandidates(sources, db_dir)
+    with phase("group"):
+        members, sizes = groupCandidates(words, owners)
+    if not len(sizes):
+        return []
+    grouped = [kanas[i] for i in members.tolist()]
+    score, consensus = scoreCandidates(grouped, sizes)
+
+    starts = np.cumsum(sizes) - sizes
+    group_of = np.repeat(np.arange(len(sizes)), sizes)
+    positions = np.arange(len(members))
+    flagged = (positions != consensus[group_of]) & (score >= threshold)
+    rows = []
+    for p in np.flatnonzero(flagged)[np.argsort(-score[flagged], kind="stable")]:
+        g = group_of[p]
+        i = members[p]
+        rows.append(
+            (
+                words[i],
+                sources[owners[i]].name,
+                kanas[i],
+                grouped[consensus[g]],
+                float(score[p]),
+                int(sizes[g]),
+                int(p == starts[g]),
+            )
+        )
+    logging.info(
+        f"{len(sizes)} words in two or more sources, {len(members)} candidates, "
+        f"{len(rows)} anomalies."
+    )
+    return rows
+
+
+def main(args):
+    rows = findAnomalies(SOURCES, args.db_dir, args.threshold)
+    with phase("write"):
+        writeAnomalies(rows, args.output)
+
+    chosen = [row for row in rows if row[6]]
+    per_source = {}
+    for row in rows:
+        per_source[row[1]] = per_source.get(row[1], 0) + 1
+    for name, count in per_source.items():
+        print(f"{name:<12}{count:>8} anomalies")
+    print(f"{len(chosen)} anomalies would be kept by the merge.")
+    for english, source, jap, consensus, score, _, _ in chosen[: args.show]:
+        print(f"{score:>6.2f} {english} {jap} ({source}), others say {consensus}")
+    return args.fail_above is None or len(chosen) <= args.fail_above
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = stage_parser(__doc__)
+    parser.add_argument(
+        "--db-dir", type=Path, default=HERE, help="where the source databases are"
+    )
+    parser.add_argument(
+        "--output", type=Path, default=MERGED_DB, help="database for `anomalies`"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"lowest score flagged (default: {THRESHOLD})",
+    )
+    parser.add_argument(
+        "--show", type=int, default=20, help="chosen anomalies to list (default: 20)"
+    )
+    parser.add_argument(
+        "--fail-above",
+        type=int,
+        default=None,
+        help="exit with status 1 if more chosen candidates than this are anomalies",
+    )
+    args = parser.parse_args()
+    with profiled("anomalies", args):
+        ok = main(args)
+    sys.exit(0 if ok else 1)
@@ -342,8 +342,8 @@ INSERT INTO "hand_mapping" VALUES ('''M','ə m','a mv','アム','アム');
 INSERT INTO "hand_mapping" VALUES ('''RE','ə','a','ア','ア');
 INSERT INTO "hand_mapping" VALUES ('''S(1)','z','zv','ズ','ズ');
 INSERT INTO "hand_mapping" VALUES ('''S(2)','s','sv','ス','ス');
-INSERT INTO "hand_mapping" VALUES ('''VE(1)','v','bv','ブ','ブ');
-INSERT INTO "hand_mapping" VALUES ('''VE(2)','ə v','a bv','アブ','アブ');
+INSERT INTO "hand_mapping" VALUES ('''VE(1)','v','Vv','ブ','ブ');
+INSERT INTO "hand_mapping" VALUES ('''VE(2)','ə v','a Vv','アブ','アブ');
 INSERT INTO "hand_mapping" VALUES ('A''S','ˈeɪ z','e i zv','エイズ','エイズ');
 INSERT INTO "hand_mapping" VALUES ('A(1)','ə','a','ア','ア');
 INSERT INTO "hand_mapping" VALUES ('A(2)','ˈeɪ','e i','エイ','エイ');
@@ -354,7 +354,7 @@ INSERT INTO "hand_mapping" VALUES ('ABANDONED','ə b ˈæ n d ə n d','a ba nv d
 INSERT INTO "hand_mapping" VALUES ('ABATE','ə b ˈeɪ t','a be i tv','アベイト','アベイト');
 INSERT INTO "hand_mapping" VALUES ('ABBEY','ˈæ b i','a bi -','アビー','アビー');
 INSERT INTO "hand_mapping" VALUES ('ABBOT','ˈæ b ə t','a ba tv','アバト','アバト');
-INSERT INTO "hand_mapping" VALUES ('ABBREVIATE','ə b ɹ ˈiː v ɪ ˌeɪ t','a bv ri - bi e i tv','アブリービエイト','アブリービエイト');
+INSERT INTO "hand_mapping" VALUES ('ABBREVIATE','ə b ɹ ˈiː v ɪ ˌeɪ t','a bv ri - Vi e i tv','アブリービエイト','アブリービエイト');
 INSERT INTO "hand_mapping" VALUES ('ABDOMINAL','æ b d ˈɒ m ɪ n ə l','a bv do mi na rv','アブドミナル','アブドミナル');
 INSERT INTO "hand_mapping" VALUES ('ABEL','ˈeɪ b ə l','e i ba rv','エイバル','エイバル');
 INSERT INTO "hand_mapping" VALUES ('ABERDEEN','ˌæ b ə d ˈiː n','a ba di - nv','アバディーン','アバディーン');
@@ -376,7 +376,7 @@ INSERT INTO "hand_mapping" VALUES ('ABORIGINAL','ˌæ b ə ɹ ˈɪ dʒ ɪ n ə l
 INSERT INTO "hand_mapping" VALUES ('ABORT','ə b ˈɔː t','a bo - tv','アボート','アボート');
 INSERT INTO "hand_mapping" VALUES ('ABORTION','ə b ˈɔː ʃ ə n','a bo - sya nv','アボーシャン','アボーション');
 INSERT INTO "hand_mapping" VALUES ('ABOUT','ə b ˈaʊ t','a ba u tv','アバウト','アバウト');
-INSERT INTO "hand_mapping" VALUES ('ABOVE','ə b ˈɐ v','a ba bv','アバブ','アバブ');
+INSERT INTO "hand_mapping" VALUES ('ABOVE','ə b ˈɐ v','a ba Vv','アバブ','アバブ');
 INSERT INTO "hand_mapping" VALUES ('ABRAHAM','ˈeɪ b ɹ ə h ˌæ m','e i bv ra ha mv','エイブラハム','エイブラハム');
 INSERT INTO "hand_mapping" VALUES ('ABROAD','ə b ɹ ˈɔː d','a bv ro - dv','アブロード','アブロード');
 INSERT INTO "hand_mapping" VALUES ('ABRUPTLY','ə b ɹ ˈɐ p t l i','a bv ra pv tv ri -','アブラプトリー','アブラプトリー');
@@ -463,11 +463,11 @@ INSERT INTO "hand_mapping" VALUES ('ACCUSED','ə k j ˈuː z d','a kyu - zv dv',
 INSERT INTO "hand_mapping" VALUES ('ACE','ˈeɪ s','e i sv','エイス','エイス');
 INSERT INTO "hand_mapping" VALUES ('ACER','ˈeɪ s ə','e i sa','エイサ','エイサ');
 INSERT INTO "hand_mapping" VALUES ('ACHE','ˈeɪ k','e i kv','エイク','エイク');
-INSERT INTO "hand_mapping" VALUES ('ACHIEVE','ə tʃ ˈiː v','a tyi - bv','アチィーブ','アチィーブ');
-INSERT INTO "hand_mapping" VALUES ('ACHIEVED','ə tʃ ˈiː v d','a tyi - bv dv','アチィーブド','アチィーブド');
-INSERT INTO "hand_mapping" VALUES ('ACHIEVEMENT','ə tʃ ˈiː v m ə n t','a tyi - bv ma nv tv','アチィーブマント','アチィーブメント');
-INSERT INTO "hand_mapping" VALUES ('ACHIEVEMENTS','ə tʃ ˈiː v m ə n t s','a tyi - bv ma nv tsv','アチィーブマンツ','アチィーブマンツ');
-INSERT INTO "hand_mapping" VALUES ('ACHIEVING','ə tʃ ˈiː v ɪ ŋ','a tyi - bi Nv','アチィービン','アチィービング');
+INSERT INTO "hand_mapping" VALUES ('ACHIEVE','ə tʃ ˈiː v','a tyi - Vv','アチィーブ','アチィーブ');
+INSERT INTO "hand_mapping" VALUES ('ACHIEVED','ə tʃ ˈiː v d','a tyi - Vv dv','アチィーブド','アチィーブド');
+INSERT INTO "hand_mapping" VALUES ('ACHIEVEMENT','ə tʃ ˈiː v m ə n t','a tyi - Vv ma nv tv','アチィーブマント','アチィーブメント');
+INSERT INTO "hand_mapping" VALUES ('ACHIEVEMENTS','ə tʃ ˈiː v m ə n t s','a tyi - Vv ma nv tsv','アチィーブマンツ','アチィーブマンツ');
+INSERT INTO "hand_mapping" VALUES ('ACHIEVING','ə tʃ ˈiː v ɪ ŋ','a tyi - Vi Nv','アチィービン','アチィービング');
 INSERT INTO "hand_mapping" VALUES ('ACID','ˈæ s ɪ d','a x si dv','アッシド','アッシド');
 INSERT INTO "hand_mapping" VALUES ('ACIDIC','ə s ˈɪ d ɪ k','a si di kv','アシディク','アシディク');
 INSERT INTO "hand_mapping" VALUES ('ACIDS','ˈæ s ɪ d z','a x si zv','アッシズ','アッシズ');
@@ -496,15 +496,15 @@ INSERT INTO "hand_mapping" VALUES ('ACTED','ˈæ k t ɪ d','a x kv ti dv','ア
 INSERT INTO "hand_mapping" VALUES ('ACTING','ˈæ k t ɪ ŋ','a x kv ti Nv','アックティン','アックティング');
 INSERT INTO "hand_mapping" VALUES ('ACTION','ˈæ k ʃ ə n','a x kv sya nv','アックシャン','アックション');
 INSERT INTO "hand_mapping" VALUES ('ACTIONS','ˈæ k ʃ ə n z','a x kv sya nv zv','アックシャンズ','アックシャンズ');
-INSERT INTO "hand_mapping" VALUES ('ACTIVATE','ˈæ k t ɪ v ˌeɪ t','a x kv ti be i tv','アックティベイト','アックティベイト');
-INSERT INTO "hand_mapping" VALUES ('ACTIVATED','ˈæ k t ɪ v ˌeɪ t ɪ d','a x kv ti be i ti dv','アックティベイティド','アックティベイティド');
-INSERT INTO "hand_mapping" VALUES ('ACTIVATION','ˌæ k t ɪ v ˈeɪ ʃ ə n','a x kv ti be i sya nv','アックティベイシャン','アックティベイション');
-INSERT INTO "hand_mapping" VALUES ('ACTIVE','ˈæ k t ɪ v','a x kv ti bv','アックティブ','アックティブ');
-INSERT INTO "hand_mapping" VALUES ('ACTIVELY','ˈæ k t ɪ v l i','a x kv ti bv ri -','アックティブリー','アックティブリー');
-INSERT INTO "hand_mapping" VALUES ('ACTIVIST','ˈæ k t ɪ v ɪ s t','a x kv ti bi sv tv','アックティビスト','アックティビスト');
-INSERT INTO "hand_mapping" VALUES ('ACTIVISTS','ˈæ k t ɪ v ɪ s t s','a x kv ti bi sv tsv','アックティビスツ','アックティビスツ');
-INSERT INTO "hand_mapping" VALUES ('ACTIVITIES','æ k t ˈɪ v ɪ t i z','a kv ti bi ti - zv','アクティビティーズ','アクティビティーズ');
-INSERT INTO "hand_mapping" VALUES ('ACTIVITY','æ k t ˈɪ v ɪ t i','a kv ti bi ti -','アクティビティー','アクティビティー');
+INSERT INTO "hand_mapping" VALUES ('ACTIVATE','ˈæ k t ɪ v ˌeɪ t','a x kv ti Ve i tv','アックティベイト','アックティベイト');
+INSERT INTO "hand_mapping" VALUES ('ACTIVATED','ˈæ k t ɪ v ˌeɪ t ɪ d','a x kv ti Ve i ti dv','アックティベイティド','アックティベイティド');
+INSERT INTO "hand_mapping" VALUES ('ACTIVATION','ˌæ k t ɪ v ˈeɪ ʃ ə n','a x kv ti Ve i sya nv','アックティベイシャン','アックティベイション');
+INSERT INTO "hand_mapping" VALUES ('ACTIVE','ˈæ k t ɪ v','a x kv ti Vv','アックティブ','アックティブ');
+INSERT INTO "hand_mapping" VALUES ('ACTIVELY','ˈæ k t ɪ v l i','a x kv ti Vv ri -','アックティブリー','アックティブリー');
+INSERT INTO "hand_mapping" VALUES ('ACTIVIST','ˈæ k t ɪ v ɪ s t','a x kv ti Vi sv tv','アックティビスト','アックティビスト');
+INSERT INTO "hand_mapping" VALUES ('ACTIVISTS','ˈæ k t ɪ v ɪ s t s','a x kv ti Vi sv tsv','アックティビスツ','アックティビスツ');
+INSERT INTO "hand_mapping" VALUES ('ACTIVITIES','æ k t ˈɪ v ɪ t i z','a kv ti Vi ti - zv','アクティビティーズ','アクティビティーズ');
+INSERT INTO "hand_mapping" VALUES ('ACTIVITY','æ k t ˈɪ v ɪ t i','a kv ti Vi ti -','アクティビティー','アクティビティー');
 INSERT INTO "hand_mapping" VALUES ('ACTOR','ˈæ k t ə','a x kv ta','アックタ','アックタ');
 INSERT INTO "hand_mapping" VALUES ('ACTORS','ˈæ k t ə z','a x kv ta zv','アックタズ','アックタズ');
 INSERT INTO "hand_mapping" VALUES ('ACTRESS','ˈæ k t ɹ ɪ s','a x kv tv ri sv','アックトリス','アックトリス');
@@ -523,7 +523,7 @@ INSERT INTO "hand_mapping" VALUES ('ADAPTATION','ˌæ d ə p t ˈeɪ ʃ ə n','a
 INSERT INTO "hand_mapping" VALUES ('ADAPTED','ə d ˈæ p t ɪ d','a da x pv ti dv','アダップティド','アダップティド');
 INSERT INTO "hand_mapping" VALUES ('ADAPTER','ə d ˈæ p t ə','a da x pv ta','アダップタ','アダップタ');
 INSERT INTO "hand_mapping" VALUES ('ADAPTERS','ə d ˈæ p t ə z','a da x pv ta zv','アダップタズ','アダップタズ');
-INSERT INTO "hand_mapping" VALUES ('ADAPTIVE','ə d ˈæ p t ɪ v','a da x pv ti bv','アダップティブ','アダップティブ');
+INSERT INTO "hand_mapping" VALUES ('ADAPTIVE','ə d ˈæ p t ɪ v','a da x pv ti Vv','アダップティブ','アダップティブ');
 INSERT INTO "hand_mapping" VALUES ('ADAPTOR','ə d ˈɑː p t ə','a da - pv ta','アダープタ','アダープタ');
 INSERT INTO "hand_mapping" VALUES ('ADD','ˈæ d','a dv','アド','アド');
 INSERT INTO "hand_mapping" VALUES ('ADDED','ˈæ d ɪ d','a di dv','アディド','アディド');
@@ -548,13 +548,13 @@ INSERT INTO "hand_mapping" VALUES ('ADEPT','ə d ˈɛ p t','a de pv tv','アデ
 INSERT INTO "hand_mapping" VALUES ('ADEQUATE','ˈæ d ɪ k w ɪ t','a di kwi tv','アディクィト','アディクィト');
 INSERT INTO "hand_mapping" VALUES ('ADEQUATELY','ˈæ d ɪ k w ə t l i','a di kwa tv ri -','アディクァトリー','アディクァトリー');
 INSERT INTO "hand_mapping" VALUES ('ADHERE','ə d h ˈɪə','a dv hi a','アドヒア','アドヒア');
-INSERT INTO "hand_mapping" VALUES ('ADHESIVE','ə d h ˈiː s ɪ v','a dv hi - si bv','アドヒーシブ','アドヒーシブ');
+INSERT INTO "hand_mapping" VALUES ('ADHESIVE','ə d h ˈiː s ɪ v','a dv hi - si Vv','アドヒーシブ','アドヒーシブ');
 INSERT INTO "hand_mapping" VALUES ('ADIDAS','ˈæ d ɪ d ə s','a di da sv','アディダス','アディダス');
 INSERT INTO "hand_mapping" VALUES ('ADIRONDACK','ˌæ d ɪ ɹ ˈɒ n d æ k','a di ro nv da kv','アディロンダク','アディロンダク');
 INSERT INTO "hand_mapping" VALUES ('ADJACENCY','ə dʒ ˈeɪ s ə n s i','a jye i sa nv si -','アジェイサンシー','アジェイサンシー');
 INSERT INTO "hand_mapping" VALUES ('ADJACENT','ə dʒ ˈeɪ s ə n t','a jye i sa nv tv','アジェイサント','アジェイサント');
-INSERT INTO "hand_mapping" VALUES ('ADJECTIVE','ˈæ dʒ ɪ k t ɪ v','a jyi kv ti bv','アジィクティブ','アジィクティブ');
-INSERT INTO "hand_mapping" VALUES ('ADJECTIVES','ˈæ dʒ ɪ k t ɪ v z','a jyi kv ti bv zv','アジィクティブズ','アジィクティブズ');
+INSERT INTO "hand_mapping" VALUES ('ADJECTIVE','ˈæ dʒ ɪ k t ɪ v','a jyi kv ti Vv','アジィクティブ','アジィクティブ');
+INSERT INTO "hand_mapping" VALUES ('ADJECTIVES','ˈæ dʒ ɪ k t ɪ v z','a jyi kv ti Vv zv','アジィクティブズ','アジィクティブズ');
 INSERT INTO "hand_mapping" VALUES ('ADJOURN','ə dʒ ˈɜː n','a jye - nv','アジェーン','アジェーン');
 INSERT INTO "hand_mapping" VALUES ('ADJUST','ə dʒ ˈɐ s t','a jya sv tv','アジャスト','アジャスト');
 INSERT INTO "hand_mapping" VALUES ('ADJUSTABLE','ə dʒ ˈɐ s t ə b ə l','a jya sv ta ba rv','アジャスタバル','アジャスタバル');
@@ -565,7 +565,7 @@ INSERT INTO "hand_mapping" VALUES ('ADMIN','ˈæ d m ɪ n','a dv mi nv','アド
 INSERT INTO "hand_mapping" VALUES ('ADMINISTER','ə d m ˈɪ n ɪ s t ə','a dv mi ni sv ta','アドミニスタ','アドミニスタ');
 INSERT INTO "hand_mapping" VALUES ('ADMINISTERED','ə d m ˈɪ n ɪ s t ə d','a dv mi ni sv ta dv','アドミニスタド','アドミニスタド');
 INSERT INTO "hand_mapping" VALUES ('ADMINISTRATION','ə d m ˌɪ n ɪ s t ɹ ˈeɪ ʃ ə n','a dv mi - ni sv tv re i sya nv','アドミーニストレイシャン','アドミーニストレイション');
-INSERT INTO "hand_mapping" VALUES ('ADMINISTRATIVE','ə d m ˈɪ n ɪ s t ɹ ə t ɪ v','a dv mi ni sv tv ra ti bv','アドミニストラティブ','アドミニストラティブ');
+INSERT INTO "hand_mapping" VALUES ('ADMINISTRATIVE','ə d m ˈɪ n ɪ s t ɹ ə t ɪ v','a dv mi ni sv tv ra ti Vv','アドミニストラティブ','アドミニストラティブ');
 INSERT INTO "hand_mapping" VALUES ('ADMINISTRATOR','ə d m ˈɪ n ɪ s t ɹ ˌeɪ t ə','a dv mi ni sv tv re i ta','アドミニストレイタ','アドミニストレイタ');
 INSERT INTO "hand_mapping" VALUES ('ADMINISTRATORS','ə d m ˈɪ n ɪ s t ɹ ˌeɪ t ə z','a dv mi ni sv tv re i ta zv','アドミニストレイタズ','アドミニストレイタズ');
 INSERT INTO "hand_mapping" VALUES ('ADMIRAL','ˈæ d m ə ɹ ə l','a dv ma ra rv','アドマラル','アドマラル');
@@ -590,42 +590,42 @@ INSERT INTO "hand_mapping" VALUES ('ADULT(1)','ə d ˈɐ l t','a da rv tv','ア
 INSERT INTO "hand_mapping" VALUES ('ADULT(2)','ˈæ d ɐ l t','a da rv tv','アダルト','アダルト');
 INSERT INTO "hand_mapping" VALUES ('ADULTS(1)','ə d ˈɐ l t s','a da rv tsv','アダルツ','アダルツ');
 INSERT INTO "hand_mapping" VALUES ('ADULTS(2)','ˈæ d ɐ l t s','a da rv tsv','アダルツ','アダルツ');
-INSERT INTO "hand_mapping" VALUES ('ADVANCE','ə d v ˈɑː n s','a dv ba - nv sv','アドバーンス','アドバーンス');
-INSERT INTO "hand_mapping" VALUES ('ADVANCED','ə d v ˈɑː n s t','a dv ba - nv sv tv','アドバーンスト','アドバーンスト');
-INSERT INTO "hand_mapping" VALUES ('ADVANCEMENT','ə d v ˈɑː n s m ə n t','a dv ba - nv sv ma nv tv','アドバーンスマント','アドバーンスメント');
-INSERT INTO "hand_mapping" VALUES ('ADVANCES','ə d v ˈɑː n s ɪ z','a dv ba - nv si zv','アドバーンシズ','アドバーンシズ');
-INSERT INTO "hand_mapping" VALUES ('ADVANTAGE','ə d v ˈɑː n t ɪ dʒ','a dv ba - nv ti jyv','アドバーンティジュ','アドバーンティジュ');
-INSERT INTO "hand_mapping" VALUES ('ADVANTAGEOUS','ˌæ d v ə n t ˈeɪ dʒ ə s','a dv ba nv te i jya sv','アドバンテイジャス','アドバンテイジャス');
-INSERT INTO "hand_mapping" VALUES ('ADVANTAGES','ə d v ˈɑː n t ɪ dʒ ɪ z','a dv ba - nv ti jyi zv','アドバーンティジィズ','アドバーンティジィズ');
-INSERT INTO "hand_mapping" VALUES ('ADVENT(1)','ˈæ d v ɛ n t','a dv be nv tv','アドベント','アドベント');
-INSERT INTO "hand_mapping" VALUES ('ADVENT(2)','ˈæ d v ə n t','a dv ba nv tv','アドバント','アドバント');
-INSERT INTO "hand_mapping" VALUES ('ADVENTURE','ə d v ˈɛ n tʃ ə','a dv be nv tya','アドベンチャ','アドベンチャ');
-INSERT INTO "hand_mapping" VALUES ('ADVENTURES','ə d v ˈɛ n tʃ ə z','a dv be nv tya zv','アドベンチャズ','アドベンチャズ');
-INSERT INTO "hand_mapping" VALUES ('ADVENTUROUS','ə d v ˈɛ n tʃ ə ɹ ə z','a dv be nv tya ra zv','アドベンチャラズ','アドベンチャラズ');
-INSERT INTO "hand_mapping" VALUES ('ADVERSARY','ˈæ d v ə s ə ɹ i','a dv ba sa ri -','アドバサリー','アドバサリー');
-INSERT INTO "hand_mapping" VALUES ('ADVERSE(1)','ˈæ d v ɜː s','a dv be - sv','アドベース','アドベース');
-INSERT INTO "hand_mapping" VALUES ('ADVERSE(2)','æ d v ˈɜː s','a dv be - sv','アドベース','アドベース');
-INSERT INTO "hand_mapping" VALUES ('ADVERT','æ d v ˈɜː t','a dv be - tv','アドベート','アドベート');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISE','ˈæ d v ə t ˌaɪ z','a dv ba ta i zv','アドバタイズ','アドバタイズ');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISED','ˈæ d v ə t ˌaɪ z d','a dv ba ta i zv dv','アドバタイズド','アドバタイズド');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENT(1)','ə d v ˈɜː t ɪ s m ə n t','a dv be - ti sv ma nv tv','アドベーティスマント','アドベーティスメント');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENT(2)','ə d v ˈɜː t ɪ z m ə n t','a dv be - ti zv ma nv tv','アドベーティズマント','アドベーティズメント');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENTS(1)','ə d v ˈɜː t ɪ s m ə n t s','a dv be - ti sv ma nv tsv','アドベーティスマンツ','アドベーティスマンツ');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENTS(2)','ə d v ˈɜː t ɪ z m ə n t s','a dv be - ti zv ma nv tsv','アドベーティズマンツ','アドベーティズマンツ');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISER','ˈæ d v ə t ˌaɪ z ə','a dv ba ta i za','アドバタイザ','アドバタイザ');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISERS','ˈæ d v ə t ˌaɪ z ə z','a dv ba ta i za zv','アドバタイザズ','アドバタイザズ');
-INSERT INTO "hand_mapping" VALUES ('ADVERTISING','ˈæ d v ə t ˌaɪ z ɪ ŋ','a dv ba ta i zi Nv','アドバタイジン','アドバタイジング');
-INSERT INTO "hand_mapping" VALUES ('ADVICE','ə d v ˈaɪ s','a dv ba i sv','アドバイス','アドバイス');
-INSERT INTO "hand_mapping" VALUES ('ADVISE','ə d v ˈaɪ z','a dv ba i zv','アドバイズ','アドバイズ');
-INSERT INTO "hand_mapping" VALUES ('ADVISED','ə d v ˈaɪ z d','a dv ba i zv dv','アドバイズド','アドバイズド');
-INSERT INTO "hand_mapping" VALUES ('ADVISER','ə d v ˈaɪ z ə','a dv ba i za','アドバイザ','アドバイザ');
-INSERT INTO "hand_mapping" VALUES ('ADVISERS','ə d v ˈaɪ z ə z','a dv ba i za zv','アドバイザズ','アドバイザズ');
-INSERT INTO "hand_mapping" VALUES ('ADVISOR','ə d v ˈaɪ z ə','a dv ba i za','アドバイザ','アドバイザ');
-INSERT INTO "hand_mapping" VALUES ('ADVISORS','ə d v ˈaɪ z ə z','a dv ba i za zv','アドバイザズ','アドバイザズ');
-INSERT INTO "hand_mapping" VALUES ('ADVISORY','ə d v ˈaɪ z ə ɹ i','a dv ba i za ri -','アドバイザリー','アドバイザリー');
-INSERT INTO "hand_mapping" VALUES ('ADVOCACY','ˈæ d v ə k ə s i','a dv ba ka si -','アドバカシー','アドバカシー');
-INSERT INTO "hand_mapping" VALUES ('ADVOCATE(1)','ˈæ d v ə k ˌeɪ t','a dv ba ke i tv','アドバケイト','アドバケイト');
-INSERT INTO "hand_mapping" VALUES ('ADVOCATE(2)','ˈæ d v ə k ɪ t','a dv ba ki tv','アドバキト','アドバキト');
+INSERT INTO "hand_mapping" VALUES ('ADVANCE','ə d v ˈɑː n s','a dv Va - nv sv','アドバーンス','アドバーンス');
+INSERT INTO "hand_mapping" VALUES ('ADVANCED','ə d v ˈɑː n s t','a dv Va - nv sv tv','アドバーンスト','アドバーンスト');
+INSERT INTO "hand_mapping" VALUES ('ADVANCEMENT','ə d v ˈɑː n s m ə n t','a dv Va - nv sv ma nv tv','アドバーンスマント','アドバーンスメント');
+INSERT INTO "hand_mapping" VALUES ('ADVANCES','ə d v ˈɑː n s ɪ z','a dv Va - nv si zv','アドバーンシズ','アドバーンシズ');
+INSERT INTO "hand_mapping" VALUES ('ADVANTAGE','ə d v ˈɑː n t ɪ dʒ','a dv Va - nv ti jyv','アドバーンティジュ','アドバーンティジュ');
+INSERT INTO "hand_mapping" VALUES ('ADVANTAGEOUS','ˌæ d v ə n t ˈeɪ dʒ ə s','a dv Va nv te i jya sv','アドバンテイジャス','アドバンテイジャス');
+INSERT INTO "hand_mapping" VALUES ('ADVANTAGES','ə d v ˈɑː n t ɪ dʒ ɪ z','a dv Va - nv ti jyi zv','アドバーンティジィズ','アドバーンティジィズ');
+INSERT INTO "hand_mapping" VALUES ('ADVENT(1)','ˈæ d v ɛ n t','a dv Ve nv tv','アドベント','アドベント');
+INSERT INTO "hand_mapping" VALUES ('ADVENT(2)','ˈæ d v ə n t','a dv Va nv tv','アドバント','アドバント');
+INSERT INTO "hand_mapping" VALUES ('ADVENTURE','ə d v ˈɛ n tʃ ə','a dv Ve nv tya','アドベンチャ','アドベンチャ');
+INSERT INTO "hand_mapping" VALUES ('ADVENTURES','ə d v ˈɛ n tʃ ə z','a dv Ve nv tya zv','アドベンチャズ','アドベンチャズ');
+INSERT INTO "hand_mapping" VALUES ('ADVENTUROUS','ə d v ˈɛ n tʃ ə ɹ ə z','a dv Ve nv tya ra zv','アドベンチャラズ','アドベンチャラズ');
+INSERT INTO "hand_mapping" VALUES ('ADVERSARY','ˈæ d v ə s ə ɹ i','a dv Va sa ri -','アドバサリー','アドバサリー');
+INSERT INTO "hand_mapping" VALUES ('ADVERSE(1)','ˈæ d v ɜː s','a dv Ve - sv','アドベース','アドベース');
+INSERT INTO "hand_mapping" VALUES ('ADVERSE(2)','æ d v ˈɜː s','a dv Ve - sv','アドベース','アドベース');
+INSERT INTO "hand_mapping" VALUES ('ADVERT','æ d v ˈɜː t','a dv Ve - tv','アドベート','アドベート');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISE','ˈæ d v ə t ˌaɪ z','a dv Va ta i zv','アドバタイズ','アドバタイズ');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISED','ˈæ d v ə t ˌaɪ z d','a dv Va ta i zv dv','アドバタイズド','アドバタイズド');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENT(1)','ə d v ˈɜː t ɪ s m ə n t','a dv Ve - ti sv ma nv tv','アドベーティスマント','アドベーティスメント');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENT(2)','ə d v ˈɜː t ɪ z m ə n t','a dv Ve - ti zv ma nv tv','アドベーティズマント','アドベーティズメント');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENTS(1)','ə d v ˈɜː t ɪ s m ə n t s','a dv Ve - ti sv ma nv tsv','アドベーティスマンツ','アドベーティスマンツ');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISEMENTS(2)','ə d v ˈɜː t ɪ z m ə n t s','a dv Ve - ti zv ma nv tsv','アドベーティズマンツ','アドベーティズマンツ');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISER','ˈæ d v ə t ˌaɪ z ə','a dv Va ta i za','アドバタイザ','アドバタイザ');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISERS','ˈæ d v ə t ˌaɪ z ə z','a dv Va ta i za zv','アドバタイザズ','アドバタイザズ');
+INSERT INTO "hand_mapping" VALUES ('ADVERTISING','ˈæ d v ə t ˌaɪ z ɪ ŋ','a dv Va ta i zi Nv','アドバタイジン','アドバタイジング');
+INSERT INTO "hand_mapping" VALUES ('ADVICE','ə d v ˈaɪ s','a dv Va i sv','アドバイス','アドバイス');
+INSERT INTO "hand_mapping" VALUES ('ADVISE','ə d v ˈaɪ z','a dv Va i zv','アドバイズ','アドバイズ');
+INSERT INTO "hand_mapping" VALUES ('ADVISED','ə d v ˈaɪ z d','a dv Va i zv dv','アドバイズド','アドバイズド');
+INSERT INTO "hand_mapping" VALUES ('ADVISER','ə d v ˈaɪ z ə','a dv Va i za','アドバイザ','アドバイザ');
+INSERT INTO "hand_mapping" VALUES ('ADVISERS','ə d v ˈaɪ z ə z','a dv Va i za zv','アドバイザズ','アドバイザズ');
+INSERT INTO "hand_mapping" VALUES ('ADVISOR','ə d v ˈaɪ z ə','a dv Va i za','アドバイザ','アドバイザ');
+INSERT INTO "hand_mapping" VALUES ('ADVISORS','ə d v ˈaɪ z ə z','a dv Va i za zv','アドバイザズ','アドバイザズ');
+INSERT INTO "hand_mapping" VALUES ('ADVISORY','ə d v ˈaɪ z ə ɹ i','a dv Va i za ri -','アドバイザリー','アドバイザリー');
+INSERT INTO "hand_mapping" VALUES ('ADVOCACY','ˈæ d v ə k ə s i','a dv Va ka si -','アドバカシー','アドバカシー');
+INSERT INTO "hand_mapping" VALUES ('ADVOCATE(1)','ˈæ d v ə k ˌeɪ t','a dv Va ke i tv','アドバケイト','アドバケイト');
+INSERT INTO "hand_mapping" VALUES ('ADVOCATE(2)','ˈæ d v ə k ɪ t','a dv Va ki tv','アドバキト','アドバキト');
 INSERT INTO "hand_mapping" VALUES ('ADWARE','ˈæ d w ˌɛə','a dv we a -','アドウェアー','アドウェアー');
 INSERT INTO "hand_mapping" VALUES ('AERIAL','ˈɛə ɹ ɪə l','e a ri a rv','エアリアル','エアリアル');
 INSERT INTO "hand_mapping" VALUES ('AEROPLANE','ˌɛə ɹ ə p l ˈeɪ n','e a - ra pv re i nv','エアーラプレイン','エアーラプレイン');
@@ -677,11 +677,11 @@ INSERT INTO "hand_mapping" VALUES ('AGENDA','ə dʒ ˈɛ n d ə','a jye nv da','
 INSERT INTO "hand_mapping" VALUES ('AGENT','ˈeɪ dʒ ə n t','e i jya nv tv','エイジャント','エイジャント');
 INSERT INTO "hand_mapping" VALUES ('AGENTS','ˈeɪ dʒ ə n t s','e i jya nv tsv','エイジャンツ','エイジャンツ');
 INSERT INTO "hand_mapping" VALUES ('AGES','ˈeɪ dʒ ɪ z','e i jyi zv','エイジィズ','エイジィズ');
-INSERT INTO "hand_mapping" VALUES ('AGGRAVATE','ˈæ g ɹ ə v ˌeɪ t','a gv ra be i tv','アグラベイト','アグラベイト');
+INSERT INTO "hand_mapping" VALUES ('AGGRAVATE','ˈæ g ɹ ə v ˌeɪ t','a gv ra Ve i tv','アグラベイト','アグラベイト');
 INSERT INTO "hand_mapping" VALUES ('AGGREGATE(1)','ˈæ g ɹ ɪ g ˌeɪ t','a gv ri ge i tv','アグリゲイト','アグリゲイト');
 INSERT INTO "hand_mapping" VALUES ('AGGREGATE(2)','ˈæ g ɹ ɪ g ɪ t','a gv ri gi tv','アグリギト','アグリギト');
 INSERT INTO "hand_mapping" VALUES ('AGGRESSION','ə g ɹ ˈɛ ʃ ə n','a gv re sya nv','アグレシャン','アグレション');
-INSERT INTO "hand_mapping" VALUES ('AGGRESSIVE','ə g ɹ ˈɛ s ɪ v','a gv re si bv','アグレシブ','アグレシブ');
+INSERT INTO "hand_mapping" VALUES ('AGGRESSIVE','ə g ɹ ˈɛ s ɪ v','a gv re si Vv','アグレシブ','アグレシブ');
 INSERT INTO "hand_mapping" VALUES ('AGGRO','ˈæ g ɹ əʊ','a gv ro','アグロ','アグロ');
 INSERT INTO "hand_mapping" VALUES ('AGILE','ˈæ dʒ aɪ l','a jya i rv','アジャイル','アジャイル');
 INSERT INTO "hand_mapping" VALUES ('AGING','ˈeɪ dʒ ɪ ŋ','e i jyi Nv','エイジィン','エイジィング');
@@ -767,7 +767,7 @@ INSERT INTO "hand_mapping" VALUES ('ALIGN','ə l ˈaɪ n','a ra i nv','アライ
 INSERT INTO "hand_mapping" VALUES ('ALIGNMENT','ə l ˈaɪ n m ə n t','a ra i nv ma nv tv','アラインマント','アラインメント');
 INSERT INTO "hand_mapping" VALUES ('ALIKE','ə l ˈaɪ k','a ra i kv','アライク','アライク');
 INSERT INTO "hand_mapping" VALUES ('ALISON','ˈæ l ɪ s ə n','a ri sa nv','アリサン','アリサン');
-INSERT INTO "hand_mapping" VALUES ('ALIVE','ə l ˈaɪ v','a ra i bv','アライブ','アライブ');
+INSERT INTO "hand_mapping" VALUES ('ALIVE','ə l ˈaɪ v','a ra i Vv','アライブ','アライブ');
 INSERT INTO "hand_mapping" VALUES ('ALL','ˈɔː l','o - rv','オール','オール');
 INSERT INTO "hand_mapping" VALUES ('ALLAH(1)','ˈæ l ə','a ra','アラ','アラ');
 INSERT INTO "hand_mapping" VALUES ('ALLAH(2)','ə l ˈɑː','a ra -','アラー','アラー');
@@ -834,9 +834,9 @@ INSERT INTO "hand_mapping" VALUES ('ALTERATIONS','ˌɔː l t ə ɹ ˈeɪ ʃ ə n
 INSERT INTO "hand_mapping" VALUES ('ALTERED','ˈɔː l t ə d','o - rv ta dv','オールタド','オールタド');
 INSERT INTO "hand_mapping" VALUES ('ALTERNATE(1)','ˈɔː l t ə n ˌeɪ t','o - rv ta ne i tv','オールタネイト','オールタネイト');
 INSERT INTO "hand_mapping" VALUES ('ALTERNATE(2)','ˈɔː l t ə n ɪ t','o - rv ta ni tv','オールタニト','オールタニト');
-INSERT INTO "hand_mapping" VALUES ('ALTERNATIVE','ɔː l t ˈɜː n ə t ɪ v','o - rv te - na ti bv','オールテーナティブ','オールテーナティブ');
-INSERT INTO "hand_mapping" VALUES ('ALTERNATIVELY','ɔː l t ˈɜː n ə t ɪ v l i','o - rv te - na ti bv ri -','オールテーナティブリー','オールテーナティブリー');
-INSERT INTO "hand_mapping" VALUES ('ALTERNATIVES','ɔː l t ˈɜː n ə t ɪ v z','o - rv te - na ti bv zv','オールテーナティブズ','オールテーナティブズ');
+INSERT INTO "hand_mapping" VALUES ('ALTERNATIVE','ɔː l t ˈɜː n ə t ɪ v','o - rv te - na ti Vv','オールテーナティブ','オールテーナティブ');
+INSERT INTO "hand_mapping" VALUES ('ALTERNATIVELY','ɔː l t ˈɜː n ə t ɪ v l i','o - rv te - na ti Vv ri -','オールテーナティブリー','オールテーナティブリー');
+INSERT INTO "hand_mapping" VALUES ('ALTERNATIVES','ɔː l t ˈɜː n ə t ɪ v z','o - rv te - na ti Vv zv','オールテーナティブズ','オールテーナティブズ');
 INSERT INTO "hand_mapping" VALUES ('ALTHORP(1)','ˈɔː l θ ɔː p','o - rv so - pv','オールソープ','オールソープ');
 INSERT INTO "hand_mapping" VALUES ('ALTHORP(2)','ˈɔː l t ɹ ə p','o - rv tv ra pv','オールトラプ','オールトラプ');
 INSERT INTO "hand_mapping" VALUES ('ALTHOUGH','ˌɔː l ð ˈəʊ','o - rv zo -','オールゾー','オールゾー');
@@ -978,7 +978,7 @@ INSERT INTO "hand_mapping" VALUES ('ANNEX(2)','ˌæ n ˈɛ k s','a ne kv sv','
 INSERT INTO "hand_mapping" VALUES ('ANNEXE(1)','ˈæ n ɪ k s','a ni kv sv','アニクス','アニクス');
 INSERT INTO "hand_mapping" VALUES ('ANNEXE(2)','ˈæ n ˌɛ k s','a ne - kv sv','アネークス','アネークス');
 INSERT INTO "hand_mapping" VALUES ('ANNIE','ˈæ n i','a ni -','アニー','アニー');
-INSERT INTO "hand_mapping" VALUES ('ANNIVERSARY','ˌæ n ɪ v ˈɜː s ə ɹ i','a ni be - sa ri -','アニベーサリー','アニベーサリー');
+INSERT INTO "hand_mapping" VALUES ('ANNIVERSARY','ˌæ n ɪ v ˈɜː s ə ɹ i','a ni Ve - sa ri -','アニベーサリー','アニベーサリー');
 INSERT INTO "hand_mapping" VALUES ('ANNOTATED(1)','ˈæ n ə t ˌeɪ t ɪ d','a na te i ti dv','アナテイティド','アナテイティド');
 INSERT INTO "hand_mapping" VALUES ('ANNOTATED(2)','ˈæ n əʊ t ˌeɪ t ɪ d','a no te i ti dv','アノテイティド','アノテイティド');
 INSERT INTO "hand_mapping" VALUES ('ANNOTATION','ˌæ n ə t ˈeɪ ʃ ə n','a na te i sya nv','アナテイシャン','アナテイション');
@@ -1028,7 +1028,7 @@ INSERT INTO "hand_mapping" VALUES ('ANTIQUATED','ˈæ n t ɪ k w ˌeɪ t ɪ d','
 INSERT INTO "hand_mapping" VALUES ('ANTIQUE','æ n t ˈiː k','a nv ti - kv','アンティーク','アンティーク');
 INSERT INTO "hand_mapping" VALUES ('ANTIQUES','æ n t ˈiː k s','a nv ti - kv sv','アンティークス','アンティークス');
 INSERT INTO "hand_mapping" VALUES ('ANTIQUITY','æ n t ˈɪ k w ɪ t i','a nv ti kwi ti -','アンティクィティー','アンティクィティー');
-INSERT INTO "hand_mapping" VALUES ('ANTIVIRUS','ˌæ n t ɪ v ˈaɪ ɹ ə s','a nv ti ba i ra sv','アンティバイラス','アンティバイラス');
+INSERT INTO "hand_mapping" VALUES ('ANTIVIRUS','ˌæ n t ɪ v ˈaɪ ɹ ə s','a nv ti Va i ra sv','アンティバイラス','アンティバイラス');
 INSERT INTO "hand_mapping" VALUES ('ANTONIO','æ n t ˈəʊ n ɪ əʊ','a nv to - ni o','アントーニオ','アントーニオ');
 INSERT INTO "hand_mapping" VALUES ('ANUS','ˈeɪ n ə s','e i na sv','エイナス','エイナス');
 INSERT INTO "hand_mapping" VALUES ('ANXIETY','æ ŋ z ˈaɪ ə t i','a Nv za i a ti -','アンザイアティー','アンザイアティー');
@@ -1112,9 +1112,9 @@ INSERT INTO "hand_mapping" VALUES ('APPROPRIATE(1)','ə p ɹ ˈəʊ p ɹ ɪə t'
 INSERT INTO "hand_mapping" VALUES ('APPROPRIATE(2)','ə p ɹ ˈəʊ p ɹ ɪ ˌeɪ t','a pv ro - pv ri e i tv','アプロープリエイト','アプロープリエイト');
 INSERT INTO "hand_mapping" VALUES ('APPROPRIATELY','ə p ɹ ˈəʊ p ɹ ɪə t l i','a pv ro - pv ri a tv ri -','アプロープリアトリー','アプロープリアトリー');
 INSERT INTO "hand_mapping" VALUES ('APPROPRIATIONS','ə p ɹ ˌəʊ p ɹ ɪ ˈeɪ ʃ ə n z','a pv ro pv ri e i sya nv zv','アプロプリエイシャンズ','アプロプリエイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('APPROVAL','ə p ɹ ˈuː v ə l','a pv ru - ba rv','アプルーバル','アプルーバル');
-INSERT INTO "hand_mapping" VALUES ('APPROVE','ə p ɹ ˈuː v','a pv ru - bv','アプルーブ','アプルーブ');
-INSERT INTO "hand_mapping" VALUES ('APPROVED','ə p ɹ ˈuː v d','a pv ru - bv dv','アプルーブド','アプルーブド');
+INSERT INTO "hand_mapping" VALUES ('APPROVAL','ə p ɹ ˈuː v ə l','a pv ru - Va rv','アプルーバル','アプルーバル');
+INSERT INTO "hand_mapping" VALUES ('APPROVE','ə p ɹ ˈuː v','a pv ru - Vv','アプルーブ','アプルーブ');
+INSERT INTO "hand_mapping" VALUES ('APPROVED','ə p ɹ ˈuː v d','a pv ru - Vv dv','アプルーブド','アプルーブド');
 INSERT INTO "hand_mapping" VALUES ('APPROXIMATE(1)','ə p ɹ ˈɒ k s ɪ m ˌeɪ t','a pv ro x kv si me i tv','アプロックシメイト','アプロックシメイト');
 INSERT INTO "hand_mapping" VALUES ('APPROXIMATE(2)','ə p ɹ ˈɒ k s ɪ m ɪ t','a pv ro x kv si mi tv','アプロックシミト','アプロックシミト');
 INSERT INTO "hand_mapping" VALUES ('APPROXIMATELY','ə p ɹ ˈɒ k s ɪ m ə t l i','a pv ro x kv si ma tv ri -','アプロックシマトリー','アプロックシマトリー');
@@ -1147,9 +1147,9 @@ INSERT INTO "hand_mapping" VALUES ('ARCHITECT','ˈɑː k ɪ t ˌɛ k t','a - ki
 INSERT INTO "hand_mapping" VALUES ('ARCHITECTS','ˈɑː k ɪ t ˌɛ k t s','a - ki te - kv tsv','アーキテークツ','アーキテークツ');
 INSERT INTO "hand_mapping" VALUES ('ARCHITECTURAL','ˌɑː k ɪ t ˈɛ k tʃ ə ɹ ə l','a - ki te kv tya ra rv','アーキテクチャラル','アーキテクチャラル');
 INSERT INTO "hand_mapping" VALUES ('ARCHITECTURE','ˈɑː k ɪ t ˌɛ k tʃ ə','a - ki te - kv tya','アーキテークチャ','アーキテークチャ');
-INSERT INTO "hand_mapping" VALUES ('ARCHIVE','ˈɑː k ˌaɪ v','a - ka i bv','アーカイブ','アーカイブ');
-INSERT INTO "hand_mapping" VALUES ('ARCHIVED','ˈɑː k ˌaɪ v d','a - ka i bv dv','アーカイブド','アーカイブド');
-INSERT INTO "hand_mapping" VALUES ('ARCHIVES','ˈɑː k ˌaɪ v z','a - ka i bv zv','アーカイブズ','アーカイブズ');
+INSERT INTO "hand_mapping" VALUES ('ARCHIVE','ˈɑː k ˌaɪ v','a - ka i Vv','アーカイブ','アーカイブ');
+INSERT INTO "hand_mapping" VALUES ('ARCHIVED','ˈɑː k ˌaɪ v d','a - ka i Vv dv','アーカイブド','アーカイブド');
+INSERT INTO "hand_mapping" VALUES ('ARCHIVES','ˈɑː k ˌaɪ v z','a - ka i Vv zv','アーカイブズ','アーカイブズ');
 INSERT INTO "hand_mapping" VALUES ('ARCTIC','ˈɑː k t ɪ k','a - kv ti kv','アークティク','アークティク');
 INSERT INTO "hand_mapping" VALUES ('ARE(1)','ə','a','ア','ア');
 INSERT INTO "hand_mapping" VALUES ('ARE(2)','ˈɑː','a -','アー','アー');
@@ -1201,12 +1201,12 @@ INSERT INTO "hand_mapping" VALUES ('ARRANGEMENTS','ə ɹ ˈeɪ n dʒ m ə n t s'
 INSERT INTO "hand_mapping" VALUES ('ARRAY','ə ɹ ˈeɪ','a re i','アレイ','アレイ');
 INSERT INTO "hand_mapping" VALUES ('ARREST','ə ɹ ˈɛ s t','a re sv tv','アレスト','アレスト');
 INSERT INTO "hand_mapping" VALUES ('ARRESTED','ə ɹ ˈɛ s t ɪ d','a re sv ti dv','アレスティド','アレスティド');
-INSERT INTO "hand_mapping" VALUES ('ARRIVAL','ə ɹ ˈaɪ v ə l','a ra i ba rv','アライバル','アライバル');
-INSERT INTO "hand_mapping" VALUES ('ARRIVALS','ə ɹ ˈaɪ v ə l z','a ra i ba rv zv','アライバルズ','アライバルズ');
-INSERT INTO "hand_mapping" VALUES ('ARRIVE','ə ɹ ˈaɪ v','a ra i bv','アライブ','アライブ');
-INSERT INTO "hand_mapping" VALUES ('ARRIVED','ə ɹ ˈaɪ v d','a ra i bv dv','アライブド','アライブド');
-INSERT INTO "hand_mapping" VALUES ('ARRIVES','ə ɹ ˈaɪ v z','a ra i bv zv','アライブズ','アライブズ');
-INSERT INTO "hand_mapping" VALUES ('ARRIVING','ə ɹ ˈaɪ v ɪ ŋ','a ra i bi Nv','アライビン','アライビング');
+INSERT INTO "hand_mapping" VALUES ('ARRIVAL','ə ɹ ˈaɪ v ə l','a ra i Va rv','アライバル','アライバル');
+INSERT INTO "hand_mapping" VALUES ('ARRIVALS','ə ɹ ˈaɪ v ə l z','a ra i Va rv zv','アライバルズ','アライバルズ');
+INSERT INTO "hand_mapping" VALUES ('ARRIVE','ə ɹ ˈaɪ v','a ra i Vv','アライブ','アライブ');
+INSERT INTO "hand_mapping" VALUES ('ARRIVED','ə ɹ ˈaɪ v d','a ra i Vv dv','アライブド','アライブド');
+INSERT INTO "hand_mapping" VALUES ('ARRIVES','ə ɹ ˈaɪ v z','a ra i Vv zv','アライブズ','アライブズ');
+INSERT INTO "hand_mapping" VALUES ('ARRIVING','ə ɹ ˈaɪ v ɪ ŋ','a ra i Vi Nv','アライビン','アライビング');
 INSERT INTO "hand_mapping" VALUES ('ARROW','ˈæ ɹ əʊ','a ro','アロ','アロ');
 INSERT INTO "hand_mapping" VALUES ('ARS','ˈɑː z','a - zv','アーズ','アーズ');
 INSERT INTO "hand_mapping" VALUES ('ARSE','ˈɑː s','a - sv','アース','アース');
@@ -1270,7 +1270,7 @@ INSERT INTO "hand_mapping" VALUES ('ASSEMBLED','ə s ˈɛ m b ə l d','a se Nv b
 INSERT INTO "hand_mapping" VALUES ('ASSEMBLY','ə s ˈɛ m b l i','a se nbv ri -','アセンブリー','アセンブリー');
 INSERT INTO "hand_mapping" VALUES ('ASSERT','ə s ˈɜː t','a se - tv','アセート','アセート');
 INSERT INTO "hand_mapping" VALUES ('ASSERTION','ə s ˈɜː ʃ ə n','a se - sya nv','アセーシャン','アセーション');
-INSERT INTO "hand_mapping" VALUES ('ASSERTIVE','ə s ˈɜː t ɪ v','a se - ti bv','アセーティブ','アセーティブ');
+INSERT INTO "hand_mapping" VALUES ('ASSERTIVE','ə s ˈɜː t ɪ v','a se - ti Vv','アセーティブ','アセーティブ');
 INSERT INTO "hand_mapping" VALUES ('ASSES','ˈɑː s ɪ z','a - si zv','アーシズ','アーシズ');
 INSERT INTO "hand_mapping" VALUES ('ASSESS','ə s ˈɛ s','a se sv','アセス','アセス');
 INSERT INTO "hand_mapping" VALUES ('ASSESSED','ə s ˈɛ s t','a se sv tv','アセスト','アセスト');
@@ -1375,7 +1375,7 @@ INSERT INTO "hand_mapping" VALUES ('ATTRACT','ə t ɹ ˈæ k t','a tv ra x kv tv
 INSERT INTO "hand_mapping" VALUES ('ATTRACTED','ə t ɹ ˈæ k t ɪ d','a tv ra x kv ti dv','アトラックティド','アトラックティド');
 INSERT INTO "hand_mapping" VALUES ('ATTRACTION','ə t ɹ ˈæ k ʃ ə n','a tv ra x kv sya nv','アトラックシャン','アトラックション');
 INSERT INTO "hand_mapping" VALUES ('ATTRACTIONS','ə t ɹ ˈæ k ʃ ə n z','a tv ra x kv sya nv zv','アトラックシャンズ','アトラックシャンズ');
-INSERT INTO "hand_mapping" VALUES ('ATTRACTIVE','ə t ɹ ˈæ k t ɪ v','a tv ra x kv ti bv','アトラックティブ','アトラックティブ');
+INSERT INTO "hand_mapping" VALUES ('ATTRACTIVE','ə t ɹ ˈæ k t ɪ v','a tv ra x kv ti Vv','アトラックティブ','アトラックティブ');
 INSERT INTO "hand_mapping" VALUES ('ATTRIBUTE(1)','ˈæ t ɹ ɪ b j ˌuː t','a x tv ri byu - tv','アットリビュート','アットリビュート');
 INSERT INTO "hand_mapping" VALUES ('ATTRIBUTE(2)','ə t ɹ ˈɪ b j ˌuː t','a tv ri byu - tv','アトリビュート','アトリビュート');
 INSERT INTO "hand_mapping" VALUES ('ATTRIBUTED','ə t ɹ ˈɪ b j ʊ t ɪ d','a tv ri byu ti dv','アトリビュティド','アトリビュティド');
@@ -1424,30 +1424,30 @@ INSERT INTO "hand_mapping" VALUES ('AUTOMATICALLY','ˌɔː t ə m ˈæ t ɪ k l
 INSERT INTO "hand_mapping" VALUES ('AUTOMATION','ɔː t ə m ˈeɪ ʃ ə n','o - ta me i sya nv','オータメイシャン','オータメイション');
 INSERT INTO "hand_mapping" VALUES ('AUTOMOBILE','ˌɔː t ə m ə b ˈiː l','o - ta ma bi - rv','オータマビール','オータマビール');
 INSERT INTO "hand_mapping" VALUES ('AUTOMOBILES','ˈɔː t ə m əʊ b ˌiː l z','o - ta mo bi - rv zv','オータモビールズ','オータモビールズ');
-INSERT INTO "hand_mapping" VALUES ('AUTOMOTIVE','ˌɔː t ə m ˈəʊ t ɪ v','o - ta mo - ti bv','オータモーティブ','オータモーティブ');
+INSERT INTO "hand_mapping" VALUES ('AUTOMOTIVE','ˌɔː t ə m ˈəʊ t ɪ v','o - ta mo - ti Vv','オータモーティブ','オータモーティブ');
 INSERT INTO "hand_mapping" VALUES ('AUTONOMOUS','ɔː t ˈɒ n ə m ə s','o - to na ma sv','オートナマス','オートナマス');
 INSERT INTO "hand_mapping" VALUES ('AUTONOMY','ɔː t ˈɒ n ə m i','o - to na mi -','オートナミー','オートナミー');
 INSERT INTO "hand_mapping" VALUES ('AUTOS','ˈɔː t əʊ z','o - to zv','オートズ','オートズ');
 INSERT INTO "hand_mapping" VALUES ('AUTUMN','ˈɔː t ə m','o - ta mv','オータム','オータム');
 INSERT INTO "hand_mapping" VALUES ('AUXILIARY(1)','ɔː g z ˈɪ l j ə ɹ i','o - gv zi rya ri -','オーグジリャリー','オーグジリャリー');
 INSERT INTO "hand_mapping" VALUES ('AUXILIARY(2)','ɔː g z ˈɪ l ə ɹ i','o - gv zi ra ri -','オーグジラリー','オーグジラリー');
-INSERT INTO "hand_mapping" VALUES ('AVAIL','ə v ˈeɪ l','a be i rv','アベイル','アベイル');
-INSERT INTO "hand_mapping" VALUES ('AVAILABILITY','ə v ˌeɪ l ə b ˈɪ l ɪ t i','a be i ra bi ri ti -','アベイラビリティー','アベイラビリティー');
-INSERT INTO "hand_mapping" VALUES ('AVAILABLE','ə v ˈeɪ l ə b ə l','a be i ra ba rv','アベイラバル','アベイラバル');
-INSERT INTO "hand_mapping" VALUES ('AVATAR','ˈæ v ə t ɑː','a ba ta','アバタ','アバタ');
-INSERT INTO "hand_mapping" VALUES ('AVENUE','ˈæ v ɪ n j ˌuː','a bi nyu -','アビニュー','アビニュー');
-INSERT INTO "hand_mapping" VALUES ('AVERAGE(1)','ˈæ v ɹ ɪ dʒ','a bv ri jyv','アブリジュ','アブリジュ');
-INSERT INTO "hand_mapping" VALUES ('AVERAGE(2)','ˈæ v ə ɹ ɪ dʒ','a ba ri jyv','アバリジュ','アバリジュ');
+INSERT INTO "hand_mapping" VALUES ('AVAIL','ə v ˈeɪ l','a Ve i rv','アベイル','アベイル');
+INSERT INTO "hand_mapping" VALUES ('AVAILABILITY','ə v ˌeɪ l ə b ˈɪ l ɪ t i','a Ve i ra bi ri ti -','アベイラビリティー','アベイラビリティー');
+INSERT INTO "hand_mapping" VALUES ('AVAILABLE','ə v ˈeɪ l ə b ə l','a Ve i ra ba rv','アベイラバル','アベイラバル');
+INSERT INTO "hand_mapping" VALUES ('AVATAR','ˈæ v ə t ɑː','a Va ta','アバタ','アバタ');
+INSERT INTO "hand_mapping" VALUES ('AVENUE','ˈæ v ɪ n j ˌuː','a Vi nyu -','アビニュー','アビニュー');
+INSERT INTO "hand_mapping" VALUES ('AVERAGE(1)','ˈæ v ɹ ɪ dʒ','a Vv ri jyv','アブリジュ','アブリジュ');
+INSERT INTO "hand_mapping" VALUES ('AVERAGE(2)','ˈæ v ə ɹ ɪ dʒ','a Va ri jyv','アバリジュ','アバリジュ');
 INSERT INTO "hand_mapping" VALUES ('AVERHAM','ˈɛə ɹ ə m','e a ra mv','エアラム','エアラム');
-INSERT INTO "hand_mapping" VALUES ('AVERT','ə v ˈɜː t','a be - tv','アベート','アベート');
-INSERT INTO "hand_mapping" VALUES ('AVIATION','ˌeɪ v ɪ ˈeɪ ʃ ə n','e i bi e i sya nv','エイビエイシャン','エイビエイション');
-INSERT INTO "hand_mapping" VALUES ('AVID','ˈæ v ɪ d','a bi dv','アビド','アビド');
-INSERT INTO "hand_mapping" VALUES ('AVOCADO','ˌæ v ə k ˈɑː d əʊ','a ba ka - do','アバカード','アバカード');
-INSERT INTO "hand_mapping" VALUES ('AVOCADOS','ˌæ v ə k ˈɑː d əʊ z','a ba ka - do zv','アバカードズ','アバカードズ');
-INSERT INTO "hand_mapping" VALUES ('AVOID','ə v ˈɔɪ d','a bo i dv','アボイド','アボイド');
-INSERT INTO "hand_mapping" VALUES ('AVOIDED','ə v ˈɔɪ d ɪ d','a bo i di dv','アボイディド','アボイディド');
-INSERT INTO "hand_mapping" VALUES ('AVOIDING','ə v ˈɔɪ d ɪ ŋ','a bo i di Nv','アボイディン','アボイディング');
-INSERT INTO "hand_mapping" VALUES ('AVON','ˈeɪ v ə n','e i ba nv','エイバン','エイバン');
+INSERT INTO "hand_mapping" VALUES ('AVERT','ə v ˈɜː t','a Ve - tv','アベート','アベート');
+INSERT INTO "hand_mapping" VALUES ('AVIATION','ˌeɪ v ɪ ˈeɪ ʃ ə n','e i Vi e i sya nv','エイビエイシャン','エイビエイション');
+INSERT INTO "hand_mapping" VALUES ('AVID','ˈæ v ɪ d','a Vi dv','アビド','アビド');
+INSERT INTO "hand_mapping" VALUES ('AVOCADO','ˌæ v ə k ˈɑː d əʊ','a Va ka - do','アバカード','アバカード');
+INSERT INTO "hand_mapping" VALUES ('AVOCADOS','ˌæ v ə k ˈɑː d əʊ z','a Va ka - do zv','アバカードズ','アバカードズ');
+INSERT INTO "hand_mapping" VALUES ('AVOID','ə v ˈɔɪ d','a Vo i dv','アボイド','アボイド');
+INSERT INTO "hand_mapping" VALUES ('AVOIDED','ə v ˈɔɪ d ɪ d','a Vo i di dv','アボイディド','アボイディド');
+INSERT INTO "hand_mapping" VALUES ('AVOIDING','ə v ˈɔɪ d ɪ ŋ','a Vo i di Nv','アボイディン','アボイディング');
+INSERT INTO "hand_mapping" VALUES ('AVON','ˈeɪ v ə n','e i Va nv','エイバン','エイバン');
 INSERT INTO "hand_mapping" VALUES ('AW','ˈɔː','o -','オー','オー');
 INSERT INTO "hand_mapping" VALUES ('AWAIT','ə w ˈeɪ t','a we i tv','アウェイト','アウェイト');
 INSERT INTO "hand_mapping" VALUES ('AWAITING','ə w ˈeɪ t ɪ ŋ','a we i ti Nv','アウェイティン','アウェイティング');
@@ -1678,7 +1678,7 @@ INSERT INTO "hand_mapping" VALUES ('BEAUTIFUL','b j ˈuː t ɪ f ə l','byu - ti
 INSERT INTO "hand_mapping" VALUES ('BEAUTIFULLY','b j ˈuː t ɪ f l i','byu - ti fv ri -','ビューティフリー','ビューティフリー');
 INSERT INTO "hand_mapping" VALUES ('BEAUTY','b j ˈuː t i','byu - ti -','ビューティー','ビューティー');
 INSERT INTO "hand_mapping" VALUES ('BEAUX','b ˈəʊ z','bo - zv','ボーズ','ボーズ');
-INSERT INTO "hand_mapping" VALUES ('BEAVER','b ˈiː v ə','bi - ba','ビーバ','ビーバ');
+INSERT INTO "hand_mapping" VALUES ('BEAVER','b ˈiː v ə','bi - Va','ビーバ','ビーバ');
 INSERT INTO "hand_mapping" VALUES ('BECAME','b ɪ k ˈeɪ m','bi ke i mv','ビケイム','ビケイム');
 INSERT INTO "hand_mapping" VALUES ('BECAUSE(1)','b ɪ k ˈɒ z','bi ko zv','ビコズ','ビコズ');
 INSERT INTO "hand_mapping" VALUES ('BECAUSE(2)','b ɪ k ˈə z','bi ka zv','ビカズ','ビカズ');
@@ -1696,7 +1696,7 @@ INSERT INTO "hand_mapping" VALUES ('BEDS','b ˈɛ d z','be zv','ベズ','ベズ'
 INSERT INTO "hand_mapping" VALUES ('BEE','b ˈiː','bi -','ビー','ビー');
 INSERT INTO "hand_mapping" VALUES ('BEECH','b ˈiː tʃ','bi - tyv','ビーチュ','ビーチュ');
 INSERT INTO "hand_mapping" VALUES ('BEEF','b ˈiː f','bi - fv','ビーフ','ビーフ');
-INSERT INTO "hand_mapping" VALUES ('BEEHIVE','b ˈiː h ˌaɪ v','bi - ha i bv','ビーハイブ','ビーハイブ');
+INSERT INTO "hand_mapping" VALUES ('BEEHIVE','b ˈiː h ˌaɪ v','bi - ha i Vv','ビーハイブ','ビーハイブ');
 INSERT INTO "hand_mapping" VALUES ('BEEN(1)','b ɪ n','bi nv','ビン','ビン');
 INSERT INTO "hand_mapping" VALUES ('BEEN(2)','b ˈiː n','bi - nv','ビーン','ビーン');
 INSERT INTO "hand_mapping" VALUES ('BEEN(3)','b ˈɪ n','bi nv','ビン','ビン');
@@ -1705,7 +1705,7 @@ INSERT INTO "hand_mapping" VALUES ('BEEPING','b ˈiː p ɪ ŋ','bi - pi Nv','ビ
 INSERT INTO "hand_mapping" VALUES ('BEEPS','b ˈiː p s','bi - pv sv','ビープス','ビープス');
 INSERT INTO "hand_mapping" VALUES ('BEER','b ˈɪə','bi a','ビア','ビア');
 INSERT INTO "hand_mapping" VALUES ('BEES','b ˈiː z','bi - zv','ビーズ','ビーズ');
-INSERT INTO "hand_mapping" VALUES ('BEETHOVEN','b ˌeɪ t ˈəʊ v ə n','be i to - ba nv','ベイトーバン','ベイトーバン');
+INSERT INTO "hand_mapping" VALUES ('BEETHOVEN','b ˌeɪ t ˈəʊ v ə n','be i to - Va nv','ベイトーバン','ベイトーバン');
 INSERT INTO "hand_mapping" VALUES ('BEETLE','b ˈiː t ə l','bi - ta rv','ビータル','ビータル');
 INSERT INTO "hand_mapping" VALUES ('BEETLES','b ˈiː t ə l z','bi - ta rv zv','ビータルズ','ビータルズ');
 INSERT INTO "hand_mapping" VALUES ('BEFALL','b ɪ f ˈɔː l','bi fo - rv','ビフォール','ビフォール');
@@ -1726,10 +1726,10 @@ INSERT INTO "hand_mapping" VALUES ('BEGOT','b ɪ g ˈɒ t','bi go x tv','ビゴ
 INSERT INTO "hand_mapping" VALUES ('BEGOTTEN','b ɪ g ˈɒ t ə n','bi go x ta nv','ビゴッタン','ビゴッタン');
 INSERT INTO "hand_mapping" VALUES ('BEGUN','b ɪ g ˈɐ n','bi ga nv','ビガン','ビガン');
 INSERT INTO "hand_mapping" VALUES ('BEHALF','b ɪ h ˈɑː f','bi ha - fv','ビハーフ','ビハーフ');
-INSERT INTO "hand_mapping" VALUES ('BEHAVE','b ɪ h ˈeɪ v','bi he i bv','ビヘイブ','ビヘイブ');
-INSERT INTO "hand_mapping" VALUES ('BEHAVIOR','b ɪ h ˈeɪ v j ə','bi he i bya','ビヘイビャ','ビヘイビャ');
-INSERT INTO "hand_mapping" VALUES ('BEHAVIORAL','b ɪ h ˈeɪ v j ə ɹ ə l','bi he i bya ra rv','ビヘイビャラル','ビヘイビャラル');
-INSERT INTO "hand_mapping" VALUES ('BEHAVIOUR','b ɪ h ˈeɪ v j ə','bi he i bya','ビヘイビャ','ビヘイビャ');
+INSERT INTO "hand_mapping" VALUES ('BEHAVE','b ɪ h ˈeɪ v','bi he i Vv','ビヘイブ','ビヘイブ');
+INSERT INTO "hand_mapping" VALUES ('BEHAVIOR','b ɪ h ˈeɪ v j ə','bi he i Vya','ビヘイビャ','ビヘイビャ');
+INSERT INTO "hand_mapping" VALUES ('BEHAVIORAL','b ɪ h ˈeɪ v j ə ɹ ə l','bi he i Vya ra rv','ビヘイビャラル','ビヘイビャラル');
+INSERT INTO "hand_mapping" VALUES ('BEHAVIOUR','b ɪ h ˈeɪ v j ə','bi he i Vya','ビヘイビャ','ビヘイビャ');
 INSERT INTO "hand_mapping" VALUES ('BEHIND','b ɪ h ˈaɪ n d','bi ha i nv dv','ビハインド','ビハインド');
 INSERT INTO "hand_mapping" VALUES ('BEIGE','b ˈeɪ ʒ','be i jyv','ベイジュ','ベイジュ');
 INSERT INTO "hand_mapping" VALUES ('BEIJING','b ˌeɪ ʒ ˈɪ ŋ','be i jyi Nv','ベイジィン','ベイジィング');
@@ -1746,10 +1746,10 @@ INSERT INTO "hand_mapping" VALUES ('BELGRADE(2)','b ˈɛ l g ɹ eɪ d','be rv gv
 INSERT INTO "hand_mapping" VALUES ('BELIE','b ɪ l ˈaɪ','bi ra i','ビライ','ビライ');
 INSERT INTO "hand_mapping" VALUES ('BELIEF','b ɪ l ˈiː f','bi ri - fv','ビリーフ','ビリーフ');
 INSERT INTO "hand_mapping" VALUES ('BELIEFS','b ɪ l ˈiː f s','bi ri - fv sv','ビリーフス','ビリーフス');
-INSERT INTO "hand_mapping" VALUES ('BELIEVE','b ɪ l ˈiː v','bi ri - bv','ビリーブ','ビリーブ');
-INSERT INTO "hand_mapping" VALUES ('BELIEVED','b ɪ l ˈiː v d','bi ri - bv dv','ビリーブド','ビリーブド');
-INSERT INTO "hand_mapping" VALUES ('BELIEVES','b ɪ l ˈiː v z','bi ri - bv zv','ビリーブズ','ビリーブズ');
-INSERT INTO "hand_mapping" VALUES ('BELIEVING','b ɪ l ˈiː v ɪ ŋ','bi ri - bi Nv','ビリービン','ビリービング');
+INSERT INTO "hand_mapping" VALUES ('BELIEVE','b ɪ l ˈiː v','bi ri - Vv','ビリーブ','ビリーブ');
+INSERT INTO "hand_mapping" VALUES ('BELIEVED','b ɪ l ˈiː v d','bi ri - Vv dv','ビリーブド','ビリーブド');
+INSERT INTO "hand_mapping" VALUES ('BELIEVES','b ɪ l ˈiː v z','bi ri - Vv zv','ビリーブズ','ビリーブズ');
+INSERT INTO "hand_mapping" VALUES ('BELIEVING','b ɪ l ˈiː v ɪ ŋ','bi ri - Vi Nv','ビリービン','ビリービング');
 INSERT INTO "hand_mapping" VALUES ('BELIZE(1)','b ɛ l ˈiː z','be ri - zv','ベリーズ','ベリーズ');
 INSERT INTO "hand_mapping" VALUES ('BELIZE(2)','b ə l ˈiː z','ba ri - zv','バリーズ','バリーズ');
 INSERT INTO "hand_mapping" VALUES ('BELL','b ˈɛ l','be rv','ベル','ベル');
@@ -1760,8 +1760,8 @@ INSERT INTO "hand_mapping" VALUES ('BELONG','b ɪ l ˈɒ ŋ','bi ro Nv','ビロ
 INSERT INTO "hand_mapping" VALUES ('BELONGED','b ɪ l ˈɒ ŋ d','bi ro Nv dv','ビロンド','ビロンド');
 INSERT INTO "hand_mapping" VALUES ('BELONGING','b ɪ l ˈɒ ŋ ɪ ŋ','bi ro Ni Nv','ビロンイン','ビロンイング');
 INSERT INTO "hand_mapping" VALUES ('BELONGS','b ɪ l ˈɒ ŋ z','bi ro Nv zv','ビロンズ','ビロンズ');
-INSERT INTO "hand_mapping" VALUES ('BELOVED(1)','b ɪ l ˈɐ v d','bi ra bv dv','ビラブド','ビラブド');
-INSERT INTO "hand_mapping" VALUES ('BELOVED(2)','b ɪ l ˈɐ v ɪ d','bi ra bi dv','ビラビド','ビラビド');
+INSERT INTO "hand_mapping" VALUES ('BELOVED(1)','b ɪ l ˈɐ v d','bi ra Vv dv','ビラブド','ビラブド');
+INSERT INTO "hand_mapping" VALUES ('BELOVED(2)','b ɪ l ˈɐ v ɪ d','bi ra Vi dv','ビラビド','ビラビド');
 INSERT INTO "hand_mapping" VALUES ('BELOW','b ɪ l ˈəʊ','bi ro -','ビロー','ビロー');
 INSERT INTO "hand_mapping" VALUES ('BELT','b ˈɛ l t','be rv tv','ベルト','ベルト');
 INSERT INTO "hand_mapping" VALUES ('BELTS','b ˈɛ l t s','be rv tsv','ベルツ','ベルツ');
@@ -1810,12 +1810,12 @@ INSERT INTO "hand_mapping" VALUES ('BETTER','b ˈɛ t ə','be ta','ベタ','ベ
 INSERT INTO "hand_mapping" VALUES ('BETTING','b ˈɛ t ɪ ŋ','be ti Nv','ベティン','ベティング');
 INSERT INTO "hand_mapping" VALUES ('BETTY','b ˈɛ t i','be ti -','ベティー','ベティー');
 INSERT INTO "hand_mapping" VALUES ('BETWEEN','b ɪ t w ˈiː n','bi twi - nv','ビトウィーン','ビトウィーン');
-INSERT INTO "hand_mapping" VALUES ('BEV','b ˈɛ v','be bv','ベブ','ベブ');
-INSERT INTO "hand_mapping" VALUES ('BEVERAGE(1)','b ˈɛ v ɹ ɪ dʒ','be bv ri jyv','ベブリジュ','ベブリジュ');
-INSERT INTO "hand_mapping" VALUES ('BEVERAGE(2)','b ˈɛ v ə ɹ ɪ dʒ','be ba ri jyv','ベバリジュ','ベバリジュ');
-INSERT INTO "hand_mapping" VALUES ('BEVERAGES','b ˈɛ v ɹ ɪ dʒ ɪ z','be bv ri jyi zv','ベブリジィズ','ベブリジィズ');
-INSERT INTO "hand_mapping" VALUES ('BEVERLEY','b ˈɛ v ə l i','be ba ri -','ベバリー','ベバリー');
-INSERT INTO "hand_mapping" VALUES ('BEVERLY','b ˈɛ v ə l i','be ba ri -','ベバリー','ベバリー');
+INSERT INTO "hand_mapping" VALUES ('BEV','b ˈɛ v','be Vv','ベブ','ベブ');
+INSERT INTO "hand_mapping" VALUES ('BEVERAGE(1)','b ˈɛ v ɹ ɪ dʒ','be Vv ri jyv','ベブリジュ','ベブリジュ');
+INSERT INTO "hand_mapping" VALUES ('BEVERAGE(2)','b ˈɛ v ə ɹ ɪ dʒ','be Va ri jyv','ベバリジュ','ベバリジュ');
+INSERT INTO "hand_mapping" VALUES ('BEVERAGES','b ˈɛ v ɹ ɪ dʒ ɪ z','be Vv ri jyi zv','ベブリジィズ','ベブリジィズ');
+INSERT INTO "hand_mapping" VALUES ('BEVERLEY','b ˈɛ v ə l i','be Va ri -','ベバリー','ベバリー');
+INSERT INTO "hand_mapping" VALUES ('BEVERLY','b ˈɛ v ə l i','be Va ri -','ベバリー','ベバリー');
 INSERT INTO "hand_mapping" VALUES ('BEWARE','b ɪ w ˈɛə','bi we a','ビウェア','ビウェア');
 INSERT INTO "hand_mapping" VALUES ('BEXLEY','b ˈɛ k s l i','be kv sv ri -','ベクスリー','ベクスリー');
 INSERT INTO "hand_mapping" VALUES ('BEYOND','b ɪ j ˈɒ n d','bi yo nv dv','ビヨンド','ビヨンド');
@@ -1861,7 +1861,7 @@ INSERT INTO "hand_mapping" VALUES ('BIND','b ˈaɪ n d','ba i nv dv','バイン
 INSERT INTO "hand_mapping" VALUES ('BINDING','b ˈaɪ n d ɪ ŋ','ba i nv di Nv','バインディン','バインディング');
 INSERT INTO "hand_mapping" VALUES ('BINGE','b ˈɪ n dʒ','bi nv jyv','ビンジュ','ビンジュ');
 INSERT INTO "hand_mapping" VALUES ('BINGO','b ˈɪ ŋ g əʊ','bi Nv go','ビンゴ','ビンゴ');
-INSERT INTO "hand_mapping" VALUES ('BIODIVERSITY','b ˌaɪ əʊ d aɪ v ˈɜː s ɪ t i','ba i o da i be - si ti -','バイオダイベーシティー','バイオダイベーシティー');
+INSERT INTO "hand_mapping" VALUES ('BIODIVERSITY','b ˌaɪ əʊ d aɪ v ˈɜː s ɪ t i','ba i o da i Ve - si ti -','バイオダイベーシティー','バイオダイベーシティー');
 INSERT INTO "hand_mapping" VALUES ('BIOGRAPHIES','b aɪ ˈɒ g ɹ ə f i z','ba i o gv ra fi - zv','バイオグラフィーズ','バイオグラフィーズ');
 INSERT INTO "hand_mapping" VALUES ('BIOGRAPHY','b aɪ ˈɒ g ɹ ə f i','ba i o gv ra fi -','バイオグラフィー','バイオグラフィー');
 INSERT INTO "hand_mapping" VALUES ('BIOLOGICAL','b aɪ ə l ˈɒ dʒ ɪ k ə l','ba i a ro jyi ka rv','バイアロジィカル','バイアロジィカル');
@@ -2001,7 +2001,7 @@ INSERT INTO "hand_mapping" VALUES ('BOILED','b ˈɔɪ l d','bo i rv dv','ボイ
 INSERT INTO "hand_mapping" VALUES ('BOILER','b ˈɔɪ l ə','bo i ra','ボイラ','ボイラ');
 INSERT INTO "hand_mapping" VALUES ('BOILING','b ˈɔɪ l ɪ ŋ','bo i ri Nv','ボイリン','ボイリング');
 INSERT INTO "hand_mapping" VALUES ('BOLD','b ˈəʊ l d','bo - rv dv','ボールド','ボールド');
-INSERT INTO "hand_mapping" VALUES ('BOLIVIA','b ə l ˈɪ v ɪə','ba ri bi a','バリビア','ボリビア');
+INSERT INTO "hand_mapping" VALUES ('BOLIVIA','b ə l ˈɪ v ɪə','ba ri Vi a','バリビア','ボリビア');
 INSERT INTO "hand_mapping" VALUES ('BOLLOCKS','b ˈɒ l ə k s','bo ra kv sv','ボラクス','ボラクス');
 INSERT INTO "hand_mapping" VALUES ('BOLT','b ˈəʊ l t','bo - rv tv','ボールト','ボールト');
 INSERT INTO "hand_mapping" VALUES ('BOLTON','b ˈəʊ l t ə n','bo - rv ta nv','ボールタン','ボールタン');
@@ -2072,7 +2072,7 @@ INSERT INTO "hand_mapping" VALUES ('BOTTOMS','b ˈɒ t ə m z','bo x ta mv zv','
 INSERT INTO "hand_mapping" VALUES ('BOUGH','b ˈaʊ','ba u','バウ','バウ');
 INSERT INTO "hand_mapping" VALUES ('BOUGHT','b ˈɔː t','bo - tv','ボート','ボート');
 INSERT INTO "hand_mapping" VALUES ('BOULDER','b ˈəʊ l d ə','bo - rv da','ボールダ','ボールダ');
-INSERT INTO "hand_mapping" VALUES ('BOULEVARD','b ˈuː l ə v ˌɑː d','bu - ra ba - dv','ブーラバード','ブーラバード');
+INSERT INTO "hand_mapping" VALUES ('BOULEVARD','b ˈuː l ə v ˌɑː d','bu - ra Va - dv','ブーラバード','ブーラバード');
 INSERT INTO "hand_mapping" VALUES ('BOUNCE','b ˈaʊ n s','ba u nv sv','バウンス','バウンス');
 INSERT INTO "hand_mapping" VALUES ('BOUNCING','b ˈaʊ n s ɪ ŋ','ba u nv si Nv','バウンシン','バウンシング');
 INSERT INTO "hand_mapping" VALUES ('BOUND','b ˈaʊ n d','ba u nv dv','バウンド','バウンド');
@@ -2129,9 +2129,9 @@ INSERT INTO "hand_mapping" VALUES ('BRAS','b ɹ ˈɑː z','bv ra - zv','ブラ
 INSERT INTO "hand_mapping" VALUES ('BRASH','b ɹ ˈæ ʃ','bv ra x syv','ブラッシュ','ブラッシュ');
 INSERT INTO "hand_mapping" VALUES ('BRASS','b ɹ ˈɑː s','bv ra - sv','ブラース','ブラース');
 INSERT INTO "hand_mapping" VALUES ('BRAT','b ɹ ˈæ t','bv ra x tv','ブラット','ブラット');
-INSERT INTO "hand_mapping" VALUES ('BRATISLAVA','b ɹ ˌæ t ɪ s l ˈɑː v ə','bv ra x ti sv ra - ba','ブラッティスラーバ','ブラッティスラーバ');
-INSERT INTO "hand_mapping" VALUES ('BRAVE','b ɹ ˈeɪ v','bv re i bv','ブレイブ','ブレイブ');
-INSERT INTO "hand_mapping" VALUES ('BRAVO','b ɹ ˈɑː v əʊ','bv ra - bo','ブラーボ','ブラーボ');
+INSERT INTO "hand_mapping" VALUES ('BRATISLAVA','b ɹ ˌæ t ɪ s l ˈɑː v ə','bv ra x ti sv ra - Va','ブラッティスラーバ','ブラッティスラーバ');
+INSERT INTO "hand_mapping" VALUES ('BRAVE','b ɹ ˈeɪ v','bv re i Vv','ブレイブ','ブレイブ');
+INSERT INTO "hand_mapping" VALUES ('BRAVO','b ɹ ˈɑː v əʊ','bv ra - Vo','ブラーボ','ブラーボ');
 INSERT INTO "hand_mapping" VALUES ('BRAWL','b ɹ ˈɔː l','bv ro - rv','ブロール','ブロール');
 INSERT INTO "hand_mapping" VALUES ('BRAY','b ɹ ˈeɪ','bv re i','ブレイ','ブレイ');
 INSERT INTO "hand_mapping" VALUES ('BRAZIL','b ɹ ə z ˈɪ l','bv ra zi rv','ブラジル','ブラジル');
@@ -2425,7 +2425,7 @@ INSERT INTO "hand_mapping" VALUES ('CALLS','k ˈɔː l z','ko - rv zv','コー
 INSERT INTO "hand_mapping" VALUES ('CALM','k ˈɑː m','ka - mv','カーム','カーム');
 INSERT INTO "hand_mapping" VALUES ('CALMLY','k ˈɑː m l i','ka - mv ri -','カームリー','カームリー');
 INSERT INTO "hand_mapping" VALUES ('CALORIES','k ˈæ l ə ɹ i z','ka ra ri - zv','カラリーズ','カラリーズ');
-INSERT INTO "hand_mapping" VALUES ('CALVES','k ˈɑː v z','ka - bv zv','カーブズ','カーブズ');
+INSERT INTO "hand_mapping" VALUES ('CALVES','k ˈɑː v z','ka - Vv zv','カーブズ','カーブズ');
 INSERT INTO "hand_mapping" VALUES ('CAM','k ˈæ m','ka mv','カム','カム');
 INSERT INTO "hand_mapping" VALUES ('CAMARADERIE','k ˌæ m ə ɹ ˈɑː d ə ɹ i','ka ma ra - da ri -','カマラーダリー','カマラーダリー');
 INSERT INTO "hand_mapping" VALUES ('CAMBODIA','k ˌæ m b ˈəʊ d ɪə','ka Nv bo - di a','カンボーディア','カンボーディア');
@@ -2485,7 +2485,7 @@ INSERT INTO "hand_mapping" VALUES ('CANS','k ˈæ n z','ka nv zv','カンズ','
 INSERT INTO "hand_mapping" VALUES ('CANT','k ˈæ n t','ka nv tv','カント','カント');
 INSERT INTO "hand_mapping" VALUES ('CANTEEN','k æ n t ˈiː n','ka nv ti - nv','カンティーン','カンティーン');
 INSERT INTO "hand_mapping" VALUES ('CANTERBURY','k ˈæ n t ə b ɹ i','ka nv ta bv ri -','カンタブリー','カンタブリー');
-INSERT INTO "hand_mapping" VALUES ('CANVAS','k ˈæ n v ə s','ka nv ba sv','カンバス','カンバス');
+INSERT INTO "hand_mapping" VALUES ('CANVAS','k ˈæ n v ə s','ka nv Va sv','カンバス','カンバス');
 INSERT INTO "hand_mapping" VALUES ('CANYON','k ˈæ n j ə n','ka nya nv','カニャン','カニャン');
 INSERT INTO "hand_mapping" VALUES ('CAP','k ˈæ p','ka x pv','カップ','カップ');
 INSERT INTO "hand_mapping" VALUES ('CAPABILITIES','k ˌeɪ p ə b ˈɪ l ɪ t i z','ke i pa bi ri ti - zv','ケイパビリティーズ','ケイパビリティーズ');
@@ -2509,8 +2509,8 @@ INSERT INTO "hand_mapping" VALUES ('CAPTOR','k ˈæ p t ə','ka x pv ta','カッ
 INSERT INTO "hand_mapping" VALUES ('CAPTURE','k ˈæ p tʃ ə','ka x pv tya','カップチャ','カップチャ');
 INSERT INTO "hand_mapping" VALUES ('CAPTURED','k ˈæ p tʃ ə d','ka x pv tya dv','カップチャド','カップチャド');
 INSERT INTO "hand_mapping" VALUES ('CAR','k ˈɑː','ka -','カー','カー');
-INSERT INTO "hand_mapping" VALUES ('CARAVAN','k ˈæ ɹ ə v ˌæ n','ka ra ba nv','カラバン','カラバン');
-INSERT INTO "hand_mapping" VALUES ('CARAVANS','k ˈæ ɹ ə v ˌæ n z','ka ra ba nv zv','カラバンズ','カラバンズ');
+INSERT INTO "hand_mapping" VALUES ('CARAVAN','k ˈæ ɹ ə v ˌæ n','ka ra Va nv','カラバン','カラバン');
+INSERT INTO "hand_mapping" VALUES ('CARAVANS','k ˈæ ɹ ə v ˌæ n z','ka ra Va nv zv','カラバンズ','カラバンズ');
 INSERT INTO "hand_mapping" VALUES ('CARBON','k ˈɑː b ə n','ka - ba nv','カーバン','カーバン');
 INSERT INTO "hand_mapping" VALUES ('CARBONATE','k ˈɑː b ə n ˌeɪ t','ka - ba ne i tv','カーバネイト','カーバネイト');
 INSERT INTO "hand_mapping" VALUES ('CARBONATED','k ˈɑː b ə n ˌeɪ t ɪ d','ka - ba ne i ti dv','カーバネイティド','カーバネイティド');
@@ -2520,7 +2520,7 @@ INSERT INTO "hand_mapping" VALUES ('CARDBOARD','k ˈɑː d b ˌɔː d','ka - dv
 INSERT INTO "hand_mapping" VALUES ('CARDIAC','k ˈɑː d ɪ ˌæ k','ka - di a x kv','カーディアック','カーディアック');
 INSERT INTO "hand_mapping" VALUES ('CARDIFF','k ˈɑː d ɪ f','ka - di fv','カーディフ','カーディフ');
 INSERT INTO "hand_mapping" VALUES ('CARDIGAN','k ˈɑː d ɪ g ə n','ka - di ga nv','カーディガン','カーディガン');
-INSERT INTO "hand_mapping" VALUES ('CARDIOVASCULAR','k ˌɑː d ɪ əʊ v ˈæ s k j ʊ l ə','ka - di o ba x sv kyu ra','カーディオバッスキュラ','カーディオバッスキュラ');
+INSERT INTO "hand_mapping" VALUES ('CARDIOVASCULAR','k ˌɑː d ɪ əʊ v ˈæ s k j ʊ l ə','ka - di o Va x sv kyu ra','カーディオバッスキュラ','カーディオバッスキュラ');
 INSERT INTO "hand_mapping" VALUES ('CARDS','k ˈɑː d z','ka - zv','カーズ','カーズ');
 INSERT INTO "hand_mapping" VALUES ('CARE','k ˈɛə','ke a','ケア','ケア');
 INSERT INTO "hand_mapping" VALUES ('CARED','k ˈɛə d','ke a dv','ケアド','ケアド');
@@ -2540,8 +2540,8 @@ INSERT INTO "hand_mapping" VALUES ('CARING','k ˈɛə ɹ ɪ ŋ','ke a ri Nv','
 INSERT INTO "hand_mapping" VALUES ('CARL','k ˈɑː l','ka - rv','カール','カール');
 INSERT INTO "hand_mapping" VALUES ('CARLA','k ˈɑː l ə','ka - ra','カーラ','カーラ');
 INSERT INTO "hand_mapping" VALUES ('CARLOS','k ˈɑː l ɒ s','ka - ro sv','カーロス','カーロス');
-INSERT INTO "hand_mapping" VALUES ('CARNIVAL','k ˈɑː n ɪ v ə l','ka - ni ba rv','カーニバル','カーニバル');
-INSERT INTO "hand_mapping" VALUES ('CARNIVORE','k ˈɑː n ɪ v ˌɔː','ka - ni bo -','カーニボー','カーニボー');
+INSERT INTO "hand_mapping" VALUES ('CARNIVAL','k ˈɑː n ɪ v ə l','ka - ni Va rv','カーニバル','カーニバル');
+INSERT INTO "hand_mapping" VALUES ('CARNIVORE','k ˈɑː n ɪ v ˌɔː','ka - ni Vo -','カーニボー','カーニボー');
 INSERT INTO "hand_mapping" VALUES ('CAROL','k ˈæ ɹ ə l','ka ra rv','カラル','カラル');
 INSERT INTO "hand_mapping" VALUES ('CAROLE','k ˈæ ɹ ə l','ka ra rv','カラル','カラル');
 INSERT INTO "hand_mapping" VALUES ('CAROLINA','k ˌæ ɹ ə l ˈaɪ n ə','ka ra ra i na','カラライナ','カラライナ');
@@ -2573,7 +2573,7 @@ INSERT INTO "hand_mapping" VALUES ('CARTOON','k ɑː t ˈuː n','ka tu - nv','
 INSERT INTO "hand_mapping" VALUES ('CARTOONS','k ɑː t ˈuː n z','ka tu - nv zv','カトゥーンズ','カトゥーンズ');
 INSERT INTO "hand_mapping" VALUES ('CARTRIDGE','k ˈɑː t ɹ ɪ dʒ','ka - tv ri jyv','カートリジュ','カートリジュ');
 INSERT INTO "hand_mapping" VALUES ('CARTRIDGES','k ˈɑː t ɹ ɪ dʒ ɪ z','ka - tv ri jyi zv','カートリジィズ','カートリジィズ');
-INSERT INTO "hand_mapping" VALUES ('CARVE','k ˈɑː v','ka - bv','カーブ','カーブ');
+INSERT INTO "hand_mapping" VALUES ('CARVE','k ˈɑː v','ka - Vv','カーブ','カーブ');
 INSERT INTO "hand_mapping" VALUES ('CASCADE','k ˌæ s k ˌeɪ d','ka x sv ke i dv','カッスケイド','カッスケイド');
 INSERT INTO "hand_mapping" VALUES ('CASE','k ˈeɪ s','ke i sv','ケイス','ケイス');
 INSERT INTO "hand_mapping" VALUES ('CASES','k ˈeɪ s ɪ z','ke i si zv','ケイシズ','ケイシズ');
@@ -2632,11 +2632,11 @@ INSERT INTO "hand_mapping" VALUES ('CAUSES','k ˈɔː z ɪ z','ko - zi zv','コ
 INSERT INTO "hand_mapping" VALUES ('CAUSING','k ˈɔː z ɪ ŋ','ko - zi Nv','コージン','コージング');
 INSERT INTO "hand_mapping" VALUES ('CAUTION','k ˈɔː ʃ ə n','ko - sya nv','コーシャン','コーション');
 INSERT INTO "hand_mapping" VALUES ('CAUTIOUS','k ˈɔː ʃ ə s','ko - sya sv','コーシャス','コーシャス');
-INSERT INTO "hand_mapping" VALUES ('CAVE','k ˈeɪ v','ke i bv','ケイブ','ケイブ');
-INSERT INTO "hand_mapping" VALUES ('CAVEAT(1)','k ˈæ v ɪ ˌæ t','ka bi a x tv','カビアット','カビアット');
-INSERT INTO "hand_mapping" VALUES ('CAVEAT(2)','k ˈeɪ v ɪ ˌæ t','ke i bi a x tv','ケイビアット','ケイビアット');
-INSERT INTO "hand_mapping" VALUES ('CAVERN','k ˈæ v ə n','ka ba nv','カバン','カバン');
-INSERT INTO "hand_mapping" VALUES ('CAVITY','k ˈæ v ɪ t i','ka bi ti -','カビティー','カビティー');
+INSERT INTO "hand_mapping" VALUES ('CAVE','k ˈeɪ v','ke i Vv','ケイブ','ケイブ');
+INSERT INTO "hand_mapping" VALUES ('CAVEAT(1)','k ˈæ v ɪ ˌæ t','ka Vi a x tv','カビアット','カビアット');
+INSERT INTO "hand_mapping" VALUES ('CAVEAT(2)','k ˈeɪ v ɪ ˌæ t','ke i Vi a x tv','ケイビアット','ケイビアット');
+INSERT INTO "hand_mapping" VALUES ('CAVERN','k ˈæ v ə n','ka Va nv','カバン','カバン');
+INSERT INTO "hand_mapping" VALUES ('CAVITY','k ˈæ v ɪ t i','ka Vi ti -','カビティー','カビティー');
 INSERT INTO "hand_mapping" VALUES ('CAYMAN','k ˈeɪ m ə n','ke i ma nv','ケイマン','ケイマン');
 INSERT INTO "hand_mapping" VALUES ('CEASE','s ˈiː s','si - sv','シース','シース');
 INSERT INTO "hand_mapping" VALUES ('CEDAR','s ˈiː d ə','si - da','シーダ','シーダ');
@@ -2774,7 +2774,7 @@ INSERT INTO "hand_mapping" VALUES ('CHAT','tʃ ˈæ t','tya x tv','チャット'
 INSERT INTO "hand_mapping" VALUES ('CHATTER','tʃ ˈæ t ə','tya x ta','チャッタ','チャッタ');
 INSERT INTO "hand_mapping" VALUES ('CHATTERING','tʃ ˈæ t ə ɹ ɪ ŋ','tya x ta ri Nv','チャッタリン','チャッタリング');
 INSERT INTO "hand_mapping" VALUES ('CHATTING','tʃ ˈæ t ɪ ŋ','tya x ti Nv','チャッティン','チャッティング');
-INSERT INTO "hand_mapping" VALUES ('CHAUVINISM','ʃ ˈəʊ v ɪ n ˌɪ z ə m','syo - bi ni - za mv','ショービニーザム','ショービニーズム');
+INSERT INTO "hand_mapping" VALUES ('CHAUVINISM','ʃ ˈəʊ v ɪ n ˌɪ z ə m','syo - Vi ni - za mv','ショービニーザム','ショービニーズム');
 INSERT INTO "hand_mapping" VALUES ('CHEAP','tʃ ˈiː p','tyi - pv','チィープ','チィープ');
 INSERT INTO "hand_mapping" VALUES ('CHEAPER','tʃ ˈiː p ə','tyi - pa','チィーパ','チィーパ');
 INSERT INTO "hand_mapping" VALUES ('CHEAPEST','tʃ ˈiː p ɪ s t','tyi - pi sv tv','チィーピスト','チィーピスト');
@@ -2820,10 +2820,10 @@ INSERT INTO "hand_mapping" VALUES ('CHESTER','tʃ ˈɛ s t ə','tye sv ta','チ
 INSERT INTO "hand_mapping" VALUES ('CHESTER-LE-STREET','tʃ ˈɛ s t ə l ɪ s t ɹ ˌiː t','tye sv ta ri sv tv ri - tv','チェスタリストリート','チェスタリストリート');
 INSERT INTO "hand_mapping" VALUES ('CHESTERFIELD','tʃ ˈɛ s t ə f iː l d','tye sv ta fi - rv dv','チェスタフィールド','チェスタフィールド');
 INSERT INTO "hand_mapping" VALUES ('CHETAH','tʃ ˈiː t ə','tyi - ta','チィータ','チィータ');
-INSERT INTO "hand_mapping" VALUES ('CHEVROLET(1)','ʃ ˈɛ v ɹ əʊ l ˌeɪ','sye bv ro re i','シェブロレイ','シェブロレイ');
-INSERT INTO "hand_mapping" VALUES ('CHEVROLET(2)','ʃ ˈɛ v ɹ ə l ˌeɪ','sye bv ra re i','シェブラレイ','シェブラレイ');
-INSERT INTO "hand_mapping" VALUES ('CHEVY(1)','tʃ ˈɛ v i','tye bi -','チェビー','チェビー');
-INSERT INTO "hand_mapping" VALUES ('CHEVY(2)','ʃ ˈɛ v i','sye bi -','シェビー','シェビー');
+INSERT INTO "hand_mapping" VALUES ('CHEVROLET(1)','ʃ ˈɛ v ɹ əʊ l ˌeɪ','sye Vv ro re i','シェブロレイ','シェブロレイ');
+INSERT INTO "hand_mapping" VALUES ('CHEVROLET(2)','ʃ ˈɛ v ɹ ə l ˌeɪ','sye Vv ra re i','シェブラレイ','シェブラレイ');
+INSERT INTO "hand_mapping" VALUES ('CHEVY(1)','tʃ ˈɛ v i','tye Vi -','チェビー','チェビー');
+INSERT INTO "hand_mapping" VALUES ('CHEVY(2)','ʃ ˈɛ v i','sye Vi -','シェビー','シェビー');
 INSERT INTO "hand_mapping" VALUES ('CHEW','tʃ ˈuː','tyu -','チュー','チュー');
 INSERT INTO "hand_mapping" VALUES ('CHEWING','tʃ ˈuː ɪ ŋ','tyu - i Nv','チューイン','チューイング');
 INSERT INTO "hand_mapping" VALUES ('CHI(1)','k ˈaɪ','ka i','カイ','カイ');
@@ -2858,8 +2858,8 @@ INSERT INTO "hand_mapping" VALUES ('CHIRP','tʃ ˈɜː p','tye - pv','チェー
 INSERT INTO "hand_mapping" VALUES ('CHISEL','tʃ ˈɪ z ə l','tyi za rv','チィザル','チィザル');
 INSERT INTO "hand_mapping" VALUES ('CHISWICK','tʃ ˈɪ z ɪ k','tyi zi kv','チィジク','チィジク');
 INSERT INTO "hand_mapping" VALUES ('CHIT','tʃ ˈɪ t','tyi tv','チィト','チィト');
-INSERT INTO "hand_mapping" VALUES ('CHIVE','tʃ ˈaɪ v','tya i bv','チャイブ','チャイブ');
-INSERT INTO "hand_mapping" VALUES ('CHIVVY','tʃ ˈɪ v i','tyi bi -','チィビー','チィビー');
+INSERT INTO "hand_mapping" VALUES ('CHIVE','tʃ ˈaɪ v','tya i Vv','チャイブ','チャイブ');
+INSERT INTO "hand_mapping" VALUES ('CHIVVY','tʃ ˈɪ v i','tyi Vi -','チィビー','チィビー');
 INSERT INTO "hand_mapping" VALUES ('CHLORIDE','k l ˈɔː ɹ aɪ d','kv ro - ra i dv','クローライド','クローライド');
 INSERT INTO "hand_mapping" VALUES ('CHOCOLATE(1)','tʃ ˈɒ k ə l ə t','tyo x ka ra tv','チョッカラト','チョッカラト');
 INSERT INTO "hand_mapping" VALUES ('CHOCOLATE(2)','tʃ ˈɒ k ə l ɪ t','tyo x ka ri tv','チョッカリト','チョッカリト');
@@ -2954,12 +2954,12 @@ INSERT INTO "hand_mapping" VALUES ('CITIZEN','s ˈɪ t ɪ z ə n','si ti za nv',
 INSERT INTO "hand_mapping" VALUES ('CITIZENS','s ˈɪ t ɪ z ə n z','si ti za nv zv','シティザンズ','シティザンズ');
 INSERT INTO "hand_mapping" VALUES ('CITIZENSHIP','s ˈɪ t ɪ z ə n ʃ ˌɪ p','si ti za nv syi - pv','シティザンシープ','シティザンシープ');
 INSERT INTO "hand_mapping" VALUES ('CITY','s ˈɪ t i','si ti -','シティー','シティー');
-INSERT INTO "hand_mapping" VALUES ('CIVET','s ˈɪ v ɪ t','si bi tv','シビト','シビト');
-INSERT INTO "hand_mapping" VALUES ('CIVIC','s ˈɪ v ɪ k','si bi kv','シビク','シビク');
-INSERT INTO "hand_mapping" VALUES ('CIVIL','s ˈɪ v ə l','si ba rv','シバル','シバル');
-INSERT INTO "hand_mapping" VALUES ('CIVILIAN','s ɪ v ˈɪ l j ə n','si bi rya nv','シビリャン','シビリャン');
-INSERT INTO "hand_mapping" VALUES ('CIVILIANS','s ɪ v ˈɪ l j ə n z','si bi rya nv zv','シビリャンズ','シビリャンズ');
-INSERT INTO "hand_mapping" VALUES ('CIVILIZATION','s ˌɪ v ɪ l aɪ z ˈeɪ ʃ ə n','si - bi ra i ze i sya nv','シービライゼイシャン','シービライゼイション');
+INSERT INTO "hand_mapping" VALUES ('CIVET','s ˈɪ v ɪ t','si Vi tv','シビト','シビト');
+INSERT INTO "hand_mapping" VALUES ('CIVIC','s ˈɪ v ɪ k','si Vi kv','シビク','シビク');
+INSERT INTO "hand_mapping" VALUES ('CIVIL','s ˈɪ v ə l','si Va rv','シバル','シバル');
+INSERT INTO "hand_mapping" VALUES ('CIVILIAN','s ɪ v ˈɪ l j ə n','si Vi rya nv','シビリャン','シビリャン');
+INSERT INTO "hand_mapping" VALUES ('CIVILIANS','s ɪ v ˈɪ l j ə n z','si Vi rya nv zv','シビリャンズ','シビリャンズ');
+INSERT INTO "hand_mapping" VALUES ('CIVILIZATION','s ˌɪ v ɪ l aɪ z ˈeɪ ʃ ə n','si - Vi ra i ze i sya nv','シービライゼイシャン','シービライゼイション');
 INSERT INTO "hand_mapping" VALUES ('CLACKMANNANSHIRE','k l æ k m ˈæ n ə n ʃ ə','kv ra kv ma na nv sya','クラクマナンシャ','クラクマナンシャ');
 INSERT INTO "hand_mapping" VALUES ('CLAD','k l ˈæ d','kv ra dv','クラド','クラド');
 INSERT INTO "hand_mapping" VALUES ('CLADDED','k l ˈæ d ɪ d','kv ra di dv','クラディド','クラディド');
@@ -3009,13 +3009,13 @@ INSERT INTO "hand_mapping" VALUES ('CLEARER','k l ˈɪə ɹ ə','kv ri a ra','
 INSERT INTO "hand_mapping" VALUES ('CLEARING','k l ˈɪə ɹ ɪ ŋ','kv ri a ri Nv','クリアリン','クリアリング');
 INSERT INTO "hand_mapping" VALUES ('CLEARLY','k l ˈɪə l i','kv ri a ri -','クリアリー','クリアリー');
 INSERT INTO "hand_mapping" VALUES ('CLEARS','k l ˈɪə z','kv ri a zv','クリアズ','クリアズ');
-INSERT INTO "hand_mapping" VALUES ('CLEAVE','k l ˈiː v','kv ri - bv','クリーブ','クリーブ');
+INSERT INTO "hand_mapping" VALUES ('CLEAVE','k l ˈiː v','kv ri - Vv','クリーブ','クリーブ');
 INSERT INTO "hand_mapping" VALUES ('CLEFT','k l ˈɛ f t','kv re fv tv','クレフト','クレフト');
 INSERT INTO "hand_mapping" VALUES ('CLERGY','k l ˈɜː dʒ i','kv re - jyi -','クレージィー','クレージィー');
 INSERT INTO "hand_mapping" VALUES ('CLERICAL','k l ˈɛ ɹ ɪ k ə l','kv re ri ka rv','クレリカル','クレリカル');
 INSERT INTO "hand_mapping" VALUES ('CLERK','k l ˈɑː k','kv ra - kv','クラーク','クラーク');
-INSERT INTO "hand_mapping" VALUES ('CLEVELAND','k l ˈiː v l ə n d','kv ri - bv ra nv dv','クリーブランド','クリーブランド');
-INSERT INTO "hand_mapping" VALUES ('CLEVER','k l ˈɛ v ə','kv re ba','クレバ','クレバ');
+INSERT INTO "hand_mapping" VALUES ('CLEVELAND','k l ˈiː v l ə n d','kv ri - Vv ra nv dv','クリーブランド','クリーブランド');
+INSERT INTO "hand_mapping" VALUES ('CLEVER','k l ˈɛ v ə','kv re Va','クレバ','クレバ');
 INSERT INTO "hand_mapping" VALUES ('CLICHE','k l ˈiː ʃ eɪ','kv ri - sye i','クリーシェイ','クリーシェイ');
 INSERT INTO "hand_mapping" VALUES ('CLICK','k l ˈɪ k','kv ri kv','クリク','クリク');
 INSERT INTO "hand_mapping" VALUES ('CLICKING','k l ˈɪ k ɪ ŋ','kv ri ki Nv','クリキン','クリキング');
@@ -3036,7 +3036,7 @@ INSERT INTO "hand_mapping" VALUES ('CLINK','k l ˈɪ ŋ k','kv ri Nv kv','クリ
 INSERT INTO "hand_mapping" VALUES ('CLINTON','k l ˈɪ n t ə n','kv ri nv ta nv','クリンタン','クリンタン');
 INSERT INTO "hand_mapping" VALUES ('CLIP','k l ˈɪ p','kv ri pv','クリプ','クリプ');
 INSERT INTO "hand_mapping" VALUES ('CLIPS','k l ˈɪ p s','kv ri pv sv','クリプス','クリプス');
-INSERT INTO "hand_mapping" VALUES ('CLIVE','k l ˈaɪ v','kv ra i bv','クライブ','クライブ');
+INSERT INTO "hand_mapping" VALUES ('CLIVE','k l ˈaɪ v','kv ra i Vv','クライブ','クライブ');
 INSERT INTO "hand_mapping" VALUES ('CLOAK','k l ˈəʊ k','kv ro - kv','クローク','クローク');
 INSERT INTO "hand_mapping" VALUES ('CLOCK','k l ˈɒ k','kv ro x kv','クロック','クロック');
 INSERT INTO "hand_mapping" VALUES ('CLOCKS','k l ˈɒ k s','kv ro x kv sv','クロックス','クロックス');
@@ -3065,8 +3065,8 @@ INSERT INTO "hand_mapping" VALUES ('CLOUD','k l ˈaʊ d','kv ra u dv','クラウ
 INSERT INTO "hand_mapping" VALUES ('CLOUDS','k l ˈaʊ d z','kv ra u zv','クラウズ','クラウズ');
 INSERT INTO "hand_mapping" VALUES ('CLOUDY','k l ˈaʊ d i','kv ra u di -','クラウディー','クラウディー');
 INSERT INTO "hand_mapping" VALUES ('CLOUT','k l ˈaʊ t','kv ra u tv','クラウト','クラウト');
-INSERT INTO "hand_mapping" VALUES ('CLOVE','k l ˈəʊ v','kv ro - bv','クローブ','クローブ');
-INSERT INTO "hand_mapping" VALUES ('CLOVEN','k l ˈəʊ v ə n','kv ro - ba nv','クローバン','クローバン');
+INSERT INTO "hand_mapping" VALUES ('CLOVE','k l ˈəʊ v','kv ro - Vv','クローブ','クローブ');
+INSERT INTO "hand_mapping" VALUES ('CLOVEN','k l ˈəʊ v ə n','kv ro - Va nv','クローバン','クローバン');
 INSERT INTO "hand_mapping" VALUES ('CLOWN','k l ˈaʊ n','kv ra u nv','クラウン','クラウン');
 INSERT INTO "hand_mapping" VALUES ('CLUB','k l ˈɐ b','kv ra bv','クラブ','クラブ');
 INSERT INTO "hand_mapping" VALUES ('CLUBS','k l ˈɐ b z','kv ra bv zv','クラブズ','クラブズ');
@@ -3083,8 +3083,8 @@ INSERT INTO "hand_mapping" VALUES ('CLYDE','k l ˈaɪ d','kv ra i dv','クライ
 INSERT INTO "hand_mapping" VALUES ('CO','k ˈəʊ','ko -','コー','コー');
 INSERT INTO "hand_mapping" VALUES ('CO-OP','k ˈəʊ ˌɒ p','ko - o - pv','コーオープ','コーオープ');
 INSERT INTO "hand_mapping" VALUES ('CO-OPERATION','k əʊ ˌɒ p ə ɹ ˈeɪ ʃ ə n','ko o - pa re i sya nv','コオーパレイシャン','コオーパレイション');
-INSERT INTO "hand_mapping" VALUES ('CO-OPERATIVE(1)','k ˌəʊ ˈɒ p ɹ ə t ɪ v','ko o x pv ra ti bv','コオップラティブ','コオップラティブ');
-INSERT INTO "hand_mapping" VALUES ('CO-OPERATIVE(2)','k ˌəʊ ˈɒ p ə ɹ ə t ɪ v','ko o x pa ra ti bv','コオッパラティブ','コオッパラティブ');
+INSERT INTO "hand_mapping" VALUES ('CO-OPERATIVE(1)','k ˌəʊ ˈɒ p ɹ ə t ɪ v','ko o x pv ra ti Vv','コオップラティブ','コオップラティブ');
+INSERT INTO "hand_mapping" VALUES ('CO-OPERATIVE(2)','k ˌəʊ ˈɒ p ə ɹ ə t ɪ v','ko o x pa ra ti Vv','コオッパラティブ','コオッパラティブ');
 INSERT INTO "hand_mapping" VALUES ('CO-ORDINATION','k əʊ ˌɔː d ɪ n ˈeɪ ʃ ə n','ko o - di ne i sya nv','コオーディネイシャン','コオーディネイション');
 INSERT INTO "hand_mapping" VALUES ('COACH','k ˈəʊ tʃ','ko - tyv','コーチュ','コーチュ');
 INSERT INTO "hand_mapping" VALUES ('COACHES','k ˈəʊ tʃ ɪ z','ko - tyi zv','コーチィズ','コーチィズ');
@@ -3124,7 +3124,7 @@ INSERT INTO "hand_mapping" VALUES ('COERCED','k əʊ ˈɜː s t','ko e - sv tv',
 INSERT INTO "hand_mapping" VALUES ('COFFEE','k ˈɒ f i','ko fi -','コフィー','コフィー');
 INSERT INTO "hand_mapping" VALUES ('COFFIN','k ˈɒ f ɪ n','ko fi nv','コフィン','コフィン');
 INSERT INTO "hand_mapping" VALUES ('COG','k ˈɒ g','ko gv','コグ','コグ');
-INSERT INTO "hand_mapping" VALUES ('COGNITIVE','k ˈɒ g n ɪ t ɪ v','ko gv ni ti bv','コグニティブ','コグニティブ');
+INSERT INTO "hand_mapping" VALUES ('COGNITIVE','k ˈɒ g n ɪ t ɪ v','ko gv ni ti Vv','コグニティブ','コグニティブ');
 INSERT INTO "hand_mapping" VALUES ('COHABITING','k əʊ h ˈæ b ɪ t ɪ ŋ','ko ha bi ti Nv','コハビティン','コハビティング');
 INSERT INTO "hand_mapping" VALUES ('COHEN','k ˈəʊ ə n','ko - a nv','コーアン','コーアン');
 INSERT INTO "hand_mapping" VALUES ('COHERENT','k əʊ h ˈɪə ɹ ə n t','ko hi a ra nv tv','コヒアラント','コヒアラント');
@@ -3149,7 +3149,7 @@ INSERT INTO "hand_mapping" VALUES ('COLIN','k ˈɒ l ɪ n','ko ri nv','コリン
 INSERT INTO "hand_mapping" VALUES ('COLITIS(1)','k ɒ l ˈaɪ t ɪ s','ko ra i ti sv','コライティス','コライティス');
 INSERT INTO "hand_mapping" VALUES ('COLITIS(2)','k ə l ˈaɪ t ɪ s','ka ra i ti sv','カライティス','コライティス');
 INSERT INTO "hand_mapping" VALUES ('COLLABORATION','k ə l ˌæ b ə ɹ ˈeɪ ʃ ə n','ka ra ba re i sya nv','カラバレイシャン','コラバレイション');
-INSERT INTO "hand_mapping" VALUES ('COLLABORATIVE','k ə l ˈæ b ə ɹ ə t ɪ v','ka ra ba ra ti bv','カラバラティブ','コラバラティブ');
+INSERT INTO "hand_mapping" VALUES ('COLLABORATIVE','k ə l ˈæ b ə ɹ ə t ɪ v','ka ra ba ra ti Vv','カラバラティブ','コラバラティブ');
 INSERT INTO "hand_mapping" VALUES ('COLLAPSE','k ə l ˈæ p s','ka ra x pv sv','カラップス','コラップス');
 INSERT INTO "hand_mapping" VALUES ('COLLAR','k ˈɒ l ə','ko ra','コラ','コラ');
 INSERT INTO "hand_mapping" VALUES ('COLLEAGUE','k ˈɒ l iː g','ko ri - gv','コリーグ','コリーグ');
@@ -3162,7 +3162,7 @@ INSERT INTO "hand_mapping" VALUES ('COLLECTIBLES','k ə l ˈɛ k t ə b ə l z',
 INSERT INTO "hand_mapping" VALUES ('COLLECTING','k ə l ˈɛ k t ɪ ŋ','ka re kv ti Nv','カレクティン','コレクティング');
 INSERT INTO "hand_mapping" VALUES ('COLLECTION','k ə l ˈɛ k ʃ ə n','ka re kv sya nv','カレクシャン','コレクション');
 INSERT INTO "hand_mapping" VALUES ('COLLECTIONS','k ə l ˈɛ k ʃ ə n z','ka re kv sya nv zv','カレクシャンズ','コレクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('COLLECTIVE','k ə l ˈɛ k t ɪ v','ka re kv ti bv','カレクティブ','コレクティブ');
+INSERT INTO "hand_mapping" VALUES ('COLLECTIVE','k ə l ˈɛ k t ɪ v','ka re kv ti Vv','カレクティブ','コレクティブ');
 INSERT INTO "hand_mapping" VALUES ('COLLECTOR','k ə l ˈɛ k t ə','ka re kv ta','カレクタ','コレクタ');
 INSERT INTO "hand_mapping" VALUES ('COLLECTORS','k ə l ˈɛ k t ə z','ka re kv ta zv','カレクタズ','コレクタズ');
 INSERT INTO "hand_mapping" VALUES ('COLLEGE','k ˈɒ l ɪ dʒ','ko ri jyv','コリジュ','コリジュ');
@@ -3194,7 +3194,7 @@ INSERT INTO "hand_mapping" VALUES ('COMA','k ˈəʊ m ə','ko - ma','コーマ',
 INSERT INTO "hand_mapping" VALUES ('COMB','k ˈəʊ m','ko - mv','コーム','コーム');
 INSERT INTO "hand_mapping" VALUES ('COMBAT(1)','k ˈɒ m b ˌæ t','ko Nv ba x tv','コンバット','コンバット');
 INSERT INTO "hand_mapping" VALUES ('COMBAT(2)','k ə m b ˈæ t','ka Nv ba x tv','カンバット','コンバット');
-INSERT INTO "hand_mapping" VALUES ('COMBATIVE','k ˈɒ m b ə t ɪ v','ko Nv ba ti bv','コンバティブ','コンバティブ');
+INSERT INTO "hand_mapping" VALUES ('COMBATIVE','k ˈɒ m b ə t ɪ v','ko Nv ba ti Vv','コンバティブ','コンバティブ');
 INSERT INTO "hand_mapping" VALUES ('COMBINATION','k ˌɒ m b ɪ n ˈeɪ ʃ ə n','ko Nv bi ne i sya nv','コンビネイシャン','コンビネイション');
 INSERT INTO "hand_mapping" VALUES ('COMBINATIONS','k ˌɒ m b ɪ n ˈeɪ ʃ ə n z','ko Nv bi ne i sya nv zv','コンビネイシャンズ','コンビネイシャンズ');
 INSERT INTO "hand_mapping" VALUES ('COMBINE(1)','k ˈɒ m b aɪ n','ko Nv ba i nv','コンバイン','コンバイン');
@@ -3250,7 +3250,7 @@ INSERT INTO "hand_mapping" VALUES ('COMMONWEALTH','k ˈɒ m ə n w ˌɛ l θ','k
 INSERT INTO "hand_mapping" VALUES ('COMMUNICATE','k ə m j ˈuː n ɪ k ˌeɪ t','ka myu - ni ke i tv','カミューニケイト','コミューニケイト');
 INSERT INTO "hand_mapping" VALUES ('COMMUNICATION','k ə m j ˌuː n ɪ k ˈeɪ ʃ ə n','ka myu - ni ke i sya nv','カミューニケイシャン','コミューニケイション');
 INSERT INTO "hand_mapping" VALUES ('COMMUNICATIONS','k ə m j ˌuː n ɪ k ˈeɪ ʃ ə n z','ka myu - ni ke i sya nv zv','カミューニケイシャンズ','コミューニケイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('COMMUNICATIVE','k ə m j ˈuː n ɪ k ə t ɪ v','ka myu - ni ka ti bv','カミューニカティブ','コミューニカティブ');
+INSERT INTO "hand_mapping" VALUES ('COMMUNICATIVE','k ə m j ˈuː n ɪ k ə t ɪ v','ka myu - ni ka ti Vv','カミューニカティブ','コミューニカティブ');
 INSERT INTO "hand_mapping" VALUES ('COMMUNION','k ə m j ˈuː n j ə n','ka myu - nya nv','カミューニャン','コミューニャン');
 INSERT INTO "hand_mapping" VALUES ('COMMUNISM','k ˈɒ m j ʊ n ˌɪ z ə m','ko myu ni - za mv','コミュニーザム','コミュニーズム');
 INSERT INTO "hand_mapping" VALUES ('COMMUNIST','k ˈɒ m j ʊ n ɪ s t','ko myu ni sv tv','コミュニスト','コミュニスト');
@@ -3266,8 +3266,8 @@ INSERT INTO "hand_mapping" VALUES ('COMPANIONS','k ə m p ˈæ n j ə n z','ka N
 INSERT INTO "hand_mapping" VALUES ('COMPANY','k ˈɐ m p ə n i','ka Nv pa ni -','カンパニー','コンパニー');
 INSERT INTO "hand_mapping" VALUES ('COMPAQ','k ˈɒ m p ˌæ k','ko Nv pa x kv','コンパック','コンパック');
 INSERT INTO "hand_mapping" VALUES ('COMPARABLE','k ˈɒ m p ə ɹ ə b ə l','ko Nv pa ra ba rv','コンパラバル','コンパラバル');
-INSERT INTO "hand_mapping" VALUES ('COMPARATIVE','k ə m p ˈæ ɹ ə t ɪ v','ka Nv pa ra ti bv','カンパラティブ','コンパラティブ');
-INSERT INTO "hand_mapping" VALUES ('COMPARATIVELY','k ə m p ˈæ ɹ ə t ɪ v l i','ka Nv pa ra ti bv ri -','カンパラティブリー','コンパラティブリー');
+INSERT INTO "hand_mapping" VALUES ('COMPARATIVE','k ə m p ˈæ ɹ ə t ɪ v','ka Nv pa ra ti Vv','カンパラティブ','コンパラティブ');
+INSERT INTO "hand_mapping" VALUES ('COMPARATIVELY','k ə m p ˈæ ɹ ə t ɪ v l i','ka Nv pa ra ti Vv ri -','カンパラティブリー','コンパラティブリー');
 INSERT INTO "hand_mapping" VALUES ('COMPARE','k ə m p ˈɛə','ka Nv pe a','カンペア','コンペア');
 INSERT INTO "hand_mapping" VALUES ('COMPARED','k ə m p ˈɛə d','ka Nv pe a dv','カンペアド','コンペアド');
 INSERT INTO "hand_mapping" VALUES ('COMPARING','k ə m p ˈɛə ɹ ɪ ŋ','ka Nv pe a ri Nv','カンペアリン','コンペアリング');
@@ -3287,7 +3287,7 @@ INSERT INTO "hand_mapping" VALUES ('COMPETENT','k ˈɒ m p ɪ t ə n t','ko Nv p
 INSERT INTO "hand_mapping" VALUES ('COMPETING','k ə m p ˈiː t ɪ ŋ','ka Nv pi - ti Nv','カンピーティン','コンピーティング');
 INSERT INTO "hand_mapping" VALUES ('COMPETITION','k ˌɒ m p ɪ t ˈɪ ʃ ə n','ko Nv pi ti sya nv','コンピティシャン','コンピティション');
 INSERT INTO "hand_mapping" VALUES ('COMPETITIONS','k ˌɒ m p ɪ t ˈɪ ʃ ə n z','ko Nv pi ti sya nv zv','コンピティシャンズ','コンピティシャンズ');
-INSERT INTO "hand_mapping" VALUES ('COMPETITIVE','k ə m p ˈɛ t ɪ t ɪ v','ka Nv pe ti ti bv','カンペティティブ','コンペティティブ');
+INSERT INTO "hand_mapping" VALUES ('COMPETITIVE','k ə m p ˈɛ t ɪ t ɪ v','ka Nv pe ti ti Vv','カンペティティブ','コンペティティブ');
 INSERT INTO "hand_mapping" VALUES ('COMPETITOR','k ə m p ˈɛ t ɪ t ə','ka Nv pe ti ta','カンペティタ','コンペティタ');
 INSERT INTO "hand_mapping" VALUES ('COMPETITORS','k ə m p ˈɛ t ɪ t ə z','ka Nv pe ti ta zv','カンペティタズ','コンペティタズ');
 INSERT INTO "hand_mapping" VALUES ('COMPILATION','k ˌɒ m p ɪ l ˈeɪ ʃ ə n','ko Nv pi re i sya nv','コンピレイシャン','コンピレイション');
@@ -3332,7 +3332,7 @@ INSERT INTO "hand_mapping" VALUES ('COMPOUND(2)','k ə m p ˈaʊ n d','ka Nv pa
 INSERT INTO "hand_mapping" VALUES ('COMPOUNDS(1)','k ˈɒ m p aʊ n d z','ko Nv pa u nv zv','コンパウンズ','コンパウンズ');
 INSERT INTO "hand_mapping" VALUES ('COMPOUNDS(2)','k ə m p ˈaʊ n d z','ka Nv pa u nv zv','カンパウンズ','コンパウンズ');
 INSERT INTO "hand_mapping" VALUES ('COMPREHENSION','k ˌɒ m p ɹ ɪ h ˈɛ n ʃ ə n','ko npv ri he nv sya nv','コンプリヘンシャン','コンプリヘンション');
-INSERT INTO "hand_mapping" VALUES ('COMPREHENSIVE','k ˌɒ m p ɹ ɪ h ˈɛ n s ɪ v','ko npv ri he nv si bv','コンプリヘンシブ','コンプリヘンシブ');
+INSERT INTO "hand_mapping" VALUES ('COMPREHENSIVE','k ˌɒ m p ɹ ɪ h ˈɛ n s ɪ v','ko npv ri he nv si Vv','コンプリヘンシブ','コンプリヘンシブ');
 INSERT INTO "hand_mapping" VALUES ('COMPRESSED','k ə m p ɹ ˈɛ s t','ka npv re sv tv','カンプレスト','コンプレスト');
 INSERT INTO "hand_mapping" VALUES ('COMPRESSION','k ə m p ɹ ˈɛ ʃ ə n','ka npv re sya nv','カンプレシャン','コンプレション');
 INSERT INTO "hand_mapping" VALUES ('COMPRISE','k ə m p ɹ ˈaɪ z','ka npv ra i zv','カンプライズ','コンプライズ');
@@ -3354,8 +3354,8 @@ INSERT INTO "hand_mapping" VALUES ('CONCATENATE','k ɒ n k ˈæ t ɪ n ˌeɪ t',
 INSERT INTO "hand_mapping" VALUES ('CONCEAL','k ə n s ˈiː l','ka nv si - rv','カンシール','コンシール');
 INSERT INTO "hand_mapping" VALUES ('CONCEDE','k ə n s ˈiː d','ka nv si - dv','カンシード','コンシード');
 INSERT INTO "hand_mapping" VALUES ('CONCEIT','k ə n s ˈiː t','ka nv si - tv','カンシート','コンシート');
-INSERT INTO "hand_mapping" VALUES ('CONCEIVABLE','k ə n s ˈiː v ə b ə l','ka nv si - ba ba rv','カンシーババル','コンシーババル');
-INSERT INTO "hand_mapping" VALUES ('CONCEIVE','k ə n s ˈiː v','ka nv si - bv','カンシーブ','コンシーブ');
+INSERT INTO "hand_mapping" VALUES ('CONCEIVABLE','k ə n s ˈiː v ə b ə l','ka nv si - Va ba rv','カンシーババル','コンシーババル');
+INSERT INTO "hand_mapping" VALUES ('CONCEIVE','k ə n s ˈiː v','ka nv si - Vv','カンシーブ','コンシーブ');
 INSERT INTO "hand_mapping" VALUES ('CONCENTRATE','k ˈɒ n s ə n t ɹ ˌeɪ t','ko nv sa nv tv re i tv','コンサントレイト','コンサントレイト');
 INSERT INTO "hand_mapping" VALUES ('CONCENTRATED','k ˈɒ n s ə n t ɹ ˌeɪ t ɪ d','ko nv sa nv tv re i ti dv','コンサントレイティド','コンサントレイティド');
 INSERT INTO "hand_mapping" VALUES ('CONCENTRATING','k ˈɒ n s ə n t ɹ ˌeɪ t ɪ ŋ','ko nv sa nv tv re i ti Nv','コンサントレイティン','コンサントレイティング');
@@ -3454,7 +3454,7 @@ INSERT INTO "hand_mapping" VALUES ('CONNECTICUT','k ə n ˈɛ t ɪ k ə t','ka n
 INSERT INTO "hand_mapping" VALUES ('CONNECTING','k ə n ˈɛ k t ɪ ŋ','ka ne kv ti Nv','カネクティン','コネクティング');
 INSERT INTO "hand_mapping" VALUES ('CONNECTION','k ə n ˈɛ k ʃ ə n','ka ne kv sya nv','カネクシャン','コネクション');
 INSERT INTO "hand_mapping" VALUES ('CONNECTIONS','k ə n ˈɛ k ʃ ə n z','ka ne kv sya nv zv','カネクシャンズ','コネクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('CONNECTIVITY','k ə n ɛ k t ˈɪ v ɪ t i','ka ne kv ti bi ti -','カネクティビティー','コネクティビティー');
+INSERT INTO "hand_mapping" VALUES ('CONNECTIVITY','k ə n ɛ k t ˈɪ v ɪ t i','ka ne kv ti Vi ti -','カネクティビティー','コネクティビティー');
 INSERT INTO "hand_mapping" VALUES ('CONNECTOR','k ə n ˈɛ k t ə','ka ne kv ta','カネクタ','コネクタ');
 INSERT INTO "hand_mapping" VALUES ('CONNECTORS','k ə n ˈɛ k t ə z','ka ne kv ta zv','カネクタズ','コネクタズ');
 INSERT INTO "hand_mapping" VALUES ('CONNIE','k ˈɒ n i','ko ni -','コニー','コニー');
@@ -3466,19 +3466,19 @@ INSERT INTO "hand_mapping" VALUES ('CONSCIENCE','k ˈɒ n ʃ ə n s','ko nv sya
 INSERT INTO "hand_mapping" VALUES ('CONSCIENTIOUS','k ˌɒ n ʃ ɪ ˈɛ n ʃ ə s','ko nv syi e nv sya sv','コンシエンシャス','コンシエンシャス');
 INSERT INTO "hand_mapping" VALUES ('CONSCIOUS','k ˈɒ n ʃ ə s','ko nv sya sv','コンシャス','コンシャス');
 INSERT INTO "hand_mapping" VALUES ('CONSCIOUSNESS','k ˈɒ n ʃ ə s n ɪ s','ko nv sya sv ni sv','コンシャスニス','コンシャスニス');
-INSERT INTO "hand_mapping" VALUES ('CONSECUTIVE','k ə n s ˈɛ k j ʊ t ɪ v','ka nv se kyu ti bv','カンセキュティブ','コンセキュティブ');
+INSERT INTO "hand_mapping" VALUES ('CONSECUTIVE','k ə n s ˈɛ k j ʊ t ɪ v','ka nv se kyu ti Vv','カンセキュティブ','コンセキュティブ');
 INSERT INTO "hand_mapping" VALUES ('CONSENSUS','k ə n s ˈɛ n s ə s','ka nv se nv sa sv','カンセンサス','コンセンサス');
 INSERT INTO "hand_mapping" VALUES ('CONSENT','k ə n s ˈɛ n t','ka nv se nv tv','カンセント','コンセント');
 INSERT INTO "hand_mapping" VALUES ('CONSEQUENCE','k ˈɒ n s ɪ k w ə n s','ko nv si kwa nv sv','コンシクァンス','コンシクァンス');
 INSERT INTO "hand_mapping" VALUES ('CONSEQUENCES','k ˈɒ n s ɪ k w ə n s ɪ z','ko nv si kwa nv si zv','コンシクァンシズ','コンシクァンシズ');
 INSERT INTO "hand_mapping" VALUES ('CONSEQUENT','k ˈɒ n s ɪ k w ə n t','ko nv si kwa nv tv','コンシクァント','コンシクァント');
 INSERT INTO "hand_mapping" VALUES ('CONSEQUENTLY','k ˈɒ n s ɪ k w ə n t l i','ko nv si kwa nv tv ri -','コンシクァントリー','コンシクァントリー');
-INSERT INTO "hand_mapping" VALUES ('CONSERVATION','k ˌɒ n s ə v ˈeɪ ʃ ə n','ko nv sa be i sya nv','コンサベイシャン','コンサベイション');
-INSERT INTO "hand_mapping" VALUES ('CONSERVATIVE','k ə n s ˈɜː v ə t ɪ v','ka nv se - ba ti bv','カンセーバティブ','コンセーバティブ');
-INSERT INTO "hand_mapping" VALUES ('CONSERVATIVES','k ə n s ˈɜː v ə t ɪ v z','ka nv se - ba ti bv zv','カンセーバティブズ','コンセーバティブズ');
-INSERT INTO "hand_mapping" VALUES ('CONSERVATORY','k ə n s ˈɜː v ə t ə ɹ i','ka nv se - ba ta ri -','カンセーバタリー','コンセーバタリー');
-INSERT INTO "hand_mapping" VALUES ('CONSERVE(1)','k ə n s ˈɜː v','ka nv se - bv','カンセーブ','コンセーブ');
-INSERT INTO "hand_mapping" VALUES ('CONSERVE(2)','k ˈɒ n s ɜː v','ko nv se - bv','コンセーブ','コンセーブ');
+INSERT INTO "hand_mapping" VALUES ('CONSERVATION','k ˌɒ n s ə v ˈeɪ ʃ ə n','ko nv sa Ve i sya nv','コンサベイシャン','コンサベイション');
+INSERT INTO "hand_mapping" VALUES ('CONSERVATIVE','k ə n s ˈɜː v ə t ɪ v','ka nv se - Va ti Vv','カンセーバティブ','コンセーバティブ');
+INSERT INTO "hand_mapping" VALUES ('CONSERVATIVES','k ə n s ˈɜː v ə t ɪ v z','ka nv se - Va ti Vv zv','カンセーバティブズ','コンセーバティブズ');
+INSERT INTO "hand_mapping" VALUES ('CONSERVATORY','k ə n s ˈɜː v ə t ə ɹ i','ka nv se - Va ta ri -','カンセーバタリー','コンセーバタリー');
+INSERT INTO "hand_mapping" VALUES ('CONSERVE(1)','k ə n s ˈɜː v','ka nv se - Vv','カンセーブ','コンセーブ');
+INSERT INTO "hand_mapping" VALUES ('CONSERVE(2)','k ˈɒ n s ɜː v','ko nv se - Vv','コンセーブ','コンセーブ');
 INSERT INTO "hand_mapping" VALUES ('CONSIDER','k ə n s ˈɪ d ə','ka nv si da','カンシダ','コンシダ');
 INSERT INTO "hand_mapping" VALUES ('CONSIDERABLE','k ə n s ˈɪ d ə ɹ ə b ə l','ka nv si da ra ba rv','カンシダラバル','コンシダラバル');
 INSERT INTO "hand_mapping" VALUES ('CONSIDERABLY','k ə n s ˈɪ d ə ɹ ə b l i','ka nv si da ra bv ri -','カンシダラブリー','コンシダラブリー');
@@ -3524,7 +3524,7 @@ INSERT INTO "hand_mapping" VALUES ('CONSTRUCT(1)','k ˈɒ n s t ɹ ɐ k t','ko n
 INSERT INTO "hand_mapping" VALUES ('CONSTRUCT(2)','k ə n s t ɹ ˈɐ k t','ka nv sv tv ra kv tv','カンストラクト','コンストラクト');
 INSERT INTO "hand_mapping" VALUES ('CONSTRUCTED','k ə n s t ɹ ˈɐ k t ɪ d','ka nv sv tv ra kv ti dv','カンストラクティド','コンストラクティド');
 INSERT INTO "hand_mapping" VALUES ('CONSTRUCTION','k ə n s t ɹ ˈɐ k ʃ ə n','ka nv sv tv ra kv sya nv','カンストラクシャン','コンストラクション');
-INSERT INTO "hand_mapping" VALUES ('CONSTRUCTIVE','k ə n s t ɹ ˈɐ k t ɪ v','ka nv sv tv ra kv ti bv','カンストラクティブ','コンストラクティブ');
+INSERT INTO "hand_mapping" VALUES ('CONSTRUCTIVE','k ə n s t ɹ ˈɐ k t ɪ v','ka nv sv tv ra kv ti Vv','カンストラクティブ','コンストラクティブ');
 INSERT INTO "hand_mapping" VALUES ('CONSULT','k ə n s ˈɐ l t','ka nv sa rv tv','カンサルト','コンサルト');
 INSERT INTO "hand_mapping" VALUES ('CONSULTANCY','k ə n s ˈɐ l t ə n s i','ka nv sa rv ta nv si -','カンサルタンシー','コンサルタンシー');
 INSERT INTO "hand_mapping" VALUES ('CONSULTANT','k ə n s ˈɐ l t ə n t','ka nv sa rv ta nv tv','カンサルタント','コンサルタント');
@@ -3611,39 +3611,39 @@ INSERT INTO "hand_mapping" VALUES ('CONTROLLER','k ə n t ɹ ˈəʊ l ə','ka nv
 INSERT INTO "hand_mapping" VALUES ('CONTROLLERS','k ə n t ɹ ˈəʊ l ə z','ka nv tv ro - ra zv','カントローラズ','コントローラズ');
 INSERT INTO "hand_mapping" VALUES ('CONTROLLING','k ə n t ɹ ˈəʊ l ɪ ŋ','ka nv tv ro - ri Nv','カントローリン','コントローリング');
 INSERT INTO "hand_mapping" VALUES ('CONTROLS','k ə n t ɹ ˈəʊ l z','ka nv tv ro - rv zv','カントロールズ','コントロールズ');
-INSERT INTO "hand_mapping" VALUES ('CONTROVERSIAL','k ˌɒ n t ɹ ə v ˈɜː ʃ ə l','ko nv tv ra be - sya rv','コントラベーシャル','コントラベーシャル');
-INSERT INTO "hand_mapping" VALUES ('CONTROVERSY(1)','k ˈɒ n t ɹ ə v ˌɜː s i','ko nv tv ra be - si -','コントラベーシー','コントラベーシー');
-INSERT INTO "hand_mapping" VALUES ('CONTROVERSY(2)','k ə n t ɹ ˈɒ v ə s i','ka nv tv ro ba si -','カントロバシー','コントロバシー');
-INSERT INTO "hand_mapping" VALUES ('CONVALESCE','k ˌɒ n v ə l ˈɛ s','ko nv ba re sv','コンバレス','コンバレス');
-INSERT INTO "hand_mapping" VALUES ('CONVENIENCE','k ə n v ˈiː n ɪə n s','ka nv bi - ni a nv sv','カンビーニアンス','コンビーニアンス');
-INSERT INTO "hand_mapping" VALUES ('CONVENIENT','k ə n v ˈiː n ɪə n t','ka nv bi - ni a nv tv','カンビーニアント','コンビーニアント');
-INSERT INTO "hand_mapping" VALUES ('CONVENTION','k ə n v ˈɛ n ʃ ə n','ka nv be nv sya nv','カンベンシャン','コンベンション');
-INSERT INTO "hand_mapping" VALUES ('CONVENTIONAL','k ə n v ˈɛ n ʃ ə n ə l','ka nv be nv sya na rv','カンベンシャナル','コンベンシャナル');
-INSERT INTO "hand_mapping" VALUES ('CONVENTIONS','k ə n v ˈɛ n ʃ ə n z','ka nv be nv sya nv zv','カンベンシャンズ','コンベンシャンズ');
-INSERT INTO "hand_mapping" VALUES ('CONVERGE','k ə n v ˈɜː dʒ','ka nv be - jyv','カンベージュ','コンベージュ');
-INSERT INTO "hand_mapping" VALUES ('CONVERGENCE','k ə n v ˈɜː dʒ ə n s','ka nv be - jya nv sv','カンベージャンス','コンベージャンス');
-INSERT INTO "hand_mapping" VALUES ('CONVERSATION','k ˌɒ n v ə s ˈeɪ ʃ ə n','ko nv ba se i sya nv','コンバセイシャン','コンバセイション');
-INSERT INTO "hand_mapping" VALUES ('CONVERSATIONS','k ˌɒ n v ə s ˈeɪ ʃ ə n z','ko nv ba se i sya nv zv','コンバセイシャンズ','コンバセイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('CONVERSELY(1)','k ə n v ˈɜː s l i','ka nv be - sv ri -','カンベースリー','コンベースリー');
-INSERT INTO "hand_mapping" VALUES ('CONVERSELY(2)','k ˈɒ n v ə s l i','ko nv ba sv ri -','コンバスリー','コンバスリー');
-INSERT INTO "hand_mapping" VALUES ('CONVERSION','k ə n v ˈɜː ʒ ə n','ka nv be - jya nv','カンベージャン','コンベージョン');
-INSERT INTO "hand_mapping" VALUES ('CONVERT(1)','k ˈɒ n v ɜː t','ko nv be - tv','コンベート','コンベート');
-INSERT INTO "hand_mapping" VALUES ('CONVERT(2)','k ə n v ˈɜː t','ka nv be - tv','カンベート','コンベート');
-INSERT INTO "hand_mapping" VALUES ('CONVERTED','k ə n v ˈɜː t ɪ d','ka nv be - ti dv','カンベーティド','コンベーティド');
-INSERT INTO "hand_mapping" VALUES ('CONVERTER','k ə n v ˈɜː t ə','ka nv be - ta','カンベータ','コンベータ');
-INSERT INTO "hand_mapping" VALUES ('CONVERTIBLE','k ə n v ˈɜː t ɪ b ə l','ka nv be - ti ba rv','カンベーティバル','コンベーティバル');
-INSERT INTO "hand_mapping" VALUES ('CONVEY','k ə n v ˈeɪ','ka nv be i','カンベイ','コンベイ');
-INSERT INTO "hand_mapping" VALUES ('CONVEYOR','k ə n v ˈeɪ ə','ka nv be i a','カンベイア','コンベイア');
-INSERT INTO "hand_mapping" VALUES ('CONVEYORS','k ə n v ˈeɪ ə z','ka nv be i a zv','カンベイアズ','コンベイアズ');
-INSERT INTO "hand_mapping" VALUES ('CONVICT(1)','k ə n v ˈɪ k t','ka nv bi kv tv','カンビクト','コンビクト');
-INSERT INTO "hand_mapping" VALUES ('CONVICT(2)','k ˈɒ n v ɪ k t','ko nv bi kv tv','コンビクト','コンビクト');
-INSERT INTO "hand_mapping" VALUES ('CONVICTED','k ə n v ˈɪ k t ɪ d','ka nv bi kv ti dv','カンビクティド','コンビクティド');
-INSERT INTO "hand_mapping" VALUES ('CONVICTION','k ə n v ˈɪ k ʃ ə n','ka nv bi kv sya nv','カンビクシャン','コンビクション');
-INSERT INTO "hand_mapping" VALUES ('CONVICTIONS','k ə n v ˈɪ k ʃ ə n z','ka nv bi kv sya nv zv','カンビクシャンズ','コンビクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('CONVINCE','k ə n v ˈɪ n s','ka nv bi nv sv','カンビンス','コンビンス');
-INSERT INTO "hand_mapping" VALUES ('CONVINCED','k ə n v ˈɪ n s t','ka nv bi nv sv tv','カンビンスト','コンビンスト');
-INSERT INTO "hand_mapping" VALUES ('CONVINCING','k ə n v ˈɪ n s ɪ ŋ','ka nv bi nv si Nv','カンビンシン','コンビンシング');
-INSERT INTO "hand_mapping" VALUES ('CONVOY','k ˈɒ n v ɔɪ','ko nv bo i','コンボイ','コンボイ');
+INSERT INTO "hand_mapping" VALUES ('CONTROVERSIAL','k ˌɒ n t ɹ ə v ˈɜː ʃ ə l','ko nv tv ra Ve - sya rv','コントラベーシャル','コントラベーシャル');
+INSERT INTO "hand_mapping" VALUES ('CONTROVERSY(1)','k ˈɒ n t ɹ ə v ˌɜː s i','ko nv tv ra Ve - si -','コントラベーシー','コントラベーシー');
+INSERT INTO "hand_mapping" VALUES ('CONTROVERSY(2)','k ə n t ɹ ˈɒ v ə s i','ka nv tv ro Va si -','カントロバシー','コントロバシー');
+INSERT INTO "hand_mapping" VALUES ('CONVALESCE','k ˌɒ n v ə l ˈɛ s','ko nv Va re sv','コンバレス','コンバレス');
+INSERT INTO "hand_mapping" VALUES ('CONVENIENCE','k ə n v ˈiː n ɪə n s','ka nv Vi - ni a nv sv','カンビーニアンス','コンビーニアンス');
+INSERT INTO "hand_mapping" VALUES ('CONVENIENT','k ə n v ˈiː n ɪə n t','ka nv Vi - ni a nv tv','カンビーニアント','コンビーニアント');
+INSERT INTO "hand_mapping" VALUES ('CONVENTION','k ə n v ˈɛ n ʃ ə n','ka nv Ve nv sya nv','カンベンシャン','コンベンション');
+INSERT INTO "hand_mapping" VALUES ('CONVENTIONAL','k ə n v ˈɛ n ʃ ə n ə l','ka nv Ve nv sya na rv','カンベンシャナル','コンベンシャナル');
+INSERT INTO "hand_mapping" VALUES ('CONVENTIONS','k ə n v ˈɛ n ʃ ə n z','ka nv Ve nv sya nv zv','カンベンシャンズ','コンベンシャンズ');
+INSERT INTO "hand_mapping" VALUES ('CONVERGE','k ə n v ˈɜː dʒ','ka nv Ve - jyv','カンベージュ','コンベージュ');
+INSERT INTO "hand_mapping" VALUES ('CONVERGENCE','k ə n v ˈɜː dʒ ə n s','ka nv Ve - jya nv sv','カンベージャンス','コンベージャンス');
+INSERT INTO "hand_mapping" VALUES ('CONVERSATION','k ˌɒ n v ə s ˈeɪ ʃ ə n','ko nv Va se i sya nv','コンバセイシャン','コンバセイション');
+INSERT INTO "hand_mapping" VALUES ('CONVERSATIONS','k ˌɒ n v ə s ˈeɪ ʃ ə n z','ko nv Va se i sya nv zv','コンバセイシャンズ','コンバセイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('CONVERSELY(1)','k ə n v ˈɜː s l i','ka nv Ve - sv ri -','カンベースリー','コンベースリー');
+INSERT INTO "hand_mapping" VALUES ('CONVERSELY(2)','k ˈɒ n v ə s l i','ko nv Va sv ri -','コンバスリー','コンバスリー');
+INSERT INTO "hand_mapping" VALUES ('CONVERSION','k ə n v ˈɜː ʒ ə n','ka nv Ve - jya nv','カンベージャン','コンベージョン');
+INSERT INTO "hand_mapping" VALUES ('CONVERT(1)','k ˈɒ n v ɜː t','ko nv Ve - tv','コンベート','コンベート');
+INSERT INTO "hand_mapping" VALUES ('CONVERT(2)','k ə n v ˈɜː t','ka nv Ve - tv','カンベート','コンベート');
+INSERT INTO "hand_mapping" VALUES ('CONVERTED','k ə n v ˈɜː t ɪ d','ka nv Ve - ti dv','カンベーティド','コンベーティド');
+INSERT INTO "hand_mapping" VALUES ('CONVERTER','k ə n v ˈɜː t ə','ka nv Ve - ta','カンベータ','コンベータ');
+INSERT INTO "hand_mapping" VALUES ('CONVERTIBLE','k ə n v ˈɜː t ɪ b ə l','ka nv Ve - ti ba rv','カンベーティバル','コンベーティバル');
+INSERT INTO "hand_mapping" VALUES ('CONVEY','k ə n v ˈeɪ','ka nv Ve i','カンベイ','コンベイ');
+INSERT INTO "hand_mapping" VALUES ('CONVEYOR','k ə n v ˈeɪ ə','ka nv Ve i a','カンベイア','コンベイア');
+INSERT INTO "hand_mapping" VALUES ('CONVEYORS','k ə n v ˈeɪ ə z','ka nv Ve i a zv','カンベイアズ','コンベイアズ');
+INSERT INTO "hand_mapping" VALUES ('CONVICT(1)','k ə n v ˈɪ k t','ka nv Vi kv tv','カンビクト','コンビクト');
+INSERT INTO "hand_mapping" VALUES ('CONVICT(2)','k ˈɒ n v ɪ k t','ko nv Vi kv tv','コンビクト','コンビクト');
+INSERT INTO "hand_mapping" VALUES ('CONVICTED','k ə n v ˈɪ k t ɪ d','ka nv Vi kv ti dv','カンビクティド','コンビクティド');
+INSERT INTO "hand_mapping" VALUES ('CONVICTION','k ə n v ˈɪ k ʃ ə n','ka nv Vi kv sya nv','カンビクシャン','コンビクション');
+INSERT INTO "hand_mapping" VALUES ('CONVICTIONS','k ə n v ˈɪ k ʃ ə n z','ka nv Vi kv sya nv zv','カンビクシャンズ','コンビクシャンズ');
+INSERT INTO "hand_mapping" VALUES ('CONVINCE','k ə n v ˈɪ n s','ka nv Vi nv sv','カンビンス','コンビンス');
+INSERT INTO "hand_mapping" VALUES ('CONVINCED','k ə n v ˈɪ n s t','ka nv Vi nv sv tv','カンビンスト','コンビンスト');
+INSERT INTO "hand_mapping" VALUES ('CONVINCING','k ə n v ˈɪ n s ɪ ŋ','ka nv Vi nv si Nv','カンビンシン','コンビンシング');
+INSERT INTO "hand_mapping" VALUES ('CONVOY','k ˈɒ n v ɔɪ','ko nv Vo i','コンボイ','コンボイ');
 INSERT INTO "hand_mapping" VALUES ('COOK','k ˈʊ k','ku kv','クク','クク');
 INSERT INTO "hand_mapping" VALUES ('COOKBOOK','k ˈʊ k b ˌʊ k','ku kv bu kv','ククブク','ククブク');
 INSERT INTO "hand_mapping" VALUES ('COOKED','k ˈʊ k t','ku kv tv','ククト','ククト');
@@ -3660,7 +3660,7 @@ INSERT INTO "hand_mapping" VALUES ('COOP','k ˈuː p','ku - pv','クープ','ク
 INSERT INTO "hand_mapping" VALUES ('COOPER','k ˈuː p ə','ku - pa','クーパ','クーパ');
 INSERT INTO "hand_mapping" VALUES ('COOPERATE','k əʊ ˈɒ p ə ɹ ˌeɪ t','ko o x pa re i tv','コオッパレイト','コオッパレイト');
 INSERT INTO "hand_mapping" VALUES ('COOPERATION','k əʊ ˌɒ p ə ɹ ˈeɪ ʃ ə n','ko o - pa re i sya nv','コオーパレイシャン','コオーパレイション');
-INSERT INTO "hand_mapping" VALUES ('COOPERATIVE','k əʊ ˈɒ p ə ɹ ə t ɪ v','ko o x pa ra ti bv','コオッパラティブ','コオッパラティブ');
+INSERT INTO "hand_mapping" VALUES ('COOPERATIVE','k əʊ ˈɒ p ə ɹ ə t ɪ v','ko o x pa ra ti Vv','コオッパラティブ','コオッパラティブ');
 INSERT INTO "hand_mapping" VALUES ('COORDINATE(1)','k əʊ ˈɔː d ɪ n ˌeɪ t','ko o - di ne i tv','コオーディネイト','コオーディネイト');
 INSERT INTO "hand_mapping" VALUES ('COORDINATE(2)','k əʊ ˈɔː d ɪ n ɪ t','ko o - di ni tv','コオーディニト','コオーディニト');
 INSERT INTO "hand_mapping" VALUES ('COORDINATED','k əʊ ˈɔː d ɪ n eɪ t ɪ d','ko o - di ne i ti dv','コオーディネイティド','コオーディネイティド');
@@ -3803,18 +3803,18 @@ INSERT INTO "hand_mapping" VALUES ('COURTS','k ˈɔː t s','ko - tsv','コーツ
 INSERT INTO "hand_mapping" VALUES ('COURTYARD','k ˈɔː t j ˌɑː d','ko - tya - dv','コーチャード','コーチャード');
 INSERT INTO "hand_mapping" VALUES ('COUSIN','k ˈɐ z ə n','ka za nv','カザン','カザン');
 INSERT INTO "hand_mapping" VALUES ('COUSINS','k ˈɐ z ə n z','ka za nv zv','カザンズ','カザンズ');
-INSERT INTO "hand_mapping" VALUES ('COVE','k ˈəʊ v','ko - bv','コーブ','コーブ');
-INSERT INTO "hand_mapping" VALUES ('COVENANT','k ˈɐ v ə n ə n t','ka ba na nv tv','カバナント','コバナント');
-INSERT INTO "hand_mapping" VALUES ('COVENTRY(1)','k ˈɒ v ə n t ɹ i','ko ba nv tv ri -','コバントリー','コバントリー');
-INSERT INTO "hand_mapping" VALUES ('COVENTRY(2)','k ˈɐ v ə n t ɹ i','ka ba nv tv ri -','カバントリー','コバントリー');
-INSERT INTO "hand_mapping" VALUES ('COVER','k ˈɐ v ə','ka ba','カバ','コバ');
-INSERT INTO "hand_mapping" VALUES ('COVERAGE(1)','k ˈɐ v ɹ ɪ dʒ','ka bv ri jyv','カブリジュ','コブリジュ');
-INSERT INTO "hand_mapping" VALUES ('COVERAGE(2)','k ˈɐ v ə ɹ ɪ dʒ','ka ba ri jyv','カバリジュ','コバリジュ');
-INSERT INTO "hand_mapping" VALUES ('COVERED','k ˈɐ v ə d','ka ba dv','カバド','コバド');
-INSERT INTO "hand_mapping" VALUES ('COVERING(1)','k ˈɐ v ɹ ɪ ŋ','ka bv ri Nv','カブリン','コブリング');
-INSERT INTO "hand_mapping" VALUES ('COVERING(2)','k ˈɐ v ə ɹ ɪ ŋ','ka ba ri Nv','カバリン','コバリング');
-INSERT INTO "hand_mapping" VALUES ('COVERS','k ˈɐ v ə z','ka ba zv','カバズ','コバズ');
-INSERT INTO "hand_mapping" VALUES ('COVET','k ˈɐ v ɪ t','ka bi tv','カビト','コビト');
+INSERT INTO "hand_mapping" VALUES ('COVE','k ˈəʊ v','ko - Vv','コーブ','コーブ');
+INSERT INTO "hand_mapping" VALUES ('COVENANT','k ˈɐ v ə n ə n t','ka Va na nv tv','カバナント','コバナント');
+INSERT INTO "hand_mapping" VALUES ('COVENTRY(1)','k ˈɒ v ə n t ɹ i','ko Va nv tv ri -','コバントリー','コバントリー');
+INSERT INTO "hand_mapping" VALUES ('COVENTRY(2)','k ˈɐ v ə n t ɹ i','ka Va nv tv ri -','カバントリー','コバントリー');
+INSERT INTO "hand_mapping" VALUES ('COVER','k ˈɐ v ə','ka Va','カバ','コバ');
+INSERT INTO "hand_mapping" VALUES ('COVERAGE(1)','k ˈɐ v ɹ ɪ dʒ','ka Vv ri jyv','カブリジュ','コブリジュ');
+INSERT INTO "hand_mapping" VALUES ('COVERAGE(2)','k ˈɐ v ə ɹ ɪ dʒ','ka Va ri jyv','カバリジュ','コバリジュ');
+INSERT INTO "hand_mapping" VALUES ('COVERED','k ˈɐ v ə d','ka Va dv','カバド','コバド');
+INSERT INTO "hand_mapping" VALUES ('COVERING(1)','k ˈɐ v ɹ ɪ ŋ','ka Vv ri Nv','カブリン','コブリング');
+INSERT INTO "hand_mapping" VALUES ('COVERING(2)','k ˈɐ v ə ɹ ɪ ŋ','ka Va ri Nv','カバリン','コバリング');
+INSERT INTO "hand_mapping" VALUES ('COVERS','k ˈɐ v ə z','ka Va zv','カバズ','コバズ');
+INSERT INTO "hand_mapping" VALUES ('COVET','k ˈɐ v ɪ t','ka Vi tv','カビト','コビト');
 INSERT INTO "hand_mapping" VALUES ('COW','k ˈaʊ','ka u','カウ','カウ');
 INSERT INTO "hand_mapping" VALUES ('COWARD','k ˈaʊ ə d','ka u a dv','カウアド','カウアド');
 INSERT INTO "hand_mapping" VALUES ('COWBOY','k ˈaʊ b ˌɔɪ','ka u bo i','カウボイ','カウボイ');
@@ -3845,7 +3845,7 @@ INSERT INTO "hand_mapping" VALUES ('CRASH','k ɹ ˈæ ʃ','kv ra x syv','クラ
 INSERT INTO "hand_mapping" VALUES ('CRASHED','k ɹ ˈæ ʃ t','kv ra x syv tv','クラッシュト','クラッシュト');
 INSERT INTO "hand_mapping" VALUES ('CRASS','k ɹ ˈæ s','kv ra x sv','クラッス','クラッス');
 INSERT INTO "hand_mapping" VALUES ('CRATE','k ɹ ˈeɪ t','kv re i tv','クレイト','クレイト');
-INSERT INTO "hand_mapping" VALUES ('CRAVE','k ɹ ˈeɪ v','kv re i bv','クレイブ','クレイブ');
+INSERT INTO "hand_mapping" VALUES ('CRAVE','k ɹ ˈeɪ v','kv re i Vv','クレイブ','クレイブ');
 INSERT INTO "hand_mapping" VALUES ('CRAWFORD','k ɹ ˈɔː f ə d','kv ro - fa dv','クローファド','クローファド');
 INSERT INTO "hand_mapping" VALUES ('CRAWL','k ɹ ˈɔː l','kv ro - rv','クロール','クロール');
 INSERT INTO "hand_mapping" VALUES ('CRAWLEY','k ɹ ˈɔː l i','kv ro - ri -','クローリー','クローリー');
@@ -3859,8 +3859,8 @@ INSERT INTO "hand_mapping" VALUES ('CREATES','k ɹ iː ˈeɪ t s','kv ri - e i t
 INSERT INTO "hand_mapping" VALUES ('CREATING','k ɹ iː ˈeɪ t ɪ ŋ','kv ri - e i ti Nv','クリーエイティン','クリーエイティング');
 INSERT INTO "hand_mapping" VALUES ('CREATION','k ɹ iː ˈeɪ ʃ ə n','kv ri - e i sya nv','クリーエイシャン','クリーエイション');
 INSERT INTO "hand_mapping" VALUES ('CREATIONS','k ɹ iː ˈeɪ ʃ ə n z','kv ri - e i sya nv zv','クリーエイシャンズ','クリーエイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('CREATIVE','k ɹ iː ˈeɪ t ɪ v','kv ri - e i ti bv','クリーエイティブ','クリーエイティブ');
-INSERT INTO "hand_mapping" VALUES ('CREATIVITY','k ɹ ˌiː eɪ t ˈɪ v ɪ t i','kv ri - e i ti bi ti -','クリーエイティビティー','クリーエイティビティー');
+INSERT INTO "hand_mapping" VALUES ('CREATIVE','k ɹ iː ˈeɪ t ɪ v','kv ri - e i ti Vv','クリーエイティブ','クリーエイティブ');
+INSERT INTO "hand_mapping" VALUES ('CREATIVITY','k ɹ ˌiː eɪ t ˈɪ v ɪ t i','kv ri - e i ti Vi ti -','クリーエイティビティー','クリーエイティビティー');
 INSERT INTO "hand_mapping" VALUES ('CREATOR','k ɹ iː ˈeɪ t ə','kv ri - e i ta','クリーエイタ','クリーエイタ');
 INSERT INTO "hand_mapping" VALUES ('CREATURE','k ɹ ˈiː tʃ ə','kv ri - tya','クリーチャ','クリーチャ');
 INSERT INTO "hand_mapping" VALUES ('CREATURES','k ɹ ˈiː tʃ ə z','kv ri - tya zv','クリーチャズ','クリーチャズ');
@@ -3977,7 +3977,7 @@ INSERT INTO "hand_mapping" VALUES ('CULTURE','k ˈɐ l tʃ ə','ka rv tya','カ
 INSERT INTO "hand_mapping" VALUES ('CULTURES','k ˈɐ l tʃ ə z','ka rv tya zv','カルチャズ','カルチャズ');
 INSERT INTO "hand_mapping" VALUES ('CUM','k ˈɐ m','ka mv','カム','カム');
 INSERT INTO "hand_mapping" VALUES ('CUMBERLAND','k ˈɐ m b ə l ə n d','ka Nv ba ra nv dv','カンバランド','カンバランド');
-INSERT INTO "hand_mapping" VALUES ('CUMULATIVE','k j ˈuː m j ʊ l ə t ɪ v','kyu - myu ra ti bv','キューミュラティブ','キューミュラティブ');
+INSERT INTO "hand_mapping" VALUES ('CUMULATIVE','k j ˈuː m j ʊ l ə t ɪ v','kyu - myu ra ti Vv','キューミュラティブ','キューミュラティブ');
 INSERT INTO "hand_mapping" VALUES ('CUNT','k ˈɐ n t','ka nv tv','カント','カント');
 INSERT INTO "hand_mapping" VALUES ('CUP','k ˈɐ p','ka pv','カプ','カプ');
 INSERT INTO "hand_mapping" VALUES ('CUPBOARD','k ˈɐ b ə d','ka ba dv','カバド','カバド');
@@ -4007,8 +4007,8 @@ INSERT INTO "hand_mapping" VALUES ('CURSOR','k ˈɜː s ə','ke - sa','ケーサ
 INSERT INTO "hand_mapping" VALUES ('CURT','k ˈɜː t','ke - tv','ケート','ケート');
 INSERT INTO "hand_mapping" VALUES ('CURTAIN','k ˈɜː t ə n','ke - ta nv','ケータン','ケータン');
 INSERT INTO "hand_mapping" VALUES ('CURTAINS','k ˈɜː t ə n z','ke - ta nv zv','ケータンズ','ケータンズ');
-INSERT INTO "hand_mapping" VALUES ('CURVE','k ˈɜː v','ke - bv','ケーブ','ケーブ');
-INSERT INTO "hand_mapping" VALUES ('CURVES','k ˈɜː v z','ke - bv zv','ケーブズ','ケーブズ');
+INSERT INTO "hand_mapping" VALUES ('CURVE','k ˈɜː v','ke - Vv','ケーブ','ケーブ');
+INSERT INTO "hand_mapping" VALUES ('CURVES','k ˈɜː v z','ke - Vv zv','ケーブズ','ケーブズ');
 INSERT INTO "hand_mapping" VALUES ('CUSHION','k ˈʊ ʃ ə n','ku sya nv','クシャン','クション');
 INSERT INTO "hand_mapping" VALUES ('CUSP','k ˈɐ s p','ka sv pv','カスプ','カスプ');
 INSERT INTO "hand_mapping" VALUES ('CUSTARD','k ˈɐ s t ə d','ka sv ta dv','カスタド','カスタド');
@@ -4099,11 +4099,11 @@ INSERT INTO "hand_mapping" VALUES ('DATUM','d ˈeɪ t ə m','de i ta mv','デイ
 INSERT INTO "hand_mapping" VALUES ('DAUB','d ˈɔː b','do - bv','ドーブ','ドーブ');
 INSERT INTO "hand_mapping" VALUES ('DAUGHTER','d ˈɔː t ə','do - ta','ドータ','ドータ');
 INSERT INTO "hand_mapping" VALUES ('DAUGHTERS','d ˈɔː t ə z','do - ta zv','ドータズ','ドータズ');
-INSERT INTO "hand_mapping" VALUES ('DAVE','d ˈeɪ v','de i bv','デイブ','デイブ');
-INSERT INTO "hand_mapping" VALUES ('DAVID','d ˈeɪ v ɪ d','de i bi dv','デイビド','デイビド');
-INSERT INTO "hand_mapping" VALUES ('DAVIDSON','d ˈeɪ v ɪ d s ə n','de i bi dv sa nv','デイビドサン','デイビドサン');
-INSERT INTO "hand_mapping" VALUES ('DAVIES','d ˈeɪ v i z','de i bi - zv','デイビーズ','デイビーズ');
-INSERT INTO "hand_mapping" VALUES ('DAVIS','d ˈeɪ v ɪ s','de i bi sv','デイビス','デイビス');
+INSERT INTO "hand_mapping" VALUES ('DAVE','d ˈeɪ v','de i Vv','デイブ','デイブ');
+INSERT INTO "hand_mapping" VALUES ('DAVID','d ˈeɪ v ɪ d','de i Vi dv','デイビド','デイビド');
+INSERT INTO "hand_mapping" VALUES ('DAVIDSON','d ˈeɪ v ɪ d s ə n','de i Vi dv sa nv','デイビドサン','デイビドサン');
+INSERT INTO "hand_mapping" VALUES ('DAVIES','d ˈeɪ v i z','de i Vi - zv','デイビーズ','デイビーズ');
+INSERT INTO "hand_mapping" VALUES ('DAVIS','d ˈeɪ v ɪ s','de i Vi sv','デイビス','デイビス');
 INSERT INTO "hand_mapping" VALUES ('DAWN','d ˈɔː n','do - nv','ドーン','ドーン');
 INSERT INTO "hand_mapping" VALUES ('DAY','d ˈeɪ','de i','デイ','デイ');
 INSERT INTO "hand_mapping" VALUES ('DAYDREAM','d ˈeɪ d ɹ ˌiː m','de i dv ri - mv','デイドリーム','デイドリーム');
@@ -4151,7 +4151,7 @@ INSERT INTO "hand_mapping" VALUES ('DECAF','d ˈiː k æ f','di - ka fv','ディ
 INSERT INTO "hand_mapping" VALUES ('DECAFF','d ˈiː k æ f','di - ka fv','ディーカフ','ディーカフ');
 INSERT INTO "hand_mapping" VALUES ('DECAY','d ɪ k ˈeɪ','di ke i','ディケイ','ディケイ');
 INSERT INTO "hand_mapping" VALUES ('DECEASED','d ɪ s ˈiː s t','di si - sv tv','ディシースト','ディシースト');
-INSERT INTO "hand_mapping" VALUES ('DECEIVE','d ɪ s ˈiː v','di si - bv','ディシーブ','ディシーブ');
+INSERT INTO "hand_mapping" VALUES ('DECEIVE','d ɪ s ˈiː v','di si - Vv','ディシーブ','ディシーブ');
 INSERT INTO "hand_mapping" VALUES ('DECEMBER','d ɪ s ˈɛ m b ə','di se Nv ba','ディセンバ','ディセンバ');
 INSERT INTO "hand_mapping" VALUES ('DECENCY','d ˈiː s ə n s i','di - sa nv si -','ディーサンシー','ディーサンシー');
 INSERT INTO "hand_mapping" VALUES ('DECENT','d ˈiː s ə n t','di - sa nv tv','ディーサント','ディーサント');
@@ -4165,7 +4165,7 @@ INSERT INTO "hand_mapping" VALUES ('DECISION','d ɪ s ˈɪ ʒ ə n','di si jya n
 INSERT INTO "hand_mapping" VALUES ('DECISION-MAKER','d ɪ s ˈɪ ʒ ə n m ˌeɪ k ə','di si jya nv me i ka','ディシジャンメイカ','ディシジャンメイカ');
 INSERT INTO "hand_mapping" VALUES ('DECISION-MAKING','d ɪ s ˈɪ ʒ ə n m ˌeɪ k ɪ ŋ','di si jya nv me i ki Nv','ディシジャンメイキン','ディシジャンメイキング');
 INSERT INTO "hand_mapping" VALUES ('DECISIONS','d ɪ s ˈɪ ʒ ə n z','di si jya nv zv','ディシジャンズ','ディシジャンズ');
-INSERT INTO "hand_mapping" VALUES ('DECISIVE','d ɪ s ˈaɪ s ɪ v','di sa i si bv','ディサイシブ','ディサイシブ');
+INSERT INTO "hand_mapping" VALUES ('DECISIVE','d ɪ s ˈaɪ s ɪ v','di sa i si Vv','ディサイシブ','ディサイシブ');
 INSERT INTO "hand_mapping" VALUES ('DECK','d ˈɛ k','de kv','デク','デク');
 INSERT INTO "hand_mapping" VALUES ('DECLARATION','d ˌɛ k l ə ɹ ˈeɪ ʃ ə n','de - kv ra re i sya nv','デークラレイシャン','デークラレイション');
 INSERT INTO "hand_mapping" VALUES ('DECLARE','d ɪ k l ˈɛə','di kv re a','ディクレア','ディクレア');
@@ -4181,8 +4181,8 @@ INSERT INTO "hand_mapping" VALUES ('DECORATES','d ˈɛ k ə ɹ ˌeɪ t s','de ka
 INSERT INTO "hand_mapping" VALUES ('DECORATING','d ˈɛ k ə ɹ ˌeɪ t ɪ ŋ','de ka re i ti Nv','デカレイティン','デカレイティング');
 INSERT INTO "hand_mapping" VALUES ('DECORATION','d ˌɛ k ə ɹ ˈeɪ ʃ ə n','de - ka re i sya nv','デーカレイシャン','デーカレイション');
 INSERT INTO "hand_mapping" VALUES ('DECORATIONS','d ˌɛ k ə ɹ ˈeɪ ʃ ə n z','de - ka re i sya nv zv','デーカレイシャンズ','デーカレイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('DECORATIVE(1)','d ˈɛ k ɹ ə t ɪ v','de kv ra ti bv','デクラティブ','デクラティブ');
-INSERT INTO "hand_mapping" VALUES ('DECORATIVE(2)','d ˈɛ k ə ɹ ə t ɪ v','de ka ra ti bv','デカラティブ','デカラティブ');
+INSERT INTO "hand_mapping" VALUES ('DECORATIVE(1)','d ˈɛ k ɹ ə t ɪ v','de kv ra ti Vv','デクラティブ','デクラティブ');
+INSERT INTO "hand_mapping" VALUES ('DECORATIVE(2)','d ˈɛ k ə ɹ ə t ɪ v','de ka ra ti Vv','デカラティブ','デカラティブ');
 INSERT INTO "hand_mapping" VALUES ('DECOY(1)','d ˈiː k ɔɪ','di - ko i','ディーコイ','ディーコイ');
 INSERT INTO "hand_mapping" VALUES ('DECOY(2)','d ɪ k ˈɔɪ','di ko i','ディコイ','ディコイ');
 INSERT INTO "hand_mapping" VALUES ('DECREASE(1)','d ˈiː k ɹ ˌiː s','di - kv ri - sv','ディークリース','ディークリース');
@@ -4211,7 +4211,7 @@ INSERT INTO "hand_mapping" VALUES ('DEFEAT','d ɪ f ˈiː t','di fi - tv','デ
 INSERT INTO "hand_mapping" VALUES ('DEFEATED','d ɪ f ˈiː t ɪ d','di fi - ti dv','ディフィーティド','ディフィーティド');
 INSERT INTO "hand_mapping" VALUES ('DEFECT(1)','d ˈiː f ɛ k t','di - fe kv tv','ディーフェクト','ディーフェクト');
 INSERT INTO "hand_mapping" VALUES ('DEFECT(2)','d ɪ f ˈɛ k t','di fe kv tv','ディフェクト','ディフェクト');
-INSERT INTO "hand_mapping" VALUES ('DEFECTIVE','d ɪ f ˈɛ k t ɪ v','di fe kv ti bv','ディフェクティブ','ディフェクティブ');
+INSERT INTO "hand_mapping" VALUES ('DEFECTIVE','d ɪ f ˈɛ k t ɪ v','di fe kv ti Vv','ディフェクティブ','ディフェクティブ');
 INSERT INTO "hand_mapping" VALUES ('DEFECTS(1)','d ˈiː f ɛ k t s','di - fe kv tsv','ディーフェクツ','ディーフェクツ');
 INSERT INTO "hand_mapping" VALUES ('DEFECTS(2)','d ɪ f ˈɛ k t s','di fe kv tsv','ディフェクツ','ディフェクツ');
 INSERT INTO "hand_mapping" VALUES ('DEFENCE','d ɪ f ˈɛ n s','di fe nv sv','ディフェンス','ディフェンス');
@@ -4222,7 +4222,7 @@ INSERT INTO "hand_mapping" VALUES ('DEFENDANTS','d ɪ f ˈɛ n d ə n t s','di f
 INSERT INTO "hand_mapping" VALUES ('DEFENDER','d ɪ f ˈɛ n d ə','di fe nv da','ディフェンダ','ディフェンダ');
 INSERT INTO "hand_mapping" VALUES ('DEFENDING','d ɪ f ˈɛ n d ɪ ŋ','di fe nv di Nv','ディフェンディン','ディフェンディング');
 INSERT INTO "hand_mapping" VALUES ('DEFENSE','d ɪ f ˈɛ n s','di fe nv sv','ディフェンス','ディフェンス');
-INSERT INTO "hand_mapping" VALUES ('DEFENSIVE','d ɪ f ˈɛ n s ɪ v','di fe nv si bv','ディフェンシブ','ディフェンシブ');
+INSERT INTO "hand_mapping" VALUES ('DEFENSIVE','d ɪ f ˈɛ n s ɪ v','di fe nv si Vv','ディフェンシブ','ディフェンシブ');
 INSERT INTO "hand_mapping" VALUES ('DEFER','d ɪ f ˈɜː','di fe -','ディフェー','ディフェー');
 INSERT INTO "hand_mapping" VALUES ('DEFERRED','d ɪ f ˈɜː d','di fe - dv','ディフェード','ディフェード');
 INSERT INTO "hand_mapping" VALUES ('DEFICIENCY','d ɪ f ˈɪ ʃ ə n s i','di fi sya nv si -','ディフィシャンシー','ディフィシャンシー');
@@ -4268,16 +4268,16 @@ INSERT INTO "hand_mapping" VALUES ('DELICIOUS','d ɪ l ˈɪ ʃ ə s','di ri sya
 INSERT INTO "hand_mapping" VALUES ('DELIGHT','d ɪ l ˈaɪ t','di ra i tv','ディライト','ディライト');
 INSERT INTO "hand_mapping" VALUES ('DELIGHTED','d ɪ l ˈaɪ t ɪ d','di ra i ti dv','ディライティド','ディライティド');
 INSERT INTO "hand_mapping" VALUES ('DELIGHTFUL','d ɪ l ˈaɪ t f ə l','di ra i tv fa rv','ディライトファル','ディライトファル');
-INSERT INTO "hand_mapping" VALUES ('DELIVER','d ɪ l ˈɪ v ə','di ri ba','ディリバ','ディリバ');
-INSERT INTO "hand_mapping" VALUES ('DELIVERED','d ɪ l ˈɪ v ə d','di ri ba dv','ディリバド','ディリバド');
-INSERT INTO "hand_mapping" VALUES ('DELIVERING','d ɪ l ˈɪ v ə ɹ ɪ ŋ','di ri ba ri Nv','ディリバリン','ディリバリング');
-INSERT INTO "hand_mapping" VALUES ('DELIVERS','d ɪ l ˈɪ v ə z','di ri ba zv','ディリバズ','ディリバズ');
-INSERT INTO "hand_mapping" VALUES ('DELIVERY','d ɪ l ˈɪ v ə ɹ i','di ri ba ri -','ディリバリー','ディリバリー');
+INSERT INTO "hand_mapping" VALUES ('DELIVER','d ɪ l ˈɪ v ə','di ri Va','ディリバ','ディリバ');
+INSERT INTO "hand_mapping" VALUES ('DELIVERED','d ɪ l ˈɪ v ə d','di ri Va dv','ディリバド','ディリバド');
+INSERT INTO "hand_mapping" VALUES ('DELIVERING','d ɪ l ˈɪ v ə ɹ ɪ ŋ','di ri Va ri Nv','ディリバリン','ディリバリング');
+INSERT INTO "hand_mapping" VALUES ('DELIVERS','d ɪ l ˈɪ v ə z','di ri Va zv','ディリバズ','ディリバズ');
+INSERT INTO "hand_mapping" VALUES ('DELIVERY','d ɪ l ˈɪ v ə ɹ i','di ri Va ri -','ディリバリー','ディリバリー');
 INSERT INTO "hand_mapping" VALUES ('DELL','d ˈɛ l','de rv','デル','デル');
 INSERT INTO "hand_mapping" VALUES ('DELTA','d ˈɛ l t ə','de rv ta','デルタ','デルタ');
 INSERT INTO "hand_mapping" VALUES ('DELUXE(1)','d ɪ l ˈɐ k s','di ra kv sv','ディラクス','ディラクス');
 INSERT INTO "hand_mapping" VALUES ('DELUXE(2)','d ɪ l ˈʊ k s','di ru kv sv','ディルクス','ディルクス');
-INSERT INTO "hand_mapping" VALUES ('DELVE','d ˈɛ l v','de rv bv','デルブ','デルブ');
+INSERT INTO "hand_mapping" VALUES ('DELVE','d ˈɛ l v','de rv Vv','デルブ','デルブ');
 INSERT INTO "hand_mapping" VALUES ('DEMAND','d ɪ m ˈɑː n d','di ma - nv dv','ディマーンド','ディマーンド');
 INSERT INTO "hand_mapping" VALUES ('DEMANDED','d ɪ m ˈɑː n d ɪ d','di ma - nv di dv','ディマーンディド','ディマーンディド');
 INSERT INTO "hand_mapping" VALUES ('DEMANDING','d ɪ m ˈɑː n d ɪ ŋ','di ma - nv di Nv','ディマーンディン','ディマーンディング');
@@ -4318,7 +4318,7 @@ INSERT INTO "hand_mapping" VALUES ('DENT','d ˈɛ n t','de nv tv','デント','
 INSERT INTO "hand_mapping" VALUES ('DENTAL','d ˈɛ n t ə l','de nv ta rv','デンタル','デンタル');
 INSERT INTO "hand_mapping" VALUES ('DENTIST','d ˈɛ n t ɪ s t','de nv ti sv tv','デンティスト','デンティスト');
 INSERT INTO "hand_mapping" VALUES ('DENTISTS','d ˈɛ n t ɪ s t s','de nv ti sv tsv','デンティスツ','デンティスツ');
-INSERT INTO "hand_mapping" VALUES ('DENVER','d ˈɛ n v ə','de nv ba','デンバ','デンバ');
+INSERT INTO "hand_mapping" VALUES ('DENVER','d ˈɛ n v ə','de nv Va','デンバ','デンバ');
 INSERT INTO "hand_mapping" VALUES ('DENY','d ɪ n ˈaɪ','di na i','ディナイ','ディナイ');
 INSERT INTO "hand_mapping" VALUES ('DEPART','d ɪ p ˈɑː t','di pa - tv','ディパート','ディパート');
 INSERT INTO "hand_mapping" VALUES ('DEPARTMENT','d ɪ p ˈɑː t m ə n t','di pa - tv ma nv tv','ディパートマント','ディパートメント');
@@ -4340,8 +4340,8 @@ INSERT INTO "hand_mapping" VALUES ('DEPOT','d ˈɛ p əʊ','de po','デポ','デ
 INSERT INTO "hand_mapping" VALUES ('DEPRESSED','d ɪ p ɹ ˈɛ s t','di pv re sv tv','ディプレスト','ディプレスト');
 INSERT INTO "hand_mapping" VALUES ('DEPRESSING','d ɪ p ɹ ˈɛ s ɪ ŋ','di pv re si Nv','ディプレシン','ディプレシング');
 INSERT INTO "hand_mapping" VALUES ('DEPRESSION','d ɪ p ɹ ˈɛ ʃ ə n','di pv re sya nv','ディプレシャン','ディプレション');
-INSERT INTO "hand_mapping" VALUES ('DEPRIVATION','d ˌɛ p ɹ ɪ v ˈeɪ ʃ ə n','de - pv ri be i sya nv','デープリベイシャン','デープリベイション');
-INSERT INTO "hand_mapping" VALUES ('DEPRIVE','d ɪ p ɹ ˈaɪ v','di pv ra i bv','ディプライブ','ディプライブ');
+INSERT INTO "hand_mapping" VALUES ('DEPRIVATION','d ˌɛ p ɹ ɪ v ˈeɪ ʃ ə n','de - pv ri Ve i sya nv','デープリベイシャン','デープリベイション');
+INSERT INTO "hand_mapping" VALUES ('DEPRIVE','d ɪ p ɹ ˈaɪ v','di pv ra i Vv','ディプライブ','ディプライブ');
 INSERT INTO "hand_mapping" VALUES ('DEPTH','d ˈɛ p θ','de pv sv','デプス','デプス');
 INSERT INTO "hand_mapping" VALUES ('DEPTHS','d ˈɛ p θ s','de pv sv sv','デプスス','デプスス');
 INSERT INTO "hand_mapping" VALUES ('DEPUTIES','d ˈɛ p j ʊ t i z','de pyu ti - zv','デピュティーズ','デピュティーズ');
@@ -4350,10 +4350,10 @@ INSERT INTO "hand_mapping" VALUES ('DERBY(1)','d ˈɑː b i','da - bi -','ダー
 INSERT INTO "hand_mapping" VALUES ('DERBY(2)','d ˈɜː b i','de - bi -','デービー','デービー');
 INSERT INTO "hand_mapping" VALUES ('DERBYSHIRE','d ˈɑː b ɪ ʃ ə','da - bi sya','ダービシャ','ダービシャ');
 INSERT INTO "hand_mapping" VALUES ('DEREK','d ˈɛ ɹ ɪ k','de ri kv','デリク','デリク');
-INSERT INTO "hand_mapping" VALUES ('DERIVATIVE','d ə ɹ ˈɪ v ə t ɪ v','da ri ba ti bv','ダリバティブ','ダリバティブ');
-INSERT INTO "hand_mapping" VALUES ('DERIVATIVES','d ə ɹ ˈɪ v ə t ɪ v z','da ri ba ti bv zv','ダリバティブズ','ダリバティブズ');
-INSERT INTO "hand_mapping" VALUES ('DERIVE','d ə ɹ ˈaɪ v','da ra i bv','ダライブ','ダライブ');
-INSERT INTO "hand_mapping" VALUES ('DERIVED','d ə ɹ ˈaɪ v d','da ra i bv dv','ダライブド','ダライブド');
+INSERT INTO "hand_mapping" VALUES ('DERIVATIVE','d ə ɹ ˈɪ v ə t ɪ v','da ri Va ti Vv','ダリバティブ','ダリバティブ');
+INSERT INTO "hand_mapping" VALUES ('DERIVATIVES','d ə ɹ ˈɪ v ə t ɪ v z','da ri Va ti Vv zv','ダリバティブズ','ダリバティブズ');
+INSERT INTO "hand_mapping" VALUES ('DERIVE','d ə ɹ ˈaɪ v','da ra i Vv','ダライブ','ダライブ');
+INSERT INTO "hand_mapping" VALUES ('DERIVED','d ə ɹ ˈaɪ v d','da ra i Vv dv','ダライブド','ダライブド');
 INSERT INTO "hand_mapping" VALUES ('DESCEND','d ɪ s ˈɛ n d','di se nv dv','ディセンド','ディセンド');
 INSERT INTO "hand_mapping" VALUES ('DESCENDENT','d ɪ s ˈɛ n d ə n t','di se nv da nv tv','ディセンダント','ディセンダント');
 INSERT INTO "hand_mapping" VALUES ('DESCENDING','d ɪ s ˈɛ n d ɪ ŋ','di se nv di Nv','ディセンディン','ディセンディング');
@@ -4366,9 +4366,9 @@ INSERT INTO "hand_mapping" VALUES ('DESCRIPTION','d ɪ s k ɹ ˈɪ p ʃ ə n','d
 INSERT INTO "hand_mapping" VALUES ('DESCRIPTIONS','d ɪ s k ɹ ˈɪ p ʃ ə n z','di sv kv ri pv sya nv zv','ディスクリプシャンズ','ディスクリプシャンズ');
 INSERT INTO "hand_mapping" VALUES ('DESERT(1)','d ɪ z ˈɜː t','di ze - tv','ディゼート','ディゼート');
 INSERT INTO "hand_mapping" VALUES ('DESERT(2)','d ˈɛ z ə t','de za tv','デザト','デザト');
-INSERT INTO "hand_mapping" VALUES ('DESERVE','d ɪ z ˈɜː v','di ze - bv','ディゼーブ','ディゼーブ');
-INSERT INTO "hand_mapping" VALUES ('DESERVED','d ɪ z ˈɜː v d','di ze - bv dv','ディゼーブド','ディゼーブド');
-INSERT INTO "hand_mapping" VALUES ('DESERVES','d ɪ z ˈɜː v z','di ze - bv zv','ディゼーブズ','ディゼーブズ');
+INSERT INTO "hand_mapping" VALUES ('DESERVE','d ɪ z ˈɜː v','di ze - Vv','ディゼーブ','ディゼーブ');
+INSERT INTO "hand_mapping" VALUES ('DESERVED','d ɪ z ˈɜː v d','di ze - Vv dv','ディゼーブド','ディゼーブド');
+INSERT INTO "hand_mapping" VALUES ('DESERVES','d ɪ z ˈɜː v z','di ze - Vv zv','ディゼーブズ','ディゼーブズ');
 INSERT INTO "hand_mapping" VALUES ('DESGUISE','d ɪ s g ˈaɪ z','di sv ga i zv','ディスガイズ','ディスガイズ');
 INSERT INTO "hand_mapping" VALUES ('DESIGN','d ɪ z ˈaɪ n','di za i nv','ディザイン','ディザイン');
 INSERT INTO "hand_mapping" VALUES ('DESIGNATE','d ˈɛ z ɪ g n ˌeɪ t','de zi gv ne i tv','デジグネイト','デジグネイト');
@@ -4400,7 +4400,7 @@ INSERT INTO "hand_mapping" VALUES ('DESTINY','d ˈɛ s t ɪ n i','de sv ti ni -'
 INSERT INTO "hand_mapping" VALUES ('DESTROY','d ɪ s t ɹ ˈɔɪ','di sv tv ro i','ディストロイ','ディストロイ');
 INSERT INTO "hand_mapping" VALUES ('DESTROYED','d ɪ s t ɹ ˈɔɪ d','di sv tv ro i dv','ディストロイド','ディストロイド');
 INSERT INTO "hand_mapping" VALUES ('DESTRUCTION','d ɪ s t ɹ ˈɐ k ʃ ə n','di sv tv ra kv sya nv','ディストラクシャン','ディストラクション');
-INSERT INTO "hand_mapping" VALUES ('DESTRUCTIVE','d ɪ s t ɹ ˈɐ k t ɪ v','di sv tv ra kv ti bv','ディストラクティブ','ディストラクティブ');
+INSERT INTO "hand_mapping" VALUES ('DESTRUCTIVE','d ɪ s t ɹ ˈɐ k t ɪ v','di sv tv ra kv ti Vv','ディストラクティブ','ディストラクティブ');
 INSERT INTO "hand_mapping" VALUES ('DETACH','d ɪ t ˈæ tʃ','di ta x tyv','ディタッチュ','ディタッチュ');
 INSERT INTO "hand_mapping" VALUES ('DETACHED','d ɪ t ˈæ tʃ t','di ta x tyv tv','ディタッチュト','ディタッチュト');
 INSERT INTO "hand_mapping" VALUES ('DETAIL','d ˈiː t eɪ l','di - te i rv','ディーテイル','ディーテイル');
@@ -4410,8 +4410,8 @@ INSERT INTO "hand_mapping" VALUES ('DETAIN','d ɪ t ˈeɪ n','di te i nv','デ
 INSERT INTO "hand_mapping" VALUES ('DETECT','d ɪ t ˈɛ k t','di te kv tv','ディテクト','ディテクト');
 INSERT INTO "hand_mapping" VALUES ('DETECTED','d ɪ t ˈɛ k t ɪ d','di te kv ti dv','ディテクティド','ディテクティド');
 INSERT INTO "hand_mapping" VALUES ('DETECTION','d ɪ t ˈɛ k ʃ ə n','di te kv sya nv','ディテクシャン','ディテクション');
-INSERT INTO "hand_mapping" VALUES ('DETECTIVE','d ɪ t ˈɛ k t ɪ v','di te kv ti bv','ディテクティブ','ディテクティブ');
-INSERT INTO "hand_mapping" VALUES ('DETECTIVES','d ɪ t ˈɛ k t ɪ v z','di te kv ti bv zv','ディテクティブズ','ディテクティブズ');
+INSERT INTO "hand_mapping" VALUES ('DETECTIVE','d ɪ t ˈɛ k t ɪ v','di te kv ti Vv','ディテクティブ','ディテクティブ');
+INSERT INTO "hand_mapping" VALUES ('DETECTIVES','d ɪ t ˈɛ k t ɪ v z','di te kv ti Vv zv','ディテクティブズ','ディテクティブズ');
 INSERT INTO "hand_mapping" VALUES ('DETECTOR','d ɪ t ˈɛ k t ə','di te kv ta','ディテクタ','ディテクタ');
 INSERT INTO "hand_mapping" VALUES ('DETENTION','d ɪ t ˈɛ n ʃ ə n','di te nv sya nv','ディテンシャン','ディテンション');
 INSERT INTO "hand_mapping" VALUES ('DETER','d ɪ t ˈɜː','di te -','ディテー','ディテー');
@@ -4427,27 +4427,27 @@ INSERT INTO "hand_mapping" VALUES ('DETERRENT','d ɪ t ˈɛ ɹ ə n t','di te ra
 INSERT INTO "hand_mapping" VALUES ('DETOUR','d ˈiː t ʊə','di - tu a','ディートゥア','ディートゥア');
 INSERT INTO "hand_mapping" VALUES ('DETROIT','d ɪ t ɹ ˈɔɪ t','di tv ro i tv','ディトロイト','ディトロイト');
 INSERT INTO "hand_mapping" VALUES ('DEUTSCH','d ˈɔɪ tʃ','do i tyv','ドイチュ','ドイチュ');
-INSERT INTO "hand_mapping" VALUES ('DEV','d ˈɛ v','de bv','デブ','デブ');
-INSERT INTO "hand_mapping" VALUES ('DEVASTATING','d ˈɛ v ə s t ˌeɪ t ɪ ŋ','de ba sv te i ti Nv','デバステイティン','デバステイティング');
-INSERT INTO "hand_mapping" VALUES ('DEVELOP','d ɪ v ˈɛ l ə p','di be ra pv','ディベラプ','ディベラプ');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPED','d ɪ v ˈɛ l ə p t','di be ra pv tv','ディベラプト','ディベラプト');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPER','d ɪ v ˈɛ l ə p ə','di be ra pa','ディベラパ','ディベラパ');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPERS','d ɪ v ˈɛ l ə p ə z','di be ra pa zv','ディベラパズ','ディベラパズ');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPING','d ɪ v ˈɛ l ə p ɪ ŋ','di be ra pi Nv','ディベラピン','ディベラピング');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPMENT','d ɪ v ˈɛ l ə p m ə n t','di be ra pv ma nv tv','ディベラプマント','ディベラプメント');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPMENTAL','d ɪ v ˌɛ l ə p m ˈɛ n t ə l','di be - ra pv me nv ta rv','ディベーラプメンタル','ディベーラプメンタル');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPMENTS','d ɪ v ˈɛ l ə p m ə n t s','di be ra pv ma nv tsv','ディベラプマンツ','ディベラプマンツ');
-INSERT INTO "hand_mapping" VALUES ('DEVELOPS','d ɪ v ˈɛ l ə p s','di be ra pv sv','ディベラプス','ディベラプス');
-INSERT INTO "hand_mapping" VALUES ('DEVIANT','d ˈiː v ɪə n t','di - bi a nv tv','ディービアント','ディービアント');
-INSERT INTO "hand_mapping" VALUES ('DEVIATION','d ˌiː v ɪ ˈeɪ ʃ ə n','di - bi e i sya nv','ディービエイシャン','ディービエイション');
-INSERT INTO "hand_mapping" VALUES ('DEVICE','d ɪ v ˈaɪ s','di ba i sv','ディバイス','ディバイス');
-INSERT INTO "hand_mapping" VALUES ('DEVICES','d ɪ v ˈaɪ s ɪ z','di ba i si zv','ディバイシズ','ディバイシズ');
-INSERT INTO "hand_mapping" VALUES ('DEVIL','d ˈɛ v ə l','de ba rv','デバル','デバル');
-INSERT INTO "hand_mapping" VALUES ('DEVISE','d ɪ v ˈaɪ z','di ba i zv','ディバイズ','ディバイズ');
-INSERT INTO "hand_mapping" VALUES ('DEVON','d ˈɛ v ə n','de ba nv','デバン','デバン');
-INSERT INTO "hand_mapping" VALUES ('DEVOTE','d ɪ v ˈəʊ t','di bo - tv','ディボート','ディボート');
-INSERT INTO "hand_mapping" VALUES ('DEVOTED','d ɪ v ˈəʊ t ɪ d','di bo - ti dv','ディボーティド','ディボーティド');
-INSERT INTO "hand_mapping" VALUES ('DEVOTES','d ɪ v ˈəʊ t s','di bo - tsv','ディボーツ','ディボーツ');
+INSERT INTO "hand_mapping" VALUES ('DEV','d ˈɛ v','de Vv','デブ','デブ');
+INSERT INTO "hand_mapping" VALUES ('DEVASTATING','d ˈɛ v ə s t ˌeɪ t ɪ ŋ','de Va sv te i ti Nv','デバステイティン','デバステイティング');
+INSERT INTO "hand_mapping" VALUES ('DEVELOP','d ɪ v ˈɛ l ə p','di Ve ra pv','ディベラプ','ディベラプ');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPED','d ɪ v ˈɛ l ə p t','di Ve ra pv tv','ディベラプト','ディベラプト');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPER','d ɪ v ˈɛ l ə p ə','di Ve ra pa','ディベラパ','ディベラパ');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPERS','d ɪ v ˈɛ l ə p ə z','di Ve ra pa zv','ディベラパズ','ディベラパズ');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPING','d ɪ v ˈɛ l ə p ɪ ŋ','di Ve ra pi Nv','ディベラピン','ディベラピング');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPMENT','d ɪ v ˈɛ l ə p m ə n t','di Ve ra pv ma nv tv','ディベラプマント','ディベラプメント');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPMENTAL','d ɪ v ˌɛ l ə p m ˈɛ n t ə l','di Ve - ra pv me nv ta rv','ディベーラプメンタル','ディベーラプメンタル');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPMENTS','d ɪ v ˈɛ l ə p m ə n t s','di Ve ra pv ma nv tsv','ディベラプマンツ','ディベラプマンツ');
+INSERT INTO "hand_mapping" VALUES ('DEVELOPS','d ɪ v ˈɛ l ə p s','di Ve ra pv sv','ディベラプス','ディベラプス');
+INSERT INTO "hand_mapping" VALUES ('DEVIANT','d ˈiː v ɪə n t','di - Vi a nv tv','ディービアント','ディービアント');
+INSERT INTO "hand_mapping" VALUES ('DEVIATION','d ˌiː v ɪ ˈeɪ ʃ ə n','di - Vi e i sya nv','ディービエイシャン','ディービエイション');
+INSERT INTO "hand_mapping" VALUES ('DEVICE','d ɪ v ˈaɪ s','di Va i sv','ディバイス','ディバイス');
+INSERT INTO "hand_mapping" VALUES ('DEVICES','d ɪ v ˈaɪ s ɪ z','di Va i si zv','ディバイシズ','ディバイシズ');
+INSERT INTO "hand_mapping" VALUES ('DEVIL','d ˈɛ v ə l','de Va rv','デバル','デバル');
+INSERT INTO "hand_mapping" VALUES ('DEVISE','d ɪ v ˈaɪ z','di Va i zv','ディバイズ','ディバイズ');
+INSERT INTO "hand_mapping" VALUES ('DEVON','d ˈɛ v ə n','de Va nv','デバン','デバン');
+INSERT INTO "hand_mapping" VALUES ('DEVOTE','d ɪ v ˈəʊ t','di Vo - tv','ディボート','ディボート');
+INSERT INTO "hand_mapping" VALUES ('DEVOTED','d ɪ v ˈəʊ t ɪ d','di Vo - ti dv','ディボーティド','ディボーティド');
+INSERT INTO "hand_mapping" VALUES ('DEVOTES','d ɪ v ˈəʊ t s','di Vo - tsv','ディボーツ','ディボーツ');
 INSERT INTO "hand_mapping" VALUES ('DEW','d j ˈuː','dyu -','デュー','デュー');
 INSERT INTO "hand_mapping" VALUES ('DIABETES','d ˌaɪ ə b ˈiː t iː z','da i a bi - ti - zv','ダイアビーティーズ','ダイアビーティーズ');
 INSERT INTO "hand_mapping" VALUES ('DIAGNOSE','d ˈaɪ ə g n ˌəʊ z','da i a gv no zv','ダイアグノズ','ダイアグノズ');
@@ -4560,8 +4560,8 @@ INSERT INTO "hand_mapping" VALUES ('DIRECTION(1)','d aɪ ɹ ˈɛ k ʃ ə n','da
 INSERT INTO "hand_mapping" VALUES ('DIRECTION(2)','d ɪ ɹ ˈɛ k ʃ ə n','di re kv sya nv','ディレクシャン','ディレクション');
 INSERT INTO "hand_mapping" VALUES ('DIRECTIONS(1)','d aɪ ɹ ˈɛ k ʃ ə n z','da i re kv sya nv zv','ダイレクシャンズ','ダイレクシャンズ');
 INSERT INTO "hand_mapping" VALUES ('DIRECTIONS(2)','d ɪ ɹ ˈɛ k ʃ ə n z','di re kv sya nv zv','ディレクシャンズ','ディレクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('DIRECTIVE(1)','d aɪ ɹ ˈɛ k t ɪ v','da i re kv ti bv','ダイレクティブ','ダイレクティブ');
-INSERT INTO "hand_mapping" VALUES ('DIRECTIVE(2)','d ɪ ɹ ˈɛ k t ɪ v','di re kv ti bv','ディレクティブ','ディレクティブ');
+INSERT INTO "hand_mapping" VALUES ('DIRECTIVE(1)','d aɪ ɹ ˈɛ k t ɪ v','da i re kv ti Vv','ダイレクティブ','ダイレクティブ');
+INSERT INTO "hand_mapping" VALUES ('DIRECTIVE(2)','d ɪ ɹ ˈɛ k t ɪ v','di re kv ti Vv','ディレクティブ','ディレクティブ');
 INSERT INTO "hand_mapping" VALUES ('DIRECTLY(1)','d aɪ ɹ ˈɛ k t l i','da i re kv tv ri -','ダイレクトリー','ダイレクトリー');
 INSERT INTO "hand_mapping" VALUES ('DIRECTLY(2)','d ɪ ɹ ˈɛ k t l i','di re kv tv ri -','ディレクトリー','ディレクトリー');
 INSERT INTO "hand_mapping" VALUES ('DIRECTOR(1)','d aɪ ɹ ˈɛ k t ə','da i re kv ta','ダイレクタ','ダイレクタ');
@@ -4581,7 +4581,7 @@ INSERT INTO "hand_mapping" VALUES ('DISABILITIES','d ɪ s ə b ˈɪ l ɪ t i z',
 INSERT INTO "hand_mapping" VALUES ('DISABILITY','d ˌɪ s ə b ˈɪ l ɪ t i','di - sa bi ri ti -','ディーサビリティー','ディーサビリティー');
 INSERT INTO "hand_mapping" VALUES ('DISABLE','d ɪ s ˈeɪ b ə l','di se i ba rv','ディセイバル','ディセイバル');
 INSERT INTO "hand_mapping" VALUES ('DISABLED','d ɪ s ˈeɪ b ə l d','di se i ba rv dv','ディセイバルド','ディセイバルド');
-INSERT INTO "hand_mapping" VALUES ('DISADVANTAGE','d ˌɪ s ə d v ˈɑː n t ɪ dʒ','di - sa dv ba - nv ti jyv','ディーサドバーンティジュ','ディーサドバーンティジュ');
+INSERT INTO "hand_mapping" VALUES ('DISADVANTAGE','d ˌɪ s ə d v ˈɑː n t ɪ dʒ','di - sa dv Va - nv ti jyv','ディーサドバーンティジュ','ディーサドバーンティジュ');
 INSERT INTO "hand_mapping" VALUES ('DISAGREE','d ɪ s ə g ɹ ˈiː','di sa gv ri -','ディサグリー','ディサグリー');
 INSERT INTO "hand_mapping" VALUES ('DISAGREEMENT','d ɪ s ə g ɹ ˈiː m ə n t','di sa gv ri - ma nv tv','ディサグリーマント','ディサグリーメント');
 INSERT INTO "hand_mapping" VALUES ('DISAPPEAR','d ˌɪ s ə p ˈɪə','di - sa pi a','ディーサピア','ディーサピア');
@@ -4611,10 +4611,10 @@ INSERT INTO "hand_mapping" VALUES ('DISCOUNTS(1)','d ˈɪ s k ˌaʊ n t s','di s
 INSERT INTO "hand_mapping" VALUES ('DISCOUNTS(2)','d ɪ s k ˈaʊ n t s','di sv ka u nv tsv','ディスカウンツ','ディスカウンツ');
 INSERT INTO "hand_mapping" VALUES ('DISCOURAGE','d ɪ s k ˈɐ ɹ ɪ dʒ','di sv ka ri jyv','ディスカリジュ','ディスカリジュ');
 INSERT INTO "hand_mapping" VALUES ('DISCOURSE','d ˈɪ s k ɔː s','di sv ko - sv','ディスコース','ディスコース');
-INSERT INTO "hand_mapping" VALUES ('DISCOVER','d ɪ s k ˈɐ v ə','di sv ka ba','ディスカバ','ディスカバ');
-INSERT INTO "hand_mapping" VALUES ('DISCOVERED','d ɪ s k ˈɐ v ə d','di sv ka ba dv','ディスカバド','ディスカバド');
-INSERT INTO "hand_mapping" VALUES ('DISCOVERY(1)','d ɪ s k ˈɐ v ɹ i','di sv ka bv ri -','ディスカブリー','ディスカブリー');
-INSERT INTO "hand_mapping" VALUES ('DISCOVERY(2)','d ɪ s k ˈɐ v ə ɹ i','di sv ka ba ri -','ディスカバリー','ディスカバリー');
+INSERT INTO "hand_mapping" VALUES ('DISCOVER','d ɪ s k ˈɐ v ə','di sv ka Va','ディスカバ','ディスカバ');
+INSERT INTO "hand_mapping" VALUES ('DISCOVERED','d ɪ s k ˈɐ v ə d','di sv ka Va dv','ディスカバド','ディスカバド');
+INSERT INTO "hand_mapping" VALUES ('DISCOVERY(1)','d ɪ s k ˈɐ v ɹ i','di sv ka Vv ri -','ディスカブリー','ディスカブリー');
+INSERT INTO "hand_mapping" VALUES ('DISCOVERY(2)','d ɪ s k ˈɐ v ə ɹ i','di sv ka Va ri -','ディスカバリー','ディスカバリー');
 INSERT INTO "hand_mapping" VALUES ('DISCRETE','d ɪ s k ɹ ˈiː t','di sv kv ri - tv','ディスクリート','ディスクリート');
 INSERT INTO "hand_mapping" VALUES ('DISCRETION','d ɪ s k ɹ ˈɛ ʃ ə n','di sv kv re sya nv','ディスクレシャン','ディスクレション');
 INSERT INTO "hand_mapping" VALUES ('DISCRIMINATE(1)','d ɪ s k ɹ ˈɪ m ɪ n ˌeɪ t','di sv kv ri mi ne i tv','ディスクリミネイト','ディスクリミネイト');
@@ -4663,9 +4663,9 @@ INSERT INTO "hand_mapping" VALUES ('DISPLAYS','d ɪ s p l ˈeɪ z','di sv pv re
 INSERT INTO "hand_mapping" VALUES ('DISPOSAL','d ɪ s p ˈəʊ z ə l','di sv po - za rv','ディスポーザル','ディスポーザル');
 INSERT INTO "hand_mapping" VALUES ('DISPOSE','d ɪ s p ˈəʊ z','di sv po - zv','ディスポーズ','ディスポーズ');
 INSERT INTO "hand_mapping" VALUES ('DISPOSITION','d ˌɪ s p ə z ˈɪ ʃ ə n','di - sv pa zi sya nv','ディースパジシャン','ディースパジション');
-INSERT INTO "hand_mapping" VALUES ('DISPROVE','d ɪ s p ɹ ˈuː v','di sv pv ru - bv','ディスプルーブ','ディスプルーブ');
-INSERT INTO "hand_mapping" VALUES ('DISPROVED','d ɪ s p ɹ ˈuː v d','di sv pv ru - bv dv','ディスプルーブド','ディスプルーブド');
-INSERT INTO "hand_mapping" VALUES ('DISPROVEN','d ɪ s p ɹ ˈuː v ə n','di sv pv ru - ba nv','ディスプルーバン','ディスプルーバン');
+INSERT INTO "hand_mapping" VALUES ('DISPROVE','d ɪ s p ɹ ˈuː v','di sv pv ru - Vv','ディスプルーブ','ディスプルーブ');
+INSERT INTO "hand_mapping" VALUES ('DISPROVED','d ɪ s p ɹ ˈuː v d','di sv pv ru - Vv dv','ディスプルーブド','ディスプルーブド');
+INSERT INTO "hand_mapping" VALUES ('DISPROVEN','d ɪ s p ɹ ˈuː v ə n','di sv pv ru - Va nv','ディスプルーバン','ディスプルーバン');
 INSERT INTO "hand_mapping" VALUES ('DISPUTE','d ɪ s p j ˈuː t','di sv pyu - tv','ディスピュート','ディスピュート');
 INSERT INTO "hand_mapping" VALUES ('DISPUTES','d ɪ s p j ˈuː t s','di sv pyu - tsv','ディスピューツ','ディスピューツ');
 INSERT INTO "hand_mapping" VALUES ('DISREGARD','d ˌɪ s ɹ ɪ g ˈɑː d','di - sv ri ga - dv','ディースリガード','ディースリガード');
@@ -4677,14 +4677,14 @@ INSERT INTO "hand_mapping" VALUES ('DISSEMINATION','d ɪ s ˌɛ m ɪ n ˈeɪ ʃ
 INSERT INTO "hand_mapping" VALUES ('DISSERTATION','d ɪ s ə t ˈeɪ ʃ ə n','di sa te i sya nv','ディサテイシャン','ディサテイション');
 INSERT INTO "hand_mapping" VALUES ('DISSIPATE','d ˈɪ s ɪ p ˌeɪ t','di si pe i tv','ディシペイト','ディシペイト');
 INSERT INTO "hand_mapping" VALUES ('DISSOLUTION','d ˌɪ s ə l ˈuː ʃ ə n','di - sa ru - sya nv','ディーサルーシャン','ディーサルーション');
-INSERT INTO "hand_mapping" VALUES ('DISSOLVE','d ɪ z ˈɒ l v','di zo rv bv','ディゾルブ','ディゾルブ');
+INSERT INTO "hand_mapping" VALUES ('DISSOLVE','d ɪ z ˈɒ l v','di zo rv Vv','ディゾルブ','ディゾルブ');
 INSERT INTO "hand_mapping" VALUES ('DISTANCE','d ˈɪ s t ə n s','di sv ta nv sv','ディスタンス','ディスタンス');
 INSERT INTO "hand_mapping" VALUES ('DISTANCES','d ˈɪ s t ə n s ɪ z','di sv ta nv si zv','ディスタンシズ','ディスタンシズ');
 INSERT INTO "hand_mapping" VALUES ('DISTANT','d ˈɪ s t ə n t','di sv ta nv tv','ディスタント','ディスタント');
 INSERT INTO "hand_mapping" VALUES ('DISTINCT','d ɪ s t ˈɪ ŋ k t','di sv ti Nv kv tv','ディスティンクト','ディスティンクト');
 INSERT INTO "hand_mapping" VALUES ('DISTINCTION','d ɪ s t ˈɪ ŋ k ʃ ə n','di sv ti Nv kv sya nv','ディスティンクシャン','ディスティンクション');
 INSERT INTO "hand_mapping" VALUES ('DISTINCTIONS','d ɪ s t ˈɪ ŋ k ʃ ə n z','di sv ti Nv kv sya nv zv','ディスティンクシャンズ','ディスティンクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('DISTINCTIVE','d ɪ s t ˈɪ ŋ k t ɪ v','di sv ti Nv kv ti bv','ディスティンクティブ','ディスティンクティブ');
+INSERT INTO "hand_mapping" VALUES ('DISTINCTIVE','d ɪ s t ˈɪ ŋ k t ɪ v','di sv ti Nv kv ti Vv','ディスティンクティブ','ディスティンクティブ');
 INSERT INTO "hand_mapping" VALUES ('DISTINCTLY','d ɪ s t ˈɪ ŋ k t l i','di sv ti Nv kv tv ri -','ディスティンクトリー','ディスティンクトリー');
 INSERT INTO "hand_mapping" VALUES ('DISTINGUISH','d ɪ s t ˈɪ ŋ g w ɪ ʃ','di sv ti Nv gwi syv','ディスティングィシュ','ディスティングィシュ');
 INSERT INTO "hand_mapping" VALUES ('DISTINGUISHED','d ɪ s t ˈɪ ŋ g w ɪ ʃ t','di sv ti Nv gwi syv tv','ディスティングィシュト','ディスティングィシュト');
@@ -4705,24 +4705,24 @@ INSERT INTO "hand_mapping" VALUES ('DISTURBANCE','d ɪ s t ˈɜː b ə n s','di
 INSERT INTO "hand_mapping" VALUES ('DISTURBED','d ɪ s t ˈɜː b d','di sv te - bv dv','ディステーブド','ディステーブド');
 INSERT INTO "hand_mapping" VALUES ('DISTURBING','d ɪ s t ˈɜː b ɪ ŋ','di sv te - bi Nv','ディステービン','ディステービング');
 INSERT INTO "hand_mapping" VALUES ('DITCH','d ˈɪ tʃ','di tyv','ディチュ','ディチュ');
-INSERT INTO "hand_mapping" VALUES ('DIV','d ˈɪ v','di bv','ディブ','ディブ');
-INSERT INTO "hand_mapping" VALUES ('DIVE','d ˈaɪ v','da i bv','ダイブ','ダイブ');
-INSERT INTO "hand_mapping" VALUES ('DIVED','d ˈaɪ v d','da i bv dv','ダイブド','ダイブド');
-INSERT INTO "hand_mapping" VALUES ('DIVER','d ˈaɪ v ə','da i ba','ダイバ','ダイバ');
-INSERT INTO "hand_mapping" VALUES ('DIVERSE(1)','d aɪ v ˈɜː s','da i be - sv','ダイベース','ダイベース');
-INSERT INTO "hand_mapping" VALUES ('DIVERSE(2)','d ˈaɪ v ɜː s','da i be - sv','ダイベース','ダイベース');
-INSERT INTO "hand_mapping" VALUES ('DIVERSITY','d aɪ v ˈɜː s ɪ t i','da i be - si ti -','ダイベーシティー','ダイベーシティー');
-INSERT INTO "hand_mapping" VALUES ('DIVERT','d ˈaɪ v ɜː t','da i be - tv','ダイベート','ダイベート');
-INSERT INTO "hand_mapping" VALUES ('DIVIDE','d ɪ v ˈaɪ d','di ba i dv','ディバイド','ディバイド');
-INSERT INTO "hand_mapping" VALUES ('DIVIDED','d ɪ v ˈaɪ d ɪ d','di ba i di dv','ディバイディド','ディバイディド');
-INSERT INTO "hand_mapping" VALUES ('DIVIDEND','d ˈɪ v ɪ d ˌɛ n d','di bi de - nv dv','ディビデーンド','ディビデーンド');
-INSERT INTO "hand_mapping" VALUES ('DIVIDENDS','d ˈɪ v ɪ d ˌɛ n d z','di bi de - nv zv','ディビデーンズ','ディビデーンズ');
-INSERT INTO "hand_mapping" VALUES ('DIVINE','d ɪ v ˈaɪ n','di ba i nv','ディバイン','ディバイン');
-INSERT INTO "hand_mapping" VALUES ('DIVING','d ˈaɪ v ɪ ŋ','da i bi Nv','ダイビン','ダイビング');
-INSERT INTO "hand_mapping" VALUES ('DIVISION','d ɪ v ˈɪ ʒ ə n','di bi jya nv','ディビジャン','ディビジョン');
-INSERT INTO "hand_mapping" VALUES ('DIVISIONS','d ɪ v ˈɪ ʒ ə n z','di bi jya nv zv','ディビジャンズ','ディビジャンズ');
-INSERT INTO "hand_mapping" VALUES ('DIVORCE','d ɪ v ˈɔː s','di bo - sv','ディボース','ディボース');
-INSERT INTO "hand_mapping" VALUES ('DIVORCED','d ɪ v ˈɔː s t','di bo - sv tv','ディボースト','ディボースト');
+INSERT INTO "hand_mapping" VALUES ('DIV','d ˈɪ v','di Vv','ディブ','ディブ');
+INSERT INTO "hand_mapping" VALUES ('DIVE','d ˈaɪ v','da i Vv','ダイブ','ダイブ');
+INSERT INTO "hand_mapping" VALUES ('DIVED','d ˈaɪ v d','da i Vv dv','ダイブド','ダイブド');
+INSERT INTO "hand_mapping" VALUES ('DIVER','d ˈaɪ v ə','da i Va','ダイバ','ダイバ');
+INSERT INTO "hand_mapping" VALUES ('DIVERSE(1)','d aɪ v ˈɜː s','da i Ve - sv','ダイベース','ダイベース');
+INSERT INTO "hand_mapping" VALUES ('DIVERSE(2)','d ˈaɪ v ɜː s','da i Ve - sv','ダイベース','ダイベース');
+INSERT INTO "hand_mapping" VALUES ('DIVERSITY','d aɪ v ˈɜː s ɪ t i','da i Ve - si ti -','ダイベーシティー','ダイベーシティー');
+INSERT INTO "hand_mapping" VALUES ('DIVERT','d ˈaɪ v ɜː t','da i Ve - tv','ダイベート','ダイベート');
+INSERT INTO "hand_mapping" VALUES ('DIVIDE','d ɪ v ˈaɪ d','di Va i dv','ディバイド','ディバイド');
+INSERT INTO "hand_mapping" VALUES ('DIVIDED','d ɪ v ˈaɪ d ɪ d','di Va i di dv','ディバイディド','ディバイディド');
+INSERT INTO "hand_mapping" VALUES ('DIVIDEND','d ˈɪ v ɪ d ˌɛ n d','di Vi de - nv dv','ディビデーンド','ディビデーンド');
+INSERT INTO "hand_mapping" VALUES ('DIVIDENDS','d ˈɪ v ɪ d ˌɛ n d z','di Vi de - nv zv','ディビデーンズ','ディビデーンズ');
+INSERT INTO "hand_mapping" VALUES ('DIVINE','d ɪ v ˈaɪ n','di Va i nv','ディバイン','ディバイン');
+INSERT INTO "hand_mapping" VALUES ('DIVING','d ˈaɪ v ɪ ŋ','da i Vi Nv','ダイビン','ダイビング');
+INSERT INTO "hand_mapping" VALUES ('DIVISION','d ɪ v ˈɪ ʒ ə n','di Vi jya nv','ディビジャン','ディビジョン');
+INSERT INTO "hand_mapping" VALUES ('DIVISIONS','d ɪ v ˈɪ ʒ ə n z','di Vi jya nv zv','ディビジャンズ','ディビジャンズ');
+INSERT INTO "hand_mapping" VALUES ('DIVORCE','d ɪ v ˈɔː s','di Vo - sv','ディボース','ディボース');
+INSERT INTO "hand_mapping" VALUES ('DIVORCED','d ɪ v ˈɔː s t','di Vo - sv tv','ディボースト','ディボースト');
 INSERT INTO "hand_mapping" VALUES ('DIZZY','d ˈɪ z i','di zi -','ディジー','ディジー');
 INSERT INTO "hand_mapping" VALUES ('DO','d ˈuː','du -','ドゥー','ドゥー');
 INSERT INTO "hand_mapping" VALUES ('DOC','d ˈɒ k','do x kv','ドック','ドック');
@@ -4818,8 +4818,8 @@ INSERT INTO "hand_mapping" VALUES ('DOUGHTY','d ˈaʊ t i','da u ti -','ダウ
 INSERT INTO "hand_mapping" VALUES ('DOUGLAS','d ˈɐ g l ə s','da gv ra sv','ダグラス','ダグラス');
 INSERT INTO "hand_mapping" VALUES ('DOUR(1)','d ˈaʊ ə','da u a','ダウア','ダウア');
 INSERT INTO "hand_mapping" VALUES ('DOUR(2)','d ˈʊə','du a','ドゥア','ドゥア');
-INSERT INTO "hand_mapping" VALUES ('DOVE','d ˈɐ v','da bv','ダブ','ダブ');
-INSERT INTO "hand_mapping" VALUES ('DOVER','d ˈəʊ v ə','do - ba','ドーバ','ドーバ');
+INSERT INTO "hand_mapping" VALUES ('DOVE','d ˈɐ v','da Vv','ダブ','ダブ');
+INSERT INTO "hand_mapping" VALUES ('DOVER','d ˈəʊ v ə','do - Va','ドーバ','ドーバ');
 INSERT INTO "hand_mapping" VALUES ('DOWN','d ˈaʊ n','da u nv','ダウン','ダウン');
 INSERT INTO "hand_mapping" VALUES ('DOWNLOAD','d ˈaʊ n l ˌəʊ d','da u nv ro dv','ダウンロド','ダウンロド');
 INSERT INTO "hand_mapping" VALUES ('DOWNLOADABLE','d ˈaʊ n l ˌəʊ d ɪ b ə l','da u nv ro di ba rv','ダウンロディバル','ダウンロディバル');
@@ -4881,12 +4881,12 @@ INSERT INTO "hand_mapping" VALUES ('DRINK','d ɹ ˈɪ ŋ k','dv ri Nv kv','ド
 INSERT INTO "hand_mapping" VALUES ('DRINKING','d ɹ ˈɪ ŋ k ɪ ŋ','dv ri Nv ki Nv','ドリンキン','ドリンキング');
 INSERT INTO "hand_mapping" VALUES ('DRINKS','d ɹ ˈɪ ŋ k s','dv ri Nv kv sv','ドリンクス','ドリンクス');
 INSERT INTO "hand_mapping" VALUES ('DRIP','d ɹ ˈɪ p','dv ri pv','ドリプ','ドリプ');
-INSERT INTO "hand_mapping" VALUES ('DRIVE','d ɹ ˈaɪ v','dv ra i bv','ドライブ','ドライブ');
-INSERT INTO "hand_mapping" VALUES ('DRIVEN','d ɹ ˈɪ v ə n','dv ri ba nv','ドリバン','ドリバン');
-INSERT INTO "hand_mapping" VALUES ('DRIVER','d ɹ ˈaɪ v ə','dv ra i ba','ドライバ','ドライバ');
-INSERT INTO "hand_mapping" VALUES ('DRIVERS','d ɹ ˈaɪ v ə z','dv ra i ba zv','ドライバズ','ドライバズ');
-INSERT INTO "hand_mapping" VALUES ('DRIVES','d ɹ ˈaɪ v z','dv ra i bv zv','ドライブズ','ドライブズ');
-INSERT INTO "hand_mapping" VALUES ('DRIVING','d ɹ ˈaɪ v ɪ ŋ','dv ra i bi Nv','ドライビン','ドライビング');
+INSERT INTO "hand_mapping" VALUES ('DRIVE','d ɹ ˈaɪ v','dv ra i Vv','ドライブ','ドライブ');
+INSERT INTO "hand_mapping" VALUES ('DRIVEN','d ɹ ˈɪ v ə n','dv ri Va nv','ドリバン','ドリバン');
+INSERT INTO "hand_mapping" VALUES ('DRIVER','d ɹ ˈaɪ v ə','dv ra i Va','ドライバ','ドライバ');
+INSERT INTO "hand_mapping" VALUES ('DRIVERS','d ɹ ˈaɪ v ə z','dv ra i Va zv','ドライバズ','ドライバズ');
+INSERT INTO "hand_mapping" VALUES ('DRIVES','d ɹ ˈaɪ v z','dv ra i Vv zv','ドライブズ','ドライブズ');
+INSERT INTO "hand_mapping" VALUES ('DRIVING','d ɹ ˈaɪ v ɪ ŋ','dv ra i Vi Nv','ドライビン','ドライビング');
 INSERT INTO "hand_mapping" VALUES ('DRONE','d ɹ ˈəʊ n','dv ro - nv','ドローン','ドローン');
 INSERT INTO "hand_mapping" VALUES ('DROOL','d ɹ ˈuː l','dv ru - rv','ドルール','ドルール');
 INSERT INTO "hand_mapping" VALUES ('DROOP','d ɹ ˈuː p','dv ru - pv','ドループ','ドループ');
@@ -4895,7 +4895,7 @@ INSERT INTO "hand_mapping" VALUES ('DROPPED','d ɹ ˈɒ p t','dv ro x pv tv','
 INSERT INTO "hand_mapping" VALUES ('DROPPING','d ɹ ˈɒ p ɪ ŋ','dv ro x pi Nv','ドロッピン','ドロッピング');
 INSERT INTO "hand_mapping" VALUES ('DROPS','d ɹ ˈɒ p s','dv ro x pv sv','ドロップス','ドロップス');
 INSERT INTO "hand_mapping" VALUES ('DROUGHT','d ɹ ˈaʊ t','dv ra u tv','ドラウト','ドラウト');
-INSERT INTO "hand_mapping" VALUES ('DROVE','d ɹ ˈəʊ v','dv ro - bv','ドローブ','ドローブ');
+INSERT INTO "hand_mapping" VALUES ('DROVE','d ɹ ˈəʊ v','dv ro - Vv','ドローブ','ドローブ');
 INSERT INTO "hand_mapping" VALUES ('DROWN','d ɹ ˈaʊ n','dv ra u nv','ドラウン','ドラウン');
 INSERT INTO "hand_mapping" VALUES ('DROWNED','d ɹ ˈaʊ n d','dv ra u nv dv','ドラウンド','ドラウンド');
 INSERT INTO "hand_mapping" VALUES ('DRUG','d ɹ ˈɐ g','dv ra gv','ドラグ','ドラグ');
@@ -4954,10 +4954,10 @@ INSERT INTO "hand_mapping" VALUES ('DUSTY','d ˈɐ s t i','da sv ti -','ダス
 INSERT INTO "hand_mapping" VALUES ('DUTCH','d ˈɐ tʃ','da tyv','ダチュ','ダチュ');
 INSERT INTO "hand_mapping" VALUES ('DUTIES','d j ˈuː t i z','dyu - ti - zv','デューティーズ','デューティーズ');
 INSERT INTO "hand_mapping" VALUES ('DUTY','d j ˈuː t i','dyu - ti -','デューティー','デューティー');
-INSERT INTO "hand_mapping" VALUES ('DUVET','d ˈuː v eɪ','du - be i','ドゥーベイ','ドゥーベイ');
+INSERT INTO "hand_mapping" VALUES ('DUVET','d ˈuː v eɪ','du - Ve i','ドゥーベイ','ドゥーベイ');
 INSERT INTO "hand_mapping" VALUES ('DWARF','d w ˈɔː f','dv wo - fv','ドウォーフ','ドウォーフ');
 INSERT INTO "hand_mapping" VALUES ('DWARFS','d w ˈɔː f s','dv wo - fv sv','ドウォーフス','ドウォーフス');
-INSERT INTO "hand_mapping" VALUES ('DWARVES','d w ˈɔː v z','dv wo - bv zv','ドウォーブズ','ドウォーブズ');
+INSERT INTO "hand_mapping" VALUES ('DWARVES','d w ˈɔː v z','dv wo - Vv zv','ドウォーブズ','ドウォーブズ');
 INSERT INTO "hand_mapping" VALUES ('DWELL','d w ˈɛ l','dv we rv','ドウェル','ドウェル');
 INSERT INTO "hand_mapping" VALUES ('DWELLED','d w ˈɛ l d','dv we rv dv','ドウェルド','ドウェルド');
 INSERT INTO "hand_mapping" VALUES ('DWELLING','d w ˈɛ l ɪ ŋ','dv we ri Nv','ドウェリン','ドウェリング');
@@ -5009,9 +5009,9 @@ INSERT INTO "hand_mapping" VALUES ('EAT','ˈiː t','i - tv','イート','イー
 INSERT INTO "hand_mapping" VALUES ('EATEN','ˈiː t ə n','i - ta nv','イータン','イータン');
 INSERT INTO "hand_mapping" VALUES ('EATING','ˈiː t ɪ ŋ','i - ti Nv','イーティン','イーティング');
 INSERT INTO "hand_mapping" VALUES ('EATS','ˈiː t s','i - tsv','イーツ','イーツ');
-INSERT INTO "hand_mapping" VALUES ('EAVE','ˈiː v','i - bv','イーブ','イーブ');
-INSERT INTO "hand_mapping" VALUES ('EAVES','ˈiː v z','i - bv zv','イーブズ','イーブズ');
-INSERT INTO "hand_mapping" VALUES ('EAVESDROP','ˈiː v z d ɹ ˌɒ p','i - bv zv dv ro - pv','イーブズドロープ','イーブズドロープ');
+INSERT INTO "hand_mapping" VALUES ('EAVE','ˈiː v','i - Vv','イーブ','イーブ');
+INSERT INTO "hand_mapping" VALUES ('EAVES','ˈiː v z','i - Vv zv','イーブズ','イーブズ');
+INSERT INTO "hand_mapping" VALUES ('EAVESDROP','ˈiː v z d ɹ ˌɒ p','i - Vv zv dv ro - pv','イーブズドロープ','イーブズドロープ');
 INSERT INTO "hand_mapping" VALUES ('EBAY','ˈiː b ˌeɪ','i - be i','イーベイ','イーベイ');
 INSERT INTO "hand_mapping" VALUES ('EBB','ˈɛ b','e bv','エブ','エブ');
 INSERT INTO "hand_mapping" VALUES ('EBONY','ˈɛ b ə n i','e ba ni -','エバニー','エバニー');
@@ -5070,9 +5070,9 @@ INSERT INTO "hand_mapping" VALUES ('EDWARDS','ˈɛ d w ə d z','e dv wa zv','エ
 INSERT INTO "hand_mapping" VALUES ('EERIE','ˈɪə ɹ i','i a ri -','イアリー','イアリー');
 INSERT INTO "hand_mapping" VALUES ('EF','ˈɛ f','e fv','エフ','エフ');
 INSERT INTO "hand_mapping" VALUES ('EFFECT','ɪ f ˈɛ k t','i fe kv tv','イフェクト','イフェクト');
-INSERT INTO "hand_mapping" VALUES ('EFFECTIVE','ɪ f ˈɛ k t ɪ v','i fe kv ti bv','イフェクティブ','イフェクティブ');
-INSERT INTO "hand_mapping" VALUES ('EFFECTIVELY','ɪ f ˈɛ k t ɪ v l i','i fe kv ti bv ri -','イフェクティブリー','イフェクティブリー');
-INSERT INTO "hand_mapping" VALUES ('EFFECTIVENESS','ɪ f ˈɛ k t ɪ v n ɪ s','i fe kv ti bv ni sv','イフェクティブニス','イフェクティブニス');
+INSERT INTO "hand_mapping" VALUES ('EFFECTIVE','ɪ f ˈɛ k t ɪ v','i fe kv ti Vv','イフェクティブ','イフェクティブ');
+INSERT INTO "hand_mapping" VALUES ('EFFECTIVELY','ɪ f ˈɛ k t ɪ v l i','i fe kv ti Vv ri -','イフェクティブリー','イフェクティブリー');
+INSERT INTO "hand_mapping" VALUES ('EFFECTIVENESS','ɪ f ˈɛ k t ɪ v n ɪ s','i fe kv ti Vv ni sv','イフェクティブニス','イフェクティブニス');
 INSERT INTO "hand_mapping" VALUES ('EFFECTS','ɪ f ˈɛ k t s','i fe kv tsv','イフェクツ','イフェクツ');
 INSERT INTO "hand_mapping" VALUES ('EFFED','ˈɛ f t','e fv tv','エフト','エフト');
 INSERT INTO "hand_mapping" VALUES ('EFFICIENCY','ɪ f ˈɪ ʃ ə n s i','i fi sya nv si -','イフィシャンシー','イフィシャンシー');
@@ -5136,12 +5136,12 @@ INSERT INTO "hand_mapping" VALUES ('ELEMENTARY(1)','ˌɛ l ɪ m ˈɛ n t ə ɹ i
 INSERT INTO "hand_mapping" VALUES ('ELEMENTARY(2)','ˌɛ l ɪ m ˈɛ n t ɹ i','e - ri me nv tv ri -','エーリメントリー','エーリメントリー');
 INSERT INTO "hand_mapping" VALUES ('ELEMENTS','ˈɛ l ɪ m ə n t s','e ri ma nv tsv','エリマンツ','エリマンツ');
 INSERT INTO "hand_mapping" VALUES ('ELEPHANT','ˈɛ l ɪ f ə n t','e ri fa nv tv','エリファント','エリファント');
-INSERT INTO "hand_mapping" VALUES ('ELEVATE','ˈɛ l ɪ v ˌeɪ t','e ri be i tv','エリベイト','エリベイト');
-INSERT INTO "hand_mapping" VALUES ('ELEVATION','ˌɛ l ɪ v ˈeɪ ʃ ə n','e - ri be i sya nv','エーリベイシャン','エーリベイション');
-INSERT INTO "hand_mapping" VALUES ('ELEVATOR','ˈɛ l ɪ v ˌeɪ t ə','e ri be i ta','エリベイタ','エリベイタ');
-INSERT INTO "hand_mapping" VALUES ('ELEVEN','ɪ l ˈɛ v ə n','i re ba nv','イレバン','イレバン');
-INSERT INTO "hand_mapping" VALUES ('ELEVENSES','ɪ l ˈɛ v ə n z ɪ z','i re ba nv zi zv','イレバンジズ','イレバンジズ');
-INSERT INTO "hand_mapping" VALUES ('ELEVENTH','ɪ l ˈɛ v ə n θ','i re ba nv sv','イレバンス','イレバンス');
+INSERT INTO "hand_mapping" VALUES ('ELEVATE','ˈɛ l ɪ v ˌeɪ t','e ri Ve i tv','エリベイト','エリベイト');
+INSERT INTO "hand_mapping" VALUES ('ELEVATION','ˌɛ l ɪ v ˈeɪ ʃ ə n','e - ri Ve i sya nv','エーリベイシャン','エーリベイション');
+INSERT INTO "hand_mapping" VALUES ('ELEVATOR','ˈɛ l ɪ v ˌeɪ t ə','e ri Ve i ta','エリベイタ','エリベイタ');
+INSERT INTO "hand_mapping" VALUES ('ELEVEN','ɪ l ˈɛ v ə n','i re Va nv','イレバン','イレバン');
+INSERT INTO "hand_mapping" VALUES ('ELEVENSES','ɪ l ˈɛ v ə n z ɪ z','i re Va nv zi zv','イレバンジズ','イレバンジズ');
+INSERT INTO "hand_mapping" VALUES ('ELEVENTH','ɪ l ˈɛ v ə n θ','i re Va nv sv','イレバンス','イレバンス');
 INSERT INTO "hand_mapping" VALUES ('ELF','ˈɛ l f','e rv fv','エルフ','エルフ');
 INSERT INTO "hand_mapping" VALUES ('ELFS','ˈɛ l f s','e rv fv sv','エルフス','エルフス');
 INSERT INTO "hand_mapping" VALUES ('ELIGIBILITY','ˌɛ l ɪ dʒ ɪ b ˈɪ l ɪ t i','e - ri jyi bi ri ti -','エーリジィビリティー','エーリジィビリティー');
@@ -5164,8 +5164,8 @@ INSERT INTO "hand_mapping" VALUES ('ELS','ˈɛ l z','e rv zv','エルズ','エ
 INSERT INTO "hand_mapping" VALUES ('ELSE','ˈɛ l s','e rv sv','エルス','エルス');
 INSERT INTO "hand_mapping" VALUES ('ELSEWHERE','ˈɛ l s w ˌɛə','e rv swe a -','エルスェアー','エルスェアー');
 INSERT INTO "hand_mapping" VALUES ('ELUDE','ɪ l ˈuː d','i ru - dv','イルード','イルード');
-INSERT INTO "hand_mapping" VALUES ('ELVES','ˈɛ l v z','e rv bv zv','エルブズ','エルブズ');
-INSERT INTO "hand_mapping" VALUES ('ELVIS','ˈɛ l v ɪ s','e rv bi sv','エルビス','エルビス');
+INSERT INTO "hand_mapping" VALUES ('ELVES','ˈɛ l v z','e rv Vv zv','エルブズ','エルブズ');
+INSERT INTO "hand_mapping" VALUES ('ELVIS','ˈɛ l v ɪ s','e rv Vi sv','エルビス','エルビス');
 INSERT INTO "hand_mapping" VALUES ('ELY','ˈiː l i','i - ri -','イーリー','イーリー');
 INSERT INTO "hand_mapping" VALUES ('EM','ˈɛ m','e mv','エム','エム');
 INSERT INTO "hand_mapping" VALUES ('EMAIL','ˈiː m eɪ l','i - me i rv','イーメイル','イーメイル');
@@ -5264,7 +5264,7 @@ INSERT INTO "hand_mapping" VALUES ('ENCYCLOPEDIA(4)','ɪ n s ˌaɪ k l ə p ˈi
 INSERT INTO "hand_mapping" VALUES ('END','ˈɛ n d','e nv dv','エンド','エンド');
 INSERT INTO "hand_mapping" VALUES ('ENDANGERED(1)','ɛ n d ˈeɪ n dʒ ə d','e nv de i nv jya dv','エンデインジャド','エンデインジャド');
 INSERT INTO "hand_mapping" VALUES ('ENDANGERED(2)','ɪ n d ˈeɪ n dʒ ə d','i nv de i nv jya dv','インデインジャド','インデインジャド');
-INSERT INTO "hand_mapping" VALUES ('ENDEAVOUR','ɪ n d ˈɛ v ə','i nv de ba','インデバ','インデバ');
+INSERT INTO "hand_mapping" VALUES ('ENDEAVOUR','ɪ n d ˈɛ v ə','i nv de Va','インデバ','インデバ');
 INSERT INTO "hand_mapping" VALUES ('ENDED','ˈɛ n d ɪ d','e nv di dv','エンディド','エンディド');
 INSERT INTO "hand_mapping" VALUES ('ENDING','ˈɛ n d ɪ ŋ','e nv di Nv','エンディン','エンディング');
 INSERT INTO "hand_mapping" VALUES ('ENDLESS','ˈɛ n d l ɪ s','e nv dv ri sv','エンドリス','エンドリス');
@@ -5368,15 +5368,15 @@ INSERT INTO "hand_mapping" VALUES ('ENTREPRENEUR','ˌɒ n t ɹ ə p ɹ ə n ˈɜ
 INSERT INTO "hand_mapping" VALUES ('ENTREPRENEURS','ˌɒ n t ɹ ə p ɹ ə n ˈɜː z','o nv tv ra pv ra ne - zv','オントラプラネーズ','オントラプラネーズ');
 INSERT INTO "hand_mapping" VALUES ('ENTRIES','ˈɛ n t ɹ i z','e nv tv ri - zv','エントリーズ','エントリーズ');
 INSERT INTO "hand_mapping" VALUES ('ENTRY','ˈɛ n t ɹ i','e nv tv ri -','エントリー','エントリー');
-INSERT INTO "hand_mapping" VALUES ('ENVELOPE','ˈɛ n v ə l ˌəʊ p','e nv ba ro pv','エンバロプ','エンバロプ');
-INSERT INTO "hand_mapping" VALUES ('ENVELOPES','ˈɛ n v ə l ˌəʊ p s','e nv ba ro pv sv','エンバロプス','エンバロプス');
-INSERT INTO "hand_mapping" VALUES ('ENVIRONMENT','ɪ n v ˈaɪ ɹ ə n m ə n t','i nv ba i ra nv ma nv tv','インバイランマント','インバイランメント');
-INSERT INTO "hand_mapping" VALUES ('ENVIRONMENTAL','ɪ n v ˌaɪ ɹ ə n m ˈɛ n t ə l','i nv ba i ra nv me nv ta rv','インバイランメンタル','インバイランメンタル');
-INSERT INTO "hand_mapping" VALUES ('ENVIRONMENTS','ɪ n v ˈaɪ ɹ ə n m ə n t s','i nv ba i ra nv ma nv tsv','インバイランマンツ','インバイランマンツ');
-INSERT INTO "hand_mapping" VALUES ('ENVISAGE','ɪ n v ˈɪ z ɪ dʒ','i nv bi zi jyv','インビジジュ','インビジジュ');
-INSERT INTO "hand_mapping" VALUES ('ENVISAGED','ɪ n v ˈɪ z ɪ dʒ d','i nv bi zi jyv dv','インビジジュド','インビジジュド');
-INSERT INTO "hand_mapping" VALUES ('ENVOY','ˈɛ n v ɔɪ','e nv bo i','エンボイ','エンボイ');
-INSERT INTO "hand_mapping" VALUES ('ENVY','ˈɛ n v i','e nv bi -','エンビー','エンビー');
+INSERT INTO "hand_mapping" VALUES ('ENVELOPE','ˈɛ n v ə l ˌəʊ p','e nv Va ro pv','エンバロプ','エンバロプ');
+INSERT INTO "hand_mapping" VALUES ('ENVELOPES','ˈɛ n v ə l ˌəʊ p s','e nv Va ro pv sv','エンバロプス','エンバロプス');
+INSERT INTO "hand_mapping" VALUES ('ENVIRONMENT','ɪ n v ˈaɪ ɹ ə n m ə n t','i nv Va i ra nv ma nv tv','インバイランマント','インバイランメント');
+INSERT INTO "hand_mapping" VALUES ('ENVIRONMENTAL','ɪ n v ˌaɪ ɹ ə n m ˈɛ n t ə l','i nv Va i ra nv me nv ta rv','インバイランメンタル','インバイランメンタル');
+INSERT INTO "hand_mapping" VALUES ('ENVIRONMENTS','ɪ n v ˈaɪ ɹ ə n m ə n t s','i nv Va i ra nv ma nv tsv','インバイランマンツ','インバイランマンツ');
+INSERT INTO "hand_mapping" VALUES ('ENVISAGE','ɪ n v ˈɪ z ɪ dʒ','i nv Vi zi jyv','インビジジュ','インビジジュ');
+INSERT INTO "hand_mapping" VALUES ('ENVISAGED','ɪ n v ˈɪ z ɪ dʒ d','i nv Vi zi jyv dv','インビジジュド','インビジジュド');
+INSERT INTO "hand_mapping" VALUES ('ENVOY','ˈɛ n v ɔɪ','e nv Vo i','エンボイ','エンボイ');
+INSERT INTO "hand_mapping" VALUES ('ENVY','ˈɛ n v i','e nv Vi -','エンビー','エンビー');
 INSERT INTO "hand_mapping" VALUES ('ENZYME','ˈɛ n z ˌaɪ m','e nv za i mv','エンザイム','エンザイム');
 INSERT INTO "hand_mapping" VALUES ('EPIC','ˈɛ p ɪ k','e pi kv','エピク','エピク');
 INSERT INTO "hand_mapping" VALUES ('EPIDEMIC','ɛ p ɪ d ˈɛ m ɪ k','e pi de mi kv','エピデミク','エピデミク');
@@ -5396,8 +5396,8 @@ INSERT INTO "hand_mapping" VALUES ('EQUIP','ɪ k w ˈɪ p','i kwi pv','イクィ
 INSERT INTO "hand_mapping" VALUES ('EQUIPMENT','ɪ k w ˈɪ p m ə n t','i kwi pv ma nv tv','イクィプマント','イクィプメント');
 INSERT INTO "hand_mapping" VALUES ('EQUIPPED','ɪ k w ˈɪ p t','i kwi pv tv','イクィプト','イクィプト');
 INSERT INTO "hand_mapping" VALUES ('EQUITY','ˈɛ k w ɪ t i','e kwi ti -','エクィティー','エクィティー');
-INSERT INTO "hand_mapping" VALUES ('EQUIVALENCE','ɪ k w ˈɪ v ə l ə n s','i kwi ba ra nv sv','イクィバランス','イクィバランス');
-INSERT INTO "hand_mapping" VALUES ('EQUIVALENT','ɪ k w ˈɪ v ə l ə n t','i kwi ba ra nv tv','イクィバラント','イクィバラント');
+INSERT INTO "hand_mapping" VALUES ('EQUIVALENCE','ɪ k w ˈɪ v ə l ə n s','i kwi Va ra nv sv','イクィバランス','イクィバランス');
+INSERT INTO "hand_mapping" VALUES ('EQUIVALENT','ɪ k w ˈɪ v ə l ə n t','i kwi Va ra nv tv','イクィバラント','イクィバラント');
 INSERT INTO "hand_mapping" VALUES ('ERA','ˈɪə ɹ ə','i a ra','イアラ','イアラ');
 INSERT INTO "hand_mapping" VALUES ('ERASE','ɪ ɹ ˈeɪ z','i re i zv','イレイズ','イレイズ');
 INSERT INTO "hand_mapping" VALUES ('ERECT','ɪ ɹ ˈɛ k t','i re kv tv','イレクト','イレクト');
@@ -5469,48 +5469,48 @@ INSERT INTO "hand_mapping" VALUES ('EURO','j ˈʊə ɹ əʊ','yu a ro','ユア
 INSERT INTO "hand_mapping" VALUES ('EUROPE','j ˈʊə ɹ ə p','yu a ra pv','ユアラプ','ユアラプ');
 INSERT INTO "hand_mapping" VALUES ('EUROPEAN','j ˌʊə ɹ ə p ˈiː ə n','yu a ra pi - a nv','ユアラピーアン','ユアラピーアン');
 INSERT INTO "hand_mapping" VALUES ('EUROS','j ˈʊə ɹ əʊ z','yu a ro zv','ユアロズ','ユアロズ');
-INSERT INTO "hand_mapping" VALUES ('EVA','ˈiː v ə','i - ba','イーバ','イーバ');
-INSERT INTO "hand_mapping" VALUES ('EVADE','ɪ v ˈeɪ d','i be i dv','イベイド','イベイド');
-INSERT INTO "hand_mapping" VALUES ('EVALUATE','ɪ v ˈæ l j ʊ ˌeɪ t','i ba ryu e i tv','イバリュエイト','イバリュエイト');
-INSERT INTO "hand_mapping" VALUES ('EVALUATED','ɪ v ˈæ l j ʊ ˌeɪ t ɪ d','i ba ryu e i ti dv','イバリュエイティド','イバリュエイティド');
-INSERT INTO "hand_mapping" VALUES ('EVALUATING','ɪ v ˈæ l j ʊ ˌeɪ t ɪ ŋ','i ba ryu e i ti Nv','イバリュエイティン','イバリュエイティング');
-INSERT INTO "hand_mapping" VALUES ('EVALUATION','ɪ v ˌæ l j ʊ ˈeɪ ʃ ə n','i ba ryu e i sya nv','イバリュエイシャン','イバリュエイション');
-INSERT INTO "hand_mapping" VALUES ('EVALUATIONS','ɪ v ˌæ l j ʊ ˈeɪ ʃ ə n z','i ba ryu e i sya nv zv','イバリュエイシャンズ','イバリュエイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('EVANESCENCE','ˌɛ v ə n ˈɛ s ə n s','e - ba ne sa nv sv','エーバネサンス','エーバネサンス');
-INSERT INTO "hand_mapping" VALUES ('EVANS','ˈɛ v ə n z','e ba nv zv','エバンズ','エバンズ');
-INSERT INTO "hand_mapping" VALUES ('EVE','ˈiː v','i - bv','イーブ','イーブ');
-INSERT INTO "hand_mapping" VALUES ('EVELYN(1)','ˈiː v ə l ɪ n','i - ba ri nv','イーバリン','イーバリン');
-INSERT INTO "hand_mapping" VALUES ('EVELYN(2)','ˈɛ v ə l ɪ n','e ba ri nv','エバリン','エバリン');
-INSERT INTO "hand_mapping" VALUES ('EVEN','ˈiː v ə n','i - ba nv','イーバン','イーバン');
-INSERT INTO "hand_mapping" VALUES ('EVENING','ˈiː v n ɪ ŋ','i - bv ni Nv','イーブニン','イーブニング');
-INSERT INTO "hand_mapping" VALUES ('EVENINGS','ˈiː v n ɪ ŋ z','i - bv ni Nv zv','イーブニンズ','イーブニンズ');
-INSERT INTO "hand_mapping" VALUES ('EVENLY','ˈiː v ə n l i','i - ba nv ri -','イーバンリー','イーバンリー');
-INSERT INTO "hand_mapping" VALUES ('EVENT','ɪ v ˈɛ n t','i be nv tv','イベント','イベント');
-INSERT INTO "hand_mapping" VALUES ('EVENTS','ɪ v ˈɛ n t s','i be nv tsv','イベンツ','イベンツ');
-INSERT INTO "hand_mapping" VALUES ('EVENTUAL','ɪ v ˈɛ n tʃ ʊə l','i be nv tyu a rv','イベンチュアル','イベンチュアル');
-INSERT INTO "hand_mapping" VALUES ('EVENTUALLY','ɪ v ˈɛ n tʃ ʊə l i','i be nv tyu a ri -','イベンチュアリー','イベンチュアリー');
-INSERT INTO "hand_mapping" VALUES ('EVER','ˈɛ v ə','e ba','エバ','エバ');
-INSERT INTO "hand_mapping" VALUES ('EVERY(1)','ˈɛ v ɹ i','e bv ri -','エブリー','エブリー');
-INSERT INTO "hand_mapping" VALUES ('EVERY(2)','ˈɛ v ə ɹ i','e ba ri -','エバリー','エバリー');
-INSERT INTO "hand_mapping" VALUES ('EVERYBODY','ˈɛ v ɹ ɪ b ˌɒ d i','e bv ri bo di -','エブリボディー','エブリボディー');
-INSERT INTO "hand_mapping" VALUES ('EVERYDAY(1)','ˌɛ v ɹ ɪ d ˈeɪ','e - bv ri de i','エーブリデイ','エーブリデイ');
-INSERT INTO "hand_mapping" VALUES ('EVERYDAY(2)','ˈɛ v ɹ ɪ d ˌeɪ','e bv ri de i','エブリデイ','エブリデイ');
-INSERT INTO "hand_mapping" VALUES ('EVERYONE','ˈɛ v ɹ ɪ w ˌɐ n','e bv ri wa nv','エブリワン','エブリワン');
-INSERT INTO "hand_mapping" VALUES ('EVERYTHING','ˈɛ v ɹ ɪ θ ˌɪ ŋ','e bv ri si - Nv','エブリシーン','エブリシーング');
-INSERT INTO "hand_mapping" VALUES ('EVERYWHERE','ˈɛ v ɹ ɪ w ˌɛə','e bv ri we a -','エブリウェアー','エブリウェアー');
-INSERT INTO "hand_mapping" VALUES ('EVICT','ɪ v ˈɪ k t','i bi kv tv','イビクト','イビクト');
-INSERT INTO "hand_mapping" VALUES ('EVIDENCE','ˈɛ v ɪ d ə n s','e bi da nv sv','エビダンス','エビダンス');
-INSERT INTO "hand_mapping" VALUES ('EVIDENT','ˈɛ v ɪ d ə n t','e bi da nv tv','エビダント','エビダント');
-INSERT INTO "hand_mapping" VALUES ('EVIDENTLY','ˈɛ v ɪ d ə n t l i','e bi da nv tv ri -','エビダントリー','エビダントリー');
-INSERT INTO "hand_mapping" VALUES ('EVIL','ˈiː v ə l','i - ba rv','イーバル','イーバル');
-INSERT INTO "hand_mapping" VALUES ('EVOKE','ɪ v ˈəʊ k','i bo - kv','イボーク','イボーク');
-INSERT INTO "hand_mapping" VALUES ('EVOLUTION(1)','ˌiː v ə l ˈuː ʃ ə n','i - ba ru - sya nv','イーバルーシャン','イーバルーション');
-INSERT INTO "hand_mapping" VALUES ('EVOLUTION(2)','ˌɛ v ə l ˈuː ʃ ə n','e - ba ru - sya nv','エーバルーシャン','エーバルーション');
-INSERT INTO "hand_mapping" VALUES ('EVOLUTIONARY(1)','ˌɛ v ə l ˈuː ʃ ə n ə ɹ i','e - ba ru - sya na ri -','エーバルーシャナリー','エーバルーシャナリー');
-INSERT INTO "hand_mapping" VALUES ('EVOLUTIONARY(2)','ˌiː v ə l ˈuː ʃ ə n ə ɹ i','i - ba ru - sya na ri -','イーバルーシャナリー','イーバルーシャナリー');
-INSERT INTO "hand_mapping" VALUES ('EVOLVE','ɪ v ˈɒ l v','i bo rv bv','イボルブ','イボルブ');
-INSERT INTO "hand_mapping" VALUES ('EVOLVED','ɪ v ˈɒ l v d','i bo rv bv dv','イボルブド','イボルブド');
-INSERT INTO "hand_mapping" VALUES ('EVOLVES','ɪ v ˈɒ l v z','i bo rv bv zv','イボルブズ','イボルブズ');
+INSERT INTO "hand_mapping" VALUES ('EVA','ˈiː v ə','i - Va','イーバ','イーバ');
+INSERT INTO "hand_mapping" VALUES ('EVADE','ɪ v ˈeɪ d','i Ve i dv','イベイド','イベイド');
+INSERT INTO "hand_mapping" VALUES ('EVALUATE','ɪ v ˈæ l j ʊ ˌeɪ t','i Va ryu e i tv','イバリュエイト','イバリュエイト');
+INSERT INTO "hand_mapping" VALUES ('EVALUATED','ɪ v ˈæ l j ʊ ˌeɪ t ɪ d','i Va ryu e i ti dv','イバリュエイティド','イバリュエイティド');
+INSERT INTO "hand_mapping" VALUES ('EVALUATING','ɪ v ˈæ l j ʊ ˌeɪ t ɪ ŋ','i Va ryu e i ti Nv','イバリュエイティン','イバリュエイティング');
+INSERT INTO "hand_mapping" VALUES ('EVALUATION','ɪ v ˌæ l j ʊ ˈeɪ ʃ ə n','i Va ryu e i sya nv','イバリュエイシャン','イバリュエイション');
+INSERT INTO "hand_mapping" VALUES ('EVALUATIONS','ɪ v ˌæ l j ʊ ˈeɪ ʃ ə n z','i Va ryu e i sya nv zv','イバリュエイシャンズ','イバリュエイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('EVANESCENCE','ˌɛ v ə n ˈɛ s ə n s','e - Va ne sa nv sv','エーバネサンス','エーバネサンス');
+INSERT INTO "hand_mapping" VALUES ('EVANS','ˈɛ v ə n z','e Va nv zv','エバンズ','エバンズ');
+INSERT INTO "hand_mapping" VALUES ('EVE','ˈiː v','i - Vv','イーブ','イーブ');
+INSERT INTO "hand_mapping" VALUES ('EVELYN(1)','ˈiː v ə l ɪ n','i - Va ri nv','イーバリン','イーバリン');
+INSERT INTO "hand_mapping" VALUES ('EVELYN(2)','ˈɛ v ə l ɪ n','e Va ri nv','エバリン','エバリン');
+INSERT INTO "hand_mapping" VALUES ('EVEN','ˈiː v ə n','i - Va nv','イーバン','イーバン');
+INSERT INTO "hand_mapping" VALUES ('EVENING','ˈiː v n ɪ ŋ','i - Vv ni Nv','イーブニン','イーブニング');
+INSERT INTO "hand_mapping" VALUES ('EVENINGS','ˈiː v n ɪ ŋ z','i - Vv ni Nv zv','イーブニンズ','イーブニンズ');
+INSERT INTO "hand_mapping" VALUES ('EVENLY','ˈiː v ə n l i','i - Va nv ri -','イーバンリー','イーバンリー');
+INSERT INTO "hand_mapping" VALUES ('EVENT','ɪ v ˈɛ n t','i Ve nv tv','イベント','イベント');
+INSERT INTO "hand_mapping" VALUES ('EVENTS','ɪ v ˈɛ n t s','i Ve nv tsv','イベンツ','イベンツ');
+INSERT INTO "hand_mapping" VALUES ('EVENTUAL','ɪ v ˈɛ n tʃ ʊə l','i Ve nv tyu a rv','イベンチュアル','イベンチュアル');
+INSERT INTO "hand_mapping" VALUES ('EVENTUALLY','ɪ v ˈɛ n tʃ ʊə l i','i Ve nv tyu a ri -','イベンチュアリー','イベンチュアリー');
+INSERT INTO "hand_mapping" VALUES ('EVER','ˈɛ v ə','e Va','エバ','エバ');
+INSERT INTO "hand_mapping" VALUES ('EVERY(1)','ˈɛ v ɹ i','e Vv ri -','エブリー','エブリー');
+INSERT INTO "hand_mapping" VALUES ('EVERY(2)','ˈɛ v ə ɹ i','e Va ri -','エバリー','エバリー');
+INSERT INTO "hand_mapping" VALUES ('EVERYBODY','ˈɛ v ɹ ɪ b ˌɒ d i','e Vv ri bo di -','エブリボディー','エブリボディー');
+INSERT INTO "hand_mapping" VALUES ('EVERYDAY(1)','ˌɛ v ɹ ɪ d ˈeɪ','e - Vv ri de i','エーブリデイ','エーブリデイ');
+INSERT INTO "hand_mapping" VALUES ('EVERYDAY(2)','ˈɛ v ɹ ɪ d ˌeɪ','e Vv ri de i','エブリデイ','エブリデイ');
+INSERT INTO "hand_mapping" VALUES ('EVERYONE','ˈɛ v ɹ ɪ w ˌɐ n','e Vv ri wa nv','エブリワン','エブリワン');
+INSERT INTO "hand_mapping" VALUES ('EVERYTHING','ˈɛ v ɹ ɪ θ ˌɪ ŋ','e Vv ri si - Nv','エブリシーン','エブリシーング');
+INSERT INTO "hand_mapping" VALUES ('EVERYWHERE','ˈɛ v ɹ ɪ w ˌɛə','e Vv ri we a -','エブリウェアー','エブリウェアー');
+INSERT INTO "hand_mapping" VALUES ('EVICT','ɪ v ˈɪ k t','i Vi kv tv','イビクト','イビクト');
+INSERT INTO "hand_mapping" VALUES ('EVIDENCE','ˈɛ v ɪ d ə n s','e Vi da nv sv','エビダンス','エビダンス');
+INSERT INTO "hand_mapping" VALUES ('EVIDENT','ˈɛ v ɪ d ə n t','e Vi da nv tv','エビダント','エビダント');
+INSERT INTO "hand_mapping" VALUES ('EVIDENTLY','ˈɛ v ɪ d ə n t l i','e Vi da nv tv ri -','エビダントリー','エビダントリー');
+INSERT INTO "hand_mapping" VALUES ('EVIL','ˈiː v ə l','i - Va rv','イーバル','イーバル');
+INSERT INTO "hand_mapping" VALUES ('EVOKE','ɪ v ˈəʊ k','i Vo - kv','イボーク','イボーク');
+INSERT INTO "hand_mapping" VALUES ('EVOLUTION(1)','ˌiː v ə l ˈuː ʃ ə n','i - Va ru - sya nv','イーバルーシャン','イーバルーション');
+INSERT INTO "hand_mapping" VALUES ('EVOLUTION(2)','ˌɛ v ə l ˈuː ʃ ə n','e - Va ru - sya nv','エーバルーシャン','エーバルーション');
+INSERT INTO "hand_mapping" VALUES ('EVOLUTIONARY(1)','ˌɛ v ə l ˈuː ʃ ə n ə ɹ i','e - Va ru - sya na ri -','エーバルーシャナリー','エーバルーシャナリー');
+INSERT INTO "hand_mapping" VALUES ('EVOLUTIONARY(2)','ˌiː v ə l ˈuː ʃ ə n ə ɹ i','i - Va ru - sya na ri -','イーバルーシャナリー','イーバルーシャナリー');
+INSERT INTO "hand_mapping" VALUES ('EVOLVE','ɪ v ˈɒ l v','i Vo rv Vv','イボルブ','イボルブ');
+INSERT INTO "hand_mapping" VALUES ('EVOLVED','ɪ v ˈɒ l v d','i Vo rv Vv dv','イボルブド','イボルブド');
+INSERT INTO "hand_mapping" VALUES ('EVOLVES','ɪ v ˈɒ l v z','i Vo rv Vv zv','イボルブズ','イボルブズ');
 INSERT INTO "hand_mapping" VALUES ('EWE','j ˈuː','yu -','ユー','ユー');
 INSERT INTO "hand_mapping" VALUES ('EWELL','j ˈuː l','yu - rv','ユール','ユール');
 INSERT INTO "hand_mapping" VALUES ('EX','ˈɛ k s','e kv sv','エクス','エクス');
@@ -5542,7 +5542,7 @@ INSERT INTO "hand_mapping" VALUES ('EXCERPT(1)','ˈɛ k s ɜː p t','e kv se - p
 INSERT INTO "hand_mapping" VALUES ('EXCERPT(2)','ɛ k s ˈɜː p t','e kv se - pv tv','エクセープト','エクセープト');
 INSERT INTO "hand_mapping" VALUES ('EXCESS(1)','ɪ k s ˈɛ s','i kv se sv','イクセス','イクセス');
 INSERT INTO "hand_mapping" VALUES ('EXCESS(2)','ˈɛ k s ˌɛ s','e kv se - sv','エクセース','エクセース');
-INSERT INTO "hand_mapping" VALUES ('EXCESSIVE','ɪ k s ˈɛ s ɪ v','i kv se si bv','イクセシブ','イクセシブ');
+INSERT INTO "hand_mapping" VALUES ('EXCESSIVE','ɪ k s ˈɛ s ɪ v','i kv se si Vv','イクセシブ','イクセシブ');
 INSERT INTO "hand_mapping" VALUES ('EXCHANGE','ɪ k s tʃ ˈeɪ n dʒ','i kv sv tye i nv jyv','イクスチェインジュ','イクスチェインジュ');
 INSERT INTO "hand_mapping" VALUES ('EXCHANGES','ɪ k s tʃ ˈeɪ n dʒ ɪ z','i kv sv tye i nv jyi zv','イクスチェインジィズ','イクスチェインジィズ');
 INSERT INTO "hand_mapping" VALUES ('EXCHEQUER','ˈɛ k s tʃ ˌɛ k ə','e kv sv tye - ka','エクスチェーカ','エクスチェーカ');
@@ -5557,8 +5557,8 @@ INSERT INTO "hand_mapping" VALUES ('EXCLUDE','ɪ k s k l ˈuː d','i kv sv kv ru
 INSERT INTO "hand_mapping" VALUES ('EXCLUDED','ɪ k s k l ˈuː d ɪ d','i kv sv kv ru - di dv','イクスクルーディド','イクスクルーディド');
 INSERT INTO "hand_mapping" VALUES ('EXCLUDING','ɪ k s k l ˈuː d ɪ ŋ','i kv sv kv ru - di Nv','イクスクルーディン','イクスクルーディング');
 INSERT INTO "hand_mapping" VALUES ('EXCLUSION','ɪ k s k l ˈuː ʒ ə n','i kv sv kv ru - jya nv','イクスクルージャン','イクスクルージョン');
-INSERT INTO "hand_mapping" VALUES ('EXCLUSIVE','ɪ k s k l ˈuː s ɪ v','i kv sv kv ru - si bv','イクスクルーシブ','イクスクルーシブ');
-INSERT INTO "hand_mapping" VALUES ('EXCLUSIVELY','ɪ k s k l ˈuː s ɪ v l i','i kv sv kv ru - si bv ri -','イクスクルーシブリー','イクスクルーシブリー');
+INSERT INTO "hand_mapping" VALUES ('EXCLUSIVE','ɪ k s k l ˈuː s ɪ v','i kv sv kv ru - si Vv','イクスクルーシブ','イクスクルーシブ');
+INSERT INTO "hand_mapping" VALUES ('EXCLUSIVELY','ɪ k s k l ˈuː s ɪ v l i','i kv sv kv ru - si Vv ri -','イクスクルーシブリー','イクスクルーシブリー');
 INSERT INTO "hand_mapping" VALUES ('EXCUSE(1)','ɪ k s k j ˈuː s','i kv sv kyu - sv','イクスキュース','イクスキュース');
 INSERT INTO "hand_mapping" VALUES ('EXCUSE(2)','ɪ k s k j ˈuː z','i kv sv kyu - zv','イクスキューズ','イクスキューズ');
 INSERT INTO "hand_mapping" VALUES ('EXCUSES(1)','ɪ k s k j ˈuː s ɪ z','i kv sv kyu - si zv','イクスキューシズ','イクスキューシズ');
@@ -5567,8 +5567,8 @@ INSERT INTO "hand_mapping" VALUES ('EXEC','ˌɛ g z ˈɛ k','e - gv ze kv','エ
 INSERT INTO "hand_mapping" VALUES ('EXECUTE','ˈɛ k s ɪ k j ˌuː t','e kv si kyu - tv','エクシキュート','エクシキュート');
 INSERT INTO "hand_mapping" VALUES ('EXECUTED','ˈɛ k s ɪ k j ˌuː t ɪ d','e kv si kyu - ti dv','エクシキューティド','エクシキューティド');
 INSERT INTO "hand_mapping" VALUES ('EXECUTION','ˌɛ k s ɪ k j ˈuː ʃ ə n','e - kv si kyu - sya nv','エークシキューシャン','エークシキューション');
-INSERT INTO "hand_mapping" VALUES ('EXECUTIVE','ɪ g z ˈɛ k j ʊ t ɪ v','i gv ze kyu ti bv','イグゼキュティブ','イグゼキュティブ');
-INSERT INTO "hand_mapping" VALUES ('EXECUTIVES','ɪ g z ˈɛ k j ʊ t ɪ v z','i gv ze kyu ti bv zv','イグゼキュティブズ','イグゼキュティブズ');
+INSERT INTO "hand_mapping" VALUES ('EXECUTIVE','ɪ g z ˈɛ k j ʊ t ɪ v','i gv ze kyu ti Vv','イグゼキュティブ','イグゼキュティブ');
+INSERT INTO "hand_mapping" VALUES ('EXECUTIVES','ɪ g z ˈɛ k j ʊ t ɪ v z','i gv ze kyu ti Vv zv','イグゼキュティブズ','イグゼキュティブズ');
 INSERT INTO "hand_mapping" VALUES ('EXEMPT','ɪ g z ˈɛ m p t','i gv ze mv pv tv','イグゼムプト','イグゼムプト');
 INSERT INTO "hand_mapping" VALUES ('EXEMPTION','ɪ g z ˈɛ m p ʃ ə n','i gv ze npv sya nv','イグゼンプシャン','イグゼンプション');
 INSERT INTO "hand_mapping" VALUES ('EXERCISE','ˈɛ k s ə s ˌaɪ z','e kv sa sa i zv','エクササイズ','エクササイズ');
@@ -5616,7 +5616,7 @@ INSERT INTO "hand_mapping" VALUES ('EXPENDITURE','ɪ k s p ˈɛ n d ɪ tʃ ə','
 INSERT INTO "hand_mapping" VALUES ('EXPENDITURES','ɪ k s p ˈɛ n d ɪ tʃ ə z','i kv sv pe nv di tya zv','イクスペンディチャズ','イクスペンディチャズ');
 INSERT INTO "hand_mapping" VALUES ('EXPENSE','ɪ k s p ˈɛ n s','i kv sv pe nv sv','イクスペンス','イクスペンス');
 INSERT INTO "hand_mapping" VALUES ('EXPENSES','ɪ k s p ˈɛ n s ɪ z','i kv sv pe nv si zv','イクスペンシズ','イクスペンシズ');
-INSERT INTO "hand_mapping" VALUES ('EXPENSIVE','ɪ k s p ˈɛ n s ɪ v','i kv sv pe nv si bv','イクスペンシブ','イクスペンシブ');
+INSERT INTO "hand_mapping" VALUES ('EXPENSIVE','ɪ k s p ˈɛ n s ɪ v','i kv sv pe nv si Vv','イクスペンシブ','イクスペンシブ');
 INSERT INTO "hand_mapping" VALUES ('EXPERIENCE','ɪ k s p ˈɪə ɹ ɪə n s','i kv sv pi a ri a nv sv','イクスピアリアンス','イクスピアリアンス');
 INSERT INTO "hand_mapping" VALUES ('EXPERIENCED','ɪ k s p ˈɪə ɹ ɪə n s t','i kv sv pi a ri a nv sv tv','イクスピアリアンスト','イクスピアリアンスト');
 INSERT INTO "hand_mapping" VALUES ('EXPERIENCES','ɪ k s p ˈɪə ɹ ɪə n s ɪ z','i kv sv pi a ri a nv si zv','イクスピアリアンシズ','イクスピアリアンシズ');
@@ -5649,7 +5649,7 @@ INSERT INTO "hand_mapping" VALUES ('EXPLORED','ɪ k s p l ˈɔː d','i kv sv pv
 INSERT INTO "hand_mapping" VALUES ('EXPLORER','ɪ k s p l ˈɔː ɹ ə','i kv sv pv ro - ra','イクスプローラ','イクスプローラ');
 INSERT INTO "hand_mapping" VALUES ('EXPLORING','ɪ k s p l ˈɔː ɹ ɪ ŋ','i kv sv pv ro - ri Nv','イクスプローリン','イクスプローリング');
 INSERT INTO "hand_mapping" VALUES ('EXPLOSION','ɪ k s p l ˈəʊ ʒ ə n','i kv sv pv ro - jya nv','イクスプロージャン','イクスプロージョン');
-INSERT INTO "hand_mapping" VALUES ('EXPLOSIVE','ɪ k s p l ˈəʊ s ɪ v','i kv sv pv ro - si bv','イクスプローシブ','イクスプローシブ');
+INSERT INTO "hand_mapping" VALUES ('EXPLOSIVE','ɪ k s p l ˈəʊ s ɪ v','i kv sv pv ro - si Vv','イクスプローシブ','イクスプローシブ');
 INSERT INTO "hand_mapping" VALUES ('EXPO','ˈɛ k s p əʊ','e kv sv po','エクスポ','エクスポ');
 INSERT INTO "hand_mapping" VALUES ('EXPONENTIAL','ˌɛ k s p əʊ n ˈɛ n ʃ ə l','e - kv sv po ne nv sya rv','エークスポネンシャル','エークスポネンシャル');
 INSERT INTO "hand_mapping" VALUES ('EXPORT(1)','ˈɛ k s p ˌɔː t','e kv sv po - tv','エクスポート','エクスポート');
@@ -5670,8 +5670,8 @@ INSERT INTO "hand_mapping" VALUES ('EXTENDING','ɪ k s t ˈɛ n d ɪ ŋ','i kv s
 INSERT INTO "hand_mapping" VALUES ('EXTENDS','ɪ k s t ˈɛ n d z','i kv sv te nv zv','イクステンズ','イクステンズ');
 INSERT INTO "hand_mapping" VALUES ('EXTENSION','ɪ k s t ˈɛ n ʃ ə n','i kv sv te nv sya nv','イクステンシャン','イクステンション');
 INSERT INTO "hand_mapping" VALUES ('EXTENSIONS','ɪ k s t ˈɛ n ʃ ə n z','i kv sv te nv sya nv zv','イクステンシャンズ','イクステンシャンズ');
-INSERT INTO "hand_mapping" VALUES ('EXTENSIVE','ɪ k s t ˈɛ n s ɪ v','i kv sv te nv si bv','イクステンシブ','イクステンシブ');
-INSERT INTO "hand_mapping" VALUES ('EXTENSIVELY','ɪ k s t ˈɛ n s ɪ v l i','i kv sv te nv si bv ri -','イクステンシブリー','イクステンシブリー');
+INSERT INTO "hand_mapping" VALUES ('EXTENSIVE','ɪ k s t ˈɛ n s ɪ v','i kv sv te nv si Vv','イクステンシブ','イクステンシブ');
+INSERT INTO "hand_mapping" VALUES ('EXTENSIVELY','ɪ k s t ˈɛ n s ɪ v l i','i kv sv te nv si Vv ri -','イクステンシブリー','イクステンシブリー');
 INSERT INTO "hand_mapping" VALUES ('EXTENT','ɪ k s t ˈɛ n t','i kv sv te nv tv','イクステント','イクステント');
 INSERT INTO "hand_mapping" VALUES ('EXTERIOR','ɪ k s t ˈɪə ɹ ɪə','i kv sv ti a ri a','イクスティアリア','イクスティアリア');
 INSERT INTO "hand_mapping" VALUES ('EXTERNAL','ɪ k s t ˈɜː n ə l','i kv sv te - na rv','イクステーナル','イクステーナル');
@@ -5802,20 +5802,20 @@ INSERT INTO "hand_mapping" VALUES ('FATIGUE','f ə t ˈiː g','fa ti - gv','フ
 INSERT INTO "hand_mapping" VALUES ('FATTY','f ˈæ t i','fa x ti -','ファッティー','ファッティー');
 INSERT INTO "hand_mapping" VALUES ('FAULT','f ˈɔː l t','fo - rv tv','フォールト','フォールト');
 INSERT INTO "hand_mapping" VALUES ('FAULTY','f ˈɔː l t i','fo - rv ti -','フォールティー','フォールティー');
-INSERT INTO "hand_mapping" VALUES ('FAVOR','f ˈeɪ v ə','fe i ba','フェイバ','フェイバ');
-INSERT INTO "hand_mapping" VALUES ('FAVORABLE(1)','f ˈeɪ v ɹ ə b ə l','fe i bv ra ba rv','フェイブラバル','フェイブラバル');
-INSERT INTO "hand_mapping" VALUES ('FAVORABLE(2)','f ˈeɪ v ə ɹ ə b ə l','fe i ba ra ba rv','フェイバラバル','フェイバラバル');
-INSERT INTO "hand_mapping" VALUES ('FAVORITE(1)','f ˈeɪ v ɹ ɪ t','fe i bv ri tv','フェイブリト','フェイブリト');
-INSERT INTO "hand_mapping" VALUES ('FAVORITE(2)','f ˈeɪ v ə ɹ ɪ t','fe i ba ri tv','フェイバリト','フェイバリト');
-INSERT INTO "hand_mapping" VALUES ('FAVORITES(1)','f ˈeɪ v ɹ ɪ t s','fe i bv ri tsv','フェイブリツ','フェイブリツ');
-INSERT INTO "hand_mapping" VALUES ('FAVORITES(2)','f ˈeɪ v ə ɹ ɪ t s','fe i ba ri tsv','フェイバリツ','フェイバリツ');
-INSERT INTO "hand_mapping" VALUES ('FAVORS','f ˈeɪ v ə z','fe i ba zv','フェイバズ','フェイバズ');
-INSERT INTO "hand_mapping" VALUES ('FAVOUR','f ˈeɪ v ə','fe i ba','フェイバ','フェイバ');
-INSERT INTO "hand_mapping" VALUES ('FAVOURABLE(1)','f ˈeɪ v ɹ ə b ə l','fe i bv ra ba rv','フェイブラバル','フェイブラバル');
-INSERT INTO "hand_mapping" VALUES ('FAVOURABLE(2)','f ˈeɪ v ə ɹ ə b ə l','fe i ba ra ba rv','フェイバラバル','フェイバラバル');
-INSERT INTO "hand_mapping" VALUES ('FAVOURITE','f ˈeɪ v ə ɹ ɪ t','fe i ba ri tv','フェイバリト','フェイバリト');
-INSERT INTO "hand_mapping" VALUES ('FAVOURITES(1)','f ˈeɪ v ɹ ɪ t s','fe i bv ri tsv','フェイブリツ','フェイブリツ');
-INSERT INTO "hand_mapping" VALUES ('FAVOURITES(2)','f ˈeɪ v ə ɹ ɪ t s','fe i ba ri tsv','フェイバリツ','フェイバリツ');
+INSERT INTO "hand_mapping" VALUES ('FAVOR','f ˈeɪ v ə','fe i Va','フェイバ','フェイバ');
+INSERT INTO "hand_mapping" VALUES ('FAVORABLE(1)','f ˈeɪ v ɹ ə b ə l','fe i Vv ra ba rv','フェイブラバル','フェイブラバル');
+INSERT INTO "hand_mapping" VALUES ('FAVORABLE(2)','f ˈeɪ v ə ɹ ə b ə l','fe i Va ra ba rv','フェイバラバル','フェイバラバル');
+INSERT INTO "hand_mapping" VALUES ('FAVORITE(1)','f ˈeɪ v ɹ ɪ t','fe i Vv ri tv','フェイブリト','フェイブリト');
+INSERT INTO "hand_mapping" VALUES ('FAVORITE(2)','f ˈeɪ v ə ɹ ɪ t','fe i Va ri tv','フェイバリト','フェイバリト');
+INSERT INTO "hand_mapping" VALUES ('FAVORITES(1)','f ˈeɪ v ɹ ɪ t s','fe i Vv ri tsv','フェイブリツ','フェイブリツ');
+INSERT INTO "hand_mapping" VALUES ('FAVORITES(2)','f ˈeɪ v ə ɹ ɪ t s','fe i Va ri tsv','フェイバリツ','フェイバリツ');
+INSERT INTO "hand_mapping" VALUES ('FAVORS','f ˈeɪ v ə z','fe i Va zv','フェイバズ','フェイバズ');
+INSERT INTO "hand_mapping" VALUES ('FAVOUR','f ˈeɪ v ə','fe i Va','フェイバ','フェイバ');
+INSERT INTO "hand_mapping" VALUES ('FAVOURABLE(1)','f ˈeɪ v ɹ ə b ə l','fe i Vv ra ba rv','フェイブラバル','フェイブラバル');
+INSERT INTO "hand_mapping" VALUES ('FAVOURABLE(2)','f ˈeɪ v ə ɹ ə b ə l','fe i Va ra ba rv','フェイバラバル','フェイバラバル');
+INSERT INTO "hand_mapping" VALUES ('FAVOURITE','f ˈeɪ v ə ɹ ɪ t','fe i Va ri tv','フェイバリト','フェイバリト');
+INSERT INTO "hand_mapping" VALUES ('FAVOURITES(1)','f ˈeɪ v ɹ ɪ t s','fe i Vv ri tsv','フェイブリツ','フェイブリツ');
+INSERT INTO "hand_mapping" VALUES ('FAVOURITES(2)','f ˈeɪ v ə ɹ ɪ t s','fe i Va ri tsv','フェイバリツ','フェイバリツ');
 INSERT INTO "hand_mapping" VALUES ('FAWN','f ˈɔː n','fo - nv','フォーン','フォーン');
 INSERT INTO "hand_mapping" VALUES ('FAX','f ˈæ k s','fa x kv sv','ファックス','ファックス');
 INSERT INTO "hand_mapping" VALUES ('FAY','f ˈeɪ','fe i','フェイ','フェイ');
@@ -5872,8 +5872,8 @@ INSERT INTO "hand_mapping" VALUES ('FERRARI','f ə ɹ ˈɑː ɹ i','fa ra - ri -
 INSERT INTO "hand_mapping" VALUES ('FERRY','f ˈɛ ɹ i','fe ri -','フェリー','フェリー');
 INSERT INTO "hand_mapping" VALUES ('FERTILITY','f ə t ˈɪ l ɪ t i','fa ti ri ti -','ファティリティー','ファティリティー');
 INSERT INTO "hand_mapping" VALUES ('FEST','f ˈɛ s t','fe sv tv','フェスト','フェスト');
-INSERT INTO "hand_mapping" VALUES ('FESTIVAL','f ˈɛ s t ɪ v ə l','fe sv ti ba rv','フェスティバル','フェスティバル');
-INSERT INTO "hand_mapping" VALUES ('FESTIVALS','f ˈɛ s t ɪ v ə l z','fe sv ti ba rv zv','フェスティバルズ','フェスティバルズ');
+INSERT INTO "hand_mapping" VALUES ('FESTIVAL','f ˈɛ s t ɪ v ə l','fe sv ti Va rv','フェスティバル','フェスティバル');
+INSERT INTO "hand_mapping" VALUES ('FESTIVALS','f ˈɛ s t ɪ v ə l z','fe sv ti Va rv zv','フェスティバルズ','フェスティバルズ');
 INSERT INTO "hand_mapping" VALUES ('FETAL','f ˈiː t ə l','fi - ta rv','フィータル','フィータル');
 INSERT INTO "hand_mapping" VALUES ('FETCH','f ˈɛ tʃ','fe tyv','フェチュ','フェチュ');
 INSERT INTO "hand_mapping" VALUES ('FETCHED','f ˈɛ tʃ t','fe tyv tv','フェチュト','フェチュト');
@@ -5881,7 +5881,7 @@ INSERT INTO "hand_mapping" VALUES ('FETE','f ˈeɪ t','fe i tv','フェイト','
 INSERT INTO "hand_mapping" VALUES ('FETISH','f ˈɛ t ɪ ʃ','fe ti syv','フェティシュ','フェティシュ');
 INSERT INTO "hand_mapping" VALUES ('FETUS','f ˈiː t ə s','fi - ta sv','フィータス','フィータス');
 INSERT INTO "hand_mapping" VALUES ('FEUD','f j ˈuː d','fyu - dv','フュード','フュード');
-INSERT INTO "hand_mapping" VALUES ('FEVER','f ˈiː v ə','fi - ba','フィーバ','フィーバ');
+INSERT INTO "hand_mapping" VALUES ('FEVER','f ˈiː v ə','fi - Va','フィーバ','フィーバ');
 INSERT INTO "hand_mapping" VALUES ('FEW','f j ˈuː','fyu -','フュー','フュー');
 INSERT INTO "hand_mapping" VALUES ('FEWER','f j ˈuː ə','fyu - a','フューア','フューア');
 INSERT INTO "hand_mapping" VALUES ('FEWEST','f j ˈuː ɪ s t','fyu - i sv tv','フューイスト','フューイスト');
@@ -5995,9 +5995,9 @@ INSERT INTO "hand_mapping" VALUES ('FITS','f ˈɪ t s','fi tsv','フィツ','フ
 INSERT INTO "hand_mapping" VALUES ('FITTED','f ˈɪ t ɪ d','fi ti dv','フィティド','フィティド');
 INSERT INTO "hand_mapping" VALUES ('FITTING','f ˈɪ t ɪ ŋ','fi ti Nv','フィティン','フィティング');
 INSERT INTO "hand_mapping" VALUES ('FITTINGS','f ˈɪ t ɪ ŋ z','fi ti Nv zv','フィティンズ','フィティンズ');
-INSERT INTO "hand_mapping" VALUES ('FIVE','f ˈaɪ v','fa i bv','ファイブ','ファイブ');
-INSERT INTO "hand_mapping" VALUES ('FIVER','f ˈaɪ v ə','fa i ba','ファイバ','ファイバ');
-INSERT INTO "hand_mapping" VALUES ('FIVES','f ˈaɪ v z','fa i bv zv','ファイブズ','ファイブズ');
+INSERT INTO "hand_mapping" VALUES ('FIVE','f ˈaɪ v','fa i Vv','ファイブ','ファイブ');
+INSERT INTO "hand_mapping" VALUES ('FIVER','f ˈaɪ v ə','fa i Va','ファイバ','ファイバ');
+INSERT INTO "hand_mapping" VALUES ('FIVES','f ˈaɪ v z','fa i Vv zv','ファイブズ','ファイブズ');
 INSERT INTO "hand_mapping" VALUES ('FIX','f ˈɪ k s','fi kv sv','フィクス','フィクス');
 INSERT INTO "hand_mapping" VALUES ('FIXED','f ˈɪ k s t','fi kv sv tv','フィクスト','フィクスト');
 INSERT INTO "hand_mapping" VALUES ('FIXES','f ˈɪ k s ɪ z','fi kv si zv','フィクシズ','フィクシズ');
@@ -6025,8 +6025,8 @@ INSERT INTO "hand_mapping" VALUES ('FLASHING','f l ˈæ ʃ ɪ ŋ','fv ra x syi N
 INSERT INTO "hand_mapping" VALUES ('FLASK','f l ˈæ s k','fv ra x sv kv','フラッスク','フラッスク');
 INSERT INTO "hand_mapping" VALUES ('FLAT','f l ˈæ t','fv ra x tv','フラット','フラット');
 INSERT INTO "hand_mapping" VALUES ('FLATS','f l ˈæ t s','fv ra x tsv','フラッツ','フラッツ');
-INSERT INTO "hand_mapping" VALUES ('FLAVOR','f l ˈeɪ v ə','fv re i ba','フレイバ','フレイバ');
-INSERT INTO "hand_mapping" VALUES ('FLAVOUR','f l ˈeɪ v ə','fv re i ba','フレイバ','フレイバ');
+INSERT INTO "hand_mapping" VALUES ('FLAVOR','f l ˈeɪ v ə','fv re i Va','フレイバ','フレイバ');
+INSERT INTO "hand_mapping" VALUES ('FLAVOUR','f l ˈeɪ v ə','fv re i Va','フレイバ','フレイバ');
 INSERT INTO "hand_mapping" VALUES ('FLAW','f l ˈɔː','fv ro -','フロー','フロー');
 INSERT INTO "hand_mapping" VALUES ('FLEA','f l ˈiː','fv ri -','フリー','フリー');
 INSERT INTO "hand_mapping" VALUES ('FLED','f l ˈɛ d','fv re dv','フレド','フレド');
@@ -6160,16 +6160,16 @@ INSERT INTO "hand_mapping" VALUES ('FORESEE','f ˌɔː s ˈiː','fo - si -','フ
 INSERT INTO "hand_mapping" VALUES ('FOREST','f ˈɒ ɹ ɪ s t','fo ri sv tv','フォリスト','フォリスト');
 INSERT INTO "hand_mapping" VALUES ('FORESTRY','f ˈɒ ɹ ɪ s t ɹ i','fo ri sv tv ri -','フォリストリー','フォリストリー');
 INSERT INTO "hand_mapping" VALUES ('FORESTS','f ˈɒ ɹ ɪ s t s','fo ri sv tsv','フォリスツ','フォリスツ');
-INSERT INTO "hand_mapping" VALUES ('FOREVER','f ə ɹ ˈɛ v ə','fa re ba','ファレバ','フォァレバ');
+INSERT INTO "hand_mapping" VALUES ('FOREVER','f ə ɹ ˈɛ v ə','fa re Va','ファレバ','フォァレバ');
 INSERT INTO "hand_mapping" VALUES ('FOREWENT','f ɔː w ˈɛ n t','fo - we nv tv','フォーウェント','フォーウェント');
 INSERT INTO "hand_mapping" VALUES ('FORFEIT','f ˈɔː f ɪ t','fo - fi tv','フォーフィト','フォーフィト');
-INSERT INTO "hand_mapping" VALUES ('FORGAVE','f ə g ˈeɪ v','fa ge i bv','ファゲイブ','フォァゲイブ');
+INSERT INTO "hand_mapping" VALUES ('FORGAVE','f ə g ˈeɪ v','fa ge i Vv','ファゲイブ','フォァゲイブ');
 INSERT INTO "hand_mapping" VALUES ('FORGE','f ˈɔː dʒ','fo - jyv','フォージュ','フォージュ');
 INSERT INTO "hand_mapping" VALUES ('FORGET','f ə g ˈɛ t','fa ge tv','ファゲト','フォァゲト');
 INSERT INTO "hand_mapping" VALUES ('FORGETTING','f ə g ˈɛ t ɪ ŋ','fa ge ti Nv','ファゲティン','フォァゲティング');
-INSERT INTO "hand_mapping" VALUES ('FORGIVE','f ə g ˈɪ v','fa gi bv','ファギブ','フォァギブ');
-INSERT INTO "hand_mapping" VALUES ('FORGIVEN','f ə g ˈɪ v ə n','fa gi ba nv','ファギバン','フォァギバン');
-INSERT INTO "hand_mapping" VALUES ('FORGIVENESS','f ə g ˈɪ v n ɪ s','fa gi bv ni sv','ファギブニス','フォァギブニス');
+INSERT INTO "hand_mapping" VALUES ('FORGIVE','f ə g ˈɪ v','fa gi Vv','ファギブ','フォァギブ');
+INSERT INTO "hand_mapping" VALUES ('FORGIVEN','f ə g ˈɪ v ə n','fa gi Va nv','ファギバン','フォァギバン');
+INSERT INTO "hand_mapping" VALUES ('FORGIVENESS','f ə g ˈɪ v n ɪ s','fa gi Vv ni sv','ファギブニス','フォァギブニス');
 INSERT INTO "hand_mapping" VALUES ('FORGO','f ɔː g ˈəʊ','fo - go -','フォーゴー','フォーゴー');
 INSERT INTO "hand_mapping" VALUES ('FORGONE','f ɔː g ˈɒ n','fo - go nv','フォーゴン','フォーゴン');
 INSERT INTO "hand_mapping" VALUES ('FORGOT','f ə g ˈɒ t','fa go x tv','ファゴット','フォァゴット');
@@ -6461,8 +6461,8 @@ INSERT INTO "hand_mapping" VALUES ('GATHERED','g ˈæ ð ə d','ga za dv','ガ
 INSERT INTO "hand_mapping" VALUES ('GATHERING','g ˈæ ð ə ɹ ɪ ŋ','ga za ri Nv','ガザリン','ガザリング');
 INSERT INTO "hand_mapping" VALUES ('GAUGE','g ˈeɪ dʒ','ge i jyv','ゲイジュ','ゲイジュ');
 INSERT INTO "hand_mapping" VALUES ('GAUZE','g ˈɔː z','go - zv','ゴーズ','ゴーズ');
-INSERT INTO "hand_mapping" VALUES ('GAVE','g ˈeɪ v','ge i bv','ゲイブ','ゲイブ');
-INSERT INTO "hand_mapping" VALUES ('GAVIN','g ˈæ v ɪ n','ga bi nv','ガビン','ガビン');
+INSERT INTO "hand_mapping" VALUES ('GAVE','g ˈeɪ v','ge i Vv','ゲイブ','ゲイブ');
+INSERT INTO "hand_mapping" VALUES ('GAVIN','g ˈæ v ɪ n','ga Vi nv','ガビン','ガビン');
 INSERT INTO "hand_mapping" VALUES ('GAY','g ˈeɪ','ge i','ゲイ','ゲイ');
 INSERT INTO "hand_mapping" VALUES ('GAYS','g ˈeɪ z','ge i zv','ゲイズ','ゲイズ');
 INSERT INTO "hand_mapping" VALUES ('GAZA','g ˈɑː z ə','ga - za','ガーザ','ガーザ');
@@ -6507,7 +6507,7 @@ INSERT INTO "hand_mapping" VALUES ('GENESIS','dʒ ˈɛ n ɪ s ɪ s','jye ni si s
 INSERT INTO "hand_mapping" VALUES ('GENETIC','dʒ ə n ˈɛ t ɪ k','jya ne ti kv','ジャネティク','ジャネティク');
 INSERT INTO "hand_mapping" VALUES ('GENETICALLY','dʒ ə n ˈɛ t ɪ k ə l i','jya ne ti ka ri -','ジャネティカリー','ジャネティカリー');
 INSERT INTO "hand_mapping" VALUES ('GENETICS','dʒ ə n ˈɛ t ɪ k s','jya ne ti kv sv','ジャネティクス','ジャネティクス');
-INSERT INTO "hand_mapping" VALUES ('GENEVA','dʒ ɪ n ˈiː v ə','jyi ni - ba','ジィニーバ','ジィニーバ');
+INSERT INTO "hand_mapping" VALUES ('GENEVA','dʒ ɪ n ˈiː v ə','jyi ni - Va','ジィニーバ','ジィニーバ');
 INSERT INTO "hand_mapping" VALUES ('GENIE','dʒ ˈiː n i','jyi - ni -','ジィーニー','ジィーニー');
 INSERT INTO "hand_mapping" VALUES ('GENIUS','dʒ ˈiː n j ə s','jyi - nya sv','ジィーニャス','ジィーニャス');
 INSERT INTO "hand_mapping" VALUES ('GENOME','dʒ ˈiː n ˌəʊ m','jyi - no mv','ジィーノム','ジィーノム');
@@ -6580,11 +6580,11 @@ INSERT INTO "hand_mapping" VALUES ('GIRLS','g ˈɜː l z','ge - rv zv','ゲー
 INSERT INTO "hand_mapping" VALUES ('GIRTH','g ˈɜː θ','ge - sv','ゲース','ゲース');
 INSERT INTO "hand_mapping" VALUES ('GIST','dʒ ˈɪ s t','jyi sv tv','ジィスト','ジィスト');
 INSERT INTO "hand_mapping" VALUES ('GIT','g ˈɪ t','gi tv','ギト','ギト');
-INSERT INTO "hand_mapping" VALUES ('GIVE','g ˈɪ v','gi bv','ギブ','ギブ');
-INSERT INTO "hand_mapping" VALUES ('GIVEN','g ˈɪ v ə n','gi ba nv','ギバン','ギバン');
-INSERT INTO "hand_mapping" VALUES ('GIVES','g ˈɪ v z','gi bv zv','ギブズ','ギブズ');
-INSERT INTO "hand_mapping" VALUES ('GIVETH','g ˈɪ v ə θ','gi ba sv','ギバス','ギバス');
-INSERT INTO "hand_mapping" VALUES ('GIVING','g ˈɪ v ɪ ŋ','gi bi Nv','ギビン','ギビング');
+INSERT INTO "hand_mapping" VALUES ('GIVE','g ˈɪ v','gi Vv','ギブ','ギブ');
+INSERT INTO "hand_mapping" VALUES ('GIVEN','g ˈɪ v ə n','gi Va nv','ギバン','ギバン');
+INSERT INTO "hand_mapping" VALUES ('GIVES','g ˈɪ v z','gi Vv zv','ギブズ','ギブズ');
+INSERT INTO "hand_mapping" VALUES ('GIVETH','g ˈɪ v ə θ','gi Va sv','ギバス','ギバス');
+INSERT INTO "hand_mapping" VALUES ('GIVING','g ˈɪ v ɪ ŋ','gi Vi Nv','ギビン','ギビング');
 INSERT INTO "hand_mapping" VALUES ('GIZMO','g ˈɪ z m əʊ','gi zv mo','ギズモ','ギズモ');
 INSERT INTO "hand_mapping" VALUES ('GLAD','g l ˈæ d','gv ra dv','グラド','グラド');
 INSERT INTO "hand_mapping" VALUES ('GLAMORGAN','g l ə m ˈɔː g ə n','gv ra mo - ga nv','グラモーガン','グラモーガン');
@@ -6623,8 +6623,8 @@ INSERT INTO "hand_mapping" VALUES ('GLOSSARY','g l ˈɒ s ə ɹ i','gv ro x sa r
 INSERT INTO "hand_mapping" VALUES ('GLOSSY','g l ˈɒ s i','gv ro x si -','グロッシー','グロッシー');
 INSERT INTO "hand_mapping" VALUES ('GLOUCESTER','g l ˈɒ s t ə','gv ro x sv ta','グロッスタ','グロッスタ');
 INSERT INTO "hand_mapping" VALUES ('GLOUCESTERSHIRE','g l ˈɒ s t ə ʃ ə','gv ro x sv ta sya','グロッスタシャ','グロッスタシャ');
-INSERT INTO "hand_mapping" VALUES ('GLOVE','g l ˈɐ v','gv ra bv','グラブ','グラブ');
-INSERT INTO "hand_mapping" VALUES ('GLOVES','g l ˈɐ v z','gv ra bv zv','グラブズ','グラブズ');
+INSERT INTO "hand_mapping" VALUES ('GLOVE','g l ˈɐ v','gv ra Vv','グラブ','グラブ');
+INSERT INTO "hand_mapping" VALUES ('GLOVES','g l ˈɐ v z','gv ra Vv zv','グラブズ','グラブズ');
 INSERT INTO "hand_mapping" VALUES ('GLOW','g l ˈəʊ','gv ro -','グロー','グロー');
 INSERT INTO "hand_mapping" VALUES ('GLUCOSE(1)','g l ˈuː k ˌəʊ z','gv ru - ko zv','グルーコズ','グルーコズ');
 INSERT INTO "hand_mapping" VALUES ('GLUCOSE(2)','g l ˈuː k ˌəʊ s','gv ru - ko sv','グルーコス','グルーコス');
@@ -6692,19 +6692,19 @@ INSERT INTO "hand_mapping" VALUES ('GOTTEN','g ˈɒ t ə n','go x ta nv','ゴッ
 INSERT INTO "hand_mapping" VALUES ('GOUGE','g ˈaʊ dʒ','ga u jyv','ガウジュ','ガウジュ');
 INSERT INTO "hand_mapping" VALUES ('GOURMET','g ˈʊə m ˌeɪ','gu a me i','グアメイ','グアメイ');
 INSERT INTO "hand_mapping" VALUES ('GOUT','g ˈaʊ t','ga u tv','ガウト','ガウト');
-INSERT INTO "hand_mapping" VALUES ('GOV','g ˈɐ v','ga bv','ガブ','ゴブ');
-INSERT INTO "hand_mapping" VALUES ('GOVERN','g ˈɐ v ə n','ga ba nv','ガバン','ゴバン');
-INSERT INTO "hand_mapping" VALUES ('GOVERNANCE','g ˈɐ v ə n ə n s','ga ba na nv sv','ガバナンス','ゴバナンス');
-INSERT INTO "hand_mapping" VALUES ('GOVERNED','g ˈɐ v ə n d','ga ba nv dv','ガバンド','ゴバンド');
-INSERT INTO "hand_mapping" VALUES ('GOVERNING','g ˈɐ v ə n ɪ ŋ','ga ba ni Nv','ガバニン','ゴバニング');
-INSERT INTO "hand_mapping" VALUES ('GOVERNMENT(1)','g ˈɐ v ə m ə n t','ga ba ma nv tv','ガバマント','ゴバメント');
-INSERT INTO "hand_mapping" VALUES ('GOVERNMENT(2)','g ˈɐ v ə n m ə n t','ga ba nv ma nv tv','ガバンマント','ゴバンメント');
-INSERT INTO "hand_mapping" VALUES ('GOVERNMENTAL(1)','g ˌɐ v ə n m ˈɛ n t ə l','ga ba nv me nv ta rv','ガバンメンタル','ゴバンメンタル');
-INSERT INTO "hand_mapping" VALUES ('GOVERNMENTAL(2)','g ˌɐ v ə m ˈɛ n t ə l','ga ba me nv ta rv','ガバメンタル','ゴバメンタル');
-INSERT INTO "hand_mapping" VALUES ('GOVERNMENTS(1)','g ˈɐ v ə m ə n t s','ga ba ma nv tsv','ガバマンツ','ゴバマンツ');
-INSERT INTO "hand_mapping" VALUES ('GOVERNMENTS(2)','g ˈɐ v ə n m ə n t s','ga ba nv ma nv tsv','ガバンマンツ','ゴバンマンツ');
-INSERT INTO "hand_mapping" VALUES ('GOVERNOR','g ˈɐ v ə n ə','ga ba na','ガバナ','ゴバナ');
-INSERT INTO "hand_mapping" VALUES ('GOVERNORS','g ˈɐ v ə n ə z','ga ba na zv','ガバナズ','ゴバナズ');
+INSERT INTO "hand_mapping" VALUES ('GOV','g ˈɐ v','ga Vv','ガブ','ゴブ');
+INSERT INTO "hand_mapping" VALUES ('GOVERN','g ˈɐ v ə n','ga Va nv','ガバン','ゴバン');
+INSERT INTO "hand_mapping" VALUES ('GOVERNANCE','g ˈɐ v ə n ə n s','ga Va na nv sv','ガバナンス','ゴバナンス');
+INSERT INTO "hand_mapping" VALUES ('GOVERNED','g ˈɐ v ə n d','ga Va nv dv','ガバンド','ゴバンド');
+INSERT INTO "hand_mapping" VALUES ('GOVERNING','g ˈɐ v ə n ɪ ŋ','ga Va ni Nv','ガバニン','ゴバニング');
+INSERT INTO "hand_mapping" VALUES ('GOVERNMENT(1)','g ˈɐ v ə m ə n t','ga Va ma nv tv','ガバマント','ゴバメント');
+INSERT INTO "hand_mapping" VALUES ('GOVERNMENT(2)','g ˈɐ v ə n m ə n t','ga Va nv ma nv tv','ガバンマント','ゴバンメント');
+INSERT INTO "hand_mapping" VALUES ('GOVERNMENTAL(1)','g ˌɐ v ə n m ˈɛ n t ə l','ga Va nv me nv ta rv','ガバンメンタル','ゴバンメンタル');
+INSERT INTO "hand_mapping" VALUES ('GOVERNMENTAL(2)','g ˌɐ v ə m ˈɛ n t ə l','ga Va me nv ta rv','ガバメンタル','ゴバメンタル');
+INSERT INTO "hand_mapping" VALUES ('GOVERNMENTS(1)','g ˈɐ v ə m ə n t s','ga Va ma nv tsv','ガバマンツ','ゴバマンツ');
+INSERT INTO "hand_mapping" VALUES ('GOVERNMENTS(2)','g ˈɐ v ə n m ə n t s','ga Va nv ma nv tsv','ガバンマンツ','ゴバンマンツ');
+INSERT INTO "hand_mapping" VALUES ('GOVERNOR','g ˈɐ v ə n ə','ga Va na','ガバナ','ゴバナ');
+INSERT INTO "hand_mapping" VALUES ('GOVERNORS','g ˈɐ v ə n ə z','ga Va na zv','ガバナズ','ゴバナズ');
 INSERT INTO "hand_mapping" VALUES ('GOWN','g ˈaʊ n','ga u nv','ガウン','ガウン');
 INSERT INTO "hand_mapping" VALUES ('GRAB','g ɹ ˈæ b','gv ra bv','グラブ','グラブ');
 INSERT INTO "hand_mapping" VALUES ('GRABBED','g ɹ ˈæ b d','gv ra bv dv','グラブド','グラブド');
@@ -6772,10 +6772,10 @@ INSERT INTO "hand_mapping" VALUES ('GRATE','g ɹ ˈeɪ t','gv re i tv','グレ
 INSERT INTO "hand_mapping" VALUES ('GRATEFUL','g ɹ ˈeɪ t f ə l','gv re i tv fa rv','グレイトファル','グレイトファル');
 INSERT INTO "hand_mapping" VALUES ('GRATIS','g ɹ ˈæ t ɪ s','gv ra x ti sv','グラッティス','グラッティス');
 INSERT INTO "hand_mapping" VALUES ('GRATITUDE','g ɹ ˈæ t ɪ t j ˌuː d','gv ra x ti tyu - dv','グラッティチュード','グラッティチュード');
-INSERT INTO "hand_mapping" VALUES ('GRAVE','g ɹ ˈeɪ v','gv re i bv','グレイブ','グレイブ');
-INSERT INTO "hand_mapping" VALUES ('GRAVEL','g ɹ ˈæ v ə l','gv ra ba rv','グラバル','グラバル');
-INSERT INTO "hand_mapping" VALUES ('GRAVITY','g ɹ ˈæ v ɪ t i','gv ra bi ti -','グラビティー','グラビティー');
-INSERT INTO "hand_mapping" VALUES ('GRAVY','g ɹ ˈeɪ v i','gv re i bi -','グレイビー','グレイビー');
+INSERT INTO "hand_mapping" VALUES ('GRAVE','g ɹ ˈeɪ v','gv re i Vv','グレイブ','グレイブ');
+INSERT INTO "hand_mapping" VALUES ('GRAVEL','g ɹ ˈæ v ə l','gv ra Va rv','グラバル','グラバル');
+INSERT INTO "hand_mapping" VALUES ('GRAVITY','g ɹ ˈæ v ɪ t i','gv ra Vi ti -','グラビティー','グラビティー');
+INSERT INTO "hand_mapping" VALUES ('GRAVY','g ɹ ˈeɪ v i','gv re i Vi -','グレイビー','グレイビー');
 INSERT INTO "hand_mapping" VALUES ('GRAY','g ɹ ˈeɪ','gv re i','グレイ','グレイ');
 INSERT INTO "hand_mapping" VALUES ('GRAZE','g ɹ ˈeɪ z','gv re i zv','グレイズ','グレイズ');
 INSERT INTO "hand_mapping" VALUES ('GREASE','g ɹ ˈiː s','gv ri - sv','グリース','グリース');
@@ -6821,7 +6821,7 @@ INSERT INTO "hand_mapping" VALUES ('GROANS','g ɹ ˈəʊ n z','gv ro - nv zv','
 INSERT INTO "hand_mapping" VALUES ('GROCERY','g ɹ ˈəʊ s ə ɹ i','gv ro - sa ri -','グローサリー','グローサリー');
 INSERT INTO "hand_mapping" VALUES ('GROIN','g ɹ ˈɔɪ n','gv ro i nv','グロイン','グロイン');
 INSERT INTO "hand_mapping" VALUES ('GROOM','g ɹ ˈuː m','gv ru - mv','グルーム','グルーム');
-INSERT INTO "hand_mapping" VALUES ('GROOVE','g ɹ ˈuː v','gv ru - bv','グルーブ','グルーブ');
+INSERT INTO "hand_mapping" VALUES ('GROOVE','g ɹ ˈuː v','gv ru - Vv','グルーブ','グルーブ');
 INSERT INTO "hand_mapping" VALUES ('GROPE','g ɹ ˈəʊ p','gv ro - pv','グロープ','グロープ');
 INSERT INTO "hand_mapping" VALUES ('GROSS','g ɹ ˈəʊ s','gv ro - sv','グロース','グロース');
 INSERT INTO "hand_mapping" VALUES ('GROTESQUE','g ɹ əʊ t ˈɛ s k','gv ro te sv kv','グロテスク','グロテスク');
@@ -6832,7 +6832,7 @@ INSERT INTO "hand_mapping" VALUES ('GROUP','g ɹ ˈuː p','gv ru - pv','グル
 INSERT INTO "hand_mapping" VALUES ('GROUPING','g ɹ ˈuː p ɪ ŋ','gv ru - pi Nv','グルーピン','グルーピング');
 INSERT INTO "hand_mapping" VALUES ('GROUPINGS','g ɹ ˈuː p ɪ ŋ z','gv ru - pi Nv zv','グルーピンズ','グルーピンズ');
 INSERT INTO "hand_mapping" VALUES ('GROUPS','g ɹ ˈuː p s','gv ru - pv sv','グループス','グループス');
-INSERT INTO "hand_mapping" VALUES ('GROVE','g ɹ ˈəʊ v','gv ro - bv','グローブ','グローブ');
+INSERT INTO "hand_mapping" VALUES ('GROVE','g ɹ ˈəʊ v','gv ro - Vv','グローブ','グローブ');
 INSERT INTO "hand_mapping" VALUES ('GROW','g ɹ ˈəʊ','gv ro -','グロー','グロー');
 INSERT INTO "hand_mapping" VALUES ('GROWING','g ɹ ˈəʊ ɪ ŋ','gv ro - i Nv','グローイン','グローイング');
 INSERT INTO "hand_mapping" VALUES ('GROWL','g ɹ ˈaʊ l','gv ra u rv','グラウル','グラウル');
@@ -6856,7 +6856,7 @@ INSERT INTO "hand_mapping" VALUES ('GUARD','g ˈɑː d','ga - dv','ガード','
 INSERT INTO "hand_mapping" VALUES ('GUARDIAN','g ˈɑː d ɪə n','ga - di a nv','ガーディアン','ガーディアン');
 INSERT INTO "hand_mapping" VALUES ('GUARDS','g ˈɑː d z','ga - zv','ガーズ','ガーズ');
 INSERT INTO "hand_mapping" VALUES ('GUATEMALA','g w ˌɑː t ə m ˈɑː l ə','gwa - ta ma - ra','グァータマーラ','グァータマーラ');
-INSERT INTO "hand_mapping" VALUES ('GUAVA','g w ˈɑː v ə','gwa - ba','グァーバ','グァーバ');
+INSERT INTO "hand_mapping" VALUES ('GUAVA','g w ˈɑː v ə','gwa - Va','グァーバ','グァーバ');
 INSERT INTO "hand_mapping" VALUES ('GUERILLA','g ə ɹ ˈɪ l ə','ga ri ra','ガリラ','ガリラ');
 INSERT INTO "hand_mapping" VALUES ('GUERRILLA','g ə ɹ ˈɪ l ə','ga ri ra','ガリラ','ガリラ');
 INSERT INTO "hand_mapping" VALUES ('GUESS','g ˈɛ s','ge sv','ゲス','ゲス');
@@ -6939,8 +6939,8 @@ INSERT INTO "hand_mapping" VALUES ('HALLOW','h ˈæ l əʊ','ha ro','ハロ','
 INSERT INTO "hand_mapping" VALUES ('HALLOWEEN','h ˌæ l ə w ˈiː n','ha ra wi - nv','ハラウィーン','ハラウィーン');
 INSERT INTO "hand_mapping" VALUES ('HALO','h ˈeɪ l əʊ','he i ro','ヘイロ','ヘイロ');
 INSERT INTO "hand_mapping" VALUES ('HALT','h ˈɒ l t','ho rv tv','ホルト','ホルト');
-INSERT INTO "hand_mapping" VALUES ('HALVE','h ˈɑː v','ha - bv','ハーブ','ハーブ');
-INSERT INTO "hand_mapping" VALUES ('HALVES','h ˈɑː v z','ha - bv zv','ハーブズ','ハーブズ');
+INSERT INTO "hand_mapping" VALUES ('HALVE','h ˈɑː v','ha - Vv','ハーブ','ハーブ');
+INSERT INTO "hand_mapping" VALUES ('HALVES','h ˈɑː v z','ha - Vv zv','ハーブズ','ハーブズ');
 INSERT INTO "hand_mapping" VALUES ('HAM','h ˈæ m','ha mv','ハム','ハム');
 INSERT INTO "hand_mapping" VALUES ('HAMBURG','h ˈæ m b ɜː g','ha Nv be - gv','ハンベーグ','ハンベーグ');
 INSERT INTO "hand_mapping" VALUES ('HAMILTON','h ˈæ m ɪ l t ə n','ha mi rv ta nv','ハミルタン','ハミルタン');
@@ -7001,7 +7001,7 @@ INSERT INTO "hand_mapping" VALUES ('HARBOR','h ˈɑː b ə','ha - ba','ハーバ
 INSERT INTO "hand_mapping" VALUES ('HARBOUR','h ˈɑː b ə','ha - ba','ハーバ','ハーバ');
 INSERT INTO "hand_mapping" VALUES ('HARD','h ˈɑː d','ha - dv','ハード','ハード');
 INSERT INTO "hand_mapping" VALUES ('HARDCORE','h ˈɑː d k ˌɔː','ha - dv ko -','ハードコー','ハードコー');
-INSERT INTO "hand_mapping" VALUES ('HARDCOVER','h ˈɑː d k ˌɐ v ə','ha - dv ka ba','ハードカバ','ハードカバ');
+INSERT INTO "hand_mapping" VALUES ('HARDCOVER','h ˈɑː d k ˌɐ v ə','ha - dv ka Va','ハードカバ','ハードカバ');
 INSERT INTO "hand_mapping" VALUES ('HARDEN','h ˈɑː d ə n','ha - da nv','ハーダン','ハーダン');
 INSERT INTO "hand_mapping" VALUES ('HARDER','h ˈɑː d ə','ha - da','ハーダ','ハーダ');
 INSERT INTO "hand_mapping" VALUES ('HARDLY','h ˈɑː d l i','ha - dv ri -','ハードリー','ハードリー');
@@ -7031,9 +7031,9 @@ INSERT INTO "hand_mapping" VALUES ('HARSH','h ˈɑː ʃ','ha - syv','ハーシ
 INSERT INTO "hand_mapping" VALUES ('HART','h ˈɑː t','ha - tv','ハート','ハート');
 INSERT INTO "hand_mapping" VALUES ('HARTLEPOOL(1)','h ˈɑː t l ɪ p ˌuː l','ha - tv ri pu - rv','ハートリプール','ハートリプール');
 INSERT INTO "hand_mapping" VALUES ('HARTLEPOOL(2)','h ˈɑː t l p ˌuː l','ha - tv rv pu - rv','ハートルプール','ハートルプール');
-INSERT INTO "hand_mapping" VALUES ('HARVARD','h ˈɑː v ə d','ha - ba dv','ハーバド','ハーバド');
-INSERT INTO "hand_mapping" VALUES ('HARVEST','h ˈɑː v ɪ s t','ha - bi sv tv','ハービスト','ハービスト');
-INSERT INTO "hand_mapping" VALUES ('HARVEY','h ˈɑː v i','ha - bi -','ハービー','ハービー');
+INSERT INTO "hand_mapping" VALUES ('HARVARD','h ˈɑː v ə d','ha - Va dv','ハーバド','ハーバド');
+INSERT INTO "hand_mapping" VALUES ('HARVEST','h ˈɑː v ɪ s t','ha - Vi sv tv','ハービスト','ハービスト');
+INSERT INTO "hand_mapping" VALUES ('HARVEY','h ˈɑː v i','ha - Vi -','ハービー','ハービー');
 INSERT INTO "hand_mapping" VALUES ('HAS(1)','h ə z','ha zv','ハズ','ハズ');
 INSERT INTO "hand_mapping" VALUES ('HAS(2)','h ˈæ z','ha zv','ハズ','ハズ');
 INSERT INTO "hand_mapping" VALUES ('HASH','h ˈæ ʃ','ha x syv','ハッシュ','ハッシュ');
@@ -7053,14 +7053,14 @@ INSERT INTO "hand_mapping" VALUES ('HATRED','h ˈeɪ t ɹ ɪ d','he i tv ri dv',
 INSERT INTO "hand_mapping" VALUES ('HATS','h ˈæ t s','ha x tsv','ハッツ','ハッツ');
 INSERT INTO "hand_mapping" VALUES ('HAUL','h ˈɔː l','ho - rv','ホール','ホール');
 INSERT INTO "hand_mapping" VALUES ('HAUNT','h ˈɔː n t','ho - nv tv','ホーント','ホーント');
-INSERT INTO "hand_mapping" VALUES ('HAVE(1)','h ə v','ha bv','ハブ','ハブ');
-INSERT INTO "hand_mapping" VALUES ('HAVE(2)','h ˈæ v','ha bv','ハブ','ハブ');
-INSERT INTO "hand_mapping" VALUES ('HAVEN','h ˈeɪ v ə n','he i ba nv','ヘイバン','ヘイバン');
-INSERT INTO "hand_mapping" VALUES ('HAVEN''T','h ˈæ v ə n t','ha ba nv tv','ハバント','ハバント');
-INSERT INTO "hand_mapping" VALUES ('HAVERHILL','h ˈæ v ɹ ə l','ha bv ra rv','ハブラル','ハブラル');
-INSERT INTO "hand_mapping" VALUES ('HAVERING','h ˈeɪ v ə ɹ ɪ ŋ','he i ba ri Nv','ヘイバリン','ヘイバリング');
-INSERT INTO "hand_mapping" VALUES ('HAVING','h ˈæ v ɪ ŋ','ha bi Nv','ハビン','ハビング');
-INSERT INTO "hand_mapping" VALUES ('HAVOC','h ˈæ v ə k','ha ba kv','ハバク','ハバク');
+INSERT INTO "hand_mapping" VALUES ('HAVE(1)','h ə v','ha Vv','ハブ','ハブ');
+INSERT INTO "hand_mapping" VALUES ('HAVE(2)','h ˈæ v','ha Vv','ハブ','ハブ');
+INSERT INTO "hand_mapping" VALUES ('HAVEN','h ˈeɪ v ə n','he i Va nv','ヘイバン','ヘイバン');
+INSERT INTO "hand_mapping" VALUES ('HAVEN''T','h ˈæ v ə n t','ha Va nv tv','ハバント','ハバント');
+INSERT INTO "hand_mapping" VALUES ('HAVERHILL','h ˈæ v ɹ ə l','ha Vv ra rv','ハブラル','ハブラル');
+INSERT INTO "hand_mapping" VALUES ('HAVERING','h ˈeɪ v ə ɹ ɪ ŋ','he i Va ri Nv','ヘイバリン','ヘイバリング');
+INSERT INTO "hand_mapping" VALUES ('HAVING','h ˈæ v ɪ ŋ','ha Vi Nv','ハビン','ハビング');
+INSERT INTO "hand_mapping" VALUES ('HAVOC','h ˈæ v ə k','ha Va kv','ハバク','ハバク');
 INSERT INTO "hand_mapping" VALUES ('HAWAII','h ə w ˈaɪ i','ha wa i i -','ハワイイー','ハワイイー');
 INSERT INTO "hand_mapping" VALUES ('HAWAIIAN','h ə w ˈaɪ ə n','ha wa i a nv','ハワイアン','ハワイアン');
 INSERT INTO "hand_mapping" VALUES ('HAWICK','h ˈɔɪ k','ho i kv','ホイク','ホイク');
@@ -7113,12 +7113,12 @@ INSERT INTO "hand_mapping" VALUES ('HEATER','h ˈiː t ə','hi - ta','ヒータ'
 INSERT INTO "hand_mapping" VALUES ('HEATH','h ˈiː θ','hi - sv','ヒース','ヒース');
 INSERT INTO "hand_mapping" VALUES ('HEATHER','h ˈɛ ð ə','he za','ヘザ','ヘザ');
 INSERT INTO "hand_mapping" VALUES ('HEATING','h ˈiː t ɪ ŋ','hi - ti Nv','ヒーティン','ヒーティング');
-INSERT INTO "hand_mapping" VALUES ('HEAVE','h ˈiː v','hi - bv','ヒーブ','ヒーブ');
-INSERT INTO "hand_mapping" VALUES ('HEAVEN','h ˈɛ v ə n','he ba nv','ヘバン','ヘバン');
-INSERT INTO "hand_mapping" VALUES ('HEAVENS','h ˈɛ v ə n z','he ba nv zv','ヘバンズ','ヘバンズ');
-INSERT INTO "hand_mapping" VALUES ('HEAVIER','h ˈɛ v ɪə','he bi a','ヘビア','ヘビア');
-INSERT INTO "hand_mapping" VALUES ('HEAVILY','h ˈɛ v ɪ l i','he bi ri -','ヘビリー','ヘビリー');
-INSERT INTO "hand_mapping" VALUES ('HEAVY','h ˈɛ v i','he bi -','ヘビー','ヘビー');
+INSERT INTO "hand_mapping" VALUES ('HEAVE','h ˈiː v','hi - Vv','ヒーブ','ヒーブ');
+INSERT INTO "hand_mapping" VALUES ('HEAVEN','h ˈɛ v ə n','he Va nv','ヘバン','ヘバン');
+INSERT INTO "hand_mapping" VALUES ('HEAVENS','h ˈɛ v ə n z','he Va nv zv','ヘバンズ','ヘバンズ');
+INSERT INTO "hand_mapping" VALUES ('HEAVIER','h ˈɛ v ɪə','he Vi a','ヘビア','ヘビア');
+INSERT INTO "hand_mapping" VALUES ('HEAVILY','h ˈɛ v ɪ l i','he Vi ri -','ヘビリー','ヘビリー');
+INSERT INTO "hand_mapping" VALUES ('HEAVY','h ˈɛ v i','he Vi -','ヘビー','ヘビー');
 INSERT INTO "hand_mapping" VALUES ('HEBREW','h ˈiː b ɹ uː','hi - bv ru -','ヒーブルー','ヒーブルー');
 INSERT INTO "hand_mapping" VALUES ('HECK','h ˈɛ k','he kv','ヘク','ヘク');
 INSERT INTO "hand_mapping" VALUES ('HECTARE(1)','h ˈɛ k t ɑː','he kv ta','ヘクタ','ヘクタ');
@@ -7275,7 +7275,7 @@ INSERT INTO "hand_mapping" VALUES ('HITHERTO','h ˌɪ ð ə t ˈuː','hi - za tu
 INSERT INTO "hand_mapping" VALUES ('HITLER','h ˈɪ t l ə','hi tv ra','ヒトラ','ヒトラ');
 INSERT INTO "hand_mapping" VALUES ('HITS','h ˈɪ t s','hi tsv','ヒツ','ヒツ');
 INSERT INTO "hand_mapping" VALUES ('HITTING','h ˈɪ t ɪ ŋ','hi ti Nv','ヒティン','ヒティング');
-INSERT INTO "hand_mapping" VALUES ('HIVE','h ˈaɪ v','ha i bv','ハイブ','ハイブ');
+INSERT INTO "hand_mapping" VALUES ('HIVE','h ˈaɪ v','ha i Vv','ハイブ','ハイブ');
 INSERT INTO "hand_mapping" VALUES ('HM','h m','hv mv','フム','フム');
 INSERT INTO "hand_mapping" VALUES ('HOARD','h ˈɔː d','ho - dv','ホード','ホード');
 INSERT INTO "hand_mapping" VALUES ('HOARSE','h ˈɔː s','ho - sv','ホース','ホース');
@@ -7350,8 +7350,8 @@ INSERT INTO "hand_mapping" VALUES ('HOOKED','h ˈʊ k t','hu kv tv','フクト',
 INSERT INTO "hand_mapping" VALUES ('HOOP','h ˈuː p','hu - pv','フープ','フープ');
 INSERT INTO "hand_mapping" VALUES ('HOORAY','h ʊ ɹ ˈeɪ','hu re i','フレイ','フレイ');
 INSERT INTO "hand_mapping" VALUES ('HOOT','h ˈuː t','hu - tv','フート','フート');
-INSERT INTO "hand_mapping" VALUES ('HOOVER','h ˈuː v ə','hu - ba','フーバ','フーバ');
-INSERT INTO "hand_mapping" VALUES ('HOOVES','h ˈuː v z','hu - bv zv','フーブズ','フーブズ');
+INSERT INTO "hand_mapping" VALUES ('HOOVER','h ˈuː v ə','hu - Va','フーバ','フーバ');
+INSERT INTO "hand_mapping" VALUES ('HOOVES','h ˈuː v z','hu - Vv zv','フーブズ','フーブズ');
 INSERT INTO "hand_mapping" VALUES ('HOP','h ˈɒ p','ho x pv','ホップ','ホップ');
 INSERT INTO "hand_mapping" VALUES ('HOPE','h ˈəʊ p','ho - pv','ホープ','ホープ');
 INSERT INTO "hand_mapping" VALUES ('HOPED','h ˈəʊ p t','ho - pv tv','ホープト','ホープト');
@@ -7408,19 +7408,19 @@ INSERT INTO "hand_mapping" VALUES ('HOUSEHOLDS','h ˈaʊ s h ˌəʊ l d z','ha u
 INSERT INTO "hand_mapping" VALUES ('HOUSES','h ˈaʊ z ɪ z','ha u zi zv','ハウジズ','ハウジズ');
 INSERT INTO "hand_mapping" VALUES ('HOUSEWARES','h ˈaʊ s w ˌɛə z','ha u swe a - zv','ハウスェアーズ','ハウスェアーズ');
 INSERT INTO "hand_mapping" VALUES ('HOUSEWIFE','h ˈaʊ s w ˌaɪ f','ha u swa i fv','ハウスァイフ','ハウスァイフ');
-INSERT INTO "hand_mapping" VALUES ('HOUSEWIVES','h ˈaʊ s w ˌaɪ v z','ha u swa i bv zv','ハウスァイブズ','ハウスァイブズ');
+INSERT INTO "hand_mapping" VALUES ('HOUSEWIVES','h ˈaʊ s w ˌaɪ v z','ha u swa i Vv zv','ハウスァイブズ','ハウスァイブズ');
 INSERT INTO "hand_mapping" VALUES ('HOUSEWORK','h ˈaʊ s w ˌɜː k','ha u swe - kv','ハウスェーク','ハウスェーク');
 INSERT INTO "hand_mapping" VALUES ('HOUSING','h ˈaʊ z ɪ ŋ','ha u zi Nv','ハウジン','ハウジング');
 INSERT INTO "hand_mapping" VALUES ('HOUSTON','h j ˈuː s t ə n','hyu - sv ta nv','ヒュースタン','ヒュースタン');
-INSERT INTO "hand_mapping" VALUES ('HOVE','h ˈəʊ v','ho - bv','ホーブ','ホーブ');
-INSERT INTO "hand_mapping" VALUES ('HOVEL','h ˈɒ v ə l','ho ba rv','ホバル','ホバル');
-INSERT INTO "hand_mapping" VALUES ('HOVER','h ˈɒ v ə','ho ba','ホバ','ホバ');
-INSERT INTO "hand_mapping" VALUES ('HOVERCRAFT','h ˈɒ v ə k ɹ ˌɑː f t','ho ba kv ra - fv tv','ホバクラーフト','ホバクラーフト');
+INSERT INTO "hand_mapping" VALUES ('HOVE','h ˈəʊ v','ho - Vv','ホーブ','ホーブ');
+INSERT INTO "hand_mapping" VALUES ('HOVEL','h ˈɒ v ə l','ho Va rv','ホバル','ホバル');
+INSERT INTO "hand_mapping" VALUES ('HOVER','h ˈɒ v ə','ho Va','ホバ','ホバ');
+INSERT INTO "hand_mapping" VALUES ('HOVERCRAFT','h ˈɒ v ə k ɹ ˌɑː f t','ho Va kv ra - fv tv','ホバクラーフト','ホバクラーフト');
 INSERT INTO "hand_mapping" VALUES ('HOW','h ˈaʊ','ha u','ハウ','ハウ');
 INSERT INTO "hand_mapping" VALUES ('HOW-TO','h ˈaʊ t uː','ha u tu -','ハウトゥー','ハウトゥー');
 INSERT INTO "hand_mapping" VALUES ('HOWARD','h ˈaʊ ə d','ha u a dv','ハウアド','ハウアド');
 INSERT INTO "hand_mapping" VALUES ('HOWDY','h ˈaʊ d i','ha u di -','ハウディー','ハウディー');
-INSERT INTO "hand_mapping" VALUES ('HOWEVER','h ˌaʊ ˈɛ v ə','ha u e ba','ハウエバ','ハウエバ');
+INSERT INTO "hand_mapping" VALUES ('HOWEVER','h ˌaʊ ˈɛ v ə','ha u e Va','ハウエバ','ハウエバ');
 INSERT INTO "hand_mapping" VALUES ('HOWL','h ˈaʊ l','ha u rv','ハウル','ハウル');
 INSERT INTO "hand_mapping" VALUES ('HUB','h ˈɐ b','ha bv','ハブ','ハブ');
 INSERT INTO "hand_mapping" VALUES ('HUDDERSFIELD','h ˈɐ d ə z f iː l d','ha da zv fi - rv dv','ハダズフィールド','ハダズフィールド');
@@ -7555,7 +7555,7 @@ INSERT INTO "hand_mapping" VALUES ('IMAGERY','ˈɪ m ɪ dʒ ɹ i','i mi jyv ri -
 INSERT INTO "hand_mapping" VALUES ('IMAGES','ˈɪ m ɪ dʒ ɪ z','i mi jyi zv','イミジィズ','イミジィズ');
 INSERT INTO "hand_mapping" VALUES ('IMAGINARY','ɪ m ˈæ dʒ ɪ n ə ɹ i','i ma jyi na ri -','イマジィナリー','イマジィナリー');
 INSERT INTO "hand_mapping" VALUES ('IMAGINATION','ɪ m ˌæ dʒ ɪ n ˈeɪ ʃ ə n','i ma jyi ne i sya nv','イマジィネイシャン','イマジィネイション');
-INSERT INTO "hand_mapping" VALUES ('IMAGINATIVE','ɪ m ˈæ dʒ ɪ n ə t ɪ v','i ma jyi na ti bv','イマジィナティブ','イマジィナティブ');
+INSERT INTO "hand_mapping" VALUES ('IMAGINATIVE','ɪ m ˈæ dʒ ɪ n ə t ɪ v','i ma jyi na ti Vv','イマジィナティブ','イマジィナティブ');
 INSERT INTO "hand_mapping" VALUES ('IMAGINE','ɪ m ˈæ dʒ ɪ n','i ma jyi nv','イマジィン','イマジィン');
 INSERT INTO "hand_mapping" VALUES ('IMAGINED','ɪ m ˈæ dʒ ɪ n d','i ma jyi nv dv','イマジィンド','イマジィンド');
 INSERT INTO "hand_mapping" VALUES ('IMAGING','ˈɪ m ɪ dʒ ɪ ŋ','i mi jyi Nv','イミジィン','イミジィング');
@@ -7606,16 +7606,16 @@ INSERT INTO "hand_mapping" VALUES ('IMPOSSIBLE','ɪ m p ˈɒ s ɪ b ə l','i Nv
 INSERT INTO "hand_mapping" VALUES ('IMPRESS','ɪ m p ɹ ˈɛ s','i npv re sv','インプレス','インプレス');
 INSERT INTO "hand_mapping" VALUES ('IMPRESSED','ɪ m p ɹ ˈɛ s t','i npv re sv tv','インプレスト','インプレスト');
 INSERT INTO "hand_mapping" VALUES ('IMPRESSION','ɪ m p ɹ ˈɛ ʃ ə n','i npv re sya nv','インプレシャン','インプレション');
-INSERT INTO "hand_mapping" VALUES ('IMPRESSIVE','ɪ m p ɹ ˈɛ s ɪ v','i npv re si bv','インプレシブ','インプレシブ');
+INSERT INTO "hand_mapping" VALUES ('IMPRESSIVE','ɪ m p ɹ ˈɛ s ɪ v','i npv re si Vv','インプレシブ','インプレシブ');
 INSERT INTO "hand_mapping" VALUES ('IMPRISONMENT','ɪ m p ɹ ˈɪ z ə n m ə n t','i npv ri za nv ma nv tv','インプリザンマント','インプリザンメント');
-INSERT INTO "hand_mapping" VALUES ('IMPROVE','ɪ m p ɹ ˈuː v','i npv ru - bv','インプルーブ','インプルーブ');
-INSERT INTO "hand_mapping" VALUES ('IMPROVED','ɪ m p ɹ ˈuː v d','i npv ru - bv dv','インプルーブド','インプルーブド');
-INSERT INTO "hand_mapping" VALUES ('IMPROVEMENT','ɪ m p ɹ ˈuː v m ə n t','i npv ru - bv ma nv tv','インプルーブマント','インプルーブメント');
-INSERT INTO "hand_mapping" VALUES ('IMPROVEMENTS','ɪ m p ɹ ˈuː v m ə n t s','i npv ru - bv ma nv tsv','インプルーブマンツ','インプルーブマンツ');
-INSERT INTO "hand_mapping" VALUES ('IMPROVING','ɪ m p ɹ ˈuː v ɪ ŋ','i npv ru - bi Nv','インプルービン','インプルービング');
+INSERT INTO "hand_mapping" VALUES ('IMPROVE','ɪ m p ɹ ˈuː v','i npv ru - Vv','インプルーブ','インプルーブ');
+INSERT INTO "hand_mapping" VALUES ('IMPROVED','ɪ m p ɹ ˈuː v d','i npv ru - Vv dv','インプルーブド','インプルーブド');
+INSERT INTO "hand_mapping" VALUES ('IMPROVEMENT','ɪ m p ɹ ˈuː v m ə n t','i npv ru - Vv ma nv tv','インプルーブマント','インプルーブメント');
+INSERT INTO "hand_mapping" VALUES ('IMPROVEMENTS','ɪ m p ɹ ˈuː v m ə n t s','i npv ru - Vv ma nv tsv','インプルーブマンツ','インプルーブマンツ');
+INSERT INTO "hand_mapping" VALUES ('IMPROVING','ɪ m p ɹ ˈuː v ɪ ŋ','i npv ru - Vi Nv','インプルービン','インプルービング');
 INSERT INTO "hand_mapping" VALUES ('IMPULSE','ˈɪ m p ɐ l s','i Nv pa rv sv','インパルス','インパルス');
 INSERT INTO "hand_mapping" VALUES ('IMPULSES','ˈɪ m p ɐ l s ɪ z','i Nv pa rv si zv','インパルシズ','インパルシズ');
-INSERT INTO "hand_mapping" VALUES ('IMPULSIVE','ɪ m p ˈɐ l s ɪ v','i Nv pa rv si bv','インパルシブ','インパルシブ');
+INSERT INTO "hand_mapping" VALUES ('IMPULSIVE','ɪ m p ˈɐ l s ɪ v','i Nv pa rv si Vv','インパルシブ','インパルシブ');
 INSERT INTO "hand_mapping" VALUES ('IN(1)','ɪ n','i nv','イン','イン');
 INSERT INTO "hand_mapping" VALUES ('IN(2)','ˈɪ n','i nv','イン','イン');
 INSERT INTO "hand_mapping" VALUES ('INABILITY','ˌɪ n ə b ˈɪ l ɪ t i','i - na bi ri ti -','イーナビリティー','イーナビリティー');
@@ -7630,8 +7630,8 @@ INSERT INTO "hand_mapping" VALUES ('INCARNATE(1)','ɪ n k ˈɑː n eɪ t','i nv
 INSERT INTO "hand_mapping" VALUES ('INCARNATE(2)','ɪ n k ˈɑː n ɪ t','i nv ka - ni tv','インカーニト','インカーニト');
 INSERT INTO "hand_mapping" VALUES ('INCENSE(1)','ɪ n s ˈɛ n s','i nv se nv sv','インセンス','インセンス');
 INSERT INTO "hand_mapping" VALUES ('INCENSE(2)','ˈɪ n s ɛ n s','i nv se nv sv','インセンス','インセンス');
-INSERT INTO "hand_mapping" VALUES ('INCENTIVE','ɪ n s ˈɛ n t ɪ v','i nv se nv ti bv','インセンティブ','インセンティブ');
-INSERT INTO "hand_mapping" VALUES ('INCENTIVES','ɪ n s ˈɛ n t ɪ v z','i nv se nv ti bv zv','インセンティブズ','インセンティブズ');
+INSERT INTO "hand_mapping" VALUES ('INCENTIVE','ɪ n s ˈɛ n t ɪ v','i nv se nv ti Vv','インセンティブ','インセンティブ');
+INSERT INTO "hand_mapping" VALUES ('INCENTIVES','ɪ n s ˈɛ n t ɪ v z','i nv se nv ti Vv zv','インセンティブズ','インセンティブズ');
 INSERT INTO "hand_mapping" VALUES ('INCEST','ˈɪ n s ˌɛ s t','i nv se - sv tv','インセースト','インセースト');
 INSERT INTO "hand_mapping" VALUES ('INCH','ˈɪ n tʃ','i nv tyv','インチュ','インチュ');
 INSERT INTO "hand_mapping" VALUES ('INCHES','ˈɪ n tʃ ɪ z','i nv tyi zv','インチィズ','インチィズ');
@@ -7647,7 +7647,7 @@ INSERT INTO "hand_mapping" VALUES ('INCLUDED','ɪ n k l ˈuː d ɪ d','i nv kv r
 INSERT INTO "hand_mapping" VALUES ('INCLUDES','ɪ n k l ˈuː d z','i nv kv ru - zv','インクルーズ','インクルーズ');
 INSERT INTO "hand_mapping" VALUES ('INCLUDING','ɪ n k l ˈuː d ɪ ŋ','i nv kv ru - di Nv','インクルーディン','インクルーディング');
 INSERT INTO "hand_mapping" VALUES ('INCLUSION','ɪ n k l ˈuː ʒ ə n','i nv kv ru - jya nv','インクルージャン','インクルージョン');
-INSERT INTO "hand_mapping" VALUES ('INCLUSIVE','ɪ n k l ˈuː s ɪ v','i nv kv ru - si bv','インクルーシブ','インクルーシブ');
+INSERT INTO "hand_mapping" VALUES ('INCLUSIVE','ɪ n k l ˈuː s ɪ v','i nv kv ru - si Vv','インクルーシブ','インクルーシブ');
 INSERT INTO "hand_mapping" VALUES ('INCOME','ˈɪ n k ˌɐ m','i nv ka mv','インカム','インカム');
 INSERT INTO "hand_mapping" VALUES ('INCOMES','ˈɪ n k ˌɐ m z','i nv ka mv zv','インカムズ','インカムズ');
 INSERT INTO "hand_mapping" VALUES ('INCOMING','ˈɪ n k ˌɐ m ɪ ŋ','i nv ka mi Nv','インカミン','インカミング');
@@ -7706,9 +7706,9 @@ INSERT INTO "hand_mapping" VALUES ('INDIRECTLY(1)','ɪ n d ɪ ɹ ˈɛ k t l i','
 INSERT INTO "hand_mapping" VALUES ('INDIRECTLY(2)','ɪ n d aɪ ɹ ˈɛ k t l i','i nv da i re kv tv ri -','インダイレクトリー','インダイレクトリー');
 INSERT INTO "hand_mapping" VALUES ('INDISCRIMINATE','ɪ n d ɪ s k ɹ ˈɪ m ɪ n ɪ t','i nv di sv kv ri mi ni tv','インディスクリミニト','インディスクリミニト');
 INSERT INTO "hand_mapping" VALUES ('INDISTINCT','ˌɪ n d ɪ s t ˈɪ ŋ k t','i - nv di sv ti Nv kv tv','イーンディスティンクト','イーンディスティンクト');
-INSERT INTO "hand_mapping" VALUES ('INDIVIDUAL','ˌɪ n d ɪ v ˈɪ d j ʊə l','i - nv di bi dyu a rv','イーンディビデュアル','イーンディビデュアル');
-INSERT INTO "hand_mapping" VALUES ('INDIVIDUALLY','ˌɪ n d ɪ v ˈɪ d j ʊə l i','i - nv di bi dyu a ri -','イーンディビデュアリー','イーンディビデュアリー');
-INSERT INTO "hand_mapping" VALUES ('INDIVIDUALS','ˌɪ n d ɪ v ˈɪ d j ʊə l z','i - nv di bi dyu a rv zv','イーンディビデュアルズ','イーンディビデュアルズ');
+INSERT INTO "hand_mapping" VALUES ('INDIVIDUAL','ˌɪ n d ɪ v ˈɪ d j ʊə l','i - nv di Vi dyu a rv','イーンディビデュアル','イーンディビデュアル');
+INSERT INTO "hand_mapping" VALUES ('INDIVIDUALLY','ˌɪ n d ɪ v ˈɪ d j ʊə l i','i - nv di Vi dyu a ri -','イーンディビデュアリー','イーンディビデュアリー');
+INSERT INTO "hand_mapping" VALUES ('INDIVIDUALS','ˌɪ n d ɪ v ˈɪ d j ʊə l z','i - nv di Vi dyu a rv zv','イーンディビデュアルズ','イーンディビデュアルズ');
 INSERT INTO "hand_mapping" VALUES ('INDONESIA','ˌɪ n d ə n ˈiː ʒ ə','i - nv da ni - jya','イーンダニージャ','イーンダニージャ');
 INSERT INTO "hand_mapping" VALUES ('INDONESIAN(1)','ˌɪ n d ə n ˈiː ʒ ə n','i - nv da ni - jya nv','イーンダニージャン','イーンダニージャン');
 INSERT INTO "hand_mapping" VALUES ('INDONESIAN(2)','ˌɪ n d əʊ n ˈiː ʒ ə n','i - nv do ni - jya nv','イーンドニージャン','イーンドニージャン');
@@ -7728,9 +7728,9 @@ INSERT INTO "hand_mapping" VALUES ('INDUSTRY','ˈɪ n d ə s t ɹ i','i nv da sv
 INSERT INTO "hand_mapping" VALUES ('INEPT','ɪ n ˈɛ p t','i ne pv tv','イネプト','イネプト');
 INSERT INTO "hand_mapping" VALUES ('INEQUALITY','ˌɪ n ɪ k w ˈɒ l ɪ t i','i - ni kwo ri ti -','イーニクォリティー','イーニクォリティー');
 INSERT INTO "hand_mapping" VALUES ('INERT','ɪ n ˈɜː t','i ne - tv','イネート','イネート');
-INSERT INTO "hand_mapping" VALUES ('INEVITABLE','ɪ n ˈɛ v ɪ t ə b ə l','i ne bi ta ba rv','イネビタバル','イネビタバル');
-INSERT INTO "hand_mapping" VALUES ('INEVITABLY','ɪ n ˈɛ v ɪ t ə b l i','i ne bi ta bv ri -','イネビタブリー','イネビタブリー');
-INSERT INTO "hand_mapping" VALUES ('INEXPENSIVE','ˌɪ n ɪ k s p ˈɛ n s ɪ v','i - ni kv sv pe nv si bv','イーニクスペンシブ','イーニクスペンシブ');
+INSERT INTO "hand_mapping" VALUES ('INEVITABLE','ɪ n ˈɛ v ɪ t ə b ə l','i ne Vi ta ba rv','イネビタバル','イネビタバル');
+INSERT INTO "hand_mapping" VALUES ('INEVITABLY','ɪ n ˈɛ v ɪ t ə b l i','i ne Vi ta bv ri -','イネビタブリー','イネビタブリー');
+INSERT INTO "hand_mapping" VALUES ('INEXPENSIVE','ˌɪ n ɪ k s p ˈɛ n s ɪ v','i - ni kv sv pe nv si Vv','イーニクスペンシブ','イーニクスペンシブ');
 INSERT INTO "hand_mapping" VALUES ('INFAMOUS','ˈɪ n f ə m ə s','i nv fa ma sv','インファマス','インファマス');
 INSERT INTO "hand_mapping" VALUES ('INFANT','ˈɪ n f ə n t','i nv fa nv tv','インファント','インファント');
 INSERT INTO "hand_mapping" VALUES ('INFANTS','ˈɪ n f ə n t s','i nv fa nv tsv','インファンツ','インファンツ');
@@ -7757,7 +7757,7 @@ INSERT INTO "hand_mapping" VALUES ('INFORM','ɪ n f ˈɔː m','i nv fo - mv','
 INSERT INTO "hand_mapping" VALUES ('INFORMAL','ɪ n f ˈɔː m ə l','i nv fo - ma rv','インフォーマル','インフォーマル');
 INSERT INTO "hand_mapping" VALUES ('INFORMATION','ˌɪ n f ə m ˈeɪ ʃ ə n','i - nv fa me i sya nv','イーンファメイシャン','イーンファメイション');
 INSERT INTO "hand_mapping" VALUES ('INFORMATIONAL','ˌɪ n f ə m ˈeɪ ʃ ə n ə l','i - nv fa me i sya na rv','イーンファメイシャナル','イーンファメイシャナル');
-INSERT INTO "hand_mapping" VALUES ('INFORMATIVE','ɪ n f ˈɔː m ə t ɪ v','i nv fo - ma ti bv','インフォーマティブ','インフォーマティブ');
+INSERT INTO "hand_mapping" VALUES ('INFORMATIVE','ɪ n f ˈɔː m ə t ɪ v','i nv fo - ma ti Vv','インフォーマティブ','インフォーマティブ');
 INSERT INTO "hand_mapping" VALUES ('INFORMED','ɪ n f ˈɔː m d','i nv fo - mv dv','インフォームド','インフォームド');
 INSERT INTO "hand_mapping" VALUES ('INFRARED','ˌɪ n f ɹ ə ɹ ˈɛ d','i - nv fv ra re dv','イーンフラレド','イーンフラレド');
 INSERT INTO "hand_mapping" VALUES ('INFRASTRUCTURE','ˌɪ n f ɹ ə s t ɹ ˈɐ k tʃ ə','i - nv fv ra sv tv ra kv tya','イーンフラストラクチャ','イーンフラストラクチャ');
@@ -7780,10 +7780,10 @@ INSERT INTO "hand_mapping" VALUES ('INITIALLY','ɪ n ˈɪ ʃ ə l i','i ni sya r
 INSERT INTO "hand_mapping" VALUES ('INITIATE','ɪ n ˈɪ ʃ ɪ ˌeɪ t','i ni syi e i tv','イニシエイト','イニシエイト');
 INSERT INTO "hand_mapping" VALUES ('INITIATED','ɪ n ˈɪ ʃ ɪ ˌeɪ t ɪ d','i ni syi e i ti dv','イニシエイティド','イニシエイティド');
 INSERT INTO "hand_mapping" VALUES ('INITIATION','ɪ n ˌɪ ʃ ɪ ˈeɪ ʃ ə n','i ni - syi e i sya nv','イニーシエイシャン','イニーシエイション');
-INSERT INTO "hand_mapping" VALUES ('INITIATIVE(1)','ɪ n ˈɪ ʃ ə t ɪ v','i ni sya ti bv','イニシャティブ','イニシャティブ');
-INSERT INTO "hand_mapping" VALUES ('INITIATIVE(2)','ɪ n ˈɪ ʃ ɪə t ɪ v','i ni syi a ti bv','イニシアティブ','イニシアティブ');
-INSERT INTO "hand_mapping" VALUES ('INITIATIVES(1)','ɪ n ˈɪ ʃ ə t ɪ v z','i ni sya ti bv zv','イニシャティブズ','イニシャティブズ');
-INSERT INTO "hand_mapping" VALUES ('INITIATIVES(2)','ɪ n ˈɪ ʃ ɪə t ɪ v z','i ni syi a ti bv zv','イニシアティブズ','イニシアティブズ');
+INSERT INTO "hand_mapping" VALUES ('INITIATIVE(1)','ɪ n ˈɪ ʃ ə t ɪ v','i ni sya ti Vv','イニシャティブ','イニシャティブ');
+INSERT INTO "hand_mapping" VALUES ('INITIATIVE(2)','ɪ n ˈɪ ʃ ɪə t ɪ v','i ni syi a ti Vv','イニシアティブ','イニシアティブ');
+INSERT INTO "hand_mapping" VALUES ('INITIATIVES(1)','ɪ n ˈɪ ʃ ə t ɪ v z','i ni sya ti Vv zv','イニシャティブズ','イニシャティブズ');
+INSERT INTO "hand_mapping" VALUES ('INITIATIVES(2)','ɪ n ˈɪ ʃ ɪə t ɪ v z','i ni syi a ti Vv zv','イニシアティブズ','イニシアティブズ');
 INSERT INTO "hand_mapping" VALUES ('INJECT','ɪ n dʒ ˈɛ k t','i nv jye kv tv','インジェクト','インジェクト');
 INSERT INTO "hand_mapping" VALUES ('INJECTION','ɪ n dʒ ˈɛ k ʃ ə n','i nv jye kv sya nv','インジェクシャン','インジェクション');
 INSERT INTO "hand_mapping" VALUES ('INJUNCTION(1)','ɪ n dʒ ˈɐ ŋ ʃ ə n','i nv jya Nv sya nv','インジャンシャン','インジャンション');
@@ -7806,10 +7806,10 @@ INSERT INTO "hand_mapping" VALUES ('INNATE(2)','ɪ n ˈeɪ t','i ne i tv','イ
 INSERT INTO "hand_mapping" VALUES ('INNER','ˈɪ n ə','i na','イナ','イナ');
 INSERT INTO "hand_mapping" VALUES ('INNOCENCE','ˈɪ n ə s ə n s','i na sa nv sv','イナサンス','イナサンス');
 INSERT INTO "hand_mapping" VALUES ('INNOCENT','ˈɪ n ə s ə n t','i na sa nv tv','イナサント','イナサント');
-INSERT INTO "hand_mapping" VALUES ('INNOVATION','ˌɪ n ə v ˈeɪ ʃ ə n','i - na be i sya nv','イーナベイシャン','イーナベイション');
-INSERT INTO "hand_mapping" VALUES ('INNOVATIONS','ˌɪ n ə v ˈeɪ ʃ ə n z','i - na be i sya nv zv','イーナベイシャンズ','イーナベイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('INNOVATIVE(1)','ˈɪ n ə v ə t ɪ v','i na ba ti bv','イナバティブ','イナバティブ');
-INSERT INTO "hand_mapping" VALUES ('INNOVATIVE(2)','ˈɪ n ə v ˌeɪ t ɪ v','i na be i ti bv','イナベイティブ','イナベイティブ');
+INSERT INTO "hand_mapping" VALUES ('INNOVATION','ˌɪ n ə v ˈeɪ ʃ ə n','i - na Ve i sya nv','イーナベイシャン','イーナベイション');
+INSERT INTO "hand_mapping" VALUES ('INNOVATIONS','ˌɪ n ə v ˈeɪ ʃ ə n z','i - na Ve i sya nv zv','イーナベイシャンズ','イーナベイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('INNOVATIVE(1)','ˈɪ n ə v ə t ɪ v','i na Va ti Vv','イナバティブ','イナバティブ');
+INSERT INTO "hand_mapping" VALUES ('INNOVATIVE(2)','ˈɪ n ə v ˌeɪ t ɪ v','i na Ve i ti Vv','イナベイティブ','イナベイティブ');
 INSERT INTO "hand_mapping" VALUES ('INNS','ˈɪ n z','i nv zv','インズ','インズ');
 INSERT INTO "hand_mapping" VALUES ('INPUT','ˈɪ n p ˌʊ t','i nv pu tv','インプト','インプト');
 INSERT INTO "hand_mapping" VALUES ('INPUTS','ˈɪ n p ˌʊ t s','i nv pu tsv','インプツ','インプツ');
@@ -7900,7 +7900,7 @@ INSERT INTO "hand_mapping" VALUES ('INTENDED','ɪ n t ˈɛ n d ɪ d','i nv te nv
 INSERT INTO "hand_mapping" VALUES ('INTENDS','ɪ n t ˈɛ n d z','i nv te nv zv','インテンズ','インテンズ');
 INSERT INTO "hand_mapping" VALUES ('INTENSE','ɪ n t ˈɛ n s','i nv te nv sv','インテンス','インテンス');
 INSERT INTO "hand_mapping" VALUES ('INTENSITY','ɪ n t ˈɛ n s ɪ t i','i nv te nv si ti -','インテンシティー','インテンシティー');
-INSERT INTO "hand_mapping" VALUES ('INTENSIVE','ɪ n t ˈɛ n s ɪ v','i nv te nv si bv','インテンシブ','インテンシブ');
+INSERT INTO "hand_mapping" VALUES ('INTENSIVE','ɪ n t ˈɛ n s ɪ v','i nv te nv si Vv','インテンシブ','インテンシブ');
 INSERT INTO "hand_mapping" VALUES ('INTENT','ɪ n t ˈɛ n t','i nv te nv tv','インテント','インテント');
 INSERT INTO "hand_mapping" VALUES ('INTENTION','ɪ n t ˈɛ n ʃ ə n','i nv te nv sya nv','インテンシャン','インテンション');
 INSERT INTO "hand_mapping" VALUES ('INTENTIONS','ɪ n t ˈɛ n ʃ ə n z','i nv te nv sya nv zv','インテンシャンズ','インテンシャンズ');
@@ -7908,7 +7908,7 @@ INSERT INTO "hand_mapping" VALUES ('INTER','ɪ n t ˈɜː','i nv te -','イン
 INSERT INTO "hand_mapping" VALUES ('INTERACT','ˌɪ n t ə ɹ ˈæ k t','i - nv ta ra x kv tv','イーンタラックト','イーンタラックト');
 INSERT INTO "hand_mapping" VALUES ('INTERACTION','ˌɪ n t ə ɹ ˈæ k ʃ ə n','i - nv ta ra x kv sya nv','イーンタラックシャン','イーンタラックション');
 INSERT INTO "hand_mapping" VALUES ('INTERACTIONS','ˌɪ n t ə ɹ ˈæ k ʃ ə n z','i - nv ta ra x kv sya nv zv','イーンタラックシャンズ','イーンタラックシャンズ');
-INSERT INTO "hand_mapping" VALUES ('INTERACTIVE','ˌɪ n t ə ɹ ˈæ k t ɪ v','i - nv ta ra x kv ti bv','イーンタラックティブ','イーンタラックティブ');
+INSERT INTO "hand_mapping" VALUES ('INTERACTIVE','ˌɪ n t ə ɹ ˈæ k t ɪ v','i - nv ta ra x kv ti Vv','イーンタラックティブ','イーンタラックティブ');
 INSERT INTO "hand_mapping" VALUES ('INTERCOURSE','ˈɪ n t ə k ˌɔː s','i nv ta ko - sv','インタコース','インタコース');
 INSERT INTO "hand_mapping" VALUES ('INTEREST(1)','ˈɪ n t ɹ ɪ s t','i nv tv ri sv tv','イントリスト','イントリスト');
 INSERT INTO "hand_mapping" VALUES ('INTEREST(2)','ˈɪ n t ə ɹ ɪ s t','i nv ta ri sv tv','インタリスト','インタリスト');
@@ -7942,18 +7942,18 @@ INSERT INTO "hand_mapping" VALUES ('INTERRACIAL','ˌɪ n t ə ɹ ˈeɪ ʃ ə l',
 INSERT INTO "hand_mapping" VALUES ('INTERRUPT','ˌɪ n t ə ɹ ˈɐ p t','i - nv ta ra pv tv','イーンタラプト','イーンタラプト');
 INSERT INTO "hand_mapping" VALUES ('INTERSECTION','ˌɪ n t ə s ˈɛ k ʃ ə n','i - nv ta se kv sya nv','イーンタセクシャン','イーンタセクション');
 INSERT INTO "hand_mapping" VALUES ('INTERSTATE','ˈɪ n t ə s t ˌeɪ t','i nv ta sv te i tv','インタステイト','インタステイト');
-INSERT INTO "hand_mapping" VALUES ('INTERVAL','ˈɪ n t ə v ə l','i nv ta ba rv','インタバル','インタバル');
-INSERT INTO "hand_mapping" VALUES ('INTERVALS','ˈɪ n t ə v ə l z','i nv ta ba rv zv','インタバルズ','インタバルズ');
-INSERT INTO "hand_mapping" VALUES ('INTERVENE','ˌɪ n t ə v ˈiː n','i - nv ta bi - nv','イーンタビーン','イーンタビーン');
-INSERT INTO "hand_mapping" VALUES ('INTERVENTION','ˌɪ n t ə v ˈɛ n ʃ ə n','i - nv ta be nv sya nv','イーンタベンシャン','イーンタベンション');
-INSERT INTO "hand_mapping" VALUES ('INTERVENTIONS','ˌɪ n t ə v ˈɛ n ʃ ə n z','i - nv ta be nv sya nv zv','イーンタベンシャンズ','イーンタベンシャンズ');
-INSERT INTO "hand_mapping" VALUES ('INTERVIEW','ˈɪ n t ə v j ˌuː','i nv ta byu -','インタビュー','インタビュー');
-INSERT INTO "hand_mapping" VALUES ('INTERVIEWED','ˈɪ n t ə v j ˌuː d','i nv ta byu - dv','インタビュード','インタビュード');
-INSERT INTO "hand_mapping" VALUES ('INTERVIEWEE','ˌɪ n t ə v j uː ˈiː','i - nv ta byu - i -','イーンタビューイー','イーンタビューイー');
-INSERT INTO "hand_mapping" VALUES ('INTERVIEWER','ˈɪ n t ə v j ˌuː ə','i nv ta byu - a','インタビューア','インタビューア');
-INSERT INTO "hand_mapping" VALUES ('INTERVIEWS','ˈɪ n t ə v j ˌuː z','i nv ta byu - zv','インタビューズ','インタビューズ');
-INSERT INTO "hand_mapping" VALUES ('INTERWEAVE','ɪ n t ə w ˈiː v','i nv ta wi - bv','インタウィーブ','インタウィーブ');
-INSERT INTO "hand_mapping" VALUES ('INTERWOVEN','ɪ n t ə w ˈəʊ v ə n','i nv ta wo - ba nv','インタウォーバン','インタウォーバン');
+INSERT INTO "hand_mapping" VALUES ('INTERVAL','ˈɪ n t ə v ə l','i nv ta Va rv','インタバル','インタバル');
+INSERT INTO "hand_mapping" VALUES ('INTERVALS','ˈɪ n t ə v ə l z','i nv ta Va rv zv','インタバルズ','インタバルズ');
+INSERT INTO "hand_mapping" VALUES ('INTERVENE','ˌɪ n t ə v ˈiː n','i - nv ta Vi - nv','イーンタビーン','イーンタビーン');
+INSERT INTO "hand_mapping" VALUES ('INTERVENTION','ˌɪ n t ə v ˈɛ n ʃ ə n','i - nv ta Ve nv sya nv','イーンタベンシャン','イーンタベンション');
+INSERT INTO "hand_mapping" VALUES ('INTERVENTIONS','ˌɪ n t ə v ˈɛ n ʃ ə n z','i - nv ta Ve nv sya nv zv','イーンタベンシャンズ','イーンタベンシャンズ');
+INSERT INTO "hand_mapping" VALUES ('INTERVIEW','ˈɪ n t ə v j ˌuː','i nv ta Vyu -','インタビュー','インタビュー');
+INSERT INTO "hand_mapping" VALUES ('INTERVIEWED','ˈɪ n t ə v j ˌuː d','i nv ta Vyu - dv','インタビュード','インタビュード');
+INSERT INTO "hand_mapping" VALUES ('INTERVIEWEE','ˌɪ n t ə v j uː ˈiː','i - nv ta Vyu - i -','イーンタビューイー','イーンタビューイー');
+INSERT INTO "hand_mapping" VALUES ('INTERVIEWER','ˈɪ n t ə v j ˌuː ə','i nv ta Vyu - a','インタビューア','インタビューア');
+INSERT INTO "hand_mapping" VALUES ('INTERVIEWS','ˈɪ n t ə v j ˌuː z','i nv ta Vyu - zv','インタビューズ','インタビューズ');
+INSERT INTO "hand_mapping" VALUES ('INTERWEAVE','ɪ n t ə w ˈiː v','i nv ta wi - Vv','インタウィーブ','インタウィーブ');
+INSERT INTO "hand_mapping" VALUES ('INTERWOVEN','ɪ n t ə w ˈəʊ v ə n','i nv ta wo - Va nv','インタウォーバン','インタウォーバン');
 INSERT INTO "hand_mapping" VALUES ('INTESTINAL','ɪ n t ˈɛ s t ɪ n ə l','i nv te sv ti na rv','インテスティナル','インテスティナル');
 INSERT INTO "hand_mapping" VALUES ('INTIMATE(1)','ˈɪ n t ɪ m ɪ t','i nv ti mi tv','インティミト','インティミト');
 INSERT INTO "hand_mapping" VALUES ('INTIMATE(2)','ˈɪ n t ɪ m ˌeɪ t','i nv ti me i tv','インティメイト','インティメイト');
@@ -7972,53 +7972,53 @@ INSERT INTO "hand_mapping" VALUES ('INTRODUCING','ˌɪ n t ɹ ə d j ˈuː s ɪ
 INSERT INTO "hand_mapping" VALUES ('INTRODUCTION','ˌɪ n t ɹ ə d ˈɐ k ʃ ə n','i - nv tv ra da kv sya nv','イーントラダクシャン','イーントラダクション');
 INSERT INTO "hand_mapping" VALUES ('INTRODUCTORY','ˌɪ n t ɹ ə d ˈɐ k t ə ɹ i','i - nv tv ra da kv ta ri -','イーントラダクタリー','イーントラダクタリー');
 INSERT INTO "hand_mapping" VALUES ('INTUITION','ˌɪ n t j ʊ ˈɪ ʃ ə n','i - nv tyu i sya nv','イーンチュイシャン','イーンチュイション');
-INSERT INTO "hand_mapping" VALUES ('INTUITIVE','ˌɪ n t j ˈuː ˈɪ t ɪ v','i - nv tyu - i ti bv','イーンチューイティブ','イーンチューイティブ');
-INSERT INTO "hand_mapping" VALUES ('INVADE','ɪ n v ˈeɪ d','i nv be i dv','インベイド','インベイド');
-INSERT INTO "hand_mapping" VALUES ('INVADER','ɪ n v ˈeɪ d ə','i nv be i da','インベイダ','インベイダ');
-INSERT INTO "hand_mapping" VALUES ('INVADERS','ɪ n v ˈeɪ d ə z','i nv be i da zv','インベイダズ','インベイダズ');
-INSERT INTO "hand_mapping" VALUES ('INVALID(1)','ɪ n v ˈæ l ɪ d','i nv ba ri dv','インバリド','インバリド');
-INSERT INTO "hand_mapping" VALUES ('INVALID(2)','ˈɪ n v ə l ɪ d','i nv ba ri dv','インバリド','インバリド');
-INSERT INTO "hand_mapping" VALUES ('INVALUABLE','ɪ n v ˈæ l j ʊ b ə l','i nv ba ryu ba rv','インバリュバル','インバリュバル');
-INSERT INTO "hand_mapping" VALUES ('INVARIABLY','ɪ n v ˈɛə ɹ ɪə b l i','i nv be a ri a bv ri -','インベアリアブリー','インベアリアブリー');
-INSERT INTO "hand_mapping" VALUES ('INVASION','ɪ n v ˈeɪ ʒ ə n','i nv be i jya nv','インベイジャン','インベイジョン');
-INSERT INTO "hand_mapping" VALUES ('INVENT','ɪ n v ˈɛ n t','i nv be nv tv','インベント','インベント');
-INSERT INTO "hand_mapping" VALUES ('INVENTED','ɪ n v ˈɛ n t ɪ d','i nv be nv ti dv','インベンティド','インベンティド');
-INSERT INTO "hand_mapping" VALUES ('INVENTION','ɪ n v ˈɛ n ʃ ə n','i nv be nv sya nv','インベンシャン','インベンション');
-INSERT INTO "hand_mapping" VALUES ('INVENTORY','ˈɪ n v ə n t ə ɹ i','i nv ba nv ta ri -','インバンタリー','インバンタリー');
-INSERT INTO "hand_mapping" VALUES ('INVERCLYDE','ˌɪ n v ə k l ˈaɪ d','i - nv ba kv ra i dv','イーンバクライド','イーンバクライド');
-INSERT INTO "hand_mapping" VALUES ('INVERNESS','ˌɪ n v ə n ˈɛ s','i - nv ba ne sv','イーンバネス','イーンバネス');
-INSERT INTO "hand_mapping" VALUES ('INVERSE(1)','ˈɪ n v ɜː s','i nv be - sv','インベース','インベース');
-INSERT INTO "hand_mapping" VALUES ('INVERSE(2)','ɪ n v ˈɜː s','i nv be - sv','インベース','インベース');
-INSERT INTO "hand_mapping" VALUES ('INVERSION(1)','ɪ n v ˈɜː ʒ ə n','i nv be - jya nv','インベージャン','インベージョン');
-INSERT INTO "hand_mapping" VALUES ('INVERSION(2)','ɪ n v ˈɜː ʃ ə n','i nv be - sya nv','インベーシャン','インベーション');
-INSERT INTO "hand_mapping" VALUES ('INVERT(1)','ɪ n v ˈɜː t','i nv be - tv','インベート','インベート');
-INSERT INTO "hand_mapping" VALUES ('INVERT(2)','ˈɪ n v ɜː t','i nv be - tv','インベート','インベート');
-INSERT INTO "hand_mapping" VALUES ('INVEST','ɪ n v ˈɛ s t','i nv be sv tv','インベスト','インベスト');
-INSERT INTO "hand_mapping" VALUES ('INVESTIGATE','ɪ n v ˈɛ s t ɪ g ˌeɪ t','i nv be sv ti ge i tv','インベスティゲイト','インベスティゲイト');
-INSERT INTO "hand_mapping" VALUES ('INVESTIGATED','ɪ n v ˈɛ s t ɪ g ˌeɪ t ɪ d','i nv be sv ti ge i ti dv','インベスティゲイティド','インベスティゲイティド');
-INSERT INTO "hand_mapping" VALUES ('INVESTIGATING','ɪ n v ˈɛ s t ɪ g ˌeɪ t ɪ ŋ','i nv be sv ti ge i ti Nv','インベスティゲイティン','インベスティゲイティング');
-INSERT INTO "hand_mapping" VALUES ('INVESTIGATION','ɪ n v ˌɛ s t ɪ g ˈeɪ ʃ ə n','i nv be - sv ti ge i sya nv','インベースティゲイシャン','インベースティゲイション');
-INSERT INTO "hand_mapping" VALUES ('INVESTIGATIONS','ɪ n v ˌɛ s t ɪ g ˈeɪ ʃ ə n z','i nv be - sv ti ge i sya nv zv','インベースティゲイシャンズ','インベースティゲイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('INVESTIGATOR','ɪ n v ˈɛ s t ɪ g ˌeɪ t ə','i nv be sv ti ge i ta','インベスティゲイタ','インベスティゲイタ');
-INSERT INTO "hand_mapping" VALUES ('INVESTIGATORS','ɪ n v ˈɛ s t ɪ g ˌeɪ t ə z','i nv be sv ti ge i ta zv','インベスティゲイタズ','インベスティゲイタズ');
-INSERT INTO "hand_mapping" VALUES ('INVESTING','ɪ n v ˈɛ s t ɪ ŋ','i nv be sv ti Nv','インベスティン','インベスティング');
-INSERT INTO "hand_mapping" VALUES ('INVESTMENT','ɪ n v ˈɛ s t m ə n t','i nv be sv tv ma nv tv','インベストマント','インベストメント');
-INSERT INTO "hand_mapping" VALUES ('INVESTMENTS','ɪ n v ˈɛ s t m ə n t s','i nv be sv tv ma nv tsv','インベストマンツ','インベストマンツ');
-INSERT INTO "hand_mapping" VALUES ('INVESTOR','ɪ n v ˈɛ s t ə','i nv be sv ta','インベスタ','インベスタ');
-INSERT INTO "hand_mapping" VALUES ('INVESTORS','ɪ n v ˈɛ s t ə z','i nv be sv ta zv','インベスタズ','インベスタズ');
-INSERT INTO "hand_mapping" VALUES ('INVISIBLE','ɪ n v ˈɪ z ɪ b ə l','i nv bi zi ba rv','インビジバル','インビジバル');
-INSERT INTO "hand_mapping" VALUES ('INVITATION','ˌɪ n v ɪ t ˈeɪ ʃ ə n','i - nv bi te i sya nv','イーンビテイシャン','イーンビテイション');
-INSERT INTO "hand_mapping" VALUES ('INVITATIONS','ˌɪ n v ɪ t ˈeɪ ʃ ə n z','i - nv bi te i sya nv zv','イーンビテイシャンズ','イーンビテイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('INVITE','ɪ n v ˈaɪ t','i nv ba i tv','インバイト','インバイト');
-INSERT INTO "hand_mapping" VALUES ('INVITED','ɪ n v ˈaɪ t ɪ d','i nv ba i ti dv','インバイティド','インバイティド');
-INSERT INTO "hand_mapping" VALUES ('INVOCATION','ɪ n v ə k ˈeɪ ʃ ə n','i nv ba ke i sya nv','インバケイシャン','インバケイション');
-INSERT INTO "hand_mapping" VALUES ('INVOICE','ˈɪ n v ˌɔɪ s','i nv bo i sv','インボイス','インボイス');
-INSERT INTO "hand_mapping" VALUES ('INVOKE','ɪ n v ˈəʊ k','i nv bo - kv','インボーク','インボーク');
-INSERT INTO "hand_mapping" VALUES ('INVOLVE','ɪ n v ˈɒ l v','i nv bo rv bv','インボルブ','インボルブ');
-INSERT INTO "hand_mapping" VALUES ('INVOLVED','ɪ n v ˈɒ l v d','i nv bo rv bv dv','インボルブド','インボルブド');
-INSERT INTO "hand_mapping" VALUES ('INVOLVEMENT','ɪ n v ˈɒ l v m ə n t','i nv bo rv bv ma nv tv','インボルブマント','インボルブメント');
-INSERT INTO "hand_mapping" VALUES ('INVOLVES','ɪ n v ˈɒ l v z','i nv bo rv bv zv','インボルブズ','インボルブズ');
-INSERT INTO "hand_mapping" VALUES ('INVOLVING','ɪ n v ˈɒ l v ɪ ŋ','i nv bo rv bi Nv','インボルビン','インボルビング');
+INSERT INTO "hand_mapping" VALUES ('INTUITIVE','ˌɪ n t j ˈuː ˈɪ t ɪ v','i - nv tyu - i ti Vv','イーンチューイティブ','イーンチューイティブ');
+INSERT INTO "hand_mapping" VALUES ('INVADE','ɪ n v ˈeɪ d','i nv Ve i dv','インベイド','インベイド');
+INSERT INTO "hand_mapping" VALUES ('INVADER','ɪ n v ˈeɪ d ə','i nv Ve i da','インベイダ','インベイダ');
+INSERT INTO "hand_mapping" VALUES ('INVADERS','ɪ n v ˈeɪ d ə z','i nv Ve i da zv','インベイダズ','インベイダズ');
+INSERT INTO "hand_mapping" VALUES ('INVALID(1)','ɪ n v ˈæ l ɪ d','i nv Va ri dv','インバリド','インバリド');
+INSERT INTO "hand_mapping" VALUES ('INVALID(2)','ˈɪ n v ə l ɪ d','i nv Va ri dv','インバリド','インバリド');
+INSERT INTO "hand_mapping" VALUES ('INVALUABLE','ɪ n v ˈæ l j ʊ b ə l','i nv Va ryu ba rv','インバリュバル','インバリュバル');
+INSERT INTO "hand_mapping" VALUES ('INVARIABLY','ɪ n v ˈɛə ɹ ɪə b l i','i nv Ve a ri a bv ri -','インベアリアブリー','インベアリアブリー');
+INSERT INTO "hand_mapping" VALUES ('INVASION','ɪ n v ˈeɪ ʒ ə n','i nv Ve i jya nv','インベイジャン','インベイジョン');
+INSERT INTO "hand_mapping" VALUES ('INVENT','ɪ n v ˈɛ n t','i nv Ve nv tv','インベント','インベント');
+INSERT INTO "hand_mapping" VALUES ('INVENTED','ɪ n v ˈɛ n t ɪ d','i nv Ve nv ti dv','インベンティド','インベンティド');
+INSERT INTO "hand_mapping" VALUES ('INVENTION','ɪ n v ˈɛ n ʃ ə n','i nv Ve nv sya nv','インベンシャン','インベンション');
+INSERT INTO "hand_mapping" VALUES ('INVENTORY','ˈɪ n v ə n t ə ɹ i','i nv Va nv ta ri -','インバンタリー','インバンタリー');
+INSERT INTO "hand_mapping" VALUES ('INVERCLYDE','ˌɪ n v ə k l ˈaɪ d','i - nv Va kv ra i dv','イーンバクライド','イーンバクライド');
+INSERT INTO "hand_mapping" VALUES ('INVERNESS','ˌɪ n v ə n ˈɛ s','i - nv Va ne sv','イーンバネス','イーンバネス');
+INSERT INTO "hand_mapping" VALUES ('INVERSE(1)','ˈɪ n v ɜː s','i nv Ve - sv','インベース','インベース');
+INSERT INTO "hand_mapping" VALUES ('INVERSE(2)','ɪ n v ˈɜː s','i nv Ve - sv','インベース','インベース');
+INSERT INTO "hand_mapping" VALUES ('INVERSION(1)','ɪ n v ˈɜː ʒ ə n','i nv Ve - jya nv','インベージャン','インベージョン');
+INSERT INTO "hand_mapping" VALUES ('INVERSION(2)','ɪ n v ˈɜː ʃ ə n','i nv Ve - sya nv','インベーシャン','インベーション');
+INSERT INTO "hand_mapping" VALUES ('INVERT(1)','ɪ n v ˈɜː t','i nv Ve - tv','インベート','インベート');
+INSERT INTO "hand_mapping" VALUES ('INVERT(2)','ˈɪ n v ɜː t','i nv Ve - tv','インベート','インベート');
+INSERT INTO "hand_mapping" VALUES ('INVEST','ɪ n v ˈɛ s t','i nv Ve sv tv','インベスト','インベスト');
+INSERT INTO "hand_mapping" VALUES ('INVESTIGATE','ɪ n v ˈɛ s t ɪ g ˌeɪ t','i nv Ve sv ti ge i tv','インベスティゲイト','インベスティゲイト');
+INSERT INTO "hand_mapping" VALUES ('INVESTIGATED','ɪ n v ˈɛ s t ɪ g ˌeɪ t ɪ d','i nv Ve sv ti ge i ti dv','インベスティゲイティド','インベスティゲイティド');
+INSERT INTO "hand_mapping" VALUES ('INVESTIGATING','ɪ n v ˈɛ s t ɪ g ˌeɪ t ɪ ŋ','i nv Ve sv ti ge i ti Nv','インベスティゲイティン','インベスティゲイティング');
+INSERT INTO "hand_mapping" VALUES ('INVESTIGATION','ɪ n v ˌɛ s t ɪ g ˈeɪ ʃ ə n','i nv Ve - sv ti ge i sya nv','インベースティゲイシャン','インベースティゲイション');
+INSERT INTO "hand_mapping" VALUES ('INVESTIGATIONS','ɪ n v ˌɛ s t ɪ g ˈeɪ ʃ ə n z','i nv Ve - sv ti ge i sya nv zv','インベースティゲイシャンズ','インベースティゲイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('INVESTIGATOR','ɪ n v ˈɛ s t ɪ g ˌeɪ t ə','i nv Ve sv ti ge i ta','インベスティゲイタ','インベスティゲイタ');
+INSERT INTO "hand_mapping" VALUES ('INVESTIGATORS','ɪ n v ˈɛ s t ɪ g ˌeɪ t ə z','i nv Ve sv ti ge i ta zv','インベスティゲイタズ','インベスティゲイタズ');
+INSERT INTO "hand_mapping" VALUES ('INVESTING','ɪ n v ˈɛ s t ɪ ŋ','i nv Ve sv ti Nv','インベスティン','インベスティング');
+INSERT INTO "hand_mapping" VALUES ('INVESTMENT','ɪ n v ˈɛ s t m ə n t','i nv Ve sv tv ma nv tv','インベストマント','インベストメント');
+INSERT INTO "hand_mapping" VALUES ('INVESTMENTS','ɪ n v ˈɛ s t m ə n t s','i nv Ve sv tv ma nv tsv','インベストマンツ','インベストマンツ');
+INSERT INTO "hand_mapping" VALUES ('INVESTOR','ɪ n v ˈɛ s t ə','i nv Ve sv ta','インベスタ','インベスタ');
+INSERT INTO "hand_mapping" VALUES ('INVESTORS','ɪ n v ˈɛ s t ə z','i nv Ve sv ta zv','インベスタズ','インベスタズ');
+INSERT INTO "hand_mapping" VALUES ('INVISIBLE','ɪ n v ˈɪ z ɪ b ə l','i nv Vi zi ba rv','インビジバル','インビジバル');
+INSERT INTO "hand_mapping" VALUES ('INVITATION','ˌɪ n v ɪ t ˈeɪ ʃ ə n','i - nv Vi te i sya nv','イーンビテイシャン','イーンビテイション');
+INSERT INTO "hand_mapping" VALUES ('INVITATIONS','ˌɪ n v ɪ t ˈeɪ ʃ ə n z','i - nv Vi te i sya nv zv','イーンビテイシャンズ','イーンビテイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('INVITE','ɪ n v ˈaɪ t','i nv Va i tv','インバイト','インバイト');
+INSERT INTO "hand_mapping" VALUES ('INVITED','ɪ n v ˈaɪ t ɪ d','i nv Va i ti dv','インバイティド','インバイティド');
+INSERT INTO "hand_mapping" VALUES ('INVOCATION','ɪ n v ə k ˈeɪ ʃ ə n','i nv Va ke i sya nv','インバケイシャン','インバケイション');
+INSERT INTO "hand_mapping" VALUES ('INVOICE','ˈɪ n v ˌɔɪ s','i nv Vo i sv','インボイス','インボイス');
+INSERT INTO "hand_mapping" VALUES ('INVOKE','ɪ n v ˈəʊ k','i nv Vo - kv','インボーク','インボーク');
+INSERT INTO "hand_mapping" VALUES ('INVOLVE','ɪ n v ˈɒ l v','i nv Vo rv Vv','インボルブ','インボルブ');
+INSERT INTO "hand_mapping" VALUES ('INVOLVED','ɪ n v ˈɒ l v d','i nv Vo rv Vv dv','インボルブド','インボルブド');
+INSERT INTO "hand_mapping" VALUES ('INVOLVEMENT','ɪ n v ˈɒ l v m ə n t','i nv Vo rv Vv ma nv tv','インボルブマント','インボルブメント');
+INSERT INTO "hand_mapping" VALUES ('INVOLVES','ɪ n v ˈɒ l v z','i nv Vo rv Vv zv','インボルブズ','インボルブズ');
+INSERT INTO "hand_mapping" VALUES ('INVOLVING','ɪ n v ˈɒ l v ɪ ŋ','i nv Vo rv Vi Nv','インボルビン','インボルビング');
 INSERT INTO "hand_mapping" VALUES ('ION(1)','ˈaɪ ə n','a i a nv','アイアン','アイアン');
 INSERT INTO "hand_mapping" VALUES ('ION(2)','ˈaɪ ˌɒ n','a i o nv','アイオン','アイオン');
 INSERT INTO "hand_mapping" VALUES ('IOTA','aɪ ˈəʊ t ə','a i o - ta','アイオータ','アイオータ');
@@ -8041,8 +8041,8 @@ INSERT INTO "hand_mapping" VALUES ('IRONICALLY','aɪ ɹ ˈɒ n ɪ k l i','a i ro
 INSERT INTO "hand_mapping" VALUES ('IRONING','ˈaɪ ə n ɪ ŋ','a i a ni Nv','アイアニン','アイアニング');
 INSERT INTO "hand_mapping" VALUES ('IRONY','ˈaɪ ɹ ə n i','a i ra ni -','アイラニー','アイラニー');
 INSERT INTO "hand_mapping" VALUES ('IRREGULAR','ɪ ɹ ˈɛ g j ʊ l ə','i re gyu ra','イレギュラ','イレギュラ');
-INSERT INTO "hand_mapping" VALUES ('IRRELEVANT','ɪ ɹ ˈɛ l ə v ə n t','i re ra ba nv tv','イレラバント','イレラバント');
-INSERT INTO "hand_mapping" VALUES ('IRRESPECTIVE','ɪ ɹ ɪ s p ˈɛ k t ɪ v','i ri sv pe kv ti bv','イリスペクティブ','イリスペクティブ');
+INSERT INTO "hand_mapping" VALUES ('IRRELEVANT','ɪ ɹ ˈɛ l ə v ə n t','i re ra Va nv tv','イレラバント','イレラバント');
+INSERT INTO "hand_mapping" VALUES ('IRRESPECTIVE','ɪ ɹ ɪ s p ˈɛ k t ɪ v','i ri sv pe kv ti Vv','イリスペクティブ','イリスペクティブ');
 INSERT INTO "hand_mapping" VALUES ('IRRIGATION','ˌɪ ɹ ɪ g ˈeɪ ʃ ə n','i - ri ge i sya nv','イーリゲイシャン','イーリゲイション');
 INSERT INTO "hand_mapping" VALUES ('IS(1)','ɪ z','i zv','イズ','イズ');
 INSERT INTO "hand_mapping" VALUES ('IS(2)','ˈɪ z','i zv','イズ','イズ');
@@ -8083,16 +8083,16 @@ INSERT INTO "hand_mapping" VALUES ('ITS(1)','ɪ t s','i tsv','イツ','イツ');
 INSERT INTO "hand_mapping" VALUES ('ITS(2)','ˈɪ t s','i tsv','イツ','イツ');
 INSERT INTO "hand_mapping" VALUES ('ITSELF','ɪ t s ˈɛ l f','i tse rv fv','イツェルフ','イツェルフ');
 INSERT INTO "hand_mapping" VALUES ('ITUNES','ˈaɪ t j ˌuː n z','a i tyu - nv zv','アイチューンズ','アイチューンズ');
-INSERT INTO "hand_mapping" VALUES ('IVORY(1)','ˈaɪ v ə ɹ i','a i ba ri -','アイバリー','アイバリー');
-INSERT INTO "hand_mapping" VALUES ('IVORY(2)','ˈaɪ v ɹ i','a i bv ri -','アイブリー','アイブリー');
-INSERT INTO "hand_mapping" VALUES ('IVY','ˈaɪ v i','a i bi -','アイビー','アイビー');
+INSERT INTO "hand_mapping" VALUES ('IVORY(1)','ˈaɪ v ə ɹ i','a i Va ri -','アイバリー','アイバリー');
+INSERT INTO "hand_mapping" VALUES ('IVORY(2)','ˈaɪ v ɹ i','a i Vv ri -','アイブリー','アイブリー');
+INSERT INTO "hand_mapping" VALUES ('IVY','ˈaɪ v i','a i Vi -','アイビー','アイビー');
 INSERT INTO "hand_mapping" VALUES ('JAB','dʒ ˈæ b','jya bv','ジャブ','ジャブ');
 INSERT INTO "hand_mapping" VALUES ('JACK','dʒ ˈæ k','jya x kv','ジャック','ジャック');
 INSERT INTO "hand_mapping" VALUES ('JACKET','dʒ ˈæ k ɪ t','jya x ki tv','ジャッキト','ジャッキト');
 INSERT INTO "hand_mapping" VALUES ('JACKETS','dʒ ˈæ k ɪ t s','jya x ki tsv','ジャッキツ','ジャッキツ');
 INSERT INTO "hand_mapping" VALUES ('JACKIE','dʒ ˈæ k i','jya x ki -','ジャッキー','ジャッキー');
 INSERT INTO "hand_mapping" VALUES ('JACKSON','dʒ ˈæ k s ə n','jya x kv sa nv','ジャックサン','ジャックサン');
-INSERT INTO "hand_mapping" VALUES ('JACKSONVILLE','dʒ ˈæ k s ə n v ˌɪ l','jya x kv sa nv bi - rv','ジャックサンビール','ジャックサンビール');
+INSERT INTO "hand_mapping" VALUES ('JACKSONVILLE','dʒ ˈæ k s ə n v ˌɪ l','jya x kv sa nv Vi - rv','ジャックサンビール','ジャックサンビール');
 INSERT INTO "hand_mapping" VALUES ('JACOB','dʒ ˈeɪ k ə b','jye i ka bv','ジェイカブ','ジェイカブ');
 INSERT INTO "hand_mapping" VALUES ('JACQUELINE(1)','dʒ ˈæ k l ɪ n','jya x kv ri nv','ジャックリン','ジャックリン');
 INSERT INTO "hand_mapping" VALUES ('JACQUELINE(2)','dʒ ˈæ k ə l ɪ n','jya x ka ri nv','ジャッカリン','ジャッカリン');
@@ -8114,8 +8114,8 @@ INSERT INTO "hand_mapping" VALUES ('JAPAN','dʒ ə p ˈæ n','jya pa nv','ジャ
 INSERT INTO "hand_mapping" VALUES ('JAPANESE','dʒ ˌæ p ə n ˈiː z','jya x pa ni - zv','ジャッパニーズ','ジャッパニーズ');
 INSERT INTO "hand_mapping" VALUES ('JAR','dʒ ˈɑː','jya -','ジャー','ジャー');
 INSERT INTO "hand_mapping" VALUES ('JASON','dʒ ˈeɪ s ə n','jye i sa nv','ジェイサン','ジェイサン');
-INSERT INTO "hand_mapping" VALUES ('JAVA','dʒ ˈɑː v ə','jya - ba','ジャーバ','ジャーバ');
-INSERT INTO "hand_mapping" VALUES ('JAVASCRIPT','dʒ ˈɑː v ə s k ɹ ˌɪ p t','jya - ba sv kv ri - pv tv','ジャーバスクリープト','ジャーバスクリープト');
+INSERT INTO "hand_mapping" VALUES ('JAVA','dʒ ˈɑː v ə','jya - Va','ジャーバ','ジャーバ');
+INSERT INTO "hand_mapping" VALUES ('JAVASCRIPT','dʒ ˈɑː v ə s k ɹ ˌɪ p t','jya - Va sv kv ri - pv tv','ジャーバスクリープト','ジャーバスクリープト');
 INSERT INTO "hand_mapping" VALUES ('JAW','dʒ ˈɔː','jyo -','ジョー','ジョー');
 INSERT INTO "hand_mapping" VALUES ('JAY','dʒ ˈeɪ','jye i','ジェイ','ジェイ');
 INSERT INTO "hand_mapping" VALUES ('JAYS','dʒ ˈeɪ z','jye i zv','ジェイズ','ジェイズ');
@@ -8130,7 +8130,7 @@ INSERT INTO "hand_mapping" VALUES ('JEEZ','dʒ ˈiː z','jyi - zv','ジィーズ
 INSERT INTO "hand_mapping" VALUES ('JEFF','dʒ ˈɛ f','jye fv','ジェフ','ジェフ');
 INSERT INTO "hand_mapping" VALUES ('JEFFERSON','dʒ ˈɛ f ə s ə n','jye fa sa nv','ジェファサン','ジェファサン');
 INSERT INTO "hand_mapping" VALUES ('JEFFREY','dʒ ˈɛ f ɹ i','jye fv ri -','ジェフリー','ジェフリー');
-INSERT INTO "hand_mapping" VALUES ('JEHOVAH','dʒ ɪ h ˈəʊ v ə','jyi ho - ba','ジィホーバ','ジィホーバ');
+INSERT INTO "hand_mapping" VALUES ('JEHOVAH','dʒ ɪ h ˈəʊ v ə','jyi ho - Va','ジィホーバ','ジィホーバ');
 INSERT INTO "hand_mapping" VALUES ('JELLY','dʒ ˈɛ l i','jye ri -','ジェリー','ジェリー');
 INSERT INTO "hand_mapping" VALUES ('JENNIFER','dʒ ˈɛ n ɪ f ə','jye ni fa','ジェニファ','ジェニファ');
 INSERT INTO "hand_mapping" VALUES ('JENNY','dʒ ˈɛ n i','jye ni -','ジェニー','ジェニー');
@@ -8163,7 +8163,7 @@ INSERT INTO "hand_mapping" VALUES ('JILL','dʒ ˈɪ l','jyi rv','ジィル','ジ
 INSERT INTO "hand_mapping" VALUES ('JIM','dʒ ˈɪ m','jyi mv','ジィム','ジィム');
 INSERT INTO "hand_mapping" VALUES ('JIMMY','dʒ ˈɪ m i','jyi mi -','ジィミー','ジィミー');
 INSERT INTO "hand_mapping" VALUES ('JINX','dʒ ˈɪ ŋ k s','jyi Nv kv sv','ジィンクス','ジィンクス');
-INSERT INTO "hand_mapping" VALUES ('JIVE','dʒ ˈaɪ v','jya i bv','ジャイブ','ジャイブ');
+INSERT INTO "hand_mapping" VALUES ('JIVE','dʒ ˈaɪ v','jya i Vv','ジャイブ','ジャイブ');
 INSERT INTO "hand_mapping" VALUES ('JO','dʒ ˈəʊ','jyo -','ジョー','ジョー');
 INSERT INTO "hand_mapping" VALUES ('JOAN','dʒ ˈəʊ n','jyo - nv','ジョーン','ジョーン');
 INSERT INTO "hand_mapping" VALUES ('JOANNA','dʒ əʊ ˈæ n ə','jyo a na','ジョアナ','ジョアナ');
@@ -8263,7 +8263,7 @@ INSERT INTO "hand_mapping" VALUES ('JUSTIFIED','dʒ ˈɐ s t ɪ f ˌaɪ d','jya
 INSERT INTO "hand_mapping" VALUES ('JUSTIFY','dʒ ˈɐ s t ɪ f ˌaɪ','jya sv ti fa i','ジャスティファイ','ジャスティファイ');
 INSERT INTO "hand_mapping" VALUES ('JUSTIN','dʒ ˈɐ s t ɪ n','jya sv ti nv','ジャスティン','ジャスティン');
 INSERT INTO "hand_mapping" VALUES ('JUT','dʒ ˈɐ t','jya tv','ジャト','ジャト');
-INSERT INTO "hand_mapping" VALUES ('JUVENILE','dʒ ˈuː v ə n ˌaɪ l','jyu - ba na i rv','ジューバナイル','ジューバナイル');
+INSERT INTO "hand_mapping" VALUES ('JUVENILE','dʒ ˈuː v ə n ˌaɪ l','jyu - Va na i rv','ジューバナイル','ジューバナイル');
 INSERT INTO "hand_mapping" VALUES ('KANSAS','k ˈæ n z ə s','ka nv za sv','カンザス','カンザス');
 INSERT INTO "hand_mapping" VALUES ('KARAOKE','k ˌæ ɹ ɪ ˈəʊ k i','ka ri o - ki -','カリオーキー','カリオーキー');
 INSERT INTO "hand_mapping" VALUES ('KARATE','k ə ɹ ˈɑː t i','ka ra - ti -','カラーティー','カラーティー');
@@ -8306,7 +8306,7 @@ INSERT INTO "hand_mapping" VALUES ('KERRY','k ˈɛ ɹ i','ke ri -','ケリー','
 INSERT INTO "hand_mapping" VALUES ('KESWICK','k ˈɛ z ɪ k','ke zi kv','ケジク','ケジク');
 INSERT INTO "hand_mapping" VALUES ('KETCHUP','k ˈɛ tʃ ə p','ke tya pv','ケチャプ','ケチャプ');
 INSERT INTO "hand_mapping" VALUES ('KETTLE','k ˈɛ t ə l','ke ta rv','ケタル','ケタル');
-INSERT INTO "hand_mapping" VALUES ('KEVIN','k ˈɛ v ɪ n','ke bi nv','ケビン','ケビン');
+INSERT INTO "hand_mapping" VALUES ('KEVIN','k ˈɛ v ɪ n','ke Vi nv','ケビン','ケビン');
 INSERT INTO "hand_mapping" VALUES ('KEW','k j ˈuː','kyu -','キュー','キュー');
 INSERT INTO "hand_mapping" VALUES ('KEY','k ˈiː','ki -','キー','キー');
 INSERT INTO "hand_mapping" VALUES ('KEYBOARD','k ˈiː b ˌɔː d','ki - bo - dv','キーボード','キーボード');
@@ -8327,7 +8327,7 @@ INSERT INTO "hand_mapping" VALUES ('KIDNAPPED','k ˈɪ d n ˌæ p t','ki dv na x
 INSERT INTO "hand_mapping" VALUES ('KIDNAPPING','k ˈɪ d n ˌæ p ɪ ŋ','ki dv na x pi Nv','キドナッピン','キドナッピング');
 INSERT INTO "hand_mapping" VALUES ('KIDNEY','k ˈɪ d n i','ki dv ni -','キドニー','キドニー');
 INSERT INTO "hand_mapping" VALUES ('KIDS','k ˈɪ d z','ki zv','キズ','キズ');
-INSERT INTO "hand_mapping" VALUES ('KIEV(1)','k ˈiː ɛ v','ki - e bv','キーエブ','キーエブ');
+INSERT INTO "hand_mapping" VALUES ('KIEV(1)','k ˈiː ɛ v','ki - e Vv','キーエブ','キーエブ');
 INSERT INTO "hand_mapping" VALUES ('KIEV(2)','k ˈiː ɛ f','ki - e fv','キーエフ','キーエフ');
 INSERT INTO "hand_mapping" VALUES ('KILL','k ˈɪ l','ki rv','キル','キル');
 INSERT INTO "hand_mapping" VALUES ('KILLED','k ˈɪ l d','ki rv dv','キルド','キルド');
@@ -8394,7 +8394,7 @@ INSERT INTO "hand_mapping" VALUES ('KNIGHTS','n ˈaɪ t s','na i tsv','ナイツ
 INSERT INTO "hand_mapping" VALUES ('KNIT','n ˈɪ t','ni tv','ニト','ニト');
 INSERT INTO "hand_mapping" VALUES ('KNITTED','n ˈɪ t ɪ d','ni ti dv','ニティド','ニティド');
 INSERT INTO "hand_mapping" VALUES ('KNITTING','n ˈɪ t ɪ ŋ','ni ti Nv','ニティン','ニティング');
-INSERT INTO "hand_mapping" VALUES ('KNIVES','n ˈaɪ v z','na i bv zv','ナイブズ','ナイブズ');
+INSERT INTO "hand_mapping" VALUES ('KNIVES','n ˈaɪ v z','na i Vv zv','ナイブズ','ナイブズ');
 INSERT INTO "hand_mapping" VALUES ('KNOB','n ˈɒ b','no bv','ノブ','ノブ');
 INSERT INTO "hand_mapping" VALUES ('KNOCK','n ˈɒ k','no x kv','ノック','ノック');
 INSERT INTO "hand_mapping" VALUES ('KNOCKED','n ˈɒ k t','no x kv tv','ノックト','ノックト');
@@ -8413,7 +8413,7 @@ INSERT INTO "hand_mapping" VALUES ('KOREA','k ə ɹ ˈiː ə','ka ri - a','カ
 INSERT INTO "hand_mapping" VALUES ('KOREAN','k ə ɹ ˈiː ə n','ka ri - a nv','カリーアン','コリーアン');
 INSERT INTO "hand_mapping" VALUES ('KORMA','k ˈɔː m ə','ko - ma','コーマ','コーマ');
 INSERT INTO "hand_mapping" VALUES ('KOSHER','k ˈəʊ ʃ ə','ko - sya','コーシャ','コーシャ');
-INSERT INTO "hand_mapping" VALUES ('KOSOVO','k ˈɒ s ə v əʊ','ko x sa bo','コッサボ','コッサボ');
+INSERT INTO "hand_mapping" VALUES ('KOSOVO','k ˈɒ s ə v əʊ','ko x sa Vo','コッサボ','コッサボ');
 INSERT INTO "hand_mapping" VALUES ('KRISPIES','k ɹ ˈɪ s p i z','kv ri sv pi - zv','クリスピーズ','クリスピーズ');
 INSERT INTO "hand_mapping" VALUES ('KUDOS','k j ˈuː d ɒ s','kyu - do sv','キュードス','キュードス');
 INSERT INTO "hand_mapping" VALUES ('KUMQUAT','k ˈɐ m k w ɒ t','ka mv kwo tv','カムクォト','カムクォト');
@@ -8525,7 +8525,7 @@ INSERT INTO "hand_mapping" VALUES ('LATINO','l æ t ˈiː n əʊ','ra ti - no','
 INSERT INTO "hand_mapping" VALUES ('LATITUDE','l ˈæ t ɪ t j ˌuː d','ra x ti tyu - dv','ラッティチュード','ラッティチュード');
 INSERT INTO "hand_mapping" VALUES ('LATTER','l ˈæ t ə','ra x ta','ラッタ','ラッタ');
 INSERT INTO "hand_mapping" VALUES ('LATTICE','l ˈæ t ɪ s','ra x ti sv','ラッティス','ラッティス');
-INSERT INTO "hand_mapping" VALUES ('LATVIA','l ˈæ t v ɪə','ra x tv bi a','ラットビア','ラットビア');
+INSERT INTO "hand_mapping" VALUES ('LATVIA','l ˈæ t v ɪə','ra x tv Vi a','ラットビア','ラットビア');
 INSERT INTO "hand_mapping" VALUES ('LAUD','l ˈɔː d','ro - dv','ロード','ロード');
 INSERT INTO "hand_mapping" VALUES ('LAUGH','l ˈɑː f','ra - fv','ラーフ','ラーフ');
 INSERT INTO "hand_mapping" VALUES ('LAUGHED','l ˈɑː f t','ra - fv tv','ラーフト','ラーフト');
@@ -8540,7 +8540,7 @@ INSERT INTO "hand_mapping" VALUES ('LAURA','l ˈɔː ɹ ə','ro - ra','ローラ
 INSERT INTO "hand_mapping" VALUES ('LAUREL','l ˈɒ ɹ ə l','ro ra rv','ロラル','ロラル');
 INSERT INTO "hand_mapping" VALUES ('LAUREN','l ˈɔː ɹ ə n','ro - ra nv','ローラン','ローラン');
 INSERT INTO "hand_mapping" VALUES ('LAURENT','l ˈɒ ɹ ə n t','ro ra nv tv','ロラント','ロラント');
-INSERT INTO "hand_mapping" VALUES ('LAVA','l ˈɑː v ə','ra - ba','ラーバ','ラーバ');
+INSERT INTO "hand_mapping" VALUES ('LAVA','l ˈɑː v ə','ra - Va','ラーバ','ラーバ');
 INSERT INTO "hand_mapping" VALUES ('LAW','l ˈɔː','ro -','ロー','ロー');
 INSERT INTO "hand_mapping" VALUES ('LAWN','l ˈɔː n','ro - nv','ローン','ローン');
 INSERT INTO "hand_mapping" VALUES ('LAWRENCE','l ˈɒ ɹ ə n s','ro ra nv sv','ロランス','ロランス');
@@ -8591,9 +8591,9 @@ INSERT INTO "hand_mapping" VALUES ('LEASH','l ˈiː ʃ','ri - syv','リーシュ
 INSERT INTO "hand_mapping" VALUES ('LEASING','l ˈiː s ɪ ŋ','ri - si Nv','リーシン','リーシング');
 INSERT INTO "hand_mapping" VALUES ('LEAST','l ˈiː s t','ri - sv tv','リースト','リースト');
 INSERT INTO "hand_mapping" VALUES ('LEATHER','l ˈɛ ð ə','re za','レザ','レザ');
-INSERT INTO "hand_mapping" VALUES ('LEAVE','l ˈiː v','ri - bv','リーブ','リーブ');
-INSERT INTO "hand_mapping" VALUES ('LEAVES','l ˈiː v z','ri - bv zv','リーブズ','リーブズ');
-INSERT INTO "hand_mapping" VALUES ('LEAVING','l ˈiː v ɪ ŋ','ri - bi Nv','リービン','リービング');
+INSERT INTO "hand_mapping" VALUES ('LEAVE','l ˈiː v','ri - Vv','リーブ','リーブ');
+INSERT INTO "hand_mapping" VALUES ('LEAVES','l ˈiː v z','ri - Vv zv','リーブズ','リーブズ');
+INSERT INTO "hand_mapping" VALUES ('LEAVING','l ˈiː v ɪ ŋ','ri - Vi Nv','リービン','リービング');
 INSERT INTO "hand_mapping" VALUES ('LEBANON','l ˈɛ b ə n ə n','re ba na nv','レバナン','レバナン');
 INSERT INTO "hand_mapping" VALUES ('LECTURE','l ˈɛ k tʃ ə','re kv tya','レクチャ','レクチャ');
 INSERT INTO "hand_mapping" VALUES ('LECTURER','l ˈɛ k tʃ ə ɹ ə','re kv tya ra','レクチャラ','レクチャラ');
@@ -8617,7 +8617,7 @@ INSERT INTO "hand_mapping" VALUES ('LEGENDS','l ˈɛ dʒ ə n d z','re jya nv zv
 INSERT INTO "hand_mapping" VALUES ('LEGGINGS','l ˈɛ g ɪ ŋ z','re gi Nv zv','レギンズ','レギンズ');
 INSERT INTO "hand_mapping" VALUES ('LEGION','l ˈiː dʒ ə n','ri - jya nv','リージャン','リージョン');
 INSERT INTO "hand_mapping" VALUES ('LEGISLATION','l ˌɛ dʒ ɪ s l ˈeɪ ʃ ə n','re - jyi sv re i sya nv','レージィスレイシャン','レージィスレイション');
-INSERT INTO "hand_mapping" VALUES ('LEGISLATIVE','l ˈɛ dʒ ɪ s l ə t ɪ v','re jyi sv ra ti bv','レジィスラティブ','レジィスラティブ');
+INSERT INTO "hand_mapping" VALUES ('LEGISLATIVE','l ˈɛ dʒ ɪ s l ə t ɪ v','re jyi sv ra ti Vv','レジィスラティブ','レジィスラティブ');
 INSERT INTO "hand_mapping" VALUES ('LEGISLATURE','l ˈɛ dʒ ɪ s l ˌeɪ tʃ ə','re jyi sv re i tya','レジィスレイチャ','レジィスレイチャ');
 INSERT INTO "hand_mapping" VALUES ('LEGITIMACY','l ɪ dʒ ˈɪ t ɪ m ə s i','ri jyi ti ma si -','リジィティマシー','リジィティマシー');
 INSERT INTO "hand_mapping" VALUES ('LEGITIMATE','l ɪ dʒ ˈɪ t ɪ m ɪ t','ri jyi ti mi tv','リジィティミト','リジィティミト');
@@ -8672,14 +8672,14 @@ INSERT INTO "hand_mapping" VALUES ('LETTING','l ˈɛ t ɪ ŋ','re ti Nv','レテ
 INSERT INTO "hand_mapping" VALUES ('LETTUCE','l ˈɛ t ɪ s','re ti sv','レティス','レティス');
 INSERT INTO "hand_mapping" VALUES ('LEUKAEMIA','l uː k ˈiː m ɪə','ru - ki - mi a','ルーキーミア','ルーキーミア');
 INSERT INTO "hand_mapping" VALUES ('LEUKEMIA','l uː k ˈiː m ɪə','ru - ki - mi a','ルーキーミア','ルーキーミア');
-INSERT INTO "hand_mapping" VALUES ('LEVEL','l ˈɛ v ə l','re ba rv','レバル','レバル');
-INSERT INTO "hand_mapping" VALUES ('LEVELS','l ˈɛ v ə l z','re ba rv zv','レバルズ','レバルズ');
-INSERT INTO "hand_mapping" VALUES ('LEVER','l ˈiː v ə','ri - ba','リーバ','リーバ');
-INSERT INTO "hand_mapping" VALUES ('LEVERAGE(1)','l ˈɛ v ə ɹ ɪ dʒ','re ba ri jyv','レバリジュ','レバリジュ');
-INSERT INTO "hand_mapping" VALUES ('LEVERAGE(2)','l ˈiː v ə ɹ ɪ dʒ','ri - ba ri jyv','リーバリジュ','リーバリジュ');
-INSERT INTO "hand_mapping" VALUES ('LEVI','l ˈiː v aɪ','ri - ba i','リーバイ','リーバイ');
-INSERT INTO "hand_mapping" VALUES ('LEVY(1)','l ˈiː v aɪ','ri - ba i','リーバイ','リーバイ');
-INSERT INTO "hand_mapping" VALUES ('LEVY(2)','l ˈɛ v i','re bi -','レビー','レビー');
+INSERT INTO "hand_mapping" VALUES ('LEVEL','l ˈɛ v ə l','re Va rv','レバル','レバル');
+INSERT INTO "hand_mapping" VALUES ('LEVELS','l ˈɛ v ə l z','re Va rv zv','レバルズ','レバルズ');
+INSERT INTO "hand_mapping" VALUES ('LEVER','l ˈiː v ə','ri - Va','リーバ','リーバ');
+INSERT INTO "hand_mapping" VALUES ('LEVERAGE(1)','l ˈɛ v ə ɹ ɪ dʒ','re Va ri jyv','レバリジュ','レバリジュ');
+INSERT INTO "hand_mapping" VALUES ('LEVERAGE(2)','l ˈiː v ə ɹ ɪ dʒ','ri - Va ri jyv','リーバリジュ','リーバリジュ');
+INSERT INTO "hand_mapping" VALUES ('LEVI','l ˈiː v aɪ','ri - Va i','リーバイ','リーバイ');
+INSERT INTO "hand_mapping" VALUES ('LEVY(1)','l ˈiː v aɪ','ri - Va i','リーバイ','リーバイ');
+INSERT INTO "hand_mapping" VALUES ('LEVY(2)','l ˈɛ v i','re Vi -','レビー','レビー');
 INSERT INTO "hand_mapping" VALUES ('LEWD','l ˈuː d','ru - dv','ルード','ルード');
 INSERT INTO "hand_mapping" VALUES ('LEWIS','l ˈuː ɪ s','ru - i sv','ルーイス','ルーイス');
 INSERT INTO "hand_mapping" VALUES ('LEWISHAM','l ˈuː ɪ ʃ ə m','ru - i sya mv','ルーイシャム','ルーイシャム');
@@ -8822,17 +8822,17 @@ INSERT INTO "hand_mapping" VALUES ('LITIGATION','l ˌɪ t ɪ g ˈeɪ ʃ ə n','r
 INSERT INTO "hand_mapping" VALUES ('LITRE','l ˈiː t ə','ri - ta','リータ','リータ');
 INSERT INTO "hand_mapping" VALUES ('LITTER','l ˈɪ t ə','ri ta','リタ','リタ');
 INSERT INTO "hand_mapping" VALUES ('LITTLE','l ˈɪ t ə l','ri ta rv','リタル','リタル');
-INSERT INTO "hand_mapping" VALUES ('LIVE(1)','l ˈɪ v','ri bv','リブ','リブ');
-INSERT INTO "hand_mapping" VALUES ('LIVE(2)','l ˈaɪ v','ra i bv','ライブ','ライブ');
-INSERT INTO "hand_mapping" VALUES ('LIVED','l ˈɪ v d','ri bv dv','リブド','リブド');
-INSERT INTO "hand_mapping" VALUES ('LIVELY','l ˈaɪ v l i','ra i bv ri -','ライブリー','ライブリー');
-INSERT INTO "hand_mapping" VALUES ('LIVER','l ˈɪ v ə','ri ba','リバ','リバ');
-INSERT INTO "hand_mapping" VALUES ('LIVERPOOL','l ˈɪ v ə p ˌuː l','ri ba pu - rv','リバプール','リバプール');
-INSERT INTO "hand_mapping" VALUES ('LIVES(1)','l ˈɪ v z','ri bv zv','リブズ','リブズ');
-INSERT INTO "hand_mapping" VALUES ('LIVES(2)','l ˈaɪ v z','ra i bv zv','ライブズ','ライブズ');
-INSERT INTO "hand_mapping" VALUES ('LIVESTOCK','l ˈaɪ v s t ˌɒ k','ra i bv sv to - kv','ライブストーク','ライブストーク');
-INSERT INTO "hand_mapping" VALUES ('LIVID','l ˈɪ v ɪ d','ri bi dv','リビド','リビド');
-INSERT INTO "hand_mapping" VALUES ('LIVING','l ˈɪ v ɪ ŋ','ri bi Nv','リビン','リビング');
+INSERT INTO "hand_mapping" VALUES ('LIVE(1)','l ˈɪ v','ri Vv','リブ','リブ');
+INSERT INTO "hand_mapping" VALUES ('LIVE(2)','l ˈaɪ v','ra i Vv','ライブ','ライブ');
+INSERT INTO "hand_mapping" VALUES ('LIVED','l ˈɪ v d','ri Vv dv','リブド','リブド');
+INSERT INTO "hand_mapping" VALUES ('LIVELY','l ˈaɪ v l i','ra i Vv ri -','ライブリー','ライブリー');
+INSERT INTO "hand_mapping" VALUES ('LIVER','l ˈɪ v ə','ri Va','リバ','リバ');
+INSERT INTO "hand_mapping" VALUES ('LIVERPOOL','l ˈɪ v ə p ˌuː l','ri Va pu - rv','リバプール','リバプール');
+INSERT INTO "hand_mapping" VALUES ('LIVES(1)','l ˈɪ v z','ri Vv zv','リブズ','リブズ');
+INSERT INTO "hand_mapping" VALUES ('LIVES(2)','l ˈaɪ v z','ra i Vv zv','ライブズ','ライブズ');
+INSERT INTO "hand_mapping" VALUES ('LIVESTOCK','l ˈaɪ v s t ˌɒ k','ra i Vv sv to - kv','ライブストーク','ライブストーク');
+INSERT INTO "hand_mapping" VALUES ('LIVID','l ˈɪ v ɪ d','ri Vi dv','リビド','リビド');
+INSERT INTO "hand_mapping" VALUES ('LIVING','l ˈɪ v ɪ ŋ','ri Vi Nv','リビン','リビング');
 INSERT INTO "hand_mapping" VALUES ('LIZ','l ˈɪ z','ri zv','リズ','リズ');
 INSERT INTO "hand_mapping" VALUES ('LJUBLIANA(1)','l j ˈuː b l j ˈɑː n ə','ryu - bv rya - na','リューブリャーナ','リューブリャーナ');
 INSERT INTO "hand_mapping" VALUES ('LJUBLIANA(2)','l ˈuː b l j ˈɑː n ə','ru - bv rya - na','ルーブリャーナ','ルーブリャーナ');
@@ -8848,7 +8848,7 @@ INSERT INTO "hand_mapping" VALUES ('LOAN','l ˈəʊ n','ro - nv','ローン','
 INSERT INTO "hand_mapping" VALUES ('LOANS','l ˈəʊ n z','ro - nv zv','ローンズ','ローンズ');
 INSERT INTO "hand_mapping" VALUES ('LOATH','l ˈəʊ θ','ro - sv','ロース','ロース');
 INSERT INTO "hand_mapping" VALUES ('LOATHE','l ˈəʊ ð','ro - zv','ローズ','ローズ');
-INSERT INTO "hand_mapping" VALUES ('LOAVES','l ˈəʊ v z','ro - bv zv','ローブズ','ローブズ');
+INSERT INTO "hand_mapping" VALUES ('LOAVES','l ˈəʊ v z','ro - Vv zv','ローブズ','ローブズ');
 INSERT INTO "hand_mapping" VALUES ('LOB','l ˈɒ b','ro bv','ロブ','ロブ');
 INSERT INTO "hand_mapping" VALUES ('LOBBY','l ˈɒ b i','ro bi -','ロビー','ロビー');
 INSERT INTO "hand_mapping" VALUES ('LOBE','l ˈəʊ b','ro - bv','ローブ','ローブ');
@@ -8869,7 +8869,7 @@ INSERT INTO "hand_mapping" VALUES ('LOCKED','l ˈɒ k t','ro x kv tv','ロック
 INSERT INTO "hand_mapping" VALUES ('LOCKER','l ˈɒ k ə','ro x ka','ロッカ','ロッカ');
 INSERT INTO "hand_mapping" VALUES ('LOCKING','l ˈɒ k ɪ ŋ','ro x ki Nv','ロッキン','ロッキング');
 INSERT INTO "hand_mapping" VALUES ('LOCKS','l ˈɒ k s','ro x kv sv','ロックス','ロックス');
-INSERT INTO "hand_mapping" VALUES ('LOCOMOTIVE','l ˌəʊ k ə m ˈəʊ t ɪ v','ro ka mo - ti bv','ロカモーティブ','ロカモーティブ');
+INSERT INTO "hand_mapping" VALUES ('LOCOMOTIVE','l ˌəʊ k ə m ˈəʊ t ɪ v','ro ka mo - ti Vv','ロカモーティブ','ロカモーティブ');
 INSERT INTO "hand_mapping" VALUES ('LOCUST','l ˈəʊ k ə s t','ro - ka sv tv','ローカスト','ローカスト');
 INSERT INTO "hand_mapping" VALUES ('LOCUSTS','l ˈəʊ k ə s t s','ro - ka sv tsv','ローカスツ','ローカスツ');
 INSERT INTO "hand_mapping" VALUES ('LODGE','l ˈɒ dʒ','ro jyv','ロジュ','ロジュ');
@@ -8945,18 +8945,18 @@ INSERT INTO "hand_mapping" VALUES ('LOUGHTON','l ˈaʊ t ə n','ra u ta nv','ラ
 INSERT INTO "hand_mapping" VALUES ('LOUIS','l ˈuː i','ru - i -','ルーイー','ルーイー');
 INSERT INTO "hand_mapping" VALUES ('LOUISE','l uː ˈiː z','ru - i - zv','ルーイーズ','ルーイーズ');
 INSERT INTO "hand_mapping" VALUES ('LOUISIANA','l uː ˌiː z ɪ ˈæ n ə','ru - i - zi a na','ルーイージアナ','ルーイージアナ');
-INSERT INTO "hand_mapping" VALUES ('LOUISVILLE','l ˈuː ɪ v ˌɪ l','ru - i bi - rv','ルーイビール','ルーイビール');
+INSERT INTO "hand_mapping" VALUES ('LOUISVILLE','l ˈuː ɪ v ˌɪ l','ru - i Vi - rv','ルーイビール','ルーイビール');
 INSERT INTO "hand_mapping" VALUES ('LOUNGE','l ˈaʊ n dʒ','ra u nv jyv','ラウンジュ','ラウンジュ');
 INSERT INTO "hand_mapping" VALUES ('LOUSE','l ˈaʊ s','ra u sv','ラウス','ラウス');
 INSERT INTO "hand_mapping" VALUES ('LOUSY','l ˈaʊ z i','ra u zi -','ラウジー','ラウジー');
 INSERT INTO "hand_mapping" VALUES ('LOUT','l ˈaʊ t','ra u tv','ラウト','ラウト');
-INSERT INTO "hand_mapping" VALUES ('LOVE','l ˈɐ v','ra bv','ラブ','ラブ');
-INSERT INTO "hand_mapping" VALUES ('LOVED','l ˈɐ v d','ra bv dv','ラブド','ラブド');
-INSERT INTO "hand_mapping" VALUES ('LOVELY','l ˈɐ v l i','ra bv ri -','ラブリー','ラブリー');
-INSERT INTO "hand_mapping" VALUES ('LOVER','l ˈɐ v ə','ra ba','ラバ','ラバ');
-INSERT INTO "hand_mapping" VALUES ('LOVERS','l ˈɐ v ə z','ra ba zv','ラバズ','ラバズ');
-INSERT INTO "hand_mapping" VALUES ('LOVES','l ˈɐ v z','ra bv zv','ラブズ','ラブズ');
-INSERT INTO "hand_mapping" VALUES ('LOVING','l ˈɐ v ɪ ŋ','ra bi Nv','ラビン','ロビング');
+INSERT INTO "hand_mapping" VALUES ('LOVE','l ˈɐ v','ra Vv','ラブ','ラブ');
+INSERT INTO "hand_mapping" VALUES ('LOVED','l ˈɐ v d','ra Vv dv','ラブド','ラブド');
+INSERT INTO "hand_mapping" VALUES ('LOVELY','l ˈɐ v l i','ra Vv ri -','ラブリー','ラブリー');
+INSERT INTO "hand_mapping" VALUES ('LOVER','l ˈɐ v ə','ra Va','ラバ','ラバ');
+INSERT INTO "hand_mapping" VALUES ('LOVERS','l ˈɐ v ə z','ra Va zv','ラバズ','ラバズ');
+INSERT INTO "hand_mapping" VALUES ('LOVES','l ˈɐ v z','ra Vv zv','ラブズ','ラブズ');
+INSERT INTO "hand_mapping" VALUES ('LOVING','l ˈɐ v ɪ ŋ','ra Vi Nv','ラビン','ロビング');
 INSERT INTO "hand_mapping" VALUES ('LOW','l ˈəʊ','ro -','ロー','ロー');
 INSERT INTO "hand_mapping" VALUES ('LOWER','l ˈəʊ ə','ro - a','ローア','ローア');
 INSERT INTO "hand_mapping" VALUES ('LOWERED','l ˈəʊ ə d','ro - a dv','ローアド','ローアド');
@@ -9084,7 +9084,7 @@ INSERT INTO "hand_mapping" VALUES ('MALARIA','m ə l ˈɛə ɹ ɪə','ma re a ri
 INSERT INTO "hand_mapping" VALUES ('MALAWI','m ə l ˈɑː w i','ma ra - wi -','マラーウィー','マラーウィー');
 INSERT INTO "hand_mapping" VALUES ('MALAYSIA','m ə l ˈeɪ ʒ ə','ma re i jya','マレイジャ','マレイジャ');
 INSERT INTO "hand_mapping" VALUES ('MALCOLM','m ˈæ l k ə m','ma rv ka mv','マルカム','マルカム');
-INSERT INTO "hand_mapping" VALUES ('MALDIVES','m ˈɔː l d iː v z','mo - rv di - bv zv','モールディーブズ','モールディーブズ');
+INSERT INTO "hand_mapping" VALUES ('MALDIVES','m ˈɔː l d iː v z','mo - rv di - Vv zv','モールディーブズ','モールディーブズ');
 INSERT INTO "hand_mapping" VALUES ('MALE','m ˈeɪ l','me i rv','メイル','メイル');
 INSERT INTO "hand_mapping" VALUES ('MALES','m ˈeɪ l z','me i rv zv','メイルズ','メイルズ');
 INSERT INTO "hand_mapping" VALUES ('MALI','m ˈɑː l i','ma - ri -','マーリー','マーリー');
@@ -9113,7 +9113,7 @@ INSERT INTO "hand_mapping" VALUES ('MANDATE(2)','m ˈæ n d ɪ t','ma nv di tv',
 INSERT INTO "hand_mapping" VALUES ('MANDATORY','m ˈæ n d ə t ə ɹ i','ma nv da ta ri -','マンダタリー','マンダタリー');
 INSERT INTO "hand_mapping" VALUES ('MANDY','m ˈæ n d i','ma nv di -','マンディー','マンディー');
 INSERT INTO "hand_mapping" VALUES ('MANE','m ˈeɪ n','me i nv','メイン','メイン');
-INSERT INTO "hand_mapping" VALUES ('MANEUVRE','m ə n ˈuː v ə','ma nu - ba','マヌーバ','マヌーバ');
+INSERT INTO "hand_mapping" VALUES ('MANEUVRE','m ə n ˈuː v ə','ma nu - Va','マヌーバ','マヌーバ');
 INSERT INTO "hand_mapping" VALUES ('MANGA','m ˈæ ŋ g ə','ma Nv ga','マンガ','マンガ');
 INSERT INTO "hand_mapping" VALUES ('MANHATTAN','m æ n h ˈæ t ə n','ma nv ha x ta nv','マンハッタン','マンハッタン');
 INSERT INTO "hand_mapping" VALUES ('MANIA','m ˈeɪ n ɪə','me i ni a','メイニア','メイニア');
@@ -9125,7 +9125,7 @@ INSERT INTO "hand_mapping" VALUES ('MANKIND','m ˌæ n k ˈaɪ n d','ma nv ka i
 INSERT INTO "hand_mapping" VALUES ('MANNEQUIN','m ˈæ n ɪ k ɪ n','ma ni ki nv','マニキン','マニキン');
 INSERT INTO "hand_mapping" VALUES ('MANNER','m ˈæ n ə','ma na','マナ','マナ');
 INSERT INTO "hand_mapping" VALUES ('MANNERS','m ˈæ n ə z','ma na zv','マナズ','マナズ');
-INSERT INTO "hand_mapping" VALUES ('MANOEUVRE','m ə n ˈuː v ə','ma nu - ba','マヌーバ','マヌーバ');
+INSERT INTO "hand_mapping" VALUES ('MANOEUVRE','m ə n ˈuː v ə','ma nu - Va','マヌーバ','マヌーバ');
 INSERT INTO "hand_mapping" VALUES ('MANOR','m ˈæ n ə','ma na','マナ','マナ');
 INSERT INTO "hand_mapping" VALUES ('MANPOWER','m ˈæ n p ˌaʊ ə','ma nv pa u a','マンパウア','マンパウア');
 INSERT INTO "hand_mapping" VALUES ('MANSFIELD','m ˈæ n s f ˌiː l d','ma nv sv fi - rv dv','マンスフィールド','マンスフィールド');
@@ -9204,9 +9204,9 @@ INSERT INTO "hand_mapping" VALUES ('MARTIAL','m ˈɑː ʃ ə l','ma - sya rv','
 INSERT INTO "hand_mapping" VALUES ('MARTIN','m ˈɑː t ɪ n','ma - ti nv','マーティン','マーティン');
 INSERT INTO "hand_mapping" VALUES ('MARTS','m ˈɑː t s','ma - tsv','マーツ','マーツ');
 INSERT INTO "hand_mapping" VALUES ('MARTYR','m ˈɑː t ə','ma - ta','マータ','マータ');
-INSERT INTO "hand_mapping" VALUES ('MARVEL','m ˈɑː v ə l','ma - ba rv','マーバル','マーバル');
-INSERT INTO "hand_mapping" VALUES ('MARVELLOUS','m ˈɑː v ə l ə s','ma - ba ra sv','マーバラス','マーバラス');
-INSERT INTO "hand_mapping" VALUES ('MARVELOUS','m ˈɑː v ə l ə s','ma - ba ra sv','マーバラス','マーバラス');
+INSERT INTO "hand_mapping" VALUES ('MARVEL','m ˈɑː v ə l','ma - Va rv','マーバル','マーバル');
+INSERT INTO "hand_mapping" VALUES ('MARVELLOUS','m ˈɑː v ə l ə s','ma - Va ra sv','マーバラス','マーバラス');
+INSERT INTO "hand_mapping" VALUES ('MARVELOUS','m ˈɑː v ə l ə s','ma - Va ra sv','マーバラス','マーバラス');
 INSERT INTO "hand_mapping" VALUES ('MARX','m ˈɑː k s','ma - kv sv','マークス','マークス');
 INSERT INTO "hand_mapping" VALUES ('MARXIST','m ˈɑː k s ɪ s t','ma - kv si sv tv','マークシスト','マークシスト');
 INSERT INTO "hand_mapping" VALUES ('MARY','m ˈɛə ɹ i','me a ri -','メアリー','メアリー');
@@ -9226,7 +9226,7 @@ INSERT INTO "hand_mapping" VALUES ('MASSACRE','m ˈæ s ə k ə','ma x sa ka','
 INSERT INTO "hand_mapping" VALUES ('MASSAGE','m ə s ˈɑː ʒ','ma sa - jyv','マサージュ','マサージュ');
 INSERT INTO "hand_mapping" VALUES ('MASSES','m ˈæ s ɪ z','ma x si zv','マッシズ','マッシズ');
 INSERT INTO "hand_mapping" VALUES ('MASSIF','m ˈæ s iː f','ma x si - fv','マッシーフ','マッシーフ');
-INSERT INTO "hand_mapping" VALUES ('MASSIVE','m ˈæ s ɪ v','ma x si bv','マッシブ','マッシブ');
+INSERT INTO "hand_mapping" VALUES ('MASSIVE','m ˈæ s ɪ v','ma x si Vv','マッシブ','マッシブ');
 INSERT INTO "hand_mapping" VALUES ('MAST','m ˈɑː s t','ma - sv tv','マースト','マースト');
 INSERT INTO "hand_mapping" VALUES ('MASTER','m ˈɑː s t ə','ma - sv ta','マースタ','マースタ');
 INSERT INTO "hand_mapping" VALUES ('MASTERCARD','m ˈɑː s t ə k ˌɑː d','ma - sv ta ka - dv','マースタカード','マースタカード');
@@ -9268,8 +9268,8 @@ INSERT INTO "hand_mapping" VALUES ('MAUL','m ˈɔː l','mo - rv','モール','
 INSERT INTO "hand_mapping" VALUES ('MAUREEN','m ˈɔː ɹ iː n','mo - ri - nv','モーリーン','モーリーン');
 INSERT INTO "hand_mapping" VALUES ('MAURICE','m ˈɒ ɹ ɪ s','mo ri sv','モリス','モリス');
 INSERT INTO "hand_mapping" VALUES ('MAURITIUS','m ə ɹ ˈɪ ʃ ə s','ma ri sya sv','マリシャス','マリシャス');
-INSERT INTO "hand_mapping" VALUES ('MAVEN','m ˈeɪ v ə n','me i ba nv','メイバン','メイバン');
-INSERT INTO "hand_mapping" VALUES ('MAVERICK','m ˈæ v ə ɹ ɪ k','ma ba ri kv','マバリク','マバリク');
+INSERT INTO "hand_mapping" VALUES ('MAVEN','m ˈeɪ v ə n','me i Va nv','メイバン','メイバン');
+INSERT INTO "hand_mapping" VALUES ('MAVERICK','m ˈæ v ə ɹ ɪ k','ma Va ri kv','マバリク','マバリク');
 INSERT INTO "hand_mapping" VALUES ('MAX','m ˈæ k s','ma x kv sv','マックス','マックス');
 INSERT INTO "hand_mapping" VALUES ('MAXIM','m ˈæ k s ɪ m','ma x kv si mv','マックシム','マックシム');
 INSERT INTO "hand_mapping" VALUES ('MAXIMA','m ˈæ k s ɪ m ə','ma x kv si ma','マックシマ','マックシマ');
@@ -9324,8 +9324,8 @@ INSERT INTO "hand_mapping" VALUES ('MEDICATION','m ˌɛ d ɪ k ˈeɪ ʃ ə n','m
 INSERT INTO "hand_mapping" VALUES ('MEDICATIONS','m ˌɛ d ɪ k ˈeɪ ʃ ə n z','me - di ke i sya nv zv','メーディケイシャンズ','メーディケイシャンズ');
 INSERT INTO "hand_mapping" VALUES ('MEDICINE','m ˈɛ d ɪ s ɪ n','me di si nv','メディシン','メディシン');
 INSERT INTO "hand_mapping" VALUES ('MEDICINES','m ˈɛ d ɪ s ɪ n z','me di si nv zv','メディシンズ','メディシンズ');
-INSERT INTO "hand_mapping" VALUES ('MEDIEVAL(1)','m ɛ d ˈiː v ə l','me di - ba rv','メディーバル','メディーバル');
-INSERT INTO "hand_mapping" VALUES ('MEDIEVAL(2)','m ɛ d ɪ ˈiː v ə l','me di i - ba rv','メディイーバル','メディイーバル');
+INSERT INTO "hand_mapping" VALUES ('MEDIEVAL(1)','m ɛ d ˈiː v ə l','me di - Va rv','メディーバル','メディーバル');
+INSERT INTO "hand_mapping" VALUES ('MEDIEVAL(2)','m ɛ d ɪ ˈiː v ə l','me di i - Va rv','メディイーバル','メディイーバル');
 INSERT INTO "hand_mapping" VALUES ('MEDIOCRE(1)','m ˌiː d ɪ ˈəʊ k ə','mi - di o - ka','ミーディオーカ','ミーディオーカ');
 INSERT INTO "hand_mapping" VALUES ('MEDIOCRE(2)','m ˈiː d ɪ ˌəʊ k ə','mi - di o ka','ミーディオカ','ミーディオカ');
 INSERT INTO "hand_mapping" VALUES ('MEDITATION','m ˌɛ d ɪ t ˈeɪ ʃ ə n','me - di te i sya nv','メーディテイシャン','メーディテイション');
@@ -9440,7 +9440,7 @@ INSERT INTO "hand_mapping" VALUES ('MICKEY','m ˈɪ k i','mi ki -','ミキー','
 INSERT INTO "hand_mapping" VALUES ('MICRO','m ˈaɪ k ɹ ˌəʊ','ma i kv ro','マイクロ','マイクロ');
 INSERT INTO "hand_mapping" VALUES ('MICROPHONE','m ˈaɪ k ɹ ə f ˌəʊ n','ma i kv ra fo nv','マイクラフォン','マイクラフォン');
 INSERT INTO "hand_mapping" VALUES ('MICROSOFT','m ˈaɪ k ɹ ə s ˌɒ f t','ma i kv ra so fv tv','マイクラソフト','マイクラソフト');
-INSERT INTO "hand_mapping" VALUES ('MICROWAVE','m ˈaɪ k ɹ ə w ˌeɪ v','ma i kv ra we i bv','マイクラウェイブ','マイクラウェイブ');
+INSERT INTO "hand_mapping" VALUES ('MICROWAVE','m ˈaɪ k ɹ ə w ˌeɪ v','ma i kv ra we i Vv','マイクラウェイブ','マイクラウェイブ');
 INSERT INTO "hand_mapping" VALUES ('MIDDAY','m ˈɪ d d ˌeɪ','mi dv de i','ミドデイ','ミドデイ');
 INSERT INTO "hand_mapping" VALUES ('MIDDLE','m ˈɪ d ə l','mi da rv','ミダル','ミダル');
 INSERT INTO "hand_mapping" VALUES ('MIDDLE-AGED','m ˈɪ d ə l eɪ dʒ d','mi da re i jyv dv','ミダレイジュド','ミダレイジュド');
@@ -9536,7 +9536,7 @@ INSERT INTO "hand_mapping" VALUES ('MISCARRIAGE','m ɪ s k ˈæ ɹ ɪ dʒ','mi s
 INSERT INTO "hand_mapping" VALUES ('MISCARRIAGES','m ɪ s k ˈæ ɹ ɪ dʒ ɪ z','mi sv ka ri jyi zv','ミスカリジィズ','ミスカリジィズ');
 INSERT INTO "hand_mapping" VALUES ('MISCELLANEOUS','m ˌɪ s ə l ˈeɪ n ɪə s','mi - sa re i ni a sv','ミーサレイニアス','ミーサレイニアス');
 INSERT INTO "hand_mapping" VALUES ('MISCHIEF','m ˈɪ s tʃ ɪ f','mi sv tyi fv','ミスチィフ','ミスチィフ');
-INSERT INTO "hand_mapping" VALUES ('MISCHIEVOUS','m ˈɪ s tʃ ɪ v ə s','mi sv tyi ba sv','ミスチィバス','ミスチィバス');
+INSERT INTO "hand_mapping" VALUES ('MISCHIEVOUS','m ˈɪ s tʃ ɪ v ə s','mi sv tyi Va sv','ミスチィバス','ミスチィバス');
 INSERT INTO "hand_mapping" VALUES ('MISERABLE(1)','m ˈɪ z ɹ ə b ə l','mi zv ra ba rv','ミズラバル','ミズラバル');
 INSERT INTO "hand_mapping" VALUES ('MISERABLE(2)','m ˈɪ z ə ɹ ə b ə l','mi za ra ba rv','ミザラバル','ミザラバル');
 INSERT INTO "hand_mapping" VALUES ('MISERY','m ˈɪ z ə ɹ i','mi za ri -','ミザリー','ミザリー');
@@ -9613,7 +9613,7 @@ INSERT INTO "hand_mapping" VALUES ('MOIST','m ˈɔɪ s t','mo i sv tv','モイ
 INSERT INTO "hand_mapping" VALUES ('MOISTURE','m ˈɔɪ s tʃ ə','mo i sv tya','モイスチャ','モイスチャ');
 INSERT INTO "hand_mapping" VALUES ('MOLAR','m ˈəʊ l ə','mo - ra','モーラ','モーラ');
 INSERT INTO "hand_mapping" VALUES ('MOLD','m ˈəʊ l d','mo - rv dv','モールド','モールド');
-INSERT INTO "hand_mapping" VALUES ('MOLDOVA','m ˌɒ l d ˈəʊ v ə','mo rv do - ba','モルドーバ','モルドーバ');
+INSERT INTO "hand_mapping" VALUES ('MOLDOVA','m ˌɒ l d ˈəʊ v ə','mo rv do - Va','モルドーバ','モルドーバ');
 INSERT INTO "hand_mapping" VALUES ('MOLE','m ˈəʊ l','mo - rv','モール','モール');
 INSERT INTO "hand_mapping" VALUES ('MOLECULAR','m ə l ˈɛ k j ʊ l ə','ma re kyu ra','マレキュラ','モレキュラ');
 INSERT INTO "hand_mapping" VALUES ('MOLECULE','m ˈɒ l ɪ k j ˌuː l','mo ri kyu - rv','モリキュール','モリキュール');
@@ -9681,7 +9681,7 @@ INSERT INTO "hand_mapping" VALUES ('MORALITY','m ə ɹ ˈæ l ɪ t i','ma ra ri
 INSERT INTO "hand_mapping" VALUES ('MORAY(1)','m ɒ ɹ ˈeɪ','mo re i','モレイ','モレイ');
 INSERT INTO "hand_mapping" VALUES ('MORAY(2)','m ˈɐ ɹ i','ma ri -','マリー','モリー');
 INSERT INTO "hand_mapping" VALUES ('MORE','m ˈɔː','mo -','モー','モー');
-INSERT INTO "hand_mapping" VALUES ('MOREOVER','m ɔː ɹ ˈəʊ v ə','mo - ro - ba','モーローバ','モーローバ');
+INSERT INTO "hand_mapping" VALUES ('MOREOVER','m ɔː ɹ ˈəʊ v ə','mo - ro - Va','モーローバ','モーローバ');
 INSERT INTO "hand_mapping" VALUES ('MORGAN','m ˈɔː g ə n','mo - ga nv','モーガン','モーガン');
 INSERT INTO "hand_mapping" VALUES ('MORGUE','m ˈɔː g','mo - gv','モーグ','モーグ');
 INSERT INTO "hand_mapping" VALUES ('MORN','m ˈɔː n','mo - nv','モーン','モーン');
@@ -9719,11 +9719,11 @@ INSERT INTO "hand_mapping" VALUES ('MOTHERS','m ˈɐ ð ə z','ma za zv','マザ
 INSERT INTO "hand_mapping" VALUES ('MOTIF','m əʊ t ˈiː f','mo ti - fv','モティーフ','モティーフ');
 INSERT INTO "hand_mapping" VALUES ('MOTION','m ˈəʊ ʃ ə n','mo - sya nv','モーシャン','モーション');
 INSERT INTO "hand_mapping" VALUES ('MOTIONS','m ˈəʊ ʃ ə n z','mo - sya nv zv','モーシャンズ','モーシャンズ');
-INSERT INTO "hand_mapping" VALUES ('MOTIVATE','m ˈəʊ t ɪ v ˌeɪ t','mo - ti be i tv','モーティベイト','モーティベイト');
-INSERT INTO "hand_mapping" VALUES ('MOTIVATED','m ˈəʊ t ɪ v ˌeɪ t ɪ d','mo - ti be i ti dv','モーティベイティド','モーティベイティド');
-INSERT INTO "hand_mapping" VALUES ('MOTIVATION','m ˌəʊ t ɪ v ˈeɪ ʃ ə n','mo ti be i sya nv','モティベイシャン','モティベイション');
-INSERT INTO "hand_mapping" VALUES ('MOTIVE','m ˈəʊ t ɪ v','mo - ti bv','モーティブ','モーティブ');
-INSERT INTO "hand_mapping" VALUES ('MOTIVES','m ˈəʊ t ɪ v z','mo - ti bv zv','モーティブズ','モーティブズ');
+INSERT INTO "hand_mapping" VALUES ('MOTIVATE','m ˈəʊ t ɪ v ˌeɪ t','mo - ti Ve i tv','モーティベイト','モーティベイト');
+INSERT INTO "hand_mapping" VALUES ('MOTIVATED','m ˈəʊ t ɪ v ˌeɪ t ɪ d','mo - ti Ve i ti dv','モーティベイティド','モーティベイティド');
+INSERT INTO "hand_mapping" VALUES ('MOTIVATION','m ˌəʊ t ɪ v ˈeɪ ʃ ə n','mo ti Ve i sya nv','モティベイシャン','モティベイション');
+INSERT INTO "hand_mapping" VALUES ('MOTIVE','m ˈəʊ t ɪ v','mo - ti Vv','モーティブ','モーティブ');
+INSERT INTO "hand_mapping" VALUES ('MOTIVES','m ˈəʊ t ɪ v z','mo - ti Vv zv','モーティブズ','モーティブズ');
 INSERT INTO "hand_mapping" VALUES ('MOTOR','m ˈəʊ t ə','mo - ta','モータ','モータ');
 INSERT INTO "hand_mapping" VALUES ('MOTORBIKE','m ˈəʊ t ə b ˌaɪ k','mo - ta ba i kv','モータバイク','モータバイク');
 INSERT INTO "hand_mapping" VALUES ('MOTORCYCLE','m ˈəʊ t ə s ˌaɪ k ə l','mo - ta sa i ka rv','モータサイカル','モータサイカル');
@@ -9746,15 +9746,15 @@ INSERT INTO "hand_mapping" VALUES ('MOUSSE','m ˈuː s','mu - sv','ムース','
 INSERT INTO "hand_mapping" VALUES ('MOUSTACHE','m ə s t ˌɑː ʃ','ma sv ta - syv','マスターシュ','マスターシュ');
 INSERT INTO "hand_mapping" VALUES ('MOUTH','m ˈaʊ θ','ma u sv','マウス','マウス');
 INSERT INTO "hand_mapping" VALUES ('MOUTHFUL','m ˈaʊ θ f ʊ l','ma u sv fu rv','マウスフル','マウスフル');
-INSERT INTO "hand_mapping" VALUES ('MOVE','m ˈuː v','mu - bv','ムーブ','ムーブ');
-INSERT INTO "hand_mapping" VALUES ('MOVED','m ˈuː v d','mu - bv dv','ムーブド','ムーブド');
-INSERT INTO "hand_mapping" VALUES ('MOVEMENT','m ˈuː v m ə n t','mu - bv ma nv tv','ムーブマント','ムーブメント');
-INSERT INTO "hand_mapping" VALUES ('MOVEMENTS','m ˈuː v m ə n t s','mu - bv ma nv tsv','ムーブマンツ','ムーブマンツ');
-INSERT INTO "hand_mapping" VALUES ('MOVERS','m ˈuː v ə z','mu - ba zv','ムーバズ','ムーバズ');
-INSERT INTO "hand_mapping" VALUES ('MOVES','m ˈuː v z','mu - bv zv','ムーブズ','ムーブズ');
-INSERT INTO "hand_mapping" VALUES ('MOVIE','m ˈuː v i','mu - bi -','ムービー','ムービー');
-INSERT INTO "hand_mapping" VALUES ('MOVIES','m ˈuː v i z','mu - bi - zv','ムービーズ','ムービーズ');
-INSERT INTO "hand_mapping" VALUES ('MOVING','m ˈuː v ɪ ŋ','mu - bi Nv','ムービン','ムービング');
+INSERT INTO "hand_mapping" VALUES ('MOVE','m ˈuː v','mu - Vv','ムーブ','ムーブ');
+INSERT INTO "hand_mapping" VALUES ('MOVED','m ˈuː v d','mu - Vv dv','ムーブド','ムーブド');
+INSERT INTO "hand_mapping" VALUES ('MOVEMENT','m ˈuː v m ə n t','mu - Vv ma nv tv','ムーブマント','ムーブメント');
+INSERT INTO "hand_mapping" VALUES ('MOVEMENTS','m ˈuː v m ə n t s','mu - Vv ma nv tsv','ムーブマンツ','ムーブマンツ');
+INSERT INTO "hand_mapping" VALUES ('MOVERS','m ˈuː v ə z','mu - Va zv','ムーバズ','ムーバズ');
+INSERT INTO "hand_mapping" VALUES ('MOVES','m ˈuː v z','mu - Vv zv','ムーブズ','ムーブズ');
+INSERT INTO "hand_mapping" VALUES ('MOVIE','m ˈuː v i','mu - Vi -','ムービー','ムービー');
+INSERT INTO "hand_mapping" VALUES ('MOVIES','m ˈuː v i z','mu - Vi - zv','ムービーズ','ムービーズ');
+INSERT INTO "hand_mapping" VALUES ('MOVING','m ˈuː v ɪ ŋ','mu - Vi Nv','ムービン','ムービング');
 INSERT INTO "hand_mapping" VALUES ('MOW','m ˈəʊ','mo -','モー','モー');
 INSERT INTO "hand_mapping" VALUES ('MOWED','m ˈəʊ d','mo - dv','モード','モード');
 INSERT INTO "hand_mapping" VALUES ('MOWN','m ˈəʊ n','mo - nv','モーン','モーン');
@@ -9852,7 +9852,7 @@ INSERT INTO "hand_mapping" VALUES ('NAGGING','n ˈæ g ɪ ŋ','na gi Nv','ナギ
 INSERT INTO "hand_mapping" VALUES ('NAH','n ˈæ','na','ナ','ナ');
 INSERT INTO "hand_mapping" VALUES ('NAIL','n ˈeɪ l','ne i rv','ネイル','ネイル');
 INSERT INTO "hand_mapping" VALUES ('NAILS','n ˈeɪ l z','ne i rv zv','ネイルズ','ネイルズ');
-INSERT INTO "hand_mapping" VALUES ('NAIVE','n ˌaɪ ˈiː v','na i i - bv','ナイイーブ','ナイイーブ');
+INSERT INTO "hand_mapping" VALUES ('NAIVE','n ˌaɪ ˈiː v','na i i - Vv','ナイイーブ','ナイイーブ');
 INSERT INTO "hand_mapping" VALUES ('NAKED','n ˈeɪ k ɪ d','ne i ki dv','ネイキド','ネイキド');
 INSERT INTO "hand_mapping" VALUES ('NAME','n ˈeɪ m','ne i mv','ネイム','ネイム');
 INSERT INTO "hand_mapping" VALUES ('NAMED','n ˈeɪ m d','ne i mv dv','ネイムド','ネイムド');
@@ -9868,7 +9868,7 @@ INSERT INTO "hand_mapping" VALUES ('NAPE','n ˈeɪ p','ne i pv','ネイプ','ネ
 INSERT INTO "hand_mapping" VALUES ('NAPLES','n ˈeɪ p ə l z','ne i pa rv zv','ネイパルズ','ネイパルズ');
 INSERT INTO "hand_mapping" VALUES ('NAPOLEON','n ə p ˈəʊ l ɪə n','na po - ri a nv','ナポーリアン','ナポーリアン');
 INSERT INTO "hand_mapping" VALUES ('NAPPY','n ˈæ p i','na x pi -','ナッピー','ナッピー');
-INSERT INTO "hand_mapping" VALUES ('NARRATIVE','n ˈæ ɹ ə t ɪ v','na ra ti bv','ナラティブ','ナラティブ');
+INSERT INTO "hand_mapping" VALUES ('NARRATIVE','n ˈæ ɹ ə t ɪ v','na ra ti Vv','ナラティブ','ナラティブ');
 INSERT INTO "hand_mapping" VALUES ('NARRATOR','n ə ɹ ˈeɪ t ə','na re i ta','ナレイタ','ナレイタ');
 INSERT INTO "hand_mapping" VALUES ('NARROW','n ˈæ ɹ əʊ','na ro','ナロ','ナロ');
 INSERT INTO "hand_mapping" VALUES ('NARROWLY','n ˈæ ɹ əʊ l i','na ro ri -','ナロリー','ナロリー');
@@ -9876,7 +9876,7 @@ INSERT INTO "hand_mapping" VALUES ('NASA','n ˈæ s ə','na x sa','ナッサ','
 INSERT INTO "hand_mapping" VALUES ('NASAL','n ˈeɪ z ə l','ne i za rv','ネイザル','ネイザル');
 INSERT INTO "hand_mapping" VALUES ('NASCAR','n ˈæ s k ˌɑː','na x sv ka -','ナッスカー','ナッスカー');
 INSERT INTO "hand_mapping" VALUES ('NASDAQ','n ˈæ z d æ k','na zv da kv','ナズダク','ナズダク');
-INSERT INTO "hand_mapping" VALUES ('NASHVILLE','n ˈæ ʃ v ɪ l','na x syv bi rv','ナッシュビル','ナッシュビル');
+INSERT INTO "hand_mapping" VALUES ('NASHVILLE','n ˈæ ʃ v ɪ l','na x syv Vi rv','ナッシュビル','ナッシュビル');
 INSERT INTO "hand_mapping" VALUES ('NASTY','n ˈɑː s t i','na - sv ti -','ナースティー','ナースティー');
 INSERT INTO "hand_mapping" VALUES ('NAT','n ˈæ t','na x tv','ナット','ナット');
 INSERT INTO "hand_mapping" VALUES ('NATALIE','n ˈæ t ə l i','na x ta ri -','ナッタリー','ナッタリー');
@@ -9892,7 +9892,7 @@ INSERT INTO "hand_mapping" VALUES ('NATIONALLY(1)','n ˈæ ʃ n ə l i','na x sy
 INSERT INTO "hand_mapping" VALUES ('NATIONALLY(2)','n ˈæ ʃ ə n ə l i','na x sya na ri -','ナッシャナリー','ナッシャナリー');
 INSERT INTO "hand_mapping" VALUES ('NATIONS','n ˈeɪ ʃ ə n z','ne i sya nv zv','ネイシャンズ','ネイシャンズ');
 INSERT INTO "hand_mapping" VALUES ('NATIONWIDE','n ˈeɪ ʃ ə n w ˌaɪ d','ne i sya nwa i dv','ネイシャンワイド','ネイシャンワイド');
-INSERT INTO "hand_mapping" VALUES ('NATIVE','n ˈeɪ t ɪ v','ne i ti bv','ネイティブ','ネイティブ');
+INSERT INTO "hand_mapping" VALUES ('NATIVE','n ˈeɪ t ɪ v','ne i ti Vv','ネイティブ','ネイティブ');
 INSERT INTO "hand_mapping" VALUES ('NATO','n ˈeɪ t əʊ','ne i to','ネイト','ネイト');
 INSERT INTO "hand_mapping" VALUES ('NATURAL(1)','n ˈæ tʃ ɹ ə l','na x tyv ra rv','ナッチュラル','ナッチュラル');
 INSERT INTO "hand_mapping" VALUES ('NATURAL(2)','n ˈæ tʃ ə ɹ ə l','na x tya ra rv','ナッチャラル','ナッチャラル');
@@ -9904,13 +9904,13 @@ INSERT INTO "hand_mapping" VALUES ('NATURE','n ˈeɪ tʃ ə','ne i tya','ネイ
 INSERT INTO "hand_mapping" VALUES ('NAUGHTY','n ˈɔː t i','no - ti -','ノーティー','ノーティー');
 INSERT INTO "hand_mapping" VALUES ('NAUSEOUS(1)','n ˈɔː z ɪə s','no - zi a sv','ノージアス','ノージアス');
 INSERT INTO "hand_mapping" VALUES ('NAUSEOUS(2)','n ˈɔː s ɪə s','no - si a sv','ノーシアス','ノーシアス');
-INSERT INTO "hand_mapping" VALUES ('NAVAL','n ˈeɪ v ə l','ne i ba rv','ネイバル','ネイバル');
-INSERT INTO "hand_mapping" VALUES ('NAVE','n ˈeɪ v','ne i bv','ネイブ','ネイブ');
-INSERT INTO "hand_mapping" VALUES ('NAVEL','n ˈeɪ v ə l','ne i ba rv','ネイバル','ネイバル');
-INSERT INTO "hand_mapping" VALUES ('NAVIGATE','n ˈæ v ɪ g ˌeɪ t','na bi ge i tv','ナビゲイト','ナビゲイト');
-INSERT INTO "hand_mapping" VALUES ('NAVIGATION','n ˌæ v ɪ g ˈeɪ ʃ ə n','na bi ge i sya nv','ナビゲイシャン','ナビゲイション');
-INSERT INTO "hand_mapping" VALUES ('NAVIGATOR','n ˈæ v ɪ g ˌeɪ t ə','na bi ge i ta','ナビゲイタ','ナビゲイタ');
-INSERT INTO "hand_mapping" VALUES ('NAVY','n ˈeɪ v i','ne i bi -','ネイビー','ネイビー');
+INSERT INTO "hand_mapping" VALUES ('NAVAL','n ˈeɪ v ə l','ne i Va rv','ネイバル','ネイバル');
+INSERT INTO "hand_mapping" VALUES ('NAVE','n ˈeɪ v','ne i Vv','ネイブ','ネイブ');
+INSERT INTO "hand_mapping" VALUES ('NAVEL','n ˈeɪ v ə l','ne i Va rv','ネイバル','ネイバル');
+INSERT INTO "hand_mapping" VALUES ('NAVIGATE','n ˈæ v ɪ g ˌeɪ t','na Vi ge i tv','ナビゲイト','ナビゲイト');
+INSERT INTO "hand_mapping" VALUES ('NAVIGATION','n ˌæ v ɪ g ˈeɪ ʃ ə n','na Vi ge i sya nv','ナビゲイシャン','ナビゲイション');
+INSERT INTO "hand_mapping" VALUES ('NAVIGATOR','n ˈæ v ɪ g ˌeɪ t ə','na Vi ge i ta','ナビゲイタ','ナビゲイタ');
+INSERT INTO "hand_mapping" VALUES ('NAVY','n ˈeɪ v i','ne i Vi -','ネイビー','ネイビー');
 INSERT INTO "hand_mapping" VALUES ('NAY','n ˈeɪ','ne i','ネイ','ネイ');
 INSERT INTO "hand_mapping" VALUES ('NAZI','n ˈɑː t s i','na - tsi -','ナーツィー','ナーツィー');
 INSERT INTO "hand_mapping" VALUES ('NEAR','n ˈɪə','ni a','ニア','ニア');
@@ -9941,7 +9941,7 @@ INSERT INTO "hand_mapping" VALUES ('NEEDLESS','n ˈiː d l ɪ s','ni - dv ri sv'
 INSERT INTO "hand_mapping" VALUES ('NEEDN''T','n ˈiː d ə n t','ni - da nv tv','ニーダント','ニーダント');
 INSERT INTO "hand_mapping" VALUES ('NEEDS','n ˈiː d z','ni - zv','ニーズ','ニーズ');
 INSERT INTO "hand_mapping" VALUES ('NEEDY','n ˈiː d i','ni - di -','ニーディー','ニーディー');
-INSERT INTO "hand_mapping" VALUES ('NEGATIVE','n ˈɛ g ə t ɪ v','ne ga ti bv','ネガティブ','ネガティブ');
+INSERT INTO "hand_mapping" VALUES ('NEGATIVE','n ˈɛ g ə t ɪ v','ne ga ti Vv','ネガティブ','ネガティブ');
 INSERT INTO "hand_mapping" VALUES ('NEGLECT','n ɪ g l ˈɛ k t','ni gv re kv tv','ニグレクト','ニグレクト');
 INSERT INTO "hand_mapping" VALUES ('NEGLIGENCE','n ˈɛ g l ɪ dʒ ə n s','ne gv ri jya nv sv','ネグリジャンス','ネグリジャンス');
 INSERT INTO "hand_mapping" VALUES ('NEGOTIATE','n ɪ g ˈəʊ ʃ ɪ ˌeɪ t','ni go - syi e i tv','ニゴーシエイト','ニゴーシエイト');
@@ -9968,9 +9968,9 @@ INSERT INTO "hand_mapping" VALUES ('NEPAL','n ə p ˈɔː l','na po - rv','ナ
 INSERT INTO "hand_mapping" VALUES ('NEPHEW','n ˈɛ f j uː','ne fyu -','ネフュー','ネフュー');
 INSERT INTO "hand_mapping" VALUES ('NEPTUNE','n ˈɛ p t j uː n','ne pv tyu - nv','ネプチューン','ネプチューン');
 INSERT INTO "hand_mapping" VALUES ('NERD','n ˈɜː d','ne - dv','ネード','ネード');
-INSERT INTO "hand_mapping" VALUES ('NERVE','n ˈɜː v','ne - bv','ネーブ','ネーブ');
-INSERT INTO "hand_mapping" VALUES ('NERVES','n ˈɜː v z','ne - bv zv','ネーブズ','ネーブズ');
-INSERT INTO "hand_mapping" VALUES ('NERVOUS','n ˈɜː v ə s','ne - ba sv','ネーバス','ネーバス');
+INSERT INTO "hand_mapping" VALUES ('NERVE','n ˈɜː v','ne - Vv','ネーブ','ネーブ');
+INSERT INTO "hand_mapping" VALUES ('NERVES','n ˈɜː v z','ne - Vv zv','ネーブズ','ネーブズ');
+INSERT INTO "hand_mapping" VALUES ('NERVOUS','n ˈɜː v ə s','ne - Va sv','ネーバス','ネーバス');
 INSERT INTO "hand_mapping" VALUES ('NEST','n ˈɛ s t','ne sv tv','ネスト','ネスト');
 INSERT INTO "hand_mapping" VALUES ('NESTED','n ˈɛ s t ɪ d','ne sv ti dv','ネスティド','ネスティド');
 INSERT INTO "hand_mapping" VALUES ('NET','n ˈɛ t','ne tv','ネト','ネト');
@@ -9984,9 +9984,9 @@ INSERT INTO "hand_mapping" VALUES ('NEURAL','n j ˈʊə ɹ ə l','nyu a ra rv','
 INSERT INTO "hand_mapping" VALUES ('NEURON','n j ˈʊə ɹ ɒ n','nyu a ro nv','ニュアロン','ニュアロン');
 INSERT INTO "hand_mapping" VALUES ('NEURONE','n j ˈʊə ɹ ɒ n','nyu a ro nv','ニュアロン','ニュアロン');
 INSERT INTO "hand_mapping" VALUES ('NEUTRAL','n j ˈuː t ɹ ə l','nyu - tv ra rv','ニュートラル','ニュートラル');
-INSERT INTO "hand_mapping" VALUES ('NEVADA','n ɪ v ˈɑː d ə','ni ba - da','ニバーダ','ニバーダ');
-INSERT INTO "hand_mapping" VALUES ('NEVER','n ˈɛ v ə','ne ba','ネバ','ネバ');
-INSERT INTO "hand_mapping" VALUES ('NEVERTHELESS','n ˌɛ v ə ð ə l ˈɛ s','ne - ba za re sv','ネーバザレス','ネーバザレス');
+INSERT INTO "hand_mapping" VALUES ('NEVADA','n ɪ v ˈɑː d ə','ni Va - da','ニバーダ','ニバーダ');
+INSERT INTO "hand_mapping" VALUES ('NEVER','n ˈɛ v ə','ne Va','ネバ','ネバ');
+INSERT INTO "hand_mapping" VALUES ('NEVERTHELESS','n ˌɛ v ə ð ə l ˈɛ s','ne - Va za re sv','ネーバザレス','ネーバザレス');
 INSERT INTO "hand_mapping" VALUES ('NEW','n j ˈuː','nyu -','ニュー','ニュー');
 INSERT INTO "hand_mapping" VALUES ('NEWARK','n j ˈuː ə k','nyu - a kv','ニューアク','ニューアク');
 INSERT INTO "hand_mapping" VALUES ('NEWBIE','n j ˈuː b i','nyu - bi -','ニュービー','ニュービー');
@@ -10062,8 +10062,8 @@ INSERT INTO "hand_mapping" VALUES ('NIP','n ˈɪ p','ni pv','ニプ','ニプ');
 INSERT INTO "hand_mapping" VALUES ('NIPPLE','n ˈɪ p ə l','ni pa rv','ニパル','ニパル');
 INSERT INTO "hand_mapping" VALUES ('NIPPLES','n ˈɪ p ə l z','ni pa rv zv','ニパルズ','ニパルズ');
 INSERT INTO "hand_mapping" VALUES ('NIPPY','n ˈɪ p i','ni pi -','ニピー','ニピー');
-INSERT INTO "hand_mapping" VALUES ('NIRVANA(1)','n ɜː v ˈɑː n ə','ne - ba - na','ネーバーナ','ネーバーナ');
-INSERT INTO "hand_mapping" VALUES ('NIRVANA(2)','n ɪə v ˈɑː n ə','ni a ba - na','ニアバーナ','ニアバーナ');
+INSERT INTO "hand_mapping" VALUES ('NIRVANA(1)','n ɜː v ˈɑː n ə','ne - Va - na','ネーバーナ','ネーバーナ');
+INSERT INTO "hand_mapping" VALUES ('NIRVANA(2)','n ɪə v ˈɑː n ə','ni a Va - na','ニアバーナ','ニアバーナ');
 INSERT INTO "hand_mapping" VALUES ('NISSAN(1)','n ˈɪ s æ n','ni sa nv','ニサン','ニサン');
 INSERT INTO "hand_mapping" VALUES ('NISSAN(2)','n ˈiː s ɑː n','ni - sa nv','ニーサン','ニーサン');
 INSERT INTO "hand_mapping" VALUES ('NIT','n ˈɪ t','ni tv','ニト','ニト');
@@ -10158,12 +10158,12 @@ INSERT INTO "hand_mapping" VALUES ('NOTTINGHAM','n ˈɒ t ɪ ŋ ə m','no x ti N
 INSERT INTO "hand_mapping" VALUES ('NOTTINGHAMSHIRE','n ˈɒ t ɪ ŋ ə m ʃ ə','no x ti Na mv sya','ノッティンアムシャ','ノッティンアムシャ');
 INSERT INTO "hand_mapping" VALUES ('NOUGHT','n ˈɔː t','no - tv','ノート','ノート');
 INSERT INTO "hand_mapping" VALUES ('NOUN','n ˈaʊ n','na u nv','ナウン','ナウン');
-INSERT INTO "hand_mapping" VALUES ('NOVA','n ˈəʊ v ə','no - ba','ノーバ','ノーバ');
-INSERT INTO "hand_mapping" VALUES ('NOVEL','n ˈɒ v ə l','no ba rv','ノバル','ノバル');
-INSERT INTO "hand_mapping" VALUES ('NOVELS','n ˈɒ v ə l z','no ba rv zv','ノバルズ','ノバルズ');
-INSERT INTO "hand_mapping" VALUES ('NOVELTY','n ˈɒ v ə l t i','no ba rv ti -','ノバルティー','ノバルティー');
-INSERT INTO "hand_mapping" VALUES ('NOVEMBER','n əʊ v ˈɛ m b ə','no be Nv ba','ノベンバ','ノベンバ');
-INSERT INTO "hand_mapping" VALUES ('NOVICE','n ˈɒ v ɪ s','no bi sv','ノビス','ノビス');
+INSERT INTO "hand_mapping" VALUES ('NOVA','n ˈəʊ v ə','no - Va','ノーバ','ノーバ');
+INSERT INTO "hand_mapping" VALUES ('NOVEL','n ˈɒ v ə l','no Va rv','ノバル','ノバル');
+INSERT INTO "hand_mapping" VALUES ('NOVELS','n ˈɒ v ə l z','no Va rv zv','ノバルズ','ノバルズ');
+INSERT INTO "hand_mapping" VALUES ('NOVELTY','n ˈɒ v ə l t i','no Va rv ti -','ノバルティー','ノバルティー');
+INSERT INTO "hand_mapping" VALUES ('NOVEMBER','n əʊ v ˈɛ m b ə','no Ve Nv ba','ノベンバ','ノベンバ');
+INSERT INTO "hand_mapping" VALUES ('NOVICE','n ˈɒ v ɪ s','no Vi sv','ノビス','ノビス');
 INSERT INTO "hand_mapping" VALUES ('NOW','n ˈaʊ','na u','ナウ','ナウ');
 INSERT INTO "hand_mapping" VALUES ('NOWADAYS','n ˈaʊ ə d ˌeɪ z','na u a de i zv','ナウアデイズ','ナウアデイズ');
 INSERT INTO "hand_mapping" VALUES ('NOWHERE','n ˈəʊ w ˌɛə','no - we a -','ノーウェアー','ノーウェアー');
@@ -10219,8 +10219,8 @@ INSERT INTO "hand_mapping" VALUES ('OBJECT(1)','ə b dʒ ˈɛ k t','a bv jye kv
 INSERT INTO "hand_mapping" VALUES ('OBJECT(2)','ˈɒ b dʒ ɛ k t','o bv jye kv tv','オブジェクト','オブジェクト');
 INSERT INTO "hand_mapping" VALUES ('OBJECTION','ə b dʒ ˈɛ k ʃ ə n','a bv jye kv sya nv','アブジェクシャン','アブジェクション');
 INSERT INTO "hand_mapping" VALUES ('OBJECTIONS','ə b dʒ ˈɛ k ʃ ə n z','a bv jye kv sya nv zv','アブジェクシャンズ','アブジェクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('OBJECTIVE','ə b dʒ ˈɛ k t ɪ v','a bv jye kv ti bv','アブジェクティブ','アブジェクティブ');
-INSERT INTO "hand_mapping" VALUES ('OBJECTIVES','ə b dʒ ˈɛ k t ɪ v z','a bv jye kv ti bv zv','アブジェクティブズ','アブジェクティブズ');
+INSERT INTO "hand_mapping" VALUES ('OBJECTIVE','ə b dʒ ˈɛ k t ɪ v','a bv jye kv ti Vv','アブジェクティブ','アブジェクティブ');
+INSERT INTO "hand_mapping" VALUES ('OBJECTIVES','ə b dʒ ˈɛ k t ɪ v z','a bv jye kv ti Vv zv','アブジェクティブズ','アブジェクティブズ');
 INSERT INTO "hand_mapping" VALUES ('OBJECTS(1)','ə b dʒ ˈɛ k t s','a bv jye kv tsv','アブジェクツ','アブジェクツ');
 INSERT INTO "hand_mapping" VALUES ('OBJECTS(2)','ˈɒ b dʒ ɛ k t s','o bv jye kv tsv','オブジェクツ','オブジェクツ');
 INSERT INTO "hand_mapping" VALUES ('OBLIGATION','ˌɒ b l ɪ g ˈeɪ ʃ ə n','o bv ri ge i sya nv','オブリゲイシャン','オブリゲイション');
@@ -10230,12 +10230,12 @@ INSERT INTO "hand_mapping" VALUES ('OBLIGED','ə b l ˈaɪ dʒ d','a bv ra i jyv
 INSERT INTO "hand_mapping" VALUES ('OBLIQUE','ə b l ˈiː k','a bv ri - kv','アブリーク','アブリーク');
 INSERT INTO "hand_mapping" VALUES ('OBOE','ˈəʊ b əʊ','o - bo','オーボ','オーボ');
 INSERT INTO "hand_mapping" VALUES ('OBSCURE','ə b s k j ˈʊə','a bv sv kyu a','アブスキュア','アブスキュア');
-INSERT INTO "hand_mapping" VALUES ('OBSERVATION','ˌɒ b z ə v ˈeɪ ʃ ə n','o bv za be i sya nv','オブザベイシャン','オブザベイション');
-INSERT INTO "hand_mapping" VALUES ('OBSERVATIONS','ˌɒ b z ə v ˈeɪ ʃ ə n z','o bv za be i sya nv zv','オブザベイシャンズ','オブザベイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('OBSERVE','ə b z ˈɜː v','a bv ze - bv','アブゼーブ','アブゼーブ');
-INSERT INTO "hand_mapping" VALUES ('OBSERVED','ə b z ˈɜː v d','a bv ze - bv dv','アブゼーブド','アブゼーブド');
-INSERT INTO "hand_mapping" VALUES ('OBSERVER','ə b z ˈɜː v ə','a bv ze - ba','アブゼーバ','アブゼーバ');
-INSERT INTO "hand_mapping" VALUES ('OBSERVERS','ə b z ˈɜː v ə z','a bv ze - ba zv','アブゼーバズ','アブゼーバズ');
+INSERT INTO "hand_mapping" VALUES ('OBSERVATION','ˌɒ b z ə v ˈeɪ ʃ ə n','o bv za Ve i sya nv','オブザベイシャン','オブザベイション');
+INSERT INTO "hand_mapping" VALUES ('OBSERVATIONS','ˌɒ b z ə v ˈeɪ ʃ ə n z','o bv za Ve i sya nv zv','オブザベイシャンズ','オブザベイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('OBSERVE','ə b z ˈɜː v','a bv ze - Vv','アブゼーブ','アブゼーブ');
+INSERT INTO "hand_mapping" VALUES ('OBSERVED','ə b z ˈɜː v d','a bv ze - Vv dv','アブゼーブド','アブゼーブド');
+INSERT INTO "hand_mapping" VALUES ('OBSERVER','ə b z ˈɜː v ə','a bv ze - Va','アブゼーバ','アブゼーバ');
+INSERT INTO "hand_mapping" VALUES ('OBSERVERS','ə b z ˈɜː v ə z','a bv ze - Va zv','アブゼーバズ','アブゼーバズ');
 INSERT INTO "hand_mapping" VALUES ('OBSESSED','ə b s ˈɛ s t','a bv se sv tv','アブセスト','アブセスト');
 INSERT INTO "hand_mapping" VALUES ('OBSESSION','ə b s ˈɛ ʃ ə n','a bv se sya nv','アブセシャン','アブセション');
 INSERT INTO "hand_mapping" VALUES ('OBSTACLE','ˈɒ b s t ə k ə l','o bv sv ta ka rv','オブスタカル','オブスタカル');
@@ -10243,8 +10243,8 @@ INSERT INTO "hand_mapping" VALUES ('OBSTACLES','ˈɒ b s t ə k ə l z','o bv sv
 INSERT INTO "hand_mapping" VALUES ('OBTAIN','ə b t ˈeɪ n','a bv te i nv','アブテイン','アブテイン');
 INSERT INTO "hand_mapping" VALUES ('OBTAINED','ə b t ˈeɪ n d','a bv te i nv dv','アブテインド','アブテインド');
 INSERT INTO "hand_mapping" VALUES ('OBTAINING','ə b t ˈeɪ n ɪ ŋ','a bv te i ni Nv','アブテイニン','アブテイニング');
-INSERT INTO "hand_mapping" VALUES ('OBVIOUS','ˈɒ b v ɪə s','o bv bi a sv','オブビアス','オブビアス');
-INSERT INTO "hand_mapping" VALUES ('OBVIOUSLY','ˈɒ b v ɪə s l i','o bv bi a sv ri -','オブビアスリー','オブビアスリー');
+INSERT INTO "hand_mapping" VALUES ('OBVIOUS','ˈɒ b v ɪə s','o bv Vi a sv','オブビアス','オブビアス');
+INSERT INTO "hand_mapping" VALUES ('OBVIOUSLY','ˈɒ b v ɪə s l i','o bv Vi a sv ri -','オブビアスリー','オブビアスリー');
 INSERT INTO "hand_mapping" VALUES ('OCCASION','ə k ˈeɪ ʒ ə n','a ke i jya nv','アケイジャン','アケイジョン');
 INSERT INTO "hand_mapping" VALUES ('OCCASIONAL','ə k ˈeɪ ʒ ə n ə l','a ke i jya na rv','アケイジャナル','アケイジャナル');
 INSERT INTO "hand_mapping" VALUES ('OCCASIONALLY(1)','ə k ˈeɪ ʒ n ə l i','a ke i jyv na ri -','アケイジュナリー','アケイジュナリー');
@@ -10263,7 +10263,7 @@ INSERT INTO "hand_mapping" VALUES ('OCCURRING','ə k ˈɐ ɹ ɪ ŋ','a ka ri Nv'
 INSERT INTO "hand_mapping" VALUES ('OCCURS','ə k ˈɜː z','a ke - zv','アケーズ','アケーズ');
 INSERT INTO "hand_mapping" VALUES ('OCEAN','ˈəʊ ʃ ə n','o - sya nv','オーシャン','オーシャン');
 INSERT INTO "hand_mapping" VALUES ('OCEANIA','ˌəʊ ʃ ɪ ˈɑː n ɪə','o syi a - ni a','オシアーニア','オシアーニア');
-INSERT INTO "hand_mapping" VALUES ('OCTAVE','ˈɒ k t ɪ v','o x kv ti bv','オックティブ','オックティブ');
+INSERT INTO "hand_mapping" VALUES ('OCTAVE','ˈɒ k t ɪ v','o x kv ti Vv','オックティブ','オックティブ');
 INSERT INTO "hand_mapping" VALUES ('OCTOBER','ɒ k t ˈəʊ b ə','o kv to - ba','オクトーバ','オクトーバ');
 INSERT INTO "hand_mapping" VALUES ('OCTOPUS','ˈɒ k t ə p ə s','o x kv ta pa sv','オックタパス','オックタパス');
 INSERT INTO "hand_mapping" VALUES ('ODD','ˈɒ d','o dv','オド','オド');
@@ -10273,8 +10273,8 @@ INSERT INTO "hand_mapping" VALUES ('ODE','ˈəʊ d','o - dv','オード','オー
 INSERT INTO "hand_mapping" VALUES ('ODOR','ˈəʊ d ə','o - da','オーダ','オーダ');
 INSERT INTO "hand_mapping" VALUES ('ODOUR','ˈəʊ d ə','o - da','オーダ','オーダ');
 INSERT INTO "hand_mapping" VALUES ('ODYSSEY','ˈɒ d ɪ s i','o di si -','オディシー','オディシー');
-INSERT INTO "hand_mapping" VALUES ('OF(1)','ə v','a bv','アブ','アブ');
-INSERT INTO "hand_mapping" VALUES ('OF(2)','ˈɒ v','o bv','オブ','オブ');
+INSERT INTO "hand_mapping" VALUES ('OF(1)','ə v','a Vv','アブ','アブ');
+INSERT INTO "hand_mapping" VALUES ('OF(2)','ˈɒ v','o Vv','オブ','オブ');
 INSERT INTO "hand_mapping" VALUES ('OFF','ˈɒ f','o fv','オフ','オフ');
 INSERT INTO "hand_mapping" VALUES ('OFFENCE','ə f ˈɛ n s','a fe nv sv','アフェンス','アフェンス');
 INSERT INTO "hand_mapping" VALUES ('OFFENCES','ə f ˈɛ n s ɪ z','a fe nv si zv','アフェンシズ','アフェンシズ');
@@ -10284,7 +10284,7 @@ INSERT INTO "hand_mapping" VALUES ('OFFENDER','ə f ˈɛ n d ə','a fe nv da','
 INSERT INTO "hand_mapping" VALUES ('OFFENDERS','ə f ˈɛ n d ə z','a fe nv da zv','アフェンダズ','アフェンダズ');
 INSERT INTO "hand_mapping" VALUES ('OFFENSE','ə f ˈɛ n s','a fe nv sv','アフェンス','アフェンス');
 INSERT INTO "hand_mapping" VALUES ('OFFENSES','ə f ˈɛ n s ɪ z','a fe nv si zv','アフェンシズ','アフェンシズ');
-INSERT INTO "hand_mapping" VALUES ('OFFENSIVE','ə f ˈɛ n s ɪ v','a fe nv si bv','アフェンシブ','アフェンシブ');
+INSERT INTO "hand_mapping" VALUES ('OFFENSIVE','ə f ˈɛ n s ɪ v','a fe nv si Vv','アフェンシブ','アフェンシブ');
 INSERT INTO "hand_mapping" VALUES ('OFFER','ˈɒ f ə','o fa','オファ','オファ');
 INSERT INTO "hand_mapping" VALUES ('OFFERED','ˈɒ f ə d','o fa dv','オファド','オファド');
 INSERT INTO "hand_mapping" VALUES ('OFFERING(1)','ˈɒ f ɹ ɪ ŋ','o fv ri Nv','オフリン','オフリング');
@@ -10321,8 +10321,8 @@ INSERT INTO "hand_mapping" VALUES ('OLDER','ˈəʊ l d ə','o - rv da','オー
 INSERT INTO "hand_mapping" VALUES ('OLDEST','ˈəʊ l d ɪ s t','o - rv di sv tv','オールディスト','オールディスト');
 INSERT INTO "hand_mapping" VALUES ('OLDHAM','ˈəʊ l d ə m','o - rv da mv','オールダム','オールダム');
 INSERT INTO "hand_mapping" VALUES ('OLDY','ˈəʊ l d i','o - rv di -','オールディー','オールディー');
-INSERT INTO "hand_mapping" VALUES ('OLIVE','ˈɒ l ɪ v','o ri bv','オリブ','オリブ');
-INSERT INTO "hand_mapping" VALUES ('OLIVER','ˈɒ l ɪ v ə','o ri ba','オリバ','オリバ');
+INSERT INTO "hand_mapping" VALUES ('OLIVE','ˈɒ l ɪ v','o ri Vv','オリブ','オリブ');
+INSERT INTO "hand_mapping" VALUES ('OLIVER','ˈɒ l ɪ v ə','o ri Va','オリバ','オリバ');
 INSERT INTO "hand_mapping" VALUES ('OLLIE','ˈɒ l i','o ri -','オリー','オリー');
 INSERT INTO "hand_mapping" VALUES ('OLYMPIC','ə l ˈɪ m p ɪ k','a ri Nv pi kv','アリンピク','アリンピク');
 INSERT INTO "hand_mapping" VALUES ('OLYMPICS','ə l ˈɪ m p ɪ k s','a ri Nv pi kv sv','アリンピクス','アリンピクス');
@@ -10484,7 +10484,7 @@ INSERT INTO "hand_mapping" VALUES ('OUNCE','ˈaʊ n s','a u nv sv','アウンス
 INSERT INTO "hand_mapping" VALUES ('OUNCES','ˈaʊ n s ɪ z','a u nv si zv','アウンシズ','アウンシズ');
 INSERT INTO "hand_mapping" VALUES ('OUR','ˈaʊ ə','a u a','アウア','アウア');
 INSERT INTO "hand_mapping" VALUES ('OURS','ˈaʊ ə z','a u a zv','アウアズ','アウアズ');
-INSERT INTO "hand_mapping" VALUES ('OURSELVES','ˌaʊ ə s ˈɛ l v z','a u a se rv bv zv','アウアセルブズ','アウアセルブズ');
+INSERT INTO "hand_mapping" VALUES ('OURSELVES','ˌaʊ ə s ˈɛ l v z','a u a se rv Vv zv','アウアセルブズ','アウアセルブズ');
 INSERT INTO "hand_mapping" VALUES ('OUST','ˈaʊ s t','a u sv tv','アウスト','アウスト');
 INSERT INTO "hand_mapping" VALUES ('OUT','ˈaʊ t','a u tv','アウト','アウト');
 INSERT INTO "hand_mapping" VALUES ('OUTBREAK','ˈaʊ t b ɹ ˌeɪ k','a u tv bv re i kv','アウトブレイク','アウトブレイク');
@@ -10512,28 +10512,28 @@ INSERT INTO "hand_mapping" VALUES ('OUTSIDER','ˈaʊ t s aɪ d ə','a u tsa i da
 INSERT INTO "hand_mapping" VALUES ('OUTSIDERS','ˈaʊ t s aɪ d ə z','a u tsa i da zv','アウツァイダズ','アウツァイダズ');
 INSERT INTO "hand_mapping" VALUES ('OUTSOURCING','ˌaʊ t s ˈɔː s ɪ ŋ','a u tso - si Nv','アウツォーシン','アウツォーシング');
 INSERT INTO "hand_mapping" VALUES ('OUTSTANDING','ˌaʊ t s t ˈæ n d ɪ ŋ','a u tsv ta nv di Nv','アウツタンディン','アウツタンディング');
-INSERT INTO "hand_mapping" VALUES ('OVAL','ˈəʊ v ə l','o - ba rv','オーバル','オーバル');
-INSERT INTO "hand_mapping" VALUES ('OVEN','ˈɐ v ə n','a ba nv','アバン','アバン');
-INSERT INTO "hand_mapping" VALUES ('OVER','ˈəʊ v ə','o - ba','オーバ','オーバ');
-INSERT INTO "hand_mapping" VALUES ('OVERALL','ˈəʊ v ə ɹ ɔː l','o - ba ro - rv','オーバロール','オーバロール');
-INSERT INTO "hand_mapping" VALUES ('OVERCAME','ˈəʊ v ə k ˌeɪ m','o - ba ke i mv','オーバケイム','オーバケイム');
-INSERT INTO "hand_mapping" VALUES ('OVERCOME','ˈəʊ v ə k ˌɐ m','o - ba ka mv','オーバカム','オーバカム');
-INSERT INTO "hand_mapping" VALUES ('OVERHEAD(1)','ˈəʊ v ə h ˌɛ d','o - ba he - dv','オーバヘード','オーバヘード');
-INSERT INTO "hand_mapping" VALUES ('OVERHEAD(2)','ˌəʊ v ə h ˈɛ d','o ba he dv','オバヘド','オバヘド');
-INSERT INTO "hand_mapping" VALUES ('OVERLAP(1)','ˈəʊ v ə l ˌæ p','o - ba ra x pv','オーバラップ','オーバラップ');
-INSERT INTO "hand_mapping" VALUES ('OVERLAP(2)','ˌəʊ v ə l ˈæ p','o ba ra x pv','オバラップ','オバラップ');
-INSERT INTO "hand_mapping" VALUES ('OVERLOOK','əʊ v ə l ˈʊ k','o ba ru kv','オバルク','オバルク');
-INSERT INTO "hand_mapping" VALUES ('OVERNIGHT(1)','ˈəʊ v ə n aɪ t','o - ba na i tv','オーバナイト','オーバナイト');
-INSERT INTO "hand_mapping" VALUES ('OVERNIGHT(2)','əʊ v ə n ˈaɪ t','o ba na i tv','オバナイト','オバナイト');
-INSERT INTO "hand_mapping" VALUES ('OVERSEAS(1)','əʊ v ə s ˈiː z','o ba si - zv','オバシーズ','オバシーズ');
-INSERT INTO "hand_mapping" VALUES ('OVERSEAS(2)','ˈəʊ v ə s iː z','o - ba si - zv','オーバシーズ','オーバシーズ');
-INSERT INTO "hand_mapping" VALUES ('OVERT(1)','əʊ v ˈɜː t','o be - tv','オベート','オベート');
-INSERT INTO "hand_mapping" VALUES ('OVERT(2)','ˈəʊ v ɜː t','o - be - tv','オーベート','オーベート');
-INSERT INTO "hand_mapping" VALUES ('OVERTAKE','ˈəʊ v ə t ˌeɪ k','o - ba te i kv','オーバテイク','オーバテイク');
-INSERT INTO "hand_mapping" VALUES ('OVERTIME','ˈəʊ v ə t ˌaɪ m','o - ba ta i mv','オーバタイム','オーバタイム');
-INSERT INTO "hand_mapping" VALUES ('OVERVIEW','ˈəʊ v ə v j ˌuː','o - ba byu -','オーバビュー','オーバビュー');
-INSERT INTO "hand_mapping" VALUES ('OVERWHELM','ˌəʊ v ə w ˈɛ l m','o ba we rv mv','オバウェルム','オバウェルム');
-INSERT INTO "hand_mapping" VALUES ('OVERWHELMING','ˌəʊ v ə w ˈɛ l m ɪ ŋ','o ba we rv mi Nv','オバウェルミン','オバウェルミング');
+INSERT INTO "hand_mapping" VALUES ('OVAL','ˈəʊ v ə l','o - Va rv','オーバル','オーバル');
+INSERT INTO "hand_mapping" VALUES ('OVEN','ˈɐ v ə n','a Va nv','アバン','アバン');
+INSERT INTO "hand_mapping" VALUES ('OVER','ˈəʊ v ə','o - Va','オーバ','オーバ');
+INSERT INTO "hand_mapping" VALUES ('OVERALL','ˈəʊ v ə ɹ ɔː l','o - Va ro - rv','オーバロール','オーバロール');
+INSERT INTO "hand_mapping" VALUES ('OVERCAME','ˈəʊ v ə k ˌeɪ m','o - Va ke i mv','オーバケイム','オーバケイム');
+INSERT INTO "hand_mapping" VALUES ('OVERCOME','ˈəʊ v ə k ˌɐ m','o - Va ka mv','オーバカム','オーバカム');
+INSERT INTO "hand_mapping" VALUES ('OVERHEAD(1)','ˈəʊ v ə h ˌɛ d','o - Va he - dv','オーバヘード','オーバヘード');
+INSERT INTO "hand_mapping" VALUES ('OVERHEAD(2)','ˌəʊ v ə h ˈɛ d','o Va he dv','オバヘド','オバヘド');
+INSERT INTO "hand_mapping" VALUES ('OVERLAP(1)','ˈəʊ v ə l ˌæ p','o - Va ra x pv','オーバラップ','オーバラップ');
+INSERT INTO "hand_mapping" VALUES ('OVERLAP(2)','ˌəʊ v ə l ˈæ p','o Va ra x pv','オバラップ','オバラップ');
+INSERT INTO "hand_mapping" VALUES ('OVERLOOK','əʊ v ə l ˈʊ k','o Va ru kv','オバルク','オバルク');
+INSERT INTO "hand_mapping" VALUES ('OVERNIGHT(1)','ˈəʊ v ə n aɪ t','o - Va na i tv','オーバナイト','オーバナイト');
+INSERT INTO "hand_mapping" VALUES ('OVERNIGHT(2)','əʊ v ə n ˈaɪ t','o Va na i tv','オバナイト','オバナイト');
+INSERT INTO "hand_mapping" VALUES ('OVERSEAS(1)','əʊ v ə s ˈiː z','o Va si - zv','オバシーズ','オバシーズ');
+INSERT INTO "hand_mapping" VALUES ('OVERSEAS(2)','ˈəʊ v ə s iː z','o - Va si - zv','オーバシーズ','オーバシーズ');
+INSERT INTO "hand_mapping" VALUES ('OVERT(1)','əʊ v ˈɜː t','o Ve - tv','オベート','オベート');
+INSERT INTO "hand_mapping" VALUES ('OVERT(2)','ˈəʊ v ɜː t','o - Ve - tv','オーベート','オーベート');
+INSERT INTO "hand_mapping" VALUES ('OVERTAKE','ˈəʊ v ə t ˌeɪ k','o - Va te i kv','オーバテイク','オーバテイク');
+INSERT INTO "hand_mapping" VALUES ('OVERTIME','ˈəʊ v ə t ˌaɪ m','o - Va ta i mv','オーバタイム','オーバタイム');
+INSERT INTO "hand_mapping" VALUES ('OVERVIEW','ˈəʊ v ə v j ˌuː','o - Va Vyu -','オーバビュー','オーバビュー');
+INSERT INTO "hand_mapping" VALUES ('OVERWHELM','ˌəʊ v ə w ˈɛ l m','o Va we rv mv','オバウェルム','オバウェルム');
+INSERT INTO "hand_mapping" VALUES ('OVERWHELMING','ˌəʊ v ə w ˈɛ l m ɪ ŋ','o Va we rv mi Nv','オバウェルミン','オバウェルミング');
 INSERT INTO "hand_mapping" VALUES ('OW','ˈaʊ','a u','アウ','アウ');
 INSERT INTO "hand_mapping" VALUES ('OWE','ˈəʊ','o -','オー','オー');
 INSERT INTO "hand_mapping" VALUES ('OWED','ˈəʊ d','o - dv','オード','オード');
@@ -10721,7 +10721,7 @@ INSERT INTO "hand_mapping" VALUES ('PASSES','p ˈɑː s ɪ z','pa - si zv','パ
 INSERT INTO "hand_mapping" VALUES ('PASSING','p ˈɑː s ɪ ŋ','pa - si Nv','パーシン','パーシング');
 INSERT INTO "hand_mapping" VALUES ('PASSION','p ˈæ ʃ ə n','pa x sya nv','パッシャン','パッション');
 INSERT INTO "hand_mapping" VALUES ('PASSIONATE','p ˈæ ʃ ə n ɪ t','pa x sya ni tv','パッシャニト','パッシャニト');
-INSERT INTO "hand_mapping" VALUES ('PASSIVE','p ˈæ s ɪ v','pa x si bv','パッシブ','パッシブ');
+INSERT INTO "hand_mapping" VALUES ('PASSIVE','p ˈæ s ɪ v','pa x si Vv','パッシブ','パッシブ');
 INSERT INTO "hand_mapping" VALUES ('PASSPORT','p ˈɑː s p ˌɔː t','pa - sv po - tv','パースポート','パースポート');
 INSERT INTO "hand_mapping" VALUES ('PASSWORD','p ˈɑː s w ˌɜː d','pa - swe - dv','パースェード','パースェード');
 INSERT INTO "hand_mapping" VALUES ('PASSWORDS','p ˈɑː s w ˌɜː d z','pa - swe - zv','パースェーズ','パースェーズ');
@@ -10765,9 +10765,9 @@ INSERT INTO "hand_mapping" VALUES ('PAULA','p ˈɔː l ə','po - ra','ポーラ'
 INSERT INTO "hand_mapping" VALUES ('PAULINE','p ˈɔː l iː n','po - ri - nv','ポーリーン','ポーリーン');
 INSERT INTO "hand_mapping" VALUES ('PAUSE','p ˈɔː z','po - zv','ポーズ','ポーズ');
 INSERT INTO "hand_mapping" VALUES ('PAUSED','p ˈɔː z d','po - zv dv','ポーズド','ポーズド');
-INSERT INTO "hand_mapping" VALUES ('PAVE','p ˈeɪ v','pe i bv','ペイブ','ペイブ');
-INSERT INTO "hand_mapping" VALUES ('PAVEMENT','p ˈeɪ v m ə n t','pe i bv ma nv tv','ペイブマント','ペイブメント');
-INSERT INTO "hand_mapping" VALUES ('PAVILION','p ə v ˈɪ l j ə n','pa bi rya nv','パビリャン','パビリャン');
+INSERT INTO "hand_mapping" VALUES ('PAVE','p ˈeɪ v','pe i Vv','ペイブ','ペイブ');
+INSERT INTO "hand_mapping" VALUES ('PAVEMENT','p ˈeɪ v m ə n t','pe i Vv ma nv tv','ペイブマント','ペイブメント');
+INSERT INTO "hand_mapping" VALUES ('PAVILION','p ə v ˈɪ l j ə n','pa Vi rya nv','パビリャン','パビリャン');
 INSERT INTO "hand_mapping" VALUES ('PAW','p ˈɔː','po -','ポー','ポー');
 INSERT INTO "hand_mapping" VALUES ('PAWN','p ˈɔː n','po - nv','ポーン','ポーン');
 INSERT INTO "hand_mapping" VALUES ('PAY','p ˈeɪ','pe i','ペイ','ペイ');
@@ -10814,7 +10814,7 @@ INSERT INTO "hand_mapping" VALUES ('PEEP','p ˈiː p','pi - pv','ピープ','ピ
 INSERT INTO "hand_mapping" VALUES ('PEER','p ˈɪə','pi a','ピア','ピア');
 INSERT INTO "hand_mapping" VALUES ('PEERS','p ˈɪə z','pi a zv','ピアズ','ピアズ');
 INSERT INTO "hand_mapping" VALUES ('PEES','p ˈiː z','pi - zv','ピーズ','ピーズ');
-INSERT INTO "hand_mapping" VALUES ('PEEVE','p ˈiː v','pi - bv','ピーブ','ピーブ');
+INSERT INTO "hand_mapping" VALUES ('PEEVE','p ˈiː v','pi - Vv','ピーブ','ピーブ');
 INSERT INTO "hand_mapping" VALUES ('PEG','p ˈɛ g','pe gv','ペグ','ペグ');
 INSERT INTO "hand_mapping" VALUES ('PEGGY','p ˈɛ g i','pe gi -','ペギー','ペギー');
 INSERT INTO "hand_mapping" VALUES ('PEGS','p ˈɛ g z','pe gv zv','ペグズ','ペグズ');
@@ -10838,7 +10838,7 @@ INSERT INTO "hand_mapping" VALUES ('PENICUIK','p ˈɛ n ɪ k ʊ k','pe ni ku kv'
 INSERT INTO "hand_mapping" VALUES ('PENINSULA','p ɪ n ˈɪ n s j ʊ l ə','pi ni nv syu ra','ピニンシュラ','ピニンシュラ');
 INSERT INTO "hand_mapping" VALUES ('PENIS','p ˈiː n ɪ s','pi - ni sv','ピーニス','ピーニス');
 INSERT INTO "hand_mapping" VALUES ('PENNIES','p ˈɛ n i z','pe ni - zv','ペニーズ','ペニーズ');
-INSERT INTO "hand_mapping" VALUES ('PENNSYLVANIA','p ˌɛ n s ɪ l v ˈeɪ n j ə','pe - nv si rv be i nya','ペーンシルベイニャ','ペーンシルベイニャ');
+INSERT INTO "hand_mapping" VALUES ('PENNSYLVANIA','p ˌɛ n s ɪ l v ˈeɪ n j ə','pe - nv si rv Ve i nya','ペーンシルベイニャ','ペーンシルベイニャ');
 INSERT INTO "hand_mapping" VALUES ('PENNY','p ˈɛ n i','pe ni -','ペニー','ペニー');
 INSERT INTO "hand_mapping" VALUES ('PENS','p ˈɛ n z','pe nv zv','ペンズ','ペンズ');
 INSERT INTO "hand_mapping" VALUES ('PENSION','p ˈɛ n ʃ ə n','pe nv sya nv','ペンシャン','ペンション');
@@ -10851,8 +10851,8 @@ INSERT INTO "hand_mapping" VALUES ('PEOPLES','p ˈiː p ə l z','pi - pa rv zv',
 INSERT INTO "hand_mapping" VALUES ('PEPPER','p ˈɛ p ə','pe pa','ペパ','ペパ');
 INSERT INTO "hand_mapping" VALUES ('PER(1)','p ə','pa','パ','パ');
 INSERT INTO "hand_mapping" VALUES ('PER(2)','p ˈɜː','pe -','ペー','ペー');
-INSERT INTO "hand_mapping" VALUES ('PERCEIVE','p ə s ˈiː v','pa si - bv','パシーブ','パシーブ');
-INSERT INTO "hand_mapping" VALUES ('PERCEIVED','p ə s ˈiː v d','pa si - bv dv','パシーブド','パシーブド');
+INSERT INTO "hand_mapping" VALUES ('PERCEIVE','p ə s ˈiː v','pa si - Vv','パシーブ','パシーブ');
+INSERT INTO "hand_mapping" VALUES ('PERCEIVED','p ə s ˈiː v d','pa si - Vv dv','パシーブド','パシーブド');
 INSERT INTO "hand_mapping" VALUES ('PERCENT','p ə s ˈɛ n t','pa se nv tv','パセント','パセント');
 INSERT INTO "hand_mapping" VALUES ('PERCENTAGE','p ə s ˈɛ n t ɪ dʒ','pa se nv ti jyv','パセンティジュ','パセンティジュ');
 INSERT INTO "hand_mapping" VALUES ('PERCEPTION','p ə s ˈɛ p ʃ ə n','pa se pv sya nv','パセプシャン','パセプション');
@@ -10912,8 +10912,8 @@ INSERT INTO "hand_mapping" VALUES ('PERSONALLY(3)','p ˈɜː s ə n ə l i','pe
 INSERT INTO "hand_mapping" VALUES ('PERSONALS','p ˈɜː s ə n ə l z','pe - sa na rv zv','ペーサナルズ','ペーサナルズ');
 INSERT INTO "hand_mapping" VALUES ('PERSONNEL','p ˌɜː s ə n ˈɛ l','pe - sa ne rv','ペーサネル','ペーサネル');
 INSERT INTO "hand_mapping" VALUES ('PERSONS','p ˈɜː s ə n z','pe - sa nv zv','ペーサンズ','ペーサンズ');
-INSERT INTO "hand_mapping" VALUES ('PERSPECTIVE','p ə s p ˈɛ k t ɪ v','pa sv pe kv ti bv','パスペクティブ','パスペクティブ');
-INSERT INTO "hand_mapping" VALUES ('PERSPECTIVES','p ə s p ˈɛ k t ɪ v z','pa sv pe kv ti bv zv','パスペクティブズ','パスペクティブズ');
+INSERT INTO "hand_mapping" VALUES ('PERSPECTIVE','p ə s p ˈɛ k t ɪ v','pa sv pe kv ti Vv','パスペクティブ','パスペクティブ');
+INSERT INTO "hand_mapping" VALUES ('PERSPECTIVES','p ə s p ˈɛ k t ɪ v z','pa sv pe kv ti Vv zv','パスペクティブズ','パスペクティブズ');
 INSERT INTO "hand_mapping" VALUES ('PERSPIRATION','p ˌɜː s p ɪ ɹ ˈeɪ ʃ ə n','pe - sv pi re i sya nv','ペースピレイシャン','ペースピレイション');
 INSERT INTO "hand_mapping" VALUES ('PERSPIRE','p ə s p ˈaɪ ə','pa sv pa i a','パスパイア','パスパイア');
 INSERT INTO "hand_mapping" VALUES ('PERSUADE','p ə s w ˈeɪ d','pa swe i dv','パスェイド','パスェイド');
@@ -10921,8 +10921,8 @@ INSERT INTO "hand_mapping" VALUES ('PERSUADED','p ə s w ˈeɪ d ɪ d','pa swe i
 INSERT INTO "hand_mapping" VALUES ('PERT','p ˈɜː t','pe - tv','ペート','ペート');
 INSERT INTO "hand_mapping" VALUES ('PERTH','p ˈɜː θ','pe - sv','ペース','ペース');
 INSERT INTO "hand_mapping" VALUES ('PERU','p ə ɹ ˈuː','pa ru -','パルー','パルー');
-INSERT INTO "hand_mapping" VALUES ('PERVERT(1)','p ˈɜː v ɜː t','pe - be - tv','ペーベート','ペーベート');
-INSERT INTO "hand_mapping" VALUES ('PERVERT(2)','p ə v ˈɜː t','pa be - tv','パベート','パベート');
+INSERT INTO "hand_mapping" VALUES ('PERVERT(1)','p ˈɜː v ɜː t','pe - Ve - tv','ペーベート','ペーベート');
+INSERT INTO "hand_mapping" VALUES ('PERVERT(2)','p ə v ˈɜː t','pa Ve - tv','パベート','パベート');
 INSERT INTO "hand_mapping" VALUES ('PESKY','p ˈɛ s k i','pe sv ki -','ペスキー','ペスキー');
 INSERT INTO "hand_mapping" VALUES ('PEST','p ˈɛ s t','pe sv tv','ペスト','ペスト');
 INSERT INTO "hand_mapping" VALUES ('PESTICIDE','p ˈɛ s t ɪ s ˌaɪ d','pe sv ti sa i dv','ペスティサイド','ペスティサイド');
@@ -11079,7 +11079,7 @@ INSERT INTO "hand_mapping" VALUES ('PITS','p ˈɪ t s','pi tsv','ピツ','ピツ
 INSERT INTO "hand_mapping" VALUES ('PITTA','p ˈɪ t ə','pi ta','ピタ','ピタ');
 INSERT INTO "hand_mapping" VALUES ('PITTSBURGH','p ˈɪ t s b ɜː g','pi tsv be - gv','ピツベーグ','ピツベーグ');
 INSERT INTO "hand_mapping" VALUES ('PITY','p ˈɪ t i','pi ti -','ピティー','ピティー');
-INSERT INTO "hand_mapping" VALUES ('PIVOT','p ˈɪ v ə t','pi ba tv','ピバト','ピバト');
+INSERT INTO "hand_mapping" VALUES ('PIVOT','p ˈɪ v ə t','pi Va tv','ピバト','ピバト');
 INSERT INTO "hand_mapping" VALUES ('PIXEL','p ˈɪ k s ə l','pi kv sa rv','ピクサル','ピクサル');
 INSERT INTO "hand_mapping" VALUES ('PIXELS','p ˈɪ k s ə l z','pi kv sa rv zv','ピクサルズ','ピクサルズ');
 INSERT INTO "hand_mapping" VALUES ('PIXIE','p ˈɪ k s i','pi kv si -','ピクシー','ピクシー');
@@ -11308,8 +11308,8 @@ INSERT INTO "hand_mapping" VALUES ('POSIT','p ˈɒ z ɪ t','po zi tv','ポジト
 INSERT INTO "hand_mapping" VALUES ('POSITION','p ə z ˈɪ ʃ ə n','pa zi sya nv','パジシャン','ポジション');
 INSERT INTO "hand_mapping" VALUES ('POSITIONING','p ə z ˈɪ ʃ ə n ɪ ŋ','pa zi sya ni Nv','パジシャニン','ポジシャニング');
 INSERT INTO "hand_mapping" VALUES ('POSITIONS','p ə z ˈɪ ʃ ə n z','pa zi sya nv zv','パジシャンズ','ポジシャンズ');
-INSERT INTO "hand_mapping" VALUES ('POSITIVE','p ˈɒ z ɪ t ɪ v','po zi ti bv','ポジティブ','ポジティブ');
-INSERT INTO "hand_mapping" VALUES ('POSITIVELY','p ˈɒ z ɪ t ɪ v l i','po zi ti bv ri -','ポジティブリー','ポジティブリー');
+INSERT INTO "hand_mapping" VALUES ('POSITIVE','p ˈɒ z ɪ t ɪ v','po zi ti Vv','ポジティブ','ポジティブ');
+INSERT INTO "hand_mapping" VALUES ('POSITIVELY','p ˈɒ z ɪ t ɪ v l i','po zi ti Vv ri -','ポジティブリー','ポジティブリー');
 INSERT INTO "hand_mapping" VALUES ('POSSE','p ˈɒ s i','po x si -','ポッシー','ポッシー');
 INSERT INTO "hand_mapping" VALUES ('POSSESS','p ə z ˈɛ s','pa ze sv','パゼス','ポゼス');
 INSERT INTO "hand_mapping" VALUES ('POSSESSED','p ə z ˈɛ s t','pa ze sv tv','パゼスト','ポゼスト');
@@ -11357,7 +11357,7 @@ INSERT INTO "hand_mapping" VALUES ('POUR','p ˈɔː','po -','ポー','ポー');
 INSERT INTO "hand_mapping" VALUES ('POURED','p ˈɔː d','po - dv','ポード','ポード');
 INSERT INTO "hand_mapping" VALUES ('POURING','p ˈɔː ɹ ɪ ŋ','po - ri Nv','ポーリン','ポーリング');
 INSERT INTO "hand_mapping" VALUES ('POUT','p ˈaʊ t','pa u tv','パウト','パウト');
-INSERT INTO "hand_mapping" VALUES ('POVERTY','p ˈɒ v ə t i','po ba ti -','ポバティー','ポバティー');
+INSERT INTO "hand_mapping" VALUES ('POVERTY','p ˈɒ v ə t i','po Va ti -','ポバティー','ポバティー');
 INSERT INTO "hand_mapping" VALUES ('POW','p ˈaʊ','pa u','パウ','パウ');
 INSERT INTO "hand_mapping" VALUES ('POWDER','p ˈaʊ d ə','pa u da','パウダ','パウダ');
 INSERT INTO "hand_mapping" VALUES ('POWELL','p ˈaʊ ə l','pa u a rv','パウアル','パウアル');
@@ -11446,7 +11446,7 @@ INSERT INTO "hand_mapping" VALUES ('PREPARED','p ɹ ɪ p ˈɛə d','pv ri pe a d
 INSERT INTO "hand_mapping" VALUES ('PREPARING','p ɹ ɪ p ˈɛə ɹ ɪ ŋ','pv ri pe a ri Nv','プリペアリン','プリペアリング');
 INSERT INTO "hand_mapping" VALUES ('PREPAY','p ɹ iː p ˈeɪ','pv ri - pe i','プリーペイ','プリーペイ');
 INSERT INTO "hand_mapping" VALUES ('PREREQUISITE','p ɹ iː ɹ ˈɛ k w ɪ z ɪ t','pv ri - re kwi zi tv','プリーレクィジト','プリーレクィジト');
-INSERT INTO "hand_mapping" VALUES ('PREROGATIVE','p ɹ ɪ ɹ ˈɒ g ə t ɪ v','pv ri ro ga ti bv','プリロガティブ','プリロガティブ');
+INSERT INTO "hand_mapping" VALUES ('PREROGATIVE','p ɹ ɪ ɹ ˈɒ g ə t ɪ v','pv ri ro ga ti Vv','プリロガティブ','プリロガティブ');
 INSERT INTO "hand_mapping" VALUES ('PRESCRIBE','p ɹ ɪ s k ɹ ˈaɪ b','pv ri sv kv ra i bv','プリスクライブ','プリスクライブ');
 INSERT INTO "hand_mapping" VALUES ('PRESCRIBED','p ɹ ɪ s k ɹ ˈaɪ b d','pv ri sv kv ra i bv dv','プリスクライブド','プリスクライブド');
 INSERT INTO "hand_mapping" VALUES ('PRESCRIPTION','p ɹ ɪ s k ɹ ˈɪ p ʃ ə n','pv ri sv kv ri pv sya nv','プリスクリプシャン','プリスクリプション');
@@ -11460,9 +11460,9 @@ INSERT INTO "hand_mapping" VALUES ('PRESENTING','p ɹ ɪ z ˈɛ n t ɪ ŋ','pv r
 INSERT INTO "hand_mapping" VALUES ('PRESENTLY','p ɹ ˈɛ z ə n t l i','pv re za nv tv ri -','プレザントリー','プレザントリー');
 INSERT INTO "hand_mapping" VALUES ('PRESENTS(1)','p ɹ ɪ z ˈɛ n t s','pv ri ze nv tsv','プリゼンツ','プリゼンツ');
 INSERT INTO "hand_mapping" VALUES ('PRESENTS(2)','p ɹ ˈɛ z ə n t s','pv re za nv tsv','プレザンツ','プレザンツ');
-INSERT INTO "hand_mapping" VALUES ('PRESERVATION','p ɹ ˌɛ z ə v ˈeɪ ʃ ə n','pv re - za be i sya nv','プレーザベイシャン','プレーザベイション');
-INSERT INTO "hand_mapping" VALUES ('PRESERVE','p ɹ ɪ z ˈɜː v','pv ri ze - bv','プリゼーブ','プリゼーブ');
-INSERT INTO "hand_mapping" VALUES ('PRESERVED','p ɹ ɪ z ˈɜː v d','pv ri ze - bv dv','プリゼーブド','プリゼーブド');
+INSERT INTO "hand_mapping" VALUES ('PRESERVATION','p ɹ ˌɛ z ə v ˈeɪ ʃ ə n','pv re - za Ve i sya nv','プレーザベイシャン','プレーザベイション');
+INSERT INTO "hand_mapping" VALUES ('PRESERVE','p ɹ ɪ z ˈɜː v','pv ri ze - Vv','プリゼーブ','プリゼーブ');
+INSERT INTO "hand_mapping" VALUES ('PRESERVED','p ɹ ɪ z ˈɜː v d','pv ri ze - Vv dv','プリゼーブド','プリゼーブド');
 INSERT INTO "hand_mapping" VALUES ('PRESET(1)','p ɹ ˈiː s ɛ t','pv ri - se tv','プリーセト','プリーセト');
 INSERT INTO "hand_mapping" VALUES ('PRESET(2)','p ɹ ɪ s ˈɛ t','pv ri se tv','プリセト','プリセト');
 INSERT INTO "hand_mapping" VALUES ('PRESIDENCY','p ɹ ˈɛ z ɪ d ə n s i','pv re zi da nv si -','プレジダンシー','プレジダンシー');
@@ -11483,17 +11483,17 @@ INSERT INTO "hand_mapping" VALUES ('PRETEND','p ɹ ɪ t ˈɛ n d','pv ri te nv d
 INSERT INTO "hand_mapping" VALUES ('PRETENDING','p ɹ ɪ t ˈɛ n d ɪ ŋ','pv ri te nv di Nv','プリテンディン','プリテンディング');
 INSERT INTO "hand_mapping" VALUES ('PRETENSE','p ɹ ɪ t ˈɛ n s','pv ri te nv sv','プリテンス','プリテンス');
 INSERT INTO "hand_mapping" VALUES ('PRETTY','p ɹ ˈɪ t i','pv ri ti -','プリティー','プリティー');
-INSERT INTO "hand_mapping" VALUES ('PREVAIL','p ɹ ɪ v ˈeɪ l','pv ri be i rv','プリベイル','プリベイル');
-INSERT INTO "hand_mapping" VALUES ('PREVALENCE','p ɹ ˈɛ v ə l ə n s','pv re ba ra nv sv','プレバランス','プレバランス');
-INSERT INTO "hand_mapping" VALUES ('PREVENT','p ɹ ɪ v ˈɛ n t','pv ri be nv tv','プリベント','プリベント');
-INSERT INTO "hand_mapping" VALUES ('PREVENTED','p ɹ ɪ v ˈɛ n t ɪ d','pv ri be nv ti dv','プリベンティド','プリベンティド');
-INSERT INTO "hand_mapping" VALUES ('PREVENTING','p ɹ ɪ v ˈɛ n t ɪ ŋ','pv ri be nv ti Nv','プリベンティン','プリベンティング');
-INSERT INTO "hand_mapping" VALUES ('PREVENTION','p ɹ ɪ v ˈɛ n ʃ ə n','pv ri be nv sya nv','プリベンシャン','プリベンション');
-INSERT INTO "hand_mapping" VALUES ('PREVENTS','p ɹ ɪ v ˈɛ n t s','pv ri be nv tsv','プリベンツ','プリベンツ');
-INSERT INTO "hand_mapping" VALUES ('PREVIEW','p ɹ ˈiː v j ˌuː','pv ri - byu -','プリービュー','プリービュー');
-INSERT INTO "hand_mapping" VALUES ('PREVIEWS','p ɹ ˈiː v j ˌuː z','pv ri - byu - zv','プリービューズ','プリービューズ');
-INSERT INTO "hand_mapping" VALUES ('PREVIOUS','p ɹ ˈiː v ɪə s','pv ri - bi a sv','プリービアス','プリービアス');
-INSERT INTO "hand_mapping" VALUES ('PREVIOUSLY','p ɹ ˈiː v ɪə s l i','pv ri - bi a sv ri -','プリービアスリー','プリービアスリー');
+INSERT INTO "hand_mapping" VALUES ('PREVAIL','p ɹ ɪ v ˈeɪ l','pv ri Ve i rv','プリベイル','プリベイル');
+INSERT INTO "hand_mapping" VALUES ('PREVALENCE','p ɹ ˈɛ v ə l ə n s','pv re Va ra nv sv','プレバランス','プレバランス');
+INSERT INTO "hand_mapping" VALUES ('PREVENT','p ɹ ɪ v ˈɛ n t','pv ri Ve nv tv','プリベント','プリベント');
+INSERT INTO "hand_mapping" VALUES ('PREVENTED','p ɹ ɪ v ˈɛ n t ɪ d','pv ri Ve nv ti dv','プリベンティド','プリベンティド');
+INSERT INTO "hand_mapping" VALUES ('PREVENTING','p ɹ ɪ v ˈɛ n t ɪ ŋ','pv ri Ve nv ti Nv','プリベンティン','プリベンティング');
+INSERT INTO "hand_mapping" VALUES ('PREVENTION','p ɹ ɪ v ˈɛ n ʃ ə n','pv ri Ve nv sya nv','プリベンシャン','プリベンション');
+INSERT INTO "hand_mapping" VALUES ('PREVENTS','p ɹ ɪ v ˈɛ n t s','pv ri Ve nv tsv','プリベンツ','プリベンツ');
+INSERT INTO "hand_mapping" VALUES ('PREVIEW','p ɹ ˈiː v j ˌuː','pv ri - Vyu -','プリービュー','プリービュー');
+INSERT INTO "hand_mapping" VALUES ('PREVIEWS','p ɹ ˈiː v j ˌuː z','pv ri - Vyu - zv','プリービューズ','プリービューズ');
+INSERT INTO "hand_mapping" VALUES ('PREVIOUS','p ɹ ˈiː v ɪə s','pv ri - Vi a sv','プリービアス','プリービアス');
+INSERT INTO "hand_mapping" VALUES ('PREVIOUSLY','p ɹ ˈiː v ɪə s l i','pv ri - Vi a sv ri -','プリービアスリー','プリービアスリー');
 INSERT INTO "hand_mapping" VALUES ('PREY','p ɹ ˈeɪ','pv re i','プレイ','プレイ');
 INSERT INTO "hand_mapping" VALUES ('PRICE','p ɹ ˈaɪ s','pv ra i sv','プライス','プライス');
 INSERT INTO "hand_mapping" VALUES ('PRICED','p ɹ ˈaɪ s t','pv ra i sv tv','プライスト','プライスト');
@@ -11509,7 +11509,7 @@ INSERT INTO "hand_mapping" VALUES ('PRIMARILY(2)','p ɹ aɪ m ˈɛ ɹ ɪ l i','p
 INSERT INTO "hand_mapping" VALUES ('PRIMARY','p ɹ ˈaɪ m ə ɹ i','pv ra i ma ri -','プライマリー','プライマリー');
 INSERT INTO "hand_mapping" VALUES ('PRIME','p ɹ ˈaɪ m','pv ra i mv','プライム','プライム');
 INSERT INTO "hand_mapping" VALUES ('PRIMER','p ɹ ˈaɪ m ə','pv ra i ma','プライマ','プライマ');
-INSERT INTO "hand_mapping" VALUES ('PRIMITIVE','p ɹ ˈɪ m ɪ t ɪ v','pv ri mi ti bv','プリミティブ','プリミティブ');
+INSERT INTO "hand_mapping" VALUES ('PRIMITIVE','p ɹ ˈɪ m ɪ t ɪ v','pv ri mi ti Vv','プリミティブ','プリミティブ');
 INSERT INTO "hand_mapping" VALUES ('PRINCE','p ɹ ˈɪ n s','pv ri nv sv','プリンス','プリンス');
 INSERT INTO "hand_mapping" VALUES ('PRINCESS','p ɹ ˈɪ n s ɛ s','pv ri nv se sv','プリンセス','プリンセス');
 INSERT INTO "hand_mapping" VALUES ('PRINCETON','p ɹ ˈɪ n s t ə n','pv ri nv sv ta nv','プリンスタン','プリンスタン');
@@ -11536,19 +11536,19 @@ INSERT INTO "hand_mapping" VALUES ('PRISONERS(1)','p ɹ ˈɪ z n ə z','pv ri zv
 INSERT INTO "hand_mapping" VALUES ('PRISONERS(2)','p ɹ ˈɪ z ə n ə z','pv ri za na zv','プリザナズ','プリザナズ');
 INSERT INTO "hand_mapping" VALUES ('PRISONS','p ɹ ˈɪ z ə n z','pv ri za nv zv','プリザンズ','プリザンズ');
 INSERT INTO "hand_mapping" VALUES ('PRISTINA','p ɹ ˈiː ʃ t ɪ n ə','pv ri - syv ti na','プリーシュティナ','プリーシュティナ');
-INSERT INTO "hand_mapping" VALUES ('PRIVACY(1)','p ɹ ˈaɪ v ə s i','pv ra i ba si -','プライバシー','プライバシー');
-INSERT INTO "hand_mapping" VALUES ('PRIVACY(2)','p ɹ ˈɪ v ə s i','pv ri ba si -','プリバシー','プリバシー');
-INSERT INTO "hand_mapping" VALUES ('PRIVATE','p ɹ ˈaɪ v ɪ t','pv ra i bi tv','プライビト','プライビト');
-INSERT INTO "hand_mapping" VALUES ('PRIVATELY','p ɹ ˈaɪ v ɪ t l i','pv ra i bi tv ri -','プライビトリー','プライビトリー');
-INSERT INTO "hand_mapping" VALUES ('PRIVATISATION','p ɹ ˌaɪ v ɪ t aɪ z ˈeɪ ʃ ə n','pv ra i bi ta i ze i sya nv','プライビタイゼイシャン','プライビタイゼイション');
-INSERT INTO "hand_mapping" VALUES ('PRIVATIZATION','p ɹ ˌaɪ v ɪ t aɪ z ˈeɪ ʃ ə n','pv ra i bi ta i ze i sya nv','プライビタイゼイシャン','プライビタイゼイション');
-INSERT INTO "hand_mapping" VALUES ('PRIVILEGE(1)','p ɹ ˈɪ v l ɪ dʒ','pv ri bv ri jyv','プリブリジュ','プリブリジュ');
-INSERT INTO "hand_mapping" VALUES ('PRIVILEGE(2)','p ɹ ˈɪ v ɪ l ɪ dʒ','pv ri bi ri jyv','プリビリジュ','プリビリジュ');
-INSERT INTO "hand_mapping" VALUES ('PRIVILEGED(1)','p ɹ ˈɪ v l ɪ dʒ d','pv ri bv ri jyv dv','プリブリジュド','プリブリジュド');
-INSERT INTO "hand_mapping" VALUES ('PRIVILEGED(2)','p ɹ ˈɪ v ɪ l ɪ dʒ d','pv ri bi ri jyv dv','プリビリジュド','プリビリジュド');
-INSERT INTO "hand_mapping" VALUES ('PRIVILEGES(1)','p ɹ ˈɪ v l ɪ dʒ ɪ z','pv ri bv ri jyi zv','プリブリジィズ','プリブリジィズ');
-INSERT INTO "hand_mapping" VALUES ('PRIVILEGES(2)','p ɹ ˈɪ v ɪ l ɪ dʒ ɪ z','pv ri bi ri jyi zv','プリビリジィズ','プリビリジィズ');
-INSERT INTO "hand_mapping" VALUES ('PRIVY','p ɹ ˈɪ v i','pv ri bi -','プリビー','プリビー');
+INSERT INTO "hand_mapping" VALUES ('PRIVACY(1)','p ɹ ˈaɪ v ə s i','pv ra i Va si -','プライバシー','プライバシー');
+INSERT INTO "hand_mapping" VALUES ('PRIVACY(2)','p ɹ ˈɪ v ə s i','pv ri Va si -','プリバシー','プリバシー');
+INSERT INTO "hand_mapping" VALUES ('PRIVATE','p ɹ ˈaɪ v ɪ t','pv ra i Vi tv','プライビト','プライビト');
+INSERT INTO "hand_mapping" VALUES ('PRIVATELY','p ɹ ˈaɪ v ɪ t l i','pv ra i Vi tv ri -','プライビトリー','プライビトリー');
+INSERT INTO "hand_mapping" VALUES ('PRIVATISATION','p ɹ ˌaɪ v ɪ t aɪ z ˈeɪ ʃ ə n','pv ra i Vi ta i ze i sya nv','プライビタイゼイシャン','プライビタイゼイション');
+INSERT INTO "hand_mapping" VALUES ('PRIVATIZATION','p ɹ ˌaɪ v ɪ t aɪ z ˈeɪ ʃ ə n','pv ra i Vi ta i ze i sya nv','プライビタイゼイシャン','プライビタイゼイション');
+INSERT INTO "hand_mapping" VALUES ('PRIVILEGE(1)','p ɹ ˈɪ v l ɪ dʒ','pv ri Vv ri jyv','プリブリジュ','プリブリジュ');
+INSERT INTO "hand_mapping" VALUES ('PRIVILEGE(2)','p ɹ ˈɪ v ɪ l ɪ dʒ','pv ri Vi ri jyv','プリビリジュ','プリビリジュ');
+INSERT INTO "hand_mapping" VALUES ('PRIVILEGED(1)','p ɹ ˈɪ v l ɪ dʒ d','pv ri Vv ri jyv dv','プリブリジュド','プリブリジュド');
+INSERT INTO "hand_mapping" VALUES ('PRIVILEGED(2)','p ɹ ˈɪ v ɪ l ɪ dʒ d','pv ri Vi ri jyv dv','プリビリジュド','プリビリジュド');
+INSERT INTO "hand_mapping" VALUES ('PRIVILEGES(1)','p ɹ ˈɪ v l ɪ dʒ ɪ z','pv ri Vv ri jyi zv','プリブリジィズ','プリブリジィズ');
+INSERT INTO "hand_mapping" VALUES ('PRIVILEGES(2)','p ɹ ˈɪ v ɪ l ɪ dʒ ɪ z','pv ri Vi ri jyi zv','プリビリジィズ','プリビリジィズ');
+INSERT INTO "hand_mapping" VALUES ('PRIVY','p ɹ ˈɪ v i','pv ri Vi -','プリビー','プリビー');
 INSERT INTO "hand_mapping" VALUES ('PRIX','p ɹ ˈiː','pv ri -','プリー','プリー');
 INSERT INTO "hand_mapping" VALUES ('PRIZE','p ɹ ˈaɪ z','pv ra i zv','プライズ','プライズ');
 INSERT INTO "hand_mapping" VALUES ('PRIZES','p ɹ ˈaɪ z ɪ z','pv ra i zi zv','プライジズ','プライジズ');
@@ -11585,8 +11585,8 @@ INSERT INTO "hand_mapping" VALUES ('PRODUCING','p ɹ ə d j ˈuː s ɪ ŋ','pv r
 INSERT INTO "hand_mapping" VALUES ('PRODUCT','p ɹ ˈɒ d ɐ k t','pv ro da kv tv','プロダクト','プロダクト');
 INSERT INTO "hand_mapping" VALUES ('PRODUCTION','p ɹ ə d ˈɐ k ʃ ə n','pv ra da kv sya nv','プラダクシャン','プラダクション');
 INSERT INTO "hand_mapping" VALUES ('PRODUCTIONS','p ɹ ə d ˈɐ k ʃ ə n z','pv ra da kv sya nv zv','プラダクシャンズ','プラダクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('PRODUCTIVE','p ɹ ə d ˈɐ k t ɪ v','pv ra da kv ti bv','プラダクティブ','プラダクティブ');
-INSERT INTO "hand_mapping" VALUES ('PRODUCTIVITY','p ɹ ˌɒ d ɐ k t ˈɪ v ɪ t i','pv ro da kv ti bi ti -','プロダクティビティー','プロダクティビティー');
+INSERT INTO "hand_mapping" VALUES ('PRODUCTIVE','p ɹ ə d ˈɐ k t ɪ v','pv ra da kv ti Vv','プラダクティブ','プラダクティブ');
+INSERT INTO "hand_mapping" VALUES ('PRODUCTIVITY','p ɹ ˌɒ d ɐ k t ˈɪ v ɪ t i','pv ro da kv ti Vi ti -','プロダクティビティー','プロダクティビティー');
 INSERT INTO "hand_mapping" VALUES ('PRODUCTS','p ɹ ˈɒ d ɐ k t s','pv ro da kv tsv','プロダクツ','プロダクツ');
 INSERT INTO "hand_mapping" VALUES ('PROF','p ɹ ˈɒ f','pv ro fv','プロフ','プロフ');
 INSERT INTO "hand_mapping" VALUES ('PROFESSION','p ɹ ə f ˈɛ ʃ ə n','pv ra fe sya nv','プラフェシャン','プラフェション');
@@ -11613,8 +11613,8 @@ INSERT INTO "hand_mapping" VALUES ('PROGRAMS','p ɹ ˈəʊ g ɹ ˌæ m z','pv ro
 INSERT INTO "hand_mapping" VALUES ('PROGRESS(1)','p ɹ ˈəʊ g ɹ ˌɛ s','pv ro - gv re - sv','プローグレース','プローグレース');
 INSERT INTO "hand_mapping" VALUES ('PROGRESS(2)','p ɹ ə g ɹ ˈɛ s','pv ra gv re sv','プラグレス','プラグレス');
 INSERT INTO "hand_mapping" VALUES ('PROGRESSION','p ɹ ə g ɹ ˈɛ ʃ ə n','pv ra gv re sya nv','プラグレシャン','プラグレション');
-INSERT INTO "hand_mapping" VALUES ('PROGRESSIVE','p ɹ ə g ɹ ˈɛ s ɪ v','pv ra gv re si bv','プラグレシブ','プラグレシブ');
-INSERT INTO "hand_mapping" VALUES ('PROGRESSIVELY','p ɹ ə g ɹ ˈɛ s ɪ v l i','pv ra gv re si bv ri -','プラグレシブリー','プラグレシブリー');
+INSERT INTO "hand_mapping" VALUES ('PROGRESSIVE','p ɹ ə g ɹ ˈɛ s ɪ v','pv ra gv re si Vv','プラグレシブ','プラグレシブ');
+INSERT INTO "hand_mapping" VALUES ('PROGRESSIVELY','p ɹ ə g ɹ ˈɛ s ɪ v l i','pv ra gv re si Vv ri -','プラグレシブリー','プラグレシブリー');
 INSERT INTO "hand_mapping" VALUES ('PROHIBIT','p ɹ əʊ h ˈɪ b ɪ t','pv ro hi bi tv','プロヒビト','プロヒビト');
 INSERT INTO "hand_mapping" VALUES ('PROHIBITED','p ɹ əʊ h ˈɪ b ɪ t ɪ d','pv ro hi bi ti dv','プロヒビティド','プロヒビティド');
 INSERT INTO "hand_mapping" VALUES ('PROJECT(1)','p ɹ ˈɒ dʒ ɛ k t','pv ro jye kv tv','プロジェクト','プロジェクト');
@@ -11678,7 +11678,7 @@ INSERT INTO "hand_mapping" VALUES ('PROSE','p ɹ ˈəʊ z','pv ro - zv','プロ
 INSERT INTO "hand_mapping" VALUES ('PROSECUTE','p ɹ ˈɒ s ɪ k j ˌuː t','pv ro x si kyu - tv','プロッシキュート','プロッシキュート');
 INSERT INTO "hand_mapping" VALUES ('PROSECUTION','p ɹ ˌɒ s ɪ k j ˈuː ʃ ə n','pv ro - si kyu - sya nv','プローシキューシャン','プローシキューション');
 INSERT INTO "hand_mapping" VALUES ('PROSPECT','p ɹ ˈɒ s p ɛ k t','pv ro x sv pe kv tv','プロッスペクト','プロッスペクト');
-INSERT INTO "hand_mapping" VALUES ('PROSPECTIVE','p ɹ ə s p ˈɛ k t ɪ v','pv ra sv pe kv ti bv','プラスペクティブ','プラスペクティブ');
+INSERT INTO "hand_mapping" VALUES ('PROSPECTIVE','p ɹ ə s p ˈɛ k t ɪ v','pv ra sv pe kv ti Vv','プラスペクティブ','プラスペクティブ');
 INSERT INTO "hand_mapping" VALUES ('PROSPECTS','p ɹ ˈɒ s p ɛ k t s','pv ro x sv pe kv tsv','プロッスペクツ','プロッスペクツ');
 INSERT INTO "hand_mapping" VALUES ('PROSPECTUS','p ɹ ə s p ˈɛ k t ə s','pv ra sv pe kv ta sv','プラスペクタス','プラスペクタス');
 INSERT INTO "hand_mapping" VALUES ('PROSPECTUSES','p ɹ ə s p ˈɛ k t ə s ɪ z','pv ra sv pe kv ta si zv','プラスペクタシズ','プラスペクタシズ');
@@ -11689,7 +11689,7 @@ INSERT INTO "hand_mapping" VALUES ('PROTECT','p ɹ ə t ˈɛ k t','pv ra te kv t
 INSERT INTO "hand_mapping" VALUES ('PROTECTED','p ɹ ə t ˈɛ k t ɪ d','pv ra te kv ti dv','プラテクティド','プラテクティド');
 INSERT INTO "hand_mapping" VALUES ('PROTECTING','p ɹ ə t ˈɛ k t ɪ ŋ','pv ra te kv ti Nv','プラテクティン','プラテクティング');
 INSERT INTO "hand_mapping" VALUES ('PROTECTION','p ɹ ə t ˈɛ k ʃ ə n','pv ra te kv sya nv','プラテクシャン','プラテクション');
-INSERT INTO "hand_mapping" VALUES ('PROTECTIVE','p ɹ ə t ˈɛ k t ɪ v','pv ra te kv ti bv','プラテクティブ','プラテクティブ');
+INSERT INTO "hand_mapping" VALUES ('PROTECTIVE','p ɹ ə t ˈɛ k t ɪ v','pv ra te kv ti Vv','プラテクティブ','プラテクティブ');
 INSERT INTO "hand_mapping" VALUES ('PROTEIN','p ɹ ˈəʊ t ˌiː n','pv ro - ti - nv','プローティーン','プローティーン');
 INSERT INTO "hand_mapping" VALUES ('PROTEINS','p ɹ ˈəʊ t ˌiː n z','pv ro - ti - nv zv','プローティーンズ','プローティーンズ');
 INSERT INTO "hand_mapping" VALUES ('PROTEST(1)','p ɹ ˈəʊ t ɛ s t','pv ro - te sv tv','プローテスト','プローテスト');
@@ -11704,27 +11704,27 @@ INSERT INTO "hand_mapping" VALUES ('PROTON','p ɹ ˈəʊ t ɒ n','pv ro - to nv'
 INSERT INTO "hand_mapping" VALUES ('PROTOTYPE','p ɹ ˈəʊ t ə t ˌaɪ p','pv ro - ta ta i pv','プロータタイプ','プロータタイプ');
 INSERT INTO "hand_mapping" VALUES ('PROUD','p ɹ ˈaʊ d','pv ra u dv','プラウド','プラウド');
 INSERT INTO "hand_mapping" VALUES ('PROUDLY','p ɹ ˈaʊ d l i','pv ra u dv ri -','プラウドリー','プラウドリー');
-INSERT INTO "hand_mapping" VALUES ('PROVE','p ɹ ˈuː v','pv ru - bv','プルーブ','プルーブ');
-INSERT INTO "hand_mapping" VALUES ('PROVED','p ɹ ˈuː v d','pv ru - bv dv','プルーブド','プルーブド');
-INSERT INTO "hand_mapping" VALUES ('PROVEN','p ɹ ˈuː v ə n','pv ru - ba nv','プルーバン','プルーバン');
-INSERT INTO "hand_mapping" VALUES ('PROVES','p ɹ ˈuː v z','pv ru - bv zv','プルーブズ','プルーブズ');
-INSERT INTO "hand_mapping" VALUES ('PROVIDE','p ɹ ə v ˈaɪ d','pv ra ba i dv','プラバイド','プラバイド');
-INSERT INTO "hand_mapping" VALUES ('PROVIDED','p ɹ ə v ˈaɪ d ɪ d','pv ra ba i di dv','プラバイディド','プラバイディド');
-INSERT INTO "hand_mapping" VALUES ('PROVIDENCE','p ɹ ˈɒ v ɪ d ə n s','pv ro bi da nv sv','プロビダンス','プロビダンス');
-INSERT INTO "hand_mapping" VALUES ('PROVIDER','p ɹ ə v ˈaɪ d ə','pv ra ba i da','プラバイダ','プラバイダ');
-INSERT INTO "hand_mapping" VALUES ('PROVIDERS','p ɹ ə v ˈaɪ d ə z','pv ra ba i da zv','プラバイダズ','プラバイダズ');
-INSERT INTO "hand_mapping" VALUES ('PROVIDES','p ɹ ə v ˈaɪ d z','pv ra ba i zv','プラバイズ','プラバイズ');
-INSERT INTO "hand_mapping" VALUES ('PROVIDING','p ɹ ə v ˈaɪ d ɪ ŋ','pv ra ba i di Nv','プラバイディン','プラバイディング');
-INSERT INTO "hand_mapping" VALUES ('PROVINCE','p ɹ ˈɒ v ɪ n s','pv ro bi nv sv','プロビンス','プロビンス');
-INSERT INTO "hand_mapping" VALUES ('PROVINCES','p ɹ ˈɒ v ɪ n s ɪ z','pv ro bi nv si zv','プロビンシズ','プロビンシズ');
-INSERT INTO "hand_mapping" VALUES ('PROVINCIAL','p ɹ ə v ˈɪ n ʃ ə l','pv ra bi nv sya rv','プラビンシャル','プラビンシャル');
-INSERT INTO "hand_mapping" VALUES ('PROVING','p ɹ ˈuː v ɪ ŋ','pv ru - bi Nv','プルービン','プルービング');
-INSERT INTO "hand_mapping" VALUES ('PROVISION','p ɹ ə v ˈɪ ʒ ə n','pv ra bi jya nv','プラビジャン','プラビジョン');
-INSERT INTO "hand_mapping" VALUES ('PROVISIONAL','p ɹ ə v ˈɪ ʒ ə n ə l','pv ra bi jya na rv','プラビジャナル','プラビジャナル');
-INSERT INTO "hand_mapping" VALUES ('PROVISIONS','p ɹ ə v ˈɪ ʒ ə n z','pv ra bi jya nv zv','プラビジャンズ','プラビジャンズ');
-INSERT INTO "hand_mapping" VALUES ('PROVOCATION','p ɹ ˌɒ v ə k ˈeɪ ʃ ə n','pv ro ba ke i sya nv','プロバケイシャン','プロバケイション');
-INSERT INTO "hand_mapping" VALUES ('PROVOKE','p ɹ ə v ˈəʊ k','pv ra bo - kv','プラボーク','プラボーク');
-INSERT INTO "hand_mapping" VALUES ('PROVOKES','p ɹ ə v ˈəʊ k s','pv ra bo - kv sv','プラボークス','プラボークス');
+INSERT INTO "hand_mapping" VALUES ('PROVE','p ɹ ˈuː v','pv ru - Vv','プルーブ','プルーブ');
+INSERT INTO "hand_mapping" VALUES ('PROVED','p ɹ ˈuː v d','pv ru - Vv dv','プルーブド','プルーブド');
+INSERT INTO "hand_mapping" VALUES ('PROVEN','p ɹ ˈuː v ə n','pv ru - Va nv','プルーバン','プルーバン');
+INSERT INTO "hand_mapping" VALUES ('PROVES','p ɹ ˈuː v z','pv ru - Vv zv','プルーブズ','プルーブズ');
+INSERT INTO "hand_mapping" VALUES ('PROVIDE','p ɹ ə v ˈaɪ d','pv ra Va i dv','プラバイド','プラバイド');
+INSERT INTO "hand_mapping" VALUES ('PROVIDED','p ɹ ə v ˈaɪ d ɪ d','pv ra Va i di dv','プラバイディド','プラバイディド');
+INSERT INTO "hand_mapping" VALUES ('PROVIDENCE','p ɹ ˈɒ v ɪ d ə n s','pv ro Vi da nv sv','プロビダンス','プロビダンス');
+INSERT INTO "hand_mapping" VALUES ('PROVIDER','p ɹ ə v ˈaɪ d ə','pv ra Va i da','プラバイダ','プラバイダ');
+INSERT INTO "hand_mapping" VALUES ('PROVIDERS','p ɹ ə v ˈaɪ d ə z','pv ra Va i da zv','プラバイダズ','プラバイダズ');
+INSERT INTO "hand_mapping" VALUES ('PROVIDES','p ɹ ə v ˈaɪ d z','pv ra Va i zv','プラバイズ','プラバイズ');
+INSERT INTO "hand_mapping" VALUES ('PROVIDING','p ɹ ə v ˈaɪ d ɪ ŋ','pv ra Va i di Nv','プラバイディン','プラバイディング');
+INSERT INTO "hand_mapping" VALUES ('PROVINCE','p ɹ ˈɒ v ɪ n s','pv ro Vi nv sv','プロビンス','プロビンス');
+INSERT INTO "hand_mapping" VALUES ('PROVINCES','p ɹ ˈɒ v ɪ n s ɪ z','pv ro Vi nv si zv','プロビンシズ','プロビンシズ');
+INSERT INTO "hand_mapping" VALUES ('PROVINCIAL','p ɹ ə v ˈɪ n ʃ ə l','pv ra Vi nv sya rv','プラビンシャル','プラビンシャル');
+INSERT INTO "hand_mapping" VALUES ('PROVING','p ɹ ˈuː v ɪ ŋ','pv ru - Vi Nv','プルービン','プルービング');
+INSERT INTO "hand_mapping" VALUES ('PROVISION','p ɹ ə v ˈɪ ʒ ə n','pv ra Vi jya nv','プラビジャン','プラビジョン');
+INSERT INTO "hand_mapping" VALUES ('PROVISIONAL','p ɹ ə v ˈɪ ʒ ə n ə l','pv ra Vi jya na rv','プラビジャナル','プラビジャナル');
+INSERT INTO "hand_mapping" VALUES ('PROVISIONS','p ɹ ə v ˈɪ ʒ ə n z','pv ra Vi jya nv zv','プラビジャンズ','プラビジャンズ');
+INSERT INTO "hand_mapping" VALUES ('PROVOCATION','p ɹ ˌɒ v ə k ˈeɪ ʃ ə n','pv ro Va ke i sya nv','プロバケイシャン','プロバケイション');
+INSERT INTO "hand_mapping" VALUES ('PROVOKE','p ɹ ə v ˈəʊ k','pv ra Vo - kv','プラボーク','プラボーク');
+INSERT INTO "hand_mapping" VALUES ('PROVOKES','p ɹ ə v ˈəʊ k s','pv ra Vo - kv sv','プラボークス','プラボークス');
 INSERT INTO "hand_mapping" VALUES ('PROW','p ɹ ˈaʊ','pv ra u','プラウ','プラウ');
 INSERT INTO "hand_mapping" VALUES ('PROWL','p ɹ ˈaʊ l','pv ra u rv','プラウル','プラウル');
 INSERT INTO "hand_mapping" VALUES ('PROXY','p ɹ ˈɒ k s i','pv ro x kv si -','プロックシー','プロックシー');
@@ -11837,13 +11837,13 @@ INSERT INTO "hand_mapping" VALUES ('QUALIFICATIONS','k w ˌɒ l ɪ f ɪ k ˈeɪ
 INSERT INTO "hand_mapping" VALUES ('QUALIFIED','k w ˈɒ l ɪ f ˌaɪ d','kwo ri fa i dv','クォリファイド','クォリファイド');
 INSERT INTO "hand_mapping" VALUES ('QUALIFY','k w ˈɒ l ɪ f ˌaɪ','kwo ri fa i','クォリファイ','クォリファイ');
 INSERT INTO "hand_mapping" VALUES ('QUALIFYING','k w ˈɒ l ɪ f ˌaɪ ɪ ŋ','kwo ri fa i i Nv','クォリファイイン','クォリファイイング');
-INSERT INTO "hand_mapping" VALUES ('QUALITATIVE(1)','k w ˈɒ l ɪ t ə t ɪ v','kwo ri ta ti bv','クォリタティブ','クォリタティブ');
-INSERT INTO "hand_mapping" VALUES ('QUALITATIVE(2)','k w ˈɒ l ɪ t ˌeɪ t ɪ v','kwo ri te i ti bv','クォリテイティブ','クォリテイティブ');
+INSERT INTO "hand_mapping" VALUES ('QUALITATIVE(1)','k w ˈɒ l ɪ t ə t ɪ v','kwo ri ta ti Vv','クォリタティブ','クォリタティブ');
+INSERT INTO "hand_mapping" VALUES ('QUALITATIVE(2)','k w ˈɒ l ɪ t ˌeɪ t ɪ v','kwo ri te i ti Vv','クォリテイティブ','クォリテイティブ');
 INSERT INTO "hand_mapping" VALUES ('QUALITIES','k w ˈɒ l ɪ t i z','kwo ri ti - zv','クォリティーズ','クォリティーズ');
 INSERT INTO "hand_mapping" VALUES ('QUALITY','k w ˈɒ l ɪ t i','kwo ri ti -','クォリティー','クォリティー');
 INSERT INTO "hand_mapping" VALUES ('QUALM','k w ˈɑː m','kwa - mv','クァーム','クァーム');
 INSERT INTO "hand_mapping" VALUES ('QUALMS','k w ˈɑː m z','kwa - mv zv','クァームズ','クァームズ');
-INSERT INTO "hand_mapping" VALUES ('QUANTITATIVE','k w ˈɒ n t ɪ t ə t ɪ v','kwo nv ti ta ti bv','クォンティタティブ','クォンティタティブ');
+INSERT INTO "hand_mapping" VALUES ('QUANTITATIVE','k w ˈɒ n t ɪ t ə t ɪ v','kwo nv ti ta ti Vv','クォンティタティブ','クォンティタティブ');
 INSERT INTO "hand_mapping" VALUES ('QUANTITIES','k w ˈɒ n t ɪ t i z','kwo nv ti ti - zv','クォンティティーズ','クォンティティーズ');
 INSERT INTO "hand_mapping" VALUES ('QUANTITY','k w ˈɒ n t ɪ t i','kwo nv ti ti -','クォンティティー','クォンティティー');
 INSERT INTO "hand_mapping" VALUES ('QUANTUM','k w ˈɒ n t ə m','kwo nv ta mv','クォンタム','クォンタム');
@@ -11921,7 +11921,7 @@ INSERT INTO "hand_mapping" VALUES ('RADIATORS','ɹ ˈeɪ d ɪ ˌeɪ t ə z','re
 INSERT INTO "hand_mapping" VALUES ('RADICAL','ɹ ˈæ d ɪ k ə l','ra di ka rv','ラディカル','ラディカル');
 INSERT INTO "hand_mapping" VALUES ('RADICALLY','ɹ ˈæ d ɪ k l i','ra di kv ri -','ラディクリー','ラディクリー');
 INSERT INTO "hand_mapping" VALUES ('RADIO','ɹ ˈeɪ d ɪ ˌəʊ','re i di o','レイディオ','レイディオ');
-INSERT INTO "hand_mapping" VALUES ('RADIOACTIVE','ɹ ˌeɪ d ɪ əʊ ˈæ k t ɪ v','re i di o a x kv ti bv','レイディオアックティブ','レイディオアックティブ');
+INSERT INTO "hand_mapping" VALUES ('RADIOACTIVE','ɹ ˌeɪ d ɪ əʊ ˈæ k t ɪ v','re i di o a x kv ti Vv','レイディオアックティブ','レイディオアックティブ');
 INSERT INTO "hand_mapping" VALUES ('RADIOS','ɹ ˈeɪ d ɪ ˌəʊ z','re i di o zv','レイディオズ','レイディオズ');
 INSERT INTO "hand_mapping" VALUES ('RADIUS','ɹ ˈeɪ d ɪə s','re i di a sv','レイディアス','レイディアス');
 INSERT INTO "hand_mapping" VALUES ('RAF','ɹ ˈæ f','ra fv','ラフ','ラフ');
@@ -12001,8 +12001,8 @@ INSERT INTO "hand_mapping" VALUES ('RATIONALITY','ɹ ˌæ ʃ ə n ˈæ l ɪ t i'
 INSERT INTO "hand_mapping" VALUES ('RATIOS','ɹ ˈeɪ ʃ ɪ ˌəʊ z','re i syi o zv','レイシオズ','レイシオズ');
 INSERT INTO "hand_mapping" VALUES ('RATS','ɹ ˈæ t s','ra x tsv','ラッツ','ラッツ');
 INSERT INTO "hand_mapping" VALUES ('RATTLE','ɹ ˈæ t ə l','ra x ta rv','ラッタル','ラッタル');
-INSERT INTO "hand_mapping" VALUES ('RAVE','ɹ ˈeɪ v','re i bv','レイブ','レイブ');
-INSERT INTO "hand_mapping" VALUES ('RAVEN','ɹ ˈeɪ v ə n','re i ba nv','レイバン','レイバン');
+INSERT INTO "hand_mapping" VALUES ('RAVE','ɹ ˈeɪ v','re i Vv','レイブ','レイブ');
+INSERT INTO "hand_mapping" VALUES ('RAVEN','ɹ ˈeɪ v ə n','re i Va nv','レイバン','レイバン');
 INSERT INTO "hand_mapping" VALUES ('RAW','ɹ ˈɔː','ro -','ロー','ロー');
 INSERT INTO "hand_mapping" VALUES ('RAY','ɹ ˈeɪ','re i','レイ','レイ');
 INSERT INTO "hand_mapping" VALUES ('RAYMOND','ɹ ˈeɪ m ə n d','re i ma nv dv','レイマンド','レイマンド');
@@ -12078,12 +12078,12 @@ INSERT INTO "hand_mapping" VALUES ('RECALLS(2)','ɹ ˈiː k ɔː l z','ri - ko -
 INSERT INTO "hand_mapping" VALUES ('RECAP(1)','ɹ ˈiː k æ p','ri - ka pv','リーカプ','リーカプ');
 INSERT INTO "hand_mapping" VALUES ('RECAP(2)','ɹ iː k ˈæ p','ri - ka x pv','リーカップ','リーカップ');
 INSERT INTO "hand_mapping" VALUES ('RECEIPT','ɹ ɪ s ˈiː t','ri si - tv','リシート','リシート');
-INSERT INTO "hand_mapping" VALUES ('RECEIVE','ɹ ɪ s ˈiː v','ri si - bv','リシーブ','リシーブ');
-INSERT INTO "hand_mapping" VALUES ('RECEIVED','ɹ ɪ s ˈiː v d','ri si - bv dv','リシーブド','リシーブド');
-INSERT INTO "hand_mapping" VALUES ('RECEIVER','ɹ ɪ s ˈiː v ə','ri si - ba','リシーバ','リシーバ');
-INSERT INTO "hand_mapping" VALUES ('RECEIVERS','ɹ ɪ s ˈiː v ə z','ri si - ba zv','リシーバズ','リシーバズ');
-INSERT INTO "hand_mapping" VALUES ('RECEIVES','ɹ ɪ s ˈiː v z','ri si - bv zv','リシーブズ','リシーブズ');
-INSERT INTO "hand_mapping" VALUES ('RECEIVING','ɹ ɪ s ˈiː v ɪ ŋ','ri si - bi Nv','リシービン','リシービング');
+INSERT INTO "hand_mapping" VALUES ('RECEIVE','ɹ ɪ s ˈiː v','ri si - Vv','リシーブ','リシーブ');
+INSERT INTO "hand_mapping" VALUES ('RECEIVED','ɹ ɪ s ˈiː v d','ri si - Vv dv','リシーブド','リシーブド');
+INSERT INTO "hand_mapping" VALUES ('RECEIVER','ɹ ɪ s ˈiː v ə','ri si - Va','リシーバ','リシーバ');
+INSERT INTO "hand_mapping" VALUES ('RECEIVERS','ɹ ɪ s ˈiː v ə z','ri si - Va zv','リシーバズ','リシーバズ');
+INSERT INTO "hand_mapping" VALUES ('RECEIVES','ɹ ɪ s ˈiː v z','ri si - Vv zv','リシーブズ','リシーブズ');
+INSERT INTO "hand_mapping" VALUES ('RECEIVING','ɹ ɪ s ˈiː v ɪ ŋ','ri si - Vi Nv','リシービン','リシービング');
 INSERT INTO "hand_mapping" VALUES ('RECENT','ɹ ˈiː s ə n t','ri - sa nv tv','リーサント','リーサント');
 INSERT INTO "hand_mapping" VALUES ('RECENTLY','ɹ ˈiː s ə n t l i','ri - sa nv tv ri -','リーサントリー','リーサントリー');
 INSERT INTO "hand_mapping" VALUES ('RECEPTION','ɹ ɪ s ˈɛ p ʃ ə n','ri se pv sya nv','リセプシャン','リセプション');
@@ -12124,10 +12124,10 @@ INSERT INTO "hand_mapping" VALUES ('RECORDING','ɹ ɪ k ˈɔː d ɪ ŋ','ri ko -
 INSERT INTO "hand_mapping" VALUES ('RECORDINGS','ɹ ɪ k ˈɔː d ɪ ŋ z','ri ko - di Nv zv','リコーディンズ','リコーディンズ');
 INSERT INTO "hand_mapping" VALUES ('RECORDS(1)','ɹ ˈɛ k ɔː d z','re ko - zv','レコーズ','レコーズ');
 INSERT INTO "hand_mapping" VALUES ('RECORDS(2)','ɹ ɪ k ˈɔː d z','ri ko - zv','リコーズ','リコーズ');
-INSERT INTO "hand_mapping" VALUES ('RECOVER','ɹ ɪ k ˈɐ v ə','ri ka ba','リカバ','リカバ');
-INSERT INTO "hand_mapping" VALUES ('RECOVERED','ɹ ɪ k ˈɐ v ə d','ri ka ba dv','リカバド','リカバド');
-INSERT INTO "hand_mapping" VALUES ('RECOVERY(1)','ɹ ɪ k ˈɐ v ɹ i','ri ka bv ri -','リカブリー','リカブリー');
-INSERT INTO "hand_mapping" VALUES ('RECOVERY(2)','ɹ ɪ k ˈɐ v ə ɹ i','ri ka ba ri -','リカバリー','リカバリー');
+INSERT INTO "hand_mapping" VALUES ('RECOVER','ɹ ɪ k ˈɐ v ə','ri ka Va','リカバ','リカバ');
+INSERT INTO "hand_mapping" VALUES ('RECOVERED','ɹ ɪ k ˈɐ v ə d','ri ka Va dv','リカバド','リカバド');
+INSERT INTO "hand_mapping" VALUES ('RECOVERY(1)','ɹ ɪ k ˈɐ v ɹ i','ri ka Vv ri -','リカブリー','リカブリー');
+INSERT INTO "hand_mapping" VALUES ('RECOVERY(2)','ɹ ɪ k ˈɐ v ə ɹ i','ri ka Va ri -','リカバリー','リカバリー');
 INSERT INTO "hand_mapping" VALUES ('RECREATION(1)','ɹ ˌɛ k ɹ ɪ ˈeɪ ʃ ə n','re - kv ri e i sya nv','レークリエイシャン','レークリエイション');
 INSERT INTO "hand_mapping" VALUES ('RECREATION(2)','ɹ ˌiː k ɹ ɪ ˈeɪ ʃ ə n','ri - kv ri e i sya nv','リークリエイシャン','リークリエイション');
 INSERT INTO "hand_mapping" VALUES ('RECREATIONAL','ɹ ˌɛ k ɹ ɪ ˈeɪ ʃ ə n ə l','re - kv ri e i sya na rv','レークリエイシャナル','レークリエイシャナル');
@@ -12250,9 +12250,9 @@ INSERT INTO "hand_mapping" VALUES ('RELATION','ɹ ɪ l ˈeɪ ʃ ə n','ri re i s
 INSERT INTO "hand_mapping" VALUES ('RELATIONS','ɹ ɪ l ˈeɪ ʃ ə n z','ri re i sya nv zv','リレイシャンズ','リレイシャンズ');
 INSERT INTO "hand_mapping" VALUES ('RELATIONSHIP','ɹ ɪ l ˈeɪ ʃ ə n ʃ ˌɪ p','ri re i sya nv syi - pv','リレイシャンシープ','リレイシャンシープ');
 INSERT INTO "hand_mapping" VALUES ('RELATIONSHIPS','ɹ ɪ l ˈeɪ ʃ ə n ʃ ˌɪ p s','ri re i sya nv syi - pv sv','リレイシャンシープス','リレイシャンシープス');
-INSERT INTO "hand_mapping" VALUES ('RELATIVE','ɹ ˈɛ l ə t ɪ v','re ra ti bv','レラティブ','レラティブ');
-INSERT INTO "hand_mapping" VALUES ('RELATIVELY','ɹ ˈɛ l ə t ɪ v l i','re ra ti bv ri -','レラティブリー','レラティブリー');
-INSERT INTO "hand_mapping" VALUES ('RELATIVES','ɹ ˈɛ l ə t ɪ v z','re ra ti bv zv','レラティブズ','レラティブズ');
+INSERT INTO "hand_mapping" VALUES ('RELATIVE','ɹ ˈɛ l ə t ɪ v','re ra ti Vv','レラティブ','レラティブ');
+INSERT INTO "hand_mapping" VALUES ('RELATIVELY','ɹ ˈɛ l ə t ɪ v l i','re ra ti Vv ri -','レラティブリー','レラティブリー');
+INSERT INTO "hand_mapping" VALUES ('RELATIVES','ɹ ˈɛ l ə t ɪ v z','re ra ti Vv zv','レラティブズ','レラティブズ');
 INSERT INTO "hand_mapping" VALUES ('RELAX','ɹ ɪ l ˈæ k s','ri ra x kv sv','リラックス','リラックス');
 INSERT INTO "hand_mapping" VALUES ('RELAXATION','ɹ ˌiː l æ k s ˈeɪ ʃ ə n','ri - ra kv se i sya nv','リーラクセイシャン','リーラクセイション');
 INSERT INTO "hand_mapping" VALUES ('RELAXED','ɹ ɪ l ˈæ k s t','ri ra x kv sv tv','リラックスト','リラックスト');
@@ -12261,15 +12261,15 @@ INSERT INTO "hand_mapping" VALUES ('RELAY(2)','ɹ ɪ l ˈeɪ','ri re i','リレ
 INSERT INTO "hand_mapping" VALUES ('RELEASE','ɹ ɪ l ˈiː s','ri ri - sv','リリース','リリース');
 INSERT INTO "hand_mapping" VALUES ('RELEASED','ɹ ɪ l ˈiː s t','ri ri - sv tv','リリースト','リリースト');
 INSERT INTO "hand_mapping" VALUES ('RELEASES','ɹ ɪ l ˈiː s ɪ z','ri ri - si zv','リリーシズ','リリーシズ');
-INSERT INTO "hand_mapping" VALUES ('RELEVANCE','ɹ ˈɛ l ɪ v ə n s','re ri ba nv sv','レリバンス','レリバンス');
-INSERT INTO "hand_mapping" VALUES ('RELEVANT','ɹ ˈɛ l ɪ v ə n t','re ri ba nv tv','レリバント','レリバント');
+INSERT INTO "hand_mapping" VALUES ('RELEVANCE','ɹ ˈɛ l ɪ v ə n s','re ri Va nv sv','レリバンス','レリバンス');
+INSERT INTO "hand_mapping" VALUES ('RELEVANT','ɹ ˈɛ l ɪ v ə n t','re ri Va nv tv','レリバント','レリバント');
 INSERT INTO "hand_mapping" VALUES ('RELIABILITY','ɹ ɪ l ˌaɪ ə b ˈɪ l ɪ t i','ri ra i a bi ri ti -','リライアビリティー','リライアビリティー');
 INSERT INTO "hand_mapping" VALUES ('RELIABLE','ɹ ɪ l ˈaɪ ə b ə l','ri ra i a ba rv','リライアバル','リライアバル');
 INSERT INTO "hand_mapping" VALUES ('RELIANCE','ɹ ɪ l ˈaɪ ə n s','ri ra i a nv sv','リライアンス','リライアンス');
 INSERT INTO "hand_mapping" VALUES ('RELIC','ɹ ˈɛ l ɪ k','re ri kv','レリク','レリク');
 INSERT INTO "hand_mapping" VALUES ('RELIEF','ɹ ɪ l ˈiː f','ri ri - fv','リリーフ','リリーフ');
-INSERT INTO "hand_mapping" VALUES ('RELIEVE','ɹ ɪ l ˈiː v','ri ri - bv','リリーブ','リリーブ');
-INSERT INTO "hand_mapping" VALUES ('RELIEVED','ɹ ɪ l ˈiː v d','ri ri - bv dv','リリーブド','リリーブド');
+INSERT INTO "hand_mapping" VALUES ('RELIEVE','ɹ ɪ l ˈiː v','ri ri - Vv','リリーブ','リリーブ');
+INSERT INTO "hand_mapping" VALUES ('RELIEVED','ɹ ɪ l ˈiː v d','ri ri - Vv dv','リリーブド','リリーブド');
 INSERT INTO "hand_mapping" VALUES ('RELIGION','ɹ ɪ l ˈɪ dʒ ə n','ri ri jya nv','リリジャン','リリジョン');
 INSERT INTO "hand_mapping" VALUES ('RELIGIONS','ɹ ɪ l ˈɪ dʒ ə n z','ri ri jya nv zv','リリジャンズ','リリジャンズ');
 INSERT INTO "hand_mapping" VALUES ('RELIGIOUS','ɹ ɪ l ˈɪ dʒ ə s','ri ri jya sv','リリジャス','リリジャス');
@@ -12307,11 +12307,11 @@ INSERT INTO "hand_mapping" VALUES ('REMIX(1)','ɹ ˈiː m ˌɪ k s','ri - mi - k
 INSERT INTO "hand_mapping" VALUES ('REMIX(2)','ɹ iː m ˈɪ k s','ri - mi kv sv','リーミクス','リーミクス');
 INSERT INTO "hand_mapping" VALUES ('REMNANT','ɹ ˈɛ m n ə n t','re mv na nv tv','レムナント','レムナント');
 INSERT INTO "hand_mapping" VALUES ('REMOTE','ɹ ɪ m ˈəʊ t','ri mo - tv','リモート','リモート');
-INSERT INTO "hand_mapping" VALUES ('REMOVABLE','ɹ ɪ m ˈuː v ə b ə l','ri mu - ba ba rv','リムーババル','リムーババル');
-INSERT INTO "hand_mapping" VALUES ('REMOVAL','ɹ ɪ m ˈuː v ə l','ri mu - ba rv','リムーバル','リムーバル');
-INSERT INTO "hand_mapping" VALUES ('REMOVE','ɹ ɪ m ˈuː v','ri mu - bv','リムーブ','リムーブ');
-INSERT INTO "hand_mapping" VALUES ('REMOVED','ɹ ɪ m ˈuː v d','ri mu - bv dv','リムーブド','リムーブド');
-INSERT INTO "hand_mapping" VALUES ('REMOVING','ɹ ɪ m ˈuː v ɪ ŋ','ri mu - bi Nv','リムービン','リムービング');
+INSERT INTO "hand_mapping" VALUES ('REMOVABLE','ɹ ɪ m ˈuː v ə b ə l','ri mu - Va ba rv','リムーババル','リムーババル');
+INSERT INTO "hand_mapping" VALUES ('REMOVAL','ɹ ɪ m ˈuː v ə l','ri mu - Va rv','リムーバル','リムーバル');
+INSERT INTO "hand_mapping" VALUES ('REMOVE','ɹ ɪ m ˈuː v','ri mu - Vv','リムーブ','リムーブ');
+INSERT INTO "hand_mapping" VALUES ('REMOVED','ɹ ɪ m ˈuː v d','ri mu - Vv dv','リムーブド','リムーブド');
+INSERT INTO "hand_mapping" VALUES ('REMOVING','ɹ ɪ m ˈuː v ɪ ŋ','ri mu - Vi Nv','リムービン','リムービング');
 INSERT INTO "hand_mapping" VALUES ('REMUNERATION','ɹ ˌɪ m j uː n ə ɹ ˈeɪ ʃ ə n','ri - myu - na re i sya nv','リーミューナレイシャン','リーミューナレイション');
 INSERT INTO "hand_mapping" VALUES ('RENAISSANCE','ɹ ə n ˈeɪ s ə n s','ra ne i sa nv sv','ラネイサンス','ラネイサンス');
 INSERT INTO "hand_mapping" VALUES ('RENAL','ɹ ˈiː n ə l','ri - na rv','リーナル','リーナル');
@@ -12365,8 +12365,8 @@ INSERT INTO "hand_mapping" VALUES ('REPOSITORY','ɹ ɪ p ˈɒ z ɪ t ə ɹ i','r
 INSERT INTO "hand_mapping" VALUES ('REPRESENT','ɹ ˌɛ p ɹ ɪ z ˈɛ n t','re - pv ri ze nv tv','レープリゼント','レープリゼント');
 INSERT INTO "hand_mapping" VALUES ('REPRESENTATION','ɹ ˌɛ p ɹ ɪ z ɛ n t ˈeɪ ʃ ə n','re - pv ri ze nv te i sya nv','レープリゼンテイシャン','レープリゼンテイション');
 INSERT INTO "hand_mapping" VALUES ('REPRESENTATIONS','ɹ ˌɛ p ɹ ɪ z ɛ n t ˈeɪ ʃ ə n z','re - pv ri ze nv te i sya nv zv','レープリゼンテイシャンズ','レープリゼンテイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('REPRESENTATIVE','ɹ ˌɛ p ɹ ɪ z ˈɛ n t ə t ɪ v','re - pv ri ze nv ta ti bv','レープリゼンタティブ','レープリゼンタティブ');
-INSERT INTO "hand_mapping" VALUES ('REPRESENTATIVES','ɹ ˌɛ p ɹ ɪ z ˈɛ n t ə t ɪ v z','re - pv ri ze nv ta ti bv zv','レープリゼンタティブズ','レープリゼンタティブズ');
+INSERT INTO "hand_mapping" VALUES ('REPRESENTATIVE','ɹ ˌɛ p ɹ ɪ z ˈɛ n t ə t ɪ v','re - pv ri ze nv ta ti Vv','レープリゼンタティブ','レープリゼンタティブ');
+INSERT INTO "hand_mapping" VALUES ('REPRESENTATIVES','ɹ ˌɛ p ɹ ɪ z ˈɛ n t ə t ɪ v z','re - pv ri ze nv ta ti Vv zv','レープリゼンタティブズ','レープリゼンタティブズ');
 INSERT INTO "hand_mapping" VALUES ('REPRESENTED','ɹ ˌɛ p ɹ ɪ z ˈɛ n t ɪ d','re - pv ri ze nv ti dv','レープリゼンティド','レープリゼンティド');
 INSERT INTO "hand_mapping" VALUES ('REPRESENTING','ɹ ˌɛ p ɹ ɪ z ˈɛ n t ɪ ŋ','re - pv ri ze nv ti Nv','レープリゼンティン','レープリゼンティング');
 INSERT INTO "hand_mapping" VALUES ('REPRESENTS','ɹ ˌɛ p ɹ ɪ z ˈɛ n t s','re - pv ri ze nv tsv','レープリゼンツ','レープリゼンツ');
@@ -12377,7 +12377,7 @@ INSERT INTO "hand_mapping" VALUES ('REPRINTS(2)','ɹ iː p ɹ ˈɪ n t s','ri -
 INSERT INTO "hand_mapping" VALUES ('REPRODUCE','ɹ ˌiː p ɹ ə d j ˈuː s','ri - pv ra dyu - sv','リープラデュース','リープラデュース');
 INSERT INTO "hand_mapping" VALUES ('REPRODUCED','ɹ ˌiː p ɹ ə d j ˈuː s t','ri - pv ra dyu - sv tv','リープラデュースト','リープラデュースト');
 INSERT INTO "hand_mapping" VALUES ('REPRODUCTION','ɹ ˌiː p ɹ ə d ˈɐ k ʃ ə n','ri - pv ra da kv sya nv','リープラダクシャン','リープラダクション');
-INSERT INTO "hand_mapping" VALUES ('REPRODUCTIVE','ɹ ˌiː p ɹ ə d ˈɐ k t ɪ v','ri - pv ra da kv ti bv','リープラダクティブ','リープラダクティブ');
+INSERT INTO "hand_mapping" VALUES ('REPRODUCTIVE','ɹ ˌiː p ɹ ə d ˈɐ k t ɪ v','ri - pv ra da kv ti Vv','リープラダクティブ','リープラダクティブ');
 INSERT INTO "hand_mapping" VALUES ('REPUBLIC','ɹ ɪ p ˈɐ b l ɪ k','ri pa bv ri kv','リパブリク','リパブリク');
 INSERT INTO "hand_mapping" VALUES ('REPUBLICAN','ɹ ɪ p ˈɐ b l ɪ k ə n','ri pa bv ri ka nv','リパブリカン','リパブリカン');
 INSERT INTO "hand_mapping" VALUES ('REPUBLICANS','ɹ ɪ p ˈɐ b l ɪ k ə n z','ri pa bv ri ka nv zv','リパブリカンズ','リパブリカンズ');
@@ -12404,12 +12404,12 @@ INSERT INTO "hand_mapping" VALUES ('RESELLER','ɹ iː s ˈɛ l ə','ri - se ra',
 INSERT INTO "hand_mapping" VALUES ('RESEMBLE','ɹ ɪ z ˈɛ m b ə l','ri ze Nv ba rv','リゼンバル','リゼンバル');
 INSERT INTO "hand_mapping" VALUES ('RESENT','ɹ ɪ z ˈɛ n t','ri ze nv tv','リゼント','リゼント');
 INSERT INTO "hand_mapping" VALUES ('RESENTMENT','ɹ ɪ z ˈɛ n t m ə n t','ri ze nv tv ma nv tv','リゼントマント','リゼントメント');
-INSERT INTO "hand_mapping" VALUES ('RESERVATION','ɹ ˌɛ z ə v ˈeɪ ʃ ə n','re - za be i sya nv','レーザベイシャン','レーザベイション');
-INSERT INTO "hand_mapping" VALUES ('RESERVATIONS','ɹ ˌɛ z ə v ˈeɪ ʃ ə n z','re - za be i sya nv zv','レーザベイシャンズ','レーザベイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('RESERVE','ɹ ɪ z ˈɜː v','ri ze - bv','リゼーブ','リゼーブ');
-INSERT INTO "hand_mapping" VALUES ('RESERVED','ɹ ɪ z ˈɜː v d','ri ze - bv dv','リゼーブド','リゼーブド');
-INSERT INTO "hand_mapping" VALUES ('RESERVES','ɹ ɪ z ˈɜː v z','ri ze - bv zv','リゼーブズ','リゼーブズ');
-INSERT INTO "hand_mapping" VALUES ('RESERVOIR','ɹ ˈɛ z ə v w ˌɑː','re za bwa -','レザブワー','レザブワー');
+INSERT INTO "hand_mapping" VALUES ('RESERVATION','ɹ ˌɛ z ə v ˈeɪ ʃ ə n','re - za Ve i sya nv','レーザベイシャン','レーザベイション');
+INSERT INTO "hand_mapping" VALUES ('RESERVATIONS','ɹ ˌɛ z ə v ˈeɪ ʃ ə n z','re - za Ve i sya nv zv','レーザベイシャンズ','レーザベイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('RESERVE','ɹ ɪ z ˈɜː v','ri ze - Vv','リゼーブ','リゼーブ');
+INSERT INTO "hand_mapping" VALUES ('RESERVED','ɹ ɪ z ˈɜː v d','ri ze - Vv dv','リゼーブド','リゼーブド');
+INSERT INTO "hand_mapping" VALUES ('RESERVES','ɹ ɪ z ˈɜː v z','ri ze - Vv zv','リゼーブズ','リゼーブズ');
+INSERT INTO "hand_mapping" VALUES ('RESERVOIR','ɹ ˈɛ z ə v w ˌɑː','re za Vwa -','レザブワー','レザブワー');
 INSERT INTO "hand_mapping" VALUES ('RESET(1)','ɹ ˈiː s ɛ t','ri - se tv','リーセト','リーセト');
 INSERT INTO "hand_mapping" VALUES ('RESET(2)','ɹ ɪ s ˈɛ t','ri se tv','リセト','リセト');
 INSERT INTO "hand_mapping" VALUES ('RESIDE','ɹ ɪ z ˈaɪ d','ri za i dv','リザイド','リザイド');
@@ -12428,8 +12428,8 @@ INSERT INTO "hand_mapping" VALUES ('RESISTANCE','ɹ ɪ z ˈɪ s t ə n s','ri zi
 INSERT INTO "hand_mapping" VALUES ('RESISTANT','ɹ ɪ z ˈɪ s t ə n t','ri zi sv ta nv tv','リジスタント','リジスタント');
 INSERT INTO "hand_mapping" VALUES ('RESOLUTION','ɹ ˌɛ z ə l ˈuː ʃ ə n','re - za ru - sya nv','レーザルーシャン','レーザルーション');
 INSERT INTO "hand_mapping" VALUES ('RESOLUTIONS','ɹ ˌɛ z ə l ˈuː ʃ ə n z','re - za ru - sya nv zv','レーザルーシャンズ','レーザルーシャンズ');
-INSERT INTO "hand_mapping" VALUES ('RESOLVE','ɹ ɪ z ˈɒ l v','ri zo rv bv','リゾルブ','リゾルブ');
-INSERT INTO "hand_mapping" VALUES ('RESOLVED','ɹ ɪ z ˈɒ l v d','ri zo rv bv dv','リゾルブド','リゾルブド');
+INSERT INTO "hand_mapping" VALUES ('RESOLVE','ɹ ɪ z ˈɒ l v','ri zo rv Vv','リゾルブ','リゾルブ');
+INSERT INTO "hand_mapping" VALUES ('RESOLVED','ɹ ɪ z ˈɒ l v d','ri zo rv Vv dv','リゾルブド','リゾルブド');
 INSERT INTO "hand_mapping" VALUES ('RESORT','ɹ ɪ z ˈɔː t','ri zo - tv','リゾート','リゾート');
 INSERT INTO "hand_mapping" VALUES ('RESORTS','ɹ ɪ z ˈɔː t s','ri zo - tsv','リゾーツ','リゾーツ');
 INSERT INTO "hand_mapping" VALUES ('RESOURCE(1)','ɹ ɪ s ˈɔː s','ri so - sv','リソース','リソース');
@@ -12440,8 +12440,8 @@ INSERT INTO "hand_mapping" VALUES ('RESOURCES(2)','ɹ ɪ z ˈɔː s ɪ z','ri zo
 INSERT INTO "hand_mapping" VALUES ('RESPECT','ɹ ɪ s p ˈɛ k t','ri sv pe kv tv','リスペクト','リスペクト');
 INSERT INTO "hand_mapping" VALUES ('RESPECTABLE','ɹ ɪ s p ˈɛ k t ə b ə l','ri sv pe kv ta ba rv','リスペクタバル','リスペクタバル');
 INSERT INTO "hand_mapping" VALUES ('RESPECTED','ɹ ɪ s p ˈɛ k t ɪ d','ri sv pe kv ti dv','リスペクティド','リスペクティド');
-INSERT INTO "hand_mapping" VALUES ('RESPECTIVE','ɹ ɪ s p ˈɛ k t ɪ v','ri sv pe kv ti bv','リスペクティブ','リスペクティブ');
-INSERT INTO "hand_mapping" VALUES ('RESPECTIVELY','ɹ ɪ s p ˈɛ k t ɪ v l i','ri sv pe kv ti bv ri -','リスペクティブリー','リスペクティブリー');
+INSERT INTO "hand_mapping" VALUES ('RESPECTIVE','ɹ ɪ s p ˈɛ k t ɪ v','ri sv pe kv ti Vv','リスペクティブ','リスペクティブ');
+INSERT INTO "hand_mapping" VALUES ('RESPECTIVELY','ɹ ɪ s p ˈɛ k t ɪ v l i','ri sv pe kv ti Vv ri -','リスペクティブリー','リスペクティブリー');
 INSERT INTO "hand_mapping" VALUES ('RESPECTS','ɹ ɪ s p ˈɛ k t s','ri sv pe kv tsv','リスペクツ','リスペクツ');
 INSERT INTO "hand_mapping" VALUES ('RESPIRATORY(1)','ɹ ɪ s p ˈɪ ɹ ə t ə ɹ i','ri sv pi ra ta ri -','リスピラタリー','リスピラタリー');
 INSERT INTO "hand_mapping" VALUES ('RESPIRATORY(2)','ɹ ˈɛ s p ə ɹ ə t ə ɹ i','re sv pa ra ta ri -','レスパラタリー','レスパラタリー');
@@ -12472,7 +12472,7 @@ INSERT INTO "hand_mapping" VALUES ('RESTRICT','ɹ ɪ s t ɹ ˈɪ k t','ri sv tv
 INSERT INTO "hand_mapping" VALUES ('RESTRICTED','ɹ ɪ s t ɹ ˈɪ k t ɪ d','ri sv tv ri kv ti dv','リストリクティド','リストリクティド');
 INSERT INTO "hand_mapping" VALUES ('RESTRICTION','ɹ ɪ s t ɹ ˈɪ k ʃ ə n','ri sv tv ri kv sya nv','リストリクシャン','リストリクション');
 INSERT INTO "hand_mapping" VALUES ('RESTRICTIONS','ɹ ɪ s t ɹ ˈɪ k ʃ ə n z','ri sv tv ri kv sya nv zv','リストリクシャンズ','リストリクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('RESTRICTIVE','ɹ ɪ s t ɹ ˈɪ k t ɪ v','ri sv tv ri kv ti bv','リストリクティブ','リストリクティブ');
+INSERT INTO "hand_mapping" VALUES ('RESTRICTIVE','ɹ ɪ s t ɹ ˈɪ k t ɪ v','ri sv tv ri kv ti Vv','リストリクティブ','リストリクティブ');
 INSERT INTO "hand_mapping" VALUES ('RESTRUCTURING','ɹ ɪ s t ɹ ˈɐ k tʃ ə ɹ ɪ ŋ','ri sv tv ra kv tya ri Nv','リストラクチャリン','リストラクチャリング');
 INSERT INTO "hand_mapping" VALUES ('RESULT','ɹ ɪ z ˈɐ l t','ri za rv tv','リザルト','リザルト');
 INSERT INTO "hand_mapping" VALUES ('RESULTED','ɹ ɪ z ˈɐ l t ɪ d','ri za rv ti dv','リザルティド','リザルティド');
@@ -12494,9 +12494,9 @@ INSERT INTO "hand_mapping" VALUES ('RETIRE','ɹ ɪ t ˈaɪ ə','ri ta i a','リ
 INSERT INTO "hand_mapping" VALUES ('RETIRED','ɹ ɪ t ˈaɪ ə d','ri ta i a dv','リタイアド','リタイアド');
 INSERT INTO "hand_mapping" VALUES ('RETIREMENT','ɹ ɪ t ˈaɪ ə m ə n t','ri ta i a ma nv tv','リタイアマント','リタイアメント');
 INSERT INTO "hand_mapping" VALUES ('RETREAT','ɹ ɪ t ɹ ˈiː t','ri tv ri - tv','リトリート','リトリート');
-INSERT INTO "hand_mapping" VALUES ('RETRIEVAL','ɹ ɪ t ɹ ˈiː v ə l','ri tv ri - ba rv','リトリーバル','リトリーバル');
-INSERT INTO "hand_mapping" VALUES ('RETRIEVE','ɹ ɪ t ɹ ˈiː v','ri tv ri - bv','リトリーブ','リトリーブ');
-INSERT INTO "hand_mapping" VALUES ('RETRIEVED','ɹ ɪ t ɹ ˈiː v d','ri tv ri - bv dv','リトリーブド','リトリーブド');
+INSERT INTO "hand_mapping" VALUES ('RETRIEVAL','ɹ ɪ t ɹ ˈiː v ə l','ri tv ri - Va rv','リトリーバル','リトリーバル');
+INSERT INTO "hand_mapping" VALUES ('RETRIEVE','ɹ ɪ t ɹ ˈiː v','ri tv ri - Vv','リトリーブ','リトリーブ');
+INSERT INTO "hand_mapping" VALUES ('RETRIEVED','ɹ ɪ t ɹ ˈiː v d','ri tv ri - Vv dv','リトリーブド','リトリーブド');
 INSERT INTO "hand_mapping" VALUES ('RETRO','ɹ ˈɛ t ɹ əʊ','re tv ro','レトロ','レトロ');
 INSERT INTO "hand_mapping" VALUES ('RETROFIT','ɹ ˈɛ t ɹ əʊ f ˌɪ t','re tv ro fi - tv','レトロフィート','レトロフィート');
 INSERT INTO "hand_mapping" VALUES ('RETROFITTED','ɹ ˈɛ t ɹ əʊ f ˌɪ t ɪ d','re tv ro fi - ti dv','レトロフィーティド','レトロフィーティド');
@@ -12506,41 +12506,41 @@ INSERT INTO "hand_mapping" VALUES ('RETURNING','ɹ ɪ t ˈɜː n ɪ ŋ','ri te -
 INSERT INTO "hand_mapping" VALUES ('RETURNS','ɹ ɪ t ˈɜː n z','ri te - nv zv','リテーンズ','リテーンズ');
 INSERT INTO "hand_mapping" VALUES ('REUNION','ɹ iː j ˈuː n j ə n','ri - yu - nya nv','リーユーニャン','リーユーニャン');
 INSERT INTO "hand_mapping" VALUES ('REUTERS','ɹ ˈɔɪ t ə z','ro i ta zv','ロイタズ','ロイタズ');
-INSERT INTO "hand_mapping" VALUES ('REV','ɹ ˈɛ v','re bv','レブ','レブ');
-INSERT INTO "hand_mapping" VALUES ('REVEAL','ɹ ɪ v ˈiː l','ri bi - rv','リビール','リビール');
-INSERT INTO "hand_mapping" VALUES ('REVEALED','ɹ ɪ v ˈiː l d','ri bi - rv dv','リビールド','リビールド');
-INSERT INTO "hand_mapping" VALUES ('REVEALING','ɹ ɪ v ˈiː l ɪ ŋ','ri bi - ri Nv','リビーリン','リビーリング');
-INSERT INTO "hand_mapping" VALUES ('REVEALS','ɹ ɪ v ˈiː l z','ri bi - rv zv','リビールズ','リビールズ');
-INSERT INTO "hand_mapping" VALUES ('REVEL','ɹ ˈɛ v ə l','re ba rv','レバル','レバル');
-INSERT INTO "hand_mapping" VALUES ('REVELATION','ɹ ˌɛ v ə l ˈeɪ ʃ ə n','re - ba re i sya nv','レーバレイシャン','レーバレイション');
-INSERT INTO "hand_mapping" VALUES ('REVENGE','ɹ ɪ v ˈɛ n dʒ','ri be nv jyv','リベンジュ','リベンジュ');
-INSERT INTO "hand_mapping" VALUES ('REVENUE','ɹ ˈɛ v ə n j ˌuː','re ba nyu -','レバニュー','レバニュー');
-INSERT INTO "hand_mapping" VALUES ('REVENUES','ɹ ˈɛ v ə n j ˌuː z','re ba nyu - zv','レバニューズ','レバニューズ');
-INSERT INTO "hand_mapping" VALUES ('REVEREND(1)','ɹ ˈɛ v ɹ ə n d','re bv ra nv dv','レブランド','レブランド');
-INSERT INTO "hand_mapping" VALUES ('REVEREND(2)','ɹ ˈɛ v ə ɹ ə n d','re ba ra nv dv','レバランド','レバランド');
-INSERT INTO "hand_mapping" VALUES ('REVERSE','ɹ ɪ v ˈɜː s','ri be - sv','リベース','リベース');
-INSERT INTO "hand_mapping" VALUES ('REVERT','ɹ ɪ v ˈɜː t','ri be - tv','リベート','リベート');
-INSERT INTO "hand_mapping" VALUES ('REVIEW','ɹ ɪ v j ˈuː','ri byu -','リビュー','リビュー');
-INSERT INTO "hand_mapping" VALUES ('REVIEWED','ɹ ɪ v j ˈuː d','ri byu - dv','リビュード','リビュード');
-INSERT INTO "hand_mapping" VALUES ('REVIEWER','ɹ ɪ v j ˈuː ə','ri byu - a','リビューア','リビューア');
-INSERT INTO "hand_mapping" VALUES ('REVIEWING','ɹ ɪ v j ˈuː ɪ ŋ','ri byu - i Nv','リビューイン','リビューイング');
-INSERT INTO "hand_mapping" VALUES ('REVIEWS','ɹ ɪ v j ˈuː z','ri byu - zv','リビューズ','リビューズ');
-INSERT INTO "hand_mapping" VALUES ('REVISE','ɹ ɪ v ˈaɪ z','ri ba i zv','リバイズ','リバイズ');
-INSERT INTO "hand_mapping" VALUES ('REVISED','ɹ ɪ v ˈaɪ z d','ri ba i zv dv','リバイズド','リバイズド');
-INSERT INTO "hand_mapping" VALUES ('REVISION','ɹ ɪ v ˈɪ ʒ ə n','ri bi jya nv','リビジャン','リビジョン');
-INSERT INTO "hand_mapping" VALUES ('REVISIONS','ɹ ɪ v ˈɪ ʒ ə n z','ri bi jya nv zv','リビジャンズ','リビジャンズ');
-INSERT INTO "hand_mapping" VALUES ('REVIVAL','ɹ ɪ v ˈaɪ v ə l','ri ba i ba rv','リバイバル','リバイバル');
-INSERT INTO "hand_mapping" VALUES ('REVIVE','ɹ ɪ v ˈaɪ v','ri ba i bv','リバイブ','リバイブ');
-INSERT INTO "hand_mapping" VALUES ('REVOLTING','ɹ ɪ v ˈəʊ l t ɪ ŋ','ri bo - rv ti Nv','リボールティン','リボールティング');
-INSERT INTO "hand_mapping" VALUES ('REVOLUTION','ɹ ˌɛ v ə l ˈuː ʃ ə n','re - ba ru - sya nv','レーバルーシャン','レーバルーション');
-INSERT INTO "hand_mapping" VALUES ('REVOLUTIONARY','ɹ ˌɛ v ə l ˈuː ʃ ə n ə ɹ i','re - ba ru - sya na ri -','レーバルーシャナリー','レーバルーシャナリー');
-INSERT INTO "hand_mapping" VALUES ('REVOLVE','ɹ ɪ v ˈɒ l v','ri bo rv bv','リボルブ','リボルブ');
+INSERT INTO "hand_mapping" VALUES ('REV','ɹ ˈɛ v','re Vv','レブ','レブ');
+INSERT INTO "hand_mapping" VALUES ('REVEAL','ɹ ɪ v ˈiː l','ri Vi - rv','リビール','リビール');
+INSERT INTO "hand_mapping" VALUES ('REVEALED','ɹ ɪ v ˈiː l d','ri Vi - rv dv','リビールド','リビールド');
+INSERT INTO "hand_mapping" VALUES ('REVEALING','ɹ ɪ v ˈiː l ɪ ŋ','ri Vi - ri Nv','リビーリン','リビーリング');
+INSERT INTO "hand_mapping" VALUES ('REVEALS','ɹ ɪ v ˈiː l z','ri Vi - rv zv','リビールズ','リビールズ');
+INSERT INTO "hand_mapping" VALUES ('REVEL','ɹ ˈɛ v ə l','re Va rv','レバル','レバル');
+INSERT INTO "hand_mapping" VALUES ('REVELATION','ɹ ˌɛ v ə l ˈeɪ ʃ ə n','re - Va re i sya nv','レーバレイシャン','レーバレイション');
+INSERT INTO "hand_mapping" VALUES ('REVENGE','ɹ ɪ v ˈɛ n dʒ','ri Ve nv jyv','リベンジュ','リベンジュ');
+INSERT INTO "hand_mapping" VALUES ('REVENUE','ɹ ˈɛ v ə n j ˌuː','re Va nyu -','レバニュー','レバニュー');
+INSERT INTO "hand_mapping" VALUES ('REVENUES','ɹ ˈɛ v ə n j ˌuː z','re Va nyu - zv','レバニューズ','レバニューズ');
+INSERT INTO "hand_mapping" VALUES ('REVEREND(1)','ɹ ˈɛ v ɹ ə n d','re Vv ra nv dv','レブランド','レブランド');
+INSERT INTO "hand_mapping" VALUES ('REVEREND(2)','ɹ ˈɛ v ə ɹ ə n d','re Va ra nv dv','レバランド','レバランド');
+INSERT INTO "hand_mapping" VALUES ('REVERSE','ɹ ɪ v ˈɜː s','ri Ve - sv','リベース','リベース');
+INSERT INTO "hand_mapping" VALUES ('REVERT','ɹ ɪ v ˈɜː t','ri Ve - tv','リベート','リベート');
+INSERT INTO "hand_mapping" VALUES ('REVIEW','ɹ ɪ v j ˈuː','ri Vyu -','リビュー','リビュー');
+INSERT INTO "hand_mapping" VALUES ('REVIEWED','ɹ ɪ v j ˈuː d','ri Vyu - dv','リビュード','リビュード');
+INSERT INTO "hand_mapping" VALUES ('REVIEWER','ɹ ɪ v j ˈuː ə','ri Vyu - a','リビューア','リビューア');
+INSERT INTO "hand_mapping" VALUES ('REVIEWING','ɹ ɪ v j ˈuː ɪ ŋ','ri Vyu - i Nv','リビューイン','リビューイング');
+INSERT INTO "hand_mapping" VALUES ('REVIEWS','ɹ ɪ v j ˈuː z','ri Vyu - zv','リビューズ','リビューズ');
+INSERT INTO "hand_mapping" VALUES ('REVISE','ɹ ɪ v ˈaɪ z','ri Va i zv','リバイズ','リバイズ');
+INSERT INTO "hand_mapping" VALUES ('REVISED','ɹ ɪ v ˈaɪ z d','ri Va i zv dv','リバイズド','リバイズド');
+INSERT INTO "hand_mapping" VALUES ('REVISION','ɹ ɪ v ˈɪ ʒ ə n','ri Vi jya nv','リビジャン','リビジョン');
+INSERT INTO "hand_mapping" VALUES ('REVISIONS','ɹ ɪ v ˈɪ ʒ ə n z','ri Vi jya nv zv','リビジャンズ','リビジャンズ');
+INSERT INTO "hand_mapping" VALUES ('REVIVAL','ɹ ɪ v ˈaɪ v ə l','ri Va i Va rv','リバイバル','リバイバル');
+INSERT INTO "hand_mapping" VALUES ('REVIVE','ɹ ɪ v ˈaɪ v','ri Va i Vv','リバイブ','リバイブ');
+INSERT INTO "hand_mapping" VALUES ('REVOLTING','ɹ ɪ v ˈəʊ l t ɪ ŋ','ri Vo - rv ti Nv','リボールティン','リボールティング');
+INSERT INTO "hand_mapping" VALUES ('REVOLUTION','ɹ ˌɛ v ə l ˈuː ʃ ə n','re - Va ru - sya nv','レーバルーシャン','レーバルーション');
+INSERT INTO "hand_mapping" VALUES ('REVOLUTIONARY','ɹ ˌɛ v ə l ˈuː ʃ ə n ə ɹ i','re - Va ru - sya na ri -','レーバルーシャナリー','レーバルーシャナリー');
+INSERT INTO "hand_mapping" VALUES ('REVOLVE','ɹ ɪ v ˈɒ l v','ri Vo rv Vv','リボルブ','リボルブ');
 INSERT INTO "hand_mapping" VALUES ('REWARD','ɹ ɪ w ˈɔː d','ri wo - dv','リウォード','リウォード');
 INSERT INTO "hand_mapping" VALUES ('REWARDS','ɹ ɪ w ˈɔː d z','ri wo - zv','リウォーズ','リウォーズ');
 INSERT INTO "hand_mapping" VALUES ('REWRITE(1)','ɹ iː ɹ ˈaɪ t','ri - ra i tv','リーライト','リーライト');
 INSERT INTO "hand_mapping" VALUES ('REWRITE(2)','ɹ ˈiː ɹ ˌaɪ t','ri - ra i tv','リーライト','リーライト');
-INSERT INTO "hand_mapping" VALUES ('REYKJAVIK(1)','ɹ ˈeɪ k j ə v ˌiː k','re i kya bi - kv','レイキャビーク','レイキャビーク');
-INSERT INTO "hand_mapping" VALUES ('REYKJAVIK(2)','ɹ ˈeɪ k j ə v ˌɪ k','re i kya bi - kv','レイキャビーク','レイキャビーク');
+INSERT INTO "hand_mapping" VALUES ('REYKJAVIK(1)','ɹ ˈeɪ k j ə v ˌiː k','re i kya Vi - kv','レイキャビーク','レイキャビーク');
+INSERT INTO "hand_mapping" VALUES ('REYKJAVIK(2)','ɹ ˈeɪ k j ə v ˌɪ k','re i kya Vi - kv','レイキャビーク','レイキャビーク');
 INSERT INTO "hand_mapping" VALUES ('RHETORIC','ɹ ˈɛ t ə ɹ ɪ k','re ta ri kv','レタリク','レタリク');
 INSERT INTO "hand_mapping" VALUES ('RHINO','ɹ ˈaɪ n əʊ','ra i no','ライノ','ライノ');
 INSERT INTO "hand_mapping" VALUES ('RHINOCEROS','ɹ aɪ n ˈɒ s ə ɹ ə s','ra i no x sa ra sv','ライノッサラス','ライノッサラス');
@@ -12607,13 +12607,13 @@ INSERT INTO "hand_mapping" VALUES ('RITA','ɹ ˈiː t ə','ri - ta','リータ',
 INSERT INTO "hand_mapping" VALUES ('RITE','ɹ ˈaɪ t','ra i tv','ライト','ライト');
 INSERT INTO "hand_mapping" VALUES ('RITUAL','ɹ ˈɪ tʃ ʊə l','ri tyu a rv','リチュアル','リチュアル');
 INSERT INTO "hand_mapping" VALUES ('RITZ','ɹ ˈɪ t s','ri tsv','リツ','リツ');
-INSERT INTO "hand_mapping" VALUES ('RIVAL','ɹ ˈaɪ v ə l','ra i ba rv','ライバル','ライバル');
-INSERT INTO "hand_mapping" VALUES ('RIVALS','ɹ ˈaɪ v ə l z','ra i ba rv zv','ライバルズ','ライバルズ');
-INSERT INTO "hand_mapping" VALUES ('RIVER','ɹ ˈɪ v ə','ri ba','リバ','リバ');
-INSERT INTO "hand_mapping" VALUES ('RIVERS','ɹ ˈɪ v ə z','ri ba zv','リバズ','リバズ');
-INSERT INTO "hand_mapping" VALUES ('RIVERSIDE','ɹ ˈɪ v ə s ˌaɪ d','ri ba sa i dv','リバサイド','リバサイド');
-INSERT INTO "hand_mapping" VALUES ('RIVET','ɹ ˈɪ v ɪ t','ri bi tv','リビト','リビト');
-INSERT INTO "hand_mapping" VALUES ('RIVETING','ɹ ˈɪ v ɪ t ɪ ŋ','ri bi ti Nv','リビティン','リビティング');
+INSERT INTO "hand_mapping" VALUES ('RIVAL','ɹ ˈaɪ v ə l','ra i Va rv','ライバル','ライバル');
+INSERT INTO "hand_mapping" VALUES ('RIVALS','ɹ ˈaɪ v ə l z','ra i Va rv zv','ライバルズ','ライバルズ');
+INSERT INTO "hand_mapping" VALUES ('RIVER','ɹ ˈɪ v ə','ri Va','リバ','リバ');
+INSERT INTO "hand_mapping" VALUES ('RIVERS','ɹ ˈɪ v ə z','ri Va zv','リバズ','リバズ');
+INSERT INTO "hand_mapping" VALUES ('RIVERSIDE','ɹ ˈɪ v ə s ˌaɪ d','ri Va sa i dv','リバサイド','リバサイド');
+INSERT INTO "hand_mapping" VALUES ('RIVET','ɹ ˈɪ v ɪ t','ri Vi tv','リビト','リビト');
+INSERT INTO "hand_mapping" VALUES ('RIVETING','ɹ ˈɪ v ɪ t ɪ ŋ','ri Vi ti Nv','リビティン','リビティング');
 INSERT INTO "hand_mapping" VALUES ('ROACH','ɹ ˈəʊ tʃ','ro - tyv','ローチュ','ローチュ');
 INSERT INTO "hand_mapping" VALUES ('ROAD','ɹ ˈəʊ d','ro - dv','ロード','ロード');
 INSERT INTO "hand_mapping" VALUES ('ROADS','ɹ ˈəʊ d z','ro - zv','ローズ','ローズ');
@@ -12711,9 +12711,9 @@ INSERT INTO "hand_mapping" VALUES ('ROUTINE','ɹ uː t ˈiː n','ru - ti - nv','
 INSERT INTO "hand_mapping" VALUES ('ROUTINES','ɹ uː t ˈiː n z','ru - ti - nv zv','ルーティーンズ','ルーティーンズ');
 INSERT INTO "hand_mapping" VALUES ('ROUTING(1)','ɹ ˈuː t ɪ ŋ','ru - ti Nv','ルーティン','ルーティング');
 INSERT INTO "hand_mapping" VALUES ('ROUTING(2)','ɹ ˈaʊ t ɪ ŋ','ra u ti Nv','ラウティン','ラウティング');
-INSERT INTO "hand_mapping" VALUES ('ROVE','ɹ ˈəʊ v','ro - bv','ローブ','ローブ');
-INSERT INTO "hand_mapping" VALUES ('ROVER','ɹ ˈəʊ v ə','ro - ba','ローバ','ローバ');
-INSERT INTO "hand_mapping" VALUES ('ROVING','ɹ ˈəʊ v ɪ ŋ','ro - bi Nv','ロービン','ロービング');
+INSERT INTO "hand_mapping" VALUES ('ROVE','ɹ ˈəʊ v','ro - Vv','ローブ','ローブ');
+INSERT INTO "hand_mapping" VALUES ('ROVER','ɹ ˈəʊ v ə','ro - Va','ローバ','ローバ');
+INSERT INTO "hand_mapping" VALUES ('ROVING','ɹ ˈəʊ v ɪ ŋ','ro - Vi Nv','ロービン','ロービング');
 INSERT INTO "hand_mapping" VALUES ('ROW(1)','ɹ ˈəʊ','ro -','ロー','ロー');
 INSERT INTO "hand_mapping" VALUES ('ROW(2)','ɹ ˈaʊ','ra u','ラウ','ラウ');
 INSERT INTO "hand_mapping" VALUES ('ROWDY','ɹ ˈaʊ d i','ra u di -','ラウディー','ラウディー');
@@ -12820,9 +12820,9 @@ INSERT INTO "hand_mapping" VALUES ('SALT(1)','s ˈɒ l t','so rv tv','ソルト'
 INSERT INTO "hand_mapping" VALUES ('SALT(2)','s ˈɔː l t','so - rv tv','ソールト','ソールト');
 INSERT INTO "hand_mapping" VALUES ('SALTY(1)','s ˈɒ l t i','so rv ti -','ソルティー','ソルティー');
 INSERT INTO "hand_mapping" VALUES ('SALTY(2)','s ˈɔː l t i','so - rv ti -','ソールティー','ソールティー');
-INSERT INTO "hand_mapping" VALUES ('SALVADOR','s ˈæ l v ə d ˌɔː','sa rv ba do -','サルバドー','サルバドー');
-INSERT INTO "hand_mapping" VALUES ('SALVAGE','s ˈæ l v ɪ dʒ','sa rv bi jyv','サルビジュ','サルビジュ');
-INSERT INTO "hand_mapping" VALUES ('SALVATION','s ə l v ˈeɪ ʃ ə n','sa rv be i sya nv','サルベイシャン','サルベイション');
+INSERT INTO "hand_mapping" VALUES ('SALVADOR','s ˈæ l v ə d ˌɔː','sa rv Va do -','サルバドー','サルバドー');
+INSERT INTO "hand_mapping" VALUES ('SALVAGE','s ˈæ l v ɪ dʒ','sa rv Vi jyv','サルビジュ','サルビジュ');
+INSERT INTO "hand_mapping" VALUES ('SALVATION','s ə l v ˈeɪ ʃ ə n','sa rv Ve i sya nv','サルベイシャン','サルベイション');
 INSERT INTO "hand_mapping" VALUES ('SAM','s ˈæ m','sa mv','サム','サム');
 INSERT INTO "hand_mapping" VALUES ('SAMANTHA','s ə m ˈæ n θ ə','sa ma nv sa','サマンサ','サマンサ');
 INSERT INTO "hand_mapping" VALUES ('SAMBA','s ˈæ m b ə','sa Nv ba','サンバ','サンバ');
@@ -12860,7 +12860,7 @@ INSERT INTO "hand_mapping" VALUES ('SAP','s ˈæ p','sa x pv','サップ','サ
 INSERT INTO "hand_mapping" VALUES ('SAPPHIRE','s ˈæ f aɪ ə','sa fa i a','サファイア','サファイア');
 INSERT INTO "hand_mapping" VALUES ('SARA','s ˈɛə ɹ ə','se a ra','セアラ','セアラ');
 INSERT INTO "hand_mapping" VALUES ('SARAH','s ˈɛə ɹ ə','se a ra','セアラ','セアラ');
-INSERT INTO "hand_mapping" VALUES ('SARAJEVO','s ˌæ ɹ ə j ˈeɪ v əʊ','sa ra ye i bo','サライェイボ','サライェイボ');
+INSERT INTO "hand_mapping" VALUES ('SARAJEVO','s ˌæ ɹ ə j ˈeɪ v əʊ','sa ra ye i Vo','サライェイボ','サライェイボ');
 INSERT INTO "hand_mapping" VALUES ('SARCASM','s ˈɑː k æ z ə m','sa - ka za mv','サーカザム','サーカザム');
 INSERT INTO "hand_mapping" VALUES ('SARCASTIC','s ɑː k ˈæ s t ˈɪ k','sa ka x sv ti kv','サカッスティク','サカッスティク');
 INSERT INTO "hand_mapping" VALUES ('SASH','s ˈæ ʃ','sa x syv','サッシュ','サッシュ');
@@ -12887,14 +12887,14 @@ INSERT INTO "hand_mapping" VALUES ('SAUDI(2)','s ˈɔː d i','so - di -','ソー
 INSERT INTO "hand_mapping" VALUES ('SAUNA','s ˈɔː n ə','so - na','ソーナ','ソーナ');
 INSERT INTO "hand_mapping" VALUES ('SAUSAGE','s ˈɒ s ɪ dʒ','so x si jyv','ソッシジュ','ソッシジュ');
 INSERT INTO "hand_mapping" VALUES ('SAUSAGES','s ˈɒ s ɪ dʒ ɪ z','so x si jyi zv','ソッシジィズ','ソッシジィズ');
-INSERT INTO "hand_mapping" VALUES ('SAVAGE','s ˈæ v ɪ dʒ','sa bi jyv','サビジュ','サビジュ');
-INSERT INTO "hand_mapping" VALUES ('SAVANNAH','s ə v ˈæ n ə','sa ba na','サバナ','サバナ');
-INSERT INTO "hand_mapping" VALUES ('SAVE','s ˈeɪ v','se i bv','セイブ','セイブ');
-INSERT INTO "hand_mapping" VALUES ('SAVED','s ˈeɪ v d','se i bv dv','セイブド','セイブド');
-INSERT INTO "hand_mapping" VALUES ('SAVER','s ˈeɪ v ə','se i ba','セイバ','セイバ');
-INSERT INTO "hand_mapping" VALUES ('SAVES','s ˈeɪ v z','se i bv zv','セイブズ','セイブズ');
-INSERT INTO "hand_mapping" VALUES ('SAVING','s ˈeɪ v ɪ ŋ','se i bi Nv','セイビン','セイビング');
-INSERT INTO "hand_mapping" VALUES ('SAVINGS','s ˈeɪ v ɪ ŋ z','se i bi Nv zv','セイビンズ','セイビンズ');
+INSERT INTO "hand_mapping" VALUES ('SAVAGE','s ˈæ v ɪ dʒ','sa Vi jyv','サビジュ','サビジュ');
+INSERT INTO "hand_mapping" VALUES ('SAVANNAH','s ə v ˈæ n ə','sa Va na','サバナ','サバナ');
+INSERT INTO "hand_mapping" VALUES ('SAVE','s ˈeɪ v','se i Vv','セイブ','セイブ');
+INSERT INTO "hand_mapping" VALUES ('SAVED','s ˈeɪ v d','se i Vv dv','セイブド','セイブド');
+INSERT INTO "hand_mapping" VALUES ('SAVER','s ˈeɪ v ə','se i Va','セイバ','セイバ');
+INSERT INTO "hand_mapping" VALUES ('SAVES','s ˈeɪ v z','se i Vv zv','セイブズ','セイブズ');
+INSERT INTO "hand_mapping" VALUES ('SAVING','s ˈeɪ v ɪ ŋ','se i Vi Nv','セイビン','セイビング');
+INSERT INTO "hand_mapping" VALUES ('SAVINGS','s ˈeɪ v ɪ ŋ z','se i Vi Nv zv','セイビンズ','セイビンズ');
 INSERT INTO "hand_mapping" VALUES ('SAW','s ˈɔː','so -','ソー','ソー');
 INSERT INTO "hand_mapping" VALUES ('SAWED','s ˈɔː d','so - dv','ソード','ソード');
 INSERT INTO "hand_mapping" VALUES ('SAWN','s ˈɔː n','so - nv','ソーン','ソーン');
@@ -12993,12 +12993,12 @@ INSERT INTO "hand_mapping" VALUES ('SCREECHING','s k ɹ ˈiː tʃ ɪ ŋ','sv kv
 INSERT INTO "hand_mapping" VALUES ('SCREEN','s k ɹ ˈiː n','sv kv ri - nv','スクリーン','スクリーン');
 INSERT INTO "hand_mapping" VALUES ('SCREENING','s k ɹ ˈiː n ɪ ŋ','sv kv ri - ni Nv','スクリーニン','スクリーニング');
 INSERT INTO "hand_mapping" VALUES ('SCREENS','s k ɹ ˈiː n z','sv kv ri - nv zv','スクリーンズ','スクリーンズ');
-INSERT INTO "hand_mapping" VALUES ('SCREENSAVER','s k ɹ ˈiː n s ˌeɪ v ə','sv kv ri - nv se i ba','スクリーンセイバ','スクリーンセイバ');
-INSERT INTO "hand_mapping" VALUES ('SCREENSAVERS','s k ɹ ˈiː n s ˌeɪ v ə z','sv kv ri - nv se i ba zv','スクリーンセイバズ','スクリーンセイバズ');
+INSERT INTO "hand_mapping" VALUES ('SCREENSAVER','s k ɹ ˈiː n s ˌeɪ v ə','sv kv ri - nv se i Va','スクリーンセイバ','スクリーンセイバ');
+INSERT INTO "hand_mapping" VALUES ('SCREENSAVERS','s k ɹ ˈiː n s ˌeɪ v ə z','sv kv ri - nv se i Va zv','スクリーンセイバズ','スクリーンセイバズ');
 INSERT INTO "hand_mapping" VALUES ('SCREENSHOT','s k ɹ ˈiː n ʃ ˌɒ t','sv kv ri - nv syo - tv','スクリーンショート','スクリーンショート');
 INSERT INTO "hand_mapping" VALUES ('SCREENSHOTS','s k ɹ ˈiː n ʃ ˌɒ t s','sv kv ri - nv syo - tsv','スクリーンショーツ','スクリーンショーツ');
 INSERT INTO "hand_mapping" VALUES ('SCREW','s k ɹ ˈuː','sv kv ru -','スクルー','スクルー');
-INSERT INTO "hand_mapping" VALUES ('SCREWDRIVER','s k ɹ ˈuː d ɹ ˌaɪ v ə','sv kv ru - dv ra i ba','スクルードライバ','スクルードライバ');
+INSERT INTO "hand_mapping" VALUES ('SCREWDRIVER','s k ɹ ˈuː d ɹ ˌaɪ v ə','sv kv ru - dv ra i Va','スクルードライバ','スクルードライバ');
 INSERT INTO "hand_mapping" VALUES ('SCREWED','s k ɹ ˈuː d','sv kv ru - dv','スクルード','スクルード');
 INSERT INTO "hand_mapping" VALUES ('SCREWING','s k ɹ ˈuː ɪ ŋ','sv kv ru - i Nv','スクルーイン','スクルーイング');
 INSERT INTO "hand_mapping" VALUES ('SCREWS','s k ɹ ˈuː z','sv kv ru - zv','スクルーズ','スクルーズ');
@@ -13097,7 +13097,7 @@ INSERT INTO "hand_mapping" VALUES ('SELECTED','s ɪ l ˈɛ k t ɪ d','si re kv t
 INSERT INTO "hand_mapping" VALUES ('SELECTING','s ɪ l ˈɛ k t ɪ ŋ','si re kv ti Nv','シレクティン','シレクティング');
 INSERT INTO "hand_mapping" VALUES ('SELECTION','s ɪ l ˈɛ k ʃ ə n','si re kv sya nv','シレクシャン','シレクション');
 INSERT INTO "hand_mapping" VALUES ('SELECTIONS','s ɪ l ˈɛ k ʃ ə n z','si re kv sya nv zv','シレクシャンズ','シレクシャンズ');
-INSERT INTO "hand_mapping" VALUES ('SELECTIVE','s ɪ l ˈɛ k t ɪ v','si re kv ti bv','シレクティブ','シレクティブ');
+INSERT INTO "hand_mapping" VALUES ('SELECTIVE','s ɪ l ˈɛ k t ɪ v','si re kv ti Vv','シレクティブ','シレクティブ');
 INSERT INTO "hand_mapping" VALUES ('SELF','s ˈɛ l f','se rv fv','セルフ','セルフ');
 INSERT INTO "hand_mapping" VALUES ('SELFISH','s ˈɛ l f ɪ ʃ','se rv fi syv','セルフィシュ','セルフィシュ');
 INSERT INTO "hand_mapping" VALUES ('SELL','s ˈɛ l','se rv','セル','セル');
@@ -13105,7 +13105,7 @@ INSERT INTO "hand_mapping" VALUES ('SELLER','s ˈɛ l ə','se ra','セラ','セ
 INSERT INTO "hand_mapping" VALUES ('SELLERS','s ˈɛ l ə z','se ra zv','セラズ','セラズ');
 INSERT INTO "hand_mapping" VALUES ('SELLING','s ˈɛ l ɪ ŋ','se ri Nv','セリン','セリング');
 INSERT INTO "hand_mapping" VALUES ('SELLS','s ˈɛ l z','se rv zv','セルズ','セルズ');
-INSERT INTO "hand_mapping" VALUES ('SELVES','s ˈɛ l v z','se rv bv zv','セルブズ','セルブズ');
+INSERT INTO "hand_mapping" VALUES ('SELVES','s ˈɛ l v z','se rv Vv zv','セルブズ','セルブズ');
 INSERT INTO "hand_mapping" VALUES ('SEMANTIC','s ɪ m ˈæ n t ɪ k','si ma nv ti kv','シマンティク','シマンティク');
 INSERT INTO "hand_mapping" VALUES ('SEMEN','s ˈiː m ə n','si - ma nv','シーマン','シーマン');
 INSERT INTO "hand_mapping" VALUES ('SEMESTER','s ə m ˈɛ s t ə','sa me sv ta','サメスタ','サメスタ');
@@ -13130,8 +13130,8 @@ INSERT INTO "hand_mapping" VALUES ('SENSED','s ˈɛ n s t','se nv sv tv','セン
 INSERT INTO "hand_mapping" VALUES ('SENSES','s ˈɛ n s ɪ z','se nv si zv','センシズ','センシズ');
 INSERT INTO "hand_mapping" VALUES ('SENSIBLE','s ˈɛ n s ɪ b ə l','se nv si ba rv','センシバル','センシバル');
 INSERT INTO "hand_mapping" VALUES ('SENSIBLY','s ˈɛ n s ɪ b l i','se nv si bv ri -','センシブリー','センシブリー');
-INSERT INTO "hand_mapping" VALUES ('SENSITIVE','s ˈɛ n s ɪ t ɪ v','se nv si ti bv','センシティブ','センシティブ');
-INSERT INTO "hand_mapping" VALUES ('SENSITIVITY','s ˌɛ n s ɪ t ˈɪ v ɪ t i','se - nv si ti bi ti -','セーンシティビティー','セーンシティビティー');
+INSERT INTO "hand_mapping" VALUES ('SENSITIVE','s ˈɛ n s ɪ t ɪ v','se nv si ti Vv','センシティブ','センシティブ');
+INSERT INTO "hand_mapping" VALUES ('SENSITIVITY','s ˌɛ n s ɪ t ˈɪ v ɪ t i','se - nv si ti Vi ti -','セーンシティビティー','セーンシティビティー');
 INSERT INTO "hand_mapping" VALUES ('SENSOR','s ˈɛ n s ə','se nv sa','センサ','センサ');
 INSERT INTO "hand_mapping" VALUES ('SENSORS','s ˈɛ n s ə z','se nv sa zv','センサズ','センサズ');
 INSERT INTO "hand_mapping" VALUES ('SENSORY','s ˈɛ n s ə ɹ i','se nv sa ri -','センサリー','センサリー');
@@ -13164,16 +13164,16 @@ INSERT INTO "hand_mapping" VALUES ('SERIOUS','s ˈɪə ɹ ɪə s','si a ri a sv'
 INSERT INTO "hand_mapping" VALUES ('SERIOUSLY','s ˈɪə ɹ ɪə s l i','si a ri a sv ri -','シアリアスリー','シアリアスリー');
 INSERT INTO "hand_mapping" VALUES ('SERMON','s ˈɜː m ə n','se - ma nv','セーマン','セーマン');
 INSERT INTO "hand_mapping" VALUES ('SERUM','s ˈɪə ɹ ə m','si a ra mv','シアラム','シアラム');
-INSERT INTO "hand_mapping" VALUES ('SERVANT','s ˈɜː v ə n t','se - ba nv tv','セーバント','セーバント');
-INSERT INTO "hand_mapping" VALUES ('SERVANTS','s ˈɜː v ə n t s','se - ba nv tsv','セーバンツ','セーバンツ');
-INSERT INTO "hand_mapping" VALUES ('SERVE','s ˈɜː v','se - bv','セーブ','セーブ');
-INSERT INTO "hand_mapping" VALUES ('SERVED','s ˈɜː v d','se - bv dv','セーブド','セーブド');
-INSERT INTO "hand_mapping" VALUES ('SERVER','s ˈɜː v ə','se - ba','セーバ','セーバ');
-INSERT INTO "hand_mapping" VALUES ('SERVERS','s ˈɜː v ə z','se - ba zv','セーバズ','セーバズ');
-INSERT INTO "hand_mapping" VALUES ('SERVES','s ˈɜː v z','se - bv zv','セーブズ','セーブズ');
-INSERT INTO "hand_mapping" VALUES ('SERVICE','s ˈɜː v ɪ s','se - bi sv','セービス','セービス');
-INSERT INTO "hand_mapping" VALUES ('SERVICES','s ˈɜː v ɪ s ɪ z','se - bi si zv','セービシズ','セービシズ');
-INSERT INTO "hand_mapping" VALUES ('SERVING','s ˈɜː v ɪ ŋ','se - bi Nv','セービン','セービング');
+INSERT INTO "hand_mapping" VALUES ('SERVANT','s ˈɜː v ə n t','se - Va nv tv','セーバント','セーバント');
+INSERT INTO "hand_mapping" VALUES ('SERVANTS','s ˈɜː v ə n t s','se - Va nv tsv','セーバンツ','セーバンツ');
+INSERT INTO "hand_mapping" VALUES ('SERVE','s ˈɜː v','se - Vv','セーブ','セーブ');
+INSERT INTO "hand_mapping" VALUES ('SERVED','s ˈɜː v d','se - Vv dv','セーブド','セーブド');
+INSERT INTO "hand_mapping" VALUES ('SERVER','s ˈɜː v ə','se - Va','セーバ','セーバ');
+INSERT INTO "hand_mapping" VALUES ('SERVERS','s ˈɜː v ə z','se - Va zv','セーバズ','セーバズ');
+INSERT INTO "hand_mapping" VALUES ('SERVES','s ˈɜː v z','se - Vv zv','セーブズ','セーブズ');
+INSERT INTO "hand_mapping" VALUES ('SERVICE','s ˈɜː v ɪ s','se - Vi sv','セービス','セービス');
+INSERT INTO "hand_mapping" VALUES ('SERVICES','s ˈɜː v ɪ s ɪ z','se - Vi si zv','セービシズ','セービシズ');
+INSERT INTO "hand_mapping" VALUES ('SERVING','s ˈɜː v ɪ ŋ','se - Vi Nv','セービン','セービング');
 INSERT INTO "hand_mapping" VALUES ('SESSION','s ˈɛ ʃ ə n','se sya nv','セシャン','セション');
 INSERT INTO "hand_mapping" VALUES ('SESSIONS','s ˈɛ ʃ ə n z','se sya nv zv','セシャンズ','セシャンズ');
 INSERT INTO "hand_mapping" VALUES ('SET','s ˈɛ t','se tv','セト','セト');
@@ -13185,20 +13185,20 @@ INSERT INTO "hand_mapping" VALUES ('SETTLED','s ˈɛ t ə l d','se ta rv dv','
 INSERT INTO "hand_mapping" VALUES ('SETTLEMENT','s ˈɛ t ə l m ə n t','se ta rv ma nv tv','セタルマント','セタルメント');
 INSERT INTO "hand_mapping" VALUES ('SETTLEMENTS','s ˈɛ t ə l m ə n t s','se ta rv ma nv tsv','セタルマンツ','セタルマンツ');
 INSERT INTO "hand_mapping" VALUES ('SETUP','s ˈɛ t ˌɐ p','se ta pv','セタプ','セタプ');
-INSERT INTO "hand_mapping" VALUES ('SEVEN','s ˈɛ v ə n','se ba nv','セバン','セバン');
-INSERT INTO "hand_mapping" VALUES ('SEVENS','s ˈɛ v ə n z','se ba nv zv','セバンズ','セバンズ');
-INSERT INTO "hand_mapping" VALUES ('SEVENTEEN(1)','s ˈɛ v ə n t iː n','se ba nv ti - nv','セバンティーン','セバンティーン');
-INSERT INTO "hand_mapping" VALUES ('SEVENTEEN(2)','s ɛ v ə n t ˈiː n','se ba nv ti - nv','セバンティーン','セバンティーン');
-INSERT INTO "hand_mapping" VALUES ('SEVENTEENTH','s ɛ v ə n t ˈiː n θ','se ba nv ti - nv sv','セバンティーンス','セバンティーンス');
-INSERT INTO "hand_mapping" VALUES ('SEVENTH','s ˈɛ v ə n θ','se ba nv sv','セバンス','セバンス');
-INSERT INTO "hand_mapping" VALUES ('SEVENTIES','s ˈɛ v ə n t i z','se ba nv ti - zv','セバンティーズ','セバンティーズ');
-INSERT INTO "hand_mapping" VALUES ('SEVENTY','s ˈɛ v ə n t i','se ba nv ti -','セバンティー','セバンティー');
-INSERT INTO "hand_mapping" VALUES ('SEVER','s ˈɛ v ə','se ba','セバ','セバ');
-INSERT INTO "hand_mapping" VALUES ('SEVERAL(1)','s ˈɛ v ɹ ə l','se bv ra rv','セブラル','セブラル');
-INSERT INTO "hand_mapping" VALUES ('SEVERAL(2)','s ˈɛ v ə ɹ ə l','se ba ra rv','セバラル','セバラル');
-INSERT INTO "hand_mapping" VALUES ('SEVERE','s ə v ˈɪə','sa bi a','サビア','サビア');
-INSERT INTO "hand_mapping" VALUES ('SEVERELY','s ə v ˈɪə l i','sa bi a ri -','サビアリー','サビアリー');
-INSERT INTO "hand_mapping" VALUES ('SEVERITY','s ə v ˈɛ ɹ ɪ t i','sa be ri ti -','サベリティー','サベリティー');
+INSERT INTO "hand_mapping" VALUES ('SEVEN','s ˈɛ v ə n','se Va nv','セバン','セバン');
+INSERT INTO "hand_mapping" VALUES ('SEVENS','s ˈɛ v ə n z','se Va nv zv','セバンズ','セバンズ');
+INSERT INTO "hand_mapping" VALUES ('SEVENTEEN(1)','s ˈɛ v ə n t iː n','se Va nv ti - nv','セバンティーン','セバンティーン');
+INSERT INTO "hand_mapping" VALUES ('SEVENTEEN(2)','s ɛ v ə n t ˈiː n','se Va nv ti - nv','セバンティーン','セバンティーン');
+INSERT INTO "hand_mapping" VALUES ('SEVENTEENTH','s ɛ v ə n t ˈiː n θ','se Va nv ti - nv sv','セバンティーンス','セバンティーンス');
+INSERT INTO "hand_mapping" VALUES ('SEVENTH','s ˈɛ v ə n θ','se Va nv sv','セバンス','セバンス');
+INSERT INTO "hand_mapping" VALUES ('SEVENTIES','s ˈɛ v ə n t i z','se Va nv ti - zv','セバンティーズ','セバンティーズ');
+INSERT INTO "hand_mapping" VALUES ('SEVENTY','s ˈɛ v ə n t i','se Va nv ti -','セバンティー','セバンティー');
+INSERT INTO "hand_mapping" VALUES ('SEVER','s ˈɛ v ə','se Va','セバ','セバ');
+INSERT INTO "hand_mapping" VALUES ('SEVERAL(1)','s ˈɛ v ɹ ə l','se Vv ra rv','セブラル','セブラル');
+INSERT INTO "hand_mapping" VALUES ('SEVERAL(2)','s ˈɛ v ə ɹ ə l','se Va ra rv','セバラル','セバラル');
+INSERT INTO "hand_mapping" VALUES ('SEVERE','s ə v ˈɪə','sa Vi a','サビア','サビア');
+INSERT INTO "hand_mapping" VALUES ('SEVERELY','s ə v ˈɪə l i','sa Vi a ri -','サビアリー','サビアリー');
+INSERT INTO "hand_mapping" VALUES ('SEVERITY','s ə v ˈɛ ɹ ɪ t i','sa Ve ri ti -','サベリティー','サベリティー');
 INSERT INTO "hand_mapping" VALUES ('SEW','s ˈəʊ','so -','ソー','ソー');
 INSERT INTO "hand_mapping" VALUES ('SEWAGE','s ˈuː ɪ dʒ','su - i jyv','スーイジュ','スーイジュ');
 INSERT INTO "hand_mapping" VALUES ('SEWED','s ˈəʊ d','so - dv','ソード','ソード');
@@ -13255,9 +13255,9 @@ INSERT INTO "hand_mapping" VALUES ('SHAT','ʃ ˈæ t','sya x tv','シャット',
 INSERT INTO "hand_mapping" VALUES ('SHATTER','ʃ ˈæ t ə','sya x ta','シャッタ','シャッタ');
 INSERT INTO "hand_mapping" VALUES ('SHATTERED','ʃ ˈæ t ə d','sya x ta dv','シャッタド','シャッタド');
 INSERT INTO "hand_mapping" VALUES ('SHAUN','ʃ ˈɔː n','syo - nv','ショーン','ショーン');
-INSERT INTO "hand_mapping" VALUES ('SHAVE','ʃ ˈeɪ v','sye i bv','シェイブ','シェイブ');
-INSERT INTO "hand_mapping" VALUES ('SHAVED','ʃ ˈeɪ v d','sye i bv dv','シェイブド','シェイブド');
-INSERT INTO "hand_mapping" VALUES ('SHAVEN','ʃ ˈeɪ v ə n','sye i ba nv','シェイバン','シェイバン');
+INSERT INTO "hand_mapping" VALUES ('SHAVE','ʃ ˈeɪ v','sye i Vv','シェイブ','シェイブ');
+INSERT INTO "hand_mapping" VALUES ('SHAVED','ʃ ˈeɪ v d','sye i Vv dv','シェイブド','シェイブド');
+INSERT INTO "hand_mapping" VALUES ('SHAVEN','ʃ ˈeɪ v ə n','sye i Va nv','シェイバン','シェイバン');
 INSERT INTO "hand_mapping" VALUES ('SHAW','ʃ ˈɔː','syo -','ショー','ショー');
 INSERT INTO "hand_mapping" VALUES ('SHAWL','ʃ ˈɔː l','syo - rv','ショール','ショール');
 INSERT INTO "hand_mapping" VALUES ('SHE','ʃ ˈiː','syi -','シー','シー');
@@ -13278,7 +13278,7 @@ INSERT INTO "hand_mapping" VALUES ('SHELF','ʃ ˈɛ l f','sye rv fv','シェル
 INSERT INTO "hand_mapping" VALUES ('SHELL','ʃ ˈɛ l','sye rv','シェル','シェル');
 INSERT INTO "hand_mapping" VALUES ('SHELLEY','ʃ ˈɛ l i','sye ri -','シェリー','シェリー');
 INSERT INTO "hand_mapping" VALUES ('SHELTER','ʃ ˈɛ l t ə','sye rv ta','シェルタ','シェルタ');
-INSERT INTO "hand_mapping" VALUES ('SHELVES','ʃ ˈɛ l v z','sye rv bv zv','シェルブズ','シェルブズ');
+INSERT INTO "hand_mapping" VALUES ('SHELVES','ʃ ˈɛ l v z','sye rv Vv zv','シェルブズ','シェルブズ');
 INSERT INTO "hand_mapping" VALUES ('SHEPHERD','ʃ ˈɛ p ə d','sye pa dv','シェパド','シェパド');
 INSERT INTO "hand_mapping" VALUES ('SHERBET','ʃ ˈɜː b ə t','sye - ba tv','シェーバト','シェーバト');
 INSERT INTO "hand_mapping" VALUES ('SHERIFF','ʃ ˈɛ ɹ ɪ f','sye ri fv','シェリフ','シェリフ');
@@ -13309,7 +13309,7 @@ INSERT INTO "hand_mapping" VALUES ('SHIT','ʃ ˈɪ t','syi tv','シト','シト'
 INSERT INTO "hand_mapping" VALUES ('SHITE','ʃ ˈaɪ t','sya i tv','シャイト','シャイト');
 INSERT INTO "hand_mapping" VALUES ('SHITTED','ʃ ˈɪ t ɪ d','syi ti dv','シティド','シティド');
 INSERT INTO "hand_mapping" VALUES ('SHITTY','ʃ ˈɪ t i','syi ti -','シティー','シティー');
-INSERT INTO "hand_mapping" VALUES ('SHIVER','ʃ ˈɪ v ə','syi ba','シバ','シバ');
+INSERT INTO "hand_mapping" VALUES ('SHIVER','ʃ ˈɪ v ə','syi Va','シバ','シバ');
 INSERT INTO "hand_mapping" VALUES ('SHOCK','ʃ ˈɒ k','syo x kv','ショック','ショック');
 INSERT INTO "hand_mapping" VALUES ('SHOCKED','ʃ ˈɒ k t','syo x kv tv','ショックト','ショックト');
 INSERT INTO "hand_mapping" VALUES ('SHOCKING','ʃ ˈɒ k ɪ ŋ','syo x ki Nv','ショッキン','ショッキング');
@@ -13347,8 +13347,8 @@ INSERT INTO "hand_mapping" VALUES ('SHOUT','ʃ ˈaʊ t','sya u tv','シャウト
 INSERT INTO "hand_mapping" VALUES ('SHOUTED','ʃ ˈaʊ t ɪ d','sya u ti dv','シャウティド','シャウティド');
 INSERT INTO "hand_mapping" VALUES ('SHOUTING','ʃ ˈaʊ t ɪ ŋ','sya u ti Nv','シャウティン','シャウティング');
 INSERT INTO "hand_mapping" VALUES ('SHOUTS','ʃ ˈaʊ t s','sya u tsv','シャウツ','シャウツ');
-INSERT INTO "hand_mapping" VALUES ('SHOVE','ʃ ˈɐ v','sya bv','シャブ','シャブ');
-INSERT INTO "hand_mapping" VALUES ('SHOVEL','ʃ ˈɐ v ə l','sya ba rv','シャバル','シャバル');
+INSERT INTO "hand_mapping" VALUES ('SHOVE','ʃ ˈɐ v','sya Vv','シャブ','シャブ');
+INSERT INTO "hand_mapping" VALUES ('SHOVEL','ʃ ˈɐ v ə l','sya Va rv','シャバル','シャバル');
 INSERT INTO "hand_mapping" VALUES ('SHOW','ʃ ˈəʊ','syo -','ショー','ショー');
 INSERT INTO "hand_mapping" VALUES ('SHOWCASE','ʃ ˈəʊ k ˌeɪ s','syo - ke i sv','ショーケイス','ショーケイス');
 INSERT INTO "hand_mapping" VALUES ('SHOWED','ʃ ˈəʊ d','syo - dv','ショード','ショード');
@@ -13365,7 +13365,7 @@ INSERT INTO "hand_mapping" VALUES ('SHREWSBURY(1)','ʃ ɹ ˈuː z b ɹ i','syv r
 INSERT INTO "hand_mapping" VALUES ('SHREWSBURY(2)','ʃ ɹ ˈəʊ z b ɹ i','syv ro - zv bv ri -','シュローズブリー','シュローズブリー');
 INSERT INTO "hand_mapping" VALUES ('SHRIMP','ʃ ɹ ˈɪ m p','syv ri npv','シュリンプ','シュリンプ');
 INSERT INTO "hand_mapping" VALUES ('SHRINK','ʃ ɹ ˈɪ ŋ k','syv ri Nv kv','シュリンク','シュリンク');
-INSERT INTO "hand_mapping" VALUES ('SHRIVEL','ʃ ɹ ˈɪ v ə l','syv ri ba rv','シュリバル','シュリバル');
+INSERT INTO "hand_mapping" VALUES ('SHRIVEL','ʃ ɹ ˈɪ v ə l','syv ri Va rv','シュリバル','シュリバル');
 INSERT INTO "hand_mapping" VALUES ('SHROPSHIRE','ʃ ɹ ˈɒ p ʃ ə','syv ro x pv sya','シュロップシャ','シュロップシャ');
 INSERT INTO "hand_mapping" VALUES ('SHRUB','ʃ ɹ ˈɐ b','syv ra bv','シュラブ','シュラブ');
 INSERT INTO "hand_mapping" VALUES ('SHRUG','ʃ ɹ ˈɐ g','syv ra gv','シュラグ','シュラグ');
@@ -13389,7 +13389,7 @@ INSERT INTO "hand_mapping" VALUES ('SIDEWAYS','s ˈaɪ d w ˌeɪ z','sa i dv we
 INSERT INTO "hand_mapping" VALUES ('SIEGE','s ˈiː dʒ','si - jyv','シージュ','シージュ');
 INSERT INTO "hand_mapping" VALUES ('SIEMENS','s ˈiː m ə n z','si - ma nv zv','シーマンズ','シーマンズ');
 INSERT INTO "hand_mapping" VALUES ('SIERRA','s ɪ ˈɛə ɹ ə','si e a ra','シエアラ','シエアラ');
-INSERT INTO "hand_mapping" VALUES ('SIEVE','s ˈiː v','si - bv','シーブ','シーブ');
+INSERT INTO "hand_mapping" VALUES ('SIEVE','s ˈiː v','si - Vv','シーブ','シーブ');
 INSERT INTO "hand_mapping" VALUES ('SIFT','s ˈɪ f t','si fv tv','シフト','シフト');
 INSERT INTO "hand_mapping" VALUES ('SIG','s ˈɪ g','si gv','シグ','シグ');
 INSERT INTO "hand_mapping" VALUES ('SIGH','s ˈaɪ','sa i','サイ','サイ');
@@ -13420,7 +13420,7 @@ INSERT INTO "hand_mapping" VALUES ('SILL','s ˈɪ l','si rv','シル','シル');
 INSERT INTO "hand_mapping" VALUES ('SILLY','s ˈɪ l i','si ri -','シリー','シリー');
 INSERT INTO "hand_mapping" VALUES ('SILO','s ˈaɪ l əʊ','sa i ro','サイロ','サイロ');
 INSERT INTO "hand_mapping" VALUES ('SILT','s ˈɪ l t','si rv tv','シルト','シルト');
-INSERT INTO "hand_mapping" VALUES ('SILVER','s ˈɪ l v ə','si rv ba','シルバ','シルバ');
+INSERT INTO "hand_mapping" VALUES ('SILVER','s ˈɪ l v ə','si rv Va','シルバ','シルバ');
 INSERT INTO "hand_mapping" VALUES ('SIM','s ˈɪ m','si mv','シム','シム');
 INSERT INTO "hand_mapping" VALUES ('SIMILAR','s ˈɪ m ɪ l ə','si mi ra','シミラ','シミラ');
 INSERT INTO "hand_mapping" VALUES ('SIMILARITIES','s ˌɪ m ɪ l ˈæ ɹ ɪ t i z','si - mi ra ri ti - zv','シーミラリティーズ','シーミラリティーズ');
@@ -13511,7 +13511,7 @@ INSERT INTO "hand_mapping" VALUES ('SKINT','s k ˈɪ n t','sv ki nv tv','スキ
 INSERT INTO "hand_mapping" VALUES ('SKIP','s k ˈɪ p','sv ki pv','スキプ','スキプ');
 INSERT INTO "hand_mapping" VALUES ('SKIRT','s k ˈɜː t','sv ke - tv','スケート','スケート');
 INSERT INTO "hand_mapping" VALUES ('SKIRTS','s k ˈɜː t s','sv ke - tsv','スケーツ','スケーツ');
-INSERT INTO "hand_mapping" VALUES ('SKIVE','s k ˈaɪ v','sv ka i bv','スカイブ','スカイブ');
+INSERT INTO "hand_mapping" VALUES ('SKIVE','s k ˈaɪ v','sv ka i Vv','スカイブ','スカイブ');
 INSERT INTO "hand_mapping" VALUES ('SKOPJE','s k ˈɒ p j eɪ','sv ko x pye i','スコッピェイ','スコッピェイ');
 INSERT INTO "hand_mapping" VALUES ('SKULL','s k ˈɐ l','sv ka rv','スカル','スカル');
 INSERT INTO "hand_mapping" VALUES ('SKUNK','s k ˈɐ ŋ k','sv ka Nv kv','スカンク','スカンク');
@@ -13528,9 +13528,9 @@ INSERT INTO "hand_mapping" VALUES ('SLAP','s l ˈæ p','sv ra x pv','スラッ
 INSERT INTO "hand_mapping" VALUES ('SLASH','s l ˈæ ʃ','sv ra x syv','スラッシュ','スラッシュ');
 INSERT INTO "hand_mapping" VALUES ('SLAT','s l ˈæ t','sv ra x tv','スラット','スラット');
 INSERT INTO "hand_mapping" VALUES ('SLATE','s l ˈeɪ t','sv re i tv','スレイト','スレイト');
-INSERT INTO "hand_mapping" VALUES ('SLAVE','s l ˈeɪ v','sv re i bv','スレイブ','スレイブ');
-INSERT INTO "hand_mapping" VALUES ('SLAVERY','s l ˈeɪ v ə ɹ i','sv re i ba ri -','スレイバリー','スレイバリー');
-INSERT INTO "hand_mapping" VALUES ('SLAVES','s l ˈeɪ v z','sv re i bv zv','スレイブズ','スレイブズ');
+INSERT INTO "hand_mapping" VALUES ('SLAVE','s l ˈeɪ v','sv re i Vv','スレイブ','スレイブ');
+INSERT INTO "hand_mapping" VALUES ('SLAVERY','s l ˈeɪ v ə ɹ i','sv re i Va ri -','スレイバリー','スレイバリー');
+INSERT INTO "hand_mapping" VALUES ('SLAVES','s l ˈeɪ v z','sv re i Vv zv','スレイブズ','スレイブズ');
 INSERT INTO "hand_mapping" VALUES ('SLAY','s l ˈeɪ','sv re i','スレイ','スレイ');
 INSERT INTO "hand_mapping" VALUES ('SLAYED','s l ˈeɪ d','sv re i dv','スレイド','スレイド');
 INSERT INTO "hand_mapping" VALUES ('SLED','s l ˈɛ d','sv re dv','スレド','スレド');
@@ -13541,8 +13541,8 @@ INSERT INTO "hand_mapping" VALUES ('SLEEPING','s l ˈiː p ɪ ŋ','sv ri - pi Nv
 INSERT INTO "hand_mapping" VALUES ('SLEEPS','s l ˈiː p s','sv ri - pv sv','スリープス','スリープス');
 INSERT INTO "hand_mapping" VALUES ('SLEEPY','s l ˈiː p i','sv ri - pi -','スリーピー','スリーピー');
 INSERT INTO "hand_mapping" VALUES ('SLEET','s l ˈiː t','sv ri - tv','スリート','スリート');
-INSERT INTO "hand_mapping" VALUES ('SLEEVE','s l ˈiː v','sv ri - bv','スリーブ','スリーブ');
-INSERT INTO "hand_mapping" VALUES ('SLEEVES','s l ˈiː v z','sv ri - bv zv','スリーブズ','スリーブズ');
+INSERT INTO "hand_mapping" VALUES ('SLEEVE','s l ˈiː v','sv ri - Vv','スリーブ','スリーブ');
+INSERT INTO "hand_mapping" VALUES ('SLEEVES','s l ˈiː v z','sv ri - Vv zv','スリーブズ','スリーブズ');
 INSERT INTO "hand_mapping" VALUES ('SLEIGH','s l ˈeɪ','sv re i','スレイ','スレイ');
 INSERT INTO "hand_mapping" VALUES ('SLEIGHT','s l ˈeɪ t','sv re i tv','スレイト','スレイト');
 INSERT INTO "hand_mapping" VALUES ('SLENDER','s l ˈɛ n d ə','sv re nv da','スレンダ','スレンダ');
@@ -13579,9 +13579,9 @@ INSERT INTO "hand_mapping" VALUES ('SLOTH','s l ˈɒ θ','sv ro x sv','スロッ
 INSERT INTO "hand_mapping" VALUES ('SLOTS','s l ˈɒ t s','sv ro x tsv','スロッツ','スロッツ');
 INSERT INTO "hand_mapping" VALUES ('SLOUGH(1)','s l ˈaʊ','sv ra u','スラウ','スラウ');
 INSERT INTO "hand_mapping" VALUES ('SLOUGH(2)','s l ˈɐ f','sv ra fv','スラフ','スラフ');
-INSERT INTO "hand_mapping" VALUES ('SLOVAK','s l ˈəʊ v æ k','sv ro - ba kv','スローバク','スローバク');
-INSERT INTO "hand_mapping" VALUES ('SLOVAKIA','s l ˌəʊ v ˈæ k ɪə','sv ro ba x ki a','スロバッキア','スロバッキア');
-INSERT INTO "hand_mapping" VALUES ('SLOVENIA','s l ˌəʊ v ˈiː n ɪə','sv ro bi - ni a','スロビーニア','スロビーニア');
+INSERT INTO "hand_mapping" VALUES ('SLOVAK','s l ˈəʊ v æ k','sv ro - Va kv','スローバク','スローバク');
+INSERT INTO "hand_mapping" VALUES ('SLOVAKIA','s l ˌəʊ v ˈæ k ɪə','sv ro Va x ki a','スロバッキア','スロバッキア');
+INSERT INTO "hand_mapping" VALUES ('SLOVENIA','s l ˌəʊ v ˈiː n ɪə','sv ro Vi - ni a','スロビーニア','スロビーニア');
 INSERT INTO "hand_mapping" VALUES ('SLOW','s l ˈəʊ','sv ro -','スロー','スロー');
 INSERT INTO "hand_mapping" VALUES ('SLOWLY','s l ˈəʊ l i','sv ro - ri -','スローリー','スローリー');
 INSERT INTO "hand_mapping" VALUES ('SLUG','s l ˈɐ g','sv ra gv','スラグ','スラグ');
@@ -13720,10 +13720,10 @@ INSERT INTO "hand_mapping" VALUES ('SOLO','s ˈəʊ l ˌəʊ','so - ro','ソー
 INSERT INTO "hand_mapping" VALUES ('SOLOMON','s ˈɒ l ə m ə n','so ra ma nv','ソラマン','ソラマン');
 INSERT INTO "hand_mapping" VALUES ('SOLUTION','s ə l ˈuː ʃ ə n','sa ru - sya nv','サルーシャン','ソルーション');
 INSERT INTO "hand_mapping" VALUES ('SOLUTIONS','s ə l ˈuː ʃ ə n z','sa ru - sya nv zv','サルーシャンズ','ソルーシャンズ');
-INSERT INTO "hand_mapping" VALUES ('SOLVE','s ˈɒ l v','so rv bv','ソルブ','ソルブ');
-INSERT INTO "hand_mapping" VALUES ('SOLVED','s ˈɒ l v d','so rv bv dv','ソルブド','ソルブド');
-INSERT INTO "hand_mapping" VALUES ('SOLVENT','s ˈɒ l v ə n t','so rv ba nv tv','ソルバント','ソルバント');
-INSERT INTO "hand_mapping" VALUES ('SOLVING','s ˈɒ l v ɪ ŋ','so rv bi Nv','ソルビン','ソルビング');
+INSERT INTO "hand_mapping" VALUES ('SOLVE','s ˈɒ l v','so rv Vv','ソルブ','ソルブ');
+INSERT INTO "hand_mapping" VALUES ('SOLVED','s ˈɒ l v d','so rv Vv dv','ソルブド','ソルブド');
+INSERT INTO "hand_mapping" VALUES ('SOLVENT','s ˈɒ l v ə n t','so rv Va nv tv','ソルバント','ソルバント');
+INSERT INTO "hand_mapping" VALUES ('SOLVING','s ˈɒ l v ɪ ŋ','so rv Vi Nv','ソルビン','ソルビング');
 INSERT INTO "hand_mapping" VALUES ('SOMA','s ˈəʊ m ə','so - ma','ソーマ','ソーマ');
 INSERT INTO "hand_mapping" VALUES ('SOMALIA','s əʊ m ˈɑː l ɪə','so ma - ri a','ソマーリア','ソマーリア');
 INSERT INTO "hand_mapping" VALUES ('SOME','s ˈɐ m','sa mv','サム','ソム');
@@ -13782,11 +13782,11 @@ INSERT INTO "hand_mapping" VALUES ('SOUTHEND','s ˌaʊ θ ˈɛ n d','sa u se nv
 INSERT INTO "hand_mapping" VALUES ('SOUTHERN','s ˈɐ ð ə n','sa za nv','サザン','サザン');
 INSERT INTO "hand_mapping" VALUES ('SOUTHWARK','s ˈɐ ð ə k','sa za kv','サザク','サザク');
 INSERT INTO "hand_mapping" VALUES ('SOUTHWEST','s ˌaʊ θ w ˈɛ s t','sa u swe sv tv','サウスェスト','サウスェスト');
-INSERT INTO "hand_mapping" VALUES ('SOUVENIR(1)','s ˈuː v ə n ˌɪə','su - ba ni a','スーバニア','スーバニア');
-INSERT INTO "hand_mapping" VALUES ('SOUVENIR(2)','s ˌuː v ə n ˈɪə','su - ba ni a','スーバニア','スーバニア');
-INSERT INTO "hand_mapping" VALUES ('SOVEREIGN','s ˈɒ v ɹ ɪ n','so bv ri nv','ソブリン','ソブリン');
-INSERT INTO "hand_mapping" VALUES ('SOVEREIGNTY','s ˈɒ v ɹ ɪ n t i','so bv ri nv ti -','ソブリンティー','ソブリンティー');
-INSERT INTO "hand_mapping" VALUES ('SOVIET','s ˈəʊ v ɪə t','so - bi a tv','ソービアト','ソービアト');
+INSERT INTO "hand_mapping" VALUES ('SOUVENIR(1)','s ˈuː v ə n ˌɪə','su - Va ni a','スーバニア','スーバニア');
+INSERT INTO "hand_mapping" VALUES ('SOUVENIR(2)','s ˌuː v ə n ˈɪə','su - Va ni a','スーバニア','スーバニア');
+INSERT INTO "hand_mapping" VALUES ('SOVEREIGN','s ˈɒ v ɹ ɪ n','so Vv ri nv','ソブリン','ソブリン');
+INSERT INTO "hand_mapping" VALUES ('SOVEREIGNTY','s ˈɒ v ɹ ɪ n t i','so Vv ri nv ti -','ソブリンティー','ソブリンティー');
+INSERT INTO "hand_mapping" VALUES ('SOVIET','s ˈəʊ v ɪə t','so - Vi a tv','ソービアト','ソービアト');
 INSERT INTO "hand_mapping" VALUES ('SOW(1)','s ˈəʊ','so -','ソー','ソー');
 INSERT INTO "hand_mapping" VALUES ('SOW(2)','s ˈaʊ','sa u','サウ','サウ');
 INSERT INTO "hand_mapping" VALUES ('SOWED','s ˈəʊ d','so - dv','ソード','ソード');
@@ -14029,8 +14029,8 @@ INSERT INTO "hand_mapping" VALUES ('STARTERS','s t ˈɑː t ə z','sv ta - ta zv
 INSERT INTO "hand_mapping" VALUES ('STARTING','s t ˈɑː t ɪ ŋ','sv ta - ti Nv','スターティン','スターティング');
 INSERT INTO "hand_mapping" VALUES ('STARTS','s t ˈɑː t s','sv ta - tsv','スターツ','スターツ');
 INSERT INTO "hand_mapping" VALUES ('STARTUP','s t ˈɑː t ˌɐ p','sv ta - ta pv','スタータプ','スタータプ');
-INSERT INTO "hand_mapping" VALUES ('STARVE','s t ˈɑː v','sv ta - bv','スターブ','スターブ');
-INSERT INTO "hand_mapping" VALUES ('STARVING','s t ˈɑː v ɪ ŋ','sv ta - bi Nv','スタービン','スタービング');
+INSERT INTO "hand_mapping" VALUES ('STARVE','s t ˈɑː v','sv ta - Vv','スターブ','スターブ');
+INSERT INTO "hand_mapping" VALUES ('STARVING','s t ˈɑː v ɪ ŋ','sv ta - Vi Nv','スタービン','スタービング');
 INSERT INTO "hand_mapping" VALUES ('STASH','s t ˈæ ʃ','sv ta x syv','スタッシュ','スタッシュ');
 INSERT INTO "hand_mapping" VALUES ('STAT','s t ˈæ t','sv ta x tv','スタット','スタット');
 INSERT INTO "hand_mapping" VALUES ('STATE','s t ˈeɪ t','sv te i tv','ステイト','ステイト');
@@ -14055,9 +14055,9 @@ INSERT INTO "hand_mapping" VALUES ('STATUSES','s t ˈeɪ t ə s ɪ z','sv te i t
 INSERT INTO "hand_mapping" VALUES ('STATUTE','s t ˈæ tʃ uː t','sv ta x tyu - tv','スタッチュート','スタッチュート');
 INSERT INTO "hand_mapping" VALUES ('STATUTES','s t ˈæ tʃ uː t s','sv ta x tyu - tsv','スタッチューツ','スタッチューツ');
 INSERT INTO "hand_mapping" VALUES ('STATUTORY','s t ˈæ tʃ ʊ t ə ɹ i','sv ta x tyu ta ri -','スタッチュタリー','スタッチュタリー');
-INSERT INTO "hand_mapping" VALUES ('STAVE','s t ˈeɪ v','sv te i bv','ステイブ','ステイブ');
-INSERT INTO "hand_mapping" VALUES ('STAVED','s t ˈeɪ v d','sv te i bv dv','ステイブド','ステイブド');
-INSERT INTO "hand_mapping" VALUES ('STAVES','s t ˈeɪ v z','sv te i bv zv','ステイブズ','ステイブズ');
+INSERT INTO "hand_mapping" VALUES ('STAVE','s t ˈeɪ v','sv te i Vv','ステイブ','ステイブ');
+INSERT INTO "hand_mapping" VALUES ('STAVED','s t ˈeɪ v d','sv te i Vv dv','ステイブド','ステイブド');
+INSERT INTO "hand_mapping" VALUES ('STAVES','s t ˈeɪ v z','sv te i Vv zv','ステイブズ','ステイブズ');
 INSERT INTO "hand_mapping" VALUES ('STAY','s t ˈeɪ','sv te i','ステイ','ステイ');
 INSERT INTO "hand_mapping" VALUES ('STAYED','s t ˈeɪ d','sv te i dv','ステイド','ステイド');
 INSERT INTO "hand_mapping" VALUES ('STAYING','s t ˈeɪ ɪ ŋ','sv te i i Nv','ステイイン','ステイイング');
@@ -14077,7 +14077,7 @@ INSERT INTO "hand_mapping" VALUES ('STELLAR','s t ˈɛ l ə','sv te ra','ステ
 INSERT INTO "hand_mapping" VALUES ('STEM','s t ˈɛ m','sv te mv','ステム','ステム');
 INSERT INTO "hand_mapping" VALUES ('STEP','s t ˈɛ p','sv te pv','ステプ','ステプ');
 INSERT INTO "hand_mapping" VALUES ('STEPHANIE','s t ˈɛ f ə n i','sv te fa ni -','ステファニー','ステファニー');
-INSERT INTO "hand_mapping" VALUES ('STEPHEN','s t ˈiː v ə n','sv ti - ba nv','スティーバン','スティーバン');
+INSERT INTO "hand_mapping" VALUES ('STEPHEN','s t ˈiː v ə n','sv ti - Va nv','スティーバン','スティーバン');
 INSERT INTO "hand_mapping" VALUES ('STEPPED','s t ˈɛ p t','sv te pv tv','ステプト','ステプト');
 INSERT INTO "hand_mapping" VALUES ('STEPS','s t ˈɛ p s','sv te pv sv','ステプス','ステプス');
 INSERT INTO "hand_mapping" VALUES ('STEREO','s t ˈɛ ɹ ɪ ˌəʊ','sv te ri o','ステリオ','ステリオ');
@@ -14085,9 +14085,9 @@ INSERT INTO "hand_mapping" VALUES ('STEREOTYPE(1)','s t ˈɛ ɹ ɪə t ˌaɪ p',
 INSERT INTO "hand_mapping" VALUES ('STEREOTYPE(2)','s t ˈɪə ɹ ɪə t ˌaɪ p','sv ti a ri a ta i pv','スティアリアタイプ','スティアリアタイプ');
 INSERT INTO "hand_mapping" VALUES ('STERLING','s t ˈɜː l ɪ ŋ','sv te - ri Nv','ステーリン','ステーリング');
 INSERT INTO "hand_mapping" VALUES ('STERN','s t ˈɜː n','sv te - nv','ステーン','ステーン');
-INSERT INTO "hand_mapping" VALUES ('STEVE','s t ˈiː v','sv ti - bv','スティーブ','スティーブ');
-INSERT INTO "hand_mapping" VALUES ('STEVEN','s t ˈiː v ə n','sv ti - ba nv','スティーバン','スティーバン');
-INSERT INTO "hand_mapping" VALUES ('STEVENS','s t ˈiː v ə n z','sv ti - ba nv zv','スティーバンズ','スティーバンズ');
+INSERT INTO "hand_mapping" VALUES ('STEVE','s t ˈiː v','sv ti - Vv','スティーブ','スティーブ');
+INSERT INTO "hand_mapping" VALUES ('STEVEN','s t ˈiː v ə n','sv ti - Va nv','スティーバン','スティーバン');
+INSERT INTO "hand_mapping" VALUES ('STEVENS','s t ˈiː v ə n z','sv ti - Va nv zv','スティーバンズ','スティーバンズ');
 INSERT INTO "hand_mapping" VALUES ('STEW','s t j ˈuː','sv tyu -','スチュー','スチュー');
 INSERT INTO "hand_mapping" VALUES ('STEWARD','s t j ˈʊə d','sv tyu a dv','スチュアド','スチュアド');
 INSERT INTO "hand_mapping" VALUES ('STEWARDS','s t j ˈʊə d z','sv tyu a zv','スチュアズ','スチュアズ');
@@ -14151,7 +14151,7 @@ INSERT INTO "hand_mapping" VALUES ('STORM','s t ˈɔː m','sv to - mv','スト
 INSERT INTO "hand_mapping" VALUES ('STORMY','s t ˈɔː m i','sv to - mi -','ストーミー','ストーミー');
 INSERT INTO "hand_mapping" VALUES ('STORY','s t ˈɔː ɹ i','sv to - ri -','ストーリー','ストーリー');
 INSERT INTO "hand_mapping" VALUES ('STOUT','s t ˈaʊ t','sv ta u tv','スタウト','スタウト');
-INSERT INTO "hand_mapping" VALUES ('STOVE','s t ˈəʊ v','sv to - bv','ストーブ','ストーブ');
+INSERT INTO "hand_mapping" VALUES ('STOVE','s t ˈəʊ v','sv to - Vv','ストーブ','ストーブ');
 INSERT INTO "hand_mapping" VALUES ('STOW','s t ˈəʊ','sv to -','ストー','ストー');
 INSERT INTO "hand_mapping" VALUES ('STOWAWAY','s t ˈəʊ ə w ˌeɪ','sv to - a we i','ストーアウェイ','ストーアウェイ');
 INSERT INTO "hand_mapping" VALUES ('STRAIGHT','s t ɹ ˈeɪ t','sv tv re i tv','ストレイト','ストレイト');
@@ -14211,9 +14211,9 @@ INSERT INTO "hand_mapping" VALUES ('STRIP','s t ɹ ˈɪ p','sv tv ri pv','スト
 INSERT INTO "hand_mapping" VALUES ('STRIPE','s t ɹ ˈaɪ p','sv tv ra i pv','ストライプ','ストライプ');
 INSERT INTO "hand_mapping" VALUES ('STRIPES','s t ɹ ˈaɪ p s','sv tv ra i pv sv','ストライプス','ストライプス');
 INSERT INTO "hand_mapping" VALUES ('STRIPS','s t ɹ ˈɪ p s','sv tv ri pv sv','ストリプス','ストリプス');
-INSERT INTO "hand_mapping" VALUES ('STRIVE','s t ɹ ˈaɪ v','sv tv ra i bv','ストライブ','ストライブ');
-INSERT INTO "hand_mapping" VALUES ('STRIVED','s t ɹ ˈaɪ v d','sv tv ra i bv dv','ストライブド','ストライブド');
-INSERT INTO "hand_mapping" VALUES ('STRIVEN','s t ɹ ˈɪ v ə n','sv tv ri ba nv','ストリバン','ストリバン');
+INSERT INTO "hand_mapping" VALUES ('STRIVE','s t ɹ ˈaɪ v','sv tv ra i Vv','ストライブ','ストライブ');
+INSERT INTO "hand_mapping" VALUES ('STRIVED','s t ɹ ˈaɪ v d','sv tv ra i Vv dv','ストライブド','ストライブド');
+INSERT INTO "hand_mapping" VALUES ('STRIVEN','s t ɹ ˈɪ v ə n','sv tv ri Va nv','ストリバン','ストリバン');
 INSERT INTO "hand_mapping" VALUES ('STRODE','s t ɹ ˈəʊ d','sv tv ro - dv','ストロード','ストロード');
 INSERT INTO "hand_mapping" VALUES ('STROKE','s t ɹ ˈəʊ k','sv tv ro - kv','ストローク','ストローク');
 INSERT INTO "hand_mapping" VALUES ('STROLL','s t ɹ ˈəʊ l','sv tv ro - rv','ストロール','ストロール');
@@ -14221,7 +14221,7 @@ INSERT INTO "hand_mapping" VALUES ('STRONG','s t ɹ ˈɒ ŋ','sv tv ro Nv','ス
 INSERT INTO "hand_mapping" VALUES ('STRONGER','s t ɹ ˈɒ ŋ g ə','sv tv ro Nv ga','ストロンガ','ストロンガ');
 INSERT INTO "hand_mapping" VALUES ('STRONGEST','s t ɹ ˈɒ ŋ g ɪ s t','sv tv ro Nv gi sv tv','ストロンギスト','ストロンギスト');
 INSERT INTO "hand_mapping" VALUES ('STRONGLY','s t ɹ ˈɒ ŋ l i','sv tv ro Nv ri -','ストロンリー','ストロンリー');
-INSERT INTO "hand_mapping" VALUES ('STROVE','s t ɹ ˈəʊ v','sv tv ro - bv','ストローブ','ストローブ');
+INSERT INTO "hand_mapping" VALUES ('STROVE','s t ɹ ˈəʊ v','sv tv ro - Vv','ストローブ','ストローブ');
 INSERT INTO "hand_mapping" VALUES ('STRUCK','s t ɹ ˈɐ k','sv tv ra kv','ストラク','ストラク');
 INSERT INTO "hand_mapping" VALUES ('STRUCTURAL','s t ɹ ˈɐ k tʃ ə ɹ ə l','sv tv ra kv tya ra rv','ストラクチャラル','ストラクチャラル');
 INSERT INTO "hand_mapping" VALUES ('STRUCTURE','s t ɹ ˈɐ k tʃ ə','sv tv ra kv tya','ストラクチャ','ストラクチャ');
@@ -14265,11 +14265,11 @@ INSERT INTO "hand_mapping" VALUES ('SUB','s ˈɐ b','sa bv','サブ','サブ');
 INSERT INTO "hand_mapping" VALUES ('SUBARU','s ʊ b ˈɑː ɹ uː','su ba - ru -','スバールー','スバールー');
 INSERT INTO "hand_mapping" VALUES ('SUBCOMMITTEE','s ˈɐ b k ə m ˌɪ t i','sa bv ka mi - ti -','サブカミーティー','サブカミーティー');
 INSERT INTO "hand_mapping" VALUES ('SUBCONSCIOUS','s ɐ b k ˈɒ n ʃ ə s','sa bv ko nv sya sv','サブコンシャス','サブコンシャス');
-INSERT INTO "hand_mapping" VALUES ('SUBDIVISION','s ˈɐ b d ɪ v ˌɪ ʒ ə n','sa bv di bi - jya nv','サブディビージャン','サブディビージョン');
+INSERT INTO "hand_mapping" VALUES ('SUBDIVISION','s ˈɐ b d ɪ v ˌɪ ʒ ə n','sa bv di Vi - jya nv','サブディビージャン','サブディビージョン');
 INSERT INTO "hand_mapping" VALUES ('SUBJECT(1)','s ə b dʒ ˈɛ k t','sa bv jye kv tv','サブジェクト','サブジェクト');
 INSERT INTO "hand_mapping" VALUES ('SUBJECT(2)','s ˈɐ b dʒ ɪ k t','sa bv jyi kv tv','サブジィクト','サブジィクト');
 INSERT INTO "hand_mapping" VALUES ('SUBJECTED','s ə b dʒ ˈɛ k t ɪ d','sa bv jye kv ti dv','サブジェクティド','サブジェクティド');
-INSERT INTO "hand_mapping" VALUES ('SUBJECTIVE','s ə b dʒ ˈɛ k t ɪ v','sa bv jye kv ti bv','サブジェクティブ','サブジェクティブ');
+INSERT INTO "hand_mapping" VALUES ('SUBJECTIVE','s ə b dʒ ˈɛ k t ɪ v','sa bv jye kv ti Vv','サブジェクティブ','サブジェクティブ');
 INSERT INTO "hand_mapping" VALUES ('SUBJECTS(1)','s ə b dʒ ˈɛ k t s','sa bv jye kv tsv','サブジェクツ','サブジェクツ');
 INSERT INTO "hand_mapping" VALUES ('SUBJECTS(2)','s ˈɐ b dʒ ɪ k t s','sa bv jyi kv tsv','サブジィクツ','サブジィクツ');
 INSERT INTO "hand_mapping" VALUES ('SUBLIME','s ə b l ˈaɪ m','sa bv ra i mv','サブライム','サブライム');
@@ -14312,7 +14312,7 @@ INSERT INTO "hand_mapping" VALUES ('SUCCESSES','s ə k s ˈɛ s ɪ z','sa kv se
 INSERT INTO "hand_mapping" VALUES ('SUCCESSFUL','s ə k s ˈɛ s f ə l','sa kv se sv fa rv','サクセスファル','サクセスファル');
 INSERT INTO "hand_mapping" VALUES ('SUCCESSFULLY','s ə k s ˈɛ s f ə l i','sa kv se sv fa ri -','サクセスファリー','サクセスファリー');
 INSERT INTO "hand_mapping" VALUES ('SUCCESSION','s ə k s ˈɛ ʃ ə n','sa kv se sya nv','サクセシャン','サクセション');
-INSERT INTO "hand_mapping" VALUES ('SUCCESSIVE','s ə k s ˈɛ s ɪ v','sa kv se si bv','サクセシブ','サクセシブ');
+INSERT INTO "hand_mapping" VALUES ('SUCCESSIVE','s ə k s ˈɛ s ɪ v','sa kv se si Vv','サクセシブ','サクセシブ');
 INSERT INTO "hand_mapping" VALUES ('SUCCESSOR','s ə k s ˈɛ s ə','sa kv se sa','サクセサ','サクセサ');
 INSERT INTO "hand_mapping" VALUES ('SUCCINCT','s ə k s ˈɪ n t','sa kv si nv tv','サクシント','サクシント');
 INSERT INTO "hand_mapping" VALUES ('SUCCUMB','s ə k ˈɐ m','sa ka mv','サカム','サカム');
@@ -14352,7 +14352,7 @@ INSERT INTO "hand_mapping" VALUES ('SUITES','s w ˈiː t s','swi - tsv','スィ
 INSERT INTO "hand_mapping" VALUES ('SUITS','s ˈuː t s','su - tsv','スーツ','スーツ');
 INSERT INTO "hand_mapping" VALUES ('SULK','s ˈɐ l k','sa rv kv','サルク','サルク');
 INSERT INTO "hand_mapping" VALUES ('SULKY','s ˈɐ l k i','sa rv ki -','サルキー','サルキー');
-INSERT INTO "hand_mapping" VALUES ('SULLIVAN','s ˈɐ l ɪ v ə n','sa ri ba nv','サリバン','サリバン');
+INSERT INTO "hand_mapping" VALUES ('SULLIVAN','s ˈɐ l ɪ v ə n','sa ri Va nv','サリバン','サリバン');
 INSERT INTO "hand_mapping" VALUES ('SULLY','s ˈɐ l i','sa ri -','サリー','サリー');
 INSERT INTO "hand_mapping" VALUES ('SULPHUR','s ˈɐ l f ə','sa rv fa','サルファ','サルファ');
 INSERT INTO "hand_mapping" VALUES ('SUM','s ˈɐ m','sa mv','サム','サム');
@@ -14389,10 +14389,10 @@ INSERT INTO "hand_mapping" VALUES ('SUPERIORITY','s uː p ˌɪə ɹ ɪ ˈɒ ɹ 
 INSERT INTO "hand_mapping" VALUES ('SUPERMARKET','s ˈuː p ə m ˌɑː k ɪ t','su - pa ma - ki tv','スーパマーキト','スーパマーキト');
 INSERT INTO "hand_mapping" VALUES ('SUPERSEDE','s ˌuː p ə s ˈiː d','su - pa si - dv','スーパシード','スーパシード');
 INSERT INTO "hand_mapping" VALUES ('SUPERSEDED','s ˌuː p ə s ˈiː d ɪ d','su - pa si - di dv','スーパシーディド','スーパシーディド');
-INSERT INTO "hand_mapping" VALUES ('SUPERVISE','s ˈuː p ə v ˌaɪ z','su - pa ba i zv','スーパバイズ','スーパバイズ');
-INSERT INTO "hand_mapping" VALUES ('SUPERVISION','s ˌuː p ə v ˈɪ ʒ ə n','su - pa bi jya nv','スーパビジャン','スーパビジョン');
-INSERT INTO "hand_mapping" VALUES ('SUPERVISOR','s ˈuː p ə v ˌaɪ z ə','su - pa ba i za','スーパバイザ','スーパバイザ');
-INSERT INTO "hand_mapping" VALUES ('SUPERVISORS','s ˈuː p ə v ˌaɪ z ə z','su - pa ba i za zv','スーパバイザズ','スーパバイザズ');
+INSERT INTO "hand_mapping" VALUES ('SUPERVISE','s ˈuː p ə v ˌaɪ z','su - pa Va i zv','スーパバイズ','スーパバイズ');
+INSERT INTO "hand_mapping" VALUES ('SUPERVISION','s ˌuː p ə v ˈɪ ʒ ə n','su - pa Vi jya nv','スーパビジャン','スーパビジョン');
+INSERT INTO "hand_mapping" VALUES ('SUPERVISOR','s ˈuː p ə v ˌaɪ z ə','su - pa Va i za','スーパバイザ','スーパバイザ');
+INSERT INTO "hand_mapping" VALUES ('SUPERVISORS','s ˈuː p ə v ˌaɪ z ə z','su - pa Va i za zv','スーパバイザズ','スーパバイザズ');
 INSERT INTO "hand_mapping" VALUES ('SUPPER','s ˈɐ p ə','sa pa','サパ','サパ');
 INSERT INTO "hand_mapping" VALUES ('SUPPLEMENT(1)','s ˈɐ p l ɪ m ə n t','sa pv ri ma nv tv','サプリマント','サプリメント');
 INSERT INTO "hand_mapping" VALUES ('SUPPLEMENT(2)','s ɐ p l ɪ m ˈɛ n t','sa pv ri me nv tv','サプリメント','サプリメント');
@@ -14409,7 +14409,7 @@ INSERT INTO "hand_mapping" VALUES ('SUPPORTED','s ə p ˈɔː t ɪ d','sa po - t
 INSERT INTO "hand_mapping" VALUES ('SUPPORTER','s ə p ˈɔː t ə','sa po - ta','サポータ','サポータ');
 INSERT INTO "hand_mapping" VALUES ('SUPPORTERS','s ə p ˈɔː t ə z','sa po - ta zv','サポータズ','サポータズ');
 INSERT INTO "hand_mapping" VALUES ('SUPPORTING','s ə p ˈɔː t ɪ ŋ','sa po - ti Nv','サポーティン','サポーティング');
-INSERT INTO "hand_mapping" VALUES ('SUPPORTIVE','s ə p ˈɔː t ɪ v','sa po - ti bv','サポーティブ','サポーティブ');
+INSERT INTO "hand_mapping" VALUES ('SUPPORTIVE','s ə p ˈɔː t ɪ v','sa po - ti Vv','サポーティブ','サポーティブ');
 INSERT INTO "hand_mapping" VALUES ('SUPPORTS','s ə p ˈɔː t s','sa po - tsv','サポーツ','サポーツ');
 INSERT INTO "hand_mapping" VALUES ('SUPPOSE','s ə p ˈəʊ z','sa po - zv','サポーズ','サポーズ');
 INSERT INTO "hand_mapping" VALUES ('SUPPOSED','s ə p ˈəʊ z d','sa po - zv dv','サポーズド','サポーズド');
@@ -14445,20 +14445,20 @@ INSERT INTO "hand_mapping" VALUES ('SURROUND','s ə ɹ ˈaʊ n d','sa ra u nv dv
 INSERT INTO "hand_mapping" VALUES ('SURROUNDED','s ə ɹ ˈaʊ n d ɪ d','sa ra u nv di dv','サラウンディド','サラウンディド');
 INSERT INTO "hand_mapping" VALUES ('SURROUNDING','s ə ɹ ˈaʊ n d ɪ ŋ','sa ra u nv di Nv','サラウンディン','サラウンディング');
 INSERT INTO "hand_mapping" VALUES ('SURROUNDINGS','s ə ɹ ˈaʊ n d ɪ ŋ z','sa ra u nv di Nv zv','サラウンディンズ','サラウンディンズ');
-INSERT INTO "hand_mapping" VALUES ('SURVEILLANCE','s ə v ˈeɪ l ə n s','sa be i ra nv sv','サベイランス','サベイランス');
-INSERT INTO "hand_mapping" VALUES ('SURVEY(1)','s ə v ˈeɪ','sa be i','サベイ','サベイ');
-INSERT INTO "hand_mapping" VALUES ('SURVEY(2)','s ˈɜː v ˌeɪ','se - be i','セーベイ','セーベイ');
-INSERT INTO "hand_mapping" VALUES ('SURVEYOR','s ə v ˈeɪ ə','sa be i a','サベイア','サベイア');
-INSERT INTO "hand_mapping" VALUES ('SURVEYORS','s ə v ˈeɪ ə z','sa be i a zv','サベイアズ','サベイアズ');
-INSERT INTO "hand_mapping" VALUES ('SURVEYS(1)','s ə v ˈeɪ z','sa be i zv','サベイズ','サベイズ');
-INSERT INTO "hand_mapping" VALUES ('SURVEYS(2)','s ˈɜː v ˌeɪ z','se - be i zv','セーベイズ','セーベイズ');
-INSERT INTO "hand_mapping" VALUES ('SURVIVAL','s ə v ˈaɪ v ə l','sa ba i ba rv','サバイバル','サバイバル');
-INSERT INTO "hand_mapping" VALUES ('SURVIVE','s ə v ˈaɪ v','sa ba i bv','サバイブ','サバイブ');
-INSERT INTO "hand_mapping" VALUES ('SURVIVED','s ə v ˈaɪ v d','sa ba i bv dv','サバイブド','サバイブド');
-INSERT INTO "hand_mapping" VALUES ('SURVIVES','s ə v ˈaɪ v z','sa ba i bv zv','サバイブズ','サバイブズ');
-INSERT INTO "hand_mapping" VALUES ('SURVIVING','s ə v ˈaɪ v ɪ ŋ','sa ba i bi Nv','サバイビン','サバイビング');
-INSERT INTO "hand_mapping" VALUES ('SURVIVOR','s ə v ˈaɪ v ə','sa ba i ba','サバイバ','サバイバ');
-INSERT INTO "hand_mapping" VALUES ('SURVIVORS','s ə v ˈaɪ v ə z','sa ba i ba zv','サバイバズ','サバイバズ');
+INSERT INTO "hand_mapping" VALUES ('SURVEILLANCE','s ə v ˈeɪ l ə n s','sa Ve i ra nv sv','サベイランス','サベイランス');
+INSERT INTO "hand_mapping" VALUES ('SURVEY(1)','s ə v ˈeɪ','sa Ve i','サベイ','サベイ');
+INSERT INTO "hand_mapping" VALUES ('SURVEY(2)','s ˈɜː v ˌeɪ','se - Ve i','セーベイ','セーベイ');
+INSERT INTO "hand_mapping" VALUES ('SURVEYOR','s ə v ˈeɪ ə','sa Ve i a','サベイア','サベイア');
+INSERT INTO "hand_mapping" VALUES ('SURVEYORS','s ə v ˈeɪ ə z','sa Ve i a zv','サベイアズ','サベイアズ');
+INSERT INTO "hand_mapping" VALUES ('SURVEYS(1)','s ə v ˈeɪ z','sa Ve i zv','サベイズ','サベイズ');
+INSERT INTO "hand_mapping" VALUES ('SURVEYS(2)','s ˈɜː v ˌeɪ z','se - Ve i zv','セーベイズ','セーベイズ');
+INSERT INTO "hand_mapping" VALUES ('SURVIVAL','s ə v ˈaɪ v ə l','sa Va i Va rv','サバイバル','サバイバル');
+INSERT INTO "hand_mapping" VALUES ('SURVIVE','s ə v ˈaɪ v','sa Va i Vv','サバイブ','サバイブ');
+INSERT INTO "hand_mapping" VALUES ('SURVIVED','s ə v ˈaɪ v d','sa Va i Vv dv','サバイブド','サバイブド');
+INSERT INTO "hand_mapping" VALUES ('SURVIVES','s ə v ˈaɪ v z','sa Va i Vv zv','サバイブズ','サバイブズ');
+INSERT INTO "hand_mapping" VALUES ('SURVIVING','s ə v ˈaɪ v ɪ ŋ','sa Va i Vi Nv','サバイビン','サバイビング');
+INSERT INTO "hand_mapping" VALUES ('SURVIVOR','s ə v ˈaɪ v ə','sa Va i Va','サバイバ','サバイバ');
+INSERT INTO "hand_mapping" VALUES ('SURVIVORS','s ə v ˈaɪ v ə z','sa Va i Va zv','サバイバズ','サバイバズ');
 INSERT INTO "hand_mapping" VALUES ('SUSAN','s ˈuː z ə n','su - za nv','スーザン','スーザン');
 INSERT INTO "hand_mapping" VALUES ('SUSCEPTIBLE','s ə s ˈɛ p t ɪ b ə l','sa se pv ti ba rv','サセプティバル','サセプティバル');
 INSERT INTO "hand_mapping" VALUES ('SUSHI','s ˈuː ʃ i','su - syi -','スーシー','スーシー');
@@ -14531,7 +14531,7 @@ INSERT INTO "hand_mapping" VALUES ('SWITCHED','s w ˈɪ tʃ t','swi tyv tv','ス
 INSERT INTO "hand_mapping" VALUES ('SWITCHES','s w ˈɪ tʃ ɪ z','swi tyi zv','スィチィズ','スィチィズ');
 INSERT INTO "hand_mapping" VALUES ('SWITCHING','s w ˈɪ tʃ ɪ ŋ','swi tyi Nv','スィチィン','スィチィング');
 INSERT INTO "hand_mapping" VALUES ('SWITZERLAND','s w ˈɪ t s ə l ə n d','swi tsa ra nv dv','スィツァランド','スィツァランド');
-INSERT INTO "hand_mapping" VALUES ('SWIVEL','s w ˈɪ v ə l','swi ba rv','スィバル','スィバル');
+INSERT INTO "hand_mapping" VALUES ('SWIVEL','s w ˈɪ v ə l','swi Va rv','スィバル','スィバル');
 INSERT INTO "hand_mapping" VALUES ('SWOLLEN','s w ˈəʊ l ə n','swo - ra nv','スォーラン','スォーラン');
 INSERT INTO "hand_mapping" VALUES ('SWOOP','s w ˈuː p','swu - pv','スゥープ','スゥープ');
 INSERT INTO "hand_mapping" VALUES ('SWORD','s ˈɔː d','so - dv','ソード','ソード');
@@ -14606,7 +14606,7 @@ INSERT INTO "hand_mapping" VALUES ('TAINT','t ˈeɪ n t','te i nv tv','テイン
 INSERT INTO "hand_mapping" VALUES ('TAIWAN','t aɪ w ˈɑː n','ta i wa - nv','タイワーン','タイワーン');
 INSERT INTO "hand_mapping" VALUES ('TAKE','t ˈeɪ k','te i kv','テイク','テイク');
 INSERT INTO "hand_mapping" VALUES ('TAKEN','t ˈeɪ k ə n','te i ka nv','テイカン','テイカン');
-INSERT INTO "hand_mapping" VALUES ('TAKEOVER','t ˈeɪ k ˌəʊ v ə','te i ko ba','テイコバ','テイコバ');
+INSERT INTO "hand_mapping" VALUES ('TAKEOVER','t ˈeɪ k ˌəʊ v ə','te i ko Va','テイコバ','テイコバ');
 INSERT INTO "hand_mapping" VALUES ('TAKER','t ˈeɪ k ə','te i ka','テイカ','テイカ');
 INSERT INTO "hand_mapping" VALUES ('TAKES','t ˈeɪ k s','te i kv sv','テイクス','テイクス');
 INSERT INTO "hand_mapping" VALUES ('TAKING','t ˈeɪ k ɪ ŋ','te i ki Nv','テイキン','テイキング');
@@ -14659,7 +14659,7 @@ INSERT INTO "hand_mapping" VALUES ('TATTOO','t ə t ˈuː','ta tu -','タトゥ
 INSERT INTO "hand_mapping" VALUES ('TAUGHT','t ˈɔː t','to - tv','トート','トート');
 INSERT INTO "hand_mapping" VALUES ('TAUNT','t ˈɔː n t','to - nv tv','トーント','トーント');
 INSERT INTO "hand_mapping" VALUES ('TAUT','t ˈɔː t','to - tv','トート','トート');
-INSERT INTO "hand_mapping" VALUES ('TAVERN','t ˈæ v ə n','ta ba nv','タバン','タバン');
+INSERT INTO "hand_mapping" VALUES ('TAVERN','t ˈæ v ə n','ta Va nv','タバン','タバン');
 INSERT INTO "hand_mapping" VALUES ('TAX','t ˈæ k s','ta x kv sv','タックス','タックス');
 INSERT INTO "hand_mapping" VALUES ('TAXATION','t ˌæ k s ˈeɪ ʃ ə n','ta x kv se i sya nv','タックセイシャン','タックセイション');
 INSERT INTO "hand_mapping" VALUES ('TAXES','t ˈæ k s ɪ z','ta x kv si zv','タックシズ','タックシズ');
@@ -14717,10 +14717,10 @@ INSERT INTO "hand_mapping" VALUES ('TELEPHONE','t ˈɛ l ɪ f ˌəʊ n','te ri f
 INSERT INTO "hand_mapping" VALUES ('TELEPHONY','t ɪ l ˈɛ f ə n i','ti re fa ni -','ティレファニー','ティレファニー');
 INSERT INTO "hand_mapping" VALUES ('TELESCOPE','t ˈɛ l ɪ s k ˌəʊ p','te ri sv ko pv','テリスコプ','テリスコプ');
 INSERT INTO "hand_mapping" VALUES ('TELETEXT','t ˈɛ l ɪ t ˌɛ k s t','te ri te - kv sv tv','テリテークスト','テリテークスト');
-INSERT INTO "hand_mapping" VALUES ('TELEVISION(1)','t ˈɛ l ɪ v ˌɪ ʒ ə n','te ri bi - jya nv','テリビージャン','テリビージョン');
-INSERT INTO "hand_mapping" VALUES ('TELEVISION(2)','t ˌɛ l ɪ v ˈɪ ʒ ə n','te - ri bi jya nv','テーリビジャン','テーリビジョン');
-INSERT INTO "hand_mapping" VALUES ('TELEVISIONS(1)','t ˈɛ l ɪ v ˌɪ ʒ ə n z','te ri bi - jya nv zv','テリビージャンズ','テリビージャンズ');
-INSERT INTO "hand_mapping" VALUES ('TELEVISIONS(2)','t ˌɛ l ɪ v ˈɪ ʒ ə n z','te - ri bi jya nv zv','テーリビジャンズ','テーリビジャンズ');
+INSERT INTO "hand_mapping" VALUES ('TELEVISION(1)','t ˈɛ l ɪ v ˌɪ ʒ ə n','te ri Vi - jya nv','テリビージャン','テリビージョン');
+INSERT INTO "hand_mapping" VALUES ('TELEVISION(2)','t ˌɛ l ɪ v ˈɪ ʒ ə n','te - ri Vi jya nv','テーリビジャン','テーリビジョン');
+INSERT INTO "hand_mapping" VALUES ('TELEVISIONS(1)','t ˈɛ l ɪ v ˌɪ ʒ ə n z','te ri Vi - jya nv zv','テリビージャンズ','テリビージャンズ');
+INSERT INTO "hand_mapping" VALUES ('TELEVISIONS(2)','t ˌɛ l ɪ v ˈɪ ʒ ə n z','te - ri Vi jya nv zv','テーリビジャンズ','テーリビジャンズ');
 INSERT INTO "hand_mapping" VALUES ('TELL','t ˈɛ l','te rv','テル','テル');
 INSERT INTO "hand_mapping" VALUES ('TELLING','t ˈɛ l ɪ ŋ','te ri Nv','テリン','テリング');
 INSERT INTO "hand_mapping" VALUES ('TELLS','t ˈɛ l z','te rv zv','テルズ','テルズ');
@@ -14823,7 +14823,7 @@ INSERT INTO "hand_mapping" VALUES ('THAN(1)','ð ə n','za nv','ザン','ザン'
 INSERT INTO "hand_mapping" VALUES ('THAN(2)','ð ˈæ n','za nv','ザン','ザン');
 INSERT INTO "hand_mapping" VALUES ('THANK','θ ˈæ ŋ k','sa Nv kv','サンク','サンク');
 INSERT INTO "hand_mapping" VALUES ('THANKS','θ ˈæ ŋ k s','sa Nv kv sv','サンクス','サンクス');
-INSERT INTO "hand_mapping" VALUES ('THANKSGIVING','θ ˈæ ŋ k s g ˌɪ v ɪ ŋ','sa Nv kv sv gi - bi Nv','サンクスギービン','サンクスギービング');
+INSERT INTO "hand_mapping" VALUES ('THANKSGIVING','θ ˈæ ŋ k s g ˌɪ v ɪ ŋ','sa Nv kv sv gi - Vi Nv','サンクスギービン','サンクスギービング');
 INSERT INTO "hand_mapping" VALUES ('THANKYOU','θ ˈæ ŋ k j uː','sa Nv kyu -','サンキュー','サンキュー');
 INSERT INTO "hand_mapping" VALUES ('THAT(1)','ð ə t','za tv','ザト','ザト');
 INSERT INTO "hand_mapping" VALUES ('THAT(2)','ð ˈæ t','za x tv','ザット','ザット');
@@ -14844,8 +14844,8 @@ INSERT INTO "hand_mapping" VALUES ('THEM(1)','ð ə m','za mv','ザム','ザム'
 INSERT INTO "hand_mapping" VALUES ('THEM(2)','ð ˈɛ m','ze mv','ゼム','ゼム');
 INSERT INTO "hand_mapping" VALUES ('THEME','θ ˈiː m','si - mv','シーム','シーム');
 INSERT INTO "hand_mapping" VALUES ('THEMES','θ ˈiː m z','si - mv zv','シームズ','シームズ');
-INSERT INTO "hand_mapping" VALUES ('THEMSELVES(1)','ð ə m s ˈɛ l v z','za mv se rv bv zv','ザムセルブズ','ザムセルブズ');
-INSERT INTO "hand_mapping" VALUES ('THEMSELVES(2)','ð ɛ m s ˈɛ l v z','ze mv se rv bv zv','ゼムセルブズ','ゼムセルブズ');
+INSERT INTO "hand_mapping" VALUES ('THEMSELVES(1)','ð ə m s ˈɛ l v z','za mv se rv Vv zv','ザムセルブズ','ザムセルブズ');
+INSERT INTO "hand_mapping" VALUES ('THEMSELVES(2)','ð ɛ m s ˈɛ l v z','ze mv se rv Vv zv','ゼムセルブズ','ゼムセルブズ');
 INSERT INTO "hand_mapping" VALUES ('THEN','ð ˈɛ n','ze nv','ゼン','ゼン');
 INSERT INTO "hand_mapping" VALUES ('THEOLOGY','θ ɪ ˈɒ l ə dʒ i','si o ra jyi -','シオラジィー','シオラジィー');
 INSERT INTO "hand_mapping" VALUES ('THEOREM','θ ˈɪə ɹ ə m','si a ra mv','シアラム','シアラム');
@@ -14861,7 +14861,7 @@ INSERT INTO "hand_mapping" VALUES ('THEREAFTER','ð ˌɛə ɹ ˈɑː f t ə','ze
 INSERT INTO "hand_mapping" VALUES ('THEREBY','ð ˌɛə b ˈaɪ','ze a - ba i','ゼアーバイ','ゼアーバイ');
 INSERT INTO "hand_mapping" VALUES ('THEREFORE','ð ˈɛə f ˌɔː','ze a fo -','ゼアフォー','ゼアフォー');
 INSERT INTO "hand_mapping" VALUES ('THEREIN','ð ˌɛə ɹ ˈɪ n','ze a - ri nv','ゼアーリン','ゼアーリン');
-INSERT INTO "hand_mapping" VALUES ('THEREOF','ð ˌɛə ɹ ˈɒ v','ze a - ro bv','ゼアーロブ','ゼアーロブ');
+INSERT INTO "hand_mapping" VALUES ('THEREOF','ð ˌɛə ɹ ˈɒ v','ze a - ro Vv','ゼアーロブ','ゼアーロブ');
 INSERT INTO "hand_mapping" VALUES ('THERESA(1)','t ə ɹ ˈiː s ə','ta ri - sa','タリーサ','タリーサ');
 INSERT INTO "hand_mapping" VALUES ('THERESA(2)','t ə ɹ ˈeɪ s ə','ta re i sa','タレイサ','タレイサ');
 INSERT INTO "hand_mapping" VALUES ('THERMAL','θ ˈɜː m ə l','se - ma rv','セーマル','セーマル');
@@ -14876,7 +14876,7 @@ INSERT INTO "hand_mapping" VALUES ('THICK','θ ˈɪ k','si kv','シク','シク'
 INSERT INTO "hand_mapping" VALUES ('THICKER','θ ˈɪ k ə','si ka','シカ','シカ');
 INSERT INTO "hand_mapping" VALUES ('THICKNESS','θ ˈɪ k n ɪ s','si kv ni sv','シクニス','シクニス');
 INSERT INTO "hand_mapping" VALUES ('THIEF','θ ˈiː f','si - fv','シーフ','シーフ');
-INSERT INTO "hand_mapping" VALUES ('THIEVES','θ ˈiː v z','si - bv zv','シーブズ','シーブズ');
+INSERT INTO "hand_mapping" VALUES ('THIEVES','θ ˈiː v z','si - Vv zv','シーブズ','シーブズ');
 INSERT INTO "hand_mapping" VALUES ('THIGH','θ ˈaɪ','sa i','サイ','サイ');
 INSERT INTO "hand_mapping" VALUES ('THIN','θ ˈɪ n','si nv','シン','シン');
 INSERT INTO "hand_mapping" VALUES ('THING','θ ˈɪ ŋ','si Nv','シン','シング');
@@ -14935,7 +14935,7 @@ INSERT INTO "hand_mapping" VALUES ('THREW','θ ɹ ˈuː','sv ru -','スルー','
 INSERT INTO "hand_mapping" VALUES ('THRICE','θ ɹ ˈaɪ s','sv ra i sv','スライス','スライス');
 INSERT INTO "hand_mapping" VALUES ('THRILL','θ ɹ ˈɪ l','sv ri rv','スリル','スリル');
 INSERT INTO "hand_mapping" VALUES ('THRILLER','θ ɹ ˈɪ l ə','sv ri ra','スリラ','スリラ');
-INSERT INTO "hand_mapping" VALUES ('THRIVE','θ ɹ ˈaɪ v','sv ra i bv','スライブ','スライブ');
+INSERT INTO "hand_mapping" VALUES ('THRIVE','θ ɹ ˈaɪ v','sv ra i Vv','スライブ','スライブ');
 INSERT INTO "hand_mapping" VALUES ('THROAT','θ ɹ ˈəʊ t','sv ro - tv','スロート','スロート');
 INSERT INTO "hand_mapping" VALUES ('THROB','θ ɹ ˈɒ b','sv ro bv','スロブ','スロブ');
 INSERT INTO "hand_mapping" VALUES ('THROES','θ ɹ ˈəʊ z','sv ro - zv','スローズ','スローズ');
@@ -15094,7 +15094,7 @@ INSERT INTO "hand_mapping" VALUES ('TOPLESS','t ˈɒ p l ɪ s','to x pv ri sv','
 INSERT INTO "hand_mapping" VALUES ('TOPS','t ˈɒ p s','to x pv sv','トップス','トップス');
 INSERT INTO "hand_mapping" VALUES ('TORCH','t ˈɔː tʃ','to - tyv','トーチュ','トーチュ');
 INSERT INTO "hand_mapping" VALUES ('TORE','t ˈɔː','to -','トー','トー');
-INSERT INTO "hand_mapping" VALUES ('TORFAEN','t ˈɔː v ˌæ n','to - ba nv','トーバン','トーバン');
+INSERT INTO "hand_mapping" VALUES ('TORFAEN','t ˈɔː v ˌæ n','to - Va nv','トーバン','トーバン');
 INSERT INTO "hand_mapping" VALUES ('TORIES','t ˈɔː ɹ i z','to - ri - zv','トーリーズ','トーリーズ');
 INSERT INTO "hand_mapping" VALUES ('TORN','t ˈɔː n','to - nv','トーン','トーン');
 INSERT INTO "hand_mapping" VALUES ('TORNADO','t ɔː n ˈeɪ d əʊ','to - ne i do','トーネイド','トーネイド');
@@ -15241,17 +15241,17 @@ INSERT INTO "hand_mapping" VALUES ('TRAP','t ɹ ˈæ p','tv ra x pv','トラッ
 INSERT INTO "hand_mapping" VALUES ('TRAPPED','t ɹ ˈæ p t','tv ra x pv tv','トラップト','トラップト');
 INSERT INTO "hand_mapping" VALUES ('TRASH','t ɹ ˈæ ʃ','tv ra x syv','トラッシュ','トラッシュ');
 INSERT INTO "hand_mapping" VALUES ('TRAUMA','t ɹ ˈɔː m ə','tv ro - ma','トローマ','トローマ');
-INSERT INTO "hand_mapping" VALUES ('TRAVEL','t ɹ ˈæ v ə l','tv ra ba rv','トラバル','トラバル');
-INSERT INTO "hand_mapping" VALUES ('TRAVELER','t ɹ ˈæ v ə l ə','tv ra ba ra','トラバラ','トラバラ');
-INSERT INTO "hand_mapping" VALUES ('TRAVELERS','t ɹ ˈæ v ə l ə z','tv ra ba ra zv','トラバラズ','トラバラズ');
-INSERT INTO "hand_mapping" VALUES ('TRAVELING','t ɹ ˈæ v ə l ɪ ŋ','tv ra ba ri Nv','トラバリン','トラバリング');
-INSERT INTO "hand_mapping" VALUES ('TRAVELLED','t ɹ ˈæ v ə l d','tv ra ba rv dv','トラバルド','トラバルド');
-INSERT INTO "hand_mapping" VALUES ('TRAVELLER','t ɹ ˈæ v ə l ə','tv ra ba ra','トラバラ','トラバラ');
-INSERT INTO "hand_mapping" VALUES ('TRAVELLERS','t ɹ ˈæ v ə l ə z','tv ra ba ra zv','トラバラズ','トラバラズ');
-INSERT INTO "hand_mapping" VALUES ('TRAVELLING(1)','t ɹ ˈæ v l ɪ ŋ','tv ra bv ri Nv','トラブリン','トラブリング');
-INSERT INTO "hand_mapping" VALUES ('TRAVELLING(2)','t ɹ ˈæ v ə l ɪ ŋ','tv ra ba ri Nv','トラバリン','トラバリング');
-INSERT INTO "hand_mapping" VALUES ('TRAVELS','t ɹ ˈæ v ə l z','tv ra ba rv zv','トラバルズ','トラバルズ');
-INSERT INTO "hand_mapping" VALUES ('TRAVIS','t ɹ ˈæ v ɪ s','tv ra bi sv','トラビス','トラビス');
+INSERT INTO "hand_mapping" VALUES ('TRAVEL','t ɹ ˈæ v ə l','tv ra Va rv','トラバル','トラバル');
+INSERT INTO "hand_mapping" VALUES ('TRAVELER','t ɹ ˈæ v ə l ə','tv ra Va ra','トラバラ','トラバラ');
+INSERT INTO "hand_mapping" VALUES ('TRAVELERS','t ɹ ˈæ v ə l ə z','tv ra Va ra zv','トラバラズ','トラバラズ');
+INSERT INTO "hand_mapping" VALUES ('TRAVELING','t ɹ ˈæ v ə l ɪ ŋ','tv ra Va ri Nv','トラバリン','トラバリング');
+INSERT INTO "hand_mapping" VALUES ('TRAVELLED','t ɹ ˈæ v ə l d','tv ra Va rv dv','トラバルド','トラバルド');
+INSERT INTO "hand_mapping" VALUES ('TRAVELLER','t ɹ ˈæ v ə l ə','tv ra Va ra','トラバラ','トラバラ');
+INSERT INTO "hand_mapping" VALUES ('TRAVELLERS','t ɹ ˈæ v ə l ə z','tv ra Va ra zv','トラバラズ','トラバラズ');
+INSERT INTO "hand_mapping" VALUES ('TRAVELLING(1)','t ɹ ˈæ v l ɪ ŋ','tv ra Vv ri Nv','トラブリン','トラブリング');
+INSERT INTO "hand_mapping" VALUES ('TRAVELLING(2)','t ɹ ˈæ v ə l ɪ ŋ','tv ra Va ri Nv','トラバリン','トラバリング');
+INSERT INTO "hand_mapping" VALUES ('TRAVELS','t ɹ ˈæ v ə l z','tv ra Va rv zv','トラバルズ','トラバルズ');
+INSERT INTO "hand_mapping" VALUES ('TRAVIS','t ɹ ˈæ v ɪ s','tv ra Vi sv','トラビス','トラビス');
 INSERT INTO "hand_mapping" VALUES ('TRAWL','t ɹ ˈɔː l','tv ro - rv','トロール','トロール');
 INSERT INTO "hand_mapping" VALUES ('TRAY','t ɹ ˈeɪ','tv re i','トレイ','トレイ');
 INSERT INTO "hand_mapping" VALUES ('TRAYS','t ɹ ˈeɪ z','tv re i zv','トレイズ','トレイズ');
@@ -15276,7 +15276,7 @@ INSERT INTO "hand_mapping" VALUES ('TRENCH','t ɹ ˈɛ n tʃ','tv re nv tyv','
 INSERT INTO "hand_mapping" VALUES ('TREND','t ɹ ˈɛ n d','tv re nv dv','トレンド','トレンド');
 INSERT INTO "hand_mapping" VALUES ('TRENDS','t ɹ ˈɛ n d z','tv re nv zv','トレンズ','トレンズ');
 INSERT INTO "hand_mapping" VALUES ('TRENT','t ɹ ˈɛ n t','tv re nv tv','トレント','トレント');
-INSERT INTO "hand_mapping" VALUES ('TREVOR','t ɹ ˈɛ v ə','tv re ba','トレバ','トレバ');
+INSERT INTO "hand_mapping" VALUES ('TREVOR','t ɹ ˈɛ v ə','tv re Va','トレバ','トレバ');
 INSERT INTO "hand_mapping" VALUES ('TRIAL(1)','t ɹ ˈaɪ l','tv ra i rv','トライル','トライル');
 INSERT INTO "hand_mapping" VALUES ('TRIAL(2)','t ɹ ˈaɪ ə l','tv ra i a rv','トライアル','トライアル');
 INSERT INTO "hand_mapping" VALUES ('TRIALS(1)','t ɹ ˈaɪ l z','tv ra i rv zv','トライルズ','トライルズ');
@@ -15311,8 +15311,8 @@ INSERT INTO "hand_mapping" VALUES ('TRIPS','t ɹ ˈɪ p s','tv ri pv sv','トリ
 INSERT INTO "hand_mapping" VALUES ('TRISH','t ɹ ˈɪ ʃ','tv ri syv','トリシュ','トリシュ');
 INSERT INTO "hand_mapping" VALUES ('TRITE','t ɹ ˈaɪ t','tv ra i tv','トライト','トライト');
 INSERT INTO "hand_mapping" VALUES ('TRIUMPH','t ɹ ˈaɪ ə m f','tv ra i a mv fv','トライアムフ','トライアムフ');
-INSERT INTO "hand_mapping" VALUES ('TRIVIA','t ɹ ˈɪ v ɪə','tv ri bi a','トリビア','トリビア');
-INSERT INTO "hand_mapping" VALUES ('TRIVIAL','t ɹ ˈɪ v ɪə l','tv ri bi a rv','トリビアル','トリビアル');
+INSERT INTO "hand_mapping" VALUES ('TRIVIA','t ɹ ˈɪ v ɪə','tv ri Vi a','トリビア','トリビア');
+INSERT INTO "hand_mapping" VALUES ('TRIVIAL','t ɹ ˈɪ v ɪə l','tv ri Vi a rv','トリビアル','トリビアル');
 INSERT INTO "hand_mapping" VALUES ('TROD','t ɹ ˈɒ d','tv ro dv','トロド','トロド');
 INSERT INTO "hand_mapping" VALUES ('TRODDEN','t ɹ ˈɒ d ə n','tv ro da nv','トロダン','トロダン');
 INSERT INTO "hand_mapping" VALUES ('TROLL(1)','t ɹ ˈɒ l','tv ro rv','トロル','トロル');
@@ -15391,7 +15391,7 @@ INSERT INTO "hand_mapping" VALUES ('TURN','t ˈɜː n','te - nv','テーン','
 INSERT INTO "hand_mapping" VALUES ('TURNED','t ˈɜː n d','te - nv dv','テーンド','テーンド');
 INSERT INTO "hand_mapping" VALUES ('TURNER','t ˈɜː n ə','te - na','テーナ','テーナ');
 INSERT INTO "hand_mapping" VALUES ('TURNING','t ˈɜː n ɪ ŋ','te - ni Nv','テーニン','テーニング');
-INSERT INTO "hand_mapping" VALUES ('TURNOVER','t ˈɜː n ˌəʊ v ə','te - no ba','テーノバ','テーノバ');
+INSERT INTO "hand_mapping" VALUES ('TURNOVER','t ˈɜː n ˌəʊ v ə','te - no Va','テーノバ','テーノバ');
 INSERT INTO "hand_mapping" VALUES ('TURNS','t ˈɜː n z','te - nv zv','テーンズ','テーンズ');
 INSERT INTO "hand_mapping" VALUES ('TURQUOISE(1)','t ˈɜː k w ɔɪ z','te - kwo i zv','テークォイズ','テークォイズ');
 INSERT INTO "hand_mapping" VALUES ('TURQUOISE(2)','t ˈɜː k w ɑː z','te - kwa zv','テークァズ','テークァズ');
@@ -15410,11 +15410,11 @@ INSERT INTO "hand_mapping" VALUES ('TWEED','t w ˈiː d','twi - dv','トウィ
 INSERT INTO "hand_mapping" VALUES ('TWEET','t w ˈiː t','twi - tv','トウィート','トウィート');
 INSERT INTO "hand_mapping" VALUES ('TWELFTH','t w ˈɛ l f θ','twe rv fv sv','トウェルフス','トウェルフス');
 INSERT INTO "hand_mapping" VALUES ('TWELFTHS','t w ˈɛ l f θ s','twe rv fv sv sv','トウェルフスス','トウェルフスス');
-INSERT INTO "hand_mapping" VALUES ('TWELVE','t w ˈɛ l v','twe rv bv','トウェルブ','トウェルブ');
+INSERT INTO "hand_mapping" VALUES ('TWELVE','t w ˈɛ l v','twe rv Vv','トウェルブ','トウェルブ');
 INSERT INTO "hand_mapping" VALUES ('TWENTIES','t w ˈɛ n t i z','twe nv ti - zv','トウェンティーズ','トウェンティーズ');
 INSERT INTO "hand_mapping" VALUES ('TWENTIETH','t w ˈɛ n t i ɪ θ','twe nv ti - i sv','トウェンティーイス','トウェンティーイス');
 INSERT INTO "hand_mapping" VALUES ('TWENTY','t w ˈɛ n t i','twe nv ti -','トウェンティー','トウェンティー');
-INSERT INTO "hand_mapping" VALUES ('TWENTY-FIVE','t w ˌɛ n t iː f ˈaɪ v','twe - nv ti - fa i bv','トウェーンティーファイブ','トウェーンティーファイブ');
+INSERT INTO "hand_mapping" VALUES ('TWENTY-FIVE','t w ˌɛ n t iː f ˈaɪ v','twe - nv ti - fa i Vv','トウェーンティーファイブ','トウェーンティーファイブ');
 INSERT INTO "hand_mapping" VALUES ('TWICE','t w ˈaɪ s','twa i sv','トワイス','トワイス');
 INSERT INTO "hand_mapping" VALUES ('TWIG','t w ˈɪ g','twi gv','トウィグ','トウィグ');
 INSERT INTO "hand_mapping" VALUES ('TWIN','t w ˈɪ n','twi nv','トウィン','トウィン');
@@ -15463,9 +15463,9 @@ INSERT INTO "hand_mapping" VALUES ('UNACCEPTABLE','ˌɐ n ə k s ˈɛ p t ə b 
 INSERT INTO "hand_mapping" VALUES ('UNADORNED','ɐ n ə d ˈɔː n d','a na do - nv dv','アナドーンド','アナドーンド');
 INSERT INTO "hand_mapping" VALUES ('UNANIMOUS','j uː n ˈæ n ɪ m ə s','yu - na ni ma sv','ユーナニマス','ユーナニマス');
 INSERT INTO "hand_mapping" VALUES ('UNAUTHORIZED','ɐ n ˈɔː θ ə ɹ ˌaɪ z d','a no - sa ra i zv dv','アノーサライズド','アノーサライズド');
-INSERT INTO "hand_mapping" VALUES ('UNAVAILABLE','ˌɐ n ə v ˈeɪ l ə b ə l','a na be i ra ba rv','アナベイラバル','アナベイラバル');
+INSERT INTO "hand_mapping" VALUES ('UNAVAILABLE','ˌɐ n ə v ˈeɪ l ə b ə l','a na Ve i ra ba rv','アナベイラバル','アナベイラバル');
 INSERT INTO "hand_mapping" VALUES ('UNAWARE','ˌɐ n ə w ˈɛə','a na we a','アナウェア','アナウェア');
-INSERT INTO "hand_mapping" VALUES ('UNBELIEVABLE','ˌɐ n b ə l ˈiː v ə b ə l','a nv ba ri - ba ba rv','アンバリーババル','アンバリーババル');
+INSERT INTO "hand_mapping" VALUES ('UNBELIEVABLE','ˌɐ n b ə l ˈiː v ə b ə l','a nv ba ri - Va ba rv','アンバリーババル','アンバリーババル');
 INSERT INTO "hand_mapping" VALUES ('UNCERTAIN','ɐ n s ˈɜː t ə n','a nv se - ta nv','アンセータン','アンセータン');
 INSERT INTO "hand_mapping" VALUES ('UNCERTAINTY','ɐ n s ˈɜː t ə n t i','a nv se - ta nv ti -','アンセータンティー','アンセータンティー');
 INSERT INTO "hand_mapping" VALUES ('UNCHANGED','ɐ n tʃ ˈeɪ n dʒ d','a nv tye i nv jyv dv','アンチェインジュド','アンチェインジュド');
@@ -15473,7 +15473,7 @@ INSERT INTO "hand_mapping" VALUES ('UNCLE','ˈɐ ŋ k ə l','a Nv ka rv','アン
 INSERT INTO "hand_mapping" VALUES ('UNCLEAR','ɐ n k l ˈɪə','a nv kv ri a','アンクリア','アンクリア');
 INSERT INTO "hand_mapping" VALUES ('UNCOMFORTABLE','ɐ n k ˈɐ m f ə t ə b ə l','a nv ka mv fa ta ba rv','アンカムファタバル','アンカムファタバル');
 INSERT INTO "hand_mapping" VALUES ('UNCONSCIOUS','ɐ n k ˈɒ n ʃ ə s','a nv ko nv sya sv','アンコンシャス','アンコンシャス');
-INSERT INTO "hand_mapping" VALUES ('UNCOVER','ɐ n k ˈɐ v ə','a nv ka ba','アンカバ','アンカバ');
+INSERT INTO "hand_mapping" VALUES ('UNCOVER','ɐ n k ˈɐ v ə','a nv ka Va','アンカバ','アンカバ');
 INSERT INTO "hand_mapping" VALUES ('UNDEFINED','ˌɐ n d ɪ f ˈaɪ n d','a nv di fa i nv dv','アンディファインド','アンディファインド');
 INSERT INTO "hand_mapping" VALUES ('UNDER','ˈɐ n d ə','a nv da','アンダ','アンダ');
 INSERT INTO "hand_mapping" VALUES ('UNDERGO','ˌɐ n d ə g ˈəʊ','a nv da go -','アンダゴー','アンダゴー');
@@ -15505,7 +15505,7 @@ INSERT INTO "hand_mapping" VALUES ('UNEASY','ɐ n ˈiː z i','a ni - zi -','ア
 INSERT INTO "hand_mapping" VALUES ('UNEMPLOYED','ˌɐ n ɛ m p l ˈɔɪ d','a ne npv ro i dv','アネンプロイド','アネンプロイド');
 INSERT INTO "hand_mapping" VALUES ('UNEMPLOYMENT','ˌɐ n ɪ m p l ˈɔɪ m ə n t','a ni npv ro i ma nv tv','アニンプロイマント','アニンプロイメント');
 INSERT INTO "hand_mapping" VALUES ('UNESCO','j uː n ˈɛ s k əʊ','yu - ne sv ko','ユーネスコ','ユーネスコ');
-INSERT INTO "hand_mapping" VALUES ('UNEVEN','ɐ n ˈiː v ə n','a ni - ba nv','アニーバン','アニーバン');
+INSERT INTO "hand_mapping" VALUES ('UNEVEN','ɐ n ˈiː v ə n','a ni - Va nv','アニーバン','アニーバン');
 INSERT INTO "hand_mapping" VALUES ('UNEXPECTED','ˌɐ n ɪ k s p ˈɛ k t ɪ d','a ni kv sv pe kv ti dv','アニクスペクティド','アニクスペクティド');
 INSERT INTO "hand_mapping" VALUES ('UNEXPECTEDLY','ˌɐ n ɪ k s p ˈɛ k t ɪ d l i','a ni kv sv pe kv ti dv ri -','アニクスペクティドリー','アニクスペクティドリー');
 INSERT INTO "hand_mapping" VALUES ('UNFAIR','ɐ n f ˈɛə','a nv fe a','アンフェア','アンフェア');
@@ -15530,10 +15530,10 @@ INSERT INTO "hand_mapping" VALUES ('UNITE','j uː n ˈaɪ t','yu - na i tv','ユ
 INSERT INTO "hand_mapping" VALUES ('UNITED','j uː n ˈaɪ t ɪ d','yu - na i ti dv','ユーナイティド','ユーナイティド');
 INSERT INTO "hand_mapping" VALUES ('UNITS','j ˈuː n ɪ t s','yu - ni tsv','ユーニツ','ユーニツ');
 INSERT INTO "hand_mapping" VALUES ('UNITY','j ˈuː n ɪ t i','yu - ni ti -','ユーニティー','ユーニティー');
-INSERT INTO "hand_mapping" VALUES ('UNIVERSAL','j ˌuː n ɪ v ˈɜː s ə l','yu - ni be - sa rv','ユーニベーサル','ユーニベーサル');
-INSERT INTO "hand_mapping" VALUES ('UNIVERSE','j ˈuː n ɪ v ˌɜː s','yu - ni be - sv','ユーニベース','ユーニベース');
-INSERT INTO "hand_mapping" VALUES ('UNIVERSITIES','j ˌuː n ɪ v ˈɜː s ɪ t i z','yu - ni be - si ti - zv','ユーニベーシティーズ','ユーニベーシティーズ');
-INSERT INTO "hand_mapping" VALUES ('UNIVERSITY','j ˌuː n ɪ v ˈɜː s ɪ t i','yu - ni be - si ti -','ユーニベーシティー','ユーニベーシティー');
+INSERT INTO "hand_mapping" VALUES ('UNIVERSAL','j ˌuː n ɪ v ˈɜː s ə l','yu - ni Ve - sa rv','ユーニベーサル','ユーニベーサル');
+INSERT INTO "hand_mapping" VALUES ('UNIVERSE','j ˈuː n ɪ v ˌɜː s','yu - ni Ve - sv','ユーニベース','ユーニベース');
+INSERT INTO "hand_mapping" VALUES ('UNIVERSITIES','j ˌuː n ɪ v ˈɜː s ɪ t i z','yu - ni Ve - si ti - zv','ユーニベーシティーズ','ユーニベーシティーズ');
+INSERT INTO "hand_mapping" VALUES ('UNIVERSITY','j ˌuː n ɪ v ˈɜː s ɪ t i','yu - ni Ve - si ti -','ユーニベーシティー','ユーニベーシティー');
 INSERT INTO "hand_mapping" VALUES ('UNIX','j ˈuː n ɪ k s','yu - ni kv sv','ユーニクス','ユーニクス');
 INSERT INTO "hand_mapping" VALUES ('UNKNOWN','ɐ n n ˈəʊ n','a nv no - nv','アンノーン','アンノーン');
 INSERT INTO "hand_mapping" VALUES ('UNLABELED','ɐ n l ˈeɪ b ə l d','a nv re i ba rv dv','アンレイバルド','アンレイバルド');
@@ -15647,277 +15647,277 @@ INSERT INTO "hand_mapping" VALUES ('UTTERANCE','ˈɐ t ə ɹ ə n s','a ta ra nv
 INSERT INTO "hand_mapping" VALUES ('UTTERLY','ˈɐ t ə l i','a ta ri -','アタリー','アタリー');
 INSERT INTO "hand_mapping" VALUES ('UZBEKISTAN(1)','ʊ z b ˌɛ k ɪ s t ˈɑː n','u zv be - ki sv ta - nv','ウズベーキスターン','ウズベーキスターン');
 INSERT INTO "hand_mapping" VALUES ('UZBEKISTAN(2)','ɐ z b ˌɛ k ɪ s t ˈɑː n','a zv be - ki sv ta - nv','アズベーキスターン','アズベーキスターン');
-INSERT INTO "hand_mapping" VALUES ('VACANCIES','v ˈeɪ k ə n s i z','be i ka nv si - zv','ベイカンシーズ','ベイカンシーズ');
-INSERT INTO "hand_mapping" VALUES ('VACANCY','v ˈeɪ k ə n s i','be i ka nv si -','ベイカンシー','ベイカンシー');
-INSERT INTO "hand_mapping" VALUES ('VACANT','v ˈeɪ k ə n t','be i ka nv tv','ベイカント','ベイカント');
-INSERT INTO "hand_mapping" VALUES ('VACATION(1)','v eɪ k ˈeɪ ʃ ə n','be i ke i sya nv','ベイケイシャン','ベイケイション');
-INSERT INTO "hand_mapping" VALUES ('VACATION(2)','v ə k ˈeɪ ʃ ə n','ba ke i sya nv','バケイシャン','バケイション');
-INSERT INTO "hand_mapping" VALUES ('VACATIONS(1)','v eɪ k ˈeɪ ʃ ə n z','be i ke i sya nv zv','ベイケイシャンズ','ベイケイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('VACATIONS(2)','v ə k ˈeɪ ʃ ə n z','ba ke i sya nv zv','バケイシャンズ','バケイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('VACCINATION','v ˌæ k s ɪ n ˈeɪ ʃ ə n','ba x kv si ne i sya nv','バックシネイシャン','バックシネイション');
-INSERT INTO "hand_mapping" VALUES ('VACCINE','v ˈæ k s iː n','ba x kv si - nv','バックシーン','バックシーン');
-INSERT INTO "hand_mapping" VALUES ('VACUUM','v ˈæ k j uː m','ba x kyu - mv','バッキューム','バッキューム');
-INSERT INTO "hand_mapping" VALUES ('VAGINA','v ə dʒ ˈaɪ n ə','ba jya i na','バジャイナ','バジャイナ');
-INSERT INTO "hand_mapping" VALUES ('VAGUE','v ˈeɪ g','be i gv','ベイグ','ベイグ');
-INSERT INTO "hand_mapping" VALUES ('VAGUELY','v ˈeɪ g l i','be i gv ri -','ベイグリー','ベイグリー');
-INSERT INTO "hand_mapping" VALUES ('VAIN','v ˈeɪ n','be i nv','ベイン','ベイン');
-INSERT INTO "hand_mapping" VALUES ('VAL','v ˈæ l','ba rv','バル','バル');
-INSERT INTO "hand_mapping" VALUES ('VALE','v ˈeɪ l','be i rv','ベイル','ベイル');
-INSERT INTO "hand_mapping" VALUES ('VALENTINE','v ˈæ l ə n t ˌaɪ n','ba ra nv ta i nv','バランタイン','バランタイン');
-INSERT INTO "hand_mapping" VALUES ('VALET(1)','v ˈæ l eɪ','ba re i','バレイ','バレイ');
-INSERT INTO "hand_mapping" VALUES ('VALET(2)','v ˈæ l ɪ t','ba ri tv','バリト','バリト');
-INSERT INTO "hand_mapping" VALUES ('VALETTA','v ə l ˈɛ t ə','ba re ta','バレタ','バレタ');
-INSERT INTO "hand_mapping" VALUES ('VALID','v ˈæ l ɪ d','ba ri dv','バリド','バリド');
-INSERT INTO "hand_mapping" VALUES ('VALIDATION','v ˌæ l ɪ d ˈeɪ ʃ ə n','ba ri de i sya nv','バリデイシャン','バリデイション');
-INSERT INTO "hand_mapping" VALUES ('VALIDITY','v ə l ˈɪ d ɪ t i','ba ri di ti -','バリディティー','バリディティー');
-INSERT INTO "hand_mapping" VALUES ('VALIUM','v ˈæ l ɪə m','ba ri a mv','バリアム','バリアム');
-INSERT INTO "hand_mapping" VALUES ('VALLEY','v ˈæ l i','ba ri -','バリー','バリー');
-INSERT INTO "hand_mapping" VALUES ('VALLEYS','v ˈæ l i z','ba ri - zv','バリーズ','バリーズ');
-INSERT INTO "hand_mapping" VALUES ('VALUABLE','v ˈæ l j ʊ b ə l','ba ryu ba rv','バリュバル','バリュバル');
-INSERT INTO "hand_mapping" VALUES ('VALUATION','v æ l j ʊ ˈeɪ ʃ ə n','ba ryu e i sya nv','バリュエイシャン','バリュエイション');
-INSERT INTO "hand_mapping" VALUES ('VALUE','v ˈæ l j uː','ba ryu -','バリュー','バリュー');
-INSERT INTO "hand_mapping" VALUES ('VALUED','v ˈæ l j uː d','ba ryu - dv','バリュード','バリュード');
-INSERT INTO "hand_mapping" VALUES ('VALUES','v ˈæ l j uː z','ba ryu - zv','バリューズ','バリューズ');
-INSERT INTO "hand_mapping" VALUES ('VALVE','v ˈæ l v','ba rv bv','バルブ','バルブ');
-INSERT INTO "hand_mapping" VALUES ('VALVES','v ˈæ l v z','ba rv bv zv','バルブズ','バルブズ');
-INSERT INTO "hand_mapping" VALUES ('VAMPIRE','v ˈæ m p aɪ ə','ba Nv pa i a','バンパイア','バンパイア');
-INSERT INTO "hand_mapping" VALUES ('VAN','v ˈæ n','ba nv','バン','バン');
-INSERT INTO "hand_mapping" VALUES ('VANCOUVER','v æ n k ˈuː v ə','ba nv ku - ba','バンクーバ','バンクーバ');
-INSERT INTO "hand_mapping" VALUES ('VANE','v ˈeɪ n','be i nv','ベイン','ベイン');
-INSERT INTO "hand_mapping" VALUES ('VANILLA','v ə n ˈɪ l ə','ba ni ra','バニラ','バニラ');
-INSERT INTO "hand_mapping" VALUES ('VANISH','v ˈæ n ɪ ʃ','ba ni syv','バニシュ','バニシュ');
-INSERT INTO "hand_mapping" VALUES ('VANITY','v ˈæ n ɪ t i','ba ni ti -','バニティー','バニティー');
-INSERT INTO "hand_mapping" VALUES ('VARIABILITY','v ˌɛə ɹ ɪə b ˈɪ l ɪ t i','be a - ri a bi ri ti -','ベアーリアビリティー','ベアーリアビリティー');
-INSERT INTO "hand_mapping" VALUES ('VARIABLE','v ˈɛə ɹ ɪə b ə l','be a ri a ba rv','ベアリアバル','ベアリアバル');
-INSERT INTO "hand_mapping" VALUES ('VARIABLES','v ˈɛə ɹ ɪə b ə l z','be a ri a ba rv zv','ベアリアバルズ','ベアリアバルズ');
-INSERT INTO "hand_mapping" VALUES ('VARIANCE','v ˈɛə ɹ ɪə n s','be a ri a nv sv','ベアリアンス','ベアリアンス');
-INSERT INTO "hand_mapping" VALUES ('VARIANT','v ˈɛə ɹ ɪə n t','be a ri a nv tv','ベアリアント','ベアリアント');
-INSERT INTO "hand_mapping" VALUES ('VARIATION','v ˌɛə ɹ ɪ ˈeɪ ʃ ə n','be a - ri e i sya nv','ベアーリエイシャン','ベアーリエイション');
-INSERT INTO "hand_mapping" VALUES ('VARIATIONS','v ˌɛə ɹ ɪ ˈeɪ ʃ ə n z','be a - ri e i sya nv zv','ベアーリエイシャンズ','ベアーリエイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('VARIED','v ˈɛə ɹ ɪ d','be a ri dv','ベアリド','ベアリド');
-INSERT INTO "hand_mapping" VALUES ('VARIEGATED','v ˈɛə ɹ ɪ g ˌeɪ t ɪ d','be a ri ge i ti dv','ベアリゲイティド','ベアリゲイティド');
-INSERT INTO "hand_mapping" VALUES ('VARIES','v ˈɛə ɹ i z','be a ri - zv','ベアリーズ','ベアリーズ');
-INSERT INTO "hand_mapping" VALUES ('VARIETIES','v ə ɹ ˈaɪ ə t i z','ba ra i a ti - zv','バライアティーズ','バライアティーズ');
-INSERT INTO "hand_mapping" VALUES ('VARIETY','v ə ɹ ˈaɪ ə t i','ba ra i a ti -','バライアティー','バライアティー');
-INSERT INTO "hand_mapping" VALUES ('VARIOUS','v ˈɛə ɹ ɪə s','be a ri a sv','ベアリアス','ベアリアス');
-INSERT INTO "hand_mapping" VALUES ('VARNISH','v ˈɑː n ɪ ʃ','ba - ni syv','バーニシュ','バーニシュ');
-INSERT INTO "hand_mapping" VALUES ('VARY','v ˈɛə ɹ i','be a ri -','ベアリー','ベアリー');
-INSERT INTO "hand_mapping" VALUES ('VARYING','v ˈɛə ɹ i ɪ ŋ','be a ri - i Nv','ベアリーイン','ベアリーイング');
-INSERT INTO "hand_mapping" VALUES ('VASE','v ˈɑː s','ba - sv','バース','バース');
-INSERT INTO "hand_mapping" VALUES ('VAST','v ˈɑː s t','ba - sv tv','バースト','バースト');
-INSERT INTO "hand_mapping" VALUES ('VASTLY','v ˈɑː s t l i','ba - sv tv ri -','バーストリー','バーストリー');
-INSERT INTO "hand_mapping" VALUES ('VAT','v ˈæ t','ba x tv','バット','バット');
-INSERT INTO "hand_mapping" VALUES ('VATICAN','v ˈæ t ɪ k ə n','ba x ti ka nv','バッティカン','バッティカン');
-INSERT INTO "hand_mapping" VALUES ('VAULT','v ˈɔː l t','bo - rv tv','ボールト','ボールト');
-INSERT INTO "hand_mapping" VALUES ('VAUXHALL','v ˈɒ k s h ˌɔː l','bo x kv sv ho - rv','ボックスホール','ボックスホール');
-INSERT INTO "hand_mapping" VALUES ('VEAL','v ˈiː l','bi - rv','ビール','ビール');
-INSERT INTO "hand_mapping" VALUES ('VECTOR','v ˈɛ k t ə','be kv ta','ベクタ','ベクタ');
-INSERT INTO "hand_mapping" VALUES ('VEE','v ˈiː','bi -','ビー','ビー');
-INSERT INTO "hand_mapping" VALUES ('VEER','v ˈɪə','bi a','ビア','ビア');
-INSERT INTO "hand_mapping" VALUES ('VEES','v ˈiː z','bi - zv','ビーズ','ビーズ');
-INSERT INTO "hand_mapping" VALUES ('VEG','v ˈɛ dʒ','be jyv','ベジュ','ベジュ');
-INSERT INTO "hand_mapping" VALUES ('VEGAN','v ˈiː g ə n','bi - ga nv','ビーガン','ビーガン');
-INSERT INTO "hand_mapping" VALUES ('VEGAS','v ˈeɪ g ə s','be i ga sv','ベイガス','ベイガス');
-INSERT INTO "hand_mapping" VALUES ('VEGETABLE','v ˈɛ dʒ t ə b ə l','be jyv ta ba rv','ベジュタバル','ベジュタバル');
-INSERT INTO "hand_mapping" VALUES ('VEGETABLES','v ˈɛ dʒ t ə b ə l z','be jyv ta ba rv zv','ベジュタバルズ','ベジュタバルズ');
-INSERT INTO "hand_mapping" VALUES ('VEGETARIAN','v ˌɛ dʒ ɪ t ˈɛə ɹ ɪə n','be - jyi te a ri a nv','ベージィテアリアン','ベージィテアリアン');
-INSERT INTO "hand_mapping" VALUES ('VEGETATION','v ˌɛ dʒ ɪ t ˈeɪ ʃ ə n','be - jyi te i sya nv','ベージィテイシャン','ベージィテイション');
-INSERT INTO "hand_mapping" VALUES ('VEHICLE','v ˈiː ɪ k ə l','bi - i ka rv','ビーイカル','ビーイカル');
-INSERT INTO "hand_mapping" VALUES ('VEHICLES','v ˈiː ɪ k ə l z','bi - i ka rv zv','ビーイカルズ','ビーイカルズ');
-INSERT INTO "hand_mapping" VALUES ('VEIL','v ˈeɪ l','be i rv','ベイル','ベイル');
-INSERT INTO "hand_mapping" VALUES ('VEIN','v ˈeɪ n','be i nv','ベイン','ベイン');
-INSERT INTO "hand_mapping" VALUES ('VEINS','v ˈeɪ n z','be i nv zv','ベインズ','ベインズ');
-INSERT INTO "hand_mapping" VALUES ('VELOCITY','v ə l ˈɒ s ɪ t i','ba ro x si ti -','バロッシティー','バロッシティー');
-INSERT INTO "hand_mapping" VALUES ('VELVET','v ˈɛ l v ɪ t','be rv bi tv','ベルビト','ベルビト');
-INSERT INTO "hand_mapping" VALUES ('VENDOR','v ˈɛ n d ə','be nv da','ベンダ','ベンダ');
-INSERT INTO "hand_mapping" VALUES ('VENDORS','v ˈɛ n d ə z','be nv da zv','ベンダズ','ベンダズ');
-INSERT INTO "hand_mapping" VALUES ('VENEER','v ɪ n ˈɪə','bi ni a','ビニア','ビニア');
-INSERT INTO "hand_mapping" VALUES ('VENEZUELA','v ˌɛ n ɪ z w ˈeɪ l ə','be - ni zwe i ra','ベーニズウェイラ','ベーニズウェイラ');
-INSERT INTO "hand_mapping" VALUES ('VENGEANCE','v ˈɛ n dʒ ə n s','be nv jya nv sv','ベンジャンス','ベンジャンス');
-INSERT INTO "hand_mapping" VALUES ('VENICE','v ˈɛ n ɪ s','be ni sv','ベニス','ベニス');
-INSERT INTO "hand_mapping" VALUES ('VENOM','v ˈɛ n ə m','be na mv','ベナム','ベナム');
-INSERT INTO "hand_mapping" VALUES ('VENT','v ˈɛ n t','be nv tv','ベント','ベント');
-INSERT INTO "hand_mapping" VALUES ('VENTURE','v ˈɛ n tʃ ə','be nv tya','ベンチャ','ベンチャ');
-INSERT INTO "hand_mapping" VALUES ('VENTURES','v ˈɛ n tʃ ə z','be nv tya zv','ベンチャズ','ベンチャズ');
-INSERT INTO "hand_mapping" VALUES ('VENUE','v ˈɛ n j uː','be nyu -','ベニュー','ベニュー');
-INSERT INTO "hand_mapping" VALUES ('VENUES','v ˈɛ n uː z','be nu - zv','ベヌーズ','ベヌーズ');
-INSERT INTO "hand_mapping" VALUES ('VENUS','v ˈiː n ə s','bi - na sv','ビーナス','ビーナス');
-INSERT INTO "hand_mapping" VALUES ('VERA','v ˈɪə ɹ ə','bi a ra','ビアラ','ビアラ');
-INSERT INTO "hand_mapping" VALUES ('VERB','v ˈɜː b','be - bv','ベーブ','ベーブ');
-INSERT INTO "hand_mapping" VALUES ('VERBAL','v ˈɜː b ə l','be - ba rv','ベーバル','ベーバル');
-INSERT INTO "hand_mapping" VALUES ('VERBATIM','v ɜː b ˈeɪ t ɪ m','be - be i ti mv','ベーベイティム','ベーベイティム');
-INSERT INTO "hand_mapping" VALUES ('VERBIAGE','v ˈɜː b ɪ ɪ dʒ','be - bi i jyv','ベービイジュ','ベービイジュ');
-INSERT INTO "hand_mapping" VALUES ('VERBS','v ˈɜː b z','be - bv zv','ベーブズ','ベーブズ');
-INSERT INTO "hand_mapping" VALUES ('VERDICT','v ˈɜː d ɪ k t','be - di kv tv','ベーディクト','ベーディクト');
-INSERT INTO "hand_mapping" VALUES ('VERGE','v ˈɜː dʒ','be - jyv','ベージュ','ベージュ');
-INSERT INTO "hand_mapping" VALUES ('VERIFICATION','v ˌɛ ɹ ɪ f ɪ k ˈeɪ ʃ ə n','be - ri fi ke i sya nv','ベーリフィケイシャン','ベーリフィケイション');
-INSERT INTO "hand_mapping" VALUES ('VERIFIED','v ˈɛ ɹ ɪ f ˌaɪ d','be ri fa i dv','ベリファイド','ベリファイド');
-INSERT INTO "hand_mapping" VALUES ('VERIFY','v ˈɛ ɹ ɪ f ˌaɪ','be ri fa i','ベリファイ','ベリファイ');
-INSERT INTO "hand_mapping" VALUES ('VERMIN','v ˈɜː m ɪ n','be - mi nv','ベーミン','ベーミン');
-INSERT INTO "hand_mapping" VALUES ('VERMONT','v ə m ˈɒ n t','ba mo nv tv','バモント','バモント');
-INSERT INTO "hand_mapping" VALUES ('VERSATILE','v ˈɜː s ə t ˌaɪ l','be - sa ta i rv','ベーサタイル','ベーサタイル');
-INSERT INTO "hand_mapping" VALUES ('VERSE','v ˈɜː s','be - sv','ベース','ベース');
-INSERT INTO "hand_mapping" VALUES ('VERSION','v ˈɜː ʒ ə n','be - jya nv','ベージャン','ベージョン');
-INSERT INTO "hand_mapping" VALUES ('VERSIONS','v ˈɜː ʒ ə n z','be - jya nv zv','ベージャンズ','ベージャンズ');
-INSERT INTO "hand_mapping" VALUES ('VERSUS','v ˈɜː s ə s','be - sa sv','ベーサス','ベーサス');
-INSERT INTO "hand_mapping" VALUES ('VERTEX','v ˈɜː t ˌɛ k s','be - te - kv sv','ベーテークス','ベーテークス');
-INSERT INTO "hand_mapping" VALUES ('VERTICAL','v ˈɜː t ɪ k ə l','be - ti ka rv','ベーティカル','ベーティカル');
-INSERT INTO "hand_mapping" VALUES ('VERTICES','v ˈɜː t ɪ s ˌiː z','be - ti si - zv','ベーティシーズ','ベーティシーズ');
-INSERT INTO "hand_mapping" VALUES ('VERTIGO','v ˈɜː t ɪ g ˌəʊ','be - ti go','ベーティゴ','ベーティゴ');
-INSERT INTO "hand_mapping" VALUES ('VERY','v ˈɛ ɹ i','be ri -','ベリー','ベリー');
-INSERT INTO "hand_mapping" VALUES ('VESSEL','v ˈɛ s ə l','be sa rv','ベサル','ベサル');
-INSERT INTO "hand_mapping" VALUES ('VESSELS','v ˈɛ s ə l z','be sa rv zv','ベサルズ','ベサルズ');
-INSERT INTO "hand_mapping" VALUES ('VEST','v ˈɛ s t','be sv tv','ベスト','ベスト');
-INSERT INTO "hand_mapping" VALUES ('VESTED','v ˈɛ s t ɪ d','be sv ti dv','ベスティド','ベスティド');
-INSERT INTO "hand_mapping" VALUES ('VET','v ˈɛ t','be tv','ベト','ベト');
-INSERT INTO "hand_mapping" VALUES ('VETERAN','v ˈɛ t ə ɹ ə n','be ta ra nv','ベタラン','ベタラン');
-INSERT INTO "hand_mapping" VALUES ('VETERANS','v ˈɛ t ə ɹ ə n z','be ta ra nv zv','ベタランズ','ベタランズ');
-INSERT INTO "hand_mapping" VALUES ('VETERINARY','v ˈɛ t ə ɹ ɪ n ə ɹ i','be ta ri na ri -','ベタリナリー','ベタリナリー');
-INSERT INTO "hand_mapping" VALUES ('VETO','v ˈiː t əʊ','bi - to','ビート','ビート');
-INSERT INTO "hand_mapping" VALUES ('VETOES','v ˈiː t əʊ z','bi - to zv','ビートズ','ビートズ');
-INSERT INTO "hand_mapping" VALUES ('VIA(1)','v ˈaɪ ə','ba i a','バイア','バイア');
-INSERT INTO "hand_mapping" VALUES ('VIA(2)','v ˈiː ə','bi - a','ビーア','ビーア');
-INSERT INTO "hand_mapping" VALUES ('VIABLE','v ˈaɪ ə b ə l','ba i a ba rv','バイアバル','バイアバル');
-INSERT INTO "hand_mapping" VALUES ('VIAGRA','v aɪ ˈæ g ɹ ə','ba i a gv ra','バイアグラ','バイアグラ');
-INSERT INTO "hand_mapping" VALUES ('VIBE','v ˈaɪ b','ba i bv','バイブ','バイブ');
-INSERT INTO "hand_mapping" VALUES ('VIBRANT','v ˈaɪ b ɹ ə n t','ba i bv ra nv tv','バイブラント','バイブラント');
-INSERT INTO "hand_mapping" VALUES ('VIBRATOR','v ˈaɪ b ɹ eɪ t ə','ba i bv re i ta','バイブレイタ','バイブレイタ');
-INSERT INTO "hand_mapping" VALUES ('VIBRATORS','v ˈaɪ b ɹ eɪ t ə z','ba i bv re i ta zv','バイブレイタズ','バイブレイタズ');
-INSERT INTO "hand_mapping" VALUES ('VICAR','v ˈɪ k ə','bi ka','ビカ','ビカ');
-INSERT INTO "hand_mapping" VALUES ('VICE','v ˈaɪ s','ba i sv','バイス','バイス');
-INSERT INTO "hand_mapping" VALUES ('VICE-PRESIDENT','v ˌaɪ s p ɹ ˈɛ z ɪ d ə n t','ba i sv pv re zi da nv tv','バイスプレジダント','バイスプレジダント');
-INSERT INTO "hand_mapping" VALUES ('VICE_VERSA','v ˈaɪ s ɪ v ˈɜː s ə','ba i si be - sa','バイシベーサ','バイシベーサ');
-INSERT INTO "hand_mapping" VALUES ('VICIOUS','v ˈɪ ʃ ə s','bi sya sv','ビシャス','ビシャス');
-INSERT INTO "hand_mapping" VALUES ('VICKI','v ˈɪ k i','bi ki -','ビキー','ビキー');
-INSERT INTO "hand_mapping" VALUES ('VICKY','v ˈɪ k i','bi ki -','ビキー','ビキー');
-INSERT INTO "hand_mapping" VALUES ('VICTIM','v ˈɪ k t ɪ m','bi kv ti mv','ビクティム','ビクティム');
-INSERT INTO "hand_mapping" VALUES ('VICTIMS','v ˈɪ k t ɪ m z','bi kv ti mv zv','ビクティムズ','ビクティムズ');
-INSERT INTO "hand_mapping" VALUES ('VICTOR','v ˈɪ k t ə','bi kv ta','ビクタ','ビクタ');
-INSERT INTO "hand_mapping" VALUES ('VICTORIA','v ɪ k t ˈɔː ɹ ɪə','bi kv to - ri a','ビクトーリア','ビクトーリア');
-INSERT INTO "hand_mapping" VALUES ('VICTORIAN','v ɪ k t ˈɔː ɹ ɪə n','bi kv to - ri a nv','ビクトーリアン','ビクトーリアン');
-INSERT INTO "hand_mapping" VALUES ('VICTORY(1)','v ˈɪ k t ɹ i','bi kv tv ri -','ビクトリー','ビクトリー');
-INSERT INTO "hand_mapping" VALUES ('VICTORY(2)','v ˈɪ k t ə ɹ i','bi kv ta ri -','ビクタリー','ビクタリー');
-INSERT INTO "hand_mapping" VALUES ('VID','v ˈɪ d','bi dv','ビド','ビド');
-INSERT INTO "hand_mapping" VALUES ('VIDEO','v ˈɪ d ɪ əʊ','bi di o','ビディオ','ビディオ');
-INSERT INTO "hand_mapping" VALUES ('VIDEO-TAPED','v ˈɪ d ɪ əʊ t ˌeɪ p t','bi di o te i pv tv','ビディオテイプト','ビディオテイプト');
-INSERT INTO "hand_mapping" VALUES ('VIDEOS','v ˈɪ d ɪ əʊ z','bi di o zv','ビディオズ','ビディオズ');
-INSERT INTO "hand_mapping" VALUES ('VIDS','v ˈɪ d z','bi zv','ビズ','ビズ');
-INSERT INTO "hand_mapping" VALUES ('VIE','v ˈaɪ','ba i','バイ','バイ');
-INSERT INTO "hand_mapping" VALUES ('VIENNA','v ɪ ˈɛ n ə','bi e na','ビエナ','ビエナ');
-INSERT INTO "hand_mapping" VALUES ('VIETNAM','v j ˌɛ t n ˈæ m','bye - tv na mv','ビェートナム','ビェートナム');
-INSERT INTO "hand_mapping" VALUES ('VIETNAMESE','v j ˌɛ t n ə m ˈiː z','bye - tv na mi - zv','ビェートナミーズ','ビェートナミーズ');
-INSERT INTO "hand_mapping" VALUES ('VIEW','v j ˈuː','byu -','ビュー','ビュー');
-INSERT INTO "hand_mapping" VALUES ('VIEWED','v j ˈuː d','byu - dv','ビュード','ビュード');
-INSERT INTO "hand_mapping" VALUES ('VIEWER','v j ˈuː ə','byu - a','ビューア','ビューア');
-INSERT INTO "hand_mapping" VALUES ('VIEWERS','v j ˈuː ə z','byu - a zv','ビューアズ','ビューアズ');
-INSERT INTO "hand_mapping" VALUES ('VIEWING','v j ˈuː ɪ ŋ','byu - i Nv','ビューイン','ビューイング');
-INSERT INTO "hand_mapping" VALUES ('VIEWPOINT','v j ˈuː p ˌɔɪ n t','byu - po i nv tv','ビューポイント','ビューポイント');
-INSERT INTO "hand_mapping" VALUES ('VIEWS','v j ˈuː z','byu - zv','ビューズ','ビューズ');
-INSERT INTO "hand_mapping" VALUES ('VIGIL','v ˈɪ dʒ ɪ l','bi jyi rv','ビジィル','ビジィル');
-INSERT INTO "hand_mapping" VALUES ('VIGILANT','v ˈɪ dʒ ɪ l ə n t','bi jyi ra nv tv','ビジィラント','ビジィラント');
-INSERT INTO "hand_mapping" VALUES ('VIGILANTE','v ˌɪ dʒ ɪ l ˈæ n t i','bi - jyi ra nv ti -','ビージィランティー','ビージィランティー');
-INSERT INTO "hand_mapping" VALUES ('VIGOROUS','v ˈɪ g ə ɹ ə s','bi ga ra sv','ビガラス','ビガラス');
-INSERT INTO "hand_mapping" VALUES ('VIGOROUSLY','v ˈɪ g ə ɹ ə s l i','bi ga ra sv ri -','ビガラスリー','ビガラスリー');
-INSERT INTO "hand_mapping" VALUES ('VIGOUR','v ˈɪ g ə','bi ga','ビガ','ビガ');
-INSERT INTO "hand_mapping" VALUES ('VIKING','v ˈaɪ k ɪ ŋ','ba i ki Nv','バイキン','バイキング');
-INSERT INTO "hand_mapping" VALUES ('VILE','v ˈaɪ l','ba i rv','バイル','バイル');
-INSERT INTO "hand_mapping" VALUES ('VILLA','v ˈɪ l ə','bi ra','ビラ','ビラ');
-INSERT INTO "hand_mapping" VALUES ('VILLAGE','v ˈɪ l ɪ dʒ','bi ri jyv','ビリジュ','ビリジュ');
-INSERT INTO "hand_mapping" VALUES ('VILLAGERS','v ˈɪ l ɪ dʒ ə z','bi ri jya zv','ビリジャズ','ビリジャズ');
-INSERT INTO "hand_mapping" VALUES ('VILLAGES','v ˈɪ l ɪ dʒ ɪ z','bi ri jyi zv','ビリジィズ','ビリジィズ');
-INSERT INTO "hand_mapping" VALUES ('VILLAS','v ˈɪ l ə z','bi ra zv','ビラズ','ビラズ');
-INSERT INTO "hand_mapping" VALUES ('VILNIUS(1)','v ˈɪ l n ɪə s','bi rv ni a sv','ビルニアス','ビルニアス');
-INSERT INTO "hand_mapping" VALUES ('VILNIUS(2)','v ˈɪ l n ɪ ʊ s','bi rv ni u sv','ビルニウス','ビルニウス');
-INSERT INTO "hand_mapping" VALUES ('VIM','v ˈɪ m','bi mv','ビム','ビム');
-INSERT INTO "hand_mapping" VALUES ('VINCENT','v ˈɪ n s ə n t','bi nv sa nv tv','ビンサント','ビンサント');
-INSERT INTO "hand_mapping" VALUES ('VINE','v ˈaɪ n','ba i nv','バイン','バイン');
-INSERT INTO "hand_mapping" VALUES ('VINEGAR','v ˈɪ n ɪ g ə','bi ni ga','ビニガ','ビニガ');
-INSERT INTO "hand_mapping" VALUES ('VINTAGE','v ˈɪ n t ɪ dʒ','bi nv ti jyv','ビンティジュ','ビンティジュ');
-INSERT INTO "hand_mapping" VALUES ('VINYL','v ˈaɪ n ə l','ba i na rv','バイナル','バイナル');
-INSERT INTO "hand_mapping" VALUES ('VIOLATION','v aɪ ə l ˈeɪ ʃ ə n','ba i a re i sya nv','バイアレイシャン','バイアレイション');
-INSERT INTO "hand_mapping" VALUES ('VIOLATIONS','v aɪ ə l ˈeɪ ʃ ə n z','ba i a re i sya nv zv','バイアレイシャンズ','バイアレイシャンズ');
-INSERT INTO "hand_mapping" VALUES ('VIOLENCE','v ˈaɪ ə l ə n s','ba i a ra nv sv','バイアランス','バイアランス');
-INSERT INTO "hand_mapping" VALUES ('VIOLENT(1)','v ˈaɪ l ə n t','ba i ra nv tv','バイラント','バイラント');
-INSERT INTO "hand_mapping" VALUES ('VIOLENT(2)','v ˈaɪ ə l ə n t','ba i a ra nv tv','バイアラント','バイアラント');
-INSERT INTO "hand_mapping" VALUES ('VIOLENTLY','v ˈaɪ ə l ə n t l i','ba i a ra nv tv ri -','バイアラントリー','バイアラントリー');
-INSERT INTO "hand_mapping" VALUES ('VIOLET','v ˈaɪ ə l ɪ t','ba i a ri tv','バイアリト','バイアリト');
-INSERT INTO "hand_mapping" VALUES ('VIOLIN','v aɪ ə l ˈɪ n','ba i a ri nv','バイアリン','バイアリン');
-INSERT INTO "hand_mapping" VALUES ('VIRAL','v ˈaɪ ɹ ə l','ba i ra rv','バイラル','バイラル');
-INSERT INTO "hand_mapping" VALUES ('VIRGIN','v ˈɜː dʒ ɪ n','be - jyi nv','ベージィン','ベージィン');
-INSERT INTO "hand_mapping" VALUES ('VIRGINIA','v ə dʒ ˈɪ n j ə','ba jyi nya','バジィニャ','バジィニャ');
-INSERT INTO "hand_mapping" VALUES ('VIRTUAL','v ˈɜː tʃ ʊə l','be - tyu a rv','ベーチュアル','ベーチュアル');
-INSERT INTO "hand_mapping" VALUES ('VIRTUALLY','v ˈɜː tʃ ʊə l i','be - tyu a ri -','ベーチュアリー','ベーチュアリー');
-INSERT INTO "hand_mapping" VALUES ('VIRTUE','v ˈɜː tʃ uː','be - tyu -','ベーチュー','ベーチュー');
-INSERT INTO "hand_mapping" VALUES ('VIRUS','v ˈaɪ ɹ ə s','ba i ra sv','バイラス','バイラス');
-INSERT INTO "hand_mapping" VALUES ('VIRUSES','v ˈaɪ ɹ ə s ɪ z','ba i ra si zv','バイラシズ','バイラシズ');
-INSERT INTO "hand_mapping" VALUES ('VISA','v ˈiː z ə','bi - za','ビーザ','ビーザ');
-INSERT INTO "hand_mapping" VALUES ('VISCERAL','v ˈɪ s ə ɹ ə l','bi sa ra rv','ビサラル','ビサラル');
-INSERT INTO "hand_mapping" VALUES ('VISIBILITY','v ˌɪ z ɪ b ˈɪ l ɪ t i','bi - zi bi ri ti -','ビージビリティー','ビージビリティー');
-INSERT INTO "hand_mapping" VALUES ('VISIBLE','v ˈɪ z ɪ b ə l','bi zi ba rv','ビジバル','ビジバル');
-INSERT INTO "hand_mapping" VALUES ('VISION','v ˈɪ ʒ ə n','bi jya nv','ビジャン','ビジョン');
-INSERT INTO "hand_mapping" VALUES ('VISIT','v ˈɪ z ɪ t','bi zi tv','ビジト','ビジト');
-INSERT INTO "hand_mapping" VALUES ('VISITED','v ˈɪ z ɪ t ɪ d','bi zi ti dv','ビジティド','ビジティド');
-INSERT INTO "hand_mapping" VALUES ('VISITING','v ˈɪ z ɪ t ɪ ŋ','bi zi ti Nv','ビジティン','ビジティング');
-INSERT INTO "hand_mapping" VALUES ('VISITOR','v ˈɪ z ɪ t ə','bi zi ta','ビジタ','ビジタ');
-INSERT INTO "hand_mapping" VALUES ('VISITORS','v ˈɪ z ɪ t ə z','bi zi ta zv','ビジタズ','ビジタズ');
-INSERT INTO "hand_mapping" VALUES ('VISITS','v ˈɪ z ɪ t s','bi zi tsv','ビジツ','ビジツ');
-INSERT INTO "hand_mapping" VALUES ('VISTA','v ˈɪ s t ə','bi sv ta','ビスタ','ビスタ');
-INSERT INTO "hand_mapping" VALUES ('VISUAL(1)','v ˈɪ ʒ ʊə l','bi jyu a rv','ビジュアル','ビジュアル');
-INSERT INTO "hand_mapping" VALUES ('VISUAL(2)','v ˈɪ z j ʊə l','bi zyu a rv','ビジュアル','ビジュアル');
-INSERT INTO "hand_mapping" VALUES ('VISUALISATION(1)','v ˌɪ ʒ ʊə l aɪ z ˈeɪ ʃ ə n','bi - jyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
-INSERT INTO "hand_mapping" VALUES ('VISUALISATION(2)','v ˌɪ z j ʊə l aɪ z ˈeɪ ʃ ə n','bi - zyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
-INSERT INTO "hand_mapping" VALUES ('VISUALIZATION(1)','v ˌɪ ʒ ʊə l aɪ z ˈeɪ ʃ ə n','bi - jyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
-INSERT INTO "hand_mapping" VALUES ('VISUALIZATION(2)','v ˌɪ z j ʊə l aɪ z ˈeɪ ʃ ə n','bi - zyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
-INSERT INTO "hand_mapping" VALUES ('VITAL','v ˈaɪ t ə l','ba i ta rv','バイタル','バイタル');
-INSERT INTO "hand_mapping" VALUES ('VITAMIN','v ˈɪ t ə m ɪ n','bi ta mi nv','ビタミン','ビタミン');
-INSERT INTO "hand_mapping" VALUES ('VITAMINS','v ˈɪ t ə m ɪ n z','bi ta mi nv zv','ビタミンズ','ビタミンズ');
-INSERT INTO "hand_mapping" VALUES ('VIVID','v ˈɪ v ɪ d','bi bi dv','ビビド','ビビド');
-INSERT INTO "hand_mapping" VALUES ('VIXEN','v ˈɪ k s ə n','bi kv sa nv','ビクサン','ビクサン');
-INSERT INTO "hand_mapping" VALUES ('VOCABULARY','v əʊ k ˈæ b j ʊ l ə ɹ i','bo ka byu ra ri -','ボカビュラリー','ボカビュラリー');
-INSERT INTO "hand_mapping" VALUES ('VOCAL','v ˈəʊ k ə l','bo - ka rv','ボーカル','ボーカル');
-INSERT INTO "hand_mapping" VALUES ('VOCALS','v ˈəʊ k ə l z','bo - ka rv zv','ボーカルズ','ボーカルズ');
-INSERT INTO "hand_mapping" VALUES ('VOCATION','v əʊ k ˈeɪ ʃ ə n','bo ke i sya nv','ボケイシャン','ボケイション');
-INSERT INTO "hand_mapping" VALUES ('VOCATIONAL','v əʊ k ˈeɪ ʃ ə n ə l','bo ke i sya na rv','ボケイシャナル','ボケイシャナル');
-INSERT INTO "hand_mapping" VALUES ('VODKA','v ˈɒ d k ə','bo dv ka','ボドカ','ボドカ');
-INSERT INTO "hand_mapping" VALUES ('VOGUE','v ˈəʊ g','bo - gv','ボーグ','ボーグ');
-INSERT INTO "hand_mapping" VALUES ('VOICE','v ˈɔɪ s','bo i sv','ボイス','ボイス');
-INSERT INTO "hand_mapping" VALUES ('VOICES','v ˈɔɪ s ɪ z','bo i si zv','ボイシズ','ボイシズ');
-INSERT INTO "hand_mapping" VALUES ('VOID','v ˈɔɪ d','bo i dv','ボイド','ボイド');
-INSERT INTO "hand_mapping" VALUES ('VOLCANO','v ɒ l k ˈeɪ n əʊ','bo rv ke i no','ボルケイノ','ボルケイノ');
-INSERT INTO "hand_mapping" VALUES ('VOLE','v ˈəʊ l','bo - rv','ボール','ボール');
-INSERT INTO "hand_mapping" VALUES ('VOLES','v ˈəʊ l z','bo - rv zv','ボールズ','ボールズ');
-INSERT INTO "hand_mapping" VALUES ('VOLKSWAGEN','v ˈəʊ l k s w ˌæ g ə n','bo - rv kv swa ga nv','ボールクスァガン','ボールクスァガン');
-INSERT INTO "hand_mapping" VALUES ('VOLLEYBALL','v ˈɒ l iː b ˌɔː l','bo ri - bo - rv','ボリーボール','ボリーボール');
-INSERT INTO "hand_mapping" VALUES ('VOLT(1)','v ˈəʊ l t','bo - rv tv','ボールト','ボールト');
-INSERT INTO "hand_mapping" VALUES ('VOLT(2)','v ˈɒ l t','bo rv tv','ボルト','ボルト');
-INSERT INTO "hand_mapping" VALUES ('VOLTAGE','v ˈəʊ l t ɪ dʒ','bo - rv ti jyv','ボールティジュ','ボールティジュ');
-INSERT INTO "hand_mapping" VALUES ('VOLUME','v ˈɒ l j uː m','bo ryu - mv','ボリューム','ボリューム');
-INSERT INTO "hand_mapping" VALUES ('VOLUMES','v ˈɒ l j uː m z','bo ryu - mv zv','ボリュームズ','ボリュームズ');
-INSERT INTO "hand_mapping" VALUES ('VOLUNTARY','v ˈɒ l ə n t ə ɹ i','bo ra nv ta ri -','ボランタリー','ボランタリー');
-INSERT INTO "hand_mapping" VALUES ('VOLUNTEER','v ˌɒ l ə n t ˈɪə','bo ra nv ti a','ボランティア','ボランティア');
-INSERT INTO "hand_mapping" VALUES ('VOLUNTEERS','v ˌɒ l ə n t ˈɪə z','bo ra nv ti a zv','ボランティアズ','ボランティアズ');
-INSERT INTO "hand_mapping" VALUES ('VOLUPTUOUS','v ə l ˈɐ p t j ʊə s','ba ra pv tyu a sv','バラプチュアス','バラプチュアス');
-INSERT INTO "hand_mapping" VALUES ('VOLVO','v ˈɒ l v əʊ','bo rv bo','ボルボ','ボルボ');
-INSERT INTO "hand_mapping" VALUES ('VOMIT','v ˈɒ m ɪ t','bo mi tv','ボミト','ボミト');
-INSERT INTO "hand_mapping" VALUES ('VOTE','v ˈəʊ t','bo - tv','ボート','ボート');
-INSERT INTO "hand_mapping" VALUES ('VOTED','v ˈəʊ t ɪ d','bo - ti dv','ボーティド','ボーティド');
-INSERT INTO "hand_mapping" VALUES ('VOTER','v ˈəʊ t ə','bo - ta','ボータ','ボータ');
-INSERT INTO "hand_mapping" VALUES ('VOTERS','v ˈəʊ t ə z','bo - ta zv','ボータズ','ボータズ');
-INSERT INTO "hand_mapping" VALUES ('VOTES','v ˈəʊ t s','bo - tsv','ボーツ','ボーツ');
-INSERT INTO "hand_mapping" VALUES ('VOTING','v ˈəʊ t ɪ ŋ','bo - ti Nv','ボーティン','ボーティング');
-INSERT INTO "hand_mapping" VALUES ('VOUCH','v ˈaʊ tʃ','ba u tyv','バウチュ','バウチュ');
-INSERT INTO "hand_mapping" VALUES ('VOUCHER','v ˈaʊ tʃ ə','ba u tya','バウチャ','バウチャ');
-INSERT INTO "hand_mapping" VALUES ('VOUCHERS','v ˈaʊ tʃ ə z','ba u tya zv','バウチャズ','バウチャズ');
-INSERT INTO "hand_mapping" VALUES ('VOW','v ˈaʊ','ba u','バウ','バウ');
-INSERT INTO "hand_mapping" VALUES ('VOWEL','v ˈaʊ ə l','ba u a rv','バウアル','バウアル');
-INSERT INTO "hand_mapping" VALUES ('VOWELS','v ˈaʊ ə l z','ba u a rv zv','バウアルズ','バウアルズ');
-INSERT INTO "hand_mapping" VALUES ('VOYAGE','v ˈɔɪ ɪ dʒ','bo i i jyv','ボイイジュ','ボイイジュ');
-INSERT INTO "hand_mapping" VALUES ('VOYAGER','v ˈɔɪ ɪ dʒ ə','bo i i jya','ボイイジャ','ボイイジャ');
-INSERT INTO "hand_mapping" VALUES ('VOYEUR(1)','v w aɪ ˈɜː','bwa i e -','ブワイエー','ブワイエー');
-INSERT INTO "hand_mapping" VALUES ('VOYEUR(2)','v ɔɪ ˈɜː','bo i e -','ボイエー','ボイエー');
-INSERT INTO "hand_mapping" VALUES ('VULGAR','v ˈɐ l g ə','ba rv ga','バルガ','バルガ');
-INSERT INTO "hand_mapping" VALUES ('VULNERABILITY','v ˌɐ l n ə ɹ ə b ˈɪ l ɪ t i','ba rv na ra bi ri ti -','バルナラビリティー','バルナラビリティー');
-INSERT INTO "hand_mapping" VALUES ('VULNERABLE','v ˈɐ l n ə ɹ ə b ə l','ba rv na ra ba rv','バルナラバル','バルナラバル');
+INSERT INTO "hand_mapping" VALUES ('VACANCIES','v ˈeɪ k ə n s i z','Ve i ka nv si - zv','ベイカンシーズ','ベイカンシーズ');
+INSERT INTO "hand_mapping" VALUES ('VACANCY','v ˈeɪ k ə n s i','Ve i ka nv si -','ベイカンシー','ベイカンシー');
+INSERT INTO "hand_mapping" VALUES ('VACANT','v ˈeɪ k ə n t','Ve i ka nv tv','ベイカント','ベイカント');
+INSERT INTO "hand_mapping" VALUES ('VACATION(1)','v eɪ k ˈeɪ ʃ ə n','Ve i ke i sya nv','ベイケイシャン','ベイケイション');
+INSERT INTO "hand_mapping" VALUES ('VACATION(2)','v ə k ˈeɪ ʃ ə n','Va ke i sya nv','バケイシャン','バケイション');
+INSERT INTO "hand_mapping" VALUES ('VACATIONS(1)','v eɪ k ˈeɪ ʃ ə n z','Ve i ke i sya nv zv','ベイケイシャンズ','ベイケイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('VACATIONS(2)','v ə k ˈeɪ ʃ ə n z','Va ke i sya nv zv','バケイシャンズ','バケイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('VACCINATION','v ˌæ k s ɪ n ˈeɪ ʃ ə n','Va x kv si ne i sya nv','バックシネイシャン','バックシネイション');
+INSERT INTO "hand_mapping" VALUES ('VACCINE','v ˈæ k s iː n','Va x kv si - nv','バックシーン','バックシーン');
+INSERT INTO "hand_mapping" VALUES ('VACUUM','v ˈæ k j uː m','Va x kyu - mv','バッキューム','バッキューム');
+INSERT INTO "hand_mapping" VALUES ('VAGINA','v ə dʒ ˈaɪ n ə','Va jya i na','バジャイナ','バジャイナ');
+INSERT INTO "hand_mapping" VALUES ('VAGUE','v ˈeɪ g','Ve i gv','ベイグ','ベイグ');
+INSERT INTO "hand_mapping" VALUES ('VAGUELY','v ˈeɪ g l i','Ve i gv ri -','ベイグリー','ベイグリー');
+INSERT INTO "hand_mapping" VALUES ('VAIN','v ˈeɪ n','Ve i nv','ベイン','ベイン');
+INSERT INTO "hand_mapping" VALUES ('VAL','v ˈæ l','Va rv','バル','バル');
+INSERT INTO "hand_mapping" VALUES ('VALE','v ˈeɪ l','Ve i rv','ベイル','ベイル');
+INSERT INTO "hand_mapping" VALUES ('VALENTINE','v ˈæ l ə n t ˌaɪ n','Va ra nv ta i nv','バランタイン','バランタイン');
+INSERT INTO "hand_mapping" VALUES ('VALET(1)','v ˈæ l eɪ','Va re i','バレイ','バレイ');
+INSERT INTO "hand_mapping" VALUES ('VALET(2)','v ˈæ l ɪ t','Va ri tv','バリト','バリト');
+INSERT INTO "hand_mapping" VALUES ('VALETTA','v ə l ˈɛ t ə','Va re ta','バレタ','バレタ');
+INSERT INTO "hand_mapping" VALUES ('VALID','v ˈæ l ɪ d','Va ri dv','バリド','バリド');
+INSERT INTO "hand_mapping" VALUES ('VALIDATION','v ˌæ l ɪ d ˈeɪ ʃ ə n','Va ri de i sya nv','バリデイシャン','バリデイション');
+INSERT INTO "hand_mapping" VALUES ('VALIDITY','v ə l ˈɪ d ɪ t i','Va ri di ti -','バリディティー','バリディティー');
+INSERT INTO "hand_mapping" VALUES ('VALIUM','v ˈæ l ɪə m','Va ri a mv','バリアム','バリアム');
+INSERT INTO "hand_mapping" VALUES ('VALLEY','v ˈæ l i','Va ri -','バリー','バリー');
+INSERT INTO "hand_mapping" VALUES ('VALLEYS','v ˈæ l i z','Va ri - zv','バリーズ','バリーズ');
+INSERT INTO "hand_mapping" VALUES ('VALUABLE','v ˈæ l j ʊ b ə l','Va ryu ba rv','バリュバル','バリュバル');
+INSERT INTO "hand_mapping" VALUES ('VALUATION','v æ l j ʊ ˈeɪ ʃ ə n','Va ryu e i sya nv','バリュエイシャン','バリュエイション');
+INSERT INTO "hand_mapping" VALUES ('VALUE','v ˈæ l j uː','Va ryu -','バリュー','バリュー');
+INSERT INTO "hand_mapping" VALUES ('VALUED','v ˈæ l j uː d','Va ryu - dv','バリュード','バリュード');
+INSERT INTO "hand_mapping" VALUES ('VALUES','v ˈæ l j uː z','Va ryu - zv','バリューズ','バリューズ');
+INSERT INTO "hand_mapping" VALUES ('VALVE','v ˈæ l v','Va rv Vv','バルブ','バルブ');
+INSERT INTO "hand_mapping" VALUES ('VALVES','v ˈæ l v z','Va rv Vv zv','バルブズ','バルブズ');
+INSERT INTO "hand_mapping" VALUES ('VAMPIRE','v ˈæ m p aɪ ə','Va Nv pa i a','バンパイア','バンパイア');
+INSERT INTO "hand_mapping" VALUES ('VAN','v ˈæ n','Va nv','バン','バン');
+INSERT INTO "hand_mapping" VALUES ('VANCOUVER','v æ n k ˈuː v ə','Va nv ku - Va','バンクーバ','バンクーバ');
+INSERT INTO "hand_mapping" VALUES ('VANE','v ˈeɪ n','Ve i nv','ベイン','ベイン');
+INSERT INTO "hand_mapping" VALUES ('VANILLA','v ə n ˈɪ l ə','Va ni ra','バニラ','バニラ');
+INSERT INTO "hand_mapping" VALUES ('VANISH','v ˈæ n ɪ ʃ','Va ni syv','バニシュ','バニシュ');
+INSERT INTO "hand_mapping" VALUES ('VANITY','v ˈæ n ɪ t i','Va ni ti -','バニティー','バニティー');
+INSERT INTO "hand_mapping" VALUES ('VARIABILITY','v ˌɛə ɹ ɪə b ˈɪ l ɪ t i','Ve a - ri a bi ri ti -','ベアーリアビリティー','ベアーリアビリティー');
+INSERT INTO "hand_mapping" VALUES ('VARIABLE','v ˈɛə ɹ ɪə b ə l','Ve a ri a ba rv','ベアリアバル','ベアリアバル');
+INSERT INTO "hand_mapping" VALUES ('VARIABLES','v ˈɛə ɹ ɪə b ə l z','Ve a ri a ba rv zv','ベアリアバルズ','ベアリアバルズ');
+INSERT INTO "hand_mapping" VALUES ('VARIANCE','v ˈɛə ɹ ɪə n s','Ve a ri a nv sv','ベアリアンス','ベアリアンス');
+INSERT INTO "hand_mapping" VALUES ('VARIANT','v ˈɛə ɹ ɪə n t','Ve a ri a nv tv','ベアリアント','ベアリアント');
+INSERT INTO "hand_mapping" VALUES ('VARIATION','v ˌɛə ɹ ɪ ˈeɪ ʃ ə n','Ve a - ri e i sya nv','ベアーリエイシャン','ベアーリエイション');
+INSERT INTO "hand_mapping" VALUES ('VARIATIONS','v ˌɛə ɹ ɪ ˈeɪ ʃ ə n z','Ve a - ri e i sya nv zv','ベアーリエイシャンズ','ベアーリエイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('VARIED','v ˈɛə ɹ ɪ d','Ve a ri dv','ベアリド','ベアリド');
+INSERT INTO "hand_mapping" VALUES ('VARIEGATED','v ˈɛə ɹ ɪ g ˌeɪ t ɪ d','Ve a ri ge i ti dv','ベアリゲイティド','ベアリゲイティド');
+INSERT INTO "hand_mapping" VALUES ('VARIES','v ˈɛə ɹ i z','Ve a ri - zv','ベアリーズ','ベアリーズ');
+INSERT INTO "hand_mapping" VALUES ('VARIETIES','v ə ɹ ˈaɪ ə t i z','Va ra i a ti - zv','バライアティーズ','バライアティーズ');
+INSERT INTO "hand_mapping" VALUES ('VARIETY','v ə ɹ ˈaɪ ə t i','Va ra i a ti -','バライアティー','バライアティー');
+INSERT INTO "hand_mapping" VALUES ('VARIOUS','v ˈɛə ɹ ɪə s','Ve a ri a sv','ベアリアス','ベアリアス');
+INSERT INTO "hand_mapping" VALUES ('VARNISH','v ˈɑː n ɪ ʃ','Va - ni syv','バーニシュ','バーニシュ');
+INSERT INTO "hand_mapping" VALUES ('VARY','v ˈɛə ɹ i','Ve a ri -','ベアリー','ベアリー');
+INSERT INTO "hand_mapping" VALUES ('VARYING','v ˈɛə ɹ i ɪ ŋ','Ve a ri - i Nv','ベアリーイン','ベアリーイング');
+INSERT INTO "hand_mapping" VALUES ('VASE','v ˈɑː s','Va - sv','バース','バース');
+INSERT INTO "hand_mapping" VALUES ('VAST','v ˈɑː s t','Va - sv tv','バースト','バースト');
+INSERT INTO "hand_mapping" VALUES ('VASTLY','v ˈɑː s t l i','Va - sv tv ri -','バーストリー','バーストリー');
+INSERT INTO "hand_mapping" VALUES ('VAT','v ˈæ t','Va x tv','バット','バット');
+INSERT INTO "hand_mapping" VALUES ('VATICAN','v ˈæ t ɪ k ə n','Va x ti ka nv','バッティカン','バッティカン');
+INSERT INTO "hand_mapping" VALUES ('VAULT','v ˈɔː l t','Vo - rv tv','ボールト','ボールト');
+INSERT INTO "hand_mapping" VALUES ('VAUXHALL','v ˈɒ k s h ˌɔː l','Vo x kv sv ho - rv','ボックスホール','ボックスホール');
+INSERT INTO "hand_mapping" VALUES ('VEAL','v ˈiː l','Vi - rv','ビール','ビール');
+INSERT INTO "hand_mapping" VALUES ('VECTOR','v ˈɛ k t ə','Ve kv ta','ベクタ','ベクタ');
+INSERT INTO "hand_mapping" VALUES ('VEE','v ˈiː','Vi -','ビー','ビー');
+INSERT INTO "hand_mapping" VALUES ('VEER','v ˈɪə','Vi a','ビア','ビア');
+INSERT INTO "hand_mapping" VALUES ('VEES','v ˈiː z','Vi - zv','ビーズ','ビーズ');
+INSERT INTO "hand_mapping" VALUES ('VEG','v ˈɛ dʒ','Ve jyv','ベジュ','ベジュ');
+INSERT INTO "hand_mapping" VALUES ('VEGAN','v ˈiː g ə n','Vi - ga nv','ビーガン','ビーガン');
+INSERT INTO "hand_mapping" VALUES ('VEGAS','v ˈeɪ g ə s','Ve i ga sv','ベイガス','ベイガス');
+INSERT INTO "hand_mapping" VALUES ('VEGETABLE','v ˈɛ dʒ t ə b ə l','Ve jyv ta ba rv','ベジュタバル','ベジュタバル');
+INSERT INTO "hand_mapping" VALUES ('VEGETABLES','v ˈɛ dʒ t ə b ə l z','Ve jyv ta ba rv zv','ベジュタバルズ','ベジュタバルズ');
+INSERT INTO "hand_mapping" VALUES ('VEGETARIAN','v ˌɛ dʒ ɪ t ˈɛə ɹ ɪə n','Ve - jyi te a ri a nv','ベージィテアリアン','ベージィテアリアン');
+INSERT INTO "hand_mapping" VALUES ('VEGETATION','v ˌɛ dʒ ɪ t ˈeɪ ʃ ə n','Ve - jyi te i sya nv','ベージィテイシャン','ベージィテイション');
+INSERT INTO "hand_mapping" VALUES ('VEHICLE','v ˈiː ɪ k ə l','Vi - i ka rv','ビーイカル','ビーイカル');
+INSERT INTO "hand_mapping" VALUES ('VEHICLES','v ˈiː ɪ k ə l z','Vi - i ka rv zv','ビーイカルズ','ビーイカルズ');
+INSERT INTO "hand_mapping" VALUES ('VEIL','v ˈeɪ l','Ve i rv','ベイル','ベイル');
+INSERT INTO "hand_mapping" VALUES ('VEIN','v ˈeɪ n','Ve i nv','ベイン','ベイン');
+INSERT INTO "hand_mapping" VALUES ('VEINS','v ˈeɪ n z','Ve i nv zv','ベインズ','ベインズ');
+INSERT INTO "hand_mapping" VALUES ('VELOCITY','v ə l ˈɒ s ɪ t i','Va ro x si ti -','バロッシティー','バロッシティー');
+INSERT INTO "hand_mapping" VALUES ('VELVET','v ˈɛ l v ɪ t','Ve rv Vi tv','ベルビト','ベルビト');
+INSERT INTO "hand_mapping" VALUES ('VENDOR','v ˈɛ n d ə','Ve nv da','ベンダ','ベンダ');
+INSERT INTO "hand_mapping" VALUES ('VENDORS','v ˈɛ n d ə z','Ve nv da zv','ベンダズ','ベンダズ');
+INSERT INTO "hand_mapping" VALUES ('VENEER','v ɪ n ˈɪə','Vi ni a','ビニア','ビニア');
+INSERT INTO "hand_mapping" VALUES ('VENEZUELA','v ˌɛ n ɪ z w ˈeɪ l ə','Ve - ni zwe i ra','ベーニズウェイラ','ベーニズウェイラ');
+INSERT INTO "hand_mapping" VALUES ('VENGEANCE','v ˈɛ n dʒ ə n s','Ve nv jya nv sv','ベンジャンス','ベンジャンス');
+INSERT INTO "hand_mapping" VALUES ('VENICE','v ˈɛ n ɪ s','Ve ni sv','ベニス','ベニス');
+INSERT INTO "hand_mapping" VALUES ('VENOM','v ˈɛ n ə m','Ve na mv','ベナム','ベナム');
+INSERT INTO "hand_mapping" VALUES ('VENT','v ˈɛ n t','Ve nv tv','ベント','ベント');
+INSERT INTO "hand_mapping" VALUES ('VENTURE','v ˈɛ n tʃ ə','Ve nv tya','ベンチャ','ベンチャ');
+INSERT INTO "hand_mapping" VALUES ('VENTURES','v ˈɛ n tʃ ə z','Ve nv tya zv','ベンチャズ','ベンチャズ');
+INSERT INTO "hand_mapping" VALUES ('VENUE','v ˈɛ n j uː','Ve nyu -','ベニュー','ベニュー');
+INSERT INTO "hand_mapping" VALUES ('VENUES','v ˈɛ n uː z','Ve nu - zv','ベヌーズ','ベヌーズ');
+INSERT INTO "hand_mapping" VALUES ('VENUS','v ˈiː n ə s','Vi - na sv','ビーナス','ビーナス');
+INSERT INTO "hand_mapping" VALUES ('VERA','v ˈɪə ɹ ə','Vi a ra','ビアラ','ビアラ');
+INSERT INTO "hand_mapping" VALUES ('VERB','v ˈɜː b','Ve - bv','ベーブ','ベーブ');
+INSERT INTO "hand_mapping" VALUES ('VERBAL','v ˈɜː b ə l','Ve - ba rv','ベーバル','ベーバル');
+INSERT INTO "hand_mapping" VALUES ('VERBATIM','v ɜː b ˈeɪ t ɪ m','Ve - be i ti mv','ベーベイティム','ベーベイティム');
+INSERT INTO "hand_mapping" VALUES ('VERBIAGE','v ˈɜː b ɪ ɪ dʒ','Ve - bi i jyv','ベービイジュ','ベービイジュ');
+INSERT INTO "hand_mapping" VALUES ('VERBS','v ˈɜː b z','Ve - bv zv','ベーブズ','ベーブズ');
+INSERT INTO "hand_mapping" VALUES ('VERDICT','v ˈɜː d ɪ k t','Ve - di kv tv','ベーディクト','ベーディクト');
+INSERT INTO "hand_mapping" VALUES ('VERGE','v ˈɜː dʒ','Ve - jyv','ベージュ','ベージュ');
+INSERT INTO "hand_mapping" VALUES ('VERIFICATION','v ˌɛ ɹ ɪ f ɪ k ˈeɪ ʃ ə n','Ve - ri fi ke i sya nv','ベーリフィケイシャン','ベーリフィケイション');
+INSERT INTO "hand_mapping" VALUES ('VERIFIED','v ˈɛ ɹ ɪ f ˌaɪ d','Ve ri fa i dv','ベリファイド','ベリファイド');
+INSERT INTO "hand_mapping" VALUES ('VERIFY','v ˈɛ ɹ ɪ f ˌaɪ','Ve ri fa i','ベリファイ','ベリファイ');
+INSERT INTO "hand_mapping" VALUES ('VERMIN','v ˈɜː m ɪ n','Ve - mi nv','ベーミン','ベーミン');
+INSERT INTO "hand_mapping" VALUES ('VERMONT','v ə m ˈɒ n t','Va mo nv tv','バモント','バモント');
+INSERT INTO "hand_mapping" VALUES ('VERSATILE','v ˈɜː s ə t ˌaɪ l','Ve - sa ta i rv','ベーサタイル','ベーサタイル');
+INSERT INTO "hand_mapping" VALUES ('VERSE','v ˈɜː s','Ve - sv','ベース','ベース');
+INSERT INTO "hand_mapping" VALUES ('VERSION','v ˈɜː ʒ ə n','Ve - jya nv','ベージャン','ベージョン');
+INSERT INTO "hand_mapping" VALUES ('VERSIONS','v ˈɜː ʒ ə n z','Ve - jya nv zv','ベージャンズ','ベージャンズ');
+INSERT INTO "hand_mapping" VALUES ('VERSUS','v ˈɜː s ə s','Ve - sa sv','ベーサス','ベーサス');
+INSERT INTO "hand_mapping" VALUES ('VERTEX','v ˈɜː t ˌɛ k s','Ve - te - kv sv','ベーテークス','ベーテークス');
+INSERT INTO "hand_mapping" VALUES ('VERTICAL','v ˈɜː t ɪ k ə l','Ve - ti ka rv','ベーティカル','ベーティカル');
+INSERT INTO "hand_mapping" VALUES ('VERTICES','v ˈɜː t ɪ s ˌiː z','Ve - ti si - zv','ベーティシーズ','ベーティシーズ');
+INSERT INTO "hand_mapping" VALUES ('VERTIGO','v ˈɜː t ɪ g ˌəʊ','Ve - ti go','ベーティゴ','ベーティゴ');
+INSERT INTO "hand_mapping" VALUES ('VERY','v ˈɛ ɹ i','Ve ri -','ベリー','ベリー');
+INSERT INTO "hand_mapping" VALUES ('VESSEL','v ˈɛ s ə l','Ve sa rv','ベサル','ベサル');
+INSERT INTO "hand_mapping" VALUES ('VESSELS','v ˈɛ s ə l z','Ve sa rv zv','ベサルズ','ベサルズ');
+INSERT INTO "hand_mapping" VALUES ('VEST','v ˈɛ s t','Ve sv tv','ベスト','ベスト');
+INSERT INTO "hand_mapping" VALUES ('VESTED','v ˈɛ s t ɪ d','Ve sv ti dv','ベスティド','ベスティド');
+INSERT INTO "hand_mapping" VALUES ('VET','v ˈɛ t','Ve tv','ベト','ベト');
+INSERT INTO "hand_mapping" VALUES ('VETERAN','v ˈɛ t ə ɹ ə n','Ve ta ra nv','ベタラン','ベタラン');
+INSERT INTO "hand_mapping" VALUES ('VETERANS','v ˈɛ t ə ɹ ə n z','Ve ta ra nv zv','ベタランズ','ベタランズ');
+INSERT INTO "hand_mapping" VALUES ('VETERINARY','v ˈɛ t ə ɹ ɪ n ə ɹ i','Ve ta ri na ri -','ベタリナリー','ベタリナリー');
+INSERT INTO "hand_mapping" VALUES ('VETO','v ˈiː t əʊ','Vi - to','ビート','ビート');
+INSERT INTO "hand_mapping" VALUES ('VETOES','v ˈiː t əʊ z','Vi - to zv','ビートズ','ビートズ');
+INSERT INTO "hand_mapping" VALUES ('VIA(1)','v ˈaɪ ə','Va i a','バイア','バイア');
+INSERT INTO "hand_mapping" VALUES ('VIA(2)','v ˈiː ə','Vi - a','ビーア','ビーア');
+INSERT INTO "hand_mapping" VALUES ('VIABLE','v ˈaɪ ə b ə l','Va i a ba rv','バイアバル','バイアバル');
+INSERT INTO "hand_mapping" VALUES ('VIAGRA','v aɪ ˈæ g ɹ ə','Va i a gv ra','バイアグラ','バイアグラ');
+INSERT INTO "hand_mapping" VALUES ('VIBE','v ˈaɪ b','Va i bv','バイブ','バイブ');
+INSERT INTO "hand_mapping" VALUES ('VIBRANT','v ˈaɪ b ɹ ə n t','Va i bv ra nv tv','バイブラント','バイブラント');
+INSERT INTO "hand_mapping" VALUES ('VIBRATOR','v ˈaɪ b ɹ eɪ t ə','Va i bv re i ta','バイブレイタ','バイブレイタ');
+INSERT INTO "hand_mapping" VALUES ('VIBRATORS','v ˈaɪ b ɹ eɪ t ə z','Va i bv re i ta zv','バイブレイタズ','バイブレイタズ');
+INSERT INTO "hand_mapping" VALUES ('VICAR','v ˈɪ k ə','Vi ka','ビカ','ビカ');
+INSERT INTO "hand_mapping" VALUES ('VICE','v ˈaɪ s','Va i sv','バイス','バイス');
+INSERT INTO "hand_mapping" VALUES ('VICE-PRESIDENT','v ˌaɪ s p ɹ ˈɛ z ɪ d ə n t','Va i sv pv re zi da nv tv','バイスプレジダント','バイスプレジダント');
+INSERT INTO "hand_mapping" VALUES ('VICE_VERSA','v ˈaɪ s ɪ v ˈɜː s ə','Va i si Ve - sa','バイシベーサ','バイシベーサ');
+INSERT INTO "hand_mapping" VALUES ('VICIOUS','v ˈɪ ʃ ə s','Vi sya sv','ビシャス','ビシャス');
+INSERT INTO "hand_mapping" VALUES ('VICKI','v ˈɪ k i','Vi ki -','ビキー','ビキー');
+INSERT INTO "hand_mapping" VALUES ('VICKY','v ˈɪ k i','Vi ki -','ビキー','ビキー');
+INSERT INTO "hand_mapping" VALUES ('VICTIM','v ˈɪ k t ɪ m','Vi kv ti mv','ビクティム','ビクティム');
+INSERT INTO "hand_mapping" VALUES ('VICTIMS','v ˈɪ k t ɪ m z','Vi kv ti mv zv','ビクティムズ','ビクティムズ');
+INSERT INTO "hand_mapping" VALUES ('VICTOR','v ˈɪ k t ə','Vi kv ta','ビクタ','ビクタ');
+INSERT INTO "hand_mapping" VALUES ('VICTORIA','v ɪ k t ˈɔː ɹ ɪə','Vi kv to - ri a','ビクトーリア','ビクトーリア');
+INSERT INTO "hand_mapping" VALUES ('VICTORIAN','v ɪ k t ˈɔː ɹ ɪə n','Vi kv to - ri a nv','ビクトーリアン','ビクトーリアン');
+INSERT INTO "hand_mapping" VALUES ('VICTORY(1)','v ˈɪ k t ɹ i','Vi kv tv ri -','ビクトリー','ビクトリー');
+INSERT INTO "hand_mapping" VALUES ('VICTORY(2)','v ˈɪ k t ə ɹ i','Vi kv ta ri -','ビクタリー','ビクタリー');
+INSERT INTO "hand_mapping" VALUES ('VID','v ˈɪ d','Vi dv','ビド','ビド');
+INSERT INTO "hand_mapping" VALUES ('VIDEO','v ˈɪ d ɪ əʊ','Vi di o','ビディオ','ビディオ');
+INSERT INTO "hand_mapping" VALUES ('VIDEO-TAPED','v ˈɪ d ɪ əʊ t ˌeɪ p t','Vi di o te i pv tv','ビディオテイプト','ビディオテイプト');
+INSERT INTO "hand_mapping" VALUES ('VIDEOS','v ˈɪ d ɪ əʊ z','Vi di o zv','ビディオズ','ビディオズ');
+INSERT INTO "hand_mapping" VALUES ('VIDS','v ˈɪ d z','Vi zv','ビズ','ビズ');
+INSERT INTO "hand_mapping" VALUES ('VIE','v ˈaɪ','Va i','バイ','バイ');
+INSERT INTO "hand_mapping" VALUES ('VIENNA','v ɪ ˈɛ n ə','Vi e na','ビエナ','ビエナ');
+INSERT INTO "hand_mapping" VALUES ('VIETNAM','v j ˌɛ t n ˈæ m','Vye - tv na mv','ビェートナム','ビェートナム');
+INSERT INTO "hand_mapping" VALUES ('VIETNAMESE','v j ˌɛ t n ə m ˈiː z','Vye - tv na mi - zv','ビェートナミーズ','ビェートナミーズ');
+INSERT INTO "hand_mapping" VALUES ('VIEW','v j ˈuː','Vyu -','ビュー','ビュー');
+INSERT INTO "hand_mapping" VALUES ('VIEWED','v j ˈuː d','Vyu - dv','ビュード','ビュード');
+INSERT INTO "hand_mapping" VALUES ('VIEWER','v j ˈuː ə','Vyu - a','ビューア','ビューア');
+INSERT INTO "hand_mapping" VALUES ('VIEWERS','v j ˈuː ə z','Vyu - a zv','ビューアズ','ビューアズ');
+INSERT INTO "hand_mapping" VALUES ('VIEWING','v j ˈuː ɪ ŋ','Vyu - i Nv','ビューイン','ビューイング');
+INSERT INTO "hand_mapping" VALUES ('VIEWPOINT','v j ˈuː p ˌɔɪ n t','Vyu - po i nv tv','ビューポイント','ビューポイント');
+INSERT INTO "hand_mapping" VALUES ('VIEWS','v j ˈuː z','Vyu - zv','ビューズ','ビューズ');
+INSERT INTO "hand_mapping" VALUES ('VIGIL','v ˈɪ dʒ ɪ l','Vi jyi rv','ビジィル','ビジィル');
+INSERT INTO "hand_mapping" VALUES ('VIGILANT','v ˈɪ dʒ ɪ l ə n t','Vi jyi ra nv tv','ビジィラント','ビジィラント');
+INSERT INTO "hand_mapping" VALUES ('VIGILANTE','v ˌɪ dʒ ɪ l ˈæ n t i','Vi - jyi ra nv ti -','ビージィランティー','ビージィランティー');
+INSERT INTO "hand_mapping" VALUES ('VIGOROUS','v ˈɪ g ə ɹ ə s','Vi ga ra sv','ビガラス','ビガラス');
+INSERT INTO "hand_mapping" VALUES ('VIGOROUSLY','v ˈɪ g ə ɹ ə s l i','Vi ga ra sv ri -','ビガラスリー','ビガラスリー');
+INSERT INTO "hand_mapping" VALUES ('VIGOUR','v ˈɪ g ə','Vi ga','ビガ','ビガ');
+INSERT INTO "hand_mapping" VALUES ('VIKING','v ˈaɪ k ɪ ŋ','Va i ki Nv','バイキン','バイキング');
+INSERT INTO "hand_mapping" VALUES ('VILE','v ˈaɪ l','Va i rv','バイル','バイル');
+INSERT INTO "hand_mapping" VALUES ('VILLA','v ˈɪ l ə','Vi ra','ビラ','ビラ');
+INSERT INTO "hand_mapping" VALUES ('VILLAGE','v ˈɪ l ɪ dʒ','Vi ri jyv','ビリジュ','ビリジュ');
+INSERT INTO "hand_mapping" VALUES ('VILLAGERS','v ˈɪ l ɪ dʒ ə z','Vi ri jya zv','ビリジャズ','ビリジャズ');
+INSERT INTO "hand_mapping" VALUES ('VILLAGES','v ˈɪ l ɪ dʒ ɪ z','Vi ri jyi zv','ビリジィズ','ビリジィズ');
+INSERT INTO "hand_mapping" VALUES ('VILLAS','v ˈɪ l ə z','Vi ra zv','ビラズ','ビラズ');
+INSERT INTO "hand_mapping" VALUES ('VILNIUS(1)','v ˈɪ l n ɪə s','Vi rv ni a sv','ビルニアス','ビルニアス');
+INSERT INTO "hand_mapping" VALUES ('VILNIUS(2)','v ˈɪ l n ɪ ʊ s','Vi rv ni u sv','ビルニウス','ビルニウス');
+INSERT INTO "hand_mapping" VALUES ('VIM','v ˈɪ m','Vi mv','ビム','ビム');
+INSERT INTO "hand_mapping" VALUES ('VINCENT','v ˈɪ n s ə n t','Vi nv sa nv tv','ビンサント','ビンサント');
+INSERT INTO "hand_mapping" VALUES ('VINE','v ˈaɪ n','Va i nv','バイン','バイン');
+INSERT INTO "hand_mapping" VALUES ('VINEGAR','v ˈɪ n ɪ g ə','Vi ni ga','ビニガ','ビニガ');
+INSERT INTO "hand_mapping" VALUES ('VINTAGE','v ˈɪ n t ɪ dʒ','Vi nv ti jyv','ビンティジュ','ビンティジュ');
+INSERT INTO "hand_mapping" VALUES ('VINYL','v ˈaɪ n ə l','Va i na rv','バイナル','バイナル');
+INSERT INTO "hand_mapping" VALUES ('VIOLATION','v aɪ ə l ˈeɪ ʃ ə n','Va i a re i sya nv','バイアレイシャン','バイアレイション');
+INSERT INTO "hand_mapping" VALUES ('VIOLATIONS','v aɪ ə l ˈeɪ ʃ ə n z','Va i a re i sya nv zv','バイアレイシャンズ','バイアレイシャンズ');
+INSERT INTO "hand_mapping" VALUES ('VIOLENCE','v ˈaɪ ə l ə n s','Va i a ra nv sv','バイアランス','バイアランス');
+INSERT INTO "hand_mapping" VALUES ('VIOLENT(1)','v ˈaɪ l ə n t','Va i ra nv tv','バイラント','バイラント');
+INSERT INTO "hand_mapping" VALUES ('VIOLENT(2)','v ˈaɪ ə l ə n t','Va i a ra nv tv','バイアラント','バイアラント');
+INSERT INTO "hand_mapping" VALUES ('VIOLENTLY','v ˈaɪ ə l ə n t l i','Va i a ra nv tv ri -','バイアラントリー','バイアラントリー');
+INSERT INTO "hand_mapping" VALUES ('VIOLET','v ˈaɪ ə l ɪ t','Va i a ri tv','バイアリト','バイアリト');
+INSERT INTO "hand_mapping" VALUES ('VIOLIN','v aɪ ə l ˈɪ n','Va i a ri nv','バイアリン','バイアリン');
+INSERT INTO "hand_mapping" VALUES ('VIRAL','v ˈaɪ ɹ ə l','Va i ra rv','バイラル','バイラル');
+INSERT INTO "hand_mapping" VALUES ('VIRGIN','v ˈɜː dʒ ɪ n','Ve - jyi nv','ベージィン','ベージィン');
+INSERT INTO "hand_mapping" VALUES ('VIRGINIA','v ə dʒ ˈɪ n j ə','Va jyi nya','バジィニャ','バジィニャ');
+INSERT INTO "hand_mapping" VALUES ('VIRTUAL','v ˈɜː tʃ ʊə l','Ve - tyu a rv','ベーチュアル','ベーチュアル');
+INSERT INTO "hand_mapping" VALUES ('VIRTUALLY','v ˈɜː tʃ ʊə l i','Ve - tyu a ri -','ベーチュアリー','ベーチュアリー');
+INSERT INTO "hand_mapping" VALUES ('VIRTUE','v ˈɜː tʃ uː','Ve - tyu -','ベーチュー','ベーチュー');
+INSERT INTO "hand_mapping" VALUES ('VIRUS','v ˈaɪ ɹ ə s','Va i ra sv','バイラス','バイラス');
+INSERT INTO "hand_mapping" VALUES ('VIRUSES','v ˈaɪ ɹ ə s ɪ z','Va i ra si zv','バイラシズ','バイラシズ');
+INSERT INTO "hand_mapping" VALUES ('VISA','v ˈiː z ə','Vi - za','ビーザ','ビーザ');
+INSERT INTO "hand_mapping" VALUES ('VISCERAL','v ˈɪ s ə ɹ ə l','Vi sa ra rv','ビサラル','ビサラル');
+INSERT INTO "hand_mapping" VALUES ('VISIBILITY','v ˌɪ z ɪ b ˈɪ l ɪ t i','Vi - zi bi ri ti -','ビージビリティー','ビージビリティー');
+INSERT INTO "hand_mapping" VALUES ('VISIBLE','v ˈɪ z ɪ b ə l','Vi zi ba rv','ビジバル','ビジバル');
+INSERT INTO "hand_mapping" VALUES ('VISION','v ˈɪ ʒ ə n','Vi jya nv','ビジャン','ビジョン');
+INSERT INTO "hand_mapping" VALUES ('VISIT','v ˈɪ z ɪ t','Vi zi tv','ビジト','ビジト');
+INSERT INTO "hand_mapping" VALUES ('VISITED','v ˈɪ z ɪ t ɪ d','Vi zi ti dv','ビジティド','ビジティド');
+INSERT INTO "hand_mapping" VALUES ('VISITING','v ˈɪ z ɪ t ɪ ŋ','Vi zi ti Nv','ビジティン','ビジティング');
+INSERT INTO "hand_mapping" VALUES ('VISITOR','v ˈɪ z ɪ t ə','Vi zi ta','ビジタ','ビジタ');
+INSERT INTO "hand_mapping" VALUES ('VISITORS','v ˈɪ z ɪ t ə z','Vi zi ta zv','ビジタズ','ビジタズ');
+INSERT INTO "hand_mapping" VALUES ('VISITS','v ˈɪ z ɪ t s','Vi zi tsv','ビジツ','ビジツ');
+INSERT INTO "hand_mapping" VALUES ('VISTA','v ˈɪ s t ə','Vi sv ta','ビスタ','ビスタ');
+INSERT INTO "hand_mapping" VALUES ('VISUAL(1)','v ˈɪ ʒ ʊə l','Vi jyu a rv','ビジュアル','ビジュアル');
+INSERT INTO "hand_mapping" VALUES ('VISUAL(2)','v ˈɪ z j ʊə l','Vi zyu a rv','ビジュアル','ビジュアル');
+INSERT INTO "hand_mapping" VALUES ('VISUALISATION(1)','v ˌɪ ʒ ʊə l aɪ z ˈeɪ ʃ ə n','Vi - jyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
+INSERT INTO "hand_mapping" VALUES ('VISUALISATION(2)','v ˌɪ z j ʊə l aɪ z ˈeɪ ʃ ə n','Vi - zyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
+INSERT INTO "hand_mapping" VALUES ('VISUALIZATION(1)','v ˌɪ ʒ ʊə l aɪ z ˈeɪ ʃ ə n','Vi - jyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
+INSERT INTO "hand_mapping" VALUES ('VISUALIZATION(2)','v ˌɪ z j ʊə l aɪ z ˈeɪ ʃ ə n','Vi - zyu a ra i ze i sya nv','ビージュアライゼイシャン','ビージュアライゼイション');
+INSERT INTO "hand_mapping" VALUES ('VITAL','v ˈaɪ t ə l','Va i ta rv','バイタル','バイタル');
+INSERT INTO "hand_mapping" VALUES ('VITAMIN','v ˈɪ t ə m ɪ n','Vi ta mi nv','ビタミン','ビタミン');
+INSERT INTO "hand_mapping" VALUES ('VITAMINS','v ˈɪ t ə m ɪ n z','Vi ta mi nv zv','ビタミンズ','ビタミンズ');
+INSERT INTO "hand_mapping" VALUES ('VIVID','v ˈɪ v ɪ d','Vi Vi dv','ビビド','ビビド');
+INSERT INTO "hand_mapping" VALUES ('VIXEN','v ˈɪ k s ə n','Vi kv sa nv','ビクサン','ビクサン');
+INSERT INTO "hand_mapping" VALUES ('VOCABULARY','v əʊ k ˈæ b j ʊ l ə ɹ i','Vo ka byu ra ri -','ボカビュラリー','ボカビュラリー');
+INSERT INTO "hand_mapping" VALUES ('VOCAL','v ˈəʊ k ə l','Vo - ka rv','ボーカル','ボーカル');
+INSERT INTO "hand_mapping" VALUES ('VOCALS','v ˈəʊ k ə l z','Vo - ka rv zv','ボーカルズ','ボーカルズ');
+INSERT INTO "hand_mapping" VALUES ('VOCATION','v əʊ k ˈeɪ ʃ ə n','Vo ke i sya nv','ボケイシャン','ボケイション');
+INSERT INTO "hand_mapping" VALUES ('VOCATIONAL','v əʊ k ˈeɪ ʃ ə n ə l','Vo ke i sya na rv','ボケイシャナル','ボケイシャナル');
+INSERT INTO "hand_mapping" VALUES ('VODKA','v ˈɒ d k ə','Vo dv ka','ボドカ','ボドカ');
+INSERT INTO "hand_mapping" VALUES ('VOGUE','v ˈəʊ g','Vo - gv','ボーグ','ボーグ');
+INSERT INTO "hand_mapping" VALUES ('VOICE','v ˈɔɪ s','Vo i sv','ボイス','ボイス');
+INSERT INTO "hand_mapping" VALUES ('VOICES','v ˈɔɪ s ɪ z','Vo i si zv','ボイシズ','ボイシズ');
+INSERT INTO "hand_mapping" VALUES ('VOID','v ˈɔɪ d','Vo i dv','ボイド','ボイド');
+INSERT INTO "hand_mapping" VALUES ('VOLCANO','v ɒ l k ˈeɪ n əʊ','Vo rv ke i no','ボルケイノ','ボルケイノ');
+INSERT INTO "hand_mapping" VALUES ('VOLE','v ˈəʊ l','Vo - rv','ボール','ボール');
+INSERT INTO "hand_mapping" VALUES ('VOLES','v ˈəʊ l z','Vo - rv zv','ボールズ','ボールズ');
+INSERT INTO "hand_mapping" VALUES ('VOLKSWAGEN','v ˈəʊ l k s w ˌæ g ə n','Vo - rv kv swa ga nv','ボールクスァガン','ボールクスァガン');
+INSERT INTO "hand_mapping" VALUES ('VOLLEYBALL','v ˈɒ l iː b ˌɔː l','Vo ri - bo - rv','ボリーボール','ボリーボール');
+INSERT INTO "hand_mapping" VALUES ('VOLT(1)','v ˈəʊ l t','Vo - rv tv','ボールト','ボールト');
+INSERT INTO "hand_mapping" VALUES ('VOLT(2)','v ˈɒ l t','Vo rv tv','ボルト','ボルト');
+INSERT INTO "hand_mapping" VALUES ('VOLTAGE','v ˈəʊ l t ɪ dʒ','Vo - rv ti jyv','ボールティジュ','ボールティジュ');
+INSERT INTO "hand_mapping" VALUES ('VOLUME','v ˈɒ l j uː m','Vo ryu - mv','ボリューム','ボリューム');
+INSERT INTO "hand_mapping" VALUES ('VOLUMES','v ˈɒ l j uː m z','Vo ryu - mv zv','ボリュームズ','ボリュームズ');
+INSERT INTO "hand_mapping" VALUES ('VOLUNTARY','v ˈɒ l ə n t ə ɹ i','Vo ra nv ta ri -','ボランタリー','ボランタリー');
+INSERT INTO "hand_mapping" VALUES ('VOLUNTEER','v ˌɒ l ə n t ˈɪə','Vo ra nv ti a','ボランティア','ボランティア');
+INSERT INTO "hand_mapping" VALUES ('VOLUNTEERS','v ˌɒ l ə n t ˈɪə z','Vo ra nv ti a zv','ボランティアズ','ボランティアズ');
+INSERT INTO "hand_mapping" VALUES ('VOLUPTUOUS','v ə l ˈɐ p t j ʊə s','Va ra pv tyu a sv','バラプチュアス','バラプチュアス');
+INSERT INTO "hand_mapping" VALUES ('VOLVO','v ˈɒ l v əʊ','Vo rv Vo','ボルボ','ボルボ');
+INSERT INTO "hand_mapping" VALUES ('VOMIT','v ˈɒ m ɪ t','Vo mi tv','ボミト','ボミト');
+INSERT INTO "hand_mapping" VALUES ('VOTE','v ˈəʊ t','Vo - tv','ボート','ボート');
+INSERT INTO "hand_mapping" VALUES ('VOTED','v ˈəʊ t ɪ d','Vo - ti dv','ボーティド','ボーティド');
+INSERT INTO "hand_mapping" VALUES ('VOTER','v ˈəʊ t ə','Vo - ta','ボータ','ボータ');
+INSERT INTO "hand_mapping" VALUES ('VOTERS','v ˈəʊ t ə z','Vo - ta zv','ボータズ','ボータズ');
+INSERT INTO "hand_mapping" VALUES ('VOTES','v ˈəʊ t s','Vo - tsv','ボーツ','ボーツ');
+INSERT INTO "hand_mapping" VALUES ('VOTING','v ˈəʊ t ɪ ŋ','Vo - ti Nv','ボーティン','ボーティング');
+INSERT INTO "hand_mapping" VALUES ('VOUCH','v ˈaʊ tʃ','Va u tyv','バウチュ','バウチュ');
+INSERT INTO "hand_mapping" VALUES ('VOUCHER','v ˈaʊ tʃ ə','Va u tya','バウチャ','バウチャ');
+INSERT INTO "hand_mapping" VALUES ('VOUCHERS','v ˈaʊ tʃ ə z','Va u tya zv','バウチャズ','バウチャズ');
+INSERT INTO "hand_mapping" VALUES ('VOW','v ˈaʊ','Va u','バウ','バウ');
+INSERT INTO "hand_mapping" VALUES ('VOWEL','v ˈaʊ ə l','Va u a rv','バウアル','バウアル');
+INSERT INTO "hand_mapping" VALUES ('VOWELS','v ˈaʊ ə l z','Va u a rv zv','バウアルズ','バウアルズ');
+INSERT INTO "hand_mapping" VALUES ('VOYAGE','v ˈɔɪ ɪ dʒ','Vo i i jyv','ボイイジュ','ボイイジュ');
+INSERT INTO "hand_mapping" VALUES ('VOYAGER','v ˈɔɪ ɪ dʒ ə','Vo i i jya','ボイイジャ','ボイイジャ');
+INSERT INTO "hand_mapping" VALUES ('VOYEUR(1)','v w aɪ ˈɜː','Vwa i e -','ブワイエー','ブワイエー');
+INSERT INTO "hand_mapping" VALUES ('VOYEUR(2)','v ɔɪ ˈɜː','Vo i e -','ボイエー','ボイエー');
+INSERT INTO "hand_mapping" VALUES ('VULGAR','v ˈɐ l g ə','Va rv ga','バルガ','バルガ');
+INSERT INTO "hand_mapping" VALUES ('VULNERABILITY','v ˌɐ l n ə ɹ ə b ˈɪ l ɪ t i','Va rv na ra bi ri ti -','バルナラビリティー','バルナラビリティー');
+INSERT INTO "hand_mapping" VALUES ('VULNERABLE','v ˈɐ l n ə ɹ ə b ə l','Va rv na ra ba rv','バルナラバル','バルナラバル');
 INSERT INTO "hand_mapping" VALUES ('WACKY','w ˈæ k i','wa x ki -','ワッキー','ワッキー');
 INSERT INTO "hand_mapping" VALUES ('WAD','w ˈɒ d','wo dv','ウォド','ウォド');
 INSERT INTO "hand_mapping" VALUES ('WADDLE','w ˈɒ d ə l','wo da rv','ウォダル','ウォダル');
@@ -15938,8 +15938,8 @@ INSERT INTO "hand_mapping" VALUES ('WAIT','w ˈeɪ t','we i tv','ウェイト','
 INSERT INTO "hand_mapping" VALUES ('WAITED','w ˈeɪ t ɪ d','we i ti dv','ウェイティド','ウェイティド');
 INSERT INTO "hand_mapping" VALUES ('WAITER','w ˈeɪ t ə','we i ta','ウェイタ','ウェイタ');
 INSERT INTO "hand_mapping" VALUES ('WAITING','w ˈeɪ t ɪ ŋ','we i ti Nv','ウェイティン','ウェイティング');
-INSERT INTO "hand_mapping" VALUES ('WAIVE','w ˈeɪ v','we i bv','ウェイブ','ウェイブ');
-INSERT INTO "hand_mapping" VALUES ('WAIVER','w ˈeɪ v ə','we i ba','ウェイバ','ウェイバ');
+INSERT INTO "hand_mapping" VALUES ('WAIVE','w ˈeɪ v','we i Vv','ウェイブ','ウェイブ');
+INSERT INTO "hand_mapping" VALUES ('WAIVER','w ˈeɪ v ə','we i Va','ウェイバ','ウェイバ');
 INSERT INTO "hand_mapping" VALUES ('WAKE','w ˈeɪ k','we i kv','ウェイク','ウェイク');
 INSERT INTO "hand_mapping" VALUES ('WAKED','w ˈeɪ k t','we i kv tv','ウェイクト','ウェイクト');
 INSERT INTO "hand_mapping" VALUES ('WAKEN','w ˈeɪ k ə n','we i ka nv','ウェイカン','ウェイカン');
@@ -16039,13 +16039,13 @@ INSERT INTO "hand_mapping" VALUES ('WATFORD','w ˈɒ t f ə d','wo x tv fa dv','
 INSERT INTO "hand_mapping" VALUES ('WATSON','w ˈɒ t s ə n','wo x tsa nv','ウォッツァン','ウォッツァン');
 INSERT INTO "hand_mapping" VALUES ('WATT','w ˈɒ t','wo x tv','ウォット','ウォット');
 INSERT INTO "hand_mapping" VALUES ('WATTS','w ˈɒ t s','wo x tsv','ウォッツ','ウォッツ');
-INSERT INTO "hand_mapping" VALUES ('WAVE','w ˈeɪ v','we i bv','ウェイブ','ウェイブ');
-INSERT INTO "hand_mapping" VALUES ('WAVED','w ˈeɪ v d','we i bv dv','ウェイブド','ウェイブド');
-INSERT INTO "hand_mapping" VALUES ('WAVELENGTH','w ˈeɪ v l ˌɛ ŋ θ','we i bv re - Nv sv','ウェイブレーンス','ウェイブレーンス');
-INSERT INTO "hand_mapping" VALUES ('WAVER','w ˈeɪ v ə','we i ba','ウェイバ','ウェイバ');
-INSERT INTO "hand_mapping" VALUES ('WAVES','w ˈeɪ v z','we i bv zv','ウェイブズ','ウェイブズ');
-INSERT INTO "hand_mapping" VALUES ('WAVING','w ˈeɪ v ɪ ŋ','we i bi Nv','ウェイビン','ウェイビング');
-INSERT INTO "hand_mapping" VALUES ('WAVY','w ˈeɪ v i','we i bi -','ウェイビー','ウェイビー');
+INSERT INTO "hand_mapping" VALUES ('WAVE','w ˈeɪ v','we i Vv','ウェイブ','ウェイブ');
+INSERT INTO "hand_mapping" VALUES ('WAVED','w ˈeɪ v d','we i Vv dv','ウェイブド','ウェイブド');
+INSERT INTO "hand_mapping" VALUES ('WAVELENGTH','w ˈeɪ v l ˌɛ ŋ θ','we i Vv re - Nv sv','ウェイブレーンス','ウェイブレーンス');
+INSERT INTO "hand_mapping" VALUES ('WAVER','w ˈeɪ v ə','we i Va','ウェイバ','ウェイバ');
+INSERT INTO "hand_mapping" VALUES ('WAVES','w ˈeɪ v z','we i Vv zv','ウェイブズ','ウェイブズ');
+INSERT INTO "hand_mapping" VALUES ('WAVING','w ˈeɪ v ɪ ŋ','we i Vi Nv','ウェイビン','ウェイビング');
+INSERT INTO "hand_mapping" VALUES ('WAVY','w ˈeɪ v i','we i Vi -','ウェイビー','ウェイビー');
 INSERT INTO "hand_mapping" VALUES ('WAX','w ˈæ k s','wa x kv sv','ワックス','ワックス');
 INSERT INTO "hand_mapping" VALUES ('WAXY','w ˈæ k s i','wa x kv si -','ワックシー','ワックシー');
 INSERT INTO "hand_mapping" VALUES ('WAY','w ˈeɪ','we i','ウェイ','ウェイ');
@@ -16068,8 +16068,8 @@ INSERT INTO "hand_mapping" VALUES ('WEARS','w ˈɛə z','we a zv','ウェアズ'
 INSERT INTO "hand_mapping" VALUES ('WEARY','w ˈɪə ɹ i','wi a ri -','ウィアリー','ウィアリー');
 INSERT INTO "hand_mapping" VALUES ('WEASEL','w ˈiː z ə l','wi - za rv','ウィーザル','ウィーザル');
 INSERT INTO "hand_mapping" VALUES ('WEATHER','w ˈɛ ð ə','we za','ウェザ','ウェザ');
-INSERT INTO "hand_mapping" VALUES ('WEAVE','w ˈiː v','wi - bv','ウィーブ','ウィーブ');
-INSERT INTO "hand_mapping" VALUES ('WEAVED','w ˈiː v d','wi - bv dv','ウィーブド','ウィーブド');
+INSERT INTO "hand_mapping" VALUES ('WEAVE','w ˈiː v','wi - Vv','ウィーブ','ウィーブ');
+INSERT INTO "hand_mapping" VALUES ('WEAVED','w ˈiː v d','wi - Vv dv','ウィーブド','ウィーブド');
 INSERT INTO "hand_mapping" VALUES ('WEB','w ˈɛ b','we bv','ウェブ','ウェブ');
 INSERT INTO "hand_mapping" VALUES ('WEBCAM','w ˈɛ b k æ m','we bv ka mv','ウェブカム','ウェブカム');
 INSERT INTO "hand_mapping" VALUES ('WEBCAMS','w ˈɛ b k æ m z','we bv ka mv zv','ウェブカムズ','ウェブカムズ');
@@ -16132,10 +16132,10 @@ INSERT INTO "hand_mapping" VALUES ('WHACK','w ˈæ k','wa x kv','ワック','ワ
 INSERT INTO "hand_mapping" VALUES ('WHALE','w ˈeɪ l','we i rv','ウェイル','ウェイル');
 INSERT INTO "hand_mapping" VALUES ('WHARF','w ˈɔː f','wo - fv','ウォーフ','ウォーフ');
 INSERT INTO "hand_mapping" VALUES ('WHARFS','w ˈɔː f s','wo - fv sv','ウォーフス','ウォーフス');
-INSERT INTO "hand_mapping" VALUES ('WHARVES','w ˈɔː v z','wo - bv zv','ウォーブズ','ウォーブズ');
+INSERT INTO "hand_mapping" VALUES ('WHARVES','w ˈɔː v z','wo - Vv zv','ウォーブズ','ウォーブズ');
 INSERT INTO "hand_mapping" VALUES ('WHAT','w ˈɒ t','wo x tv','ウォット','ウォット');
-INSERT INTO "hand_mapping" VALUES ('WHATEVER','w ˌɒ t ˈɛ v ə','wo - te ba','ウォーテバ','ウォーテバ');
-INSERT INTO "hand_mapping" VALUES ('WHATSOEVER','w ˌɒ t s əʊ ˈɛ v ə','wo - tso e ba','ウォーツォエバ','ウォーツォエバ');
+INSERT INTO "hand_mapping" VALUES ('WHATEVER','w ˌɒ t ˈɛ v ə','wo - te Va','ウォーテバ','ウォーテバ');
+INSERT INTO "hand_mapping" VALUES ('WHATSOEVER','w ˌɒ t s əʊ ˈɛ v ə','wo - tso e Va','ウォーツォエバ','ウォーツォエバ');
 INSERT INTO "hand_mapping" VALUES ('WHEAT','w ˈiː t','wi - tv','ウィート','ウィート');
 INSERT INTO "hand_mapping" VALUES ('WHEEL','w ˈiː l','wi - rv','ウィール','ウィール');
 INSERT INTO "hand_mapping" VALUES ('WHEELBARROW','w ˈiː l b ˌæ ɹ əʊ','wi - rv ba ro','ウィールバロ','ウィールバロ');
@@ -16144,19 +16144,19 @@ INSERT INTO "hand_mapping" VALUES ('WHEELS','w ˈiː l z','wi - rv zv','ウィ
 INSERT INTO "hand_mapping" VALUES ('WHELK','w ˈɛ l k','we rv kv','ウェルク','ウェルク');
 INSERT INTO "hand_mapping" VALUES ('WHELP','w ˈɛ l p','we rv pv','ウェルプ','ウェルプ');
 INSERT INTO "hand_mapping" VALUES ('WHEN','w ˈɛ n','we nv','ウェン','ウェン');
-INSERT INTO "hand_mapping" VALUES ('WHENEVER','w ɛ n ˈɛ v ə','we ne ba','ウェネバ','ウェネバ');
+INSERT INTO "hand_mapping" VALUES ('WHENEVER','w ɛ n ˈɛ v ə','we ne Va','ウェネバ','ウェネバ');
 INSERT INTO "hand_mapping" VALUES ('WHERE','w ˈɛə','we a','ウェア','ウェア');
 INSERT INTO "hand_mapping" VALUES ('WHEREABOUTS','w ˈɛə ɹ ə b ˌaʊ t s','we a ra ba u tsv','ウェアラバウツ','ウェアラバウツ');
 INSERT INTO "hand_mapping" VALUES ('WHEREAS','w ˌɛə ɹ ˈæ z','we a - ra zv','ウェアーラズ','ウェアーラズ');
 INSERT INTO "hand_mapping" VALUES ('WHEREBY','w ˌɛə b ˈaɪ','we a - ba i','ウェアーバイ','ウェアーバイ');
-INSERT INTO "hand_mapping" VALUES ('WHEREVER','w ˌɛə ɹ ˈɛ v ə','we a - re ba','ウェアーレバ','ウェアーレバ');
+INSERT INTO "hand_mapping" VALUES ('WHEREVER','w ˌɛə ɹ ˈɛ v ə','we a - re Va','ウェアーレバ','ウェアーレバ');
 INSERT INTO "hand_mapping" VALUES ('WHEREWHITHAL','w ˈɛə w ɪ ð ˌɔː l','we a wi zo - rv','ウェアウィゾール','ウェアウィゾール');
 INSERT INTO "hand_mapping" VALUES ('WHET','w ˈɛ t','we tv','ウェト','ウェト');
 INSERT INTO "hand_mapping" VALUES ('WHETHER','w ˈɛ ð ə','we za','ウェザ','ウェザ');
 INSERT INTO "hand_mapping" VALUES ('WHETTED','w ˈɛ t ɪ d','we ti dv','ウェティド','ウェティド');
 INSERT INTO "hand_mapping" VALUES ('WHEY','w ˈeɪ','we i','ウェイ','ウェイ');
 INSERT INTO "hand_mapping" VALUES ('WHICH','w ˈɪ tʃ','wi tyv','ウィチュ','ウィチュ');
-INSERT INTO "hand_mapping" VALUES ('WHICHEVER','w ɪ tʃ ˈɛ v ə','wi tye ba','ウィチェバ','ウィチェバ');
+INSERT INTO "hand_mapping" VALUES ('WHICHEVER','w ɪ tʃ ˈɛ v ə','wi tye Va','ウィチェバ','ウィチェバ');
 INSERT INTO "hand_mapping" VALUES ('WHIFF','w ˈɪ f','wi fv','ウィフ','ウィフ');
 INSERT INTO "hand_mapping" VALUES ('WHILE','w ˈaɪ l','wa i rv','ワイル','ワイル');
 INSERT INTO "hand_mapping" VALUES ('WHILST','w ˈaɪ l s t','wa i rv sv tv','ワイルスト','ワイルスト');
@@ -16185,7 +16185,7 @@ INSERT INTO "hand_mapping" VALUES ('WHITES','w ˈaɪ t s','wa i tsv','ワイツ'
 INSERT INTO "hand_mapping" VALUES ('WHIZZ','w ˈɪ z','wi zv','ウィズ','ウィズ');
 INSERT INTO "hand_mapping" VALUES ('WHO','h ˈuː','hu -','フー','フー');
 INSERT INTO "hand_mapping" VALUES ('WHOA','w ˈəʊ','wo -','ウォー','ウォー');
-INSERT INTO "hand_mapping" VALUES ('WHOEVER','h uː ˈɛ v ə','hu - e ba','フーエバ','フーエバ');
+INSERT INTO "hand_mapping" VALUES ('WHOEVER','h uː ˈɛ v ə','hu - e Va','フーエバ','フーエバ');
 INSERT INTO "hand_mapping" VALUES ('WHOLE','h ˈəʊ l','ho - rv','ホール','ホール');
 INSERT INTO "hand_mapping" VALUES ('WHOLESALE','h ˈəʊ l s ˌeɪ l','ho - rv se i rv','ホールセイル','ホールセイル');
 INSERT INTO "hand_mapping" VALUES ('WHOLLY','h ˈəʊ l i','ho - ri -','ホーリー','ホーリー');
@@ -16304,7 +16304,7 @@ INSERT INTO "hand_mapping" VALUES ('WITHSTAND','w ɪ ð s t ˈæ n d','wi zv sv
 INSERT INTO "hand_mapping" VALUES ('WITNESS','w ˈɪ t n ɪ s','wi tv ni sv','ウィトニス','ウィトニス');
 INSERT INTO "hand_mapping" VALUES ('WITNESSES','w ˈɪ t n ɪ s ɪ z','wi tv ni si zv','ウィトニシズ','ウィトニシズ');
 INSERT INTO "hand_mapping" VALUES ('WITTY','w ˈɪ t i','wi ti -','ウィティー','ウィティー');
-INSERT INTO "hand_mapping" VALUES ('WIVES','w ˈaɪ v z','wa i bv zv','ワイブズ','ワイブズ');
+INSERT INTO "hand_mapping" VALUES ('WIVES','w ˈaɪ v z','wa i Vv zv','ワイブズ','ワイブズ');
 INSERT INTO "hand_mapping" VALUES ('WIZARD','w ˈɪ z ə d','wi za dv','ウィザド','ウィザド');
 INSERT INTO "hand_mapping" VALUES ('WOBBLY','w ˈɒ b l i','wo bv ri -','ウォブリー','ウォブリー');
 INSERT INTO "hand_mapping" VALUES ('WOE','w ˈəʊ','wo -','ウォー','ウォー');
@@ -16314,8 +16314,8 @@ INSERT INTO "hand_mapping" VALUES ('WOKE','w ˈəʊ k','wo - kv','ウォーク',
 INSERT INTO "hand_mapping" VALUES ('WOKEN','w ˈəʊ k ə n','wo - ka nv','ウォーカン','ウォーカン');
 INSERT INTO "hand_mapping" VALUES ('WOKING','w ˈəʊ k ɪ ŋ','wo - ki Nv','ウォーキン','ウォーキング');
 INSERT INTO "hand_mapping" VALUES ('WOLF','w ˈʊ l f','wu rv fv','ウルフ','ウルフ');
-INSERT INTO "hand_mapping" VALUES ('WOLVERHAMPTON','w ʊ l v ə h ˈæ m p t ə n','wu rv ba ha npv ta nv','ウルバハンプタン','ウルバハンプタン');
-INSERT INTO "hand_mapping" VALUES ('WOLVES','w ˈʊ l v z','wu rv bv zv','ウルブズ','ウルブズ');
+INSERT INTO "hand_mapping" VALUES ('WOLVERHAMPTON','w ʊ l v ə h ˈæ m p t ə n','wu rv Va ha npv ta nv','ウルバハンプタン','ウルバハンプタン');
+INSERT INTO "hand_mapping" VALUES ('WOLVES','w ˈʊ l v z','wu rv Vv zv','ウルブズ','ウルブズ');
 INSERT INTO "hand_mapping" VALUES ('WOMAN','w ˈʊ m ə n','wu ma nv','ウマン','ウマン');
 INSERT INTO "hand_mapping" VALUES ('WOMB','w ˈuː m','wu - mv','ウーム','ウーム');
 INSERT INTO "hand_mapping" VALUES ('WOMEN','w ˈɪ m ɪ n','wi mi nv','ウィミン','ウィミン');
@@ -16385,8 +16385,8 @@ INSERT INTO "hand_mapping" VALUES ('WOUND(1)','w ˈuː n d','wu - nv dv','ウー
 INSERT INTO "hand_mapping" VALUES ('WOUND(2)','w ˈaʊ n d','wa u nv dv','ワウンド','ワウンド');
 INSERT INTO "hand_mapping" VALUES ('WOUNDED','w ˈuː n d ɪ d','wu - nv di dv','ウーンディド','ウーンディド');
 INSERT INTO "hand_mapping" VALUES ('WOUNDS','w ˈuː n d z','wu - nv zv','ウーンズ','ウーンズ');
-INSERT INTO "hand_mapping" VALUES ('WOVE','w ˈəʊ v','wo - bv','ウォーブ','ウォーブ');
-INSERT INTO "hand_mapping" VALUES ('WOVEN','w ˈəʊ v ə n','wo - ba nv','ウォーバン','ウォーバン');
+INSERT INTO "hand_mapping" VALUES ('WOVE','w ˈəʊ v','wo - Vv','ウォーブ','ウォーブ');
+INSERT INTO "hand_mapping" VALUES ('WOVEN','w ˈəʊ v ə n','wo - Va nv','ウォーバン','ウォーバン');
 INSERT INTO "hand_mapping" VALUES ('WOW','w ˈaʊ','wa u','ワウ','ワウ');
 INSERT INTO "hand_mapping" VALUES ('WRANG','ɹ ˈæ ŋ','ra Nv','ラン','ラング');
 INSERT INTO "hand_mapping" VALUES ('WRAP','ɹ ˈæ p','ra x pv','ラップ','ラップ');
@@ -16490,19 +16490,19 @@ INSERT INTO "hand_mapping" VALUES ('YOURS(2)','j ˈɔː z','yo - zv','ヨーズ'
 INSERT INTO "hand_mapping" VALUES ('YOURSELF(1)','j ə s ˈɛ l f','ya se rv fv','ヤセルフ','ヤセルフ');
 INSERT INTO "hand_mapping" VALUES ('YOURSELF(2)','j ʊə s ˈɛ l f','yu a se rv fv','ユアセルフ','ユアセルフ');
 INSERT INTO "hand_mapping" VALUES ('YOURSELF(3)','j ɔː s ˈɛ l f','yo - se rv fv','ヨーセルフ','ヨーセルフ');
-INSERT INTO "hand_mapping" VALUES ('YOURSELVES(1)','j ə s ˈɛ l v z','ya se rv bv zv','ヤセルブズ','ヤセルブズ');
-INSERT INTO "hand_mapping" VALUES ('YOURSELVES(2)','j ʊə s ˈɛ l v z','yu a se rv bv zv','ユアセルブズ','ユアセルブズ');
-INSERT INTO "hand_mapping" VALUES ('YOURSELVES(3)','j ɔː s ˈɛ l v z','yo - se rv bv zv','ヨーセルブズ','ヨーセルブズ');
+INSERT INTO "hand_mapping" VALUES ('YOURSELVES(1)','j ə s ˈɛ l v z','ya se rv Vv zv','ヤセルブズ','ヤセルブズ');
+INSERT INTO "hand_mapping" VALUES ('YOURSELVES(2)','j ʊə s ˈɛ l v z','yu a se rv Vv zv','ユアセルブズ','ユアセルブズ');
+INSERT INTO "hand_mapping" VALUES ('YOURSELVES(3)','j ɔː s ˈɛ l v z','yo - se rv Vv zv','ヨーセルブズ','ヨーセルブズ');
 INSERT INTO "hand_mapping" VALUES ('YOUS','j ˈuː z','yu - zv','ユーズ','ユーズ');
 INSERT INTO "hand_mapping" VALUES ('YOUTH','j ˈuː θ','yu - sv','ユース','ユース');
 INSERT INTO "hand_mapping" VALUES ('YOUTHS(1)','j ˈuː ð z','yu - zv zv','ユーズズ','ユーズズ');
 INSERT INTO "hand_mapping" VALUES ('YOUTHS(2)','j ˈuː θ s','yu - sv sv','ユースス','ユースス');
 INSERT INTO "hand_mapping" VALUES ('YUCK','j ˈɐ k','ya kv','ヤク','ヤク');
-INSERT INTO "hand_mapping" VALUES ('YUGOSLAVIA','j ˌuː g əʊ s l ˈɑː v ɪə','yu - go sv ra - bi a','ユーゴスラービア','ユーゴスラービア');
+INSERT INTO "hand_mapping" VALUES ('YUGOSLAVIA','j ˌuː g əʊ s l ˈɑː v ɪə','yu - go sv ra - Vi a','ユーゴスラービア','ユーゴスラービア');
 INSERT INTO "hand_mapping" VALUES ('YUM','j ˈɐ m','ya mv','ヤム','ヤム');
 INSERT INTO "hand_mapping" VALUES ('YUMMIE','j ˈɐ m i','ya mi -','ヤミー','ヤミー');
 INSERT INTO "hand_mapping" VALUES ('YUP','j ˈɐ p','ya pv','ヤプ','ヤプ');
-INSERT INTO "hand_mapping" VALUES ('YVONNE','ɪ v ˈɒ n','i bo nv','イボン','イボン');
+INSERT INTO "hand_mapping" VALUES ('YVONNE','ɪ v ˈɒ n','i Vo nv','イボン','イボン');
 INSERT INTO "hand_mapping" VALUES ('ZAGREB','z ˈɑː g ɹ ɛ b','za - gv re bv','ザーグレブ','ザーグレブ');
 INSERT INTO "hand_mapping" VALUES ('ZAMBIA','z ˈæ m b ɪə','za Nv bi a','ザンビア','ザンビア');
 INSERT INTO "hand_mapping" VALUES ('ZANY','z ˈeɪ n i','ze i ni -','ゼイニー','ゼイニー');
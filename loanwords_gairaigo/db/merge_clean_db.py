@@ -3,6 +3,7 @@
 """ Merge and clean the entries from the testing and training data. """
 
 import re
+import sys
 import string
 import sqlite3
 import logging
@@ -11,35 +12,20 @@ import unicodedata
 from typing import Set
 from pathlib import Path
 
-import unidecode
+HERE = Path(__file__).parent
+sys.path.insert(0, str(HERE.parent / "python"))
 
-logging.basicConfig(level=logging.INFO)
+from profiling import phase, profiled, stage_parser
+from normalize import norm_en_quiet
 
 # japanese_whitespace_punctuation = re.compile(r"[\s\u3000\u303f\u30fb]")
 whitespace = re.compile(r"\s+")
 jap_whitespace = re.compile(r"[\s・]+")
-non_ascii = re.compile(r"[^A-Z.'\- ]")
 non_katakana = re.compile(r"[^\u30a1-\u30fa\u30fc]")
-pronunciation_alternative = re.compile(r"\(\d\)$")
-bad_ends = r"[0-9\s!#\$%&\(\)\*\+,\-\./:;<=>\?@\[\\\]^_`{\|}~\u3000\u303f\u30fb]+"
-bad_front = re.compile(r"^" + bad_ends)
-bad_back = re.compile(bad_ends + r"$")
 
 
 def norm_en(word: str) -> str:
-    # Remove CMUdict's alternative pronunciation notation (e.g., "UPPER(1) -> UPPER").
-    normalized_word = pronunciation_alternative.sub("", word)
-    normalized_word = (
-        "".join(
-            c
-            for c in unidecode.unidecode(unicodedata.normalize("NFKC", normalized_word))
-        )
-        .upper()
-        .strip()
-    )
-    normalized_word = bad_front.sub("", bad_back.sub("", normalized_word))
-    if non_ascii.search(normalized_word):
-        normalized_word = ""
+    normalized_word = norm_en_quiet(word)
     if not normalized_word:
         logging.warning(f"{word} normalized to empty string!")
     return normalized_word
@@ -49,121 +35,154 @@ def norm_ja(word: str) -> str:
     return non_katakana.sub("", unicodedata.normalize("NFKC", word).strip())
 
 
-HERE = Path(__file__).parent
+# Pronunciations of the single letters A to Z.
+kana_letters = (
+    "エー",
+    "ビー",
+    "シー",
+    "ディー",
+    "イー",
+    "エフ",
+    "ジー",
+    "エイチ",
+    "アイ",
+    "ジェー",
+    "ケー",
+    "エル",
+    "エム",
+    "エヌ",
+    "オー",
+    "ピー",
+    "キュー",
+    "アール",
+    "エス",
+    "ティー",
+    "ユー",
+    "ブイ",
+    "ダブリュー",
+    "エックス",
+    "ワイ",
+    "ゼット",
+)
+
 TYPE_1_DB = HERE / "type_1.db"
 TYPE_2_DB = HERE / "type_2.db"
 MERGED_DB = HERE / "merged.db"
 
-with sqlite3.connect(str(TYPE_1_DB.resolve())) as conn:
-    type_1 = map(
-        lambda ej: (norm_en(ej[0]), norm_ja(ej[1])),
-        conn.execute(
-            """
-            SELECT
-                english,
-                final
-            FROM
-                type_1
-            ;
-        """
-        ).fetchall(),
-    )
-conn.close()
-
-with sqlite3.connect(str(TYPE_2_DB.resolve())) as conn:
-    type_2 = map(
-        lambda ej: (norm_en(ej[0]), norm_ja(ej[1])),
-        conn.execute(
-            """
+
+def main():
+    from multiword import Aligner
+
+    with phase("read"), sqlite3.connect(str(TYPE_1_DB.resolve())) as conn:
+        type_1 = map(
+            lambda ej: (norm_en(ej[0]), ej[1], norm_ja(ej[1])),
+            conn.execute(
+                """
                 SELECT
                     english,
                     final
                 FROM
-                    type_2
+                    type_1
                 ;
             """
-        ).fetchall(),
-    )
-conn.close()
-
-merged = itertools.chain(type_1, type_2)
-
-with sqlite3.connect(str(MERGED_DB.resolve())) as conn:
-    conn.execute(
-        """
-            CREATE TABLE IF NOT EXISTS
-                merged (
-                    english TEXT UNIQUE,
-                    japanese TEXT
-                )
-            ;
-        """
-    )
-    englishes: Set[str] = set()
-    for eng, jap in merged:
-        if eng:
-            # Split and align multi-phrase entries.
-            eng_words = whitespace.split(eng.strip())
-            jap_words = jap_whitespace.split(jap.strip())
-            if len(eng_words) == len(jap_words):
-                for e, j in zip(eng_words, jap_words):
-                    if e not in englishes:
-                        logging.info(f"Adding {e}, {j}.")
-                        englishes.add(e)
-                        conn.execute(
-                            """
-                                INSERT INTO
-                                    merged
-                                VALUES ( ?, ? )
-                                ;
-                            """,
-                            (e, j),
-                        )
-
-    # Fix pronunciations for single letters.
-    for kana_alphabet in zip(
-        (
-            "エー",
-            "ビー",
-            "シー",
-            "ディー",
-            "イー",
-            "エフ",
-            "ジー",
-            "エイチ",
-            "アイ",
-            "ジェー",
-            "ケー",
-            "エル",
-            "エム",
-            "エヌ",
-            "オー",
-            "ピー",
-            "キュー",
-            "アール",
-            "エス",
-            "ティー",
-            "ユー",
-            "ブイ",
-            "ダブリュー",
-            "エックス",
-            "ワイ",
-            "ゼット",
-        ),
-        string.ascii_uppercase,
-    ):
+            ).fetchall(),
+        )
+    conn.close()
+
+    with phase("read"), sqlite3.connect(str(TYPE_2_DB.resolve())) as conn:
+        type_2 = map(
+            lambda ej: (norm_en(ej[0]), ej[1], norm_ja(ej[1])),
+            conn.execute(
+                """
+                    SELECT
+                        english,
+                        final
+                    FROM
+                        type_2
+                    ;
+                """
+            ).fetchall(),
+        )
+    conn.close()
+
+    merged = itertools.chain(type_1, type_2)
+
+    with phase("write"), sqlite3.connect(str(MERGED_DB.resolve())) as conn:
+        # A merged.db from before the `aligned` column would reject the inserts.
+        conn.execute("DROP TABLE IF EXISTS merged;")
         conn.execute(
             """
-                UPDATE
-                    merged
-                SET
-                    japanese = ?
-                WHERE
-                    english
-                IS
-                    ?
+                CREATE TABLE IF NOT EXISTS
+                    merged (
+                        english TEXT UNIQUE,
+                        japanese TEXT,
+                        aligned INTEGER
+                    )
                 ;
-            """,
-            kana_alphabet,
+            """
         )
-conn.close()
+        englishes: Set[str] = set()
+        aligner = Aligner(HERE)
+        # Aligned pairs only go in for words that no entry gives on its own.
+        recovered = []
+        for eng, raw_jap, jap in merged:
+            if eng:
+                # Split and align multi-phrase entries.
+                eng_words = whitespace.split(eng.strip())
+                jap_words = jap_whitespace.split(jap.strip())
+                if len(eng_words) == len(jap_words):
+                    for e, j in zip(eng_words, jap_words):
+                        if e not in englishes:
+                            logging.info(f"Adding {e}, {j}.")
+                            englishes.add(e)
+                            conn.execute(
+                                """
+                                    INSERT INTO
+                                        merged
+                                    VALUES ( ?, ?, 0 )
+                                    ;
+                                """,
+                                (e, j),
+                            )
+                else:
+                    recovered.extend(aligner.align(eng_words, raw_jap) or ())
+        for e, j in recovered:
+            if e not in englishes:
+                logging.info(f"Adding {e}, {j} (aligned).")
+                englishes.add(e)
+                conn.execute(
+                    """
+                        INSERT INTO
+                            merged
+                        VALUES ( ?, ?, 1 )
+                        ;
+                    """,
+                    (e, j),
+                )
+        logging.info(aligner.report())
+        aligner.close()
+
+        # Fix pronunciations for single letters.
+        for kana_alphabet in zip(kana_letters, string.ascii_uppercase):
+            conn.execute(
+                """
+                    UPDATE
+                        merged
+                    SET
+                        japanese = ?
+                    WHERE
+                        english
+                    IS
+                        ?
+                    ;
+                """,
+                kana_alphabet,
+            )
+    conn.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    args = stage_parser(__doc__).parse_args()
+    with profiled("merge_clean_db", args):
+        main()
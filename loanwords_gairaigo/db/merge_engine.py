@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Merge every source into `merged` in one pass, in order of source priority.
+
+Each source is read row by row, normalized and split into (English word,
+katakana) pairs, and cut into runs of at most `--run-size` pairs. Every run is
+sorted by (word, aligned, priority, tie-break) and spilled to a temporary
+file, so no more than one run is held in memory at a time. A single k-way heap merge over
+all the runs then sees each word's candidates side by side, highest priority
+first, and writes the winner. Memory use depends on `--run-size` and the
+number of runs, never on the size of the sources.
+
+Multi-word entries whose katakana does not split into as many words as the
+English are aligned with `multiword.Aligner` (unless `--no-align`). The pairs
+it recovers are sorted after every pair that was not aligned, whatever its
+source, so they only fill in words no source has on its own, and are marked
+in `merged.aligned`.
+
+This replaces `create_type_1.sql`, `create_type_2.sql` and `merge_clean_db.py`
+with the ordering given in the README:
+`JTCA > LREC'14 > JMdict > Wikipedia > Britfone > CMUdict > Wiktionary`.
+"""
+
+import os
+import heapq
+import logging
+import sqlite3
+import tempfile
+from pathlib import Path
+from collections import namedtuple
+
+from merge_clean_db import (
+    HERE,
+    MERGED_DB,
+    kana_letters,
+    norm_en,
+    norm_ja,
+    whitespace,
+    jap_whitespace,
+)
+from multiword import Aligner
+from profiling import phase, profiled, stage_parser
+
+RUN_SIZE = 500_000
+MAX_FAN_IN = 64
+WRITE_BATCH = 10_000
+
+# Every query yields (english, katakana, tie-break); within a source the
+# lowest tie-break wins, as the deduplication in the SQL scripts did.
+Source = namedtuple("Source", ["name", "db", "query"])
+
+SOURCES = (
+    Source(
+        "jtca",
+        "jtca.db",
+        """
+            SELECT
+                english,
+                japanese,
+                rowid
+            FROM
+                katakana_guide
+            ;
+        """,
+    ),
+    Source(
+        "lrec2014",
+        "lrec2014.db",
+        """
+            SELECT
+                english,
+                japanese,
+                -confidence
+            FROM
+                lrec2014
+            ;
+        """,
+    ),
+    Source(
+        "jmdict",
+        "jmdict.db",
+        """
+            SELECT
+                COALESCE(strict_eng, wasei, gloss),
+                reading,
+                entry_sequence
+            FROM
+                gairaigo_combined
+            WHERE
+                ok = 1
+            ;
+        """,
+    ),
+    Source(
+        "wikipedia",
+        "wikipedia.db",
+        """
+            SELECT
+                english,
+                japanese,
+                pageid
+            FROM
+                wikipedia
+            ;
+        """,
+    ),
+    Source(
+        "britfone",
+        "britfone.db",
+        """
+            SELECT
+                english,
+                final,
+                rowid
+            FROM
+                hand_mapping
+            ;
+        """,
+    ),
+    Source(
+        "cmudict",
+        "cmudict.db",
+        """
+            SELECT
+                english,
+                final,
+                rowid
+            FROM
+                hand_mapping
+            ;
+        """,
+    ),
+    Source(
+        "wiktionary",
+        "wiktionary.db",
+        """
+            SELECT
+                title,
+                final,
+                pageid
+            FROM
+                wiktionary
+            ;
+        """,
+    ),
+)
+
+letter_fixes = dict(zip("ABCDEFGHIJKLMNOPQRSTUVWXYZ", kana_letters))
+
+
+def readSource(source, db_dir, aligner=None):
+    """Yield the normalized (word, katakana, tie-break, aligned) pairs of one
+    source; `aligned` is whether `aligner` split the entry they came from."""
+    path = (db_dir / source.db).resolve()
+    if not path.exists():
+        logging.warning(f"{path} not found, skipping {source.name}.")
+        return
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        for eng, jap, tie_break in conn.execute(source.query):
+            if not eng or not jap:
+                continue
+            # Split and align multi-phrase entries, as merge_clean_db.py does.
+            eng_words = whitespace.split(norm_en(eng).strip())
+            jap_words = jap_whitespace.split(norm_ja(jap).strip())
+            if len(eng_words) == len(jap_words):
+                for e, j in zip(eng_words, jap_words):
+                    if e and j:
+                        yield e, j, tie_break or 0, 0
+            elif aligner is not None:
+                for e, j in aligner.align(eng_words, jap) or ():
+                    if e:
+                        yield e, j, tie_break or 0, 1
+    finally:
+        conn.close()
+
+
+def _dedupe(run):
+    """Keep only the first (best) pair of each word in a sorted run."""
+    previous = None
+    for record in run:
+        if record[0] != previous:
+            previous = record[0]
+            yield record
+
+
+def _writeRun(records, tmp_dir):
+    fd, name = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for word, aligned, priority, tie_break, jap in records:
+            f.write(f"{word}\t{aligned}\t{priority}\t{tie_break!r}\t{jap}\n")
+    return name
+
+
+def _readRun(name):
+    with open(name, encoding="utf-8") as f:
+        for line in f:
+            word, aligned, priority, tie_break, jap = line.rstrip("\n").split("\t")
+            yield word, int(aligned), int(priority), float(tie_break), jap
+
+
+def spillRuns(sources, db_dir, tmp_dir, run_size=RUN_SIZE, aligner=None):
+    """Cut every source into sorted, deduplicated run files."""
+    runs = []
+    for priority, source in enumerate(sources):
+        with phase("read"):
+            run = []
+            for word, jap, tie_break, aligned in readSource(source, db_dir, aligner):
+                # Aligned pairs lose to every other pair of the word.
+                run.append((word, aligned, priority, tie_break, jap))
+                if len(run) >= run_size:
+                    run.sort()
+                    runs.append(_writeRun(_dedupe(run), tmp_dir))
+                    run = []
+            if run:
+                run.sort()
+                runs.append(_writeRun(_dedupe(run), tmp_dir))
+        logging.info(f"{source.name}: {len(runs)} runs so far.")
+        if aligner is not None and aligner.stats["tried"]:
+            logging.info(f"{source.name}: {aligner.report()}")
+            aligner.stats.clear()
+    return runs
+
+
+def mergeRuns(runs, tmp_dir, max_fan_in=MAX_FAN_IN):
+    """One sorted stream of every run, merging in passes to cap open files."""
+    while len(runs) > max_fan_in:
+        with phase("premerge"):
+            batch, runs = runs[:max_fan_in], runs[max_fan_in:]
+            runs.append(_writeRun(_dedupe(heapq.merge(*map(_readRun, batch))), tmp_dir))
+            for name in batch:
+                os.remove(name)
+    return _dedupe(heapq.merge(*map(_readRun, runs)))
+
+
+def writeMerged(pairs, path=MERGED_DB, sources=SOURCES):
+    """Write the winning (word, katakana) pairs, replacing any older table.
+
+    `source` records which of `sources` each pair came from, so that later
+    fixes (see `python/rule_index.py`) can patch the right rows, and `aligned`
+    whether it was recovered from a multi-word entry by `multiword.Aligner`.
+    Gives the numbers of pairs and of aligned pairs written.
+    """
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        conn.execute("DROP TABLE IF EXISTS merged;")
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS
+                    merged (
+                        english TEXT UNIQUE,
+                        japanese TEXT,
+                        source TEXT,
+                        aligned INTEGER
+                    )
+                ;
+            """
+        )
+        count = recovered = 0
+        batch = []
+        for word, aligned, priority, _, jap in pairs:
+            # Fix pronunciations for single letters.
+            batch.append(
+                (word, letter_fixes.get(word, jap), sources[priority].name, aligned)
+            )
+            recovered += aligned
+            if len(batch) >= WRITE_BATCH:
+                with phase("write"):
+                    conn.executemany("INSERT INTO merged VALUES ( ?, ?, ?, ? );", batch)
+                count += len(batch)
+                batch = []
+        with phase("write"):
+            conn.executemany("INSERT INTO merged VALUES ( ?, ?, ?, ? );", batch)
+        count += len(batch)
+    conn.close()
+    return count, recovered
+
+
+def main(args):
+    with tempfile.TemporaryDirectory(dir=args.tmp_dir) as tmp_dir:
+        aligner = None if args.no_align else Aligner(args.db_dir)
+        runs = spillRuns(SOURCES, args.db_dir, tmp_dir, args.run_size, aligner)
+        if aligner is not None:
+            aligner.close()
+        count, recovered = writeMerged(
+            mergeRuns(runs, tmp_dir, args.max_fan_in), args.output
+        )
+    logging.info(
+        f"Merged {count} entries from {len(runs)} runs into {args.output}, "
+        f"{recovered} of them aligned from multi-word entries."
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = stage_parser(__doc__)
+    parser.add_argument(
+        "--db-dir", type=Path, default=HERE, help="where the source databases are"
+    )
+    parser.add_argument("--output", type=Path, default=MERGED_DB)
+    parser.add_argument(
+        "--run-size",
+        type=int,
+        default=RUN_SIZE,
+        help=f"pairs held in memory before spilling a run (default: {RUN_SIZE})",
+    )
+    parser.add_argument(
+        "--max-fan-in",
+        type=int,
+        default=MAX_FAN_IN,
+        help=f"runs merged at once (default: {MAX_FAN_IN})",
+    )
+    parser.add_argument(
+        "--tmp-dir", type=Path, default=None, help="where to spill sorted runs"
+    )
+    parser.add_argument(
+        "--no-align",
+        action="store_true",
+        help="drop multi-word entries that do not split evenly, as before",
+    )
+    args = parser.parse_args()
+    with profiled("merge_engine", args):
+        main(args)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Align multi-word entries on the transcriptions of their words.
+
+`norm_ja` drops ・ and spaces, so the katakana of a multi-word entry
+(ニューヨーク・シティ for NEW YORK CITY) is a single word and the merge used to
+drop the entry. `Aligner.align` cuts the katakana into as many pieces as there
+are English words instead, at mora boundaries, choosing the cuts whose pieces
+are closest to what the transcription engines give for each word. The search
+is a memoized dynamic program over (word, mora) positions. Each step is a
+piece at most `SLACK` morae longer or shorter than one of the word's
+transcriptions. A cut where the original had a ・ or a space is free, any
+other cut costs `CUT_COST`, and no piece may be further than `MAX_COST` (in
+mora edits per mora) from the word's transcriptions. When the original has at
+least as many separated chunks as there are words, no piece may span a
+separator: the words can only be split further, never run together.
+
+A word's transcriptions are the `final` katakana that `britfone_to_kana.py`
+and `cmu_to_kana.py` wrote for it. Words in neither get the `g2p.py` guess,
+if its model has been trained, and single letters get their names. They are
+looked up once per word and kept in an LRU cache. Entries of more than
+`MAX_WORDS` words or `MAX_MORAE` morae are not tried, so no entry costs more
+than a fixed amount of work and the merge stays linear in its input.
+
+    python multiword.py "NEW YORK CITY" ニューヨークシティ
+"""
+
+import re
+import sys
+import sqlite3
+import unicodedata
+from pathlib import Path
+from collections import Counter
+from functools import lru_cache
+
+from merge_clean_db import HERE, kana_letters, norm_en, norm_ja, whitespace
+
+MAX_WORDS = 6
+MAX_MORAE = 40
+SLACK = 2
+CUT_COST = 0.2
+MAX_COST = 0.34
+CACHE_SIZE = 2**16
+# Where the engines' transcriptions are, in `hand_mapping`.
+TRANSCRIPTIONS = ("britfone.db", "cmudict.db")
+
+jap_separators = re.compile(r"[\s・=]+")
+# Small kana belong to the mora before them.
+mora_regex = re.compile(r".[ァィゥェォャュョヮヵヶ]*")
+# No Japanese word starts with these.
+no_start = set("ーッン")
+letter_names = dict(zip("ABCDEFGHIJKLMNOPQRSTUVWXYZ", kana_letters))
+
+
+def _prefixDistances(kana, morae):
+    """Mora edit distances of `kana` from every prefix of `morae`, in one pass:
+    after the i-th mora, the last cell is the distance from morae[:i]."""
+    row = list(range(len(kana) + 1))
+    out = [row[-1]]
+    for i, x in enumerate(morae, 1):
+        previous, row[0] = row[0], i
+        for j, y in enumerate(kana, 1):
+            previous, row[j] = row[j], min(
+                row[j] + 1, row[j - 1] + 1, previous + (x != y)
+            )
+        out.append(row[-1])
+    return out
+
+
+class Aligner:
+    """Split the katakana of multi-word entries between their words."""
+
+    def __init__(self, db_dir=HERE, sources=TRANSCRIPTIONS):
+        self.paths = [Path(db_dir) / db for db in sources]
+        self._conns = None
+        self._g2p = None
+        self.transcriptions = lru_cache(maxsize=CACHE_SIZE)(self._transcriptions)
+        self.stats = Counter()
+
+    def _connect(self):
+        if self._conns is None:
+            self._conns = [
+                sqlite3.connect(f"file:{path.resolve()}?mode=ro", uri=True)
+                for path in self.paths
+                if path.exists()
+            ]
+        return self._conns
+
+    def _guess(self, word):
+        if self._g2p is None:
+            from g2p import G2P, MODEL_PATH
+
+            self._g2p = G2P.load(MODEL_PATH) if MODEL_PATH.exists() else False
+        return self._g2p.transcribe(word) if self._g2p else None
+
+    def _transcriptions(self, word):
+        """The engines' katakana for `word`, each as a tuple of morae."""
+        found = set()
+        if word in letter_names:
+            found.add(letter_names[word])
+        for conn in self._connect():
+            found.update(
+                kana
+                for (kana,) in conn.execute(
+                    """
+                        SELECT
+                            final
+                        FROM
+                            hand_mapping
+                        WHERE
+                            english IN (?, ?, ?, ?)
+                        ;
+                    """,
+                    (word, f"{word}(1)", f"{word}(2)", f"{word}(3)"),
+                )
+                if kana
+            )
+        if not found:
+            guess = self._guess(word)
+            if guess:
+                found.add(guess)
+        return tuple(tuple(mora_regex.findall(k)) for k in map(norm_ja, found) if k)
+
+    def align(self, words, kana):
+        """(word, katakana) pairs for `words` and the raw `kana`, or None."""
+        self.stats["tried"] += 1
+        morae, breaks = [], {0}
+        for chunk in jap_separators.split(unicodedata.normalize("NFKC", kana)):
+            morae.extend(mora_regex.findall(norm_ja(chunk)))
+            breaks.add(len(morae))
+        n, m = len(words), len(morae)
+        separated = len(breaks) - 1 >= n
+        if n > MAX_WORDS or m > MAX_MORAE:
+            self.stats["too long"] += 1
+            return None
+        candidates = [self.transcriptions(word) for word in words]
+        if not all(candidates):
+            self.stats["unknown word"] += 1
+            return None
+        spans = [
+            (max(1, min(map(len, kanas)) - SLACK), max(map(len, kanas)) + SLACK)
+            for kanas in candidates
+        ]
+
+        memo = {}
+
+        def best(i, start):
+            """(cost, pieces) of words[i:] over morae[start:], or None."""
+            if i == n or start == m:
+                return (0.0, ()) if i == n and start == m else None
+            if (i, start) in memo:
+                return memo[i, start]
+            result = None
+            shortest, longest = spans[i]
+            # Leave at least a mora for every word after this one.
+            last = min(start + longest, m - n + i + 1)
+            distances = [
+                (len(kana), _prefixDistances(kana, morae[start:last]))
+                for kana in candidates[i]
+            ]
+            for end in range(start + shortest, last + 1):
+                if end < m and morae[end][0] in no_start:
+                    continue
+                length = end - start
+                cost = min(d[length] / max(k, length) for k, d in distances)
+                if cost > MAX_COST:
+                    continue
+                spanned = sum(start < b < end for b in breaks)
+                if separated and spanned:
+                    continue
+                cost += CUT_COST * ((end not in breaks) + spanned)
+                rest = best(i + 1, end)
+                if rest is not None and (result is None or cost + rest[0] < result[0]):
+                    piece = "".join(morae[start:end])
+                    result = (cost + rest[0], (piece,) + rest[1])
+            memo[i, start] = result
+            return result
+
+        result = best(0, 0)
+        if result is None:
+            self.stats["no alignment"] += 1
+            return None
+        self.stats["recovered"] += 1
+        return list(zip(words, result[1]))
+
+    def report(self):
+        info = self.transcriptions.cache_info()
+        return (
+            f"{self.stats['recovered']} of {self.stats['tried']} multi-word entries "
+            f"aligned ({self.stats['too long']} too long, "
+            f"{self.stats['unknown word']} with an untranscribed word, "
+            f"{self.stats['no alignment']} without a close enough split); "
+            f"{info.hits} of {info.hits + info.misses} word transcriptions cached."
+        )
+
+    def close(self):
+        for conn in self._conns or ():
+            conn.close()
+        self._conns = None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(__doc__)
+    aligner = Aligner()
+    words = whitespace.split(norm_en(sys.argv[1]))
+    for word, kana in aligner.align(words, sys.argv[2]) or ():
+        print(f"{word}\t{kana}")
+    print(aligner.report(), file=sys.stderr)
+    aligner.close()
@@ -0,0 +1,5 @@
+"""The pipeline scripts and library modules.
+
+The modules import each other relatively inside the package and by bare name
+when they are run as scripts from this directory.
+"""
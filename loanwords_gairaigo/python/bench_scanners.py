@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark the dump scanners on synthetic dumps, without the real ones.
+
+For every scale, `dump_fixtures.py` writes a Wikipedia and a Wiktionary dump
+of `--pages` × scale pages and a JMdict of `--entries` × scale entries, the
+databases the scanners expect are seeded with the pages they look for, and
+`jmdict.scan_dict`, `wikipedia.getEngTitles` and `wiktionary_to_db.getIpa`
+are each run in a fresh interpreter (for a clean peak RSS), on a scratch
+directory rather than `db/`.
+
+    python bench_scanners.py [--scales 1 10 100] [--pages N] [--entries N] [--dir DIR]
+"""
+
+import sys
+import json
+import time
+import shutil
+import sqlite3
+import argparse
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+
+import dump_fixtures
+
+HERE = Path(__file__).resolve().parent
+
+SCALES = (1, 10, 100)
+SCANNERS = ("jmdict", "wikipedia", "wiktionary")
+DUMPS = {
+    "jmdict": "JMdict_e",
+    "wikipedia": "enwiki-latest-pages-articles.xml",
+    "wiktionary": "enwiktionary-latest-pages-articles.xml",
+}
+
+
+def writeFixtures(work, pages, entries, seed=0):
+    """Write the dumps and seed the databases in `work`; scanner -> items."""
+    import wikipedia
+    import wiktionary_to_db
+
+    wanted = dump_fixtures.writeWikipedia(work / DUMPS["wikipedia"], pages, seed)
+    wikipedia.WIKI_DB_PATH = work / "wikipedia.db"
+    wikipedia.makeTable()
+    with sqlite3.connect(str(wikipedia.WIKI_DB_PATH)) as conn:
+        conn.executemany(
+            """
+                INSERT INTO
+                    wikipedia (
+                        pageid,
+                        japanese
+                    )
+                VALUES
+                    (?, ?)
+                ;
+            """,
+            wanted,
+        )
+    conn.close()
+
+    wanted = dump_fixtures.writeWiktionary(work / DUMPS["wiktionary"], pages, seed)
+    wiktionary_to_db.DB_PATH = work / "wiktionary.db"
+    with sqlite3.connect(str(wiktionary_to_db.DB_PATH)) as conn:
+        # Normally built before this repository's scripts run; the scan only
+        # needs the page ids.
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS
+                    wiktionary (
+                        pageid INTEGER UNIQUE,
+                        title TEXT,
+                        japanese TEXT
+                    )
+                ;
+            """
+        )
+        conn.executemany(
+            """
+                INSERT INTO
+                    wiktionary (
+                        pageid,
+                        title,
+                        japanese
+                    )
+                VALUES
+                    (?, ?, ?)
+                ;
+            """,
+            wanted,
+        )
+    conn.close()
+    wiktionary_to_db.alterTable()
+
+    dump_fixtures.writeJMdict(work / DUMPS["jmdict"], entries, seed)
+    return {"jmdict": entries, "wikipedia": pages, "wiktionary": pages}
+
+
+def runScanner(scanner, work):
+    """Run `scanner` on the fixtures in `work`; (seconds, peak RSS in bytes)."""
+    from functools import partial
+
+    import progress
+    from revision_cache import RevisionCache
+
+    progress.enabled = False
+    dump = str(work / DUMPS[scanner])
+    # A cold cache, away from the real one.
+    cache = partial(RevisionCache, path=work / "revision_cache.db")
+    if scanner == "jmdict":
+        import jmdict
+
+        jmdict.DB_PATH, jmdict.JMDICT = work / "jmdict.db", dump
+        jmdict.makeTable()
+        scan = jmdict.scan_dict
+    elif scanner == "wikipedia":
+        import wikipedia
+
+        wikipedia.WIKI_DB_PATH, wikipedia.DUMP_ENG = work / "wikipedia.db", dump
+        wikipedia.RevisionCache = cache
+        scan = wikipedia.getEngTitles
+    else:
+        import wiktionary_to_db
+
+        wiktionary_to_db.DB_PATH = work / "wiktionary.db"
+        wiktionary_to_db.DUMP_ENG = dump
+        wiktionary_to_db.RevisionCache = cache
+        scan = wiktionary_to_db.getIpa
+    start = time.perf_counter()
+    scan()
+    seconds = time.perf_counter() - start
+    # Kilobytes on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return seconds, peak if sys.platform == "darwin" else peak * 1024
+
+
+def benchmark(scanner, work):
+    """(seconds, peak RSS) of `scanner` in a child process."""
+    output = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--child", scanner, str(work)],
+        cwd=str(HERE),
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stdout
+    # The scanners print their own reports first.
+    return json.loads(output.splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--pages", type=int, default=dump_fixtures.PAGES)
+    parser.add_argument("--entries", type=int, default=dump_fixtures.ENTRIES)
+    parser.add_argument("--scanners", nargs="+", choices=SCANNERS, default=SCANNERS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dir", type=Path, help="keep the fixtures here")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        scanner, work = args.child
+        print(json.dumps(runScanner(scanner, Path(work))))
+        sys.exit(0)
+
+    root = args.dir or Path(tempfile.mkdtemp(prefix="bench_scanners_"))
+    print("scanner\tscale\titems\tMB\tseconds\titems/s\tMB/s\tpeak RSS (MiB)")
+    try:
+        for scale in args.scales:
+            work = root / f"x{scale}"
+            work.mkdir(parents=True, exist_ok=True)
+            items = writeFixtures(
+                work, args.pages * scale, args.entries * scale, args.seed
+            )
+            for scanner in args.scanners:
+                size = (work / DUMPS[scanner]).stat().st_size / 1e6
+                seconds, peak = benchmark(scanner, work)
+                print(
+                    f"{scanner}\t{scale}\t{items[scanner]}\t{size:.1f}\t"
+                    f"{seconds:.2f}\t{items[scanner] / seconds:,.0f}\t"
+                    f"{size / seconds:.1f}\t{peak / 2**20:.1f}",
+                    flush=True,
+                )
+    finally:
+        if args.dir is None:
+            shutil.rmtree(str(root), ignore_errors=True)
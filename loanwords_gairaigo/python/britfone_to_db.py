@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Read the Britfone dictionary into the `main` table of britfone.db.
+
+`--source` is the CSV itself or an archive holding it, such as the zip of the
+Britfone repository from GitHub or a tarball of it; archives are read in
+place, without extracting anything. Each `WORD, p h o n e s` row becomes an
+(english, ipa) row of `main`, which `britfone_to_kana.py` transcribes.
+"""
+
+import io
+import csv
+import tarfile
+import zipfile
+import sqlite3
+from pathlib import Path
+from contextlib import contextmanager
+
+from progress import progress
+from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT_DIR / "data"
+DB_DIR = ROOT_DIR / "db"
+
+DB_PATH = DB_DIR / "britfone.db"
+CSV_NAME = "britfone.main.3.0.1.csv"
+CSV_PATH = DATA_DIR / CSV_NAME
+
+WRITE_BATCH = 10_000
+
+
+def _isMain(name):
+    name = name.rsplit("/", 1)[-1]
+    return name.startswith("britfone.main") and name.endswith(".csv")
+
+
+@contextmanager
+def openCsv(source=CSV_PATH):
+    """A text stream over the main Britfone CSV in `source`.
+
+    Use it in a `with` statement: leaving it closes the archive too.
+    """
+    source = Path(source)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            name = next((n for n in archive.namelist() if _isMain(n)), None)
+            if name is None:
+                raise ValueError(f"No britfone.main CSV in {source}.")
+            with io.TextIOWrapper(archive.open(name), encoding="utf-8") as f:
+                yield f
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(str(source), "r:*") as archive:
+            member = next((m for m in archive if m.isfile() and _isMain(m.name)), None)
+            if member is None:
+                raise ValueError(f"No britfone.main CSV in {source}.")
+            with io.TextIOWrapper(archive.extractfile(member), encoding="utf-8") as f:
+                yield f
+    else:
+        with source.open(encoding="utf-8") as f:
+            yield f
+
+
+def readRows(f):
+    """Yield the (english, ipa) rows of the CSV."""
+    rows = progress("Britfone entries")
+    for fields in csv.reader(f, skipinitialspace=True):
+        if len(fields) < 2 or not fields[0].strip():
+            continue
+        rows.update()
+        yield fields[0].strip(), fields[1].strip()
+    rows.close()
+
+
+def makeDb(rows, path=DB_PATH):
+    """Replace `main` with `rows` in one transaction, then index it."""
+    count = 0
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        conn.execute("PRAGMA synchronous=OFF;")
+        conn.execute("DROP TABLE IF EXISTS main;")
+        conn.execute(
+            """
+                CREATE TABLE
+                    main (
+                        english TEXT,
+                        ipa TEXT
+                    )
+                ;
+            """
+        )
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= WRITE_BATCH:
+                with phase("write"):
+                    conn.executemany("INSERT INTO main VALUES ( ?, ? );", batch)
+                count += len(batch)
+                batch = []
+        with phase("write"):
+            conn.executemany("INSERT INTO main VALUES ( ?, ? );", batch)
+            count += len(batch)
+            conn.execute("CREATE INDEX main_english ON main (english);")
+    conn.close()
+    return count
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=CSV_PATH,
+        help=f"{CSV_NAME} or an archive holding it (default: data/{CSV_NAME})",
+    )
+    parser.add_argument("--output", type=Path, default=DB_PATH)
+    args = parser.parse_args()
+    with profiled("britfone_to_db", args):
+        with openCsv(args.source) as f:
+            count = makeDb(readRows(f), args.output)
+    print(f"Loaded {count} Britfone entries.")
@@ -91,7 +91,7 @@ consonants = {
     "s": "s",
     "t": "t",
     "tʃ": "ty",
-    "v": "b",
+    "v": "V",
     "z": "z",
     "ð": "z",
     "ŋ": "N",
@@ -126,7 +126,7 @@ non_geminating = {
         "NN": "N",
         "ŋ": "N",
         "ɹ": "r",
-        "v": "b",
+        "v": "V",
         "z": "z",
         "ʒ": "jy",
         "NP": "np",
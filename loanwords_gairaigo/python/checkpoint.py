@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Checkpoint and resume for the dump scanners.
+
+Every so often a scanner saves a byte offset into the dump and the page ids it
+still has to find, in the same transaction as the rows it has written. With
+`--resume`, the scan seeks to the offset, skips to the next `<page>` and
+carries on with the saved page ids.
+
+`iterparse` reads ahead of the page it hands back, so the read position of the
+dump at a checkpoint may be past pages not processed yet. The read position at
+the checkpoint before is safe, though: once the reader has moved beyond it,
+every page that ended before it has been handed back (and processed).
+Resuming a little early is harmless as finished pages are no longer in the
+saved set.
+
+The page ids are kept in a `PageIdSet`, one bit per id, and `PageFilter`
+drops the pages not in it before they reach the XML parser: the bytes of a
+page are only searched for its `<id>` and its `</page>`. Dumps are sorted by
+page id, so the filter ends the document once it passes the largest id wanted.
+"""
+
+import time
+import zlib
+from array import array
+from pathlib import Path
+
+CHECKPOINT_PAGES = 10_000
+CHECKPOINT_SECONDS = 30.0
+READ_SIZE = 1 << 20
+
+PAGE_START = b"<page>"
+PAGE_END = b"</page>"
+ID_START = b"<id>"
+ID_END = b"</id>"
+ROOT_END = b"</mediawiki>\n"
+
+
+class PageIdSet:
+    """A set of page ids as a bitmap: an eighth of a byte per possible id, up
+    to the largest, rather than about a hundred bytes per id in a `set`."""
+
+    def __init__(self, pageids=()):
+        pageids = sorted(pageids)
+        self.max = pageids[-1] if pageids else -1
+        self.bits = bytearray((self.max >> 3) + 1)
+        self._len = 0
+        for pid in pageids:
+            if pid < 0:
+                raise ValueError(f"Negative page id {pid}.")
+            if not self.bits[pid >> 3] >> (pid & 7) & 1:
+                self.bits[pid >> 3] |= 1 << (pid & 7)
+                self._len += 1
+
+    def __contains__(self, pid):
+        return 0 <= pid <= self.max and bool(self.bits[pid >> 3] >> (pid & 7) & 1)
+
+    def remove(self, pid):
+        if pid not in self:
+            raise KeyError(pid)
+        self.bits[pid >> 3] &= ~(1 << (pid & 7)) & 0xFF
+        self._len -= 1
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for i, byte in enumerate(self.bits):
+            while byte:
+                low = byte & -byte
+                yield (i << 3) + low.bit_length() - 1
+                byte ^= low
+
+    @property
+    def nbytes(self):
+        return len(self.bits)
+
+    def report(self):
+        return (
+            f"{self._len:,} page ids wanted, up to {self.max:,}: "
+            f"{self.nbytes / 2**20:.1f} MiB as a bitmap."
+        )
+
+
+class PageFilter:
+    """A dump reader (`DumpReader`) that only lets through the pages in `pageids`.
+
+    Everything before the first page (the root tag and `<siteinfo>`) and after
+    the last is passed as is; the pages in between are cut at `<page>` and
+    `</page>`, which cannot occur escaped within a page. Reading ends early,
+    with a closing root tag, at the first page beyond `pageids.max`.
+    """
+
+    def __init__(self, reader, pageids):
+        self.reader = reader
+        self.pageids = pageids
+        self.skipped = 0
+        self.stopped_at = None
+        self._buffer = b""
+        self._in_pages = False
+        self._done = False
+
+    def _page(self, data, start):
+        """(end of the page starting at `start`, its id), or None if incomplete."""
+        end = data.find(PAGE_END, start)
+        if end < 0:
+            return None
+        id_start = data.find(ID_START, start, end)
+        id_end = data.find(ID_END, id_start, end)
+        pid = int(data[id_start + len(ID_START) : id_end]) if id_start >= 0 else -1
+        return end + len(PAGE_END), pid
+
+    def _fill(self):
+        """Read on until some output is ready; the output, or b"" at the end."""
+        data = self._buffer
+        while not self._done:
+            block = self.reader.read(READ_SIZE)
+            data += block
+            out = []
+            position = 0
+            if not self._in_pages:
+                first = data.find(PAGE_START)
+                if first < 0 and block:
+                    # Keep enough of the end to catch a tag split across blocks.
+                    keep = max(len(data) - len(PAGE_START) + 1, 0)
+                    out.append(data[:keep])
+                    position = keep
+                else:
+                    self._in_pages = first >= 0
+                    out.append(data[: first if first >= 0 else len(data)])
+                    position = first if first >= 0 else len(data)
+            while self._in_pages:
+                start = data.find(PAGE_START, position)
+                if start < 0:
+                    if not block:
+                        # After the last page: `</mediawiki>`.
+                        out.append(data[position:])
+                        position = len(data)
+                    break
+                page = self._page(data, start)
+                if page is None:
+                    position = start
+                    break
+                end, pid = page
+                if pid > self.pageids.max:
+                    self.stopped_at = pid
+                    out.append(ROOT_END)
+                    self._done = True
+                    position = len(data)
+                    break
+                if pid in self.pageids:
+                    out.append(data[start:end])
+                else:
+                    self.skipped += 1
+                position = end
+            if not block:
+                self._done = True
+                out.append(data[position:])
+                position = len(data)
+            data = data[position:]
+            output = b"".join(out)
+            if output:
+                self._buffer = data
+                return output
+        self._buffer = b""
+        return b""
+
+    def report(self):
+        report = f"Skipped {self.skipped:,} pages without parsing them"
+        if self.stopped_at is not None:
+            report += f", and stopped at page {self.stopped_at:,}"
+        return report + "."
+
+    def read(self, size=-1):
+        # `iterparse` takes what it is given, whatever the size asked for.
+        return self._fill()
+
+    def tell(self):
+        return self.reader.tell()
+
+    def close(self):
+        self.reader.close()
+
+
+class DumpReader:
+    """A dump file for `iterparse`, optionally starting at the first page after `offset`.
+
+    When starting midway, the XML declaration and the `<mediawiki ...>` root
+    tag from the top of the file are replayed first, so the parser sees a
+    well-formed document. `tell()` is always a position in the dump itself.
+    """
+
+    def __init__(self, path, offset=0):
+        self.path = Path(path)
+        self.file = open(self.path, "rb")
+        self._prefix = b""
+        if offset:
+            self._prefix = self._header()
+            self.file.seek(self._findPage(offset))
+
+    def _header(self):
+        head = self.file.read(READ_SIZE)
+        start = head.find(b"<mediawiki")
+        end = head.find(b">", start)
+        if start < 0 or end < 0:
+            raise ValueError(f"No <mediawiki> root tag at the top of {self.path}.")
+        return head[: end + 1]
+
+    def _findPage(self, offset):
+        """The position of the first `<page>` at or after `offset`."""
+        position = offset
+        self.file.seek(position)
+        tail = b""
+        while True:
+            block = self.file.read(READ_SIZE)
+            if not block:
+                return position + len(tail)
+            data = tail + block
+            found = data.find(PAGE_START)
+            if found >= 0:
+                return position + found
+            # Keep enough of the end to catch a tag split across blocks.
+            keep = len(PAGE_START) - 1
+            position += len(data) - keep
+            tail = data[-keep:]
+
+    def read(self, size=-1):
+        if self._prefix:
+            data, self._prefix = self._prefix, b""
+            return data
+        return self.file.read(size)
+
+    def tell(self):
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+def _packIds(pageids):
+    return zlib.compress(array("q", sorted(pageids)).tobytes())
+
+
+def _unpackIds(blob):
+    ids = array("q")
+    ids.frombytes(zlib.decompress(blob))
+    return PageIdSet(ids)
+
+
+class Checkpoints:
+    """Checkpoints of one scanner, stored in the scanner's own database."""
+
+    def __init__(
+        self,
+        conn,
+        scanner,
+        dump,
+        every_pages=CHECKPOINT_PAGES,
+        every_seconds=CHECKPOINT_SECONDS,
+    ):
+        self.conn = conn
+        self.scanner = scanner
+        self.dump = str(Path(dump).resolve())
+        self.every_pages = every_pages
+        self.every_seconds = every_seconds
+        self._pages = 0
+        self._last_time = time.monotonic()
+        self._last_read = 0
+        self.safe_offset = 0
+        self.conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS
+                    checkpoints (
+                        scanner TEXT PRIMARY KEY,
+                        dump TEXT,
+                        dump_size INTEGER,
+                        offset INTEGER,
+                        last_pageid INTEGER,
+                        remaining BLOB
+                    )
+                ;
+            """
+        )
+
+    def _dumpSize(self):
+        return Path(self.dump).stat().st_size
+
+    def load(self):
+        """(offset, remaining page ids) of the last checkpoint, or None."""
+        row = self.conn.execute(
+            """
+                SELECT
+                    dump_size,
+                    offset,
+                    remaining
+                FROM
+                    checkpoints
+                WHERE
+                    scanner = ?
+                AND
+                    dump = ?
+                ;
+            """,
+            (self.scanner, self.dump),
+        ).fetchone()
+        if row is None or row[0] != self._dumpSize():
+            return None
+        self.safe_offset = self._last_read = row[1]
+        return row[1], _unpackIds(row[2])
+
+    def due(self):
+        """Count a page; True when it is time for a checkpoint."""
+        self._pages += 1
+        if self._pages >= self.every_pages:
+            return True
+        return time.monotonic() - self._last_time >= self.every_seconds
+
+    def save(self, reader, last_pageid, remaining):
+        """Record progress; commit it with the same transaction as the data."""
+        position = reader.tell()
+        if position > self._last_read:
+            self.safe_offset = self._last_read
+            self._last_read = position
+        self.conn.execute(
+            """
+                INSERT OR REPLACE INTO
+                    checkpoints (
+                        scanner,
+                        dump,
+                        dump_size,
+                        offset,
+                        last_pageid,
+                        remaining
+                    )
+                VALUES
+                    (?, ?, ?, ?, ?, ?)
+                ;
+            """,
+            (
+                self.scanner,
+                self.dump,
+                self._dumpSize(),
+                self.safe_offset,
+                last_pageid,
+                _packIds(remaining),
+            ),
+        )
+        self._pages = 0
+        self._last_time = time.monotonic()
+
+    def clear(self):
+        """Forget the checkpoint once the scan has finished."""
+        self.conn.execute(
+            """
+                DELETE FROM
+                    checkpoints
+                WHERE
+                    scanner = ?
+                ;
+            """,
+            (self.scanner,),
+        )
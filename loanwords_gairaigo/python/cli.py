@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The `gairaigo` command: build the data, look words up, transcribe pronunciations.
+
+    python -m loanwords_gairaigo build [STAGE ...] [--profile]
+    python -m loanwords_gairaigo lookup WORD ... [--reverse | --fuzzy K | --guess] [--style S]
+    python -m loanwords_gairaigo transcribe PRONUNCIATION ... [--ipa] [--english WORD] [-n N] [--style S]
+"""
+
+import sys
+import argparse
+import itertools
+import subprocess
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+ROOT_DIR = HERE.parent
+
+# In the order of process_all.sh, followed by the merge.
+STAGES = {
+    "jtca_to_db": HERE / "jtca_to_db.py",
+    "lrec_to_db": HERE / "lrec_to_db.py",
+    "jmdict": HERE / "jmdict.py",
+    "wikipedia": HERE / "wikipedia.py",
+    "britfone_to_db": HERE / "britfone_to_db.py",
+    "britfone_to_kana": HERE / "britfone_to_kana.py",
+    "cmu_to_db": HERE / "cmu_to_db.py",
+    "cmu_to_kana": HERE / "cmu_to_kana.py",
+    "wiktionary_to_db": HERE / "wiktionary_to_db.py",
+    "wiktionary_to_kana": HERE / "wiktionary_to_kana.py",
+    "merge": ROOT_DIR / "db" / "merge_engine.py",
+}
+
+
+def build(args):
+    for stage in args.stages or STAGES:
+        script = STAGES[stage]
+        command = [sys.executable, str(script)]
+        if args.profile:
+            command.append("--profile")
+        print(f"== {stage}", file=sys.stderr)
+        # Every stage imports its neighbours by bare name, so run it from its
+        # own directory as process_all.sh does.
+        returncode = subprocess.call(command, cwd=str(script.parent))
+        if returncode:
+            return returncode
+    return 0
+
+
+def lookup(args):
+    if __package__:
+        from .lexicon import Lexicon
+    else:
+        from lexicon import Lexicon
+
+    lexicon = Lexicon(args.db)
+    for word in args.words:
+        if args.reverse:
+            print(f"{word}\t{', '.join(lexicon.reverse(word))}")
+        elif args.fuzzy is not None:
+            for d, eng, jap in lexicon.fuzzy(word, args.fuzzy):
+                print(f"{word}\t{d}\t{eng}\t{jap}")
+        else:
+            print(f"{word}\t{lexicon.lookup(word, args.guess, args.style) or ''}")
+    lexicon.close()
+    return 0
+
+
+def transcribe(args):
+    if __package__:
+        from .lexicon import transcribe as to_kana, transcribe_candidates
+    else:
+        from lexicon import transcribe as to_kana, transcribe_candidates
+
+    alphabet = "ipa" if args.ipa else "arpa"
+    for pronunciation in args.pronunciations:
+        if args.candidates:
+            candidates = transcribe_candidates(
+                pronunciation, args.english, alphabet, args.style
+            )
+            for kana, cost in itertools.islice(candidates, args.candidates):
+                print(f"{pronunciation}\t{kana}\t{cost:g}")
+        else:
+            kana = to_kana(pronunciation, args.english, alphabet, args.style)
+            print(f"{pronunciation}\t{kana}")
+    return 0
+
+
+def main(argv=None):
+    if __package__:
+        from .lexicon import MERGED_DB
+        from .prekana_map import styles
+    else:
+        from lexicon import MERGED_DB
+        from prekana_map import styles
+
+    parser = argparse.ArgumentParser(prog="gairaigo", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="run the pipeline stages")
+    build_parser.add_argument(
+        "stages", nargs="*", choices=list(STAGES), help="default: all, in order"
+    )
+    build_parser.add_argument("--profile", action="store_true")
+    build_parser.set_defaults(func=build)
+
+    lookup_parser = subparsers.add_parser("lookup", help="look words up in merged")
+    lookup_parser.add_argument("words", nargs="+")
+    mode = lookup_parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--reverse", action="store_true", help="look katakana up, giving English"
+    )
+    mode.add_argument(
+        "--fuzzy", type=int, metavar="K", help="entries within edit distance K"
+    )
+    mode.add_argument(
+        "--guess",
+        action="store_true",
+        help="transcribe words in no source from a guessed pronunciation",
+    )
+    lookup_parser.add_argument(
+        "--style", choices=list(styles), help="house style (see restyle.py)"
+    )
+    lookup_parser.add_argument("--db", type=Path, default=MERGED_DB)
+    lookup_parser.set_defaults(func=lookup)
+
+    transcribe_parser = subparsers.add_parser(
+        "transcribe", help="transcribe pronunciations into katakana"
+    )
+    transcribe_parser.add_argument(
+        "pronunciations", nargs="+", help='ARPAbet (e.g. "W ER1 K ER0") or IPA'
+    )
+    transcribe_parser.add_argument(
+        "--ipa", action="store_true", help="pronunciations are Britfone IPA"
+    )
+    transcribe_parser.add_argument(
+        "--english", default="", help="spelling, for the spelling-based corrections"
+    )
+    transcribe_parser.add_argument(
+        "-n",
+        "--candidates",
+        type=int,
+        metavar="N",
+        help="the N likeliest transcriptions, with their costs",
+    )
+    transcribe_parser.add_argument(
+        "--style", choices=list(styles), help="house style, e.g. traditional"
+    )
+    transcribe_parser.set_defaults(func=transcribe)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,10 @@ import sqlite3
 import string
 from pathlib import Path
 
-ROOT_DIR = Path("..")
+from progress import progress
+from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT_DIR / "data"
 DB_DIR = ROOT_DIR / "db"
 PYTH_DIR = ROOT_DIR / "python"
@@ -31,126 +34,143 @@ non_starters = tuple(
     ]
 )
 
-# fmt: off
-with sqlite3.connect(str(DB_PATH.resolve())) as conn, \
-    CMU_PATH.open(mode="r", encoding="cp437") as cmu_dict, \
-    PHONE_PATH.open(mode="r") as phone_file, \
-    SYMB_PATH.open(mode="r") as symbols_file:
-# fmt: on
-    conn.execute(
-        """
-            PRAGMA ENCODING=UTF8;
-        """
-    )
-
-    conn.execute(
-        """
-            CREATE TABLE IF NOT EXISTS main (
-                english text UNIQUE,
-                pronunciation text
-            )
-            ;
-        """
-    )
-
-    pairs = [
-        tuple(line.strip().split("  "))
-        for line in cmu_dict.readlines()
-        if not line.startswith(non_starters)
-    ]
+def makeDb():
+    # fmt: off
+    with sqlite3.connect(str(DB_PATH.resolve())) as conn, \
+        CMU_PATH.open(mode="r", encoding="cp437") as cmu_dict, \
+        PHONE_PATH.open(mode="r") as phone_file, \
+        SYMB_PATH.open(mode="r") as symbols_file:
+    # fmt: on
+        conn.execute(
+            """
+                PRAGMA ENCODING=UTF8;
+            """
+        )
 
-    for p in pairs:
-        print(p)
-        try:
-            conn.execute(
-                """
-                INSERT INTO main (
-                    english,
-                    pronunciation
-                )
-                VALUES (
-                    ?,
-                    ?
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS main (
+                    english text UNIQUE,
+                    pronunciation text
                 )
                 ;
-                """,
-                p,
-            )
-        except sqlite3.IntegrityError:
-            conn.execute(
-                """
-                UPDATE main
-                SET pronunciation = ?
-                WHERE english = ?
-                ;
-                """,
-                tuple(reversed(p)),
-            )
-
-    conn.execute(
-        """
-            CREATE TABLE IF NOT EXISTS phones (
-                phone text UNIQUE,
-                class text
-            )
-        """
-    )
-
-    phones = [tuple(ph.strip().split("\t")) for ph in phone_file.readlines()]
-
-    for ph in phones:
-        print(ph)
-        try:
-            conn.execute(
-                """
-                    INSERT INTO phones (
-                        phone,
-                        class
+            """
+        )
+
+        with phase("parse"):
+            pairs = [
+                tuple(line.strip().split("  "))
+                for line in cmu_dict.readlines()
+                if not line.startswith(non_starters)
+            ]
+
+        with phase("write"):
+            written = progress("CMUdict entries", total=len(pairs))
+            for p in pairs:
+                written.update()
+                try:
+                    conn.execute(
+                        """
+                        INSERT INTO main (
+                            english,
+                            pronunciation
+                        )
+                        VALUES (
+                            ?,
+                            ?
+                        )
+                        ;
+                        """,
+                        p,
+                    )
+                except sqlite3.IntegrityError:
+                    conn.execute(
+                        """
+                        UPDATE main
+                        SET pronunciation = ?
+                        WHERE english = ?
+                        ;
+                        """,
+                        tuple(reversed(p)),
                     )
-                    VALUES (
-                        ?,
-                        ?
+            written.close()
+
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS phones (
+                    phone text UNIQUE,
+                    class text
+                )
+            """
+        )
+
+        phones = [tuple(ph.strip().split("\t")) for ph in phone_file.readlines()]
+
+        with phase("write"):
+            written = progress("phones", total=len(phones))
+            for ph in phones:
+                written.update()
+                try:
+                    conn.execute(
+                        """
+                            INSERT INTO phones (
+                                phone,
+                                class
+                            )
+                            VALUES (
+                                ?,
+                                ?
+                            )
+                            ;
+                        """,
+                        ph,
                     )
-                    ;
-                """,
-                ph,
-            )
-        except sqlite3.IntegrityError:
-            conn.execute(
-                """
-                    UPDATE phones
-                    SET class = ?
-                    WHERE phone = ?
-                    ;
-                """,
-                tuple(reversed(ph)),
-            )
-
-    conn.execute(
-        """
-            CREATE TABLE IF NOT EXISTS symbols (
-                symbol text UNIQUE
-            )
-            ;
-        """
-    )
-
-    symbs = [(symb.strip(),) for symb in symbols_file.readlines()]
-
-    for symb in symbs:
-        print(symb)
-        try:
-            conn.execute(
-                """
-                    INSERT INTO symbols (
-                        symbol
+                except sqlite3.IntegrityError:
+                    conn.execute(
+                        """
+                            UPDATE phones
+                            SET class = ?
+                            WHERE phone = ?
+                            ;
+                        """,
+                        tuple(reversed(ph)),
                     )
-                    VALUES (
-                        ?
+            written.close()
+
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS symbols (
+                    symbol text UNIQUE
+                )
+                ;
+            """
+        )
+
+        symbs = [(symb.strip(),) for symb in symbols_file.readlines()]
+
+        with phase("write"):
+            written = progress("symbols", total=len(symbs))
+            for symb in symbs:
+                written.update()
+                try:
+                    conn.execute(
+                        """
+                            INSERT INTO symbols (
+                                symbol
+                            )
+                            VALUES (
+                                ?
+                            )
+                            ;
+                        """,
+                        symb,
                     )
-                    ;
-                """,
-                symb,
-            )
-        except sqlite3.IntegrityError:
-            pass
+                except sqlite3.IntegrityError:
+                    pass
+            written.close()
+
+
+if __name__ == "__main__":
+    args = stage_parser(__doc__).parse_args()
+    with profiled("cmu_to_db", args):
+        makeDb()
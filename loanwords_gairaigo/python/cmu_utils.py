@@ -91,7 +91,7 @@ consonants = {
     "SH": "sy",
     "T": "t",
     "TH": "s",
-    "V": "b",
+    "V": "V",
     "Z": "z",
     "ZH": "jy",
 }
@@ -116,7 +116,7 @@ non_geminating = {
         "N": "n",
         "NG": "N",
         "R": "r",
-        "V": "b",
+        "V": "V",
         "Z": "z",
         "ZH": "jy",
         "NP": "np",
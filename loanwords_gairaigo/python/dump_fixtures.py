@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Write synthetic dumps to run the scanners on without the real ones.
+
+`writeWikipedia` and `writeWiktionary` write MediaWiki export-0.10 XML shaped
+like `enwiki-latest-pages-articles.xml` and
+`enwiktionary-latest-pages-articles.xml`, and `writeJMdict` writes `JMdict_e`
+style entries. Page ids rise with gaps, as in the real dumps, and the page
+lengths are log-normal (with redirects among the Wikipedia pages), so that
+scanning them costs roughly what scanning as much of the real dumps does.
+The text mixes wikitext markup, escaped HTML, Japanese and IPA templates.
+
+Each writer is deterministic for a given seed and returns what the pipeline
+would have found before the scan: the Wikipedia pages with a Japanese
+langlink and the Wiktionary pages with a Japanese section.
+
+    python dump_fixtures.py DIR [--pages N] [--entries N] [--seed S]
+"""
+
+import math
+import random
+import hashlib
+import argparse
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr, unescape
+
+PAGES = 1_000
+ENTRIES = 5_000
+# Share of Wikipedia pages with a Japanese langlink, and of Wiktionary pages
+# with a Japanese section.
+WANTED = 0.05
+REDIRECTS = 0.4
+# Median length and spread of the text of a page, log-normally distributed.
+WIKIPEDIA_LENGTH = (2_500, 1.2)
+WIKTIONARY_LENGTH = (800, 1.0)
+MAX_LENGTH = 1 << 20
+
+CONSONANTS = "bcdfghjklmnprstvwz"
+VOWELS = "aeiou"
+KATAKANA = [chr(c) for c in range(0x30A2, 0x30F3)] + ["ー"] * 8
+KANJI = [chr(c) for c in range(0x4E00, 0x4E00 + 2_000)]
+HIRAGANA = [chr(c) for c in range(0x3042, 0x3093)]
+IPA_ONSETS = ["", "p", "b", "t", "d", "k", "ɡ", "f", "v", "s", "z", "ʃ", "m"]
+IPA_ONSETS += ["n", "l", "ɹ", "w", "j", "h", "θ", "tʃ", "dʒ", "st", "pl", "kɹ"]
+IPA_VOWELS = ["æ", "ɑː", "ɒ", "ɔː", "ɛ", "eɪ", "ɪ", "iː", "ʊ", "uː", "ʌ", "ə", "ɜː"]
+IPA_VOWELS += ["aɪ", "aʊ", "əʊ", "ɪə", "ɛə"]
+IPA_CODAS = ["", "", "n", "t", "d", "s", "k", "l", "m", "ŋ", "st", "nt", "ɹ"]
+MARKUP = [
+    "[[{word}]]",
+    "[[{word}|{word}]]",
+    "'''{word}'''",
+    "''{word}''",
+    "&lt;ref&gt;{{{{cite web|url=https://example.org/{word}|title={word}}}}}&lt;/ref&gt;",
+    "{{{{lang|ja|{kana}}}}}",
+    "&amp;",
+    "&lt;br /&gt;",
+]
+
+NAMESPACE = "http://www.mediawiki.org/xml/export-0.10/"
+MEDIAWIKI_HEADER = f"""\
+<mediawiki xmlns="{NAMESPACE}" \
+xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" \
+xsi:schemaLocation="{NAMESPACE} http://www.mediawiki.org/xml/export-0.10.xsd" \
+version="0.10" xml:lang="en">
+  <siteinfo>
+    <sitename>{{sitename}}</sitename>
+    <dbname>{{dbname}}</dbname>
+    <base>https://en.{{site}}.org/wiki/Main_Page</base>
+    <generator>MediaWiki 1.36.0-wmf.20</generator>
+    <case>first-letter</case>
+    <namespaces>
+      <namespace key="0" case="first-letter" />
+    </namespaces>
+  </siteinfo>
+"""
+PAGE = """\
+  <page>
+    <title>{title}</title>
+    <ns>0</ns>
+    <id>{pageid}</id>{redirect}
+    <revision>
+      <id>{revision}</id>
+      <parentid>{parent}</parentid>
+      <timestamp>2020-12-01T00:00:00Z</timestamp>
+      <contributor>
+        <username>FixtureBot</username>
+        <id>1</id>
+      </contributor>
+      <model>wikitext</model>
+      <format>text/x-wiki</format>
+      <text bytes="{bytes}" xml:space="preserve">{text}</text>
+      <sha1>{sha1}</sha1>
+    </revision>
+  </page>
+"""
+JMDICT_HEADER = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE JMdict [
+<!ELEMENT JMdict (entry*)>
+<!ENTITY n "noun (common) (futsuumeishi)">
+<!ENTITY vs "noun or participle which takes the aux. verb suru">
+<!ENTITY adj-na "adjectival nouns or quasi-adjectives (keiyodoshi)">
+<!ENTITY on-mim "onomatopoeic or mimetic word">
+<!ENTITY uk "word usually written using kana alone">
+]>
+<!-- JMdict created: 2020-12-01 -->
+<JMdict>
+"""
+
+
+def word(rng, syllables=None):
+    syllables = syllables or rng.randint(1, 4)
+    return "".join(
+        rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(syllables)
+    )
+
+
+def katakana(rng):
+    return "".join(rng.choice(KATAKANA) for _ in range(rng.randint(2, 7)))
+
+
+def ipa(rng):
+    syllables = [
+        rng.choice(IPA_ONSETS) + rng.choice(IPA_VOWELS) + rng.choice(IPA_CODAS)
+        for _ in range(rng.randint(1, 4))
+    ]
+    stressed = rng.randrange(len(syllables))
+    syllables[stressed] = "ˈ" + syllables[stressed]
+    return "".join(syllables)
+
+
+def base36(digest):
+    n = int.from_bytes(digest, "big")
+    digits = []
+    while n:
+        n, d = divmod(n, 36)
+        digits.append("0123456789abcdefghijklmnopqrstuvwxyz"[d])
+    return "".join(reversed(digits)) or "0"
+
+
+class Filler:
+    """Escaped wikitext to cut pages of any length from, between words."""
+
+    def __init__(self, rng, size=MAX_LENGTH):
+        parts = []
+        length = 0
+        while length < size:
+            if rng.random() < 0.15:
+                part = rng.choice(MARKUP).format(word=word(rng), kana=katakana(rng))
+            elif rng.random() < 0.02:
+                part = "\n\n== " + word(rng).capitalize() + " ==\n"
+            else:
+                part = word(rng)
+            parts.append(part)
+            length += len(part) + 1
+        self.text = " ".join(parts)
+
+    def cut(self, rng, length):
+        text = self.text
+        start = text.find(" ", rng.randrange(max(len(text) - length, 1))) + 1
+        end = text.find(" ", start + length)
+        return text[start : end if end >= 0 else len(text)]
+
+
+def _length(rng, median_spread):
+    median, spread = median_spread
+    return min(int(rng.lognormvariate(math.log(median), spread)), MAX_LENGTH)
+
+
+def _page(title, pageid, text, redirect=None):
+    data = unescape(text).encode("utf-8")
+    return PAGE.format(
+        title=escape(title),
+        pageid=pageid,
+        redirect=f"\n    <redirect title={quoteattr(redirect)} />" if redirect else "",
+        revision=pageid * 10 + 7,
+        parent=pageid * 10 + 3,
+        bytes=len(data),
+        text=text,
+        sha1=base36(hashlib.sha1(data).digest()),
+    )
+
+
+def _pageIds(rng, pages):
+    pageid = rng.randint(10, 100)
+    for _ in range(pages):
+        yield pageid
+        # Deleted pages and other namespaces leave gaps.
+        pageid += 1 + int(rng.expovariate(0.5))
+
+
+def writeWikipedia(path, pages=PAGES, seed=0):
+    """Write a Wikipedia dump; [(pageid, katakana title)] of its langlinks."""
+    rng = random.Random(seed)
+    filler = Filler(rng)
+    wanted = []
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            MEDIAWIKI_HEADER.format(
+                sitename="Wikipedia", dbname="enwiki", site="wikipedia"
+            )
+        )
+        for pageid in _pageIds(rng, pages):
+            title = " ".join(word(rng).capitalize() for _ in range(rng.randint(1, 3)))
+            if rng.random() < 0.1:
+                title += f" ({word(rng)})"
+            elif rng.random() < 0.05:
+                title += f", {word(rng).capitalize()}"
+            if rng.random() < REDIRECTS:
+                target = word(rng).capitalize()
+                f.write(_page(title, pageid, f"#REDIRECT [[{target}]]", target))
+                continue
+            text = filler.cut(rng, _length(rng, WIKIPEDIA_LENGTH))
+            f.write(_page(title, pageid, f"'''{title}''' {text}"))
+            if rng.random() < WANTED / (1 - REDIRECTS):
+                wanted.append((pageid, katakana(rng)))
+        f.write("</mediawiki>\n")
+    return wanted
+
+
+def _wiktionaryText(rng, filler, title, kana):
+    length = _length(rng, WIKTIONARY_LENGTH)
+    sections = ["==English==", "===Etymology===", filler.cut(rng, length // 3)]
+    if rng.random() < 0.7:
+        sections.append("===Pronunciation===")
+        sections.append(f"* {{{{IPA|en|/{ipa(rng)}/}}}}")
+        if rng.random() < 0.3:
+            sections.append(f"* {{{{IPA|en|[{ipa(rng)}]}}}}")
+        if rng.random() < 0.2:
+            sections.append(f"* {{{{audio-IPA|en|En-us-{title}.ogg|/{ipa(rng)}/}}}}")
+    elif title.isupper():
+        letters = "|".join(title[:4])
+        sections += ["===Pronunciation===", f"* {{{{IPA letters|en|{letters}}}}}"]
+    sections += ["===Noun===", filler.cut(rng, length // 3)]
+    for language in rng.sample(["French", "German", "Italian", "Spanish"], 2):
+        if rng.random() < 0.3:
+            sections += ["----", f"=={language}==", filler.cut(rng, length // 6)]
+    if kana:
+        sections += ["----", "==Japanese==", "===Noun===", f"{{{{ja-noun|{kana}}}}}"]
+        sections.append(f"# {{{{lang|ja|{kana}}}}}: {title}")
+    return "\n".join(sections)
+
+
+def writeWiktionary(path, pages=PAGES, seed=0):
+    """Write a Wiktionary dump; [(pageid, title, katakana)] of its Japanese
+    sections."""
+    rng = random.Random(seed + 1)
+    filler = Filler(rng)
+    wanted = []
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            MEDIAWIKI_HEADER.format(
+                sitename="Wiktionary", dbname="enwiktionary", site="wiktionary"
+            )
+        )
+        for pageid in _pageIds(rng, pages):
+            title = word(rng)
+            if rng.random() < 0.02:
+                title = title.upper()[:4]
+            kana = katakana(rng) if rng.random() < WANTED else None
+            f.write(_page(title, pageid, _wiktionaryText(rng, filler, title, kana)))
+            if kana:
+                wanted.append((pageid, title, kana))
+        f.write("</mediawiki>\n")
+    return wanted
+
+
+def _entry(rng, sequence):
+    kind = rng.random()
+    lines = ["<entry>", f"<ent_seq>{sequence}</ent_seq>"]
+    senses = []
+    if kind < 0.75:
+        # The bulk of JMdict: kanji with a kana reading.
+        keb = "".join(rng.choice(KANJI) for _ in range(rng.randint(1, 4)))
+        reb = "".join(rng.choice(HIRAGANA) for _ in range(rng.randint(2, 6)))
+        lines += ["<k_ele>", f"<keb>{keb}</keb>", "</k_ele>"]
+    elif kind < 0.8:
+        reb = "".join(rng.choice(HIRAGANA) for _ in range(rng.randint(2, 6)))
+        senses.append("<misc>&uk;</misc>")
+    else:
+        reb = katakana(rng)
+        origin = rng.random()
+        if kind < 0.83:
+            senses.append("<misc>&on-mim;</misc>")
+        elif origin < 0.3:
+            senses.append(f'<lsource xml:lang="eng">{word(rng)}</lsource>')
+        elif origin < 0.35:
+            senses.append(f'<lsource xml:lang="eng" ls_wasei="y">{word(rng)}</lsource>')
+        elif origin < 0.45:
+            language = rng.choice(["ger", "fre", "por", "dut"])
+            senses.append(f'<lsource xml:lang="{language}">{word(rng)}</lsource>')
+    lines += ["<r_ele>", f"<reb>{reb}</reb>", "</r_ele>"]
+    for n in range(1 if rng.random() < 0.7 else rng.randint(2, 5)):
+        lines += ["<sense>", "<pos>&n;</pos>"]
+        if n == 0:
+            lines += senses
+        for _ in range(rng.randint(1, 3)):
+            gloss = " ".join(word(rng) for _ in range(rng.randint(1, 3)))
+            if rng.random() < 0.2:
+                gloss += f" ({word(rng)})"
+            lines.append(f"<gloss>{gloss}</gloss>")
+        lines.append("</sense>")
+    lines.append("</entry>")
+    return "\n".join(lines) + "\n"
+
+
+def writeJMdict(path, entries=ENTRIES, seed=0):
+    """Write a JMdict_e-like file of `entries` entries; the number written."""
+    rng = random.Random(seed + 2)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(JMDICT_HEADER)
+        for sequence in range(1_000_000, 1_000_000 + entries):
+            f.write(_entry(rng, sequence))
+        f.write("</JMdict>\n")
+    return entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("dir", type=Path)
+    parser.add_argument("--pages", type=int, default=PAGES)
+    parser.add_argument("--entries", type=int, default=ENTRIES)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    args.dir.mkdir(parents=True, exist_ok=True)
+    wikipedia = writeWikipedia(
+        args.dir / "enwiki-latest-pages-articles.xml", args.pages, args.seed
+    )
+    wiktionary = writeWiktionary(
+        args.dir / "enwiktionary-latest-pages-articles.xml", args.pages, args.seed
+    )
+    writeJMdict(args.dir / "JMdict_e", args.entries, args.seed)
+    print(
+        f"{args.pages} pages each ({len(wikipedia)} with Japanese langlinks, "
+        f"{len(wiktionary)} with Japanese sections) and {args.entries} JMdict "
+        f"entries written to {args.dir}."
+    )
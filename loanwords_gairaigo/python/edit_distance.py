@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Batched Levenshtein distances with NumPy.
+
+Strings (or mora sequences) are turned into padded integer matrices and the
+dynamic programming table is filled in one row at a time for a whole batch of
+pairs. Within a row the left-to-right dependency
+
+    D[i, j] = min(D[i - 1, j] + 1, D[i - 1, j - 1] + cost, D[i, j - 1] + 1)
+
+is resolved with a running minimum: writing T[j] for the first two terms,
+D[i, j] = j + min(T[k] - k for k <= j), i.e. `np.minimum.accumulate`. A batch
+therefore costs one handful of array operations per character of the longest
+first string, however many pairs it holds.
+"""
+
+import re
+
+import numpy as np
+
+BATCH_SIZE = 16384
+
+# Small kana attach to the preceding kana; everything else is its own mora.
+mora_regex = re.compile(r".[ァィゥェォャュョヮぁぃぅぇぉゃゅょゎ]*")
+
+
+def morae(kana):
+    """Split katakana into morae (キャ, ッ, ン and ー each count as one)."""
+    return mora_regex.findall(kana)
+
+
+def encode(sequences, vocab=None):
+    """Padded int32 ids [n, longest] and lengths of strings or token lists.
+
+    Characters (or tokens) get ids from `vocab`, which is extended as needed,
+    so that two calls sharing a vocab give comparable ids.
+    """
+    vocab = {} if vocab is None else vocab
+    lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+    width = int(lengths.max()) if len(sequences) else 0
+    flat = [vocab.setdefault(t, len(vocab)) for seq in sequences for t in seq]
+    ids = np.full((len(sequences), width), -1, dtype=np.int32)
+    rows = np.repeat(np.arange(len(sequences)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    cols = np.arange(len(flat)) - np.repeat(starts, lengths)
+    ids[rows, cols] = np.asarray(flat, dtype=np.int32)
+    return ids, lengths, vocab
+
+
+def _batch(a, len_a, b, len_b):
+    """Distances between rows of `a` and `b` (padded ids), for one batch."""
+    n = len(a)
+    width_b = b.shape[1]
+    columns = np.arange(width_b + 1)
+    previous = np.broadcast_to(columns, (n, width_b + 1)).copy()
+    out = np.empty(n, dtype=np.int32)
+    done = len_a == 0
+    out[done] = len_b[done]
+    rows = np.arange(n)
+    for i in range(1, a.shape[1] + 1):
+        cost = (a[:, i - 1 : i] != b).astype(np.int32)
+        t = np.empty_like(previous)
+        t[:, 0] = i
+        np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost, out=t[:, 1:])
+        current = np.minimum.accumulate(t - columns, axis=1) + columns
+        finished = len_a == i
+        out[finished] = current[rows[finished], len_b[finished]]
+        previous = current
+    return out
+
+
+def distances(a, b, batch_size=BATCH_SIZE):
+    """Levenshtein distance between a[k] and b[k] for every k.
+
+    `a` and `b` are equally long lists of strings or of token sequences
+    (e.g. `morae(kana)`).
+    """
+    if len(a) != len(b):
+        raise ValueError("Both sides need the same number of sequences.")
+    ids_a, len_a, vocab = encode(a)
+    ids_b, len_b, _ = encode(b, vocab)
+    # Sorting by length keeps the padding in each batch small.
+    order = np.argsort(len_a, kind="stable")
+    out = np.empty(len(a), dtype=np.int32)
+    for start in range(0, len(a), batch_size):
+        members = order[start : start + batch_size]
+        width_a = int(len_a[members].max())
+        width_b = int(len_b[members].max())
+        out[members] = _batch(
+            ids_a[members, :width_a],
+            len_a[members],
+            ids_b[members, :width_b],
+            len_b[members],
+        )
+    return out
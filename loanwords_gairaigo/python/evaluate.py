@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Score the phonetic engines against the human-curated (type 1) katakana.
+
+Every English word transcribed by an engine (CMUdict through `arpa_to_kana`,
+Britfone through `ipa_to_kana`) that also has katakana in JTCA, LREC'14 or
+JMdict (highest priority first) is transcribed again with the current rules
+and compared with that katakana:
+
+- exact match rate,
+- character error rate (character edit distance / gold characters),
+- mora error rate (mora edit distance / gold morae),
+
+all with the batched kernels in `edit_distance.py`. Errors are then broken
+down by the prekana units (the rules of `prekana_to_kana`) each word went
+through, and by the spelling rules (`SPELLING_RULES`) applied to it, with the
+words each rule fixed and broke.
+"""
+
+import sys
+import json
+import sqlite3
+from pathlib import Path
+from collections import namedtuple
+
+import numpy as np
+
+from edit_distance import distances, morae
+from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+
+GOLD_SOURCES = ("jtca", "lrec2014", "jmdict")
+
+Engine = namedtuple("Engine", ["name", "db", "module", "prekana", "kana"])
+
+ENGINES = {
+    "cmudict": Engine(
+        "cmudict", "cmudict.db", "cmu_to_kana", "arpa_to_prekana", "arpa_to_kana"
+    ),
+    "britfone": Engine(
+        "britfone", "britfone.db", "britfone_to_kana", "ipa_to_prekana", "ipa_to_kana"
+    ),
+}
+
+Scores = namedtuple("Scores", ["exact", "cer", "mer", "char_errors", "mora_errors"])
+
+
+def readGold(db_dir=DB_DIR):
+    """English word -> katakana from the type 1 sources, by source priority."""
+    from merge_engine import SOURCES, readSource
+
+    gold = {}
+    for source in SOURCES:
+        if source.name not in GOLD_SOURCES:
+            continue
+        best = {}
+        for word, jap, tie_break, _ in readSource(source, db_dir):
+            if word not in gold and (word not in best or tie_break < best[word][0]):
+                best[word] = (tie_break, jap)
+        gold.update((word, jap) for word, (_, jap) in best.items())
+    return gold
+
+
+def readEngineInput(engine, gold, db_dir=DB_DIR):
+    """(english, pronunciation, gold) for every engine word with gold katakana."""
+    from merge_clean_db import norm_en
+
+    with sqlite3.connect(str((db_dir / engine.db).resolve())) as conn:
+        rows = conn.execute(
+            """
+                SELECT
+                    english,
+                    pronunciation
+                FROM
+                    hand_mapping
+                ORDER BY
+                    rowid
+                ;
+            """
+        ).fetchall()
+    conn.close()
+    seen = set()
+    words = []
+    for eng, pronunciation in rows:
+        key = norm_en(eng) if eng else ""
+        if key in gold and key not in seen and pronunciation:
+            seen.add(key)
+            words.append((eng, pronunciation, gold[key]))
+    return words
+
+
+def score(outputs, gold):
+    """Exact match rate, CER and MER of `outputs` against `gold`."""
+    char_errors = distances(outputs, gold)
+    mora_errors = distances([morae(o) for o in outputs], [morae(g) for g in gold])
+    gold_chars = sum(map(len, gold))
+    gold_morae = sum(len(morae(g)) for g in gold)
+    return Scores(
+        float(np.mean(char_errors == 0)),
+        char_errors.sum() / gold_chars,
+        mora_errors.sum() / gold_morae,
+        char_errors,
+        mora_errors,
+    )
+
+
+def breakdown(prekanas, char_errors, top=20):
+    """Words, errors and error rate per prekana unit.
+
+    Units are listed by excess errors (errors beyond what the overall error
+    rate predicts for that many words), so frequent but harmless units such as
+    ー do not crowd out the ones that go wrong.
+    """
+    units = {}
+    word_ids, unit_ids = [], []
+    for i, prekana in enumerate(prekanas):
+        for unit in set(prekana.split(" ")):
+            word_ids.append(i)
+            unit_ids.append(units.setdefault(unit, len(units)))
+    word_ids = np.asarray(word_ids)
+    unit_ids = np.asarray(unit_ids)
+    wrong = (char_errors > 0).astype(np.float64)
+    words = np.bincount(unit_ids, minlength=len(units))
+    errors = np.bincount(unit_ids, weights=wrong[word_ids], minlength=len(units))
+    names = list(units)
+    excess = errors - words * wrong.mean()
+    order = np.argsort(-excess, kind="stable")[:top]
+    return [
+        (names[u], int(words[u]), int(errors[u]), errors[u] / words[u]) for u in order
+    ]
+
+
+def spellingBreakdown(rules, phonetic_errors, final_errors):
+    """Words, fixes, breakages and remaining errors per spelling rule.
+
+    `rules` holds the names of the spelling rules applied to each word (as
+    `Engine.kana` reports them in `used`). A word is fixed by its rules if
+    only its phonetic transcription is wrong, broken if only the corrected
+    one is. Rules are listed by net harm (broken minus fixed), worst first.
+    """
+    was_wrong = phonetic_errors > 0
+    is_wrong = final_errors > 0
+    counts = {}
+    for i, applied in enumerate(rules):
+        for rule in applied:
+            n = counts.setdefault(rule, [0, 0, 0, 0])
+            n[0] += 1
+            n[1] += bool(was_wrong[i] and not is_wrong[i])
+            n[2] += bool(is_wrong[i] and not was_wrong[i])
+            n[3] += bool(is_wrong[i])
+    return sorted(
+        ((rule, *n) for rule, n in counts.items()),
+        key=lambda r: (r[2] - r[3], -r[1]),
+    )
+
+
+def evaluate(engine, gold, top=20, worst=0):
+    if not (DB_DIR / engine.db).exists():
+        print(f"{engine.name}: {DB_DIR / engine.db} not found, skipping.")
+        return None
+    from merge_clean_db import norm_ja
+
+    module = __import__(engine.module)
+    to_prekana = getattr(module, engine.prekana)
+    to_kana = getattr(module, engine.kana)
+
+    with phase("read"):
+        words = readEngineInput(engine, gold)
+    if not words:
+        print(f"{engine.name}: no words in common with the gold data.")
+        return None
+
+    with phase("transcribe"):
+        prekanas = [to_prekana(p) for _, p, _ in words]
+        phonetic = [norm_ja(to_kana(p)) for _, p, _ in words]
+        final = []
+        rules = []
+        for e, p, _ in words:
+            used = []
+            final.append(norm_ja(to_kana(p, e, used)))
+            rules.append(
+                [u[len("spelling:") :] for u in used if u.startswith("spelling:")]
+            )
+    gold_kana = [g for _, _, g in words]
+
+    with phase("score"):
+        final_scores = score(final, gold_kana)
+        phonetic_scores = score(phonetic, gold_kana)
+        units = breakdown(prekanas, final_scores.char_errors, top)
+        spelling = spellingBreakdown(
+            rules, phonetic_scores.char_errors, final_scores.char_errors
+        )
+
+    fixed = int(
+        ((phonetic_scores.char_errors > 0) & (final_scores.char_errors == 0)).sum()
+    )
+    broken = int(
+        ((phonetic_scores.char_errors == 0) & (final_scores.char_errors > 0)).sum()
+    )
+
+    print(f"== {engine.name}: {len(words)} words with gold katakana")
+    print(f"{'':<22}{'exact':>8}{'CER':>8}{'MER':>8}")
+    for label, s in (
+        ("phonetic only", phonetic_scores),
+        ("with spelling rules", final_scores),
+    ):
+        print(f"{label:<22}{s.exact:>8.1%}{s.cer:>8.1%}{s.mer:>8.1%}")
+    print(f"spelling rules fixed {fixed} words and broke {broken}")
+    print(f"{'spelling rule':<14}{'words':>8}{'fixed':>8}{'broke':>8}{'wrong':>8}")
+    for rule, n, rule_fixed, rule_broke, wrong in spelling:
+        print(f"{rule:<14}{n:>8}{rule_fixed:>8}{rule_broke:>8}{wrong:>8}")
+    print(f"{'prekana':<12}{'words':>8}{'wrong':>8}{'rate':>8}")
+    for unit, n, wrong, rate in units:
+        print(f"{unit:<12}{n:>8}{wrong:>8}{rate:>8.1%}")
+    if worst:
+        for i in np.argsort(-final_scores.char_errors, kind="stable")[:worst]:
+            eng, pronunciation, g = words[i]
+            print(
+                f"{final_scores.char_errors[i]:>3} {eng} [{prekanas[i]}] {final[i]} / {g}"
+            )
+
+    return {
+        "engine": engine.name,
+        "words": len(words),
+        "exact": final_scores.exact,
+        "cer": final_scores.cer,
+        "mer": final_scores.mer,
+        "phonetic_exact": phonetic_scores.exact,
+        "phonetic_cer": phonetic_scores.cer,
+        "phonetic_mer": phonetic_scores.mer,
+        "spelling_fixed": fixed,
+        "spelling_broke": broken,
+        "prekana": [
+            {"unit": u, "words": n, "wrong": w, "rate": r} for u, n, w, r in units
+        ],
+        "spelling": [
+            {"rule": r, "words": n, "fixed": f, "broke": b, "wrong": w}
+            for r, n, f, b, w in spelling
+        ],
+    }
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument(
+        "--engine", choices=[*ENGINES, "all"], default="all", help="default: all"
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, help="prekana units to list (default: 20)"
+    )
+    parser.add_argument(
+        "--worst", type=int, default=0, help="also list the N worst words"
+    )
+    parser.add_argument("--json", type=Path, help="write the scores here as JSON")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(DB_DIR))
+    with profiled("evaluate", args):
+        with phase("read"):
+            gold = readGold()
+        names = list(ENGINES) if args.engine == "all" else [args.engine]
+        results = [evaluate(ENGINES[n], gold, args.top, args.worst) for n in names]
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([r for r in results if r], f, ensure_ascii=False, indent=1)
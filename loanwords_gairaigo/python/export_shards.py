@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Export `merged` as pre-tokenized NumPy shards for training transliteration models.
+
+Every pair is encoded with character vocabularies (one for English, one for
+katakana) into padded `int16` arrays, one shard per (split, length bucket):
+
+    shards/<split>.<bucket>.src.npy  int16 [n, bucket]  English ids
+    shards/<split>.<bucket>.tgt.npy  int16 [n, bucket]  katakana ids
+    shards/<split>.<bucket>.len.npy  int32 [n, 2]       unpadded lengths
+
+plus `manifest.json` with the vocabularies and shard shapes. Pairs are
+assigned to train/dev/test by a hash of the English word, so the split of a
+word never changes as the table grows. Encoding is done for whole columns at
+once, with no per-pair Python work, and the shards can be opened with
+`np.load(mmap_mode="r")` (see `batches`).
+"""
+
+import json
+import sqlite3
+import logging
+from zlib import crc32
+from pathlib import Path
+
+import numpy as np
+
+from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+MERGED_DB = DB_DIR / "merged.db"
+SHARD_DIR = ROOT_DIR / "shards"
+
+BUCKETS = (8, 12, 16, 24, 32, 48)
+# Per mille of the hash space given to dev and test; the rest is train.
+DEV_PER_MILLE = 10
+TEST_PER_MILLE = 10
+
+# Sequences are stored as is, without start or end symbols: every bucket is
+# filled up to its width, so a model adds them (and widens) at batch time.
+PAD, UNK = 0, 1
+SPECIALS = ("<pad>", "<unk>")
+
+
+def readPairs(path=MERGED_DB):
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        pairs = conn.execute(
+            """
+                SELECT
+                    english,
+                    japanese
+                FROM
+                    merged
+                WHERE
+                    english != ''
+                AND
+                    japanese != ''
+                ORDER BY
+                    english
+                ;
+            """
+        ).fetchall()
+    conn.close()
+    return pairs
+
+
+def _codepoints(strings):
+    """All characters of `strings` as one uint32 array, plus each string's length."""
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    codes = np.frombuffer("".join(strings).encode("utf-32-le"), dtype=np.uint32)
+    return codes, lengths
+
+
+def makeVocab(codes):
+    """Ids for every character seen, after the special symbols."""
+    return np.unique(codes)
+
+
+def encode(strings, vocab, width):
+    """Padded [n, width] int16 ids of `strings` (which must fit in `width`)."""
+    codes, lengths = _codepoints(strings)
+    ids = np.searchsorted(vocab, codes)
+    ids = np.minimum(ids, len(vocab) - 1)
+    ids = np.where(vocab[ids] == codes, ids + len(SPECIALS), UNK).astype(np.int16)
+    out = np.full((len(strings), width), PAD, dtype=np.int16)
+    rows = np.repeat(np.arange(len(strings)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    cols = np.arange(len(codes)) - np.repeat(starts, lengths)
+    out[rows, cols] = ids
+    return out, lengths
+
+
+def splitOf(english):
+    """0 (train), 1 (dev) or 2 (test), from a stable hash of the English word."""
+    hashes = np.fromiter(
+        (crc32(e.encode("utf-8")) for e in english), dtype=np.uint32, count=len(english)
+    )
+    bucket = hashes % 1000
+    return np.where(
+        bucket < TEST_PER_MILLE,
+        2,
+        np.where(bucket < TEST_PER_MILLE + DEV_PER_MILLE, 1, 0),
+    )
+
+
+def export(pairs, shard_dir=SHARD_DIR, buckets=BUCKETS):
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    english = [e for e, _ in pairs]
+    japanese = [j for _, j in pairs]
+
+    with phase("vocab"):
+        eng_codes, eng_lengths = _codepoints(english)
+        jap_codes, jap_lengths = _codepoints(japanese)
+        eng_vocab = makeVocab(eng_codes)
+        jap_vocab = makeVocab(jap_codes)
+
+    with phase("bucket"):
+        longest = np.maximum(eng_lengths, jap_lengths)
+        bucket_of = np.searchsorted(np.array(buckets), longest)
+        splits = splitOf(english)
+        dropped = int((bucket_of == len(buckets)).sum())
+        if dropped:
+            logging.warning(f"Dropping {dropped} pairs longer than {buckets[-1]}.")
+
+    manifest = {
+        "source_vocab": list(SPECIALS) + [chr(c) for c in eng_vocab.tolist()],
+        "target_vocab": list(SPECIALS) + [chr(c) for c in jap_vocab.tolist()],
+        "specials": {"pad": PAD, "unk": UNK},
+        "buckets": list(buckets),
+        "shards": [],
+    }
+    for split, split_name in enumerate(("train", "dev", "test")):
+        for b, width in enumerate(buckets):
+            with phase("encode"):
+                members = np.flatnonzero((bucket_of == b) & (splits == split))
+                if not len(members):
+                    continue
+                src, src_lengths = encode(
+                    [english[i] for i in members], eng_vocab, width
+                )
+                tgt, tgt_lengths = encode(
+                    [japanese[i] for i in members], jap_vocab, width
+                )
+                lengths = np.stack([src_lengths, tgt_lengths], axis=1).astype(np.int32)
+            with phase("write"):
+                stem = f"{split_name}.{width}"
+                np.save(shard_dir / f"{stem}.src.npy", src)
+                np.save(shard_dir / f"{stem}.tgt.npy", tgt)
+                np.save(shard_dir / f"{stem}.len.npy", lengths)
+            manifest["shards"].append(
+                {
+                    "split": split_name,
+                    "width": width,
+                    "stem": stem,
+                    "size": len(members),
+                }
+            )
+            logging.info(f"{stem}: {len(members)} pairs.")
+
+    with open(shard_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    return manifest
+
+
+def batches(split, batch_size, shard_dir=SHARD_DIR, seed=None):
+    """Yield (src, tgt, lengths) batches of one split, memory-mapped from the shards.
+
+    Each batch comes from a single bucket, so it is a plain slice of the mapped
+    arrays. With a `seed`, batches come in random order and each is a gather of
+    a random subset of its shard, every pair still seen once per pass.
+    """
+    with open(shard_dir / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    shards = [s for s in manifest["shards"] if s["split"] == split]
+    arrays = [
+        tuple(
+            np.load(shard_dir / f"{s['stem']}.{part}.npy", mmap_mode="r")
+            for part in ("src", "tgt", "len")
+        )
+        for s in shards
+    ]
+    # Every (shard, start) pair is one batch.
+    plan = [
+        (i, start)
+        for i, s in enumerate(shards)
+        for start in range(0, s["size"], batch_size)
+    ]
+    orders = None
+    if seed is not None:
+        rng = np.random.default_rng(seed)
+        rng.shuffle(plan)
+        orders = [rng.permutation(s["size"]) for s in shards]
+    for i, start in plan:
+        src, tgt, lengths = arrays[i]
+        if orders is None:
+            rows = slice(start, start + batch_size)
+        else:
+            rows = np.sort(orders[i][start : start + batch_size])
+        yield src[rows], tgt[rows], lengths[rows]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = stage_parser(__doc__)
+    parser.add_argument("--db", type=Path, default=MERGED_DB)
+    parser.add_argument("--out", type=Path, default=SHARD_DIR)
+    args = parser.parse_args()
+    with profiled("export_shards", args):
+        with phase("read"):
+            pairs = readPairs(args.db)
+        export(pairs, args.out)
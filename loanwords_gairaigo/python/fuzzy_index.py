@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fuzzy lookup of English words in the merged table (SymSpell-style).
+
+Every word is indexed under all the strings obtained by deleting up to
+`max_distance` characters from its first `prefix_length` characters. A query
+generates its own deletes, and anything sharing a delete with it is a
+candidate, which is then checked with a bounded Damerau-Levenshtein distance.
+
+Rather than a dict of delete strings (hundreds of MB for the full table), the
+deletes are stored as a sorted array of CRC32 hashes next to an array of word
+ids. Hash collisions only add candidates that fail the distance check.
+
+Before the (pure Python) distance check, candidates are filtered in one NumPy
+pass on two lower bounds of the edit distance: the bag distance (the
+character-count difference) and the number of characters the shared deletes
+removed. The survivors are verified in order of that bound, so the check stops
+as soon as nothing left can be nearer, and at k <= 2 `distance` mostly gets
+away with comparing the two strings once their common ends are trimmed.
+"""
+
+import sys
+import time
+import sqlite3
+import argparse
+from zlib import crc32
+from pathlib import Path
+from array import array
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+MERGED_DB = DB_DIR / "merged.db"
+
+MAX_DISTANCE = 2
+PREFIX_LENGTH = 7
+LIMIT = 10
+
+
+def deletes(word, distance):
+    """All strings obtained by deleting up to `distance` characters (incl. `word`)."""
+    found = {word}
+    # Deleting left to right makes every set of positions once.
+    frontier = [(word, 0)]
+    for _ in range(distance):
+        frontier = [
+            (w[:i] + w[i + 1 :], i)
+            for w, start in frontier
+            for i in range(start, len(w))
+        ]
+        found.update(w for w, _ in frontier)
+    return found
+
+
+def distance(a, b, k):
+    """Optimal string alignment distance between `a` and `b`, or k + 1 if above k.
+
+    Only the diagonal band |i - j| <= k of the table is filled in.
+    """
+    if a == b:
+        return 0
+    len_a, len_b = len(a), len(b)
+    if abs(len_a - len_b) > k:
+        return k + 1
+
+    # Common prefixes and suffixes never change the distance.
+    start = 0
+    while start < len_a and start < len_b and a[start] == b[start]:
+        start += 1
+    while len_a > start and len_b > start and a[len_a - 1] == b[len_b - 1]:
+        len_a -= 1
+        len_b -= 1
+    a, b = a[start:len_a], b[start:len_b]
+    len_a -= start
+    len_b -= start
+    if not len_a or not len_b:
+        return max(len_a, len_b)
+    # What is left starts and ends differently, so up to two characters a side
+    # are one substitution, one transposition or two edits.
+    if len_a <= 2 and len_b <= 2:
+        if len_a == len_b == 1 or (len_a == len_b == 2 and a == b[::-1]):
+            return 1
+        return 2 if k >= 2 else k + 1
+    # Otherwise one edit cannot mend both ends, and two do if one at the head
+    # and one at the tail leave the same middle.
+    if k <= 2:
+        if k == 2:
+            heads = [(1, 1), (1, 0), (0, 1)]
+            tails = [(1, 1), (1, 0), (0, 1)]
+            if len_a > 1 and len_b > 1:
+                if a[0] == b[1] and a[1] == b[0]:
+                    heads.append((2, 2))
+                if a[-1] == b[-2] and a[-2] == b[-1]:
+                    tails.append((2, 2))
+            for i, j in heads:
+                for tail_a, tail_b in tails:
+                    if (
+                        len_a - i - tail_a == len_b - j - tail_b >= 0
+                        and a[i : len_a - tail_a] == b[j : len_b - tail_b]
+                    ):
+                        return 2
+        return k + 1
+
+    big = k + 1
+    previous2 = None
+    previous = [j if j <= k else big for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        current = [big] * (len_b + 1)
+        if i <= k:
+            current[0] = i
+        row_min = current[0]
+        ca = a[i - 1]
+        for j in range(max(1, i - k), min(len_b, i + k) + 1):
+            cb = b[j - 1]
+            value = previous[j - 1] if ca == cb else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                previous2 is not None
+                and j > 1
+                and ca == b[j - 2]
+                and a[i - 2] == cb
+                and previous2[j - 2] + 1 < value
+            ):
+                value = previous2[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > k:
+            return big
+        previous2, previous = previous, current
+    return previous[len_b] if previous[len_b] <= k else big
+
+
+def _hashes(strings):
+    return np.array([crc32(s.encode("utf-8")) for s in strings], dtype=np.uint32)
+
+
+def _codes(word):
+    # Fold characters into 32 bins; merging bins only loosens the lower bound.
+    return np.frombuffer(word.encode("utf-32-le"), dtype=np.uint32) & 31
+
+
+class FuzzyIndex:
+    """Nearest English entries (and their katakana) within a small edit distance."""
+
+    def __init__(self, pairs, max_distance=MAX_DISTANCE, prefix_length=PREFIX_LENGTH):
+        start = time.perf_counter()
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.english = []
+        self.japanese = []
+
+        keys = array("I")
+        ids = array("I")
+        removed = array("B")
+        for i, (eng, jap) in enumerate(pairs):
+            self.english.append(eng)
+            self.japanese.append(jap)
+            prefix = eng[:prefix_length]
+            ds = deletes(prefix, max_distance)
+            keys.extend(crc32(d.encode("utf-8")) for d in ds)
+            ids.extend([i] * len(ds))
+            removed.extend(len(prefix) - len(d) for d in ds)
+
+        keys = np.frombuffer(keys, dtype=np.uint32)
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.ids = np.frombuffer(ids, dtype=np.uint32)[order]
+        # How many characters each delete removed from its word.
+        self.removed = np.frombuffer(removed, dtype=np.uint8)[order]
+
+        self.positions = {eng: i for i, eng in enumerate(self.english)}
+        self.lengths = np.fromiter(map(len, self.english), dtype=np.int16)
+        rows = np.repeat(np.arange(len(self.english)), self.lengths)
+        codes = _codes("".join(self.english))
+        self.counts = (
+            np.bincount(rows * 32 + codes, minlength=32 * len(self.english))
+            .reshape(-1, 32)
+            .clip(max=127)
+            .astype(np.int8)
+        )
+        self.build_seconds = time.perf_counter() - start
+
+    @classmethod
+    def from_db(cls, path=MERGED_DB, **kwargs):
+        with sqlite3.connect(str(Path(path).resolve())) as conn:
+            pairs = conn.execute(
+                """
+                    SELECT
+                        english,
+                        japanese
+                    FROM
+                        merged
+                    ;
+                """
+            ).fetchall()
+        conn.close()
+        return cls(pairs, **kwargs)
+
+    def lookup(self, word, k=None, limit=LIMIT):
+        """The `limit` entries nearest to `word` within distance k, nearest first.
+
+        Results are (distance, english, japanese). Pass `limit=None` for every
+        entry within distance k (short words can have thousands at k=2).
+        """
+        k = self.max_distance if k is None else min(k, self.max_distance)
+        word = word.strip().upper()
+        if k == 0 or limit == 1:
+            i = self.positions.get(word)
+            if i is not None:
+                return [(0, word, self.japanese[i])]
+            if k == 0:
+                return []
+        prefix = word[: self.prefix_length]
+        query_deletes = list(deletes(prefix, k))
+        hashes = _hashes(query_deletes)
+        lo = np.searchsorted(self.keys, hashes, side="left")
+        hi = np.searchsorted(self.keys, hashes, side="right")
+        sizes = hi - lo
+        total = int(sizes.sum())
+        if not total:
+            return []
+        # Concatenate the ranges ids[lo:hi] without a Python loop; a word
+        # found under several deletes is only verified once, below.
+        positions = np.repeat(lo - (np.cumsum(sizes) - sizes), sizes) + np.arange(total)
+        candidates = self.ids[positions]
+        # Every edit takes at most one character from each side of a common
+        # subsequence, so a word sharing only deletes of more than d characters
+        # (from either side) is further than d.
+        query_removed = np.repeat(
+            np.array([len(prefix) - len(d) for d in query_deletes]), sizes
+        )
+        removed = self.removed[positions]
+        shared = np.maximum(query_removed, removed)
+        # Deleting q characters from one and c from the other reaches the same
+        # string, so (for words no longer than the prefix) they are at most
+        # q + c apart: verifying these first fills the results sooner.
+        spread = query_removed + removed
+
+        # A cheap lower bound first: the bag distance, which is never below the
+        # length difference either. Counts above 127 are clipped in the index,
+        # which only lowers the bound.
+        length_diff = self.lengths[candidates] - len(word)
+        # Both sides within 0-127, so the int8 difference cannot overflow.
+        query = np.bincount(_codes(word), minlength=32).clip(max=127).astype(np.int8)
+        surplus = np.maximum(self.counts[candidates] - query, 0).sum(axis=1)
+        # The counts differ by surplus - deficit = length_diff in total.
+        bounds = np.maximum(np.maximum(surplus, surplus - length_diff), shared)
+        keep = bounds <= k
+        candidates, bounds, spread = candidates[keep], bounds[keep], spread[keep]
+
+        # Verify in order of lower bound (then spread and id), stopping once
+        # nothing left can be nearer.
+        order = np.lexsort((candidates, spread, bounds))
+        candidates, bounds = candidates[order].tolist(), bounds[order].tolist()
+        results = []
+        seen = set()
+        for i, bound in zip(candidates, bounds):
+            if limit is not None and len(results) >= limit:
+                if bound >= results[-1][0]:
+                    break
+            if i in seen:
+                continue
+            seen.add(i)
+            eng = self.english[i]
+            d = distance(word, eng, k)
+            if d <= k:
+                results.append((d, eng, self.japanese[i]))
+                if limit is not None:
+                    results.sort()
+                    del results[limit:]
+        results.sort()
+        return results
+
+    def nbytes(self):
+        """Approximate memory held by the index."""
+        strings = sum(sys.getsizeof(s) for s in self.english) + sum(
+            sys.getsizeof(s) for s in self.japanese
+        )
+        lists = sys.getsizeof(self.english) + sys.getsizeof(self.japanese)
+        lists += sys.getsizeof(self.positions)
+        arrays = self.keys.nbytes + self.ids.nbytes + self.removed.nbytes
+        arrays += self.lengths.nbytes + self.counts.nbytes
+        return arrays + strings + lists
+
+    def report(self):
+        return (
+            f"{len(self.english)} entries, {len(self.keys)} deletes, "
+            f"built in {self.build_seconds:.2f}s, ~{self.nbytes() / 2 ** 20:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("words", nargs="+", help="English words to look up")
+    parser.add_argument("-k", type=int, default=MAX_DISTANCE, help="edit distance")
+    parser.add_argument("-n", "--limit", type=int, default=LIMIT, help="max results")
+    parser.add_argument("--db", type=Path, default=MERGED_DB)
+    args = parser.parse_args()
+
+    index = FuzzyIndex.from_db(args.db, max_distance=max(args.k, MAX_DISTANCE))
+    print(index.report())
+    for word in args.words:
+        start = time.perf_counter()
+        results = index.lookup(word, args.k, args.limit)
+        micros = (time.perf_counter() - start) * 1e6
+        print(f"{word} ({micros:.0f} µs):")
+        for d, eng, jap in results:
+            print(f"    {d} {eng} {jap}")
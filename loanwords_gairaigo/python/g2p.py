@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Guess the ARPAbet of words that no source has, to transcribe them anyway.
+
+The model is a joint-sequence (graphone) bigram: CMUdict is aligned into
+pairs of 1-2 letters and 0-2 phonemes by hard EM, and the pairs' bigram counts
+are kept, interpolated with their unigram counts (Witten-Bell). Decoding is a
+Viterbi search over letter positions, whose states are the last graphone;
+with the log-probabilities precomputed as one dense table, each step is a few
+NumPy operations over the graphones that spell the next letters.
+
+    python g2p.py train [--db db/cmudict.db] [--model db/g2p.npz]
+    python g2p.py evaluate [--db db/cmudict.db]
+    python g2p.py WORD ...
+
+The pronunciations have no stress marks and go through `arpa_to_kana` as is.
+"""
+
+import re
+import sys
+import time
+import sqlite3
+from pathlib import Path
+from collections import Counter
+
+import numpy as np
+
+if __package__:
+    from .progress import progress
+    from .profiling import phase, profiled, stage_parser
+else:
+    from progress import progress
+    from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+CMU_DB = DB_DIR / "cmudict.db"
+MODEL_PATH = DB_DIR / "g2p.npz"
+
+MAX_LETTERS = 2
+MAX_PHONES = 2
+ITERATIONS = 5
+# Every `HOLD_OUT`th word is kept out of training by `evaluate`.
+HOLD_OUT = 20
+
+BOS, EOS = 0, 1
+# Log-probabilities of the chunk shapes before the first EM iteration.
+SHAPE_PRIOR = {(1, 0): -1.0, (1, 1): 0.0, (1, 2): -1.0, (2, 0): -3.0, (2, 1): -1.0}
+UNSEEN = -20.0
+
+letters_only = re.compile(r"[^A-Z']")
+alternative = re.compile(r"\(\d+\)$")
+stress = re.compile(r"\d+")
+
+
+def normWord(word):
+    return letters_only.sub("", alternative.sub("", word.strip().upper()))
+
+
+def readLexicon(path=CMU_DB):
+    """(word, phonemes) of every CMUdict entry, without stress marks."""
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        rows = conn.execute("SELECT english, pronunciation FROM main;").fetchall()
+    conn.close()
+    pairs = []
+    for english, pronunciation in rows:
+        word = normWord(english or "")
+        phones = stress.sub("", pronunciation or "").split()
+        if word and phones:
+            pairs.append((word, tuple(phones)))
+    return pairs
+
+
+def _shapes():
+    return [
+        (m, n)
+        for m in range(1, MAX_LETTERS + 1)
+        for n in range(0, MAX_PHONES + 1)
+        if (m, n) in SHAPE_PRIOR
+    ]
+
+
+def alignWord(word, phones, scores, shapes):
+    """The best split of (word, phones) into graphones under `scores`."""
+    L, P = len(word), len(phones)
+    # best[i][j]: (score, previous (i, j), graphone) of word[:i], phones[:j].
+    best = [[None] * (P + 1) for _ in range(L + 1)]
+    best[0][0] = (0.0, None, None)
+    for i in range(L):
+        for j in range(P + 1):
+            here = best[i][j]
+            if here is None:
+                continue
+            for m, n in shapes:
+                if i + m > L or j + n > P:
+                    continue
+                g = (word[i : i + m], " ".join(phones[j : j + n]))
+                score = here[0] + scores.get(g, scores.get((m, n), UNSEEN))
+                there = best[i + m][j + n]
+                if there is None or score > there[0]:
+                    best[i + m][j + n] = (score, (i, j), g)
+    if best[L][P] is None:
+        return None
+    graphones = []
+    i, j = L, P
+    while (i, j) != (0, 0):
+        _, (i, j), g = best[i][j]
+        graphones.append(g)
+    graphones.reverse()
+    return graphones
+
+
+def align(pairs, iterations=ITERATIONS):
+    """The graphone sequences of `pairs`, by hard EM on unigram graphones."""
+    shapes = _shapes()
+    # Unseen graphones fall back on the log-probability of their shape.
+    scores = dict(SHAPE_PRIOR)
+    for iteration in range(iterations):
+        counts = Counter()
+        aligned = []
+        words = progress(f"alignment {iteration + 1}/{iterations}", total=len(pairs))
+        for word, phones in pairs:
+            words.update()
+            graphones = alignWord(word, phones, scores, shapes)
+            aligned.append(graphones)
+            if graphones is not None:
+                counts.update(graphones)
+        words.close()
+        total = sum(counts.values())
+        scores = {g: float(np.log(c / total)) for g, c in counts.items()}
+        scores.update({shape: UNSEEN for shape in shapes})
+    return aligned
+
+
+def train(pairs, iterations=ITERATIONS):
+    """The arrays of a model trained on (word, phonemes) `pairs`."""
+    with phase("align"):
+        aligned = [g for g in align(pairs, iterations) if g is not None]
+    with phase("count"):
+        ids = {("<s>", ""): BOS, ("</s>", ""): EOS}
+        for graphones in aligned:
+            for g in graphones:
+                ids.setdefault(g, len(ids))
+        bigrams = Counter()
+        for graphones in aligned:
+            sequence = [BOS] + [ids[g] for g in graphones] + [EOS]
+            bigrams.update(zip(sequence, sequence[1:]))
+    graphones = sorted(ids, key=ids.get)
+    keys = np.array(list(bigrams.keys()), dtype=np.int32).reshape(-1, 2)
+    return {
+        "letters": np.array([g[0] for g in graphones]),
+        "phones": np.array([g[1] for g in graphones]),
+        "previous": keys[:, 0],
+        "next": keys[:, 1],
+        "count": np.array(list(bigrams.values()), dtype=np.int32),
+    }
+
+
+def save(model, path=MODEL_PATH):
+    np.savez_compressed(str(path), **model)
+
+
+class G2P:
+    """Viterbi decoding of a graphone bigram model."""
+
+    def __init__(self, model):
+        self.letters = [str(s) for s in model["letters"]]
+        self.phones = [str(s) for s in model["phones"]]
+        G = len(self.letters)
+        counts = np.zeros((G, G), dtype=np.float64)
+        np.add.at(counts, (model["previous"], model["next"]), model["count"])
+        # Witten-Bell: a history seen followed by many different graphones
+        # leans more on the unigram distribution.
+        unigram = counts.sum(axis=0) + 1.0
+        unigram[BOS] = 0.0
+        unigram /= unigram.sum()
+        seen = counts.sum(axis=1)
+        types = (counts > 0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            table = (counts + types[:, None] * unigram[None, :]) / (seen + types)[
+                :, None
+            ]
+            table[seen == 0] = unigram
+            self.table = np.log(table).astype(np.float32)
+        self.by_letters = {}
+        for i, letters in enumerate(self.letters):
+            if i not in (BOS, EOS):
+                self.by_letters.setdefault(letters, []).append(i)
+        self.by_letters = {
+            k: np.array(v, dtype=np.int32) for k, v in self.by_letters.items()
+        }
+        self.lengths = np.array([len(s) for s in self.letters], dtype=np.int32)
+        self.lengths[[BOS, EOS]] = 0
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        with np.load(str(path)) as model:
+            return cls(dict(model))
+
+    def pronounce(self, word):
+        """Space-separated ARPAbet for `word`, or None if it cannot be spelt."""
+        word = normWord(word)
+        if not word:
+            return None
+        L = len(word)
+        table, by_letters, lengths = self.table, self.by_letters, self.lengths
+        # For every position: the graphones ending there, their scores and the
+        # index of their best predecessor among those ending where they start.
+        states = [None] * (L + 1)
+        states[0] = (np.array([BOS], dtype=np.int32), np.zeros(1, np.float32), None)
+        for i in range(L):
+            if states[i] is None:
+                continue
+            previous, scores, _ = states[i]
+            for m in range(1, MAX_LETTERS + 1):
+                ids = by_letters.get(word[i : i + m]) if i + m <= L else None
+                if ids is None:
+                    continue
+                total = scores[:, None] + table[previous[:, None], ids[None, :]]
+                back = total.argmax(axis=0)
+                best = total[back, np.arange(len(ids))]
+                if states[i + m] is None:
+                    states[i + m] = (ids, best, back)
+                else:
+                    # Graphones of different lengths never share an id.
+                    old_ids, old_best, old_back = states[i + m]
+                    states[i + m] = (
+                        np.concatenate((old_ids, ids)),
+                        np.concatenate((old_best, best)),
+                        np.concatenate((old_back, back)),
+                    )
+        if states[L] is None:
+            return None
+        ids, scores, back = states[L]
+        k = int((scores + table[ids, EOS]).argmax())
+        phones = []
+        position = L
+        while position > 0:
+            ids, _, back = states[position]
+            g = int(ids[k])
+            if self.phones[g]:
+                phones.append(self.phones[g])
+            k = int(back[k])
+            position -= int(lengths[g])
+        return " ".join(reversed(phones))
+
+    def transcribe(self, word, style=None):
+        """Katakana for `word` through its guessed pronunciation, or None."""
+        if __package__:
+            from .cmu_to_kana import engine, arpa_to_prekana
+        else:
+            from cmu_to_kana import engine, arpa_to_prekana
+
+        pronunciation = self.pronounce(word)
+        if not pronunciation:
+            return None
+        return engine.kana(arpa_to_prekana(pronunciation), normWord(word), style=style)
+
+
+def _edits(a, b):
+    row = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j, y in enumerate(b, 1):
+            previous, row[j] = row[j], min(
+                row[j] + 1, row[j - 1] + 1, previous + (x != y)
+            )
+    return row[-1]
+
+
+def evaluate(pairs, iterations=ITERATIONS):
+    """Train on all but every `HOLD_OUT`th word; report on the others."""
+    held = pairs[::HOLD_OUT]
+    model = G2P(train([p for i, p in enumerate(pairs) if i % HOLD_OUT], iterations))
+    start = time.perf_counter()
+    guesses = [model.pronounce(word) for word, _ in held]
+    seconds = time.perf_counter() - start
+    correct = errors = length = 0
+    for (_, phones), guess in zip(held, guesses):
+        guess = guess.split() if guess else []
+        correct += guess == list(phones)
+        errors += _edits(guess, phones)
+        length += len(phones)
+    print(
+        f"{len(held)} held-out words: {correct / len(held):.1%} exact, "
+        f"{errors / length:.1%} phoneme error rate; "
+        f"{len(held) / seconds:,.0f} words/s, {len(model.letters)} graphones."
+    )
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument("words", nargs="*", help="train, evaluate or words to guess")
+    parser.add_argument("--db", type=Path, default=CMU_DB)
+    parser.add_argument("--model", type=Path, default=MODEL_PATH)
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    args = parser.parse_args()
+
+    if args.words[:1] == ["train"]:
+        with profiled("g2p", args):
+            model = train(readLexicon(args.db), args.iterations)
+            save(model, args.model)
+        print(f"{len(model['letters'])} graphones written to {args.model}.")
+    elif args.words[:1] == ["evaluate"]:
+        with profiled("g2p", args):
+            evaluate(readLexicon(args.db), args.iterations)
+    elif args.words:
+        model = G2P.load(args.model)
+        for word in args.words:
+            print(
+                f"{word}\t{model.pronounce(word) or ''}\t{model.transcribe(word) or ''}"
+            )
+    else:
+        parser.print_usage(sys.stderr)
@@ -2,15 +2,17 @@
 # -*- coding: utf-8 -*-
 """Scan JMdict for things that look like 外来語."""
 
+import os
 import re
-import sys
 import sqlite3
 from pathlib import Path
 
-from lxml import etree as ET
+from progress import progress
+from profiling import phase, profiled, stage_parser
 
-DB_PATH = Path("../db/jmdict.db")
-JMDICT = str(Path("../data/JMdict_e").resolve())
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_PATH = ROOT_DIR / "db" / "jmdict.db"
+JMDICT = str(ROOT_DIR / "data" / "JMdict_e")
 
 SEQUENCE_TAG = "ent_seq"
 ENTRY_TAG = "entry"
@@ -123,25 +125,30 @@ def quickExclude(entry):
 
 def scan_dict():
     """Iteratively find pages in the dump and extract the first paragraph if the title matches."""
-    entries = ET.iterparse(JMDICT, tag=ENTRY_TAG, huge_tree=True, recover=True)
-    sys.stdout.write("[")
+    from lxml import etree as ET
+
+    dump = open(JMDICT, "rb")
+    entries = ET.iterparse(dump, tag=ENTRY_TAG, huge_tree=True, recover=True)
+    scanned = progress("JMdict", total_bytes=os.path.getsize(JMDICT))
     while True:
         try:
-            _, entry = next(entries)
-            if quickExclude(entry):
-                continue
-            reading = getReading(entry)
-            if reading and onlyKat(reading):
-                entry_sequence = getSequence(entry)
-                surface_form = getSurface(entry) or reading
-                gloss = getGloss(entry)
-                strict_eng = getStrictEng(entry)
-                wasei = getWasei(entry)
-                sys.stdout.write(
-                    f"({entry_sequence}, {reading}, {gloss}, {strict_eng}, {wasei})"
-                )
-                sys.stdout.flush()
-                with sqlite3.connect(str(DB_PATH.resolve())) as conn:
+            with phase("parse"):
+                _, entry = next(entries)
+            with phase("extract"):
+                if quickExclude(entry):
+                    scanned.update(position=dump.tell())
+                    continue
+                reading = getReading(entry)
+                is_gairaigo = reading and onlyKat(reading)
+                if is_gairaigo:
+                    entry_sequence = getSequence(entry)
+                    surface_form = getSurface(entry) or reading
+                    gloss = getGloss(entry)
+                    strict_eng = getStrictEng(entry)
+                    wasei = getWasei(entry)
+            scanned.update(matched=bool(is_gairaigo), position=dump.tell())
+            if is_gairaigo:
+                with phase("write"), sqlite3.connect(str(DB_PATH.resolve())) as conn:
                     try:
                         conn.execute(
                             """
@@ -190,9 +197,6 @@ def scan_dict():
                                 entry_sequence,
                             ),
                         )
-            else:
-                sys.stdout.write(".")
-                sys.stdout.flush()
         except ET.XMLSyntaxError as e:
             print("Skipping error: ", e)
             continue
@@ -203,11 +207,13 @@ def scan_dict():
                 entry.clear()
             except:
                 pass
-    sys.stdout.write("]\n")
-    sys.stdout.flush()
+    scanned.close()
+    dump.close()
     print("Done with the dump!")
 
 
 if __name__ == "__main__":
-    makeTable()
-    scan_dict()
+    args = stage_parser(__doc__).parse_args()
+    with profiled("jmdict", args):
+        makeTable()
+        scan_dict()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Load the JTCA guideline table (db/jtca.sql) into jtca.db.
+
+The JTCA data only exists as a table in a PDF, which was copy-pasted and
+reviewed by hand into `jtca.sql`, so that dump is the archive this stage
+reads. `katakana_guide` is rebuilt from it in one transaction and indexed.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+
+DB_PATH = DB_DIR / "jtca.db"
+SQL_PATH = DB_DIR / "jtca.sql"
+
+
+def makeDb(sql_path=SQL_PATH, path=DB_PATH):
+    with phase("read"):
+        script = Path(sql_path).read_text(encoding="utf-8")
+    with phase("write"), sqlite3.connect(str(Path(path).resolve())) as conn:
+        conn.execute("DROP TABLE IF EXISTS katakana_guide;")
+        # The dump has its own BEGIN TRANSACTION and COMMIT.
+        conn.executescript(script)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS katakana_guide_english "
+            "ON katakana_guide (english);"
+        )
+        count = conn.execute("SELECT COUNT(*) FROM katakana_guide;").fetchone()[0]
+    conn.close()
+    return count
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument("--sql", type=Path, default=SQL_PATH)
+    parser.add_argument("--output", type=Path, default=DB_PATH)
+    args = parser.parse_args()
+    with profiled("jtca_to_db", args):
+        count = makeDb(args.sql, args.output)
+    print(f"Loaded {count} JTCA entries.")
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Library access to the merged mapping and the transcription engines.
+
+Nothing is opened, built or imported until it is first used: a single English
+lookup is one indexed query on `merged`, the reverse index is loaded from its
+snapshot on the first katakana lookup, and NumPy is only imported for fuzzy
+lookups.
+
+Run as a script, it looks up the words of a file (one per line) in bulk and
+compares the throughput with one query per word.
+"""
+
+import sys
+import time
+import sqlite3
+import argparse
+import itertools
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+MERGED_DB = DB_DIR / "merged.db"
+
+# Words looked up per join; bounds the memory used by lookup_many.
+CHUNK = 100_000
+
+
+def _norm_en():
+    if __package__:
+        from .normalize import norm_en_quiet
+    else:
+        from normalize import norm_en_quiet
+
+    return norm_en_quiet
+
+
+class Lexicon:
+    """English to katakana (and back) over the `merged` table."""
+
+    def __init__(self, path=MERGED_DB):
+        self.path = Path(path)
+        self._conn = None
+        self._reverse = None
+        self._fuzzy = None
+        self._g2p = None
+        self._styled = None
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                f"file:{self.path.resolve()}?mode=ro", uri=True, check_same_thread=False
+            )
+            # `restyle.py` creates merged_styles; until then every style reads
+            # the default katakana.
+            self._styled = (
+                self._conn.execute(
+                    """
+                        SELECT
+                            1
+                        FROM
+                            sqlite_master
+                        WHERE
+                            type = 'table'
+                        AND
+                            name = 'merged_styles'
+                        ;
+                    """
+                ).fetchone()
+                is not None
+            )
+        return self._conn
+
+    def lookup(self, english, guess=False, style=None):
+        """The katakana for `english`, or None.
+
+        With `guess`, words in no source are transcribed from the pronunciation
+        `g2p.py` guesses for them, if its model has been trained. With a
+        `style`, words transcribed by the pipeline come in that house style,
+        once `restyle.py` has rendered it.
+        """
+        if style is not None:
+            _checkStyle(style)
+        conn = self._connect()
+        if style is None or style == "default" or not self._styled:
+            row = conn.execute(
+                """
+                    SELECT
+                        japanese
+                    FROM
+                        merged
+                    WHERE
+                        english = ?
+                    ;
+                """,
+                (english.strip().upper(),),
+            ).fetchone()
+        else:
+            row = conn.execute(
+                """
+                    SELECT
+                        COALESCE(merged_styles.japanese, merged.japanese)
+                    FROM
+                        merged
+                        LEFT JOIN merged_styles
+                            ON merged_styles.style = ?
+                            AND merged_styles.english = merged.english
+                    WHERE
+                        merged.english = ?
+                    ;
+                """,
+                (style, english.strip().upper()),
+            ).fetchone()
+        if row is None and guess:
+            return self.guess(english, style)
+        return row[0] if row else None
+
+    def guess(self, english, style=None):
+        """Katakana for `english` through its guessed pronunciation, or None."""
+        if self._g2p is None:
+            if __package__:
+                from .g2p import G2P, MODEL_PATH
+            else:
+                from g2p import G2P, MODEL_PATH
+
+            if not MODEL_PATH.exists():
+                return None
+            self._g2p = G2P.load(MODEL_PATH)
+        return self._g2p.transcribe(english, style)
+
+    def lookup_many(self, words, chunk_size=CHUNK):
+        """Yield (word, katakana or None) for every word of `words`, in order.
+
+        Words are normalized as in `merge_clean_db.norm_en` (but quietly: many
+        tokens of a stream normalize to nothing), deduplicated and resolved
+        `chunk_size` at a time with a single join against a temporary table,
+        so `words` can be any iterable, however long.
+        """
+        norm_en = _norm_en()
+        conn = self._connect()
+        conn.execute(
+            """
+                CREATE TEMP TABLE IF NOT EXISTS
+                    lookup_words (
+                        english TEXT PRIMARY KEY
+                    )
+                WITHOUT ROWID
+                ;
+            """
+        )
+        words = iter(words)
+        while True:
+            chunk = list(itertools.islice(words, chunk_size))
+            if not chunk:
+                return
+            normalized = {}
+            for word in chunk:
+                if word not in normalized:
+                    normalized[word] = norm_en(word)
+            conn.execute("DELETE FROM lookup_words;")
+            conn.executemany(
+                "INSERT OR IGNORE INTO lookup_words VALUES ( ? );",
+                ((w,) for w in set(normalized.values()) if w),
+            )
+            found = dict(
+                conn.execute(
+                    """
+                        SELECT
+                            english,
+                            japanese
+                        FROM
+                            lookup_words
+                            JOIN merged
+                                USING (english)
+                        ;
+                    """
+                )
+            )
+            conn.commit()
+            for word in chunk:
+                yield word, found.get(normalized[word])
+
+    def reverse(self, kana):
+        """Every English entry transcribed as (a variant of) `kana`."""
+        if self._reverse is None:
+            if __package__:
+                from .reverse_index import ReverseIndex
+            else:
+                from reverse_index import ReverseIndex
+
+            self._reverse = ReverseIndex.from_snapshot(self.path)
+        return self._reverse.lookup(kana)
+
+    def fuzzy(self, english, k=None, limit=10):
+        """(distance, english, katakana) of the nearest entries to `english`."""
+        if self._fuzzy is None:
+            if __package__:
+                from .fuzzy_index import FuzzyIndex
+            else:
+                from fuzzy_index import FuzzyIndex
+
+            self._fuzzy = FuzzyIndex.from_db(self.path)
+        return self._fuzzy.lookup(english, k, limit)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _checkStyle(style):
+    if __package__:
+        from .prekana_map import styles
+    else:
+        from prekana_map import styles
+
+    if style not in styles:
+        raise ValueError(f"Unknown style {style!r}, not one of {', '.join(styles)}.")
+
+
+def _engine(alphabet):
+    if alphabet == "arpa":
+        if __package__:
+            from .cmu_to_kana import engine, arpa_to_prekana as to_prekana
+        else:
+            from cmu_to_kana import engine, arpa_to_prekana as to_prekana
+    elif alphabet == "ipa":
+        if __package__:
+            from .britfone_to_kana import engine, ipa_to_prekana as to_prekana
+        else:
+            from britfone_to_kana import engine, ipa_to_prekana as to_prekana
+    else:
+        raise ValueError(f"Unknown phonetic alphabet {alphabet!r}.")
+    return engine, to_prekana
+
+
+def transcribe(pronunciation, english="", alphabet="arpa", style=None):
+    """Katakana for an ARPAbet (CMUdict) or IPA (Britfone) pronunciation.
+
+    Passing the `english` spelling applies the spelling-based corrections;
+    `style` is one of `prekana_map.styles`.
+    """
+    engine, to_prekana = _engine(alphabet)
+    if style is not None:
+        _checkStyle(style)
+    return engine.kana(to_prekana(pronunciation), english, style=style)
+
+
+def transcribe_candidates(pronunciation, english="", alphabet="arpa", style=None):
+    """(katakana, cost) candidates for a pronunciation, cheapest first.
+
+    The first is what `transcribe` gives; the others are only worked out as
+    they are iterated over (see `Engine.kana_candidates`).
+    """
+    engine, to_prekana = _engine(alphabet)
+    if style is not None:
+        _checkStyle(style)
+    return engine.kana_candidates(to_prekana(pronunciation), english, style)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("words", type=Path, help="one word per line, - for stdin")
+    parser.add_argument("--db", type=Path, default=MERGED_DB)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK)
+    parser.add_argument(
+        "--compare", action="store_true", help="also time one query per word"
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="only report the throughput"
+    )
+    args = parser.parse_args()
+
+    f = sys.stdin if str(args.words) == "-" else args.words.open(encoding="utf-8")
+    words = (line.rstrip("\n") for line in f)
+    lexicon = Lexicon(args.db)
+    if args.compare:
+        # Both paths see the same words, so keep them.
+        words = list(words)
+        norm_en = _norm_en()
+        start = time.perf_counter()
+        single = [lexicon.lookup(norm_en(word)) for word in words]
+        single_seconds = time.perf_counter() - start
+
+    count = found = 0
+    start = time.perf_counter()
+    for word, kana in lexicon.lookup_many(words, args.chunk_size):
+        count += 1
+        found += kana is not None
+        if not args.quiet:
+            print(f"{word}\t{kana or ''}")
+    seconds = time.perf_counter() - start
+    print(
+        f"lookup_many: {count} words, {found} found, {seconds:.2f}s "
+        f"({count / max(seconds, 1e-9):,.0f} words/s)",
+        file=sys.stderr,
+    )
+    if args.compare:
+        print(
+            f"lookup: {len(single)} words, {sum(k is not None for k in single)} "
+            f"found, {single_seconds:.2f}s "
+            f"({len(single) / max(single_seconds, 1e-9):,.0f} words/s, "
+            f"{single_seconds / max(seconds, 1e-9):.1f}x slower)",
+            file=sys.stderr,
+        )
+    lexicon.close()
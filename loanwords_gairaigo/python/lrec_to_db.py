@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Read the LREC'14 transliteration dictionary straight from its tarball.
+
+The members of `data/lrec2014.tar.bz2` are streamed one after the other (the
+archive is never extracted). Every line holding a katakana word, its English
+and a confidence score, tab-separated and in any order, becomes a row of
+`lrec2014`, which `create_type_1.sql` and `merge_engine.py` read. Other lines
+(READMEs, headers) are skipped and counted.
+"""
+
+import re
+import sqlite3
+import tarfile
+from pathlib import Path
+
+from progress import progress
+from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT_DIR / "data"
+DB_DIR = ROOT_DIR / "db"
+
+DB_PATH = DB_DIR / "lrec2014.db"
+ARCHIVE_PATH = DATA_DIR / "lrec2014.tar.bz2"
+
+WRITE_BATCH = 10_000
+
+katakana = re.compile(r"^[゠-ヿㇰ-ㇿ]+$")
+# Not float(), which would also take English such as "nan" or "infinity".
+number = re.compile(r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+
+
+def findColumns(fields):
+    """(katakana, confidence, English) column numbers of a line's fields, or None."""
+    japanese = confidence = None
+    english = []
+    for i, field in enumerate(fields):
+        field = field.strip()
+        if japanese is None and katakana.match(field):
+            japanese = i
+            continue
+        if confidence is None and number.match(field):
+            confidence = i
+            continue
+        if field:
+            english.append(i)
+    if japanese is None or confidence is None or not english:
+        return None
+    return japanese, confidence, tuple(english)
+
+
+def parseLine(line, columns=None):
+    """(english, japanese, confidence) of a dictionary line (or None) and its layout.
+
+    `columns` is the layout of the previous line; it is tried first, since all
+    the lines of a file share one.
+    """
+    fields = line.rstrip("\n").split("\t")
+    if len(fields) < 3:
+        return None, columns
+    if columns is not None:
+        japanese, confidence, english = columns
+        if (
+            english[-1] < len(fields)
+            and katakana.match(fields[japanese])
+            and number.match(fields[confidence].strip())
+        ):
+            return (
+                " ".join([fields[e].strip() for e in english]),
+                fields[japanese],
+                float(fields[confidence]),
+            ), columns
+    found = findColumns(fields)
+    if found is None:
+        return None, columns
+    japanese, confidence, english = found
+    row = (
+        " ".join([fields[e].strip() for e in english]),
+        fields[japanese].strip(),
+        float(fields[confidence]),
+    )
+    return row, found
+
+
+def readArchive(path=ARCHIVE_PATH):
+    """Yield the rows of every member of the tarball, and count the rest."""
+    lines = progress("LREC'14 lines")
+    # "r|*" reads the (compressed) archive as a stream, member by member.
+    with tarfile.open(str(path), "r|*") as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            columns = None
+            for raw in archive.extractfile(member):
+                row, columns = parseLine(raw.decode("utf-8", errors="replace"), columns)
+                lines.update(matched=row is not None)
+                if row is not None:
+                    yield row
+    lines.close()
+
+
+def makeDb(rows, path=DB_PATH):
+    """Replace `lrec2014` with `rows` in one transaction, then index it."""
+    count = 0
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        conn.execute("PRAGMA synchronous=OFF;")
+        conn.execute("DROP TABLE IF EXISTS lrec2014;")
+        conn.execute(
+            """
+                CREATE TABLE
+                    lrec2014 (
+                        english TEXT,
+                        japanese TEXT,
+                        confidence REAL
+                    )
+                ;
+            """
+        )
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= WRITE_BATCH:
+                with phase("write"):
+                    conn.executemany("INSERT INTO lrec2014 VALUES ( ?, ?, ? );", batch)
+                count += len(batch)
+                batch = []
+        with phase("write"):
+            conn.executemany("INSERT INTO lrec2014 VALUES ( ?, ?, ? );", batch)
+            count += len(batch)
+            conn.execute("CREATE INDEX lrec2014_english ON lrec2014 (english);")
+    conn.close()
+    return count
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument("--archive", type=Path, default=ARCHIVE_PATH)
+    parser.add_argument("--output", type=Path, default=DB_PATH)
+    args = parser.parse_args()
+    with profiled("lrec_to_db", args):
+        count = makeDb(readArchive(args.archive), args.output)
+    print(f"Loaded {count} LREC'14 entries.")
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""How English spellings are normalized, by the merge (`merge_clean_db.norm_en`)
+and by the library (`Lexicon.lookup_many`) alike."""
+
+import re
+import unicodedata
+
+import unidecode
+
+non_ascii = re.compile(r"[^A-Z.'\- ]")
+pronunciation_alternative = re.compile(r"\(\d\)$")
+bad_ends = r"[0-9\s!#\$%&\(\)\*\+,\-\./:;<=>\?@\[\\\]^_`{\|}~\u3000\u303f\u30fb]+"
+bad_front = re.compile(r"^" + bad_ends)
+bad_back = re.compile(bad_ends + r"$")
+
+
+def norm_en_quiet(word: str) -> str:
+    """`norm_en` without the warning, for input where empty words are expected."""
+    # Remove CMUdict's alternative pronunciation notation (e.g., "UPPER(1) -> UPPER").
+    normalized_word = pronunciation_alternative.sub("", word)
+    normalized_word = (
+        "".join(
+            c
+            for c in unidecode.unidecode(unicodedata.normalize("NFKC", normalized_word))
+        )
+        .upper()
+        .strip()
+    )
+    normalized_word = bad_front.sub("", bad_back.sub("", normalized_word))
+    if non_ascii.search(normalized_word):
+        normalized_word = ""
+    return normalized_word
@@ -70,7 +70,7 @@ onsets = {
     "F R",
     "TH R",
     "SH R",
-    "H W",
+    "HH W",
     "S W",
     "TH W",
     "V W",  # voiceless fricative or V plus approximant other than Y
@@ -87,7 +87,7 @@ onsets = {
     "TH Y",
     "S Y",
     "Z Y",
-    "H Y",
+    "HH Y",
     "L Y",  # consonant plus Y
     "S P",
     "S T",
@@ -216,4 +216,15 @@ uninf_codas = {
 # (except those ending in S, Z, SH, ZH, CH or JH),
 # or a +T or +D to represent past tense
 # (except those ending in T or D.)
-codas = uninf_codas  # + ?? Too hard for now...
+def inflect(codas):
+    inflected = set()
+    for coda in codas:
+        last = coda.split(" ")[-1]
+        if last not in ("S", "Z", "SH", "ZH", "CH", "JH"):
+            inflected.update((coda + " S", coda + " Z"))
+        if last not in ("T", "D"):
+            inflected.update((coda + " T", coda + " D"))
+    return inflected
+
+
+codas = uninf_codas | inflect(uninf_codas)
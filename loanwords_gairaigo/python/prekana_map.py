@@ -332,3 +332,71 @@ prekana_to_kana = {
     "zyu": "ジュ",
     "zyv": "ジュ",
 }
+
+# V has its own prekana, read as B by default, so that styles can tell them apart.
+prekana_to_kana.update(
+    {"V" + p[1:]: kana for p, kana in prekana_to_kana.items() if p.startswith("b")}
+)
+
+# Other katakana commonly used for some prekana, each with a cost (the higher,
+# the less likely), tried by `Engine.kana_candidates` after the ones above.
+prekana_alternatives = {
+    "-": (("", 1.0),),  # Long vowels are often left short (コンピュータ).
+    "x": (("", 1.0),),  # As is gemination (ダフィン).
+    "di": (("ジ", 1.0),),  # Older loanwords (ラジオ).
+    "dya": (("ジャ", 1.0),),
+    "dyo": (("ジョ", 1.0),),
+    "dyu": (("ジュ", 0.5),),
+    "ti": (("チ", 1.0),),  # チケット
+    "tu": (("ツ", 1.0), ("ト", 1.5)),
+    "du": (("ド", 1.0), ("ズ", 1.5)),
+    "we": (("ウエ", 0.5),),
+    "wi": (("ウイ", 0.5),),  # ウイスキー
+    "wo": (("ウオ", 1.0), ("オ", 1.5)),
+    "fi": (("フイ", 1.5),),
+    "ye": (("エ", 1.0),),
+}
+
+
+def _withV(kana):
+    """`kana`, starting with a katakana of the バ row, with ヴ instead."""
+    if kana[1:2] in ("ャ", "ュ", "ョ"):
+        return "ヴ" + kana[1:]
+    return {"バ": "ヴァ", "ビ": "ヴィ", "ブ": "ヴ", "ベ": "ヴェ", "ボ": "ヴォ"}[kana[0]] + kana[1:]
+
+
+# House styles: the prekana whose katakana differ from `prekana_to_kana`.
+style_overrides = {
+    "default": {},
+    # Older loanwords: ウイスキー, チケット, ラジオ, クイーン, スイッチ.
+    "traditional": {
+        "wi": "ウイ",
+        "we": "ウエ",
+        "wo": "ウオ",
+        "ye": "イエ",
+        "ti": "チ",
+        "di": "ジ",
+        "tu": "ツ",
+        "du": "ド",
+        "dya": "ジャ",
+        "dyo": "ジョ",
+        "dyu": "ジュ",
+        "kwa": "クワ",
+        "kwi": "クイ",
+        "kwe": "クエ",
+        "kwo": "クオ",
+        "swi": "スイ",
+        "swe": "スエ",
+    },
+    # What the JTCA guideline (db/jtca.sql) mostly does: ウオッチ, クエスチョン
+    # and クオリティー in full size, but ウィザード, ウェブ, ティ and ディ.
+    "jtca": {"wo": "ウオ", "kwe": "クエ", "kwo": "クオ"},
+    # ヴ for V: ヴァイオリン, ヴィデオ.
+    "modern-v": {p: _withV(kana) for p, kana in prekana_to_kana.items() if p[0] == "V"},
+}
+
+# Every style compiled into a full prekana -> katakana table, once.
+styles = {
+    name: {**prekana_to_kana, **overrides}
+    for name, overrides in style_overrides.items()
+}
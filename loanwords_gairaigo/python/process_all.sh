@@ -2,10 +2,13 @@
 # Process all the data resources.
 
 # Type 1 resources.
+python3 jtca_to_db.py && \
+python3 lrec_to_db.py && \
 python3 jmdict.py && \
 python3 wikipedia.py
 
 # Type 2 resources.
+python3 britfone_to_db.py && \
 python3 britfone_to_kana.py && \
 python3 cmu_to_db.py && \
 python3 cmu_to_kana.py && \
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Timing and profiling hooks shared by the pipeline scripts.
+
+Every stage script accepts `--profile`, which runs the stage under cProfile,
+writes `<stage>.prof` (for pstats/snakeviz) and `<stage>.collapsed` (for
+flamegraph.pl/speedscope) and prints a per-phase breakdown on exit.
+
+Sub-phases are marked with `with phase("parse"): ...`. While profiling is off,
+`phase` hands back a shared do-nothing context manager, so nothing is timed or
+recorded.
+cProfile, pstats and argparse are only imported by the functions that use
+them, so importing a module that marks phases costs next to nothing.
+"""
+
+import sys
+import time
+import atexit
+from pathlib import Path
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+if __package__:
+    from . import progress
+else:
+    import progress
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+PROFILE_DIR = ROOT_DIR / "profiles"
+
+enabled = False
+
+_NULL_PHASE = nullcontext()
+_totals = defaultdict(float)
+_counts = defaultdict(int)
+_wall = {}
+
+
+class _Phase:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _totals[self.name] += time.perf_counter() - self.start
+        _counts[self.name] += 1
+        return False
+
+
+def phase(name):
+    """Time the enclosed block under `name` (a no-op unless profiling)."""
+    return _Phase(name) if enabled else _NULL_PHASE
+
+
+def report(stream=None):
+    """Print the accumulated per-phase timings, slowest first."""
+    if not _totals:
+        return
+    stream = stream or sys.stderr
+    overall = sum(_wall.values()) or sum(_totals.values())
+    stream.write(f"{'phase':<20}{'calls':>12}{'seconds':>12}{'share':>8}\n")
+    for name, total in sorted(_totals.items(), key=lambda kv: -kv[1]):
+        share = total / overall if overall else 0.0
+        stream.write(f"{name:<20}{_counts[name]:>12}{total:>12.3f}{share:>8.1%}\n")
+    stream.flush()
+
+
+def _label(func):
+    filename, lineno, name = func
+    return f"{Path(filename).name}:{name}:{lineno}".replace(";", ",")
+
+
+def write_collapsed(stats, path):
+    """Write cProfile data as collapsed stacks ("a;b;c <microseconds>").
+
+    cProfile only records caller/callee pairs, so full stacks are rebuilt by
+    walking down from the root functions and splitting each function's time
+    across its callers in proportion to their cumulative time.
+    """
+    callees = defaultdict(dict)
+    roots = []
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        if not callers:
+            roots.append(func)
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    lines = defaultdict(float)
+
+    def walk(func, path, budget):
+        _, _, own, cumulative, _ = stats.stats[func]
+        if cumulative <= 0 or len(path) > 64:
+            return
+        scale = min(1.0, budget / cumulative)
+        stack = path + (_label(func),)
+        lines[";".join(stack)] += own * scale
+        for callee, edge_time in callees[func].items():
+            if _label(callee) not in stack:
+                walk(callee, stack, edge_time * scale)
+
+    for root in roots:
+        walk(root, (), stats.stats[root][3])
+
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, seconds in sorted(lines.items()):
+            micros = int(seconds * 1e6)
+            if micros:
+                f.write(f"{stack} {micros}\n")
+
+
+def stage_parser(description=None):
+    """Argument parser with the options common to every stage script."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="run under cProfile and print a per-phase timing breakdown",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=PROFILE_DIR,
+        help=f"where to write .prof/.collapsed output (default: {PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="do not report progress on stderr",
+    )
+    return parser
+
+
+@contextmanager
+def profiled(stage, args):
+    """Run the enclosed stage under cProfile if `args.profile` is set."""
+    global enabled
+    progress.enabled = not getattr(args, "no_progress", False)
+    if not args.profile:
+        yield
+        return
+
+    import pstats
+    import cProfile
+
+    enabled = True
+    atexit.register(report)
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _wall[stage] = time.perf_counter() - start
+        args.profile_dir.mkdir(parents=True, exist_ok=True)
+        prof_path = args.profile_dir / f"{stage}.prof"
+        collapsed_path = args.profile_dir / f"{stage}.collapsed"
+        profiler.dump_stats(str(prof_path))
+        write_collapsed(pstats.Stats(profiler), collapsed_path)
+        sys.stderr.write(
+            f"{stage}: {_wall[stage]:.3f}s, "
+            f"profile written to {prof_path} and {collapsed_path}\n"
+        )
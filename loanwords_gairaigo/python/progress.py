@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A throttled progress line for the long-running stages.
+
+Instead of writing (and flushing) stdout for every entry or page, a stage
+counts its items with `Progress.update` and a single status line on stderr is
+redrawn at most every `interval` seconds, with rates, matched counts and, when
+the total is known, an ETA. On a terminal the line is redrawn in place;
+otherwise a new line is written every few seconds.
+
+`--no-progress` turns it off, in which case `progress` hands back a shared
+do-nothing object, as `profiling.phase` does.
+"""
+
+import sys
+import time
+
+enabled = True
+
+INTERVAL = 0.25
+PIPE_INTERVAL = 10.0
+
+
+def _human(n):
+    for unit in ("", "k", "M", "G"):
+        if abs(n) < 1000:
+            return f"{n:.1f}{unit}" if unit else f"{n:.0f}"
+        n /= 1000
+    return f"{n:.1f}T"
+
+
+def _duration(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class Progress:
+    """Counts of items (and bytes) processed, reported a few times a second."""
+
+    def __init__(self, label, total=None, total_bytes=None, offset=0, stream=None):
+        self.label = label
+        self.total = total
+        self.total_bytes = total_bytes
+        self.stream = stream or sys.stderr
+        self.tty = self.stream.isatty()
+        self.interval = INTERVAL if self.tty else PIPE_INTERVAL
+        self.count = 0
+        self.matched = 0
+        # Where a resumed scan started, so byte rates only count this run.
+        self.offset = self.position = offset
+        self.start = time.monotonic()
+        self._next = self.start + self.interval
+
+    def update(self, n=1, matched=0, position=None):
+        """Count `n` more items, `matched` of them kept; `position` is in bytes."""
+        self.count += n
+        self.matched += matched
+        if position is not None:
+            self.position = position
+        now = time.monotonic()
+        if now >= self._next:
+            self._next = now + self.interval
+            self._render(now)
+
+    def _render(self, now, final=False):
+        elapsed = max(now - self.start, 1e-9)
+        rate = self.count / elapsed
+        parts = [f"{self.label}: {_human(self.count)} ({_human(rate)}/s)"]
+        if self.matched:
+            parts.append(f"{_human(self.matched)} matched")
+        remaining = None
+        if self.total_bytes:
+            byte_rate = (self.position - self.offset) / elapsed
+            parts.append(
+                f"{self.position / self.total_bytes:.1%} of "
+                f"{_human(self.total_bytes)}B ({_human(byte_rate)}B/s)"
+            )
+            if byte_rate:
+                remaining = (self.total_bytes - self.position) / byte_rate
+        elif self.total:
+            parts.append(f"{self.count / self.total:.1%} of {_human(self.total)}")
+            if rate:
+                remaining = (self.total - self.count) / rate
+        if remaining is not None and not final:
+            parts.append(f"ETA {_duration(remaining)}")
+        else:
+            parts.append(f"elapsed {_duration(elapsed)}")
+        line = ", ".join(parts)
+        if self.tty:
+            self.stream.write(f"\r\x1b[K{line}" + ("\n" if final else ""))
+        else:
+            self.stream.write(line + "\n")
+        self.stream.flush()
+
+    def close(self):
+        """Write the final counts."""
+        self._render(time.monotonic(), final=True)
+
+
+class _NullProgress:
+    __slots__ = ()
+
+    def update(self, n=1, matched=0, position=None):
+        pass
+
+    def close(self):
+        pass
+
+
+_NULL_PROGRESS = _NullProgress()
+
+
+def progress(label, total=None, total_bytes=None, offset=0):
+    """A `Progress` for `label` (a no-op if progress is turned off)."""
+    if not enabled:
+        return _NULL_PROGRESS
+    return Progress(label, total, total_bytes, offset)
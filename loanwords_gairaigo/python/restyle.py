@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Render the stored prekana in a house style, without running the stages again.
+
+A style only changes the katakana of a few prekana syllables
+(`prekana_map.style_overrides`), and the `rule_index` of every transcription
+stage records which entries went through which syllables, so the entries a
+style can change are found with one join and only those are transcribed
+again, in batches. Where a changed entry is the one its word's `merged` row
+came from, the styled katakana goes into `merged_styles`, which
+`Lexicon.lookup(word, style=...)` reads.
+
+    python restyle.py STYLE [STYLE ...]
+
+A stage database without a rule index, such as one loaded from the shipped
+`britfone.sql`, has all its entries rendered instead.
+
+Entries transcribed before V had a prekana of its own (V rather than b) need
+their stage run once more for the modern-v style to find them; the
+`hand_mapping` of `britfone.sql` already has it.
+"""
+
+import sqlite3
+from pathlib import Path
+
+from prekana_map import style_overrides
+from rule_index import (
+    DB_DIR,
+    MERGED_DB,
+    STAGES,
+    affectedEntries,
+    mergedUpdates,
+    stageRows,
+)
+from profiling import phase, profiled, stage_parser
+
+
+def restyled(conn, stage, keys, engine, style):
+    """(key, tie-break, english, prekana, final, styled final) of the `keys`
+    entries whose katakana differ in `style`."""
+    changes = []
+    for key, tie_break, english, prekana, final in stageRows(conn, stage, keys):
+        if prekana is None:
+            continue
+        styled = engine.kana(prekana, english, style=style)
+        if styled != final:
+            changes.append((key, tie_break, english, prekana, final, styled))
+    return changes
+
+
+def writeStyle(style, updates, path=MERGED_DB):
+    """Replace the `merged_styles` rows of `style`; the number written."""
+    if not Path(path).exists():
+        return 0
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(merged);")}
+        if "source" not in columns:
+            print("merged has no source column, rebuild it with merge_engine.py.")
+            return 0
+        conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS
+                    merged_styles (
+                        style TEXT,
+                        english TEXT,
+                        japanese TEXT,
+                        PRIMARY KEY (style, english)
+                    )
+                WITHOUT ROWID
+                ;
+            """
+        )
+        conn.execute("DELETE FROM merged_styles WHERE style = ?;", (style,))
+        # Only where `merged` still has what the stage gave.
+        written = conn.executemany(
+            """
+                INSERT OR REPLACE INTO
+                    merged_styles
+                SELECT
+                    ?,
+                    english,
+                    ?
+                FROM
+                    merged
+                WHERE
+                    english = ?
+                AND
+                    source = ?
+                AND
+                    japanese = ?
+                ;
+            """,
+            ((style, new, word, source, old) for new, word, source, old in updates),
+        ).rowcount
+    conn.close()
+    return written
+
+
+def main(args):
+    from cmu_to_kana import engine
+
+    for style in args.styles:
+        changed = {f"prekana:{p}" for p in style_overrides[style]}
+        updates = []
+        for stage in STAGES:
+            path = args.db_dir / stage.db
+            if not path.exists():
+                continue
+            with sqlite3.connect(str(path.resolve())) as conn:
+                tables = {
+                    name
+                    for (name,) in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'table';"
+                    )
+                }
+                with phase("affected"):
+                    if "rule_index" in tables:
+                        keys = affectedEntries(conn, stage, changed, {})
+                    else:
+                        # Loaded from a dump (britfone.sql): try every entry.
+                        keys = [
+                            key
+                            for (key,) in conn.execute(
+                                f"SELECT {stage.key} FROM {stage.table};"
+                            )
+                        ]
+                with phase("transcribe"):
+                    changes = restyled(conn, stage, keys, engine, style)
+                with phase("merged"):
+                    updates.extend(mergedUpdates(stage, changes, conn))
+            conn.close()
+            print(
+                f"{style}: {stage.name} has {len(keys)} entries with restyled "
+                f"syllables, {len(changes)} of them changed."
+            )
+        with phase("write"):
+            written = writeStyle(style, updates, args.db_dir / MERGED_DB.name)
+        print(f"{style}: {written} merged words restyled.")
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument("styles", nargs="+", choices=list(style_overrides))
+    parser.add_argument(
+        "--db-dir", type=Path, default=DB_DIR, help="where the databases are"
+    )
+    args = parser.parse_args()
+    with profiled("restyle", args):
+        main(args)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Reverse (katakana to English) index over the merged table.
+
+Transcriptions of the same word vary between sources (ヴ/ブ, ウィ/ウイ, ウェ/ウエ,
+trailing ー, ・ separators, ...). Each katakana string is folded into a
+canonical key: single-character rules go through one precompiled
+`str.translate` table, multi-character ones through one precompiled regex.
+Lookups are then a fold plus one dict access.
+"""
+
+import re
+import time
+import sqlite3
+import argparse
+import unicodedata
+from pathlib import Path
+from collections import defaultdict
+
+if __package__:
+    from . import snapshot
+else:
+    import snapshot
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+MERGED_DB = DB_DIR / "merged.db"
+
+# One character to one character (or to nothing). Hiragana fold to katakana.
+fold_table = str.maketrans(
+    {
+        **{chr(c): chr(c + 0x60) for c in range(0x3041, 0x3097)},
+        "ヂ": "ジ",
+        "ヅ": "ズ",
+        "ヰ": "イ",
+        "ヱ": "エ",
+        "ヲ": "オ",
+        "ヵ": "カ",
+        "ヶ": "ケ",
+        "ヷ": "バ",
+        "ヸ": "ビ",
+        "ヹ": "ベ",
+        "ヺ": "ボ",
+        "・": None,
+        "＝": None,
+        "=": None,
+        " ": None,
+        "　": None,
+    }
+)
+
+# Several characters to one or more (longest first so ヴァ wins over ヴ).
+contractions = {
+    "ヴァ": "バ",
+    "ヴィ": "ビ",
+    "ヴェ": "ベ",
+    "ヴォ": "ボ",
+    "ヴュ": "ビュ",
+    "ヴ": "ブ",
+    "ウィ": "ウイ",
+    "ウェ": "ウエ",
+    "ウォ": "ウオ",
+}
+contraction_regex = re.compile(
+    "|".join(sorted(map(re.escape, contractions), key=len, reverse=True))
+)
+
+long_vowels = re.compile(r"ー{2,}")
+
+
+def _contract(match):
+    return contractions[match.group(0)]
+
+
+def canonical_kana(s):
+    """Fold a katakana string into the key used by the reverse index."""
+    s = unicodedata.normalize("NFKC", s).translate(fold_table)
+    s = contraction_regex.sub(_contract, s)
+    return long_vowels.sub("ー", s).rstrip("ー")
+
+
+class ReverseIndex:
+    """All English entries whose katakana fold to the same canonical key."""
+
+    def __init__(self, pairs):
+        start = time.perf_counter()
+        index = defaultdict(list)
+        for eng, jap in pairs:
+            if jap:
+                index[canonical_kana(jap)].append(eng)
+        self.index = {key: tuple(engs) for key, engs in index.items()}
+        self.build_seconds = time.perf_counter() - start
+
+    @classmethod
+    def from_db(cls, path=MERGED_DB):
+        with sqlite3.connect(str(Path(path).resolve())) as conn:
+            pairs = conn.execute(
+                """
+                    SELECT
+                        english,
+                        japanese
+                    FROM
+                        merged
+                    ;
+                """
+            ).fetchall()
+        conn.close()
+        return cls(pairs)
+
+    @classmethod
+    def from_snapshot(cls, path=MERGED_DB):
+        """Load the index from its snapshot, rebuilding it if `path` changed.
+
+        This file is stamped too, so editing `fold_table`, `contractions` or
+        `canonical_kana` also rebuilds it.
+        """
+        start = time.perf_counter()
+        index = cls.__new__(cls)
+        index.index = snapshot.load(
+            "reverse_index", [path, __file__], lambda: cls.from_db(path).index
+        )
+        index.build_seconds = time.perf_counter() - start
+        return index
+
+    def lookup(self, kana):
+        """Every English entry transcribed as (a variant of) `kana`."""
+        return self.index.get(canonical_kana(kana), ())
+
+    def report(self):
+        return f"{len(self.index)} canonical keys, built in {self.build_seconds:.2f}s"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("kana", nargs="+", help="katakana strings to look up")
+    parser.add_argument("--db", type=Path, default=MERGED_DB)
+    args = parser.parse_args()
+
+    index = ReverseIndex.from_snapshot(args.db)
+    print(index.report())
+    for kana in args.kana:
+        start = time.perf_counter()
+        results = index.lookup(kana)
+        micros = (time.perf_counter() - start) * 1e6
+        print(
+            f"{kana} -> {canonical_kana(kana)} ({micros:.1f} µs): {', '.join(results)}"
+        )
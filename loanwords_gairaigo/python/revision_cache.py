@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Remember what was extracted from each dump page, keyed by its revision.
+
+Most pages are unchanged between monthly Wikimedia dumps. The scanners look up
+(pageid, revision sha1) here before running their regexes and only extract
+pages whose revision is new. Each entry also stores how long extraction took,
+which gives the time saved by every hit.
+
+Entries also record a hash of the scanner's source files (see
+`transcription_cache.rules_version`), and opening the cache deletes the
+scanner's entries from any other version, so editing a scanner's regexes
+quietly re-extracts every page.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+from transcription_cache import rules_version
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+REVISION_CACHE_DB_PATH = DB_DIR / "revision_cache.db"
+
+FLUSH_EVERY = 4096
+
+
+def getRevision(page, revision_tag, sha1_tag, id_tag):
+    """The page's revision sha1, falling back to the revision id."""
+    revision = page.find(revision_tag)
+    if revision is None:
+        return None
+    sha1 = revision.find(sha1_tag)
+    if sha1 is not None and sha1.text:
+        return sha1.text
+    revision_id = revision.find(id_tag)
+    return revision_id.text if revision_id is not None else None
+
+
+class RevisionCache:
+    """Extraction results of one scanner, keyed by (pageid, revision)."""
+
+    def __init__(self, scanner, sources=(), path=REVISION_CACHE_DB_PATH):
+        self.scanner = scanner
+        self.extractor = rules_version(sources=sources)
+        self.conn = sqlite3.connect(str(Path(path).resolve()), timeout=60)
+        columns = [
+            row[1] for row in self.conn.execute("PRAGMA table_info(extractions);")
+        ]
+        with self.conn:
+            if columns and "extractor" not in columns:
+                # Written before entries were versioned: nothing to keep.
+                self.conn.execute("DROP TABLE extractions;")
+            self.conn.execute(
+                """
+                    CREATE TABLE IF NOT EXISTS
+                        extractions (
+                            scanner TEXT,
+                            pageid INTEGER,
+                            revision TEXT,
+                            extractor TEXT,
+                            result TEXT,
+                            seconds REAL,
+                            PRIMARY KEY (scanner, pageid)
+                        )
+                    ;
+                """
+            )
+            self.conn.execute(
+                """
+                    DELETE FROM
+                        extractions
+                    WHERE
+                        scanner = ?
+                    AND
+                        extractor != ?
+                    ;
+                """,
+                (self.scanner, self.extractor),
+            )
+        self._pending = []
+        self.hits = self.misses = 0
+        self.saved = 0.0
+
+    def get(self, pageid, revision):
+        """The cached result for this revision of the page, or None."""
+        if revision is None:
+            self.misses += 1
+            return None
+        row = self.conn.execute(
+            """
+                SELECT
+                    result,
+                    seconds
+                FROM
+                    extractions
+                WHERE
+                    scanner = ?
+                AND
+                    pageid = ?
+                AND
+                    revision = ?
+                AND
+                    extractor = ?
+                ;
+            """,
+            (self.scanner, pageid, revision, self.extractor),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.saved += row[1]
+        return json.loads(row[0])
+
+    def put(self, pageid, revision, result, seconds):
+        """Store a list of extracted values for this revision of the page."""
+        if revision is None:
+            return
+        self._pending.append(
+            (
+                self.scanner,
+                pageid,
+                revision,
+                self.extractor,
+                json.dumps(result),
+                seconds,
+            )
+        )
+        if len(self._pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self.conn:
+            self.conn.executemany(
+                """
+                    INSERT OR REPLACE INTO
+                        extractions (
+                            scanner,
+                            pageid,
+                            revision,
+                            extractor,
+                            result,
+                            seconds
+                        )
+                    VALUES
+                        (?, ?, ?, ?, ?, ?)
+                    ;
+                """,
+                self._pending,
+            )
+        self._pending = []
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def report(self):
+        total = self.hits + self.misses
+        rate = self.hits / total if total else 0.0
+        return (
+            f"{self.scanner} revision cache: {self.hits}/{total} hits ({rate:.1%}), "
+            f"{self.saved:.2f}s of extraction saved"
+        )
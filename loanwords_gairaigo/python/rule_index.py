@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Re-transcribe only the entries affected by a change to the rule tables.
+
+While `britfone_to_kana.py`, `cmu_to_kana.py` and `wiktionary_to_kana.py` run,
+they record in their database which prekana syllables (`prekana_to_kana`
+entries) and spelling rules (`SPELLING_RULES`) every entry went through, in
+`rule_index`, along with the definition of every rule at the time, in
+`rule_tables`.
+
+Running this script afterwards compares those definitions with the current
+ones. The entries that used a changed rule, and for spelling rules those whose
+English has the rule's affixes, are transcribed again from their stored
+prekana, and `hand_mapping` (or `wiktionary`), `type_2` and `merged` are
+patched in place where the output changed.
+
+Changes to the phone inventories (`cmu_utils.py`, `britfone_utils.py`) or to
+the engine itself change the prekana, so they still need the stages to be run
+again.
+"""
+
+import sys
+import json
+import sqlite3
+from pathlib import Path
+from collections import namedtuple
+
+if __package__:
+    from .prekana_map import prekana_to_kana
+    from .transcription_engine import SPELLING_RULES
+    from .profiling import phase, profiled, stage_parser
+else:
+    from prekana_map import prekana_to_kana
+    from transcription_engine import SPELLING_RULES
+    from profiling import phase, profiled, stage_parser
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+TYPE_2_DB = DB_DIR / "type_2.db"
+MERGED_DB = DB_DIR / "merged.db"
+
+# Keys per `IN (...)` query, within SQLite's old limit of 999 variables.
+READ_BATCH = 500
+WRITE_BATCH = 10_000
+
+# Where each transcription stage keeps its entries: `key` identifies a row of
+# `table`, `english` is the spelling the stage passed to the engine and
+# `tie_break` orders rows with the same word, as in `merge_engine.SOURCES`.
+Stage = namedtuple("Stage", ["name", "db", "table", "key", "english", "tie_break"])
+
+STAGES = (
+    Stage("britfone", "britfone.db", "hand_mapping", "english", "english", "rowid"),
+    Stage("cmudict", "cmudict.db", "hand_mapping", "english", "english", "rowid"),
+    Stage(
+        "wiktionary", "wiktionary.db", "wiktionary", "pageid", "UPPER(title)", "pageid"
+    ),
+)
+
+
+def ruleDefinitions():
+    """Rule name -> JSON definition for every prekana syllable and spelling rule."""
+    definitions = {
+        f"prekana:{prekana}": json.dumps(kana, ensure_ascii=False)
+        for prekana, kana in prekana_to_kana.items()
+    }
+    for group in SPELLING_RULES:
+        for position, r in enumerate(group.rules):
+            definitions[f"spelling:{r.name}"] = json.dumps(
+                [group.name, group.skip, position, r._replace(words=sorted(r.words))],
+                ensure_ascii=False,
+            )
+    return definitions
+
+
+class RuleIndex:
+    """Records the rules used by every entry of a stage as it is transcribed."""
+
+    def __init__(self, conn, reset=True):
+        self.conn = conn
+        self.batch = []
+        if not reset:
+            return
+        conn.execute("DROP TABLE IF EXISTS rule_index;")
+        conn.execute(
+            """
+                CREATE TABLE
+                    rule_index (
+                        rule TEXT,
+                        entry,
+                        PRIMARY KEY (rule, entry)
+                    )
+                WITHOUT ROWID
+                ;
+            """
+        )
+        conn.execute("CREATE INDEX rule_index_entry ON rule_index (entry);")
+
+    def add(self, entry, used):
+        """Record that `entry` went through the rules named in `used`."""
+        self.batch.extend((rule, entry) for rule in set(used))
+        if len(self.batch) >= WRITE_BATCH:
+            self.flush()
+
+    def remove(self, entries):
+        self.conn.executemany(
+            "DELETE FROM rule_index WHERE entry = ?;", ((e,) for e in entries)
+        )
+
+    def flush(self):
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO rule_index VALUES ( ?, ? );", self.batch
+        )
+        self.batch = []
+
+    def close(self):
+        """Write what is left and the definitions the entries were made with."""
+        self.flush()
+        self.conn.execute("DROP TABLE IF EXISTS rule_tables;")
+        self.conn.execute(
+            """
+                CREATE TABLE
+                    rule_tables (
+                        rule TEXT PRIMARY KEY,
+                        definition TEXT
+                    )
+                ;
+            """
+        )
+        self.conn.executemany(
+            "INSERT INTO rule_tables VALUES ( ?, ? );", ruleDefinitions().items()
+        )
+
+
+def changedRules(conn):
+    """Rules whose definition differs from when `conn` was built, and the old ones."""
+    old = dict(conn.execute("SELECT rule, definition FROM rule_tables;"))
+    new = ruleDefinitions()
+    return {
+        rule for rule in old.keys() | new.keys() if old.get(rule) != new.get(rule)
+    }, old
+
+
+def _affixes(definition):
+    """(at_start, English affixes) of a spelling rule definition."""
+    rule = json.loads(definition)[3]
+    return rule[1], rule[2]
+
+
+def affectedEntries(conn, stage, changed, old):
+    """Keys of the entries that may transcribe differently under `changed`."""
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS changed_rules (rule TEXT);")
+    conn.execute("DELETE FROM changed_rules;")
+    conn.executemany("INSERT INTO changed_rules VALUES ( ? );", ((r,) for r in changed))
+    keys = {
+        key
+        for (key,) in conn.execute(
+            """
+                SELECT DISTINCT
+                    entry
+                FROM
+                    rule_index
+                    JOIN changed_rules
+                        USING (rule)
+                ;
+            """
+        )
+    }
+    # A changed spelling rule can start (or stop) applying to words that no
+    # rule applied to before; those are found by their spelling.
+    new = ruleDefinitions()
+    patterns = set()
+    for rule in changed:
+        if not rule.startswith("spelling:"):
+            continue
+        for definition in (old.get(rule), new.get(rule)):
+            if definition is not None:
+                at_start, affixes = _affixes(definition)
+                # Parentheticals such as (1) are removed before matching.
+                patterns.update(a + "%" if at_start else "%" + a + "%" for a in affixes)
+    for pattern in patterns:
+        keys.update(
+            key
+            for (key,) in conn.execute(
+                f"""
+                    SELECT
+                        {stage.key}
+                    FROM
+                        {stage.table}
+                    WHERE
+                        {stage.english} LIKE ?
+                    ;
+                """,
+                (pattern,),
+            )
+        )
+    return keys
+
+
+def stageRows(conn, stage, keys):
+    """(key, tie-break, english, prekana, final) of the `keys` entries of
+    `stage`, read `READ_BATCH` keys at a time."""
+    keys = list(keys)
+    for start in range(0, len(keys), READ_BATCH):
+        chunk = keys[start : start + READ_BATCH]
+        yield from conn.execute(
+            f"""
+                SELECT
+                    {stage.key},
+                    {stage.tie_break},
+                    {stage.english},
+                    prekana,
+                    final
+                FROM
+                    {stage.table}
+                WHERE
+                    {stage.key} IN ({", ".join("?" * len(chunk))})
+                ;
+            """,
+            chunk,
+        ).fetchall()
+
+
+def retranscribe(conn, stage, keys, engine):
+    """Transcribe the `keys` entries again from their prekana and update them.
+
+    Returns (key, tie-break, english, prekana, old final, new final) for those
+    that changed.
+    """
+    index = RuleIndex(conn, reset=False)
+    changes = []
+    keys = list(keys)
+    index.remove(keys)
+    for key, tie_break, english, prekana, final in stageRows(conn, stage, keys):
+        if prekana is None:
+            continue
+        used = []
+        new_final = engine.kana(prekana, english, used)
+        index.add(key, used)
+        if new_final != final:
+            changes.append((key, tie_break, english, prekana, final, new_final))
+    index.flush()
+
+    conn.executemany(
+        f"""
+            UPDATE
+                {stage.table}
+            SET
+                transcription = ?,
+                final = ?
+            WHERE
+                {stage.key} = ?
+            ;
+        """,
+        ((engine.kana(p), new, key) for key, _, _, p, _, new in changes),
+    )
+    return changes
+
+
+def patchType2(changes, path=TYPE_2_DB):
+    """Update the `type_2` rows that came from the changed entries."""
+    if not Path(path).exists():
+        return 0
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        # Only where the old output won; a higher-priority stage with the same
+        # prekana and English changes in the same way anyway.
+        patched = conn.executemany(
+            """
+                UPDATE
+                    type_2
+                SET
+                    final = ?
+                WHERE
+                    english = ?
+                AND
+                    prekana = ?
+                AND
+                    final = ?
+                ;
+            """,
+            ((new, eng, p, old) for _, _, eng, p, old, new in changes),
+        ).rowcount
+    conn.close()
+    return patched
+
+
+def mergedUpdates(stage, changes, stage_conn):
+    """(new katakana, word, source, old katakana) of the `merged` rows that
+    `stage` won with the changed entries.
+
+    A word's row in `merged` came from the first of the stage's entries for
+    that word (by tie-break), so other entries for the same word, such as the
+    WORD(2) of WORD(1), are left alone even when they had the same katakana.
+    """
+    if str(DB_DIR) not in sys.path:
+        sys.path.insert(0, str(DB_DIR))
+    from merge_clean_db import norm_en, norm_ja, whitespace, jap_whitespace
+    from merge_engine import letter_fixes
+
+    first = {}
+    for tie_break, eng in stage_conn.execute(
+        f"SELECT {stage.tie_break}, {stage.english} FROM {stage.table};"
+    ):
+        word = norm_en(eng) if eng else ""
+        if word and (word not in first or tie_break < first[word]):
+            first[word] = tie_break
+
+    updates = []
+    for _, tie_break, eng, _, old, new in changes:
+        words = whitespace.split(norm_en(eng).strip())
+        old_words = jap_whitespace.split(norm_ja(old).strip())
+        new_words = jap_whitespace.split(norm_ja(new).strip())
+        if len(words) == len(old_words) == len(new_words):
+            updates.extend(
+                (n, w, stage.name, o)
+                for w, o, n in zip(words, old_words, new_words)
+                if first.get(w) == tie_break and w not in letter_fixes and o != n
+            )
+    return updates
+
+
+def patchMerged(stage, changes, stage_conn, path=MERGED_DB):
+    """Update the `merged` rows that `stage` won with the changed entries."""
+    if not changes or not Path(path).exists():
+        return 0
+
+    updates = mergedUpdates(stage, changes, stage_conn)
+    with sqlite3.connect(str(Path(path).resolve())) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(merged);")}
+        if "source" not in columns:
+            print("merged has no source column, rebuild it with merge_engine.py.")
+            return 0
+        patched = conn.executemany(
+            """
+                UPDATE
+                    merged
+                SET
+                    japanese = ?
+                WHERE
+                    english = ?
+                AND
+                    source = ?
+                AND
+                    japanese = ?
+                ;
+            """,
+            updates,
+        ).rowcount
+    conn.close()
+    return patched
+
+
+def main(args):
+    from cmu_to_kana import engine
+
+    for stage in STAGES:
+        path = args.db_dir / stage.db
+        if not path.exists():
+            continue
+        with sqlite3.connect(str(path.resolve())) as conn:
+            tables = {
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table';"
+                )
+            }
+            if "rule_tables" not in tables:
+                print(f"{stage.name}: no rule index, run the stage once first.")
+                continue
+            with phase("diff"):
+                changed, old = changedRules(conn)
+            if not changed:
+                print(f"{stage.name}: up to date.")
+                continue
+            with phase("affected"):
+                keys = affectedEntries(conn, stage, changed, old)
+            with phase("transcribe"):
+                changes = retranscribe(conn, stage, keys, engine)
+            with phase("write"):
+                type_2 = patchType2(changes, args.db_dir / TYPE_2_DB.name)
+                merged = patchMerged(stage, changes, conn, args.db_dir / MERGED_DB.name)
+                RuleIndex(conn, reset=False).close()
+        conn.close()
+        print(
+            f"{stage.name}: {len(changed)} rules changed, {len(keys)} entries "
+            f"re-transcribed, {len(changes)} changed; patched {type_2} type_2 and "
+            f"{merged} merged rows."
+        )
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument(
+        "--db-dir", type=Path, default=DB_DIR, help="where the databases are"
+    )
+    args = parser.parse_args()
+    with profiled("rule_index", args):
+        main(args)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Marshal snapshots of tables computed from the databases.
+
+Building, e.g., the reverse index means reading and folding every row of
+`merged`. The result is saved next to the databases with a stamp of the files
+it was built from (path, size, modification time); later runs load it with a
+single `marshal.load` and only rebuild when a source file changes.
+"""
+
+import os
+import marshal
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SNAPSHOT_DIR = ROOT_DIR / "db"
+
+
+def _stamp(sources, version):
+    stamp = [version]
+    for source in sources:
+        stat = os.stat(source)
+        stamp.append((str(Path(source).resolve()), stat.st_size, stat.st_mtime_ns))
+    return tuple(stamp)
+
+
+def load(name, sources, build, version=1, snapshot_dir=SNAPSHOT_DIR):
+    """The table saved as `name`, or `build()` (saved for next time) if stale.
+
+    The table must be marshallable: nested dicts, lists, tuples, strings and
+    numbers. Bump `version` whenever `build` changes.
+    """
+    path = Path(snapshot_dir) / f"{name}.snapshot"
+    stamp = _stamp(sources, version)
+    try:
+        # One read and one loads: marshal.load on a file object reads in
+        # small pieces and is several times slower.
+        saved_stamp, table = marshal.loads(path.read_bytes())
+        if saved_stamp == stamp:
+            return table
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    table = build()
+    tmp = path.with_suffix(f".tmp{os.getpid()}")
+    tmp.write_bytes(marshal.dumps((stamp, table)))
+    os.replace(tmp, path)
+    return table
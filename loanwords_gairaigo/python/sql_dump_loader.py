@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Read the rows of the shipped SQL dumps (`db/merged.sql`, `db/britfone.sql`,
+...) straight into memory, without a database.
+
+The dumps are one `INSERT INTO "table" VALUES (...);` statement per row. The
+rows are parsed as the file streams by, and only the tables asked for are
+parsed at all:
+
+    from reverse_index import ReverseIndex
+    index = ReverseIndex(pairs("merged.sql", "merged"))
+
+To get a dump into a database, replay it (`sqlite3 db < dump` or
+`executescript`): SQLite parses its own statements faster than this module can
+hand it parsed rows.
+"""
+
+import re
+from pathlib import Path
+from collections import defaultdict
+
+from progress import progress
+from profiling import phase, profiled, stage_parser
+
+insert = re.compile(r'^INSERT INTO\s+"?(\w+)"?\s*(?:\([^)]*\)\s*)?VALUES\s*', re.I)
+create_table = re.compile(r'^CREATE TABLE\s+(?:IF NOT EXISTS\s+)?"?(\w+)"?', re.I)
+# One value of a row, with the "(" before it if it starts the row, and what
+# follows it: "," for another value, ")" to end the row.
+value = re.compile(
+    r"""[\s,]*\(?\s*('(?:[^']|'')*'|[Xx]'[0-9A-Fa-f]*'|[^\s,)']+)\s*([,)])"""
+)
+constraints = ("PRIMARY", "UNIQUE", "CHECK", "FOREIGN", "CONSTRAINT")
+
+
+def _number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parseValues(text, start=0):
+    """Yield the rows of `(...), (...)` in `text`, from `start`."""
+    row = []
+    for token, sep in value.findall(text, start):
+        first = token[0]
+        if first == "'":
+            row.append(token[1:-1].replace("''", "'"))
+        elif first in "Xx" and token[1:2] == "'":
+            row.append(bytes.fromhex(token[2:-1]))
+        elif token.upper() == "NULL":
+            row.append(None)
+        else:
+            row.append(_number(token))
+        if sep == ")":
+            yield tuple(row)
+            row = []
+    if row:
+        raise ValueError(f"Cannot parse the values in {text[:80]!r}.")
+
+
+def columnNames(statement):
+    """The column names of a CREATE TABLE statement, in order."""
+    body = statement[statement.index("(") + 1 : statement.rindex(")")]
+    names, depth, field = [], 0, []
+    for c in body + ",":
+        if c == "," and depth == 0:
+            words = "".join(field).split()
+            if words and words[0].upper() not in constraints:
+                names.append(words[0].strip('"`[]'))
+            field = []
+            continue
+        depth += (c == "(") - (c == ")")
+        field.append(c)
+    return names
+
+
+def statements(lines):
+    """Yield the complete statements of a dump, one string each."""
+    pending = []
+    quotes = 0
+    for line in lines:
+        # A statement ends with ";" outside of a string; strings double their
+        # quotes, so the count is odd inside one.
+        if not pending and line.count("'") % 2 == 0 and line.rstrip().endswith(";"):
+            yield line.strip()
+            continue
+        pending.append(line)
+        quotes += line.count("'")
+        if quotes % 2 == 0 and line.rstrip().endswith(";"):
+            yield "".join(pending).strip()
+            pending = []
+            quotes = 0
+    if "".join(pending).strip():
+        yield "".join(pending).strip()
+
+
+def readDump(path, tables=None):
+    """Yield ("create", table, statement) and ("row", table, values) for the
+    dump at `path`.
+
+    Rows of tables not in `tables` (if given) are skipped without parsing.
+    """
+    path = Path(path)
+    lines = progress(f"{path.name} statements", total_bytes=path.stat().st_size)
+    with path.open(encoding="utf-8") as f:
+        for n, statement in enumerate(statements(f)):
+            # Asking the file where it is costs a system call.
+            lines.update(position=f.buffer.tell() if n % 4096 == 0 else None)
+            match = insert.match(statement)
+            if match is not None:
+                if tables is None or match.group(1) in tables:
+                    for row in parseValues(statement, match.end()):
+                        yield "row", match.group(1), row
+                continue
+            match = create_table.match(statement)
+            if match is not None:
+                if tables is None or match.group(1) in tables:
+                    yield "create", match.group(1), statement
+            # Indexes, BEGIN TRANSACTION and COMMIT mean nothing in memory.
+        lines.update(0, position=f.buffer.tell())
+    lines.close()
+
+
+def readTables(path, tables=None):
+    """Table -> (column names, list of rows) for the dump at `path`."""
+    result = {}
+    contents = defaultdict(list)
+    for kind, table, item in readDump(path, tables):
+        if kind == "create":
+            result[table] = columnNames(item)
+        elif kind == "row":
+            contents[table].append(item)
+    return {table: (result.get(table), contents[table]) for table in contents}
+
+
+def pairs(path, table, columns=("english", "japanese")):
+    """Yield the `columns` of every row of `table` in the dump at `path`.
+
+    Ready for `ReverseIndex`, `FuzzyIndex` and the like, e.g. from `merged.sql`.
+    """
+    positions = None
+    for kind, _, item in readDump(path, {table}):
+        if kind == "create":
+            names = columnNames(item)
+            positions = [names.index(c) for c in columns]
+        elif kind == "row":
+            if positions is None:
+                raise ValueError(f"{path} has no CREATE TABLE for {table}.")
+            yield tuple(item[p] for p in positions)
+
+
+if __name__ == "__main__":
+    parser = stage_parser(__doc__)
+    parser.add_argument("dump", type=Path, help="e.g. db/britfone.sql")
+    parser.add_argument(
+        "--table", action="append", dest="tables", help="only these tables"
+    )
+    args = parser.parse_args()
+    with profiled("sql_dump_loader", args):
+        with phase("read"):
+            tables = readTables(args.dump, set(args.tables) if args.tables else None)
+    for table, (columns, rows) in tables.items():
+        print(f"{table}: {len(rows)} rows of {', '.join(columns or ())}")
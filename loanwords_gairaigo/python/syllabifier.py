@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Split pronunciations into syllables by the maximal onset principle.
+
+The onsets and (inflected) codas of `phonotactics.py` are compiled into tries,
+the onsets backwards and the codas forwards, so the consonants between two
+vowels are read at most twice: once back from the second vowel for the legal
+onsets, once on from the first for the legal codas. As many consonants as
+possible go to the onset of the second syllable, as long as what is left is
+a legal coda of the first; if no split is legal both ways, the longest legal
+onset wins.
+
+Run as a script, it compares `Engine.group_by_syllable` with the usual
+`Engine.group_by_cluster`, for speed and for agreement on `test_data` and on
+every CMUdict and Britfone entry.
+"""
+
+import time
+import argparse
+from pathlib import Path
+
+if __package__:
+    from .phonotactics import onsets, codas
+else:
+    from phonotactics import onsets, codas
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+
+_END = "$"
+
+
+def compileTrie(clusters, reverse=False):
+    """Nested dicts of the space-separated `clusters`; `_END` marks an end."""
+    root = {}
+    for cluster in clusters:
+        phones = cluster.split(" ")
+        node = root
+        for phone in reversed(phones) if reverse else phones:
+            node = node.setdefault(phone, {})
+        node[_END] = True
+    return root
+
+
+class Syllabifier:
+    """Maximal onset syllabification over one phone inventory.
+
+    `arpabet` maps the inventory's consonants and semivowels to the ARPAbet
+    of `phonotactics.py` (None if they are ARPAbet already).
+    """
+
+    def __init__(self, vowels, arpabet=None, onsets=onsets, codas=codas):
+        self.vowels = frozenset(vowels)
+        self.arpabet = arpabet
+        self.onsets = compileTrie(onsets, reverse=True)
+        self.codas = compileTrie(codas)
+
+    def split(self, phones, start, end):
+        """Where the consonants `phones[start:end]` between two vowels split."""
+        if end - start < 2:
+            # Most often: no consonant, or one that can start a syllable.
+            if start == end or _END in self.onsets.get(phones[start], ()):
+                return start
+        # Legal onsets, from the longest: walk back from the second vowel.
+        onset_starts = [end]
+        node = self.onsets
+        for i in range(end - 1, start - 1, -1):
+            node = node.get(phones[i])
+            if node is None:
+                break
+            if _END in node:
+                onset_starts.append(i)
+        # Legal codas: walk on from the first vowel.
+        coda_ends = {start}
+        node = self.codas
+        for i in range(start, end):
+            node = node.get(phones[i])
+            if node is None:
+                break
+            if _END in node:
+                coda_ends.add(i + 1)
+        for i in reversed(onset_starts):
+            if i in coda_ends:
+                return i
+        return onset_starts[-1]
+
+    def syllabify(self, phonemes):
+        """(onset, vowel, coda) lists of every syllable of `phonemes`.
+
+        A pronunciation without vowels is one syllable with vowel None.
+        """
+        vowels = self.vowels
+        positions = [i for i, p in enumerate(phonemes) if p in vowels]
+        if not positions:
+            return [(list(phonemes), None, [])]
+        phones = phonemes
+        if self.arpabet is not None:
+            phones = [self.arpabet.get(p, p) for p in phonemes]
+
+        syllables = []
+        onset_start = 0
+        for n, v in enumerate(positions):
+            if n + 1 < len(positions):
+                boundary = self.split(phones, v + 1, positions[n + 1])
+            else:
+                boundary = len(phonemes)
+            syllables.append(
+                (phonemes[onset_start:v], phonemes[v], phonemes[v + 1 : boundary])
+            )
+            onset_start = boundary
+        return syllables
+
+
+def _kana(engine, group, english, pronunciation):
+    """What `engine.kana` makes of `pronunciation` grouped with `group`."""
+    table = engine.symb_to_prekana
+    prekana = " ".join(
+        "".join([table.get(s, s) for s in c]) for c in group(pronunciation.split(" "))
+    )
+    return engine.kana(prekana, english)
+
+
+def _timed(group, pronunciations, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for p in pronunciations:
+            group(p.split(" "))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(engine, entries, repeat=5):
+    """(agreeing, differences, cluster seconds, syllable seconds) of the two
+    groupings over the (english, pronunciation) `entries`."""
+    differences = []
+    for english, p in entries:
+        old = _kana(engine, engine.group_by_cluster, english, p)
+        new = _kana(engine, engine.group_by_syllable, english, p)
+        if old != new:
+            differences.append((english, p, old, new))
+    pronunciations = [p for _, p in entries]
+    return (
+        len(entries) - len(differences),
+        differences,
+        _timed(engine.group_by_cluster, pronunciations, repeat),
+        _timed(engine.group_by_syllable, pronunciations, repeat),
+    )
+
+
+if __name__ == "__main__":
+    import sqlite3
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-dir", type=Path, default=DB_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--show", type=int, default=10, help="differences to show")
+    args = parser.parse_args()
+
+    from cmu_utils import test_data
+    from cmu_to_kana import engine as cmu_engine
+    from britfone_to_kana import engine as britfone_engine
+
+    def unstressed(engine, pronunciation):
+        # As in `Engine.prekana`, stress marks go before grouping.
+        if engine.inventory.stress is None:
+            return pronunciation
+        return engine.inventory.stress.sub("", pronunciation)
+
+    for group in ("group_by_cluster", "group_by_syllable"):
+        agree = 0
+        for english, arpa, expected in test_data:
+            pronunciation = unstressed(cmu_engine, arpa)
+            kana = _kana(cmu_engine, getattr(cmu_engine, group), english, pronunciation)
+            if kana == expected:
+                agree += 1
+            elif group == "group_by_syllable":
+                print(f"    {english} /{arpa}/: {kana}, test_data has {expected}")
+        print(f"test_data: {group} agrees on {agree} of {len(test_data)}.")
+
+    # hand_mapping, as `main` holds the raw dictionary, with extra entries.
+    sources = (
+        ("CMUdict", cmu_engine, "cmudict.db"),
+        ("Britfone", britfone_engine, "britfone.db"),
+    )
+    query = "SELECT english, pronunciation FROM hand_mapping;"
+    for name, engine, db in sources:
+        path = args.db_dir / db
+        if not path.exists():
+            continue
+        with sqlite3.connect(str(path.resolve())) as conn:
+            entries = [(e, unstressed(engine, p)) for e, p in conn.execute(query) if p]
+        conn.close()
+        same, differences, cluster_time, syllable_time = compare(
+            engine, entries, args.repeat
+        )
+        print(
+            f"{name}: the groupings agree on {same} of {len(entries)} "
+            f"({same / len(entries):.2%}); group_by_cluster {cluster_time:.3f}s, "
+            f"group_by_syllable {syllable_time:.3f}s."
+        )
+        for english, p, old, new in differences[: args.show]:
+            print(f"    {english} /{p}/: {old} -> {new}")
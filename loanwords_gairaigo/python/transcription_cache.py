@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A persistent, shareable cache for the phonetic transcription functions.
+
+Results are kept in a sized in-memory LRU tier in front of an SQLite store in
+`db/transcription_cache.db`. The store is opened in WAL mode, so parallel
+workers and repeated builds all read from and add to the same table.
+
+Every entry is keyed by (engine, version, input). The version is a hash of
+the rule tables and source files the engine depends on, so editing, e.g.,
+`symb_to_prekana` or `cmu_to_kana.py` quietly invalidates the old entries.
+"""
+
+import atexit
+import hashlib
+import sqlite3
+from pathlib import Path
+from functools import wraps
+from collections import OrderedDict, namedtuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_DIR = ROOT_DIR / "db"
+CACHE_DB_PATH = DB_DIR / "transcription_cache.db"
+
+DEFAULT_MAXSIZE = 2**17
+FLUSH_EVERY = 4096
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "disk_hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+_MISSING = object()
+
+
+def rules_version(tables=(), sources=()):
+    """Hash the rule tables and source files that an engine's output depends on."""
+    digest = hashlib.sha1()
+    for table in tables:
+        items = table.items() if isinstance(table, dict) else enumerate(table)
+        for key, value in sorted(items, key=lambda kv: repr(kv[0])):
+            digest.update(repr((key, value)).encode("utf-8"))
+        digest.update(b"\x00")
+    for source in sources:
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class TranscriptionCache:
+    """Two-tier (memory, then disk) cache for a single transcription engine.
+
+    Nothing is hashed or opened until the first lookup, so importing a module
+    that defines a cache stays free.
+    """
+
+    def __init__(
+        self,
+        engine,
+        tables=(),
+        sources=(),
+        maxsize=DEFAULT_MAXSIZE,
+        path=CACHE_DB_PATH,
+        flush_every=FLUSH_EVERY,
+    ):
+        self.engine = engine
+        self.tables = tables
+        self.sources = sources
+        self.maxsize = maxsize
+        self.path = path
+        self.flush_every = flush_every
+
+        self._version = None
+        self._conn = None
+        self._memory = OrderedDict()
+        self._pending = []
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    @property
+    def version(self):
+        if self._version is None:
+            self._version = rules_version(self.tables, self.sources)
+        return self._version
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(Path(self.path).resolve()), timeout=60)
+            self._conn.execute("PRAGMA journal_mode=WAL;")
+            self._conn.execute("PRAGMA synchronous=NORMAL;")
+            with self._conn:
+                self._conn.execute(
+                    """
+                        CREATE TABLE IF NOT EXISTS
+                            transcriptions (
+                                engine TEXT,
+                                version TEXT,
+                                input TEXT,
+                                output TEXT,
+                                PRIMARY KEY (engine, version, input)
+                            )
+                        WITHOUT ROWID
+                        ;
+                    """
+                )
+                # Entries made under older rule tables can never be hit again.
+                self._conn.execute(
+                    """
+                        DELETE FROM
+                            transcriptions
+                        WHERE
+                            engine = ?
+                        AND
+                            version != ?
+                        ;
+                    """,
+                    (self.engine, self.version),
+                )
+            atexit.register(self.close)
+        return self._conn
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key):
+        """Return the cached output for `key`, or `_MISSING`."""
+        value = self._memory.get(key, _MISSING)
+        if value is not _MISSING:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return value
+
+        row = (
+            self._connect()
+            .execute(
+                """
+                    SELECT
+                        output
+                    FROM
+                        transcriptions
+                    WHERE
+                        engine = ?
+                    AND
+                        version = ?
+                    AND
+                        input = ?
+                    ;
+                """,
+                (self.engine, self.version, key),
+            )
+            .fetchone()
+        )
+        if row is None:
+            self.misses += 1
+            return _MISSING
+        self.disk_hits += 1
+        self._remember(key, row[0])
+        return row[0]
+
+    def put(self, key, value):
+        self._remember(key, value)
+        self._pending.append((self.engine, self.version, key, value))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write the entries computed since the last flush to disk."""
+        if not self._pending:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                    INSERT OR IGNORE INTO
+                        transcriptions (
+                            engine,
+                            version,
+                            input,
+                            output
+                        )
+                    VALUES
+                        (?, ?, ?, ?)
+                    ;
+                """,
+                self._pending,
+            )
+        self._pending = []
+
+    def close(self):
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def clear(self):
+        """Drop the in-memory tier and the statistics (the disk store is kept)."""
+        self._memory.clear()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def info(self):
+        return CacheInfo(
+            self.hits,
+            self.disk_hits,
+            self.misses,
+            self.evictions,
+            self.maxsize,
+            len(self._memory),
+        )
+
+
+def persistent_cache(engine=None, tables=(), sources=(), **kwargs):
+    """Decorator replacing `@lru_cache()` for single-string transcription functions.
+
+    The wrapped function gets `cache`, `cache_info()` and `cache_clear()`
+    attributes like an `lru_cache`d one.
+    """
+
+    def decorator(func):
+        cache = TranscriptionCache(
+            engine or func.__qualname__, tables=tables, sources=sources, **kwargs
+        )
+
+        @wraps(func)
+        def wrapper(s):
+            if not s:
+                return func(s)
+            value = cache.get(s)
+            if value is _MISSING:
+                value = func(s)
+                cache.put(s, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The phoneme to katakana engine shared by `cmu_to_kana` and `britfone_to_kana`.
+
+Both pipelines go through the same steps:
+
+1. split the phonemes into clusters ending in a vowel;
+2. regroup the clusters into Japanese-like v, kv, sv and ksv syllables;
+3. fix rhotic vowels (ARPAbet only, RP is not rhotic), gemination and final
+   D Z / T S;
+4. map every symbol to prekana, every prekana syllable to katakana;
+5. correct common spelling-based transcriptions.
+
+They only differ in their phone symbols, which are described by an
+`Inventory`. An `Engine` turns an inventory into the lookup tables used at
+every step when it is constructed, so the per-phoneme work is a set or dict
+lookup whichever alphabet is being transcribed.
+
+`Engine.count_hits()` makes the engine count how often every rhoticity and
+gemination case, prekana syllable and spelling rule is used; `hitReport` lists
+`Engine.all_hits()` and `Engine.reorder_rules` tries the spelling rules most
+used first.
+Until `count_hits()` is called, the only cost is a `None` check per call (and
+per rare rhoticity or gemination case).
+
+`Engine.kana` also takes the name of a house style (`prekana_map.styles`):
+every style's table is compiled once, at import, so choosing one per call
+costs nothing.
+"""
+
+import re
+import heapq
+from pathlib import Path
+from collections import Counter, namedtuple
+
+if __package__:
+    from .prekana_map import prekana_to_kana, prekana_alternatives, styles
+else:
+    from prekana_map import prekana_to_kana, prekana_alternatives, styles
+
+Inventory = namedtuple(
+    "Inventory",
+    [
+        "vowels",  # symbol -> prekana; None stands for an epenthetic vowel.
+        "semivowels",
+        "consonants",
+        "special",  # The TS, NP and NB clusters made while grouping.
+        "non_geminating",  # Symbols that cannot follow ッ.
+        "geminating",  # Vowel -> replacement where ッ cannot follow it.
+        "roles",  # Which symbols are T, S, M, P, B, D, W and Z.
+        "nasal",  # The N put before P or B (from M).
+        "rhotic",  # (ER, R) if rhotic vowels have to be fixed, else None.
+        "stress",  # Regex matching stress marks to strip, or None.
+        "arpabet",  # Consonant -> ARPAbet for the syllabifier, None if ARPAbet.
+    ],
+    defaults=(None,),
+)
+
+
+class Engine:
+    """Transcribes pronunciations in one inventory into prekana and katakana."""
+
+    def __init__(self, inventory, syllables=False):
+        self.inventory = inventory
+        self.vowels = frozenset(inventory.vowels)
+        self.semivowels = frozenset(inventory.semivowels)
+        self.consonants = frozenset(inventory.consonants)
+        self.onsets = self.consonants | self.semivowels
+        self.non_geminating = frozenset(inventory.non_geminating)
+        self.geminating = dict(inventory.geminating)
+        self.symb_to_prekana = {
+            **inventory.vowels,
+            **inventory.semivowels,
+            **inventory.consonants,
+            **inventory.special,
+        }
+        self.prekana_to_kana = prekana_to_kana
+        self.styles = styles
+        self.prekana_alternatives = prekana_alternatives
+        self.spelling_rules = SPELLING_RULES
+        # See `group_by_syllable`; built on first use.
+        self.syllabifier = None
+        # Consonants whose prekana is already palatal (ZH is jy): the prekana
+        # table spells them with a semivowel after them (jyyu, jywa).
+        self.palatals = frozenset(
+            c for c, prekana in inventory.consonants.items() if prekana.endswith("y")
+        )
+        self.group = self.group_by_syllable if syllables else self.group_by_cluster
+        self.hits = None
+        self.counted_prekana = None
+
+        roles = inventory.roles
+        self.t, self.s, self.d, self.z = (roles[r] for r in ("T", "S", "D", "Z"))
+        self.ts = [roles["T"], roles["S"]]
+        self.mp = [roles["M"], roles["P"]]
+        self.mb = [roles["M"], roles["B"]]
+        self.m = [roles["M"]]
+        self.p = roles["P"]
+        self.b = roles["B"]
+        self.w = roles["W"]
+        self.dw = [roles["D"], roles["W"]]
+        self.final_dz = [[roles["D"], None], [roles["Z"], None]]
+        self.final_ts = [[roles["T"], None], [roles["S"], None]]
+
+    def count_hits(self):
+        """Start counting rule hits."""
+        self.hits = Counter()
+        # The prekana syllables are only counted when the hits are read.
+        self.counted_prekana = []
+
+    def all_hits(self):
+        """Every count so far, by rule name as in `rule_index.py`."""
+        syllables = Counter()
+        for prekanas in self.counted_prekana:
+            syllables.update(prekanas.split(" "))
+        hits = Counter(self.hits)
+        for syllable, count in syllables.items():
+            hits["prekana:" + syllable] = count
+        return hits
+
+    def reorder_rules(self, hits):
+        """Try the spelling rules with the most `hits` first (see `reorderRules`)."""
+        self.spelling_rules = reorderRules(SPELLING_RULES, hits)
+
+    def group_by_cluster(self, phonemes):
+        """Clusters of phonemes, each ending in (at most) one vowel."""
+        vowels = self.vowels
+        clusters = []
+        start = 0
+        for i, p in enumerate(phonemes):
+            if p in vowels:
+                clusters.append(phonemes[start : i + 1])
+                start = i + 1
+        if start != len(phonemes):
+            clusters.append(phonemes[start:])
+
+        # Group into syllables with v, kv, sv or ksv structure where
+        # v = vowel, k = consonant, s = semivowel.
+        return self.fix_clusters(self.group_japonically(clusters))
+
+    def group_by_syllable(self, phonemes):
+        """Clusters like `group_by_cluster`, but only the consonants of an
+        English onset (see `syllabifier.py`) go with the vowel after them,
+        and a semivowel never leaves a palatal consonant before it."""
+        if self.syllabifier is None:
+            if __package__:
+                from .syllabifier import Syllabifier
+            else:
+                from syllabifier import Syllabifier
+
+            self.syllabifier = Syllabifier(self.vowels, self.inventory.arpabet)
+        clusters = []
+        codas = []
+        coda = []
+        for onset, vowel, next_coda in self.syllabifier.syllabify(phonemes):
+            if (
+                coda
+                and onset
+                and onset[0] in self.semivowels
+                and coda[-1] in self.palatals
+            ):
+                # ZH Y UW is ジュ, not ジュ + ユ.
+                coda, onset = coda[:-1], coda[-1:] + onset
+            cluster = coda + onset
+            if vowel is not None:
+                cluster.append(vowel)
+            clusters.append(cluster)
+            codas.append(len(coda))
+            coda = next_coda
+        if coda:
+            clusters.append(coda)
+            codas.append(len(coda))
+        return self.fix_clusters(self.group_japonically(clusters, codas))
+
+    def fix_clusters(self, clusters):
+        # Fix how R and ER are interpreted.
+        if self.inventory.rhotic:
+            clusters = self.fix_rhoticity(clusters)
+
+        # Fix where gemination ッ can occur.
+        clusters = self.fix_gemination(clusters)
+
+        # Final D Z to just Z and final T S to just TS.
+        return self.fix_final_DZ_TS(clusters)
+
+    def group_japonically(self, clusters, codas=None):
+        """Group clusters into either
+        " - lone vowel
+        " - consonant + vowel
+        " - semivowel + vowel
+        " - consonant + semivowel + vowel.
+        " If given, the first `codas[i]` phonemes of cluster i stay apart.
+        """
+        vowels, onsets = self.vowels, self.onsets
+        consonants, semivowels = self.consonants, self.semivowels
+        new_clusters = []
+        for i, c in enumerate(clusters):
+            if len(c) == 1:
+                new_clusters.append(c)
+                continue
+            if (
+                len(c) > 2
+                and c[-3] in consonants
+                and c[-2] in semivowels
+                and c[-1] in vowels
+            ):
+                # We have ksv.
+                split = len(c) - 3
+            elif c[-2] in onsets and c[-1] in vowels:
+                # We have kv or sv.
+                split = len(c) - 2
+            elif c[-1] in vowels:
+                # We have lone v.
+                split = len(c) - 1
+            else:
+                # Must be on a consonant only coda.
+                split = len(c)
+            if codas is not None and split < codas[i]:
+                split = codas[i]
+            if split:
+                new_clusters.append(c[:split])
+            if split != len(c):
+                new_clusters.append(c[split:])
+
+        # Now, break up or replace consonant clusters not ending in vowels.
+        old_clusters = new_clusters
+        new_clusters = []
+        last = len(old_clusters) - 1
+        for i, c in enumerate(old_clusters):
+            if c == self.ts:
+                new_clusters.append(["TS", None])
+            elif i != last and c == [self.t] and old_clusters[i + 1][0] == self.s:
+                old_clusters[i + 1][0] = "TS"  # Update the next cluster.
+            elif c == self.mp:
+                new_clusters.append(["NP", None])
+            elif i != last and c == self.m and old_clusters[i + 1][0] == self.p:
+                new_clusters.append([self.inventory.nasal, None])
+            elif c == self.mb:
+                new_clusters.append(["NB", None])
+            elif i != last and c == self.m and old_clusters[i + 1][0] == self.b:
+                new_clusters.append([self.inventory.nasal, None])
+            elif c[0:2] == self.dw:
+                new_clusters.append([self.d, None])
+                new_clusters.append(c[1:])
+            elif c[-1] not in vowels:
+                for consonant in c:
+                    new_clusters.append([consonant, None])
+            else:
+                new_clusters.append(c)
+
+        return new_clusters
+
+    def fix_rhoticity(self, clusters):
+        """Check ER and R phones and make the following fixes.
+        " - R + vowel ==> R + vowel (no change)
+        " - cons + R + cons ==> cons + R + cons (no change)
+        " - cons + R + vowel ==> cons + R + vowel (no change)
+        " - ER + vowel ==> ア + R + vowel (fishery ==> フィシャリー)
+        " - vowel + R + end ==> vowel + ア + end (remove rhotic final) (more ==> モア)
+        " - ER + end ==> アー + end (remove rhotic final and make long) (her ==> ハー)
+        " - vowel + R + cons ==> vowel + ー + cons (remove rhotic and make long) (born ==> ボーン)
+        " - ER + cons ==> アー + cons (remove rhotic and make long) (burn ==> バーン)
+        " - R + W + vowel ==> ア + W + vowel (firewall ==> ファイアウォール)
+        """
+        er, r = self.inventory.rhotic
+        vowels = self.vowels
+        hits = self.hits
+        lone_r = [r, None]
+        if clusters[-1] == lone_r:
+            clusters[-1] = ["a"]
+            if hits is not None:
+                hits["rhoticity:vowel + R + end"] += 1
+
+        if clusters[-1][-1] == er:
+            clusters[-1][-1] = "a -"
+            if hits is not None:
+                hits["rhoticity:ER + end"] += 1
+
+        new_clusters = []
+        for i, cluster in enumerate(clusters):
+            new_cluster = cluster.copy()
+            if cluster[-1] == er and clusters[i + 1][0] not in vowels:
+                new_cluster[-1] = "a -"
+                if hits is not None:
+                    hits["rhoticity:ER + cons"] += 1
+            elif cluster[-1] == er and clusters[i + 1][0] in vowels:
+                new_cluster[-1] = "a"
+                clusters[i + 1].insert(0, r)
+                if hits is not None:
+                    hits["rhoticity:ER + vowel"] += 1
+            elif cluster == lone_r and clusters[i + 1][0] not in vowels:
+                new_cluster = ["-"]
+                if hits is not None:
+                    hits["rhoticity:vowel + R + cons"] += 1
+
+            # Avoid rw + vowel.
+            if new_cluster[0:2] == [r, self.w]:
+                new_cluster = ["a ", self.w] + new_cluster[-1:]
+                if hits is not None:
+                    hits["rhoticity:R + W + vowel"] += 1
+
+            new_clusters.append(new_cluster)
+
+        return new_clusters
+
+    def fix_gemination(self, clusters):
+        """Gemination (ッ) cannot occur in the following positions:
+        " - at the start of a word;
+        " - at the end of a word;
+        " - before voiced, nasal or liquid consonants;
+        " - before vowels.
+        " Only the `geminating` vowels (e.g. AE ==> a x) produce ッ, and they
+        " cannot occur in initial position, so only the other cases are checked.
+        """
+        geminating = self.geminating
+        hits = self.hits
+        if clusters[-1][-1] in geminating:
+            clusters[-1][-1] = geminating[clusters[-1][-1]]
+            if hits is not None:
+                hits["gemination:blocked at end"] += 1
+
+        for i, cluster in enumerate(clusters):
+            if cluster[-1] in geminating:
+                if clusters[i + 1][0] in self.non_geminating:
+                    cluster[-1] = geminating[cluster[-1]]
+                    if hits is not None:
+                        hits["gemination:blocked before " + clusters[i + 1][0]] += 1
+                elif hits is not None:
+                    hits["gemination:kept"] += 1
+
+        return clusters
+
+    def fix_final_DZ_TS(self, clusters):
+        if clusters[-2:] == self.final_dz:
+            clusters = clusters[:-2] + [[self.z, None]]
+        elif clusters[-2:] == self.final_ts:
+            clusters = clusters[:-2] + [["TS", None]]
+        return clusters
+
+    def prekana(self, pronunciation):
+        """Space-separated prekana syllables for a space-separated pronunciation."""
+        if not pronunciation:
+            return ""
+        if self.inventory.stress is not None:
+            pronunciation = self.inventory.stress.sub("", pronunciation)
+        clusters = self.group(pronunciation.split(" "))
+        table = self.symb_to_prekana
+        return " ".join(
+            "".join([table.get(symb, symb) for symb in c]) for c in clusters
+        )
+
+    def kana(self, prekanas, english="", used=None, style=None):
+        """Katakana for `prekanas`, corrected with the spelling of `english`.
+
+        If `used` is a list, the prekana syllables and spelling rules that went
+        into the result are appended to it (see `rule_index.py`). While hits
+        are counted, they are counted too, but only for calls with `english`,
+        so that an entry whose bare transcription is also made counts once.
+        `style` names one of `prekana_map.styles`, the default if None.
+        """
+        table = self.prekana_to_kana if style is None else self.styles[style]
+        syllables = prekanas.split(" ")
+        kanas = "".join([table.get(p, p) for p in syllables])
+        if used is not None:
+            used.extend(["prekana:" + p for p in syllables])
+        if english:
+            if self.hits is None:
+                kanas = spelling_fixes(kanas, english, used, self.spelling_rules)
+            else:
+                self.counted_prekana.append(prekanas)
+                applied = []
+                kanas = spelling_fixes(kanas, english, applied, self.spelling_rules)
+                if applied:
+                    self.hits.update(applied)
+                    if used is not None:
+                        used.extend(applied)
+        # Remove multiple 長音符.
+        return removeMultiLongVowels(kanas)
+
+    def alternatives(self, syllables, i):
+        """(cost, katakana) of the other readings of prekana syllable i."""
+        options = [
+            (cost, kana)
+            for kana, cost in self.prekana_alternatives.get(syllables[i], ())
+        ]
+        # The volatile ɪə (i a): ヒアリング, but also イヤ.
+        if syllables[i] == "a" and i and syllables[i - 1].endswith("i"):
+            options.append((VOLATILE_COST, "ヤ"))
+        return options
+
+    def kana_candidates(self, prekanas, english="", style=None):
+        """Yield (katakana, cost) for `prekanas`, cheapest first.
+
+        The first is what `kana` gives, at cost 0, and costs nothing more.
+        The others mix in the `alternatives` of the syllables (and leaving out
+        the spelling-based corrections), and are only worked out as they are
+        asked for: each one pulled costs a heap pop and a push per ambiguous
+        syllable, however many combinations there are.
+        """
+        best = self.kana(prekanas, english, style=style)
+        yield best, 0.0
+
+        table = self.prekana_to_kana if style is None else self.styles[style]
+        syllables = prekanas.split(" ")
+        kanas = [table.get(p, p) for p in syllables]
+        # (position, options cheapest first) of every ambiguous syllable; the
+        # first option is what `kana` used. Position None is the spelling.
+        choices = []
+        for i in range(len(syllables)):
+            options = self.alternatives(syllables, i)
+            if options:
+                choices.append((i, [(0.0, kanas[i])] + sorted(options)))
+        if english:
+            choices.append((None, [(0.0, True), (SPELLING_COST, False)]))
+
+        seen = {best}
+        heap = []
+        count = 0
+
+        def expand(state, cost, last):
+            # Only raise choices from `last` on, so that every combination is
+            # reached in exactly one way.
+            nonlocal count
+            for j in range(last, len(choices)):
+                options = choices[j][1]
+                k = state[j]
+                if k + 1 < len(options):
+                    count += 1
+                    heapq.heappush(
+                        heap,
+                        (
+                            cost - options[k][0] + options[k + 1][0],
+                            count,
+                            state[:j] + (k + 1,) + state[j + 1 :],
+                            j,
+                        ),
+                    )
+
+        expand((0,) * len(choices), 0.0, 0)
+        while heap:
+            cost, _, state, last = heapq.heappop(heap)
+            expand(state, cost, last)
+            candidate = kanas.copy()
+            spelling = bool(english)
+            for (i, options), k in zip(choices, state):
+                if i is None:
+                    spelling = options[k][1]
+                else:
+                    candidate[i] = options[k][1]
+            candidate = "".join(candidate)
+            if spelling:
+                candidate = spelling_fixes(
+                    candidate, english, None, self.spelling_rules
+                )
+            candidate = removeMultiLongVowels(candidate)
+            if candidate not in seen:
+                seen.add(candidate)
+                yield candidate, cost
+
+
+# Costs of reading the volatile ɪə as イヤ and of not correcting by spelling.
+VOLATILE_COST = 1.0
+SPELLING_COST = 2.0
+
+parenthetical = re.compile(r"\([^)]*\) ?")
+
+
+def removeParentheticals(s):
+    return parenthetical.sub("", s).strip()
+
+
+multiLongVowel = re.compile(r"ー{2,}")
+
+
+def removeMultiLongVowels(s):
+    return multiLongVowel.sub("ー", s).strip()
+
+
+# A spelling rule rewrites the start (or end) of the katakana when the English
+# starts (or ends) with one of `english` and the katakana with `kana`. `cut` is
+# how many kana are replaced by `replacement` (all of `kana` unless given).
+SpellingRule = namedtuple(
+    "SpellingRule",
+    ["name", "at_start", "english", "kana", "replacement", "cut", "unless", "words"],
+)
+
+# At most one rule of a group applies, the first that matches. A group is
+# skipped for words whose second and third letters start with `skip`.
+RuleGroup = namedtuple("RuleGroup", ["name", "skip", "rules"])
+
+
+def _rule(
+    name, english, kana, replacement, at_start=True, unless=(), words=(), cut=None
+):
+    return SpellingRule(
+        name,
+        at_start,
+        english if isinstance(english, tuple) else (english,),
+        kana,
+        replacement,
+        len(kana) if cut is None else cut,
+        unless,
+        frozenset(words),
+    )
+
+
+SPELLING_RULES = (
+    # Words starting/ending with "WOOD(S)".
+    RuleGroup(
+        "wood",
+        (),
+        (
+            _rule("WOODS-", "WOODS", "ウドズ", "ウッズ"),
+            _rule("-WOODS", ("WOODS", "WOOD'S"), "ウズ", "ウッズ", at_start=False),
+            _rule("WOOD-", "WOOD", "ウド", "ウッド"),
+            _rule("-WOOD", "WOOD", "ウド", "ウッド", at_start=False),
+        ),
+    ),
+    # Words with initial o sounds.
+    RuleGroup(
+        "initial o",
+        ("OW", "OU", "OO"),
+        (
+            _rule("CO-", ("CO", "KO"), "カ", "コ"),
+            _rule("GO-", "GO", "ガ", "ゴ"),
+            _rule(
+                "SO-",
+                "SO",
+                "サ",
+                "ソ",
+                unless=("SOMM",),
+                words=(
+                    "SON-OF-A-BITCH",
+                    "SONS-IN-LAW",
+                    "SON-IN-LAW",
+                    "SONNY",
+                    "SONNY'S",
+                    "SON'S",
+                    "SONS'",
+                    "SONS",
+                    "SON",
+                ),
+            ),
+            # ZOW- does not exist in the data.
+            _rule("ZO-", "ZO", "ザ", "ゾ"),
+            _rule("TO-", "TO", "タ", "ト", unless=("TOBACCO",)),
+            _rule("NO-", "NO", "ナ", "ノ", unless=("NOTHIN", "NOTHER")),
+            _rule("HO-", "HO", "ハ", "ホ", unless=("HONEY",)),
+            # Only the フ of ファ is replaced, which keeps the ァ (ファ ==> フォァ).
+            _rule("FO-", "FO", "ファ", "フォ", cut=1),
+            _rule("BO-", "BO", "バ", "ボ"),
+            _rule("PO-", "PO", "パ", "ポ"),
+            _rule("MO-", "MO", "マ", "モ", unless=("MOTHER",)),
+            _rule("YO-", "YO", "ヤ", "ヨ"),
+            _rule("LO-", ("LO", "RO"), "ラ", "ロ", unless=("LOVE",)),
+            _rule(
+                "WO-",
+                "WO",
+                "ワ",
+                "ウォ",
+                unless=("WORSHIP", "WONDER", "WORLD", "WORST", "WORSE", "WORD", "WORK"),
+            ),
+        ),
+    ),
+    # Words with certain endings.
+    RuleGroup(
+        "endings",
+        (),
+        (
+            _rule("-ION/シャン", "ION", "シャン", "ション", at_start=False),
+            _rule("-ION/ジャン", "ION", "ジャン", "ジョン", at_start=False),
+            _rule("-NG", "NG", "ン", "ング", at_start=False),
+            _rule("-ISM/イザム", "ISM", "イザム", "イズム", at_start=False),
+            _rule("-ISM/ザム", "ISM", "ザム", "ズム", at_start=False),
+            _rule("-MENT", "MENT", "マント", "メント", at_start=False),
+            # Not sure if -ED ==> ティド is correct (テド? ティッド?), seems
+            # there is no consensus, so it is left alone.
+        ),
+    ),
+)
+
+
+def spelling_fixes(kanas, english_string, used=None, rules=SPELLING_RULES):
+    """Fix some common transcriptions that are based on English spelling.
+
+    The name of every rule applied is appended to `used`, if given.
+    """
+    english_string = removeParentheticals(english_string)
+    for group in rules:
+        if group.skip and english_string[1:3].startswith(group.skip):
+            continue
+        for r in group.rules:
+            if r.at_start:
+                if not (
+                    english_string.startswith(r.english) and kanas.startswith(r.kana)
+                ):
+                    continue
+                if english_string.startswith(r.unless) or english_string in r.words:
+                    continue
+                kanas = r.replacement + kanas[r.cut :]
+            else:
+                if not (english_string.endswith(r.english) and kanas.endswith(r.kana)):
+                    continue
+                kanas = kanas[: len(kanas) - r.cut] + r.replacement
+            if used is not None:
+                used.append("spelling:" + r.name)
+            break
+    return kanas
+
+
+def _overlap(a, b):
+    """Whether one word can match both spelling rules `a` and `b`."""
+    if a.at_start != b.at_start:
+        # A start and an end can always be matched by a long enough word.
+        return True
+
+    def related(x, y):
+        if a.at_start:
+            return x.startswith(y) or y.startswith(x)
+        return x.endswith(y) or y.endswith(x)
+
+    return related(a.kana, b.kana) and any(
+        related(x, y) for x in a.english for y in b.english
+    )
+
+
+def reorderRules(groups, hits):
+    """`groups` with the rules of each group sorted by their `hits`, most first.
+
+    Only the first matching rule of a group applies, so a rule never moves
+    ahead of an earlier one that a word could match as well (WOODS- stays
+    ahead of WOOD-): the transcriptions are the same in any order this gives.
+    Groups stay in their order, as each works on the output of the last.
+    """
+    reordered = []
+    for group in groups:
+        left = list(group.rules)
+        rules = []
+        while left:
+            free = [
+                r
+                for i, r in enumerate(left)
+                if not any(_overlap(earlier, r) for earlier in left[:i])
+            ]
+            best = max(free, key=lambda r: hits.get("spelling:" + r.name, 0))
+            rules.append(best)
+            left.remove(best)
+        reordered.append(group._replace(rules=tuple(rules)))
+    return tuple(reordered)
+
+
+def hitReport(hits):
+    """Lines of (kind, rule, hits, share of the kind), most used first.
+
+    Spelling rules that never applied are listed too, with 0 hits.
+    """
+    hits = Counter(hits)
+    for group in SPELLING_RULES:
+        for r in group.rules:
+            hits.setdefault("spelling:" + r.name, 0)
+    totals = Counter()
+    for rule, count in hits.items():
+        totals[rule.split(":", 1)[0]] += count
+    lines = []
+    for rule, count in sorted(
+        hits.items(), key=lambda kv: (kv[0].split(":", 1)[0], -kv[1], kv[0])
+    ):
+        kind, name = rule.split(":", 1)
+        share = count / totals[kind] if totals[kind] else 0.0
+        lines.append(f"{kind}\t{name}\t{count}\t{share:.2%}")
+    return lines
+
+
+def readHits(path):
+    """The hits of a report written from `hitReport`."""
+    hits = Counter()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            kind, name, count, _ = line.rstrip("\n").split("\t")
+            hits[f"{kind}:{name}"] = int(count)
+    return hits
+
+
+def hit_arguments(parser):
+    """Add the rule hit options of the transcription stages to `parser`."""
+    parser.add_argument(
+        "--rule-hits",
+        type=Path,
+        metavar="REPORT",
+        help="count how often every rule is used and write the counts to REPORT",
+    )
+    parser.add_argument(
+        "--reorder-rules",
+        type=Path,
+        metavar="REPORT",
+        help="try the spelling rules most used in REPORT (from --rule-hits) first",
+    )
+    return parser
+
+
+def applyHitArguments(engine, args, cached_prekana):
+    """Set `engine` up for `args`; returns the prekana function to use.
+
+    While counting, prekana are made by the engine rather than taken from the
+    cache, so that the rhoticity and gemination cases of every entry count.
+    """
+    if args.reorder_rules:
+        engine.reorder_rules(readHits(args.reorder_rules))
+    if args.rule_hits:
+        engine.count_hits()
+        return engine.prekana
+    return cached_prekana
+
+
+def writeHits(engine, args):
+    if engine.hits is None:
+        return
+    args.rule_hits.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.rule_hits, "w", encoding="utf-8") as f:
+        for line in hitReport(engine.all_hits()):
+            f.write(line + "\n")
+    print(f"Rule hits written to {args.rule_hits}.")
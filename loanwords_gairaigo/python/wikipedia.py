@@ -2,28 +2,31 @@
 # -*- coding: utf-8 -*-
 """Use xml.etree.ElementTree to parse the English Wikipedia data and extract the relevant info."""
 
+import os
 import re
-import sys
+import time
 import sqlite3
 from pathlib import Path
 
-from lxml import etree as ET
+from progress import progress
+from profiling import phase, profiled, stage_parser
+from checkpoint import Checkpoints, DumpReader, PageFilter, PageIdSet
+from revision_cache import RevisionCache, getRevision
 
-import mysql.connector
-from mysql.connector import errorcode
-
-WIKI_DB_PATH = Path("../db/wikipedia.db")
+ROOT_DIR = Path(__file__).resolve().parent.parent
+WIKI_DB_PATH = ROOT_DIR / "db" / "wikipedia.db"
 
 useCurr = True
 currVer = "0.10"
 testVer = "0.3"
 ver = currVer if useCurr else testVer
-DUMP_ENG = str(Path("../data/enwiki-latest-pages-articles.xml").resolve())
+DUMP_ENG = str(ROOT_DIR / "data" / "enwiki-latest-pages-articles.xml")
 PAGE_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}page"
 TITLE_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}title"
 REVISION_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}revision"
 TEXT_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}text"
 ID_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}id"
+SHA1_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}sha1"
 
 halfwidth_parenthetical = re.compile(r"\([^)]*\)[ \u3000\u303f]?")
 fullwidth_parenthetical = re.compile(r"（[^）]*）[ \u3000\u303f]?")
@@ -57,6 +60,10 @@ def getId(page):
     return int("".join(page.find(ID_TAG).itertext()))
 
 
+def getPageRevision(page):
+    return getRevision(page, REVISION_TAG, SHA1_TAG, ID_TAG)
+
+
 not_kat_regex = re.compile(r"[^\u30a0-\u30ff\u31f0-\u31ff]")
 
 
@@ -85,6 +92,8 @@ def makeTable():
 
 
 def getLanglinkIds():
+    import mysql.connector
+
     try:
         cnx = mysql.connector.connect(
             user="root",
@@ -116,14 +125,12 @@ def getLanglinkIds():
                     PRAGMA ENCODING=UTF8;
                 """
             )
-            sys.stdout.write("[")
-            sys.stdout.flush()
+            links = progress("langlinks")
             for pageid, ll_title in cursor:
                 pageid, ll_title = int(pageid), removeParentheticals(str(ll_title))
-                if ll_title and onlyKat(ll_title):
-                    sys.stdout.write(f"({pageid}, {ll_title})")
-                    sys.stdout.flush()
-
+                is_katakana = bool(ll_title and onlyKat(ll_title))
+                links.update(matched=is_katakana)
+                if is_katakana:
                     try:
                         conn.execute(
                             """
@@ -153,13 +160,10 @@ def getLanglinkIds():
                         )
                     else:
                         conn.commit()
-                else:
-                    sys.stdout.write(".")
+            links.close()
     finally:
         cursor.close()
         cnx.close()
-        sys.stdout.write("]\n")
-        sys.stdout.flush()
 
 
 # Can't use jawiki to enwiki langlinks since page IDs are not unique across
@@ -167,7 +171,9 @@ def getLanglinkIds():
 # from other Wikis. Therefore, must scan Wiki...
 
 
-def getEngTitles():
+def getEngTitles(resume=False):
+    from lxml import etree as ET
+
     with sqlite3.connect(str(WIKI_DB_PATH.resolve())) as conn:
         conn.execute(
             """
@@ -185,50 +191,88 @@ def getEngTitles():
             """
         )
 
-        pageids = {int(r[0]) for r in results}
+        pageids = PageIdSet(int(r[0]) for r in results)
+        extractions = RevisionCache("wikipedia.getEngTitles", sources=(__file__,))
+
+        checkpoints = Checkpoints(conn, "wikipedia.getEngTitles", DUMP_ENG)
+        saved = checkpoints.load() if resume else None
+        offset = 0
+        if saved is not None:
+            offset, pageids = saved
+            print(f"Resuming at byte {offset} with {len(pageids)} pages to go.")
+
+        print(pageids.report())
 
-        sys.stdout.write("[")
-        sys.stdout.flush()
-        pages = ET.iterparse(DUMP_ENG, tag=PAGE_TAG, huge_tree=True, recover=True)
+        dump = PageFilter(DumpReader(DUMP_ENG, offset), pageids)
+        pages = ET.iterparse(dump, tag=PAGE_TAG, huge_tree=True, recover=True)
+        scanned = progress(
+            "Wikipedia", total_bytes=os.path.getsize(DUMP_ENG), offset=offset
+        )
+        skipped = 0
         while pageids:
             try:
-                _, page = next(pages)
-                pid = getId(page)
+                with phase("parse"):
+                    _, page = next(pages)
+                    pid = getId(page)
+                scanned.update(
+                    n=dump.skipped - skipped + 1,
+                    matched=pid in pageids,
+                    position=dump.tell(),
+                )
+                skipped = dump.skipped
                 if pid in pageids:
                     pageids.remove(pid)
-                    eng_title = getTitle(page)
-
-                    sys.stdout.write(f"({pid}, {eng_title})")
-
-                    conn.execute(
-                        """
-                            UPDATE
-                                wikipedia 
-                            SET
-                                english = ?
-                            WHERE
-                                pageid = ?
-                            ;
-                        """,
-                        (eng_title, pid),
-                    )
-                else:
-                    sys.stdout.write(".")
-                sys.stdout.flush()
+                    with phase("extract"):
+                        revision = getPageRevision(page)
+                        cached = extractions.get(pid, revision)
+                        if cached is None:
+                            start = time.perf_counter()
+                            eng_title = getTitle(page)
+                            extractions.put(
+                                pid,
+                                revision,
+                                [eng_title],
+                                time.perf_counter() - start,
+                            )
+                        else:
+                            (eng_title,) = cached
+
+                    with phase("write"):
+                        conn.execute(
+                            """
+                                UPDATE
+                                    wikipedia 
+                                SET
+                                    english = ?
+                                WHERE
+                                    pageid = ?
+                                ;
+                            """,
+                            (eng_title, pid),
+                        )
             except ET.XMLSyntaxError as e:
                 print("Skipping error: ", e)
                 continue
             except StopIteration:
                 break
             else:
-                conn.commit()
+                if checkpoints.due():
+                    with phase("write"):
+                        checkpoints.save(dump, pid, pageids)
+                        conn.commit()
             finally:
                 try:
                     page.clear()
                 except:
                     pass
-        sys.stdout.write("]\n")
-        sys.stdout.flush()
+        with phase("write"):
+            checkpoints.clear()
+            conn.commit()
+        scanned.close()
+        dump.close()
+        print(dump.report())
+        extractions.close()
+        print(extractions.report())
         print("Done with the English dump!")
 
 
@@ -252,7 +296,18 @@ def cleanDb():
 
 
 if __name__ == "__main__":
-    makeTable()
-    getLanglinkIds()
-    getEngTitles()
-    cleanDb()
+    parser = stage_parser(__doc__)
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="carry on from the last checkpoint of an interrupted dump scan",
+    )
+    args = parser.parse_args()
+    with profiled("wikipedia", args):
+        makeTable()
+        if not args.resume:
+            with phase("langlinks"):
+                getLanglinkIds()
+        getEngTitles(args.resume)
+        with phase("clean"):
+            cleanDb()
@@ -2,29 +2,34 @@
 # -*- coding: utf-8 -*-
 """Extract the IPA from the Wiktionary dump."""
 
+import os
 import re
-import sys
+import time
 import sqlite3
 from pathlib import Path
 from itertools import chain
-from functools import lru_cache
 from unicodedata import normalize
 
-from lxml import etree as ET
+from progress import progress
+from profiling import phase, profiled, stage_parser
+from checkpoint import Checkpoints, DumpReader, PageFilter, PageIdSet
+from revision_cache import RevisionCache, getRevision
+from transcription_cache import persistent_cache
 
-
-DB_PATH = Path("../db/wiktionary.db")
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DB_PATH = ROOT_DIR / "db" / "wiktionary.db"
 
 useCurr = True
 currVer = "0.10"
 testVer = "0.3"
 ver = currVer if useCurr else testVer
-DUMP_ENG = str(Path("../data/enwiktionary-latest-pages-articles.xml").resolve())
+DUMP_ENG = str(ROOT_DIR / "data" / "enwiktionary-latest-pages-articles.xml")
 PAGE_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}page"
 TITLE_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}title"
 REVISION_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}revision"
 TEXT_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}text"
 ID_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}id"
+SHA1_TAG = f"{{http://www.mediawiki.org/xml/export-{ver}/}}sha1"
 
 
 def alterTable():
@@ -87,6 +92,10 @@ def getId(page):
     return int("".join(page.find(ID_TAG).itertext()))
 
 
+def getPageRevision(page):
+    return getRevision(page, REVISION_TAG, SHA1_TAG, ID_TAG)
+
+
 not_kat_regex = re.compile(r"[^\u30a0-\u30ff\u31f0-\u31ff]")
 
 
@@ -183,7 +192,9 @@ def getPronunciation(page):
         return None  # "N/A" + ipas
 
 
-def getIpa():
+def getIpa(resume=False):
+    from lxml import etree as ET
+
     with sqlite3.connect(str(DB_PATH.resolve())) as conn:
         conn.execute(
             """
@@ -201,22 +212,55 @@ def getIpa():
             """
         )
 
-        pageids = {int(r[0]) for r in results}
+        pageids = PageIdSet(int(r[0]) for r in results)
+
+    extractions = RevisionCache("wiktionary_to_db.getIpa", sources=(__file__,))
 
-    sys.stdout.write("[")
-    sys.stdout.flush()
-    pages = ET.iterparse(DUMP_ENG, tag=PAGE_TAG, huge_tree=True, recover=True)
+    checkpoints = Checkpoints(conn, "wiktionary_to_db.getIpa", DUMP_ENG)
+    saved = checkpoints.load() if resume else None
+    offset = 0
+    if saved is not None:
+        offset, pageids = saved
+        print(f"Resuming at byte {offset} with {len(pageids)} pages to go.")
+
+    print(pageids.report())
+
+    dump = PageFilter(DumpReader(DUMP_ENG, offset), pageids)
+    pages = ET.iterparse(dump, tag=PAGE_TAG, huge_tree=True, recover=True)
+    scanned = progress(
+        "Wiktionary", total_bytes=os.path.getsize(DUMP_ENG), offset=offset
+    )
+    skipped = 0
     while pageids:
         try:
-            _, page = next(pages)
-            pid = getId(page)
+            with phase("parse"):
+                _, page = next(pages)
+                pid = getId(page)
+            scanned.update(
+                n=dump.skipped - skipped + 1,
+                matched=pid in pageids,
+                position=dump.tell(),
+            )
+            skipped = dump.skipped
             if pid in pageids:
                 pageids.remove(pid)
-                eng_title = getTitle(page)
-                ipa = getPronunciation(page)
-                sys.stdout.write(f"({pid}, {eng_title}, {ipa})")
-
-                with conn:
+                with phase("extract"):
+                    revision = getPageRevision(page)
+                    cached = extractions.get(pid, revision)
+                    if cached is None:
+                        start = time.perf_counter()
+                        eng_title = getTitle(page)
+                        ipa = getPronunciation(page)
+                        extractions.put(
+                            pid,
+                            revision,
+                            [eng_title, ipa],
+                            time.perf_counter() - start,
+                        )
+                    else:
+                        eng_title, ipa = cached
+
+                with phase("write"):
                     conn.execute(
                         """
                             UPDATE
@@ -229,23 +273,29 @@ def getIpa():
                         """,
                         (ipa, pid),
                     )
-            else:
-                sys.stdout.write(".")
-            sys.stdout.flush()
         except ET.XMLSyntaxError as e:
             print("Skipping error:", e)
             continue
         except StopIteration:
             break
         else:
-            conn.commit()
+            if checkpoints.due():
+                with phase("write"):
+                    checkpoints.save(dump, pid, pageids)
+                    conn.commit()
         finally:
             try:
                 page.clear()
             except:
                 pass
-    sys.stdout.write("]\n")
-    sys.stdout.flush()
+    with phase("write"):
+        checkpoints.clear()
+        conn.commit()
+    scanned.close()
+    dump.close()
+    print(dump.report())
+    extractions.close()
+    print(extractions.report())
     print("Done with the dump!")
 
 
@@ -405,7 +455,8 @@ secondaryStressMark = re.compile(r"ˌ")
 syllableMarks = re.compile(r"[. ]")
 
 
-@lru_cache()
+# The IPA tables live inside convertIpa itself, so the source file is the version.
+@persistent_cache("wiktionary_to_db.convertIpa", sources=(__file__,))
 def convertIpa(s):
     if not s:
         return ""
@@ -610,6 +661,8 @@ def convertIpa(s):
 
 def makeArpabet():
     with sqlite3.connect(str(DB_PATH.resolve())) as conn:
+        (total,) = conn.execute("SELECT COUNT(*) FROM wiktionary;").fetchone()
+        converted = progress("ARPAbet", total=total)
         results = conn.execute(
             """
                 SELECT
@@ -623,23 +676,37 @@ def makeArpabet():
         )
 
         for pageid, title, ipa in results:
-            conn.execute(
-                """
-                    UPDATE
-                        wiktionary
-                    SET
-                        arpa = ?
-                    WHERE
-                        pageid = ?
-                    ;
-                """,
-                (convertIpa(ipa), pageid),
-            )
-            print(pageid, title, ipa, convertIpa(ipa))
+            with phase("transcribe"):
+                arpa = convertIpa(ipa)
+            with phase("write"):
+                conn.execute(
+                    """
+                        UPDATE
+                            wiktionary
+                        SET
+                            arpa = ?
+                        WHERE
+                            pageid = ?
+                        ;
+                    """,
+                    (arpa, pageid),
+                )
+            converted.update(matched=arpa is not None)
+        converted.close()
+        print(f"convertIpa cache: {convertIpa.cache_info()}")
 
 
 if __name__ == "__main__":
-    # alterTable()
-    getIpa()
-    makeArpabet()
-    cleanDb()
+    parser = stage_parser(__doc__)
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="carry on from the last checkpoint of an interrupted dump scan",
+    )
+    args = parser.parse_args()
+    with profiled("wiktionary_to_db", args):
+        # alterTable()
+        getIpa(args.resume)
+        makeArpabet()
+        with phase("clean"):
+            cleanDb()
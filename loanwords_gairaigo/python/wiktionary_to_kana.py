@@ -4,15 +4,23 @@
 
 import sqlite3
 from pathlib import Path
-from cmu import arpa_to_prekana, arpa_to_kana
 
-ROOT_DIR = Path("..")
+from cmu_to_kana import engine, arpa_to_prekana
+from transcription_engine import applyHitArguments, hit_arguments, writeHits
+from profiling import phase, profiled, stage_parser
+from rule_index import RuleIndex
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT_DIR / "data"
 DB_DIR = ROOT_DIR / "db"
 DB_PATH = DB_DIR / "wiktionary.db"
 
 if __name__ == "__main__":
-    with sqlite3.connect(str(DB_PATH.resolve())) as conn:
+    args = hit_arguments(stage_parser(__doc__)).parse_args()
+    to_prekana = applyHitArguments(engine, args, arpa_to_prekana)
+    with profiled("wiktionary_to_kana", args), sqlite3.connect(
+        str(DB_PATH.resolve())
+    ) as conn:
         conn.execute(
             """
                 PRAGMA ENCODING=UTF8;
@@ -56,6 +64,8 @@ if __name__ == "__main__":
         except sqlite3.OperationalError:
             pass
 
+        # Before the SELECT below, which would lock the table being dropped.
+        index = RuleIndex(conn)
         entries = conn.execute(
             """
                 SELECT 
@@ -69,22 +79,32 @@ if __name__ == "__main__":
         )
 
         for pageid, title, arpa in entries:
-            conn.execute(
-                """
-                    UPDATE
-                        wiktionary
-                    SET
-                        prekana = ?,
-                        transcription = ?,
-                        final = ?
-                    WHERE
-                        pageid = ?
-                    ;
-                """,
-                (
-                    arpa_to_prekana(arpa),
-                    arpa_to_kana(arpa),
-                    arpa_to_kana(arpa, title.upper()),
-                    pageid,
-                ),
-            )
+            with phase("transcribe"):
+                used = []
+                prekana = to_prekana(arpa)
+                kanas = (
+                    prekana,
+                    engine.kana(prekana),
+                    engine.kana(prekana, title.upper(), used),
+                )
+            with phase("write"):
+                conn.execute(
+                    """
+                        UPDATE
+                            wiktionary
+                        SET
+                            prekana = ?,
+                            transcription = ?,
+                            final = ?
+                        WHERE
+                            pageid = ?
+                        ;
+                    """,
+                    (*kanas, pageid),
+                )
+                index.add(pageid, used)
+        with phase("write"):
+            index.close()
+
+        print(f"arpa_to_prekana cache: {arpa_to_prekana.cache_info()}")
+        writeHits(engine, args)